@@ -1,4 +1,12 @@
-from . import model
+import asyncio
+import base64
+from collections import namedtuple
+
+from . import model, tag
+
+# The statuses of actions that have stopped running, for good.
+FINISHED_STATUSES = frozenset([
+    'completed', 'failed', 'cancelled', 'aborted', 'error'])
 
 
 class Action(model.ModelEntity):
@@ -8,3 +16,184 @@ class Action(model.ModelEntity):
 
     async def wait(self):
         return await self.model.wait_for_action(self.id)
+
+
+class ActionBatch:
+    """The set of actions created by enqueueing one action on many units.
+
+    Returned by :meth:`juju.model.Model.enqueue_action` and
+    :meth:`juju.application.Application.run_action`.
+
+    ``action_ids`` maps the name of each unit on which the action was
+    enqueued to the id of its action. ``errors`` maps the name of each
+    unit on which the action could not be enqueued to the error message
+    returned by the controller; a failure on one unit does not affect the
+    others.
+
+    Iterating over the batch with ``async for`` yields each
+    :class:`Action` as soon as it has finished, i.e. its status is one of
+    FINISHED_STATUSES::
+
+        batch = await app.run_action('backup', target='/srv')
+        async for action in batch:
+            print(action.receiver, action.status)
+
+    """
+    def __init__(self, model):
+        self.model = model
+        self.action_ids = {}
+        self.errors = {}
+        self._units = {}
+        self._finished = set()
+        self._yielded = 0
+        self._completed = asyncio.Queue(loop=model.loop)
+        # Model only holds weak references to its observers, so keep
+        # the callback alive for as long as the batch is.
+        self._observer = self._on_action_delta
+        model.add_observer(self._observer, 'action')
+
+    def __len__(self):
+        return len(self.action_ids)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._yielded == len(self._units):
+            raise StopAsyncIteration
+        return self._result(await self._next_finished())
+
+    async def _next_finished(self):
+        action_id = await self._completed.get()
+        self._yielded += 1
+        return action_id
+
+    def _result(self, action_id):
+        return self.model.state.get_entity('action', action_id)
+
+    async def _on_action_delta(self, delta, old, new, model):
+        self._check_finished(delta.get_id(), delta.data)
+
+    def _check_finished(self, action_id, data):
+        if action_id not in self._units or action_id in self._finished:
+            return
+        if data and data.get('status') in FINISHED_STATUSES:
+            self._finished.add(action_id)
+            self._completed.put_nowait(action_id)
+
+    def _add_result(self, unit_name, result):
+        """Record the ``ActionResult`` returned by Enqueue for a unit.
+
+        """
+        if result.error:
+            self.errors[unit_name] = result.error.message
+            return
+        action_id = tag.untag('action-', result.action.tag)
+        self.action_ids[unit_name] = action_id
+        self._units[action_id] = unit_name
+        # The action may have finished before we learnt its id, in which
+        # case the watcher delta has already gone past the observer.
+        try:
+            data = self.model.state.entity_data('action', action_id, -1)
+        except KeyError:
+            return
+        self._check_finished(action_id, data)
+
+    async def get_action(self, unit_name):
+        """Return the :class:`Action` enqueued on the given unit, waiting
+        for it to appear in the model if necessary.
+
+        :param str unit_name: Name of the unit, e.g. 'ubuntu/0'
+        """
+        action_id = self.action_ids[unit_name]
+        return await self.model._wait_for_new('action', action_id)
+
+    async def wait(self):
+        """Wait for every remaining action to finish.
+
+        :return dict: Mapping of unit name to its finished :class:`Action`,
+            for each action not already consumed by iterating the batch.
+        """
+        results = {}
+        while self._yielded < len(self._units):
+            action_id = await self._next_finished()
+            results[self._units[action_id]] = self._result(action_id)
+        return results
+
+
+class RunResult(namedtuple('RunResult', 'receiver status code stdout '
+                                        'stderr message truncated')):
+    """The outcome of a command run on a single unit or machine.
+
+    ``receiver`` is the unit name or machine id, ``code`` the exit code of
+    the command (None if it didn't run, e.g. on a timeout), and ``stdout``
+    and ``stderr`` are bytes. ``truncated`` is True if either of the
+    outputs was cut short to respect the batch's ``max_output_size``.
+
+    """
+
+
+class RunBatch(ActionBatch):
+    """The set of actions created by a single Run call.
+
+    Returned by :meth:`juju.model.Model.run` and
+    :meth:`juju.application.Application.run`. Iterating over the batch
+    with ``async for`` yields a :class:`RunResult` for each receiver as
+    soon as its command has finished::
+
+        batch = await model.run('uptime', applications=['ubuntu'])
+        async for result in batch:
+            print(result.receiver, result.code, result.stdout)
+
+    ``max_output_size`` caps the stdout and stderr of each result. It
+    doesn't limit what the controller sends: the full outputs arrive in
+    the watcher deltas of the actions, and are held in the model's state
+    until their result is read. The model then forgets the history of the
+    action, so that memory grows with the number of commands which have
+    finished but whose results haven't been read yet, rather than with
+    the size of the fan-out.
+
+    """
+    def __init__(self, model, max_output_size=None):
+        super().__init__(model)
+        self.max_output_size = max_output_size
+
+    def _output(self, results, key):
+        value = results.get(key)
+        if value is None:
+            value = results.get(key.lower(), '')
+        if results.get(key + '.encoding') == 'base64':
+            value = base64.b64decode(value)
+        elif isinstance(value, str):
+            value = value.encode('utf-8')
+        limit = self.max_output_size
+        if limit is not None and len(value) > limit:
+            return value[:limit], True
+        return value, False
+
+    def _result(self, action_id):
+        data = self.model.state.entity_data('action', action_id, -1)
+        self.model.state.forget_entity('action', action_id)
+        results = data.get('results') or {}
+        stdout, stdout_truncated = self._output(results, 'Stdout')
+        stderr, stderr_truncated = self._output(results, 'Stderr')
+        code = results.get('Code', results.get('return-code'))
+        return RunResult(
+            receiver=self._units[action_id],
+            status=data.get('status'),
+            code=int(code) if code is not None else None,
+            stdout=stdout,
+            stderr=stderr,
+            message=data.get('message'),
+            truncated=stdout_truncated or stderr_truncated,
+        )
+
+
+def receiver_name(receiver_tag):
+    """Return the unit name or machine id for an action receiver tag.
+
+    """
+    if receiver_tag.startswith('unit-'):
+        app, _, number = receiver_tag[len('unit-'):].rpartition('-')
+        return '{}/{}'.format(app, number)
+    return tag.untag('machine-', receiver_tag).replace('-', '/')
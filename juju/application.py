@@ -251,7 +251,7 @@ class Application(model.ModelEntity):
             'Getting constraints for %s', self.name)
 
         result = (await app_facade.Get(self.name)).constraints
-        return vars(result) if result else result
+        return result._asdict() if result else result
 
     async def get_actions(self, schema=False):
         """Get actions defined for this application.
@@ -291,26 +291,44 @@ class Application(model.ModelEntity):
                     resources[resource.name] = resource
         return resources
 
-    async def run(self, command, timeout=None):
+    async def run(self, command, timeout=None, max_output_size=None):
         """Run command on all units for this application.
 
         :param str command: The command to run
-        :param int timeout: Time to wait before command is considered failed
+        :param float timeout: Time, in seconds, to wait before the command
+            is considered failed
+        :param int max_output_size: Maximum number of bytes of stdout and
+            of stderr in the result for each unit; see
+            :class:`juju.action.RunBatch`
+        :returns: A :class:`juju.action.RunBatch` instance, which yields a
+            :class:`juju.action.RunResult` for each unit as its command
+            finishes.
 
         """
-        action = client.ActionFacade.from_connection(self.connection)
-
         log.debug(
             'Running `%s` on all units of %s', command, self.name)
 
-        # TODO this should return a list of Actions
-        return await action.Run(
-            [self.name],
-            command,
-            [],
-            timeout,
-            [],
-        )
+        return await self.model.run(command, timeout,
+                                    applications=[self.name],
+                                    max_output_size=max_output_size)
+
+    async def run_action(self, action_name, **params):
+        """Run an action on all units of this application.
+
+        :param str action_name: Name of action to run
+        :param **params: Action parameters
+        :returns: A :class:`juju.action.ActionBatch` instance.
+
+        Note that this only enqueues the actions.  Iterate over the
+        returned batch with ``async for``, or call ``batch.wait()``, if
+        you wish to block until the actions are complete.
+
+        """
+        log.debug(
+            'Starting action `%s` on all units of %s', action_name, self.name)
+
+        return await self.model.enqueue_action(
+            action_name, self.units, params)
 
     async def set_annotations(self, annotations):
         """Set annotations on this application.
@@ -0,0 +1,217 @@
+'''A content-addressed cache of local charm archives and their uploads.
+
+Deploying a local charm directory zips it and uploads the archive to the
+model, every time, even if it hasn't changed since it was last deployed
+to that model. CharmCache lets Model.add_local_charm_dir skip both:
+
+* CharmArchiveGenerator.content_hash hashes the files of a charm
+  directory, and the cache remembers the digest of each file with its
+  modification time and size, so that unchanged files aren't read again.
+
+* The archive built for a content hash is kept in the cache directory,
+  and is uploaded again as it is to other models.
+
+* The 'local:' URL that each model gave an upload is remembered, and
+  returned again for the same content and series, as long as the model
+  still has the charm.
+
+The Connector's JujuData provides the cache: FileJujuData keeps it in
+the charm-cache directory of the Juju data directory, so that it is
+shared between processes, unless it is created with cache_charms=False.
+Processes that update it at the same time may lose each other's entries,
+which only costs some work later.
+'''
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+
+class CharmCache:
+    MAX_FILES = 100000
+    "The number of file digests kept, least recently used first out."
+
+    MAX_UPLOADS = 10000
+    "The number of uploads remembered, least recently used first out."
+
+    MAX_ARCHIVES = 20
+    "The number of archives kept, least recently used first out."
+
+    def __init__(self, path=None):
+        '''
+        :param str path: The directory to keep the archives and the index
+            of file digests and uploads in, or None to keep only the index,
+            in memory.
+        '''
+        self.path = path
+        self.files = OrderedDict()
+        self.uploads = OrderedDict()
+        # content_hash may run in executor threads while the index is
+        # saved on the event loop.
+        self._lock = threading.Lock()
+        if path is not None:
+            self.load()
+
+    @property
+    def _index_path(self):
+        return os.path.join(self.path, 'index.json')
+
+    def load(self):
+        try:
+            with open(self._index_path) as f:
+                index = json.load(f)
+            self.files = OrderedDict(index.get('files', []))
+            self.uploads = OrderedDict(index.get('uploads', []))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            log.warning('ignoring charm cache index in {}: {}'.format(
+                self.path, e))
+
+    def save(self):
+        if self.path is None:
+            return
+        with self._lock:
+            index = {'files': list(self.files.items()),
+                     'uploads': list(self.uploads.items())}
+        # Write to a temporary file first so that other processes never
+        # read a partly written one.
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, prefix='.index')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(index, f)
+            os.replace(tmp, self._index_path)
+        except OSError as e:
+            log.warning('cannot save charm cache index to {}: {}'.format(
+                self.path, e))
+
+    def file_digest(self, path, st):
+        '''Return the SHA-256 digest of the file at path, reading it only
+        if its modification time or size differ from when it was last
+        read.
+
+        :param str path: The absolute path of the file.
+        :param os.stat_result st: The result of os.stat(path).
+        '''
+        key = [st.st_mtime_ns, st.st_size]
+        with self._lock:
+            entry = self.files.pop(path, None)
+            if entry is not None and entry[:2] == key:
+                self.files[path] = entry
+                return entry[2]
+        digest = file_digest(path)
+        with self._lock:
+            self.files[path] = key + [digest]
+            _trim(self.files, self.MAX_FILES)
+        return digest
+
+    def uploaded(self, model_uuid, series, content_hash):
+        '''Return the 'local:' URL of the charm with content_hash that was
+        uploaded to the model for series, or None.
+        '''
+        key = _upload_key(model_uuid, series, content_hash)
+        with self._lock:
+            url = self.uploads.pop(key, None)
+            if url is not None:
+                self.uploads[key] = url
+        return url
+
+    def record_upload(self, model_uuid, series, content_hash, charm_url):
+        with self._lock:
+            key = _upload_key(model_uuid, series, content_hash)
+            self.uploads.pop(key, None)
+            self.uploads[key] = charm_url
+            _trim(self.uploads, self.MAX_UPLOADS)
+        self.save()
+
+    def forget_upload(self, model_uuid, series, content_hash):
+        with self._lock:
+            self.uploads.pop(_upload_key(model_uuid, series, content_hash),
+                             None)
+        self.save()
+
+    def archive(self, content_hash):
+        '''Return the path of the cached archive with content_hash, or
+        None.
+        '''
+        if self.path is None:
+            return None
+        path = os.path.join(self.path, content_hash + '.charm')
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def archive_to(self, content_hash, make_archive, out):
+        '''Call make_archive with a file object that writes to out and, if
+        the cache has a directory, to the cached archive of content_hash,
+        which is added to the cache if make_archive succeeds.
+        '''
+        if self.path is None:
+            return make_archive(out)
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, prefix='.archive')
+        except OSError as e:
+            log.warning('cannot cache charm archive in {}: {}'.format(
+                self.path, e))
+            return make_archive(out)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                result = make_archive(_Tee(out, f))
+            os.replace(tmp, os.path.join(self.path, content_hash + '.charm'))
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self._trim_archives()
+        return result
+
+    def _trim_archives(self):
+        try:
+            archives = [entry for entry in os.scandir(self.path)
+                        if entry.name.endswith('.charm')]
+            archives.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in archives[:-self.MAX_ARCHIVES]:
+                os.remove(entry.path)
+        except OSError as e:
+            log.warning('cannot trim charm archives in {}: {}'.format(
+                self.path, e))
+
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of the file at path."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(2**16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _Tee:
+    def __init__(self, *files):
+        self.files = files
+
+    def write(self, data):
+        for f in self.files:
+            f.write(data)
+        return len(data)
+
+    def flush(self):
+        for f in self.files:
+            f.flush()
+
+
+def _upload_key(model_uuid, series, content_hash):
+    return '{}/{}/{}'.format(model_uuid, series, content_hash)
+
+
+def _trim(entries, size):
+    while len(entries) > size:
+        entries.popitem(last=False)
@@ -2,22 +2,24 @@
 # Changes will be overwritten/lost when the file is regenerated.
 
 from juju.client._definitions import *
+from juju.client.facade import ClientModules
 
-from juju.client import _client2, _client1, _client3, _client4, _client5, _client8, _client7, _client9
 
+CLIENTS = ClientModules({
+    "2": "juju.client._client2",
+    "1": "juju.client._client1",
+    "3": "juju.client._client3",
+    "4": "juju.client._client4",
+    "5": "juju.client._client5",
+    "8": "juju.client._client8",
+    "7": "juju.client._client7",
+    "9": "juju.client._client9"
+})
 
-CLIENTS = {
-    "2": _client2,
-    "1": _client1,
-    "3": _client3,
-    "4": _client4,
-    "5": _client5,
-    "8": _client8,
-    "7": _client7,
-    "9": _client9
-}
 
 
+_facade_classes = {}
+
 
 def lookup_facade(name, version):
     """
@@ -25,9 +27,14 @@ def lookup_facade(name, version):
     of the correct client<version>.py file.
 
     """
+    try:
+        return _facade_classes[name, version]
+    except KeyError:
+        pass
     for _version in range(int(version), 0, -1):
         try:
             facade = getattr(CLIENTS[str(_version)], name)
+            _facade_classes[name, version] = facade
             return facade
         except (KeyError, AttributeError):
             continue
@@ -45,6 +52,12 @@ class TypeFactory:
         connected instance of an API Interface matching the name of
         this class.
 
+        The instance is cached on the connection until its facades are
+        rebuilt, so repeated calls are cheap. Use partial() or raw() to
+        get a copy with different options rather than changing it.
+        Watcher facades, which keep the id of their watcher, aren't
+        cached: each call returns a new one.
+
         @param connection: initialized Connection object.
 
         """
@@ -57,9 +70,19 @@ class TypeFactory:
             raise Exception('No facade {} in facades {}'.format(facade_name,
                                                                 connection.facades))
 
+        stateful = facade_name.endswith('Watcher')
+        cache = connection._facade_cache
+        if not stateful:
+            try:
+                return cache[facade_name, version]
+            except KeyError:
+                pass
+
         c = lookup_facade(cls.__name__, version)
         c = c()
         c.connect(connection)
+        if not stateful:
+            cache[facade_name, version] = c
 
         return c
 
@@ -1,21 +1,38 @@
 # DO NOT CHANGE THIS FILE! This file is auto-generated by facade.py.
 # Changes will be overwritten/lost when the file is regenerated.
 
-from juju.client.facade import Type, ReturnMapping
+from juju.client.facade import LazyField, ReturnMapping, Type
 
 
 class APIHostPortsResult(Type):
+    __slots__ = ('_raw_servers', '_servers', 'unknown_fields')
     _toSchema = {'servers': 'servers'}
     _toPy = {'servers': 'servers'}
     def __init__(self, servers=None, **unknown_fields):
         '''
         servers : typing.Sequence[~HostPort]
         '''
-        self.servers = [HostPort.from_json(o) for o in servers or []]
+        self._raw_servers = servers
+        self.unknown_fields = unknown_fields
+
+    servers = LazyField('servers', lambda data: [HostPort.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_servers = data.get('servers')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'servers': self._raw_servers}
 
 
 
 class Action(Type):
+    __slots__ = ('name', 'parameters', 'receiver', 'tag', 'unknown_fields')
     _toSchema = {'name': 'name', 'parameters': 'parameters', 'receiver': 'receiver', 'tag': 'tag'}
     _toPy = {'name': 'name', 'parameters': 'parameters', 'receiver': 'receiver', 'tag': 'tag'}
     def __init__(self, name=None, parameters=None, receiver=None, tag=None, **unknown_fields):
@@ -29,10 +46,27 @@ class Action(Type):
         self.parameters = parameters
         self.receiver = receiver
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.name = data.get('name')
+        self.parameters = data.get('parameters')
+        self.receiver = data.get('receiver')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'name': self.name, 'parameters': self.parameters, 'receiver': self.receiver, 'tag': self.tag}
 
 
 
 class ActionExecutionResult(Type):
+    __slots__ = ('action_tag', 'message', 'results', 'status', 'unknown_fields')
     _toSchema = {'action_tag': 'action-tag', 'message': 'message', 'results': 'results', 'status': 'status'}
     _toPy = {'action-tag': 'action_tag', 'message': 'message', 'results': 'results', 'status': 'status'}
     def __init__(self, action_tag=None, message=None, results=None, status=None, **unknown_fields):
@@ -46,21 +80,54 @@ class ActionExecutionResult(Type):
         self.message = message
         self.results = results
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.action_tag = data.get('action-tag')
+        self.message = data.get('message')
+        self.results = data.get('results')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'action-tag': self.action_tag, 'message': self.message, 'results': self.results, 'status': self.status}
 
 
 
 class ActionExecutionResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ActionExecutionResult]
         '''
-        self.results = [ActionExecutionResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ActionExecutionResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ActionPruneArgs(Type):
+    __slots__ = ('max_history_mb', 'max_history_time', 'unknown_fields')
     _toSchema = {'max_history_mb': 'max-history-mb', 'max_history_time': 'max-history-time'}
     _toPy = {'max-history-mb': 'max_history_mb', 'max-history-time': 'max_history_time'}
     def __init__(self, max_history_mb=None, max_history_time=None, **unknown_fields):
@@ -70,10 +137,25 @@ class ActionPruneArgs(Type):
         '''
         self.max_history_mb = max_history_mb
         self.max_history_time = max_history_time
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.max_history_mb = data.get('max-history-mb')
+        self.max_history_time = data.get('max-history-time')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'max-history-mb': self.max_history_mb, 'max-history-time': self.max_history_time}
 
 
 
 class ActionResult(Type):
+    __slots__ = ('_action', '_error', '_raw_action', '_raw_error', 'completed', 'enqueued', 'message', 'output', 'started', 'status', 'unknown_fields')
     _toSchema = {'action': 'action', 'completed': 'completed', 'enqueued': 'enqueued', 'error': 'error', 'message': 'message', 'output': 'output', 'started': 'started', 'status': 'status'}
     _toPy = {'action': 'action', 'completed': 'completed', 'enqueued': 'enqueued', 'error': 'error', 'message': 'message', 'output': 'output', 'started': 'started', 'status': 'status'}
     def __init__(self, action=None, completed=None, enqueued=None, error=None, message=None, output=None, started=None, status=None, **unknown_fields):
@@ -87,29 +169,69 @@ class ActionResult(Type):
         started : str
         status : str
         '''
-        self.action = Action.from_json(action) if action else None
+        self._raw_action = action
         self.completed = completed
         self.enqueued = enqueued
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.message = message
         self.output = output
         self.started = started
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    action = LazyField('action', lambda data: Action.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_action = data.get('action')
+        self.completed = data.get('completed')
+        self.enqueued = data.get('enqueued')
+        self._raw_error = data.get('error')
+        self.message = data.get('message')
+        self.output = data.get('output')
+        self.started = data.get('started')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'action': self._raw_action, 'completed': self.completed, 'enqueued': self.enqueued, 'error': self._raw_error, 'message': self.message, 'output': self.output, 'started': self.started, 'status': self.status}
 
 
 
 class ActionResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ActionResult]
         '''
-        self.results = [ActionResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ActionResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ActionSpec(Type):
+    __slots__ = ('description', 'params', 'unknown_fields')
     _toSchema = {'description': 'description', 'params': 'params'}
     _toPy = {'description': 'description', 'params': 'params'}
     def __init__(self, description=None, params=None, **unknown_fields):
@@ -119,21 +241,52 @@ class ActionSpec(Type):
         '''
         self.description = description
         self.params = params
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.description = data.get('description')
+        self.params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'description': self.description, 'params': self.params}
 
 
 
 class Actions(Type):
+    __slots__ = ('_actions', '_raw_actions', 'unknown_fields')
     _toSchema = {'actions': 'actions'}
     _toPy = {'actions': 'actions'}
     def __init__(self, actions=None, **unknown_fields):
         '''
         actions : typing.Sequence[~Action]
         '''
-        self.actions = [Action.from_json(o) for o in actions or []]
+        self._raw_actions = actions
+        self.unknown_fields = unknown_fields
+
+    actions = LazyField('actions', lambda data: [Action.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_actions = data.get('actions')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'actions': self._raw_actions}
 
 
 
 class ActionsByName(Type):
+    __slots__ = ('_actions', '_error', '_raw_actions', '_raw_error', 'name', 'unknown_fields')
     _toSchema = {'actions': 'actions', 'error': 'error', 'name': 'name'}
     _toPy = {'actions': 'actions', 'error': 'error', 'name': 'name'}
     def __init__(self, actions=None, error=None, name=None, **unknown_fields):
@@ -142,24 +295,59 @@ class ActionsByName(Type):
         error : Error
         name : str
         '''
-        self.actions = [ActionResult.from_json(o) for o in actions or []]
-        self.error = Error.from_json(error) if error else None
+        self._raw_actions = actions
+        self._raw_error = error
         self.name = name
+        self.unknown_fields = unknown_fields
+
+    actions = LazyField('actions', lambda data: [ActionResult.from_json(o) for o in data or []])
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_actions = data.get('actions')
+        self._raw_error = data.get('error')
+        self.name = data.get('name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'actions': self._raw_actions, 'error': self._raw_error, 'name': self.name}
 
 
 
 class ActionsByNames(Type):
+    __slots__ = ('_actions', '_raw_actions', 'unknown_fields')
     _toSchema = {'actions': 'actions'}
     _toPy = {'actions': 'actions'}
     def __init__(self, actions=None, **unknown_fields):
         '''
         actions : typing.Sequence[~ActionsByName]
         '''
-        self.actions = [ActionsByName.from_json(o) for o in actions or []]
+        self._raw_actions = actions
+        self.unknown_fields = unknown_fields
+
+    actions = LazyField('actions', lambda data: [ActionsByName.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_actions = data.get('actions')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'actions': self._raw_actions}
 
 
 
 class ActionsByReceiver(Type):
+    __slots__ = ('_actions', '_error', '_raw_actions', '_raw_error', 'receiver', 'unknown_fields')
     _toSchema = {'actions': 'actions', 'error': 'error', 'receiver': 'receiver'}
     _toPy = {'actions': 'actions', 'error': 'error', 'receiver': 'receiver'}
     def __init__(self, actions=None, error=None, receiver=None, **unknown_fields):
@@ -168,24 +356,59 @@ class ActionsByReceiver(Type):
         error : Error
         receiver : str
         '''
-        self.actions = [ActionResult.from_json(o) for o in actions or []]
-        self.error = Error.from_json(error) if error else None
+        self._raw_actions = actions
+        self._raw_error = error
         self.receiver = receiver
+        self.unknown_fields = unknown_fields
+
+    actions = LazyField('actions', lambda data: [ActionResult.from_json(o) for o in data or []])
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_actions = data.get('actions')
+        self._raw_error = data.get('error')
+        self.receiver = data.get('receiver')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'actions': self._raw_actions, 'error': self._raw_error, 'receiver': self.receiver}
 
 
 
 class ActionsByReceivers(Type):
+    __slots__ = ('_actions', '_raw_actions', 'unknown_fields')
     _toSchema = {'actions': 'actions'}
     _toPy = {'actions': 'actions'}
     def __init__(self, actions=None, **unknown_fields):
         '''
         actions : typing.Sequence[~ActionsByReceiver]
         '''
-        self.actions = [ActionsByReceiver.from_json(o) for o in actions or []]
+        self._raw_actions = actions
+        self.unknown_fields = unknown_fields
+
+    actions = LazyField('actions', lambda data: [ActionsByReceiver.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_actions = data.get('actions')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'actions': self._raw_actions}
 
 
 
 class AddApplicationOffer(Type):
+    __slots__ = ('application_description', 'application_name', 'endpoints', 'model_tag', 'offer_name', 'unknown_fields')
     _toSchema = {'application_description': 'application-description', 'application_name': 'application-name', 'endpoints': 'endpoints', 'model_tag': 'model-tag', 'offer_name': 'offer-name'}
     _toPy = {'application-description': 'application_description', 'application-name': 'application_name', 'endpoints': 'endpoints', 'model-tag': 'model_tag', 'offer-name': 'offer_name'}
     def __init__(self, application_description=None, application_name=None, endpoints=None, model_tag=None, offer_name=None, **unknown_fields):
@@ -201,21 +424,55 @@ class AddApplicationOffer(Type):
         self.endpoints = endpoints
         self.model_tag = model_tag
         self.offer_name = offer_name
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_description = data.get('application-description')
+        self.application_name = data.get('application-name')
+        self.endpoints = data.get('endpoints')
+        self.model_tag = data.get('model-tag')
+        self.offer_name = data.get('offer-name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-description': self.application_description, 'application-name': self.application_name, 'endpoints': self.endpoints, 'model-tag': self.model_tag, 'offer-name': self.offer_name}
 
 
 
 class AddApplicationOffers(Type):
+    __slots__ = ('_offers', '_raw_offers', 'unknown_fields')
     _toSchema = {'offers': 'Offers'}
     _toPy = {'Offers': 'offers'}
     def __init__(self, offers=None, **unknown_fields):
         '''
         offers : typing.Sequence[~AddApplicationOffer]
         '''
-        self.offers = [AddApplicationOffer.from_json(o) for o in offers or []]
+        self._raw_offers = offers
+        self.unknown_fields = unknown_fields
+
+    offers = LazyField('offers', lambda data: [AddApplicationOffer.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_offers = data.get('Offers')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Offers': self._raw_offers}
 
 
 
 class AddApplicationUnits(Type):
+    __slots__ = ('_placement', '_raw_placement', 'application', 'num_units', 'unknown_fields')
     _toSchema = {'application': 'application', 'num_units': 'num-units', 'placement': 'placement'}
     _toPy = {'application': 'application', 'num-units': 'num_units', 'placement': 'placement'}
     def __init__(self, application=None, num_units=None, placement=None, **unknown_fields):
@@ -226,11 +483,29 @@ class AddApplicationUnits(Type):
         '''
         self.application = application
         self.num_units = num_units
-        self.placement = [Placement.from_json(o) for o in placement or []]
+        self._raw_placement = placement
+        self.unknown_fields = unknown_fields
+
+    placement = LazyField('placement', lambda data: [Placement.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.num_units = data.get('num-units')
+        self._raw_placement = data.get('placement')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'num-units': self.num_units, 'placement': self._raw_placement}
 
 
 
 class AddApplicationUnitsResults(Type):
+    __slots__ = ('units', 'unknown_fields')
     _toSchema = {'units': 'units'}
     _toPy = {'units': 'units'}
     def __init__(self, units=None, **unknown_fields):
@@ -238,10 +513,24 @@ class AddApplicationUnitsResults(Type):
         units : typing.Sequence[str]
         '''
         self.units = units
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.units = data.get('units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'units': self.units}
 
 
 
 class AddCharm(Type):
+    __slots__ = ('channel', 'unknown_fields', 'url')
     _toSchema = {'channel': 'channel', 'url': 'url'}
     _toPy = {'channel': 'channel', 'url': 'url'}
     def __init__(self, channel=None, url=None, **unknown_fields):
@@ -251,10 +540,25 @@ class AddCharm(Type):
         '''
         self.channel = channel
         self.url = url
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.channel = data.get('channel')
+        self.url = data.get('url')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'channel': self.channel, 'url': self.url}
 
 
 
 class AddCharmWithAuthorization(Type):
+    __slots__ = ('_macaroon', '_raw_macaroon', 'channel', 'unknown_fields', 'url')
     _toSchema = {'channel': 'channel', 'macaroon': 'macaroon', 'url': 'url'}
     _toPy = {'channel': 'channel', 'macaroon': 'macaroon', 'url': 'url'}
     def __init__(self, channel=None, macaroon=None, url=None, **unknown_fields):
@@ -264,12 +568,30 @@ class AddCharmWithAuthorization(Type):
         url : str
         '''
         self.channel = channel
-        self.macaroon = Macaroon.from_json(macaroon) if macaroon else None
+        self._raw_macaroon = macaroon
         self.url = url
+        self.unknown_fields = unknown_fields
+
+    macaroon = LazyField('macaroon', lambda data: Macaroon.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.channel = data.get('channel')
+        self._raw_macaroon = data.get('macaroon')
+        self.url = data.get('url')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'channel': self.channel, 'macaroon': self._raw_macaroon, 'url': self.url}
 
 
 
 class AddCloudArgs(Type):
+    __slots__ = ('_cloud', '_raw_cloud', 'name', 'unknown_fields')
     _toSchema = {'cloud': 'cloud', 'name': 'name'}
     _toPy = {'cloud': 'cloud', 'name': 'name'}
     def __init__(self, cloud=None, name=None, **unknown_fields):
@@ -277,12 +599,29 @@ class AddCloudArgs(Type):
         cloud : Cloud
         name : str
         '''
-        self.cloud = Cloud.from_json(cloud) if cloud else None
+        self._raw_cloud = cloud
         self.name = name
+        self.unknown_fields = unknown_fields
+
+    cloud = LazyField('cloud', lambda data: Cloud.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_cloud = data.get('cloud')
+        self.name = data.get('name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud': self._raw_cloud, 'name': self.name}
 
 
 
 class AddMachineParams(Type):
+    __slots__ = ('_addresses', '_constraints', '_disks', '_hardware_characteristics', '_placement', '_raw_addresses', '_raw_constraints', '_raw_disks', '_raw_hardware_characteristics', '_raw_placement', 'container_type', 'instance_id', 'jobs', 'nonce', 'parent_id', 'series', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'constraints': 'constraints', 'container_type': 'container-type', 'disks': 'disks', 'hardware_characteristics': 'hardware-characteristics', 'instance_id': 'instance-id', 'jobs': 'jobs', 'nonce': 'nonce', 'parent_id': 'parent-id', 'placement': 'placement', 'series': 'series'}
     _toPy = {'addresses': 'addresses', 'constraints': 'constraints', 'container-type': 'container_type', 'disks': 'disks', 'hardware-characteristics': 'hardware_characteristics', 'instance-id': 'instance_id', 'jobs': 'jobs', 'nonce': 'nonce', 'parent-id': 'parent_id', 'placement': 'placement', 'series': 'series'}
     def __init__(self, addresses=None, constraints=None, container_type=None, disks=None, hardware_characteristics=None, instance_id=None, jobs=None, nonce=None, parent_id=None, placement=None, series=None, **unknown_fields):
@@ -299,32 +638,78 @@ class AddMachineParams(Type):
         placement : Placement
         series : str
         '''
-        self.addresses = [Address.from_json(o) for o in addresses or []]
-        self.constraints = Value.from_json(constraints) if constraints else None
+        self._raw_addresses = addresses
+        self._raw_constraints = constraints
         self.container_type = container_type
-        self.disks = [Constraints.from_json(o) for o in disks or []]
-        self.hardware_characteristics = HardwareCharacteristics.from_json(hardware_characteristics) if hardware_characteristics else None
+        self._raw_disks = disks
+        self._raw_hardware_characteristics = hardware_characteristics
         self.instance_id = instance_id
         self.jobs = jobs
         self.nonce = nonce
         self.parent_id = parent_id
-        self.placement = Placement.from_json(placement) if placement else None
+        self._raw_placement = placement
         self.series = series
+        self.unknown_fields = unknown_fields
+
+    addresses = LazyField('addresses', lambda data: [Address.from_json(o) for o in data or []])
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+    disks = LazyField('disks', lambda data: [Constraints.from_json(o) for o in data or []])
+    hardware_characteristics = LazyField('hardware_characteristics', lambda data: HardwareCharacteristics.from_json(data) if data else None)
+    placement = LazyField('placement', lambda data: Placement.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_addresses = data.get('addresses')
+        self._raw_constraints = data.get('constraints')
+        self.container_type = data.get('container-type')
+        self._raw_disks = data.get('disks')
+        self._raw_hardware_characteristics = data.get('hardware-characteristics')
+        self.instance_id = data.get('instance-id')
+        self.jobs = data.get('jobs')
+        self.nonce = data.get('nonce')
+        self.parent_id = data.get('parent-id')
+        self._raw_placement = data.get('placement')
+        self.series = data.get('series')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'addresses': self._raw_addresses, 'constraints': self._raw_constraints, 'container-type': self.container_type, 'disks': self._raw_disks, 'hardware-characteristics': self._raw_hardware_characteristics, 'instance-id': self.instance_id, 'jobs': self.jobs, 'nonce': self.nonce, 'parent-id': self.parent_id, 'placement': self._raw_placement, 'series': self.series}
 
 
 
 class AddMachines(Type):
+    __slots__ = ('_params', '_raw_params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~AddMachineParams]
         '''
-        self.params = [AddMachineParams.from_json(o) for o in params or []]
+        self._raw_params = params
+        self.unknown_fields = unknown_fields
+
+    params = LazyField('params', lambda data: [AddMachineParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'params': self._raw_params}
 
 
 
 class AddMachinesResult(Type):
+    __slots__ = ('_error', '_raw_error', 'machine', 'unknown_fields')
     _toSchema = {'error': 'error', 'machine': 'machine'}
     _toPy = {'error': 'error', 'machine': 'machine'}
     def __init__(self, error=None, machine=None, **unknown_fields):
@@ -332,23 +717,56 @@ class AddMachinesResult(Type):
         error : Error
         machine : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.machine = machine
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.machine = data.get('machine')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'machine': self.machine}
 
 
 
 class AddMachinesResults(Type):
+    __slots__ = ('_machines', '_raw_machines', 'unknown_fields')
     _toSchema = {'machines': 'machines'}
     _toPy = {'machines': 'machines'}
     def __init__(self, machines=None, **unknown_fields):
         '''
         machines : typing.Sequence[~AddMachinesResult]
         '''
-        self.machines = [AddMachinesResult.from_json(o) for o in machines or []]
+        self._raw_machines = machines
+        self.unknown_fields = unknown_fields
+
+    machines = LazyField('machines', lambda data: [AddMachinesResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_machines = data.get('machines')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'machines': self._raw_machines}
 
 
 
 class AddPendingResourcesArgs(Type):
+    __slots__ = ('_addcharmwithauthorization', '_entity', '_raw_addcharmwithauthorization', '_raw_entity', '_raw_resources', '_resources', 'unknown_fields')
     _toSchema = {'addcharmwithauthorization': 'AddCharmWithAuthorization', 'entity': 'Entity', 'resources': 'Resources'}
     _toPy = {'AddCharmWithAuthorization': 'addcharmwithauthorization', 'Entity': 'entity', 'Resources': 'resources'}
     def __init__(self, addcharmwithauthorization=None, entity=None, resources=None, **unknown_fields):
@@ -357,13 +775,33 @@ class AddPendingResourcesArgs(Type):
         entity : Entity
         resources : typing.Sequence[~CharmResource]
         '''
-        self.addcharmwithauthorization = AddCharmWithAuthorization.from_json(addcharmwithauthorization) if addcharmwithauthorization else None
-        self.entity = Entity.from_json(entity) if entity else None
-        self.resources = [CharmResource.from_json(o) for o in resources or []]
+        self._raw_addcharmwithauthorization = addcharmwithauthorization
+        self._raw_entity = entity
+        self._raw_resources = resources
+        self.unknown_fields = unknown_fields
+
+    addcharmwithauthorization = LazyField('addcharmwithauthorization', lambda data: AddCharmWithAuthorization.from_json(data) if data else None)
+    entity = LazyField('entity', lambda data: Entity.from_json(data) if data else None)
+    resources = LazyField('resources', lambda data: [CharmResource.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_addcharmwithauthorization = data.get('AddCharmWithAuthorization')
+        self._raw_entity = data.get('Entity')
+        self._raw_resources = data.get('Resources')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'AddCharmWithAuthorization': self._raw_addcharmwithauthorization, 'Entity': self._raw_entity, 'Resources': self._raw_resources}
 
 
 
 class AddPendingResourcesResult(Type):
+    __slots__ = ('_errorresult', '_raw_errorresult', 'pending_ids', 'unknown_fields')
     _toSchema = {'errorresult': 'ErrorResult', 'pending_ids': 'pending-ids'}
     _toPy = {'ErrorResult': 'errorresult', 'pending-ids': 'pending_ids'}
     def __init__(self, errorresult=None, pending_ids=None, **unknown_fields):
@@ -371,12 +809,29 @@ class AddPendingResourcesResult(Type):
         errorresult : ErrorResult
         pending_ids : typing.Sequence[str]
         '''
-        self.errorresult = ErrorResult.from_json(errorresult) if errorresult else None
+        self._raw_errorresult = errorresult
         self.pending_ids = pending_ids
+        self.unknown_fields = unknown_fields
+
+    errorresult = LazyField('errorresult', lambda data: ErrorResult.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_errorresult = data.get('ErrorResult')
+        self.pending_ids = data.get('pending-ids')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ErrorResult': self._raw_errorresult, 'pending-ids': self.pending_ids}
 
 
 
 class AddRelation(Type):
+    __slots__ = ('endpoints', 'unknown_fields')
     _toSchema = {'endpoints': 'endpoints'}
     _toPy = {'endpoints': 'endpoints'}
     def __init__(self, endpoints=None, **unknown_fields):
@@ -384,10 +839,24 @@ class AddRelation(Type):
         endpoints : typing.Sequence[str]
         '''
         self.endpoints = endpoints
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.endpoints = data.get('endpoints')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'endpoints': self.endpoints}
 
 
 
 class AddRelationResults(Type):
+    __slots__ = ('endpoints', 'unknown_fields')
     _toSchema = {'endpoints': 'endpoints'}
     _toPy = {'endpoints': 'endpoints'}
     def __init__(self, endpoints=None, **unknown_fields):
@@ -395,10 +864,24 @@ class AddRelationResults(Type):
         endpoints : typing.Mapping[str, ~CharmRelation]
         '''
         self.endpoints = endpoints
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.endpoints = data.get('endpoints')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'endpoints': self.endpoints}
 
 
 
 class AddStorageDetails(Type):
+    __slots__ = ('storage_tags', 'unknown_fields')
     _toSchema = {'storage_tags': 'storage-tags'}
     _toPy = {'storage-tags': 'storage_tags'}
     def __init__(self, storage_tags=None, **unknown_fields):
@@ -406,10 +889,24 @@ class AddStorageDetails(Type):
         storage_tags : typing.Sequence[str]
         '''
         self.storage_tags = storage_tags
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.storage_tags = data.get('storage-tags')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'storage-tags': self.storage_tags}
 
 
 
 class AddStorageResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -417,23 +914,57 @@ class AddStorageResult(Type):
         error : Error
         result : AddStorageDetails
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = AddStorageDetails.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: AddStorageDetails.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class AddStorageResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~AddStorageResult]
         '''
-        self.results = [AddStorageResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [AddStorageResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class AddSubnetParams(Type):
+    __slots__ = ('space_tag', 'subnet_provider_id', 'subnet_tag', 'unknown_fields', 'zones')
     _toSchema = {'space_tag': 'space-tag', 'subnet_provider_id': 'subnet-provider-id', 'subnet_tag': 'subnet-tag', 'zones': 'zones'}
     _toPy = {'space-tag': 'space_tag', 'subnet-provider-id': 'subnet_provider_id', 'subnet-tag': 'subnet_tag', 'zones': 'zones'}
     def __init__(self, space_tag=None, subnet_provider_id=None, subnet_tag=None, zones=None, **unknown_fields):
@@ -447,21 +978,54 @@ class AddSubnetParams(Type):
         self.subnet_provider_id = subnet_provider_id
         self.subnet_tag = subnet_tag
         self.zones = zones
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.space_tag = data.get('space-tag')
+        self.subnet_provider_id = data.get('subnet-provider-id')
+        self.subnet_tag = data.get('subnet-tag')
+        self.zones = data.get('zones')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'space-tag': self.space_tag, 'subnet-provider-id': self.subnet_provider_id, 'subnet-tag': self.subnet_tag, 'zones': self.zones}
 
 
 
 class AddSubnetsParams(Type):
+    __slots__ = ('_raw_subnets', '_subnets', 'unknown_fields')
     _toSchema = {'subnets': 'subnets'}
     _toPy = {'subnets': 'subnets'}
     def __init__(self, subnets=None, **unknown_fields):
         '''
         subnets : typing.Sequence[~AddSubnetParams]
         '''
-        self.subnets = [AddSubnetParams.from_json(o) for o in subnets or []]
+        self._raw_subnets = subnets
+        self.unknown_fields = unknown_fields
+
+    subnets = LazyField('subnets', lambda data: [AddSubnetParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_subnets = data.get('subnets')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'subnets': self._raw_subnets}
 
 
 
 class AddUser(Type):
+    __slots__ = ('display_name', 'password', 'unknown_fields', 'username')
     _toSchema = {'display_name': 'display-name', 'password': 'password', 'username': 'username'}
     _toPy = {'display-name': 'display_name', 'password': 'password', 'username': 'username'}
     def __init__(self, display_name=None, password=None, username=None, **unknown_fields):
@@ -473,10 +1037,26 @@ class AddUser(Type):
         self.display_name = display_name
         self.password = password
         self.username = username
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.display_name = data.get('display-name')
+        self.password = data.get('password')
+        self.username = data.get('username')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'display-name': self.display_name, 'password': self.password, 'username': self.username}
 
 
 
 class AddUserResult(Type):
+    __slots__ = ('_error', '_raw_error', 'secret_key', 'tag', 'unknown_fields')
     _toSchema = {'error': 'error', 'secret_key': 'secret-key', 'tag': 'tag'}
     _toPy = {'error': 'error', 'secret-key': 'secret_key', 'tag': 'tag'}
     def __init__(self, error=None, secret_key=None, tag=None, **unknown_fields):
@@ -485,35 +1065,85 @@ class AddUserResult(Type):
         secret_key : typing.Sequence[int]
         tag : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.secret_key = secret_key
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.secret_key = data.get('secret-key')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'secret-key': self.secret_key, 'tag': self.tag}
 
 
 
 class AddUserResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~AddUserResult]
         '''
-        self.results = [AddUserResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [AddUserResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class AddUsers(Type):
+    __slots__ = ('_raw_users', '_users', 'unknown_fields')
     _toSchema = {'users': 'users'}
     _toPy = {'users': 'users'}
     def __init__(self, users=None, **unknown_fields):
         '''
         users : typing.Sequence[~AddUser]
         '''
-        self.users = [AddUser.from_json(o) for o in users or []]
+        self._raw_users = users
+        self.unknown_fields = unknown_fields
+
+    users = LazyField('users', lambda data: [AddUser.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_users = data.get('users')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'users': self._raw_users}
 
 
 
 class Address(Type):
+    __slots__ = ('scope', 'space_name', 'type_', 'unknown_fields', 'value')
     _toSchema = {'scope': 'scope', 'space_name': 'space-name', 'type_': 'type', 'value': 'value'}
     _toPy = {'scope': 'scope', 'space-name': 'space_name', 'type': 'type_', 'value': 'value'}
     def __init__(self, scope=None, space_name=None, type_=None, value=None, **unknown_fields):
@@ -527,10 +1157,27 @@ class Address(Type):
         self.space_name = space_name
         self.type_ = type_
         self.value = value
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.scope = data.get('scope')
+        self.space_name = data.get('space-name')
+        self.type_ = data.get('type')
+        self.value = data.get('value')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'scope': self.scope, 'space-name': self.space_name, 'type': self.type_, 'value': self.value}
 
 
 
 class AdoptResourcesArgs(Type):
+    __slots__ = ('_raw_source_controller_version', '_source_controller_version', 'model_tag', 'unknown_fields')
     _toSchema = {'model_tag': 'model-tag', 'source_controller_version': 'source-controller-version'}
     _toPy = {'model-tag': 'model_tag', 'source-controller-version': 'source_controller_version'}
     def __init__(self, model_tag=None, source_controller_version=None, **unknown_fields):
@@ -539,11 +1186,28 @@ class AdoptResourcesArgs(Type):
         source_controller_version : Number
         '''
         self.model_tag = model_tag
-        self.source_controller_version = Number.from_json(source_controller_version) if source_controller_version else None
+        self._raw_source_controller_version = source_controller_version
+        self.unknown_fields = unknown_fields
+
+    source_controller_version = LazyField('source_controller_version', lambda data: Number.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.model_tag = data.get('model-tag')
+        self._raw_source_controller_version = data.get('source-controller-version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'model-tag': self.model_tag, 'source-controller-version': self._raw_source_controller_version}
 
 
 
 class AgentGetEntitiesResult(Type):
+    __slots__ = ('_error', '_raw_error', 'container_type', 'jobs', 'life', 'unknown_fields')
     _toSchema = {'container_type': 'container-type', 'error': 'error', 'jobs': 'jobs', 'life': 'life'}
     _toPy = {'container-type': 'container_type', 'error': 'error', 'jobs': 'jobs', 'life': 'life'}
     def __init__(self, container_type=None, error=None, jobs=None, life=None, **unknown_fields):
@@ -554,35 +1218,86 @@ class AgentGetEntitiesResult(Type):
         life : str
         '''
         self.container_type = container_type
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.jobs = jobs
         self.life = life
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.container_type = data.get('container-type')
+        self._raw_error = data.get('error')
+        self.jobs = data.get('jobs')
+        self.life = data.get('life')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'container-type': self.container_type, 'error': self._raw_error, 'jobs': self.jobs, 'life': self.life}
 
 
 
 class AgentGetEntitiesResults(Type):
+    __slots__ = ('_entities', '_raw_entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~AgentGetEntitiesResult]
         '''
-        self.entities = [AgentGetEntitiesResult.from_json(o) for o in entities or []]
+        self._raw_entities = entities
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [AgentGetEntitiesResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities}
 
 
 
 class AgentVersionResult(Type):
+    __slots__ = ('_raw_version', '_version', 'unknown_fields')
     _toSchema = {'version': 'version'}
     _toPy = {'version': 'version'}
     def __init__(self, version=None, **unknown_fields):
         '''
         version : Number
         '''
-        self.version = Number.from_json(version) if version else None
+        self._raw_version = version
+        self.unknown_fields = unknown_fields
+
+    version = LazyField('version', lambda data: Number.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'version': self._raw_version}
 
 
 
 class AllWatcherId(Type):
+    __slots__ = ('unknown_fields', 'watcher_id')
     _toSchema = {'watcher_id': 'watcher-id'}
     _toPy = {'watcher-id': 'watcher_id'}
     def __init__(self, watcher_id=None, **unknown_fields):
@@ -590,21 +1305,51 @@ class AllWatcherId(Type):
         watcher_id : str
         '''
         self.watcher_id = watcher_id
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.watcher_id = data.get('watcher-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'watcher-id': self.watcher_id}
 
 
 
 class AllWatcherNextResults(Type):
+    __slots__ = ('_deltas', '_raw_deltas', 'unknown_fields')
     _toSchema = {'deltas': 'deltas'}
     _toPy = {'deltas': 'deltas'}
     def __init__(self, deltas=None, **unknown_fields):
         '''
         deltas : typing.Sequence[~Delta]
         '''
-        self.deltas = [Delta.from_json(o) for o in deltas or []]
+        self._raw_deltas = deltas
+        self.unknown_fields = unknown_fields
+
+    deltas = LazyField('deltas', lambda data: [Delta.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_deltas = data.get('deltas')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'deltas': self._raw_deltas}
 
 
 
 class AnnotationsGetResult(Type):
+    __slots__ = ('_error', '_raw_error', 'annotations', 'entity', 'unknown_fields')
     _toSchema = {'annotations': 'annotations', 'entity': 'entity', 'error': 'error'}
     _toPy = {'annotations': 'annotations', 'entity': 'entity', 'error': 'error'}
     def __init__(self, annotations=None, entity=None, error=None, **unknown_fields):
@@ -615,33 +1360,83 @@ class AnnotationsGetResult(Type):
         '''
         self.annotations = annotations
         self.entity = entity
-        self.error = ErrorResult.from_json(error) if error else None
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: ErrorResult.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.annotations = data.get('annotations')
+        self.entity = data.get('entity')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'annotations': self.annotations, 'entity': self.entity, 'error': self._raw_error}
 
 
 
 class AnnotationsGetResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~AnnotationsGetResult]
         '''
-        self.results = [AnnotationsGetResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [AnnotationsGetResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class AnnotationsSet(Type):
+    __slots__ = ('_annotations', '_raw_annotations', 'unknown_fields')
     _toSchema = {'annotations': 'annotations'}
     _toPy = {'annotations': 'annotations'}
     def __init__(self, annotations=None, **unknown_fields):
         '''
         annotations : typing.Sequence[~EntityAnnotations]
         '''
-        self.annotations = [EntityAnnotations.from_json(o) for o in annotations or []]
+        self._raw_annotations = annotations
+        self.unknown_fields = unknown_fields
+
+    annotations = LazyField('annotations', lambda data: [EntityAnnotations.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_annotations = data.get('annotations')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'annotations': self._raw_annotations}
 
 
 
 class ApplicationCharm(Type):
+    __slots__ = ('charm_modified_version', 'force_upgrade', 'sha256', 'unknown_fields', 'url')
     _toSchema = {'charm_modified_version': 'charm-modified-version', 'force_upgrade': 'force-upgrade', 'sha256': 'sha256', 'url': 'url'}
     _toPy = {'charm-modified-version': 'charm_modified_version', 'force-upgrade': 'force_upgrade', 'sha256': 'sha256', 'url': 'url'}
     def __init__(self, charm_modified_version=None, force_upgrade=None, sha256=None, url=None, **unknown_fields):
@@ -655,10 +1450,27 @@ class ApplicationCharm(Type):
         self.force_upgrade = force_upgrade
         self.sha256 = sha256
         self.url = url
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.charm_modified_version = data.get('charm-modified-version')
+        self.force_upgrade = data.get('force-upgrade')
+        self.sha256 = data.get('sha256')
+        self.url = data.get('url')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'charm-modified-version': self.charm_modified_version, 'force-upgrade': self.force_upgrade, 'sha256': self.sha256, 'url': self.url}
 
 
 
 class ApplicationCharmActionsResult(Type):
+    __slots__ = ('_error', '_raw_error', 'actions', 'application_tag', 'unknown_fields')
     _toSchema = {'actions': 'actions', 'application_tag': 'application-tag', 'error': 'error'}
     _toPy = {'actions': 'actions', 'application-tag': 'application_tag', 'error': 'error'}
     def __init__(self, actions=None, application_tag=None, error=None, **unknown_fields):
@@ -669,11 +1481,29 @@ class ApplicationCharmActionsResult(Type):
         '''
         self.actions = actions
         self.application_tag = application_tag
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.actions = data.get('actions')
+        self.application_tag = data.get('application-tag')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'actions': self.actions, 'application-tag': self.application_tag, 'error': self._raw_error}
 
 
 
 class ApplicationCharmRelations(Type):
+    __slots__ = ('application', 'unknown_fields')
     _toSchema = {'application': 'application'}
     _toPy = {'application': 'application'}
     def __init__(self, application=None, **unknown_fields):
@@ -681,10 +1511,24 @@ class ApplicationCharmRelations(Type):
         application : str
         '''
         self.application = application
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application}
 
 
 
 class ApplicationCharmRelationsResults(Type):
+    __slots__ = ('charm_relations', 'unknown_fields')
     _toSchema = {'charm_relations': 'charm-relations'}
     _toPy = {'charm-relations': 'charm_relations'}
     def __init__(self, charm_relations=None, **unknown_fields):
@@ -692,10 +1536,24 @@ class ApplicationCharmRelationsResults(Type):
         charm_relations : typing.Sequence[str]
         '''
         self.charm_relations = charm_relations
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.charm_relations = data.get('charm-relations')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'charm-relations': self.charm_relations}
 
 
 
 class ApplicationCharmResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -703,23 +1561,57 @@ class ApplicationCharmResult(Type):
         error : Error
         result : ApplicationCharm
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ApplicationCharm.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ApplicationCharm.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ApplicationCharmResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationCharmResult]
         '''
-        self.results = [ApplicationCharmResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ApplicationCharmResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ApplicationConfigSet(Type):
+    __slots__ = ('application', 'config', 'unknown_fields')
     _toSchema = {'application': 'application', 'config': 'config'}
     _toPy = {'application': 'application', 'config': 'config'}
     def __init__(self, application=None, config=None, **unknown_fields):
@@ -729,32 +1621,79 @@ class ApplicationConfigSet(Type):
         '''
         self.application = application
         self.config = config
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'config': self.config}
 
 
 
 class ApplicationConfigSetArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ApplicationConfigSet]
         '''
-        self.args = [ApplicationConfigSet.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [ApplicationConfigSet.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('Args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Args': self._raw_args}
 
 
 
 class ApplicationConfigUnsetArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ApplicationUnset]
         '''
-        self.args = [ApplicationUnset.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [ApplicationUnset.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('Args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Args': self._raw_args}
 
 
 
 class ApplicationConstraint(Type):
+    __slots__ = ('_constraints', '_error', '_raw_constraints', '_raw_error', 'unknown_fields')
     _toSchema = {'constraints': 'constraints', 'error': 'error'}
     _toPy = {'constraints': 'constraints', 'error': 'error'}
     def __init__(self, constraints=None, error=None, **unknown_fields):
@@ -762,12 +1701,30 @@ class ApplicationConstraint(Type):
         constraints : Value
         error : Error
         '''
-        self.constraints = Value.from_json(constraints) if constraints else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_constraints = constraints
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_constraints = data.get('constraints')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'constraints': self._raw_constraints, 'error': self._raw_error}
 
 
 
 class ApplicationDeploy(Type):
+    __slots__ = ('_constraints', '_placement', '_raw_constraints', '_raw_placement', 'application', 'attach_storage', 'channel', 'charm_url', 'config', 'config_yaml', 'devices', 'endpoint_bindings', 'num_units', 'policy', 'resources', 'series', 'storage', 'unknown_fields')
     _toSchema = {'application': 'application', 'attach_storage': 'attach-storage', 'channel': 'channel', 'charm_url': 'charm-url', 'config': 'config', 'config_yaml': 'config-yaml', 'constraints': 'constraints', 'devices': 'devices', 'endpoint_bindings': 'endpoint-bindings', 'num_units': 'num-units', 'placement': 'placement', 'policy': 'policy', 'resources': 'resources', 'series': 'series', 'storage': 'storage'}
     _toPy = {'application': 'application', 'attach-storage': 'attach_storage', 'channel': 'channel', 'charm-url': 'charm_url', 'config': 'config', 'config-yaml': 'config_yaml', 'constraints': 'constraints', 'devices': 'devices', 'endpoint-bindings': 'endpoint_bindings', 'num-units': 'num_units', 'placement': 'placement', 'policy': 'policy', 'resources': 'resources', 'series': 'series', 'storage': 'storage'}
     def __init__(self, application=None, attach_storage=None, channel=None, charm_url=None, config=None, config_yaml=None, constraints=None, devices=None, endpoint_bindings=None, num_units=None, placement=None, policy=None, resources=None, series=None, storage=None, **unknown_fields):
@@ -794,19 +1751,50 @@ class ApplicationDeploy(Type):
         self.charm_url = charm_url
         self.config = config
         self.config_yaml = config_yaml
-        self.constraints = Value.from_json(constraints) if constraints else None
+        self._raw_constraints = constraints
         self.devices = devices
         self.endpoint_bindings = endpoint_bindings
         self.num_units = num_units
-        self.placement = [Placement.from_json(o) for o in placement or []]
+        self._raw_placement = placement
         self.policy = policy
         self.resources = resources
         self.series = series
         self.storage = storage
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+    placement = LazyField('placement', lambda data: [Placement.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.attach_storage = data.get('attach-storage')
+        self.channel = data.get('channel')
+        self.charm_url = data.get('charm-url')
+        self.config = data.get('config')
+        self.config_yaml = data.get('config-yaml')
+        self._raw_constraints = data.get('constraints')
+        self.devices = data.get('devices')
+        self.endpoint_bindings = data.get('endpoint-bindings')
+        self.num_units = data.get('num-units')
+        self._raw_placement = data.get('placement')
+        self.policy = data.get('policy')
+        self.resources = data.get('resources')
+        self.series = data.get('series')
+        self.storage = data.get('storage')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'attach-storage': self.attach_storage, 'channel': self.channel, 'charm-url': self.charm_url, 'config': self.config, 'config-yaml': self.config_yaml, 'constraints': self._raw_constraints, 'devices': self.devices, 'endpoint-bindings': self.endpoint_bindings, 'num-units': self.num_units, 'placement': self._raw_placement, 'policy': self.policy, 'resources': self.resources, 'series': self.series, 'storage': self.storage}
 
 
 
 class ApplicationDestroy(Type):
+    __slots__ = ('application', 'unknown_fields')
     _toSchema = {'application': 'application'}
     _toPy = {'application': 'application'}
     def __init__(self, application=None, **unknown_fields):
@@ -814,10 +1802,24 @@ class ApplicationDestroy(Type):
         application : str
         '''
         self.application = application
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application}
 
 
 
 class ApplicationExpose(Type):
+    __slots__ = ('application', 'unknown_fields')
     _toSchema = {'application': 'application'}
     _toPy = {'application': 'application'}
     def __init__(self, application=None, **unknown_fields):
@@ -825,10 +1827,24 @@ class ApplicationExpose(Type):
         application : str
         '''
         self.application = application
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application}
 
 
 
 class ApplicationGet(Type):
+    __slots__ = ('application', 'unknown_fields')
     _toSchema = {'application': 'application'}
     _toPy = {'application': 'application'}
     def __init__(self, application=None, **unknown_fields):
@@ -836,32 +1852,78 @@ class ApplicationGet(Type):
         application : str
         '''
         self.application = application
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application}
 
 
 
 class ApplicationGetConfigResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'Results'}
     _toPy = {'Results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ConfigResult]
         '''
-        self.results = [ConfigResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ConfigResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('Results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Results': self._raw_results}
 
 
 
 class ApplicationGetConstraintsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationConstraint]
         '''
-        self.results = [ApplicationConstraint.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ApplicationConstraint.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ApplicationGetResults(Type):
+    __slots__ = ('_constraints', '_raw_constraints', 'application', 'charm', 'config', 'series', 'unknown_fields')
     _toSchema = {'application': 'application', 'charm': 'charm', 'config': 'config', 'constraints': 'constraints', 'series': 'series'}
     _toPy = {'application': 'application', 'charm': 'charm', 'config': 'config', 'constraints': 'constraints', 'series': 'series'}
     def __init__(self, application=None, charm=None, config=None, constraints=None, series=None, **unknown_fields):
@@ -875,12 +1937,32 @@ class ApplicationGetResults(Type):
         self.application = application
         self.charm = charm
         self.config = config
-        self.constraints = Value.from_json(constraints) if constraints else None
+        self._raw_constraints = constraints
         self.series = series
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.charm = data.get('charm')
+        self.config = data.get('config')
+        self._raw_constraints = data.get('constraints')
+        self.series = data.get('series')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'charm': self.charm, 'config': self.config, 'constraints': self._raw_constraints, 'series': self.series}
 
 
 
 class ApplicationMetricCredential(Type):
+    __slots__ = ('application', 'metrics_credentials', 'unknown_fields')
     _toSchema = {'application': 'application', 'metrics_credentials': 'metrics-credentials'}
     _toPy = {'application': 'application', 'metrics-credentials': 'metrics_credentials'}
     def __init__(self, application=None, metrics_credentials=None, **unknown_fields):
@@ -890,21 +1972,52 @@ class ApplicationMetricCredential(Type):
         '''
         self.application = application
         self.metrics_credentials = metrics_credentials
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.metrics_credentials = data.get('metrics-credentials')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'metrics-credentials': self.metrics_credentials}
 
 
 
 class ApplicationMetricCredentials(Type):
+    __slots__ = ('_creds', '_raw_creds', 'unknown_fields')
     _toSchema = {'creds': 'creds'}
     _toPy = {'creds': 'creds'}
     def __init__(self, creds=None, **unknown_fields):
         '''
         creds : typing.Sequence[~ApplicationMetricCredential]
         '''
-        self.creds = [ApplicationMetricCredential.from_json(o) for o in creds or []]
+        self._raw_creds = creds
+        self.unknown_fields = unknown_fields
+
+    creds = LazyField('creds', lambda data: [ApplicationMetricCredential.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_creds = data.get('creds')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'creds': self._raw_creds}
 
 
 
 class ApplicationOffer(Type):
+    __slots__ = ('_endpoints', '_raw_endpoints', '_raw_spaces', '_spaces', 'access', 'application_description', 'bindings', 'offer_name', 'offer_url', 'source_model_tag', 'unknown_fields')
     _toSchema = {'access': 'access', 'application_description': 'application-description', 'bindings': 'bindings', 'endpoints': 'endpoints', 'offer_name': 'offer-name', 'offer_url': 'offer-url', 'source_model_tag': 'source-model-tag', 'spaces': 'spaces'}
     _toPy = {'access': 'access', 'application-description': 'application_description', 'bindings': 'bindings', 'endpoints': 'endpoints', 'offer-name': 'offer_name', 'offer-url': 'offer_url', 'source-model-tag': 'source_model_tag', 'spaces': 'spaces'}
     def __init__(self, access=None, application_description=None, bindings=None, endpoints=None, offer_name=None, offer_url=None, source_model_tag=None, spaces=None, **unknown_fields):
@@ -921,15 +2034,39 @@ class ApplicationOffer(Type):
         self.access = access
         self.application_description = application_description
         self.bindings = bindings
-        self.endpoints = [RemoteEndpoint.from_json(o) for o in endpoints or []]
+        self._raw_endpoints = endpoints
         self.offer_name = offer_name
         self.offer_url = offer_url
         self.source_model_tag = source_model_tag
-        self.spaces = [RemoteSpace.from_json(o) for o in spaces or []]
+        self._raw_spaces = spaces
+        self.unknown_fields = unknown_fields
+
+    endpoints = LazyField('endpoints', lambda data: [RemoteEndpoint.from_json(o) for o in data or []])
+    spaces = LazyField('spaces', lambda data: [RemoteSpace.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.application_description = data.get('application-description')
+        self.bindings = data.get('bindings')
+        self._raw_endpoints = data.get('endpoints')
+        self.offer_name = data.get('offer-name')
+        self.offer_url = data.get('offer-url')
+        self.source_model_tag = data.get('source-model-tag')
+        self._raw_spaces = data.get('spaces')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'application-description': self.application_description, 'bindings': self.bindings, 'endpoints': self._raw_endpoints, 'offer-name': self.offer_name, 'offer-url': self.offer_url, 'source-model-tag': self.source_model_tag, 'spaces': self._raw_spaces}
 
 
 
 class ApplicationOfferAdminDetails(Type):
+    __slots__ = ('_applicationofferdetails', '_connections', '_raw_applicationofferdetails', '_raw_connections', 'application_name', 'charm_url', 'unknown_fields')
     _toSchema = {'application_name': 'application-name', 'applicationofferdetails': 'ApplicationOfferDetails', 'charm_url': 'charm-url', 'connections': 'connections'}
     _toPy = {'ApplicationOfferDetails': 'applicationofferdetails', 'application-name': 'application_name', 'charm-url': 'charm_url', 'connections': 'connections'}
     def __init__(self, applicationofferdetails=None, application_name=None, charm_url=None, connections=None, **unknown_fields):
@@ -939,14 +2076,34 @@ class ApplicationOfferAdminDetails(Type):
         charm_url : str
         connections : typing.Sequence[~OfferConnection]
         '''
-        self.applicationofferdetails = ApplicationOfferDetails.from_json(applicationofferdetails) if applicationofferdetails else None
+        self._raw_applicationofferdetails = applicationofferdetails
         self.application_name = application_name
         self.charm_url = charm_url
-        self.connections = [OfferConnection.from_json(o) for o in connections or []]
+        self._raw_connections = connections
+        self.unknown_fields = unknown_fields
+
+    applicationofferdetails = LazyField('applicationofferdetails', lambda data: ApplicationOfferDetails.from_json(data) if data else None)
+    connections = LazyField('connections', lambda data: [OfferConnection.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_applicationofferdetails = data.get('ApplicationOfferDetails')
+        self.application_name = data.get('application-name')
+        self.charm_url = data.get('charm-url')
+        self._raw_connections = data.get('connections')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ApplicationOfferDetails': self._raw_applicationofferdetails, 'application-name': self.application_name, 'charm-url': self.charm_url, 'connections': self._raw_connections}
 
 
 
 class ApplicationOfferDetails(Type):
+    __slots__ = ('_endpoints', '_raw_endpoints', '_raw_spaces', '_raw_users', '_spaces', '_users', 'application_description', 'bindings', 'offer_name', 'offer_url', 'offer_uuid', 'source_model_tag', 'unknown_fields')
     _toSchema = {'application_description': 'application-description', 'bindings': 'bindings', 'endpoints': 'endpoints', 'offer_name': 'offer-name', 'offer_url': 'offer-url', 'offer_uuid': 'offer-uuid', 'source_model_tag': 'source-model-tag', 'spaces': 'spaces', 'users': 'users'}
     _toPy = {'application-description': 'application_description', 'bindings': 'bindings', 'endpoints': 'endpoints', 'offer-name': 'offer_name', 'offer-url': 'offer_url', 'offer-uuid': 'offer_uuid', 'source-model-tag': 'source_model_tag', 'spaces': 'spaces', 'users': 'users'}
     def __init__(self, application_description=None, bindings=None, endpoints=None, offer_name=None, offer_url=None, offer_uuid=None, source_model_tag=None, spaces=None, users=None, **unknown_fields):
@@ -963,17 +2120,43 @@ class ApplicationOfferDetails(Type):
         '''
         self.application_description = application_description
         self.bindings = bindings
-        self.endpoints = [RemoteEndpoint.from_json(o) for o in endpoints or []]
+        self._raw_endpoints = endpoints
         self.offer_name = offer_name
         self.offer_url = offer_url
         self.offer_uuid = offer_uuid
         self.source_model_tag = source_model_tag
-        self.spaces = [RemoteSpace.from_json(o) for o in spaces or []]
-        self.users = [OfferUserDetails.from_json(o) for o in users or []]
+        self._raw_spaces = spaces
+        self._raw_users = users
+        self.unknown_fields = unknown_fields
+
+    endpoints = LazyField('endpoints', lambda data: [RemoteEndpoint.from_json(o) for o in data or []])
+    spaces = LazyField('spaces', lambda data: [RemoteSpace.from_json(o) for o in data or []])
+    users = LazyField('users', lambda data: [OfferUserDetails.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_description = data.get('application-description')
+        self.bindings = data.get('bindings')
+        self._raw_endpoints = data.get('endpoints')
+        self.offer_name = data.get('offer-name')
+        self.offer_url = data.get('offer-url')
+        self.offer_uuid = data.get('offer-uuid')
+        self.source_model_tag = data.get('source-model-tag')
+        self._raw_spaces = data.get('spaces')
+        self._raw_users = data.get('users')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-description': self.application_description, 'bindings': self.bindings, 'endpoints': self._raw_endpoints, 'offer-name': self.offer_name, 'offer-url': self.offer_url, 'offer-uuid': self.offer_uuid, 'source-model-tag': self.source_model_tag, 'spaces': self._raw_spaces, 'users': self._raw_users}
 
 
 
 class ApplicationOfferResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -981,12 +2164,30 @@ class ApplicationOfferResult(Type):
         error : Error
         result : ApplicationOfferAdminDetails
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ApplicationOfferAdminDetails.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ApplicationOfferAdminDetails.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ApplicationOfferStatus(Type):
+    __slots__ = ('active_connected_count', 'application_name', 'charm', 'endpoints', 'err', 'offer_name', 'total_connected_count', 'unknown_fields')
     _toSchema = {'active_connected_count': 'active-connected-count', 'application_name': 'application-name', 'charm': 'charm', 'endpoints': 'endpoints', 'err': 'err', 'offer_name': 'offer-name', 'total_connected_count': 'total-connected-count'}
     _toPy = {'active-connected-count': 'active_connected_count', 'application-name': 'application_name', 'charm': 'charm', 'endpoints': 'endpoints', 'err': 'err', 'offer-name': 'offer_name', 'total-connected-count': 'total_connected_count'}
     def __init__(self, active_connected_count=None, application_name=None, charm=None, endpoints=None, err=None, offer_name=None, total_connected_count=None, **unknown_fields):
@@ -1006,21 +2207,57 @@ class ApplicationOfferStatus(Type):
         self.err = err
         self.offer_name = offer_name
         self.total_connected_count = total_connected_count
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.active_connected_count = data.get('active-connected-count')
+        self.application_name = data.get('application-name')
+        self.charm = data.get('charm')
+        self.endpoints = data.get('endpoints')
+        self.err = data.get('err')
+        self.offer_name = data.get('offer-name')
+        self.total_connected_count = data.get('total-connected-count')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'active-connected-count': self.active_connected_count, 'application-name': self.application_name, 'charm': self.charm, 'endpoints': self.endpoints, 'err': self.err, 'offer-name': self.offer_name, 'total-connected-count': self.total_connected_count}
 
 
 
 class ApplicationOffersResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationOfferResult]
         '''
-        self.results = [ApplicationOfferResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ApplicationOfferResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ApplicationRelationsChange(Type):
+    __slots__ = ('_changed', '_raw_changed', 'removed', 'unknown_fields')
     _toSchema = {'changed': 'changed', 'removed': 'removed'}
     _toPy = {'changed': 'changed', 'removed': 'removed'}
     def __init__(self, changed=None, removed=None, **unknown_fields):
@@ -1028,12 +2265,29 @@ class ApplicationRelationsChange(Type):
         changed : typing.Sequence[~RelationChange]
         removed : typing.Sequence[int]
         '''
-        self.changed = [RelationChange.from_json(o) for o in changed or []]
+        self._raw_changed = changed
         self.removed = removed
+        self.unknown_fields = unknown_fields
+
+    changed = LazyField('changed', lambda data: [RelationChange.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changed = data.get('changed')
+        self.removed = data.get('removed')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changed': self._raw_changed, 'removed': self.removed}
 
 
 
 class ApplicationRelationsWatchResult(Type):
+    __slots__ = ('_changes', '_error', '_raw_changes', '_raw_error', 'applicationrelationswatcherid', 'unknown_fields')
     _toSchema = {'applicationrelationswatcherid': 'ApplicationRelationsWatcherId', 'changes': 'changes', 'error': 'error'}
     _toPy = {'ApplicationRelationsWatcherId': 'applicationrelationswatcherid', 'changes': 'changes', 'error': 'error'}
     def __init__(self, applicationrelationswatcherid=None, changes=None, error=None, **unknown_fields):
@@ -1043,12 +2297,31 @@ class ApplicationRelationsWatchResult(Type):
         error : Error
         '''
         self.applicationrelationswatcherid = applicationrelationswatcherid
-        self.changes = ApplicationRelationsChange.from_json(changes) if changes else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_changes = changes
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: ApplicationRelationsChange.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.applicationrelationswatcherid = data.get('ApplicationRelationsWatcherId')
+        self._raw_changes = data.get('changes')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ApplicationRelationsWatcherId': self.applicationrelationswatcherid, 'changes': self._raw_changes, 'error': self._raw_error}
 
 
 
 class ApplicationSet(Type):
+    __slots__ = ('application', 'options', 'unknown_fields')
     _toSchema = {'application': 'application', 'options': 'options'}
     _toPy = {'application': 'application', 'options': 'options'}
     def __init__(self, application=None, options=None, **unknown_fields):
@@ -1058,10 +2331,25 @@ class ApplicationSet(Type):
         '''
         self.application = application
         self.options = options
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.options = data.get('options')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'options': self.options}
 
 
 
 class ApplicationSetCharm(Type):
+    __slots__ = ('application', 'channel', 'charm_url', 'config_settings', 'config_settings_yaml', 'force_series', 'force_units', 'resource_ids', 'storage_constraints', 'unknown_fields')
     _toSchema = {'application': 'application', 'channel': 'channel', 'charm_url': 'charm-url', 'config_settings': 'config-settings', 'config_settings_yaml': 'config-settings-yaml', 'force_series': 'force-series', 'force_units': 'force-units', 'resource_ids': 'resource-ids', 'storage_constraints': 'storage-constraints'}
     _toPy = {'application': 'application', 'channel': 'channel', 'charm-url': 'charm_url', 'config-settings': 'config_settings', 'config-settings-yaml': 'config_settings_yaml', 'force-series': 'force_series', 'force-units': 'force_units', 'resource-ids': 'resource_ids', 'storage-constraints': 'storage_constraints'}
     def __init__(self, application=None, channel=None, charm_url=None, config_settings=None, config_settings_yaml=None, force_series=None, force_units=None, resource_ids=None, storage_constraints=None, **unknown_fields):
@@ -1085,10 +2373,32 @@ class ApplicationSetCharm(Type):
         self.force_units = force_units
         self.resource_ids = resource_ids
         self.storage_constraints = storage_constraints
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.channel = data.get('channel')
+        self.charm_url = data.get('charm-url')
+        self.config_settings = data.get('config-settings')
+        self.config_settings_yaml = data.get('config-settings-yaml')
+        self.force_series = data.get('force-series')
+        self.force_units = data.get('force-units')
+        self.resource_ids = data.get('resource-ids')
+        self.storage_constraints = data.get('storage-constraints')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'channel': self.channel, 'charm-url': self.charm_url, 'config-settings': self.config_settings, 'config-settings-yaml': self.config_settings_yaml, 'force-series': self.force_series, 'force-units': self.force_units, 'resource-ids': self.resource_ids, 'storage-constraints': self.storage_constraints}
 
 
 
 class ApplicationSetCharmProfile(Type):
+    __slots__ = ('application', 'charm_url', 'unknown_fields')
     _toSchema = {'application': 'application', 'charm_url': 'charm-url'}
     _toPy = {'application': 'application', 'charm-url': 'charm_url'}
     def __init__(self, application=None, charm_url=None, **unknown_fields):
@@ -1098,10 +2408,25 @@ class ApplicationSetCharmProfile(Type):
         '''
         self.application = application
         self.charm_url = charm_url
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.charm_url = data.get('charm-url')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'charm-url': self.charm_url}
 
 
 
 class ApplicationStatus(Type):
+    __slots__ = ('_raw_status', '_status', 'can_upgrade_to', 'charm', 'err', 'exposed', 'life', 'meter_statuses', 'relations', 'series', 'subordinate_to', 'units', 'unknown_fields', 'workload_version')
     _toSchema = {'can_upgrade_to': 'can-upgrade-to', 'charm': 'charm', 'err': 'err', 'exposed': 'exposed', 'life': 'life', 'meter_statuses': 'meter-statuses', 'relations': 'relations', 'series': 'series', 'status': 'status', 'subordinate_to': 'subordinate-to', 'units': 'units', 'workload_version': 'workload-version'}
     _toPy = {'can-upgrade-to': 'can_upgrade_to', 'charm': 'charm', 'err': 'err', 'exposed': 'exposed', 'life': 'life', 'meter-statuses': 'meter_statuses', 'relations': 'relations', 'series': 'series', 'status': 'status', 'subordinate-to': 'subordinate_to', 'units': 'units', 'workload-version': 'workload_version'}
     def __init__(self, can_upgrade_to=None, charm=None, err=None, exposed=None, life=None, meter_statuses=None, relations=None, series=None, status=None, subordinate_to=None, units=None, workload_version=None, **unknown_fields):
@@ -1127,14 +2452,41 @@ class ApplicationStatus(Type):
         self.meter_statuses = meter_statuses
         self.relations = relations
         self.series = series
-        self.status = DetailedStatus.from_json(status) if status else None
+        self._raw_status = status
         self.subordinate_to = subordinate_to
         self.units = units
         self.workload_version = workload_version
+        self.unknown_fields = unknown_fields
+
+    status = LazyField('status', lambda data: DetailedStatus.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.can_upgrade_to = data.get('can-upgrade-to')
+        self.charm = data.get('charm')
+        self.err = data.get('err')
+        self.exposed = data.get('exposed')
+        self.life = data.get('life')
+        self.meter_statuses = data.get('meter-statuses')
+        self.relations = data.get('relations')
+        self.series = data.get('series')
+        self._raw_status = data.get('status')
+        self.subordinate_to = data.get('subordinate-to')
+        self.units = data.get('units')
+        self.workload_version = data.get('workload-version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'can-upgrade-to': self.can_upgrade_to, 'charm': self.charm, 'err': self.err, 'exposed': self.exposed, 'life': self.life, 'meter-statuses': self.meter_statuses, 'relations': self.relations, 'series': self.series, 'status': self._raw_status, 'subordinate-to': self.subordinate_to, 'units': self.units, 'workload-version': self.workload_version}
 
 
 
 class ApplicationStatusResult(Type):
+    __slots__ = ('_application', '_error', '_raw_application', '_raw_error', 'units', 'unknown_fields')
     _toSchema = {'application': 'application', 'error': 'error', 'units': 'units'}
     _toPy = {'application': 'application', 'error': 'error', 'units': 'units'}
     def __init__(self, application=None, error=None, units=None, **unknown_fields):
@@ -1143,24 +2495,59 @@ class ApplicationStatusResult(Type):
         error : Error
         units : typing.Mapping[str, ~StatusResult]
         '''
-        self.application = StatusResult.from_json(application) if application else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_application = application
+        self._raw_error = error
         self.units = units
+        self.unknown_fields = unknown_fields
+
+    application = LazyField('application', lambda data: StatusResult.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_application = data.get('application')
+        self._raw_error = data.get('error')
+        self.units = data.get('units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self._raw_application, 'error': self._raw_error, 'units': self.units}
 
 
 
 class ApplicationStatusResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationStatusResult]
         '''
-        self.results = [ApplicationStatusResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ApplicationStatusResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ApplicationTag(Type):
+    __slots__ = ('name', 'unknown_fields')
     _toSchema = {'name': 'Name'}
     _toPy = {'Name': 'name'}
     def __init__(self, name=None, **unknown_fields):
@@ -1168,10 +2555,24 @@ class ApplicationTag(Type):
         name : str
         '''
         self.name = name
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.name = data.get('Name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Name': self.name}
 
 
 
 class ApplicationURLs(Type):
+    __slots__ = ('application_urls', 'unknown_fields')
     _toSchema = {'application_urls': 'application-urls'}
     _toPy = {'application-urls': 'application_urls'}
     def __init__(self, application_urls=None, **unknown_fields):
@@ -1179,10 +2580,24 @@ class ApplicationURLs(Type):
         application_urls : typing.Sequence[str]
         '''
         self.application_urls = application_urls
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_urls = data.get('application-urls')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-urls': self.application_urls}
 
 
 
 class ApplicationUnexpose(Type):
+    __slots__ = ('application', 'unknown_fields')
     _toSchema = {'application': 'application'}
     _toPy = {'application': 'application'}
     def __init__(self, application=None, **unknown_fields):
@@ -1190,10 +2605,24 @@ class ApplicationUnexpose(Type):
         application : str
         '''
         self.application = application
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application}
 
 
 
 class ApplicationUnitParams(Type):
+    __slots__ = ('_filesystem_info', '_raw_filesystem_info', 'address', 'data', 'info', 'ports', 'provider_id', 'status', 'unit_tag', 'unknown_fields')
     _toSchema = {'address': 'address', 'data': 'data', 'filesystem_info': 'filesystem-info', 'info': 'info', 'ports': 'ports', 'provider_id': 'provider-id', 'status': 'status', 'unit_tag': 'unit-tag'}
     _toPy = {'address': 'address', 'data': 'data', 'filesystem-info': 'filesystem_info', 'info': 'info', 'ports': 'ports', 'provider-id': 'provider_id', 'status': 'status', 'unit-tag': 'unit_tag'}
     def __init__(self, address=None, data=None, filesystem_info=None, info=None, ports=None, provider_id=None, status=None, unit_tag=None, **unknown_fields):
@@ -1209,16 +2638,39 @@ class ApplicationUnitParams(Type):
         '''
         self.address = address
         self.data = data
-        self.filesystem_info = [KubernetesFilesystemInfo.from_json(o) for o in filesystem_info or []]
+        self._raw_filesystem_info = filesystem_info
         self.info = info
         self.ports = ports
         self.provider_id = provider_id
         self.status = status
         self.unit_tag = unit_tag
+        self.unknown_fields = unknown_fields
+
+    filesystem_info = LazyField('filesystem_info', lambda data: [KubernetesFilesystemInfo.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.address = data.get('address')
+        self.data = data.get('data')
+        self._raw_filesystem_info = data.get('filesystem-info')
+        self.info = data.get('info')
+        self.ports = data.get('ports')
+        self.provider_id = data.get('provider-id')
+        self.status = data.get('status')
+        self.unit_tag = data.get('unit-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'address': self.address, 'data': self.data, 'filesystem-info': self._raw_filesystem_info, 'info': self.info, 'ports': self.ports, 'provider-id': self.provider_id, 'status': self.status, 'unit-tag': self.unit_tag}
 
 
 
 class ApplicationUnset(Type):
+    __slots__ = ('application', 'options', 'unknown_fields')
     _toSchema = {'application': 'application', 'options': 'options'}
     _toPy = {'application': 'application', 'options': 'options'}
     def __init__(self, application=None, options=None, **unknown_fields):
@@ -1228,10 +2680,25 @@ class ApplicationUnset(Type):
         '''
         self.application = application
         self.options = options
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.options = data.get('options')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'options': self.options}
 
 
 
 class ApplicationUpdate(Type):
+    __slots__ = ('_constraints', '_raw_constraints', 'application', 'charm_url', 'force_charm_url', 'force_series', 'min_units', 'settings', 'settings_yaml', 'unknown_fields')
     _toSchema = {'application': 'application', 'charm_url': 'charm-url', 'constraints': 'constraints', 'force_charm_url': 'force-charm-url', 'force_series': 'force-series', 'min_units': 'min-units', 'settings': 'settings', 'settings_yaml': 'settings-yaml'}
     _toPy = {'application': 'application', 'charm-url': 'charm_url', 'constraints': 'constraints', 'force-charm-url': 'force_charm_url', 'force-series': 'force_series', 'min-units': 'min_units', 'settings': 'settings', 'settings-yaml': 'settings_yaml'}
     def __init__(self, application=None, charm_url=None, constraints=None, force_charm_url=None, force_series=None, min_units=None, settings=None, settings_yaml=None, **unknown_fields):
@@ -1247,38 +2714,93 @@ class ApplicationUpdate(Type):
         '''
         self.application = application
         self.charm_url = charm_url
-        self.constraints = Value.from_json(constraints) if constraints else None
+        self._raw_constraints = constraints
         self.force_charm_url = force_charm_url
         self.force_series = force_series
         self.min_units = min_units
         self.settings = settings
         self.settings_yaml = settings_yaml
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.charm_url = data.get('charm-url')
+        self._raw_constraints = data.get('constraints')
+        self.force_charm_url = data.get('force-charm-url')
+        self.force_series = data.get('force-series')
+        self.min_units = data.get('min-units')
+        self.settings = data.get('settings')
+        self.settings_yaml = data.get('settings-yaml')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'charm-url': self.charm_url, 'constraints': self._raw_constraints, 'force-charm-url': self.force_charm_url, 'force-series': self.force_series, 'min-units': self.min_units, 'settings': self.settings, 'settings-yaml': self.settings_yaml}
 
 
 
 class ApplicationsCharmActionsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationCharmActionsResult]
         '''
-        self.results = [ApplicationCharmActionsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ApplicationCharmActionsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ApplicationsDeploy(Type):
+    __slots__ = ('_applications', '_raw_applications', 'unknown_fields')
     _toSchema = {'applications': 'applications'}
     _toPy = {'applications': 'applications'}
     def __init__(self, applications=None, **unknown_fields):
         '''
         applications : typing.Sequence[~ApplicationDeploy]
         '''
-        self.applications = [ApplicationDeploy.from_json(o) for o in applications or []]
+        self._raw_applications = applications
+        self.unknown_fields = unknown_fields
+
+    applications = LazyField('applications', lambda data: [ApplicationDeploy.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_applications = data.get('applications')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'applications': self._raw_applications}
 
 
 
 class BackupsCreateArgs(Type):
+    __slots__ = ('notes', 'unknown_fields')
     _toSchema = {'notes': 'notes'}
     _toPy = {'notes': 'notes'}
     def __init__(self, notes=None, **unknown_fields):
@@ -1286,10 +2808,24 @@ class BackupsCreateArgs(Type):
         notes : str
         '''
         self.notes = notes
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.notes = data.get('notes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'notes': self.notes}
 
 
 
 class BackupsInfoArgs(Type):
+    __slots__ = ('id_', 'unknown_fields')
     _toSchema = {'id_': 'id'}
     _toPy = {'id': 'id_'}
     def __init__(self, id_=None, **unknown_fields):
@@ -1297,32 +2833,74 @@ class BackupsInfoArgs(Type):
         id_ : str
         '''
         self.id_ = id_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.id_ = data.get('id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'id': self.id_}
 
 
 
 class BackupsListArgs(Type):
+    __slots__ = ('unknown_fields',)
     _toSchema = {}
     _toPy = {}
     def __init__(self, **unknown_fields):
         '''
 
         '''
-        pass
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {}
 
 
 
 class BackupsListResult(Type):
+    __slots__ = ('_list_', '_raw_list_', 'unknown_fields')
     _toSchema = {'list_': 'list'}
     _toPy = {'list': 'list_'}
     def __init__(self, list_=None, **unknown_fields):
         '''
         list_ : typing.Sequence[~BackupsMetadataResult]
         '''
-        self.list_ = [BackupsMetadataResult.from_json(o) for o in list_ or []]
+        self._raw_list_ = list_
+        self.unknown_fields = unknown_fields
+
+    list_ = LazyField('list_', lambda data: [BackupsMetadataResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_list_ = data.get('list')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'list': self._raw_list_}
 
 
 
 class BackupsMetadataResult(Type):
+    __slots__ = ('_raw_version', '_version', 'ca_cert', 'ca_private_key', 'checksum', 'checksum_format', 'finished', 'hostname', 'id_', 'machine', 'model', 'notes', 'series', 'size', 'started', 'stored', 'unknown_fields')
     _toSchema = {'ca_cert': 'ca-cert', 'ca_private_key': 'ca-private-key', 'checksum': 'checksum', 'checksum_format': 'checksum-format', 'finished': 'finished', 'hostname': 'hostname', 'id_': 'id', 'machine': 'machine', 'model': 'model', 'notes': 'notes', 'series': 'series', 'size': 'size', 'started': 'started', 'stored': 'stored', 'version': 'version'}
     _toPy = {'ca-cert': 'ca_cert', 'ca-private-key': 'ca_private_key', 'checksum': 'checksum', 'checksum-format': 'checksum_format', 'finished': 'finished', 'hostname': 'hostname', 'id': 'id_', 'machine': 'machine', 'model': 'model', 'notes': 'notes', 'series': 'series', 'size': 'size', 'started': 'started', 'stored': 'stored', 'version': 'version'}
     def __init__(self, ca_cert=None, ca_private_key=None, checksum=None, checksum_format=None, finished=None, hostname=None, id_=None, machine=None, model=None, notes=None, series=None, size=None, started=None, stored=None, version=None, **unknown_fields):
@@ -1357,11 +2935,41 @@ class BackupsMetadataResult(Type):
         self.size = size
         self.started = started
         self.stored = stored
-        self.version = Number.from_json(version) if version else None
+        self._raw_version = version
+        self.unknown_fields = unknown_fields
+
+    version = LazyField('version', lambda data: Number.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.ca_cert = data.get('ca-cert')
+        self.ca_private_key = data.get('ca-private-key')
+        self.checksum = data.get('checksum')
+        self.checksum_format = data.get('checksum-format')
+        self.finished = data.get('finished')
+        self.hostname = data.get('hostname')
+        self.id_ = data.get('id')
+        self.machine = data.get('machine')
+        self.model = data.get('model')
+        self.notes = data.get('notes')
+        self.series = data.get('series')
+        self.size = data.get('size')
+        self.started = data.get('started')
+        self.stored = data.get('stored')
+        self._raw_version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ca-cert': self.ca_cert, 'ca-private-key': self.ca_private_key, 'checksum': self.checksum, 'checksum-format': self.checksum_format, 'finished': self.finished, 'hostname': self.hostname, 'id': self.id_, 'machine': self.machine, 'model': self.model, 'notes': self.notes, 'series': self.series, 'size': self.size, 'started': self.started, 'stored': self.stored, 'version': self._raw_version}
 
 
 
 class BackupsRemoveArgs(Type):
+    __slots__ = ('id_', 'unknown_fields')
     _toSchema = {'id_': 'id'}
     _toPy = {'id': 'id_'}
     def __init__(self, id_=None, **unknown_fields):
@@ -1369,10 +2977,24 @@ class BackupsRemoveArgs(Type):
         id_ : str
         '''
         self.id_ = id_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.id_ = data.get('id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'id': self.id_}
 
 
 
 class Binary(Type):
+    __slots__ = ('_number', '_raw_number', 'arch', 'series', 'unknown_fields')
     _toSchema = {'arch': 'Arch', 'number': 'Number', 'series': 'Series'}
     _toPy = {'Arch': 'arch', 'Number': 'number', 'Series': 'series'}
     def __init__(self, arch=None, number=None, series=None, **unknown_fields):
@@ -1382,12 +3004,30 @@ class Binary(Type):
         series : str
         '''
         self.arch = arch
-        self.number = Number.from_json(number) if number else None
+        self._raw_number = number
         self.series = series
+        self.unknown_fields = unknown_fields
+
+    number = LazyField('number', lambda data: Number.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arch = data.get('Arch')
+        self._raw_number = data.get('Number')
+        self.series = data.get('Series')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Arch': self.arch, 'Number': self._raw_number, 'Series': self.series}
 
 
 
 class Block(Type):
+    __slots__ = ('id_', 'message', 'tag', 'type_', 'unknown_fields')
     _toSchema = {'id_': 'id', 'message': 'message', 'tag': 'tag', 'type_': 'type'}
     _toPy = {'id': 'id_', 'message': 'message', 'tag': 'tag', 'type': 'type_'}
     def __init__(self, id_=None, message=None, tag=None, type_=None, **unknown_fields):
@@ -1401,10 +3041,27 @@ class Block(Type):
         self.message = message
         self.tag = tag
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.id_ = data.get('id')
+        self.message = data.get('message')
+        self.tag = data.get('tag')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'id': self.id_, 'message': self.message, 'tag': self.tag, 'type': self.type_}
 
 
 
 class BlockDevice(Type):
+    __slots__ = ('busaddress', 'devicelinks', 'devicename', 'filesystemtype', 'hardwareid', 'inuse', 'label', 'mountpoint', 'size', 'unknown_fields', 'uuid')
     _toSchema = {'busaddress': 'BusAddress', 'devicelinks': 'DeviceLinks', 'devicename': 'DeviceName', 'filesystemtype': 'FilesystemType', 'hardwareid': 'HardwareId', 'inuse': 'InUse', 'label': 'Label', 'mountpoint': 'MountPoint', 'size': 'Size', 'uuid': 'UUID'}
     _toPy = {'BusAddress': 'busaddress', 'DeviceLinks': 'devicelinks', 'DeviceName': 'devicename', 'FilesystemType': 'filesystemtype', 'HardwareId': 'hardwareid', 'InUse': 'inuse', 'Label': 'label', 'MountPoint': 'mountpoint', 'Size': 'size', 'UUID': 'uuid'}
     def __init__(self, busaddress=None, devicelinks=None, devicename=None, filesystemtype=None, hardwareid=None, inuse=None, label=None, mountpoint=None, size=None, uuid=None, **unknown_fields):
@@ -1430,10 +3087,33 @@ class BlockDevice(Type):
         self.mountpoint = mountpoint
         self.size = size
         self.uuid = uuid
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.busaddress = data.get('BusAddress')
+        self.devicelinks = data.get('DeviceLinks')
+        self.devicename = data.get('DeviceName')
+        self.filesystemtype = data.get('FilesystemType')
+        self.hardwareid = data.get('HardwareId')
+        self.inuse = data.get('InUse')
+        self.label = data.get('Label')
+        self.mountpoint = data.get('MountPoint')
+        self.size = data.get('Size')
+        self.uuid = data.get('UUID')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'BusAddress': self.busaddress, 'DeviceLinks': self.devicelinks, 'DeviceName': self.devicename, 'FilesystemType': self.filesystemtype, 'HardwareId': self.hardwareid, 'InUse': self.inuse, 'Label': self.label, 'MountPoint': self.mountpoint, 'Size': self.size, 'UUID': self.uuid}
 
 
 
 class BlockDeviceResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -1441,23 +3121,57 @@ class BlockDeviceResult(Type):
         error : Error
         result : BlockDevice
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = BlockDevice.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: BlockDevice.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class BlockDeviceResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~BlockDeviceResult]
         '''
-        self.results = [BlockDeviceResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [BlockDeviceResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class BlockResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -1465,23 +3179,57 @@ class BlockResult(Type):
         error : Error
         result : Block
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = Block.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: Block.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class BlockResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~BlockResult]
         '''
-        self.results = [BlockResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [BlockResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class BlockSwitchParams(Type):
+    __slots__ = ('message', 'type_', 'unknown_fields')
     _toSchema = {'message': 'message', 'type_': 'type'}
     _toPy = {'message': 'message', 'type': 'type_'}
     def __init__(self, message=None, type_=None, **unknown_fields):
@@ -1491,10 +3239,25 @@ class BlockSwitchParams(Type):
         '''
         self.message = message
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.message = data.get('message')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'message': self.message, 'type': self.type_}
 
 
 
 class BoolResult(Type):
+    __slots__ = ('_error', '_raw_error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -1502,34 +3265,83 @@ class BoolResult(Type):
         error : Error
         result : bool
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self.result}
 
 
 
 class BoolResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~BoolResult]
         '''
-        self.results = [BoolResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [BoolResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class BulkImportStorageParams(Type):
+    __slots__ = ('_raw_storage', '_storage', 'unknown_fields')
     _toSchema = {'storage': 'storage'}
     _toPy = {'storage': 'storage'}
     def __init__(self, storage=None, **unknown_fields):
         '''
         storage : typing.Sequence[~ImportStorageParams]
         '''
-        self.storage = [ImportStorageParams.from_json(o) for o in storage or []]
+        self._raw_storage = storage
+        self.unknown_fields = unknown_fields
+
+    storage = LazyField('storage', lambda data: [ImportStorageParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_storage = data.get('storage')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'storage': self._raw_storage}
 
 
 
 class BundleChange(Type):
+    __slots__ = ('args', 'id_', 'method', 'requires', 'unknown_fields')
     _toSchema = {'args': 'args', 'id_': 'id', 'method': 'method', 'requires': 'requires'}
     _toPy = {'args': 'args', 'id': 'id_', 'method': 'method', 'requires': 'requires'}
     def __init__(self, args=None, id_=None, method=None, requires=None, **unknown_fields):
@@ -1543,10 +3355,27 @@ class BundleChange(Type):
         self.id_ = id_
         self.method = method
         self.requires = requires
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.args = data.get('args')
+        self.id_ = data.get('id')
+        self.method = data.get('method')
+        self.requires = data.get('requires')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self.args, 'id': self.id_, 'method': self.method, 'requires': self.requires}
 
 
 
 class BundleChangesParams(Type):
+    __slots__ = ('unknown_fields', 'yaml')
     _toSchema = {'yaml': 'yaml'}
     _toPy = {'yaml': 'yaml'}
     def __init__(self, yaml=None, **unknown_fields):
@@ -1554,10 +3383,24 @@ class BundleChangesParams(Type):
         yaml : str
         '''
         self.yaml = yaml
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.yaml = data.get('yaml')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'yaml': self.yaml}
 
 
 
 class BundleChangesResults(Type):
+    __slots__ = ('_changes', '_raw_changes', 'errors', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'errors': 'errors'}
     _toPy = {'changes': 'changes', 'errors': 'errors'}
     def __init__(self, changes=None, errors=None, **unknown_fields):
@@ -1565,12 +3408,29 @@ class BundleChangesResults(Type):
         changes : typing.Sequence[~BundleChange]
         errors : typing.Sequence[str]
         '''
-        self.changes = [BundleChange.from_json(o) for o in changes or []]
+        self._raw_changes = changes
         self.errors = errors
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [BundleChange.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self.errors = data.get('errors')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes, 'errors': self.errors}
 
 
 
 class BytesResult(Type):
+    __slots__ = ('result', 'unknown_fields')
     _toSchema = {'result': 'result'}
     _toPy = {'result': 'result'}
     def __init__(self, result=None, **unknown_fields):
@@ -1578,10 +3438,24 @@ class BytesResult(Type):
         result : typing.Sequence[int]
         '''
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'result': self.result}
 
 
 
 class ChangeModelCredentialParams(Type):
+    __slots__ = ('credential_tag', 'model_tag', 'unknown_fields')
     _toSchema = {'credential_tag': 'credential-tag', 'model_tag': 'model-tag'}
     _toPy = {'credential-tag': 'credential_tag', 'model-tag': 'model_tag'}
     def __init__(self, credential_tag=None, model_tag=None, **unknown_fields):
@@ -1591,21 +3465,52 @@ class ChangeModelCredentialParams(Type):
         '''
         self.credential_tag = credential_tag
         self.model_tag = model_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.credential_tag = data.get('credential-tag')
+        self.model_tag = data.get('model-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credential-tag': self.credential_tag, 'model-tag': self.model_tag}
 
 
 
 class ChangeModelCredentialsParams(Type):
+    __slots__ = ('_model_credentials', '_raw_model_credentials', 'unknown_fields')
     _toSchema = {'model_credentials': 'model-credentials'}
     _toPy = {'model-credentials': 'model_credentials'}
     def __init__(self, model_credentials=None, **unknown_fields):
         '''
         model_credentials : typing.Sequence[~ChangeModelCredentialParams]
         '''
-        self.model_credentials = [ChangeModelCredentialParams.from_json(o) for o in model_credentials or []]
+        self._raw_model_credentials = model_credentials
+        self.unknown_fields = unknown_fields
+
+    model_credentials = LazyField('model_credentials', lambda data: [ChangeModelCredentialParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_model_credentials = data.get('model-credentials')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'model-credentials': self._raw_model_credentials}
 
 
 
 class CharmActionSpec(Type):
+    __slots__ = ('description', 'params', 'unknown_fields')
     _toSchema = {'description': 'description', 'params': 'params'}
     _toPy = {'description': 'description', 'params': 'params'}
     def __init__(self, description=None, params=None, **unknown_fields):
@@ -1615,10 +3520,25 @@ class CharmActionSpec(Type):
         '''
         self.description = description
         self.params = params
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.description = data.get('description')
+        self.params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'description': self.description, 'params': self.params}
 
 
 
 class CharmActions(Type):
+    __slots__ = ('specs', 'unknown_fields')
     _toSchema = {'specs': 'specs'}
     _toPy = {'specs': 'specs'}
     def __init__(self, specs=None, **unknown_fields):
@@ -1626,10 +3546,24 @@ class CharmActions(Type):
         specs : typing.Mapping[str, ~CharmActionSpec]
         '''
         self.specs = specs
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.specs = data.get('specs')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'specs': self.specs}
 
 
 
 class CharmDevice(Type):
+    __slots__ = ('countmax', 'countmin', 'description', 'name', 'type_', 'unknown_fields')
     _toSchema = {'countmax': 'CountMax', 'countmin': 'CountMin', 'description': 'Description', 'name': 'Name', 'type_': 'Type'}
     _toPy = {'CountMax': 'countmax', 'CountMin': 'countmin', 'Description': 'description', 'Name': 'name', 'Type': 'type_'}
     def __init__(self, countmax=None, countmin=None, description=None, name=None, type_=None, **unknown_fields):
@@ -1645,10 +3579,28 @@ class CharmDevice(Type):
         self.description = description
         self.name = name
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.countmax = data.get('CountMax')
+        self.countmin = data.get('CountMin')
+        self.description = data.get('Description')
+        self.name = data.get('Name')
+        self.type_ = data.get('Type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'CountMax': self.countmax, 'CountMin': self.countmin, 'Description': self.description, 'Name': self.name, 'Type': self.type_}
 
 
 
 class CharmInfo(Type):
+    __slots__ = ('_actions', '_meta', '_metrics', '_raw_actions', '_raw_meta', '_raw_metrics', 'config', 'revision', 'unknown_fields', 'url')
     _toSchema = {'actions': 'actions', 'config': 'config', 'meta': 'meta', 'metrics': 'metrics', 'revision': 'revision', 'url': 'url'}
     _toPy = {'actions': 'actions', 'config': 'config', 'meta': 'meta', 'metrics': 'metrics', 'revision': 'revision', 'url': 'url'}
     def __init__(self, actions=None, config=None, meta=None, metrics=None, revision=None, url=None, **unknown_fields):
@@ -1660,16 +3612,39 @@ class CharmInfo(Type):
         revision : int
         url : str
         '''
-        self.actions = CharmActions.from_json(actions) if actions else None
+        self._raw_actions = actions
         self.config = config
-        self.meta = CharmMeta.from_json(meta) if meta else None
-        self.metrics = CharmMetrics.from_json(metrics) if metrics else None
+        self._raw_meta = meta
+        self._raw_metrics = metrics
         self.revision = revision
         self.url = url
+        self.unknown_fields = unknown_fields
+
+    actions = LazyField('actions', lambda data: CharmActions.from_json(data) if data else None)
+    meta = LazyField('meta', lambda data: CharmMeta.from_json(data) if data else None)
+    metrics = LazyField('metrics', lambda data: CharmMetrics.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_actions = data.get('actions')
+        self.config = data.get('config')
+        self._raw_meta = data.get('meta')
+        self._raw_metrics = data.get('metrics')
+        self.revision = data.get('revision')
+        self.url = data.get('url')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'actions': self._raw_actions, 'config': self.config, 'meta': self._raw_meta, 'metrics': self._raw_metrics, 'revision': self.revision, 'url': self.url}
 
 
 
 class CharmLXDProfile(Type):
+    __slots__ = ('config', 'description', 'devices', 'unknown_fields')
     _toSchema = {'config': 'config', 'description': 'description', 'devices': 'devices'}
     _toPy = {'config': 'config', 'description': 'description', 'devices': 'devices'}
     def __init__(self, config=None, description=None, devices=None, **unknown_fields):
@@ -1681,10 +3656,26 @@ class CharmLXDProfile(Type):
         self.config = config
         self.description = description
         self.devices = devices
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self.description = data.get('description')
+        self.devices = data.get('devices')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config, 'description': self.description, 'devices': self.devices}
 
 
 
 class CharmMeta(Type):
+    __slots__ = ('categories', 'description', 'extra_bindings', 'min_juju_version', 'name', 'payload_classes', 'peers', 'provides', 'requires', 'resources', 'series', 'storage', 'subordinate', 'summary', 'tags', 'terms', 'unknown_fields')
     _toSchema = {'categories': 'categories', 'description': 'description', 'extra_bindings': 'extra-bindings', 'min_juju_version': 'min-juju-version', 'name': 'name', 'payload_classes': 'payload-classes', 'peers': 'peers', 'provides': 'provides', 'requires': 'requires', 'resources': 'resources', 'series': 'series', 'storage': 'storage', 'subordinate': 'subordinate', 'summary': 'summary', 'tags': 'tags', 'terms': 'terms'}
     _toPy = {'categories': 'categories', 'description': 'description', 'extra-bindings': 'extra_bindings', 'min-juju-version': 'min_juju_version', 'name': 'name', 'payload-classes': 'payload_classes', 'peers': 'peers', 'provides': 'provides', 'requires': 'requires', 'resources': 'resources', 'series': 'series', 'storage': 'storage', 'subordinate': 'subordinate', 'summary': 'summary', 'tags': 'tags', 'terms': 'terms'}
     def __init__(self, categories=None, description=None, extra_bindings=None, min_juju_version=None, name=None, payload_classes=None, peers=None, provides=None, requires=None, resources=None, series=None, storage=None, subordinate=None, summary=None, tags=None, terms=None, **unknown_fields):
@@ -1722,10 +3713,39 @@ class CharmMeta(Type):
         self.summary = summary
         self.tags = tags
         self.terms = terms
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.categories = data.get('categories')
+        self.description = data.get('description')
+        self.extra_bindings = data.get('extra-bindings')
+        self.min_juju_version = data.get('min-juju-version')
+        self.name = data.get('name')
+        self.payload_classes = data.get('payload-classes')
+        self.peers = data.get('peers')
+        self.provides = data.get('provides')
+        self.requires = data.get('requires')
+        self.resources = data.get('resources')
+        self.series = data.get('series')
+        self.storage = data.get('storage')
+        self.subordinate = data.get('subordinate')
+        self.summary = data.get('summary')
+        self.tags = data.get('tags')
+        self.terms = data.get('terms')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'categories': self.categories, 'description': self.description, 'extra-bindings': self.extra_bindings, 'min-juju-version': self.min_juju_version, 'name': self.name, 'payload-classes': self.payload_classes, 'peers': self.peers, 'provides': self.provides, 'requires': self.requires, 'resources': self.resources, 'series': self.series, 'storage': self.storage, 'subordinate': self.subordinate, 'summary': self.summary, 'tags': self.tags, 'terms': self.terms}
 
 
 
 class CharmMetric(Type):
+    __slots__ = ('description', 'type_', 'unknown_fields')
     _toSchema = {'description': 'description', 'type_': 'type'}
     _toPy = {'description': 'description', 'type': 'type_'}
     def __init__(self, description=None, type_=None, **unknown_fields):
@@ -1735,10 +3755,25 @@ class CharmMetric(Type):
         '''
         self.description = description
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.description = data.get('description')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'description': self.description, 'type': self.type_}
 
 
 
 class CharmMetrics(Type):
+    __slots__ = ('_plan', '_raw_plan', 'metrics', 'unknown_fields')
     _toSchema = {'metrics': 'metrics', 'plan': 'plan'}
     _toPy = {'metrics': 'metrics', 'plan': 'plan'}
     def __init__(self, metrics=None, plan=None, **unknown_fields):
@@ -1747,11 +3782,28 @@ class CharmMetrics(Type):
         plan : CharmPlan
         '''
         self.metrics = metrics
-        self.plan = CharmPlan.from_json(plan) if plan else None
+        self._raw_plan = plan
+        self.unknown_fields = unknown_fields
+
+    plan = LazyField('plan', lambda data: CharmPlan.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.metrics = data.get('metrics')
+        self._raw_plan = data.get('plan')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'metrics': self.metrics, 'plan': self._raw_plan}
 
 
 
 class CharmOption(Type):
+    __slots__ = ('default', 'description', 'type_', 'unknown_fields')
     _toSchema = {'default': 'default', 'description': 'description', 'type_': 'type'}
     _toPy = {'default': 'default', 'description': 'description', 'type': 'type_'}
     def __init__(self, default=None, description=None, type_=None, **unknown_fields):
@@ -1763,10 +3815,26 @@ class CharmOption(Type):
         self.default = default
         self.description = description
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.default = data.get('default')
+        self.description = data.get('description')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'default': self.default, 'description': self.description, 'type': self.type_}
 
 
 
 class CharmPayloadClass(Type):
+    __slots__ = ('name', 'type_', 'unknown_fields')
     _toSchema = {'name': 'name', 'type_': 'type'}
     _toPy = {'name': 'name', 'type': 'type_'}
     def __init__(self, name=None, type_=None, **unknown_fields):
@@ -1776,10 +3844,25 @@ class CharmPayloadClass(Type):
         '''
         self.name = name
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.name = data.get('name')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'name': self.name, 'type': self.type_}
 
 
 
 class CharmPlan(Type):
+    __slots__ = ('required', 'unknown_fields')
     _toSchema = {'required': 'required'}
     _toPy = {'required': 'required'}
     def __init__(self, required=None, **unknown_fields):
@@ -1787,10 +3870,24 @@ class CharmPlan(Type):
         required : bool
         '''
         self.required = required
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.required = data.get('required')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'required': self.required}
 
 
 
 class CharmRelation(Type):
+    __slots__ = ('interface', 'limit', 'name', 'optional', 'role', 'scope', 'unknown_fields')
     _toSchema = {'interface': 'interface', 'limit': 'limit', 'name': 'name', 'optional': 'optional', 'role': 'role', 'scope': 'scope'}
     _toPy = {'interface': 'interface', 'limit': 'limit', 'name': 'name', 'optional': 'optional', 'role': 'role', 'scope': 'scope'}
     def __init__(self, interface=None, limit=None, name=None, optional=None, role=None, scope=None, **unknown_fields):
@@ -1808,10 +3905,29 @@ class CharmRelation(Type):
         self.optional = optional
         self.role = role
         self.scope = scope
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.interface = data.get('interface')
+        self.limit = data.get('limit')
+        self.name = data.get('name')
+        self.optional = data.get('optional')
+        self.role = data.get('role')
+        self.scope = data.get('scope')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'interface': self.interface, 'limit': self.limit, 'name': self.name, 'optional': self.optional, 'role': self.role, 'scope': self.scope}
 
 
 
 class CharmResource(Type):
+    __slots__ = ('description', 'fingerprint', 'name', 'origin', 'path', 'revision', 'size', 'type_', 'unknown_fields')
     _toSchema = {'description': 'description', 'fingerprint': 'fingerprint', 'name': 'name', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'type_': 'type'}
     _toPy = {'description': 'description', 'fingerprint': 'fingerprint', 'name': 'name', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'type': 'type_'}
     def __init__(self, description=None, fingerprint=None, name=None, origin=None, path=None, revision=None, size=None, type_=None, **unknown_fields):
@@ -1833,10 +3949,31 @@ class CharmResource(Type):
         self.revision = revision
         self.size = size
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.description = data.get('description')
+        self.fingerprint = data.get('fingerprint')
+        self.name = data.get('name')
+        self.origin = data.get('origin')
+        self.path = data.get('path')
+        self.revision = data.get('revision')
+        self.size = data.get('size')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'description': self.description, 'fingerprint': self.fingerprint, 'name': self.name, 'origin': self.origin, 'path': self.path, 'revision': self.revision, 'size': self.size, 'type': self.type_}
 
 
 
 class CharmResourceMeta(Type):
+    __slots__ = ('description', 'name', 'path', 'type_', 'unknown_fields')
     _toSchema = {'description': 'description', 'name': 'name', 'path': 'path', 'type_': 'type'}
     _toPy = {'description': 'description', 'name': 'name', 'path': 'path', 'type': 'type_'}
     def __init__(self, description=None, name=None, path=None, type_=None, **unknown_fields):
@@ -1850,10 +3987,27 @@ class CharmResourceMeta(Type):
         self.name = name
         self.path = path
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.description = data.get('description')
+        self.name = data.get('name')
+        self.path = data.get('path')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'description': self.description, 'name': self.name, 'path': self.path, 'type': self.type_}
 
 
 
 class CharmStorage(Type):
+    __slots__ = ('count_max', 'count_min', 'description', 'location', 'minimum_size', 'name', 'properties', 'read_only', 'shared', 'type_', 'unknown_fields')
     _toSchema = {'count_max': 'count-max', 'count_min': 'count-min', 'description': 'description', 'location': 'location', 'minimum_size': 'minimum-size', 'name': 'name', 'properties': 'properties', 'read_only': 'read-only', 'shared': 'shared', 'type_': 'type'}
     _toPy = {'count-max': 'count_max', 'count-min': 'count_min', 'description': 'description', 'location': 'location', 'minimum-size': 'minimum_size', 'name': 'name', 'properties': 'properties', 'read-only': 'read_only', 'shared': 'shared', 'type': 'type_'}
     def __init__(self, count_max=None, count_min=None, description=None, location=None, minimum_size=None, name=None, properties=None, read_only=None, shared=None, type_=None, **unknown_fields):
@@ -1879,10 +4033,33 @@ class CharmStorage(Type):
         self.read_only = read_only
         self.shared = shared
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.count_max = data.get('count-max')
+        self.count_min = data.get('count-min')
+        self.description = data.get('description')
+        self.location = data.get('location')
+        self.minimum_size = data.get('minimum-size')
+        self.name = data.get('name')
+        self.properties = data.get('properties')
+        self.read_only = data.get('read-only')
+        self.shared = data.get('shared')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'count-max': self.count_max, 'count-min': self.count_min, 'description': self.description, 'location': self.location, 'minimum-size': self.minimum_size, 'name': self.name, 'properties': self.properties, 'read-only': self.read_only, 'shared': self.shared, 'type': self.type_}
 
 
 
 class CharmURL(Type):
+    __slots__ = ('unknown_fields', 'url')
     _toSchema = {'url': 'url'}
     _toPy = {'url': 'url'}
     def __init__(self, url=None, **unknown_fields):
@@ -1890,21 +4067,51 @@ class CharmURL(Type):
         url : str
         '''
         self.url = url
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.url = data.get('url')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'url': self.url}
 
 
 
 class CharmURLs(Type):
+    __slots__ = ('_raw_urls', '_urls', 'unknown_fields')
     _toSchema = {'urls': 'urls'}
     _toPy = {'urls': 'urls'}
     def __init__(self, urls=None, **unknown_fields):
         '''
         urls : typing.Sequence[~CharmURL]
         '''
-        self.urls = [CharmURL.from_json(o) for o in urls or []]
+        self._raw_urls = urls
+        self.unknown_fields = unknown_fields
+
+    urls = LazyField('urls', lambda data: [CharmURL.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_urls = data.get('urls')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'urls': self._raw_urls}
 
 
 
 class CharmsList(Type):
+    __slots__ = ('names', 'unknown_fields')
     _toSchema = {'names': 'names'}
     _toPy = {'names': 'names'}
     def __init__(self, names=None, **unknown_fields):
@@ -1912,10 +4119,24 @@ class CharmsList(Type):
         names : typing.Sequence[str]
         '''
         self.names = names
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.names = data.get('names')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'names': self.names}
 
 
 
 class CharmsListResult(Type):
+    __slots__ = ('charm_urls', 'unknown_fields')
     _toSchema = {'charm_urls': 'charm-urls'}
     _toPy = {'charm-urls': 'charm_urls'}
     def __init__(self, charm_urls=None, **unknown_fields):
@@ -1923,32 +4144,78 @@ class CharmsListResult(Type):
         charm_urls : typing.Sequence[str]
         '''
         self.charm_urls = charm_urls
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.charm_urls = data.get('charm-urls')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'charm-urls': self.charm_urls}
 
 
 
 class ClaimLeadershipBulkParams(Type):
+    __slots__ = ('_params', '_raw_params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~ClaimLeadershipParams]
         '''
-        self.params = [ClaimLeadershipParams.from_json(o) for o in params or []]
+        self._raw_params = params
+        self.unknown_fields = unknown_fields
+
+    params = LazyField('params', lambda data: [ClaimLeadershipParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'params': self._raw_params}
 
 
 
 class ClaimLeadershipBulkResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ErrorResult]
         '''
-        self.results = [ErrorResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ErrorResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ClaimLeadershipParams(Type):
+    __slots__ = ('application_tag', 'duration', 'unit_tag', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'duration': 'duration', 'unit_tag': 'unit-tag'}
     _toPy = {'application-tag': 'application_tag', 'duration': 'duration', 'unit-tag': 'unit_tag'}
     def __init__(self, application_tag=None, duration=None, unit_tag=None, **unknown_fields):
@@ -1960,10 +4227,26 @@ class ClaimLeadershipParams(Type):
         self.application_tag = application_tag
         self.duration = duration
         self.unit_tag = unit_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_tag = data.get('application-tag')
+        self.duration = data.get('duration')
+        self.unit_tag = data.get('unit-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-tag': self.application_tag, 'duration': self.duration, 'unit-tag': self.unit_tag}
 
 
 
 class Cloud(Type):
+    __slots__ = ('_raw_regions', '_regions', 'auth_types', 'endpoint', 'identity_endpoint', 'storage_endpoint', 'type_', 'unknown_fields')
     _toSchema = {'auth_types': 'auth-types', 'endpoint': 'endpoint', 'identity_endpoint': 'identity-endpoint', 'regions': 'regions', 'storage_endpoint': 'storage-endpoint', 'type_': 'type'}
     _toPy = {'auth-types': 'auth_types', 'endpoint': 'endpoint', 'identity-endpoint': 'identity_endpoint', 'regions': 'regions', 'storage-endpoint': 'storage_endpoint', 'type': 'type_'}
     def __init__(self, auth_types=None, endpoint=None, identity_endpoint=None, regions=None, storage_endpoint=None, type_=None, **unknown_fields):
@@ -1978,13 +4261,34 @@ class Cloud(Type):
         self.auth_types = auth_types
         self.endpoint = endpoint
         self.identity_endpoint = identity_endpoint
-        self.regions = [CloudRegion.from_json(o) for o in regions or []]
+        self._raw_regions = regions
         self.storage_endpoint = storage_endpoint
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    regions = LazyField('regions', lambda data: [CloudRegion.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.auth_types = data.get('auth-types')
+        self.endpoint = data.get('endpoint')
+        self.identity_endpoint = data.get('identity-endpoint')
+        self._raw_regions = data.get('regions')
+        self.storage_endpoint = data.get('storage-endpoint')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'auth-types': self.auth_types, 'endpoint': self.endpoint, 'identity-endpoint': self.identity_endpoint, 'regions': self._raw_regions, 'storage-endpoint': self.storage_endpoint, 'type': self.type_}
 
 
 
 class CloudCredential(Type):
+    __slots__ = ('attrs', 'auth_type', 'redacted', 'unknown_fields')
     _toSchema = {'attrs': 'attrs', 'auth_type': 'auth-type', 'redacted': 'redacted'}
     _toPy = {'attrs': 'attrs', 'auth-type': 'auth_type', 'redacted': 'redacted'}
     def __init__(self, attrs=None, auth_type=None, redacted=None, **unknown_fields):
@@ -1996,10 +4300,26 @@ class CloudCredential(Type):
         self.attrs = attrs
         self.auth_type = auth_type
         self.redacted = redacted
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.attrs = data.get('attrs')
+        self.auth_type = data.get('auth-type')
+        self.redacted = data.get('redacted')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attrs': self.attrs, 'auth-type': self.auth_type, 'redacted': self.redacted}
 
 
 
 class CloudCredentialArg(Type):
+    __slots__ = ('cloud_name', 'credential_name', 'unknown_fields')
     _toSchema = {'cloud_name': 'cloud-name', 'credential_name': 'credential-name'}
     _toPy = {'cloud-name': 'cloud_name', 'credential-name': 'credential_name'}
     def __init__(self, cloud_name=None, credential_name=None, **unknown_fields):
@@ -2009,10 +4329,25 @@ class CloudCredentialArg(Type):
         '''
         self.cloud_name = cloud_name
         self.credential_name = credential_name
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cloud_name = data.get('cloud-name')
+        self.credential_name = data.get('credential-name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud-name': self.cloud_name, 'credential-name': self.credential_name}
 
 
 
 class CloudCredentialArgs(Type):
+    __slots__ = ('_credentials', '_raw_credentials', 'include_secrets', 'unknown_fields')
     _toSchema = {'credentials': 'credentials', 'include_secrets': 'include-secrets'}
     _toPy = {'credentials': 'credentials', 'include-secrets': 'include_secrets'}
     def __init__(self, credentials=None, include_secrets=None, **unknown_fields):
@@ -2020,12 +4355,29 @@ class CloudCredentialArgs(Type):
         credentials : typing.Sequence[~CloudCredentialArg]
         include_secrets : bool
         '''
-        self.credentials = [CloudCredentialArg.from_json(o) for o in credentials or []]
+        self._raw_credentials = credentials
         self.include_secrets = include_secrets
+        self.unknown_fields = unknown_fields
+
+    credentials = LazyField('credentials', lambda data: [CloudCredentialArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_credentials = data.get('credentials')
+        self.include_secrets = data.get('include-secrets')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credentials': self._raw_credentials, 'include-secrets': self.include_secrets}
 
 
 
 class CloudCredentialResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -2033,23 +4385,57 @@ class CloudCredentialResult(Type):
         error : Error
         result : CloudCredential
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = CloudCredential.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: CloudCredential.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class CloudCredentialResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CloudCredentialResult]
         '''
-        self.results = [CloudCredentialResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [CloudCredentialResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class CloudDetails(Type):
+    __slots__ = ('_raw_regions', '_regions', 'auth_types', 'endpoint', 'identity_endpoint', 'storage_endpoint', 'type_', 'unknown_fields')
     _toSchema = {'auth_types': 'auth-types', 'endpoint': 'endpoint', 'identity_endpoint': 'identity-endpoint', 'regions': 'regions', 'storage_endpoint': 'storage-endpoint', 'type_': 'type'}
     _toPy = {'auth-types': 'auth_types', 'endpoint': 'endpoint', 'identity-endpoint': 'identity_endpoint', 'regions': 'regions', 'storage-endpoint': 'storage_endpoint', 'type': 'type_'}
     def __init__(self, auth_types=None, endpoint=None, identity_endpoint=None, regions=None, storage_endpoint=None, type_=None, **unknown_fields):
@@ -2064,13 +4450,34 @@ class CloudDetails(Type):
         self.auth_types = auth_types
         self.endpoint = endpoint
         self.identity_endpoint = identity_endpoint
-        self.regions = [CloudRegion.from_json(o) for o in regions or []]
+        self._raw_regions = regions
         self.storage_endpoint = storage_endpoint
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    regions = LazyField('regions', lambda data: [CloudRegion.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.auth_types = data.get('auth-types')
+        self.endpoint = data.get('endpoint')
+        self.identity_endpoint = data.get('identity-endpoint')
+        self._raw_regions = data.get('regions')
+        self.storage_endpoint = data.get('storage-endpoint')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'auth-types': self.auth_types, 'endpoint': self.endpoint, 'identity-endpoint': self.identity_endpoint, 'regions': self._raw_regions, 'storage-endpoint': self.storage_endpoint, 'type': self.type_}
 
 
 
 class CloudImageMetadata(Type):
+    __slots__ = ('arch', 'image_id', 'priority', 'region', 'root_storage_size', 'root_storage_type', 'series', 'source', 'stream', 'unknown_fields', 'version', 'virt_type')
     _toSchema = {'arch': 'arch', 'image_id': 'image-id', 'priority': 'priority', 'region': 'region', 'root_storage_size': 'root-storage-size', 'root_storage_type': 'root-storage-type', 'series': 'series', 'source': 'source', 'stream': 'stream', 'version': 'version', 'virt_type': 'virt-type'}
     _toPy = {'arch': 'arch', 'image-id': 'image_id', 'priority': 'priority', 'region': 'region', 'root-storage-size': 'root_storage_size', 'root-storage-type': 'root_storage_type', 'series': 'series', 'source': 'source', 'stream': 'stream', 'version': 'version', 'virt-type': 'virt_type'}
     def __init__(self, arch=None, image_id=None, priority=None, region=None, root_storage_size=None, root_storage_type=None, series=None, source=None, stream=None, version=None, virt_type=None, **unknown_fields):
@@ -2098,21 +4505,61 @@ class CloudImageMetadata(Type):
         self.stream = stream
         self.version = version
         self.virt_type = virt_type
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arch = data.get('arch')
+        self.image_id = data.get('image-id')
+        self.priority = data.get('priority')
+        self.region = data.get('region')
+        self.root_storage_size = data.get('root-storage-size')
+        self.root_storage_type = data.get('root-storage-type')
+        self.series = data.get('series')
+        self.source = data.get('source')
+        self.stream = data.get('stream')
+        self.version = data.get('version')
+        self.virt_type = data.get('virt-type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'arch': self.arch, 'image-id': self.image_id, 'priority': self.priority, 'region': self.region, 'root-storage-size': self.root_storage_size, 'root-storage-type': self.root_storage_type, 'series': self.series, 'source': self.source, 'stream': self.stream, 'version': self.version, 'virt-type': self.virt_type}
 
 
 
 class CloudImageMetadataList(Type):
+    __slots__ = ('_metadata', '_raw_metadata', 'unknown_fields')
     _toSchema = {'metadata': 'metadata'}
     _toPy = {'metadata': 'metadata'}
     def __init__(self, metadata=None, **unknown_fields):
         '''
         metadata : typing.Sequence[~CloudImageMetadata]
         '''
-        self.metadata = [CloudImageMetadata.from_json(o) for o in metadata or []]
+        self._raw_metadata = metadata
+        self.unknown_fields = unknown_fields
+
+    metadata = LazyField('metadata', lambda data: [CloudImageMetadata.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_metadata = data.get('metadata')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'metadata': self._raw_metadata}
 
 
 
 class CloudInfo(Type):
+    __slots__ = ('_clouddetails', '_raw_clouddetails', '_raw_users', '_users', 'unknown_fields')
     _toSchema = {'clouddetails': 'CloudDetails', 'users': 'users'}
     _toPy = {'CloudDetails': 'clouddetails', 'users': 'users'}
     def __init__(self, clouddetails=None, users=None, **unknown_fields):
@@ -2120,12 +4567,30 @@ class CloudInfo(Type):
         clouddetails : CloudDetails
         users : typing.Sequence[~CloudUserInfo]
         '''
-        self.clouddetails = CloudDetails.from_json(clouddetails) if clouddetails else None
-        self.users = [CloudUserInfo.from_json(o) for o in users or []]
+        self._raw_clouddetails = clouddetails
+        self._raw_users = users
+        self.unknown_fields = unknown_fields
+
+    clouddetails = LazyField('clouddetails', lambda data: CloudDetails.from_json(data) if data else None)
+    users = LazyField('users', lambda data: [CloudUserInfo.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_clouddetails = data.get('CloudDetails')
+        self._raw_users = data.get('users')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'CloudDetails': self._raw_clouddetails, 'users': self._raw_users}
 
 
 
 class CloudInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -2133,23 +4598,57 @@ class CloudInfoResult(Type):
         error : Error
         result : CloudInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = CloudInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: CloudInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class CloudInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CloudInfoResult]
         '''
-        self.results = [CloudInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [CloudInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class CloudInstanceTypesConstraint(Type):
+    __slots__ = ('_constraints', '_raw_constraints', 'cloud_tag', 'region', 'unknown_fields')
     _toSchema = {'cloud_tag': 'cloud-tag', 'constraints': 'constraints', 'region': 'region'}
     _toPy = {'cloud-tag': 'cloud_tag', 'constraints': 'constraints', 'region': 'region'}
     def __init__(self, cloud_tag=None, constraints=None, region=None, **unknown_fields):
@@ -2159,23 +4658,57 @@ class CloudInstanceTypesConstraint(Type):
         region : str
         '''
         self.cloud_tag = cloud_tag
-        self.constraints = Value.from_json(constraints) if constraints else None
+        self._raw_constraints = constraints
         self.region = region
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cloud_tag = data.get('cloud-tag')
+        self._raw_constraints = data.get('constraints')
+        self.region = data.get('region')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud-tag': self.cloud_tag, 'constraints': self._raw_constraints, 'region': self.region}
 
 
 
 class CloudInstanceTypesConstraints(Type):
+    __slots__ = ('_constraints', '_raw_constraints', 'unknown_fields')
     _toSchema = {'constraints': 'constraints'}
     _toPy = {'constraints': 'constraints'}
     def __init__(self, constraints=None, **unknown_fields):
         '''
         constraints : typing.Sequence[~CloudInstanceTypesConstraint]
         '''
-        self.constraints = [CloudInstanceTypesConstraint.from_json(o) for o in constraints or []]
+        self._raw_constraints = constraints
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: [CloudInstanceTypesConstraint.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_constraints = data.get('constraints')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'constraints': self._raw_constraints}
 
 
 
 class CloudRegion(Type):
+    __slots__ = ('endpoint', 'identity_endpoint', 'name', 'storage_endpoint', 'unknown_fields')
     _toSchema = {'endpoint': 'endpoint', 'identity_endpoint': 'identity-endpoint', 'name': 'name', 'storage_endpoint': 'storage-endpoint'}
     _toPy = {'endpoint': 'endpoint', 'identity-endpoint': 'identity_endpoint', 'name': 'name', 'storage-endpoint': 'storage_endpoint'}
     def __init__(self, endpoint=None, identity_endpoint=None, name=None, storage_endpoint=None, **unknown_fields):
@@ -2189,10 +4722,27 @@ class CloudRegion(Type):
         self.identity_endpoint = identity_endpoint
         self.name = name
         self.storage_endpoint = storage_endpoint
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.endpoint = data.get('endpoint')
+        self.identity_endpoint = data.get('identity-endpoint')
+        self.name = data.get('name')
+        self.storage_endpoint = data.get('storage-endpoint')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'endpoint': self.endpoint, 'identity-endpoint': self.identity_endpoint, 'name': self.name, 'storage-endpoint': self.storage_endpoint}
 
 
 
 class CloudResult(Type):
+    __slots__ = ('_cloud', '_error', '_raw_cloud', '_raw_error', 'unknown_fields')
     _toSchema = {'cloud': 'cloud', 'error': 'error'}
     _toPy = {'cloud': 'cloud', 'error': 'error'}
     def __init__(self, cloud=None, error=None, **unknown_fields):
@@ -2200,23 +4750,57 @@ class CloudResult(Type):
         cloud : Cloud
         error : Error
         '''
-        self.cloud = Cloud.from_json(cloud) if cloud else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_cloud = cloud
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    cloud = LazyField('cloud', lambda data: Cloud.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_cloud = data.get('cloud')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud': self._raw_cloud, 'error': self._raw_error}
 
 
 
 class CloudResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CloudResult]
         '''
-        self.results = [CloudResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [CloudResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class CloudSpec(Type):
+    __slots__ = ('_credential', '_raw_credential', 'endpoint', 'identity_endpoint', 'name', 'region', 'storage_endpoint', 'type_', 'unknown_fields')
     _toSchema = {'credential': 'credential', 'endpoint': 'endpoint', 'identity_endpoint': 'identity-endpoint', 'name': 'name', 'region': 'region', 'storage_endpoint': 'storage-endpoint', 'type_': 'type'}
     _toPy = {'credential': 'credential', 'endpoint': 'endpoint', 'identity-endpoint': 'identity_endpoint', 'name': 'name', 'region': 'region', 'storage-endpoint': 'storage_endpoint', 'type': 'type_'}
     def __init__(self, credential=None, endpoint=None, identity_endpoint=None, name=None, region=None, storage_endpoint=None, type_=None, **unknown_fields):
@@ -2229,17 +4813,39 @@ class CloudSpec(Type):
         storage_endpoint : str
         type_ : str
         '''
-        self.credential = CloudCredential.from_json(credential) if credential else None
+        self._raw_credential = credential
         self.endpoint = endpoint
         self.identity_endpoint = identity_endpoint
         self.name = name
         self.region = region
         self.storage_endpoint = storage_endpoint
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    credential = LazyField('credential', lambda data: CloudCredential.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_credential = data.get('credential')
+        self.endpoint = data.get('endpoint')
+        self.identity_endpoint = data.get('identity-endpoint')
+        self.name = data.get('name')
+        self.region = data.get('region')
+        self.storage_endpoint = data.get('storage-endpoint')
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credential': self._raw_credential, 'endpoint': self.endpoint, 'identity-endpoint': self.identity_endpoint, 'name': self.name, 'region': self.region, 'storage-endpoint': self.storage_endpoint, 'type': self.type_}
 
 
 
 class CloudSpecResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -2247,23 +4853,57 @@ class CloudSpecResult(Type):
         error : Error
         result : CloudSpec
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = CloudSpec.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: CloudSpec.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class CloudSpecResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CloudSpecResult]
         '''
-        self.results = [CloudSpecResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [CloudSpecResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class CloudUserInfo(Type):
+    __slots__ = ('access', 'display_name', 'unknown_fields', 'user')
     _toSchema = {'access': 'access', 'display_name': 'display-name', 'user': 'user'}
     _toPy = {'access': 'access', 'display-name': 'display_name', 'user': 'user'}
     def __init__(self, access=None, display_name=None, user=None, **unknown_fields):
@@ -2275,10 +4915,26 @@ class CloudUserInfo(Type):
         self.access = access
         self.display_name = display_name
         self.user = user
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.display_name = data.get('display-name')
+        self.user = data.get('user')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'display-name': self.display_name, 'user': self.user}
 
 
 
 class CloudsResult(Type):
+    __slots__ = ('clouds', 'unknown_fields')
     _toSchema = {'clouds': 'clouds'}
     _toPy = {'clouds': 'clouds'}
     def __init__(self, clouds=None, **unknown_fields):
@@ -2286,10 +4942,24 @@ class CloudsResult(Type):
         clouds : typing.Mapping[str, ~Cloud]
         '''
         self.clouds = clouds
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.clouds = data.get('clouds')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'clouds': self.clouds}
 
 
 
 class ConfigResult(Type):
+    __slots__ = ('_error', '_raw_error', 'config', 'unknown_fields')
     _toSchema = {'config': 'config', 'error': 'error'}
     _toPy = {'config': 'config', 'error': 'error'}
     def __init__(self, config=None, error=None, **unknown_fields):
@@ -2298,11 +4968,28 @@ class ConfigResult(Type):
         error : Error
         '''
         self.config = config
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config, 'error': self._raw_error}
 
 
 
 class ConfigSettingsResult(Type):
+    __slots__ = ('_error', '_raw_error', 'settings', 'unknown_fields')
     _toSchema = {'error': 'error', 'settings': 'settings'}
     _toPy = {'error': 'error', 'settings': 'settings'}
     def __init__(self, error=None, settings=None, **unknown_fields):
@@ -2310,23 +4997,56 @@ class ConfigSettingsResult(Type):
         error : Error
         settings : typing.Mapping[str, typing.Any]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.settings = settings
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.settings = data.get('settings')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'settings': self.settings}
 
 
 
 class ConfigSettingsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ConfigSettingsResult]
         '''
-        self.results = [ConfigSettingsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ConfigSettingsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ConfigValue(Type):
+    __slots__ = ('source', 'unknown_fields', 'value')
     _toSchema = {'source': 'source', 'value': 'value'}
     _toPy = {'source': 'source', 'value': 'value'}
     def __init__(self, source=None, value=None, **unknown_fields):
@@ -2336,10 +5056,25 @@ class ConfigValue(Type):
         '''
         self.source = source
         self.value = value
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.source = data.get('source')
+        self.value = data.get('value')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'source': self.source, 'value': self.value}
 
 
 
 class Constraints(Type):
+    __slots__ = ('count', 'pool', 'size', 'unknown_fields')
     _toSchema = {'count': 'Count', 'pool': 'Pool', 'size': 'Size'}
     _toPy = {'Count': 'count', 'Pool': 'pool', 'Size': 'size'}
     def __init__(self, count=None, pool=None, size=None, **unknown_fields):
@@ -2351,10 +5086,26 @@ class Constraints(Type):
         self.count = count
         self.pool = pool
         self.size = size
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.count = data.get('Count')
+        self.pool = data.get('Pool')
+        self.size = data.get('Size')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Count': self.count, 'Pool': self.pool, 'Size': self.size}
 
 
 
 class ConstraintsResult(Type):
+    __slots__ = ('_constraints', '_error', '_raw_constraints', '_raw_error', 'unknown_fields')
     _toSchema = {'constraints': 'constraints', 'error': 'error'}
     _toPy = {'constraints': 'constraints', 'error': 'error'}
     def __init__(self, constraints=None, error=None, **unknown_fields):
@@ -2362,23 +5113,57 @@ class ConstraintsResult(Type):
         constraints : Value
         error : Error
         '''
-        self.constraints = Value.from_json(constraints) if constraints else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_constraints = constraints
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_constraints = data.get('constraints')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'constraints': self._raw_constraints, 'error': self._raw_error}
 
 
 
 class ConstraintsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ConstraintsResult]
         '''
-        self.results = [ConstraintsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ConstraintsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ConsumeApplicationArg(Type):
+    __slots__ = ('application_alias', 'application_url', 'unknown_fields')
     _toSchema = {'application_alias': 'application-alias', 'application_url': 'application-url'}
     _toPy = {'application-alias': 'application_alias', 'application-url': 'application_url'}
     def __init__(self, application_alias=None, application_url=None, **unknown_fields):
@@ -2388,21 +5173,52 @@ class ConsumeApplicationArg(Type):
         '''
         self.application_alias = application_alias
         self.application_url = application_url
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_alias = data.get('application-alias')
+        self.application_url = data.get('application-url')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-alias': self.application_alias, 'application-url': self.application_url}
 
 
 
 class ConsumeApplicationArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ConsumeApplicationArg]
         '''
-        self.args = [ConsumeApplicationArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [ConsumeApplicationArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class ConsumeApplicationResult(Type):
+    __slots__ = ('_error', '_raw_error', 'local_name', 'unknown_fields')
     _toSchema = {'error': 'error', 'local_name': 'local-name'}
     _toPy = {'error': 'error', 'local-name': 'local_name'}
     def __init__(self, error=None, local_name=None, **unknown_fields):
@@ -2410,23 +5226,56 @@ class ConsumeApplicationResult(Type):
         error : Error
         local_name : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.local_name = local_name
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.local_name = data.get('local-name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'local-name': self.local_name}
 
 
 
 class ConsumeApplicationResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ConsumeApplicationResult]
         '''
-        self.results = [ConsumeApplicationResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ConsumeApplicationResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ConsumeOfferDetails(Type):
+    __slots__ = ('_external_controller', '_macaroon', '_offer', '_raw_external_controller', '_raw_macaroon', '_raw_offer', 'unknown_fields')
     _toSchema = {'external_controller': 'external-controller', 'macaroon': 'macaroon', 'offer': 'offer'}
     _toPy = {'external-controller': 'external_controller', 'macaroon': 'macaroon', 'offer': 'offer'}
     def __init__(self, external_controller=None, macaroon=None, offer=None, **unknown_fields):
@@ -2435,13 +5284,33 @@ class ConsumeOfferDetails(Type):
         macaroon : Macaroon
         offer : ApplicationOfferDetails
         '''
-        self.external_controller = ExternalControllerInfo.from_json(external_controller) if external_controller else None
-        self.macaroon = Macaroon.from_json(macaroon) if macaroon else None
-        self.offer = ApplicationOfferDetails.from_json(offer) if offer else None
+        self._raw_external_controller = external_controller
+        self._raw_macaroon = macaroon
+        self._raw_offer = offer
+        self.unknown_fields = unknown_fields
+
+    external_controller = LazyField('external_controller', lambda data: ExternalControllerInfo.from_json(data) if data else None)
+    macaroon = LazyField('macaroon', lambda data: Macaroon.from_json(data) if data else None)
+    offer = LazyField('offer', lambda data: ApplicationOfferDetails.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_external_controller = data.get('external-controller')
+        self._raw_macaroon = data.get('macaroon')
+        self._raw_offer = data.get('offer')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'external-controller': self._raw_external_controller, 'macaroon': self._raw_macaroon, 'offer': self._raw_offer}
 
 
 
 class ConsumeOfferDetailsResult(Type):
+    __slots__ = ('_consumeofferdetails', '_error', '_raw_consumeofferdetails', '_raw_error', 'unknown_fields')
     _toSchema = {'consumeofferdetails': 'ConsumeOfferDetails', 'error': 'error'}
     _toPy = {'ConsumeOfferDetails': 'consumeofferdetails', 'error': 'error'}
     def __init__(self, consumeofferdetails=None, error=None, **unknown_fields):
@@ -2449,23 +5318,57 @@ class ConsumeOfferDetailsResult(Type):
         consumeofferdetails : ConsumeOfferDetails
         error : Error
         '''
-        self.consumeofferdetails = ConsumeOfferDetails.from_json(consumeofferdetails) if consumeofferdetails else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_consumeofferdetails = consumeofferdetails
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    consumeofferdetails = LazyField('consumeofferdetails', lambda data: ConsumeOfferDetails.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_consumeofferdetails = data.get('ConsumeOfferDetails')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ConsumeOfferDetails': self._raw_consumeofferdetails, 'error': self._raw_error}
 
 
 
 class ConsumeOfferDetailsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ConsumeOfferDetailsResult]
         '''
-        self.results = [ConsumeOfferDetailsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ConsumeOfferDetailsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ContainerConfig(Type):
+    __slots__ = ('_apt_proxy', '_proxy', '_raw_apt_proxy', '_raw_proxy', '_raw_updatebehavior', '_updatebehavior', 'apt_mirror', 'authorized_keys', 'provider_type', 'ssl_hostname_verification', 'unknown_fields')
     _toSchema = {'apt_mirror': 'apt-mirror', 'apt_proxy': 'apt-proxy', 'authorized_keys': 'authorized-keys', 'provider_type': 'provider-type', 'proxy': 'proxy', 'ssl_hostname_verification': 'ssl-hostname-verification', 'updatebehavior': 'UpdateBehavior'}
     _toPy = {'UpdateBehavior': 'updatebehavior', 'apt-mirror': 'apt_mirror', 'apt-proxy': 'apt_proxy', 'authorized-keys': 'authorized_keys', 'provider-type': 'provider_type', 'proxy': 'proxy', 'ssl-hostname-verification': 'ssl_hostname_verification'}
     def __init__(self, updatebehavior=None, apt_mirror=None, apt_proxy=None, authorized_keys=None, provider_type=None, proxy=None, ssl_hostname_verification=None, **unknown_fields):
@@ -2478,17 +5381,41 @@ class ContainerConfig(Type):
         proxy : Settings
         ssl_hostname_verification : bool
         '''
-        self.updatebehavior = UpdateBehavior.from_json(updatebehavior) if updatebehavior else None
+        self._raw_updatebehavior = updatebehavior
         self.apt_mirror = apt_mirror
-        self.apt_proxy = Settings.from_json(apt_proxy) if apt_proxy else None
+        self._raw_apt_proxy = apt_proxy
         self.authorized_keys = authorized_keys
         self.provider_type = provider_type
-        self.proxy = Settings.from_json(proxy) if proxy else None
+        self._raw_proxy = proxy
         self.ssl_hostname_verification = ssl_hostname_verification
+        self.unknown_fields = unknown_fields
+
+    updatebehavior = LazyField('updatebehavior', lambda data: UpdateBehavior.from_json(data) if data else None)
+    apt_proxy = LazyField('apt_proxy', lambda data: Settings.from_json(data) if data else None)
+    proxy = LazyField('proxy', lambda data: Settings.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_updatebehavior = data.get('UpdateBehavior')
+        self.apt_mirror = data.get('apt-mirror')
+        self._raw_apt_proxy = data.get('apt-proxy')
+        self.authorized_keys = data.get('authorized-keys')
+        self.provider_type = data.get('provider-type')
+        self._raw_proxy = data.get('proxy')
+        self.ssl_hostname_verification = data.get('ssl-hostname-verification')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'UpdateBehavior': self._raw_updatebehavior, 'apt-mirror': self.apt_mirror, 'apt-proxy': self._raw_apt_proxy, 'authorized-keys': self.authorized_keys, 'provider-type': self.provider_type, 'proxy': self._raw_proxy, 'ssl-hostname-verification': self.ssl_hostname_verification}
 
 
 
 class ContainerLXDProfile(Type):
+    __slots__ = ('_profile', '_raw_profile', 'name', 'unknown_fields')
     _toSchema = {'name': 'name', 'profile': 'profile'}
     _toPy = {'name': 'name', 'profile': 'profile'}
     def __init__(self, name=None, profile=None, **unknown_fields):
@@ -2497,11 +5424,28 @@ class ContainerLXDProfile(Type):
         profile : CharmLXDProfile
         '''
         self.name = name
-        self.profile = CharmLXDProfile.from_json(profile) if profile else None
+        self._raw_profile = profile
+        self.unknown_fields = unknown_fields
+
+    profile = LazyField('profile', lambda data: CharmLXDProfile.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.name = data.get('name')
+        self._raw_profile = data.get('profile')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'name': self.name, 'profile': self._raw_profile}
 
 
 
 class ContainerManagerConfig(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
     def __init__(self, config=None, **unknown_fields):
@@ -2509,10 +5453,24 @@ class ContainerManagerConfig(Type):
         config : typing.Mapping[str, str]
         '''
         self.config = config
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config}
 
 
 
 class ContainerManagerConfigParams(Type):
+    __slots__ = ('type_', 'unknown_fields')
     _toSchema = {'type_': 'type'}
     _toPy = {'type': 'type_'}
     def __init__(self, type_=None, **unknown_fields):
@@ -2520,10 +5478,24 @@ class ContainerManagerConfigParams(Type):
         type_ : str
         '''
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.type_ = data.get('type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'type': self.type_}
 
 
 
 class ContainerProfileResult(Type):
+    __slots__ = ('_error', '_lxd_profiles', '_raw_error', '_raw_lxd_profiles', 'unknown_fields')
     _toSchema = {'error': 'error', 'lxd_profiles': 'lxd-profiles'}
     _toPy = {'error': 'error', 'lxd-profiles': 'lxd_profiles'}
     def __init__(self, error=None, lxd_profiles=None, **unknown_fields):
@@ -2531,23 +5503,57 @@ class ContainerProfileResult(Type):
         error : Error
         lxd_profiles : typing.Sequence[~ContainerLXDProfile]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.lxd_profiles = [ContainerLXDProfile.from_json(o) for o in lxd_profiles or []]
+        self._raw_error = error
+        self._raw_lxd_profiles = lxd_profiles
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    lxd_profiles = LazyField('lxd_profiles', lambda data: [ContainerLXDProfile.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_lxd_profiles = data.get('lxd-profiles')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'lxd-profiles': self._raw_lxd_profiles}
 
 
 
 class ContainerProfileResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ContainerProfileResult]
         '''
-        self.results = [ContainerProfileResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ContainerProfileResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ControllerAPIInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', 'addresses', 'cacert', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'cacert': 'cacert', 'error': 'error'}
     _toPy = {'addresses': 'addresses', 'cacert': 'cacert', 'error': 'error'}
     def __init__(self, addresses=None, cacert=None, error=None, **unknown_fields):
@@ -2558,22 +5564,56 @@ class ControllerAPIInfoResult(Type):
         '''
         self.addresses = addresses
         self.cacert = cacert
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.addresses = data.get('addresses')
+        self.cacert = data.get('cacert')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'addresses': self.addresses, 'cacert': self.cacert, 'error': self._raw_error}
 
 
 
 class ControllerAPIInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ControllerAPIInfoResult]
         '''
-        self.results = [ControllerAPIInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ControllerAPIInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ControllerConfigResult(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
     def __init__(self, config=None, **unknown_fields):
@@ -2581,10 +5621,24 @@ class ControllerConfigResult(Type):
         config : typing.Mapping[str, typing.Any]
         '''
         self.config = config
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config}
 
 
 
 class ControllerConfigSet(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
     def __init__(self, config=None, **unknown_fields):
@@ -2592,10 +5646,24 @@ class ControllerConfigSet(Type):
         config : typing.Mapping[str, typing.Any]
         '''
         self.config = config
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config}
 
 
 
 class ControllerCredentialInfo(Type):
+    __slots__ = ('_content', '_models', '_raw_content', '_raw_models', 'unknown_fields')
     _toSchema = {'content': 'content', 'models': 'models'}
     _toPy = {'content': 'content', 'models': 'models'}
     def __init__(self, content=None, models=None, **unknown_fields):
@@ -2603,12 +5671,30 @@ class ControllerCredentialInfo(Type):
         content : CredentialContent
         models : typing.Sequence[~ModelAccess]
         '''
-        self.content = CredentialContent.from_json(content) if content else None
-        self.models = [ModelAccess.from_json(o) for o in models or []]
+        self._raw_content = content
+        self._raw_models = models
+        self.unknown_fields = unknown_fields
+
+    content = LazyField('content', lambda data: CredentialContent.from_json(data) if data else None)
+    models = LazyField('models', lambda data: [ModelAccess.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_content = data.get('content')
+        self._raw_models = data.get('models')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'content': self._raw_content, 'models': self._raw_models}
 
 
 
 class ControllersChangeResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -2616,23 +5702,57 @@ class ControllersChangeResult(Type):
         error : Error
         result : ControllersChanges
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ControllersChanges.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ControllersChanges.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ControllersChangeResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ControllersChangeResult]
         '''
-        self.results = [ControllersChangeResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ControllersChangeResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ControllersChanges(Type):
+    __slots__ = ('added', 'converted', 'demoted', 'maintained', 'promoted', 'removed', 'unknown_fields')
     _toSchema = {'added': 'added', 'converted': 'converted', 'demoted': 'demoted', 'maintained': 'maintained', 'promoted': 'promoted', 'removed': 'removed'}
     _toPy = {'added': 'added', 'converted': 'converted', 'demoted': 'demoted', 'maintained': 'maintained', 'promoted': 'promoted', 'removed': 'removed'}
     def __init__(self, added=None, converted=None, demoted=None, maintained=None, promoted=None, removed=None, **unknown_fields):
@@ -2650,10 +5770,29 @@ class ControllersChanges(Type):
         self.maintained = maintained
         self.promoted = promoted
         self.removed = removed
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.added = data.get('added')
+        self.converted = data.get('converted')
+        self.demoted = data.get('demoted')
+        self.maintained = data.get('maintained')
+        self.promoted = data.get('promoted')
+        self.removed = data.get('removed')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'added': self.added, 'converted': self.converted, 'demoted': self.demoted, 'maintained': self.maintained, 'promoted': self.promoted, 'removed': self.removed}
 
 
 
 class ControllersSpec(Type):
+    __slots__ = ('_constraints', '_raw_constraints', 'num_controllers', 'placement', 'series', 'unknown_fields')
     _toSchema = {'constraints': 'constraints', 'num_controllers': 'num-controllers', 'placement': 'placement', 'series': 'series'}
     _toPy = {'constraints': 'constraints', 'num-controllers': 'num_controllers', 'placement': 'placement', 'series': 'series'}
     def __init__(self, constraints=None, num_controllers=None, placement=None, series=None, **unknown_fields):
@@ -2663,25 +5802,60 @@ class ControllersSpec(Type):
         placement : typing.Sequence[str]
         series : str
         '''
-        self.constraints = Value.from_json(constraints) if constraints else None
+        self._raw_constraints = constraints
         self.num_controllers = num_controllers
         self.placement = placement
         self.series = series
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_constraints = data.get('constraints')
+        self.num_controllers = data.get('num-controllers')
+        self.placement = data.get('placement')
+        self.series = data.get('series')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'constraints': self._raw_constraints, 'num-controllers': self.num_controllers, 'placement': self.placement, 'series': self.series}
 
 
 
 class ControllersSpecs(Type):
+    __slots__ = ('_raw_specs', '_specs', 'unknown_fields')
     _toSchema = {'specs': 'specs'}
     _toPy = {'specs': 'specs'}
     def __init__(self, specs=None, **unknown_fields):
         '''
         specs : typing.Sequence[~ControllersSpec]
         '''
-        self.specs = [ControllersSpec.from_json(o) for o in specs or []]
+        self._raw_specs = specs
+        self.unknown_fields = unknown_fields
+
+    specs = LazyField('specs', lambda data: [ControllersSpec.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_specs = data.get('specs')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'specs': self._raw_specs}
 
 
 
 class CreateSpaceParams(Type):
+    __slots__ = ('provider_id', 'public', 'space_tag', 'subnet_tags', 'unknown_fields')
     _toSchema = {'provider_id': 'provider-id', 'public': 'public', 'space_tag': 'space-tag', 'subnet_tags': 'subnet-tags'}
     _toPy = {'provider-id': 'provider_id', 'public': 'public', 'space-tag': 'space_tag', 'subnet-tags': 'subnet_tags'}
     def __init__(self, provider_id=None, public=None, space_tag=None, subnet_tags=None, **unknown_fields):
@@ -2695,21 +5869,54 @@ class CreateSpaceParams(Type):
         self.public = public
         self.space_tag = space_tag
         self.subnet_tags = subnet_tags
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.provider_id = data.get('provider-id')
+        self.public = data.get('public')
+        self.space_tag = data.get('space-tag')
+        self.subnet_tags = data.get('subnet-tags')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'provider-id': self.provider_id, 'public': self.public, 'space-tag': self.space_tag, 'subnet-tags': self.subnet_tags}
 
 
 
 class CreateSpacesParams(Type):
+    __slots__ = ('_raw_spaces', '_spaces', 'unknown_fields')
     _toSchema = {'spaces': 'spaces'}
     _toPy = {'spaces': 'spaces'}
     def __init__(self, spaces=None, **unknown_fields):
         '''
         spaces : typing.Sequence[~CreateSpaceParams]
         '''
-        self.spaces = [CreateSpaceParams.from_json(o) for o in spaces or []]
+        self._raw_spaces = spaces
+        self.unknown_fields = unknown_fields
+
+    spaces = LazyField('spaces', lambda data: [CreateSpaceParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_spaces = data.get('spaces')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'spaces': self._raw_spaces}
 
 
 
 class CredentialContent(Type):
+    __slots__ = ('attrs', 'auth_type', 'cloud', 'name', 'unknown_fields')
     _toSchema = {'attrs': 'attrs', 'auth_type': 'auth-type', 'cloud': 'cloud', 'name': 'name'}
     _toPy = {'attrs': 'attrs', 'auth-type': 'auth_type', 'cloud': 'cloud', 'name': 'name'}
     def __init__(self, attrs=None, auth_type=None, cloud=None, name=None, **unknown_fields):
@@ -2723,10 +5930,27 @@ class CredentialContent(Type):
         self.auth_type = auth_type
         self.cloud = cloud
         self.name = name
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.attrs = data.get('attrs')
+        self.auth_type = data.get('auth-type')
+        self.cloud = data.get('cloud')
+        self.name = data.get('name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attrs': self.attrs, 'auth-type': self.auth_type, 'cloud': self.cloud, 'name': self.name}
 
 
 
 class CredentialContentResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -2734,23 +5958,57 @@ class CredentialContentResult(Type):
         error : Error
         result : ControllerCredentialInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ControllerCredentialInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ControllerCredentialInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class CredentialContentResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CredentialContentResult]
         '''
-        self.results = [CredentialContentResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [CredentialContentResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Delta(Type):
+    __slots__ = ('entity', 'removed', 'unknown_fields')
     _toSchema = {'entity': 'entity', 'removed': 'removed'}
     _toPy = {'entity': 'entity', 'removed': 'removed'}
     def __init__(self, entity=None, removed=None, **unknown_fields):
@@ -2760,10 +6018,25 @@ class Delta(Type):
         '''
         self.entity = entity
         self.removed = removed
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.entity = data.get('entity')
+        self.removed = data.get('removed')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entity': self.entity, 'removed': self.removed}
 
 
 
 class DeployerConnectionValues(Type):
+    __slots__ = ('api_addresses', 'state_addresses', 'unknown_fields')
     _toSchema = {'api_addresses': 'api-addresses', 'state_addresses': 'state-addresses'}
     _toPy = {'api-addresses': 'api_addresses', 'state-addresses': 'state_addresses'}
     def __init__(self, api_addresses=None, state_addresses=None, **unknown_fields):
@@ -2773,10 +6046,25 @@ class DeployerConnectionValues(Type):
         '''
         self.api_addresses = api_addresses
         self.state_addresses = state_addresses
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.api_addresses = data.get('api-addresses')
+        self.state_addresses = data.get('state-addresses')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'api-addresses': self.api_addresses, 'state-addresses': self.state_addresses}
 
 
 
 class DestroyApplicationInfo(Type):
+    __slots__ = ('_destroyed_storage', '_destroyed_units', '_detached_storage', '_raw_destroyed_storage', '_raw_destroyed_units', '_raw_detached_storage', 'unknown_fields')
     _toSchema = {'destroyed_storage': 'destroyed-storage', 'destroyed_units': 'destroyed-units', 'detached_storage': 'detached-storage'}
     _toPy = {'destroyed-storage': 'destroyed_storage', 'destroyed-units': 'destroyed_units', 'detached-storage': 'detached_storage'}
     def __init__(self, destroyed_storage=None, destroyed_units=None, detached_storage=None, **unknown_fields):
@@ -2785,13 +6073,33 @@ class DestroyApplicationInfo(Type):
         destroyed_units : typing.Sequence[~Entity]
         detached_storage : typing.Sequence[~Entity]
         '''
-        self.destroyed_storage = [Entity.from_json(o) for o in destroyed_storage or []]
-        self.destroyed_units = [Entity.from_json(o) for o in destroyed_units or []]
-        self.detached_storage = [Entity.from_json(o) for o in detached_storage or []]
+        self._raw_destroyed_storage = destroyed_storage
+        self._raw_destroyed_units = destroyed_units
+        self._raw_detached_storage = detached_storage
+        self.unknown_fields = unknown_fields
+
+    destroyed_storage = LazyField('destroyed_storage', lambda data: [Entity.from_json(o) for o in data or []])
+    destroyed_units = LazyField('destroyed_units', lambda data: [Entity.from_json(o) for o in data or []])
+    detached_storage = LazyField('detached_storage', lambda data: [Entity.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_destroyed_storage = data.get('destroyed-storage')
+        self._raw_destroyed_units = data.get('destroyed-units')
+        self._raw_detached_storage = data.get('detached-storage')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destroyed-storage': self._raw_destroyed_storage, 'destroyed-units': self._raw_destroyed_units, 'detached-storage': self._raw_detached_storage}
 
 
 
 class DestroyApplicationOffers(Type):
+    __slots__ = ('force', 'offer_urls', 'unknown_fields')
     _toSchema = {'force': 'force', 'offer_urls': 'offer-urls'}
     _toPy = {'force': 'force', 'offer-urls': 'offer_urls'}
     def __init__(self, force=None, offer_urls=None, **unknown_fields):
@@ -2801,10 +6109,25 @@ class DestroyApplicationOffers(Type):
         '''
         self.force = force
         self.offer_urls = offer_urls
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.force = data.get('force')
+        self.offer_urls = data.get('offer-urls')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'force': self.force, 'offer-urls': self.offer_urls}
 
 
 
 class DestroyApplicationParams(Type):
+    __slots__ = ('application_tag', 'destroy_storage', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'destroy_storage': 'destroy-storage'}
     _toPy = {'application-tag': 'application_tag', 'destroy-storage': 'destroy_storage'}
     def __init__(self, application_tag=None, destroy_storage=None, **unknown_fields):
@@ -2814,10 +6137,25 @@ class DestroyApplicationParams(Type):
         '''
         self.application_tag = application_tag
         self.destroy_storage = destroy_storage
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_tag = data.get('application-tag')
+        self.destroy_storage = data.get('destroy-storage')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-tag': self.application_tag, 'destroy-storage': self.destroy_storage}
 
 
 
 class DestroyApplicationResult(Type):
+    __slots__ = ('_error', '_info', '_raw_error', '_raw_info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
     def __init__(self, error=None, info=None, **unknown_fields):
@@ -2825,23 +6163,57 @@ class DestroyApplicationResult(Type):
         error : Error
         info : DestroyApplicationInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.info = DestroyApplicationInfo.from_json(info) if info else None
+        self._raw_error = error
+        self._raw_info = info
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    info = LazyField('info', lambda data: DestroyApplicationInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_info = data.get('info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'info': self._raw_info}
 
 
 
 class DestroyApplicationResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DestroyApplicationResult]
         '''
-        self.results = [DestroyApplicationResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [DestroyApplicationResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class DestroyApplicationUnits(Type):
+    __slots__ = ('unit_names', 'unknown_fields')
     _toSchema = {'unit_names': 'unit-names'}
     _toPy = {'unit-names': 'unit_names'}
     def __init__(self, unit_names=None, **unknown_fields):
@@ -2849,21 +6221,51 @@ class DestroyApplicationUnits(Type):
         unit_names : typing.Sequence[str]
         '''
         self.unit_names = unit_names
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.unit_names = data.get('unit-names')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'unit-names': self.unit_names}
 
 
 
 class DestroyApplicationsParams(Type):
+    __slots__ = ('_applications', '_raw_applications', 'unknown_fields')
     _toSchema = {'applications': 'applications'}
     _toPy = {'applications': 'applications'}
     def __init__(self, applications=None, **unknown_fields):
         '''
         applications : typing.Sequence[~DestroyApplicationParams]
         '''
-        self.applications = [DestroyApplicationParams.from_json(o) for o in applications or []]
+        self._raw_applications = applications
+        self.unknown_fields = unknown_fields
+
+    applications = LazyField('applications', lambda data: [DestroyApplicationParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_applications = data.get('applications')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'applications': self._raw_applications}
 
 
 
 class DestroyConsumedApplicationParams(Type):
+    __slots__ = ('application_tag', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag'}
     _toPy = {'application-tag': 'application_tag'}
     def __init__(self, application_tag=None, **unknown_fields):
@@ -2871,21 +6273,51 @@ class DestroyConsumedApplicationParams(Type):
         application_tag : str
         '''
         self.application_tag = application_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_tag = data.get('application-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-tag': self.application_tag}
 
 
 
 class DestroyConsumedApplicationsParams(Type):
+    __slots__ = ('_applications', '_raw_applications', 'unknown_fields')
     _toSchema = {'applications': 'applications'}
     _toPy = {'applications': 'applications'}
     def __init__(self, applications=None, **unknown_fields):
         '''
         applications : typing.Sequence[~DestroyConsumedApplicationParams]
         '''
-        self.applications = [DestroyConsumedApplicationParams.from_json(o) for o in applications or []]
+        self._raw_applications = applications
+        self.unknown_fields = unknown_fields
+
+    applications = LazyField('applications', lambda data: [DestroyConsumedApplicationParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_applications = data.get('applications')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'applications': self._raw_applications}
 
 
 
 class DestroyControllerArgs(Type):
+    __slots__ = ('destroy_models', 'unknown_fields')
     _toSchema = {'destroy_models': 'destroy-models'}
     _toPy = {'destroy-models': 'destroy_models'}
     def __init__(self, destroy_models=None, **unknown_fields):
@@ -2893,10 +6325,24 @@ class DestroyControllerArgs(Type):
         destroy_models : bool
         '''
         self.destroy_models = destroy_models
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.destroy_models = data.get('destroy-models')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destroy-models': self.destroy_models}
 
 
 
 class DestroyMachineInfo(Type):
+    __slots__ = ('_destroyed_storage', '_destroyed_units', '_detached_storage', '_raw_destroyed_storage', '_raw_destroyed_units', '_raw_detached_storage', 'unknown_fields')
     _toSchema = {'destroyed_storage': 'destroyed-storage', 'destroyed_units': 'destroyed-units', 'detached_storage': 'detached-storage'}
     _toPy = {'destroyed-storage': 'destroyed_storage', 'destroyed-units': 'destroyed_units', 'detached-storage': 'detached_storage'}
     def __init__(self, destroyed_storage=None, destroyed_units=None, detached_storage=None, **unknown_fields):
@@ -2905,13 +6351,33 @@ class DestroyMachineInfo(Type):
         destroyed_units : typing.Sequence[~Entity]
         detached_storage : typing.Sequence[~Entity]
         '''
-        self.destroyed_storage = [Entity.from_json(o) for o in destroyed_storage or []]
-        self.destroyed_units = [Entity.from_json(o) for o in destroyed_units or []]
-        self.detached_storage = [Entity.from_json(o) for o in detached_storage or []]
+        self._raw_destroyed_storage = destroyed_storage
+        self._raw_destroyed_units = destroyed_units
+        self._raw_detached_storage = detached_storage
+        self.unknown_fields = unknown_fields
+
+    destroyed_storage = LazyField('destroyed_storage', lambda data: [Entity.from_json(o) for o in data or []])
+    destroyed_units = LazyField('destroyed_units', lambda data: [Entity.from_json(o) for o in data or []])
+    detached_storage = LazyField('detached_storage', lambda data: [Entity.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_destroyed_storage = data.get('destroyed-storage')
+        self._raw_destroyed_units = data.get('destroyed-units')
+        self._raw_detached_storage = data.get('detached-storage')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destroyed-storage': self._raw_destroyed_storage, 'destroyed-units': self._raw_destroyed_units, 'detached-storage': self._raw_detached_storage}
 
 
 
 class DestroyMachineResult(Type):
+    __slots__ = ('_error', '_info', '_raw_error', '_raw_info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
     def __init__(self, error=None, info=None, **unknown_fields):
@@ -2919,23 +6385,57 @@ class DestroyMachineResult(Type):
         error : Error
         info : DestroyMachineInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.info = DestroyMachineInfo.from_json(info) if info else None
+        self._raw_error = error
+        self._raw_info = info
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    info = LazyField('info', lambda data: DestroyMachineInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_info = data.get('info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'info': self._raw_info}
 
 
 
 class DestroyMachineResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DestroyMachineResult]
         '''
-        self.results = [DestroyMachineResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [DestroyMachineResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class DestroyMachines(Type):
+    __slots__ = ('force', 'machine_names', 'unknown_fields')
     _toSchema = {'force': 'force', 'machine_names': 'machine-names'}
     _toPy = {'force': 'force', 'machine-names': 'machine_names'}
     def __init__(self, force=None, machine_names=None, **unknown_fields):
@@ -2945,10 +6445,25 @@ class DestroyMachines(Type):
         '''
         self.force = force
         self.machine_names = machine_names
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.force = data.get('force')
+        self.machine_names = data.get('machine-names')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'force': self.force, 'machine-names': self.machine_names}
 
 
 
 class DestroyMachinesParams(Type):
+    __slots__ = ('force', 'keep', 'machine_tags', 'unknown_fields')
     _toSchema = {'force': 'force', 'keep': 'keep', 'machine_tags': 'machine-tags'}
     _toPy = {'force': 'force', 'keep': 'keep', 'machine-tags': 'machine_tags'}
     def __init__(self, force=None, keep=None, machine_tags=None, **unknown_fields):
@@ -2960,10 +6475,26 @@ class DestroyMachinesParams(Type):
         self.force = force
         self.keep = keep
         self.machine_tags = machine_tags
+        self.unknown_fields = unknown_fields
 
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.force = data.get('force')
+        self.keep = data.get('keep')
+        self.machine_tags = data.get('machine-tags')
+        self.unknown_fields = {}
+        return self
 
+    def serialize(self):
+        return {'force': self.force, 'keep': self.keep, 'machine-tags': self.machine_tags}
 
-class DestroyModelParams(Type):
+
+
+class DestroyModelParams(Type):
+    __slots__ = ('destroy_storage', 'model_tag', 'unknown_fields')
     _toSchema = {'destroy_storage': 'destroy-storage', 'model_tag': 'model-tag'}
     _toPy = {'destroy-storage': 'destroy_storage', 'model-tag': 'model_tag'}
     def __init__(self, destroy_storage=None, model_tag=None, **unknown_fields):
@@ -2973,21 +6504,52 @@ class DestroyModelParams(Type):
         '''
         self.destroy_storage = destroy_storage
         self.model_tag = model_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.destroy_storage = data.get('destroy-storage')
+        self.model_tag = data.get('model-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destroy-storage': self.destroy_storage, 'model-tag': self.model_tag}
 
 
 
 class DestroyModelsParams(Type):
+    __slots__ = ('_models', '_raw_models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~DestroyModelParams]
         '''
-        self.models = [DestroyModelParams.from_json(o) for o in models or []]
+        self._raw_models = models
+        self.unknown_fields = unknown_fields
+
+    models = LazyField('models', lambda data: [DestroyModelParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_models = data.get('models')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'models': self._raw_models}
 
 
 
 class DestroyRelation(Type):
+    __slots__ = ('endpoints', 'unknown_fields')
     _toSchema = {'endpoints': 'endpoints'}
     _toPy = {'endpoints': 'endpoints'}
     def __init__(self, endpoints=None, **unknown_fields):
@@ -2995,10 +6557,24 @@ class DestroyRelation(Type):
         endpoints : typing.Sequence[str]
         '''
         self.endpoints = endpoints
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.endpoints = data.get('endpoints')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'endpoints': self.endpoints}
 
 
 
 class DestroyUnitInfo(Type):
+    __slots__ = ('_destroyed_storage', '_detached_storage', '_raw_destroyed_storage', '_raw_detached_storage', 'unknown_fields')
     _toSchema = {'destroyed_storage': 'destroyed-storage', 'detached_storage': 'detached-storage'}
     _toPy = {'destroyed-storage': 'destroyed_storage', 'detached-storage': 'detached_storage'}
     def __init__(self, destroyed_storage=None, detached_storage=None, **unknown_fields):
@@ -3006,12 +6582,30 @@ class DestroyUnitInfo(Type):
         destroyed_storage : typing.Sequence[~Entity]
         detached_storage : typing.Sequence[~Entity]
         '''
-        self.destroyed_storage = [Entity.from_json(o) for o in destroyed_storage or []]
-        self.detached_storage = [Entity.from_json(o) for o in detached_storage or []]
+        self._raw_destroyed_storage = destroyed_storage
+        self._raw_detached_storage = detached_storage
+        self.unknown_fields = unknown_fields
+
+    destroyed_storage = LazyField('destroyed_storage', lambda data: [Entity.from_json(o) for o in data or []])
+    detached_storage = LazyField('detached_storage', lambda data: [Entity.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_destroyed_storage = data.get('destroyed-storage')
+        self._raw_detached_storage = data.get('detached-storage')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destroyed-storage': self._raw_destroyed_storage, 'detached-storage': self._raw_detached_storage}
 
 
 
 class DestroyUnitParams(Type):
+    __slots__ = ('destroy_storage', 'unit_tag', 'unknown_fields')
     _toSchema = {'destroy_storage': 'destroy-storage', 'unit_tag': 'unit-tag'}
     _toPy = {'destroy-storage': 'destroy_storage', 'unit-tag': 'unit_tag'}
     def __init__(self, destroy_storage=None, unit_tag=None, **unknown_fields):
@@ -3021,10 +6615,25 @@ class DestroyUnitParams(Type):
         '''
         self.destroy_storage = destroy_storage
         self.unit_tag = unit_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.destroy_storage = data.get('destroy-storage')
+        self.unit_tag = data.get('unit-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destroy-storage': self.destroy_storage, 'unit-tag': self.unit_tag}
 
 
 
 class DestroyUnitResult(Type):
+    __slots__ = ('_error', '_info', '_raw_error', '_raw_info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
     def __init__(self, error=None, info=None, **unknown_fields):
@@ -3032,34 +6641,84 @@ class DestroyUnitResult(Type):
         error : Error
         info : DestroyUnitInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.info = DestroyUnitInfo.from_json(info) if info else None
+        self._raw_error = error
+        self._raw_info = info
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    info = LazyField('info', lambda data: DestroyUnitInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_info = data.get('info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'info': self._raw_info}
 
 
 
 class DestroyUnitResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DestroyUnitResult]
         '''
-        self.results = [DestroyUnitResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [DestroyUnitResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class DestroyUnitsParams(Type):
+    __slots__ = ('_raw_units', '_units', 'unknown_fields')
     _toSchema = {'units': 'units'}
     _toPy = {'units': 'units'}
     def __init__(self, units=None, **unknown_fields):
         '''
         units : typing.Sequence[~DestroyUnitParams]
         '''
-        self.units = [DestroyUnitParams.from_json(o) for o in units or []]
+        self._raw_units = units
+        self.unknown_fields = unknown_fields
+
+    units = LazyField('units', lambda data: [DestroyUnitParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_units = data.get('units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'units': self._raw_units}
 
 
 
 class DetailedStatus(Type):
+    __slots__ = ('data', 'err', 'info', 'kind', 'life', 'since', 'status', 'unknown_fields', 'version')
     _toSchema = {'data': 'data', 'err': 'err', 'info': 'info', 'kind': 'kind', 'life': 'life', 'since': 'since', 'status': 'status', 'version': 'version'}
     _toPy = {'data': 'data', 'err': 'err', 'info': 'info', 'kind': 'kind', 'life': 'life', 'since': 'since', 'status': 'status', 'version': 'version'}
     def __init__(self, data=None, err=None, info=None, kind=None, life=None, since=None, status=None, version=None, **unknown_fields):
@@ -3081,10 +6740,31 @@ class DetailedStatus(Type):
         self.since = since
         self.status = status
         self.version = version
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.data = data.get('data')
+        self.err = data.get('err')
+        self.info = data.get('info')
+        self.kind = data.get('kind')
+        self.life = data.get('life')
+        self.since = data.get('since')
+        self.status = data.get('status')
+        self.version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'data': self.data, 'err': self.err, 'info': self.info, 'kind': self.kind, 'life': self.life, 'since': self.since, 'status': self.status, 'version': self.version}
 
 
 
 class DeviceBridgeInfo(Type):
+    __slots__ = ('bridge_name', 'host_device_name', 'unknown_fields')
     _toSchema = {'bridge_name': 'bridge-name', 'host_device_name': 'host-device-name'}
     _toPy = {'bridge-name': 'bridge_name', 'host-device-name': 'host_device_name'}
     def __init__(self, bridge_name=None, host_device_name=None, **unknown_fields):
@@ -3094,21 +6774,52 @@ class DeviceBridgeInfo(Type):
         '''
         self.bridge_name = bridge_name
         self.host_device_name = host_device_name
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.bridge_name = data.get('bridge-name')
+        self.host_device_name = data.get('host-device-name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'bridge-name': self.bridge_name, 'host-device-name': self.host_device_name}
 
 
 
 class DiscoverSpacesResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ProviderSpace]
         '''
-        self.results = [ProviderSpace.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ProviderSpace.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class DistributionGroupResult(Type):
+    __slots__ = ('_error', '_raw_error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -3116,23 +6827,56 @@ class DistributionGroupResult(Type):
         error : Error
         result : typing.Sequence[str]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self.result}
 
 
 
 class DistributionGroupResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DistributionGroupResult]
         '''
-        self.results = [DistributionGroupResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [DistributionGroupResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class DumpModelRequest(Type):
+    __slots__ = ('_entities', '_raw_entities', 'simplified', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'simplified': 'simplified'}
     _toPy = {'entities': 'entities', 'simplified': 'simplified'}
     def __init__(self, entities=None, simplified=None, **unknown_fields):
@@ -3140,12 +6884,29 @@ class DumpModelRequest(Type):
         entities : typing.Sequence[~Entity]
         simplified : bool
         '''
-        self.entities = [Entity.from_json(o) for o in entities or []]
+        self._raw_entities = entities
         self.simplified = simplified
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [Entity.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.simplified = data.get('simplified')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities, 'simplified': self.simplified}
 
 
 
 class Endpoint(Type):
+    __slots__ = ('_raw_relation', '_relation', 'application_name', 'unknown_fields')
     _toSchema = {'application_name': 'application-name', 'relation': 'relation'}
     _toPy = {'application-name': 'application_name', 'relation': 'relation'}
     def __init__(self, application_name=None, relation=None, **unknown_fields):
@@ -3154,11 +6915,28 @@ class Endpoint(Type):
         relation : CharmRelation
         '''
         self.application_name = application_name
-        self.relation = CharmRelation.from_json(relation) if relation else None
+        self._raw_relation = relation
+        self.unknown_fields = unknown_fields
+
+    relation = LazyField('relation', lambda data: CharmRelation.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_name = data.get('application-name')
+        self._raw_relation = data.get('relation')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-name': self.application_name, 'relation': self._raw_relation}
 
 
 
 class EndpointFilterAttributes(Type):
+    __slots__ = ('interface', 'name', 'role', 'unknown_fields')
     _toSchema = {'interface': 'interface', 'name': 'name', 'role': 'role'}
     _toPy = {'interface': 'interface', 'name': 'name', 'role': 'role'}
     def __init__(self, interface=None, name=None, role=None, **unknown_fields):
@@ -3170,10 +6948,26 @@ class EndpointFilterAttributes(Type):
         self.interface = interface
         self.name = name
         self.role = role
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.interface = data.get('interface')
+        self.name = data.get('name')
+        self.role = data.get('role')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'interface': self.interface, 'name': self.name, 'role': self.role}
 
 
 
 class EndpointStatus(Type):
+    __slots__ = ('application', 'name', 'role', 'subordinate', 'unknown_fields')
     _toSchema = {'application': 'application', 'name': 'name', 'role': 'role', 'subordinate': 'subordinate'}
     _toPy = {'application': 'application', 'name': 'name', 'role': 'role', 'subordinate': 'subordinate'}
     def __init__(self, application=None, name=None, role=None, subordinate=None, **unknown_fields):
@@ -3187,43 +6981,108 @@ class EndpointStatus(Type):
         self.name = name
         self.role = role
         self.subordinate = subordinate
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.name = data.get('name')
+        self.role = data.get('role')
+        self.subordinate = data.get('subordinate')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'name': self.name, 'role': self.role, 'subordinate': self.subordinate}
 
 
 
 class Entities(Type):
+    __slots__ = ('_entities', '_raw_entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~Entity]
         '''
-        self.entities = [Entity.from_json(o) for o in entities or []]
+        self._raw_entities = entities
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [Entity.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities}
 
 
 
 class EntitiesCharmURL(Type):
+    __slots__ = ('_entities', '_raw_entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~EntityCharmURL]
         '''
-        self.entities = [EntityCharmURL.from_json(o) for o in entities or []]
+        self._raw_entities = entities
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [EntityCharmURL.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities}
 
 
 
 class EntitiesPortRanges(Type):
+    __slots__ = ('_entities', '_raw_entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~EntityPortRange]
         '''
-        self.entities = [EntityPortRange.from_json(o) for o in entities or []]
+        self._raw_entities = entities
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [EntityPortRange.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities}
 
 
 
 class EntitiesResult(Type):
+    __slots__ = ('_entities', '_error', '_raw_entities', '_raw_error', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'error': 'error'}
     _toPy = {'entities': 'entities', 'error': 'error'}
     def __init__(self, entities=None, error=None, **unknown_fields):
@@ -3231,34 +7090,84 @@ class EntitiesResult(Type):
         entities : typing.Sequence[~Entity]
         error : Error
         '''
-        self.entities = [Entity.from_json(o) for o in entities or []]
-        self.error = Error.from_json(error) if error else None
+        self._raw_entities = entities
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [Entity.from_json(o) for o in data or []])
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities, 'error': self._raw_error}
 
 
 
 class EntitiesResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~EntitiesResult]
         '''
-        self.results = [EntitiesResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [EntitiesResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class EntitiesVersion(Type):
+    __slots__ = ('_agent_tools', '_raw_agent_tools', 'unknown_fields')
     _toSchema = {'agent_tools': 'agent-tools'}
     _toPy = {'agent-tools': 'agent_tools'}
     def __init__(self, agent_tools=None, **unknown_fields):
         '''
         agent_tools : typing.Sequence[~EntityVersion]
         '''
-        self.agent_tools = [EntityVersion.from_json(o) for o in agent_tools or []]
+        self._raw_agent_tools = agent_tools
+        self.unknown_fields = unknown_fields
+
+    agent_tools = LazyField('agent_tools', lambda data: [EntityVersion.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_agent_tools = data.get('agent-tools')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'agent-tools': self._raw_agent_tools}
 
 
 
 class EntitiesWatchResult(Type):
+    __slots__ = ('_error', '_raw_error', 'changes', 'unknown_fields', 'watcher_id')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
@@ -3268,12 +7177,30 @@ class EntitiesWatchResult(Type):
         watcher_id : str
         '''
         self.changes = changes
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.watcher_id = watcher_id
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.changes = data.get('changes')
+        self._raw_error = data.get('error')
+        self.watcher_id = data.get('watcher-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self.changes, 'error': self._raw_error, 'watcher-id': self.watcher_id}
 
 
 
 class Entity(Type):
+    __slots__ = ('tag', 'unknown_fields')
     _toSchema = {'tag': 'tag'}
     _toPy = {'tag': 'tag'}
     def __init__(self, tag=None, **unknown_fields):
@@ -3281,10 +7208,24 @@ class Entity(Type):
         tag : str
         '''
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'tag': self.tag}
 
 
 
 class EntityAnnotations(Type):
+    __slots__ = ('annotations', 'entity', 'unknown_fields')
     _toSchema = {'annotations': 'annotations', 'entity': 'entity'}
     _toPy = {'annotations': 'annotations', 'entity': 'entity'}
     def __init__(self, annotations=None, entity=None, **unknown_fields):
@@ -3294,10 +7235,25 @@ class EntityAnnotations(Type):
         '''
         self.annotations = annotations
         self.entity = entity
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.annotations = data.get('annotations')
+        self.entity = data.get('entity')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'annotations': self.annotations, 'entity': self.entity}
 
 
 
 class EntityCharmURL(Type):
+    __slots__ = ('charm_url', 'tag', 'unknown_fields')
     _toSchema = {'charm_url': 'charm-url', 'tag': 'tag'}
     _toPy = {'charm-url': 'charm_url', 'tag': 'tag'}
     def __init__(self, charm_url=None, tag=None, **unknown_fields):
@@ -3307,10 +7263,25 @@ class EntityCharmURL(Type):
         '''
         self.charm_url = charm_url
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.charm_url = data.get('charm-url')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'charm-url': self.charm_url, 'tag': self.tag}
 
 
 
 class EntityMacaroonArg(Type):
+    __slots__ = ('_macaroon', '_raw_macaroon', 'tag', 'unknown_fields')
     _toSchema = {'macaroon': 'macaroon', 'tag': 'tag'}
     _toPy = {'macaroon': 'macaroon', 'tag': 'tag'}
     def __init__(self, macaroon=None, tag=None, **unknown_fields):
@@ -3318,23 +7289,56 @@ class EntityMacaroonArg(Type):
         macaroon : Macaroon
         tag : str
         '''
-        self.macaroon = Macaroon.from_json(macaroon) if macaroon else None
+        self._raw_macaroon = macaroon
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    macaroon = LazyField('macaroon', lambda data: Macaroon.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_macaroon = data.get('macaroon')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'macaroon': self._raw_macaroon, 'tag': self.tag}
 
 
 
 class EntityMacaroonArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~EntityMacaroonArg]
         '''
-        self.args = [EntityMacaroonArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [EntityMacaroonArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('Args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Args': self._raw_args}
 
 
 
 class EntityMetrics(Type):
+    __slots__ = ('_error', '_metrics', '_raw_error', '_raw_metrics', 'unknown_fields')
     _toSchema = {'error': 'error', 'metrics': 'metrics'}
     _toPy = {'error': 'error', 'metrics': 'metrics'}
     def __init__(self, error=None, metrics=None, **unknown_fields):
@@ -3342,12 +7346,30 @@ class EntityMetrics(Type):
         error : Error
         metrics : typing.Sequence[~MetricResult]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.metrics = [MetricResult.from_json(o) for o in metrics or []]
+        self._raw_error = error
+        self._raw_metrics = metrics
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    metrics = LazyField('metrics', lambda data: [MetricResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_metrics = data.get('metrics')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'metrics': self._raw_metrics}
 
 
 
 class EntityPassword(Type):
+    __slots__ = ('password', 'tag', 'unknown_fields')
     _toSchema = {'password': 'password', 'tag': 'tag'}
     _toPy = {'password': 'password', 'tag': 'tag'}
     def __init__(self, password=None, tag=None, **unknown_fields):
@@ -3357,21 +7379,52 @@ class EntityPassword(Type):
         '''
         self.password = password
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.password = data.get('password')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'password': self.password, 'tag': self.tag}
 
 
 
 class EntityPasswords(Type):
+    __slots__ = ('_changes', '_raw_changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~EntityPassword]
         '''
-        self.changes = [EntityPassword.from_json(o) for o in changes or []]
+        self._raw_changes = changes
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [EntityPassword.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes}
 
 
 
 class EntityPortRange(Type):
+    __slots__ = ('from_port', 'protocol', 'tag', 'to_port', 'unknown_fields')
     _toSchema = {'from_port': 'from-port', 'protocol': 'protocol', 'tag': 'tag', 'to_port': 'to-port'}
     _toPy = {'from-port': 'from_port', 'protocol': 'protocol', 'tag': 'tag', 'to-port': 'to_port'}
     def __init__(self, from_port=None, protocol=None, tag=None, to_port=None, **unknown_fields):
@@ -3385,10 +7438,27 @@ class EntityPortRange(Type):
         self.protocol = protocol
         self.tag = tag
         self.to_port = to_port
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.from_port = data.get('from-port')
+        self.protocol = data.get('protocol')
+        self.tag = data.get('tag')
+        self.to_port = data.get('to-port')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'from-port': self.from_port, 'protocol': self.protocol, 'tag': self.tag, 'to-port': self.to_port}
 
 
 
 class EntityStatus(Type):
+    __slots__ = ('data', 'info', 'since', 'status', 'unknown_fields')
     _toSchema = {'data': 'data', 'info': 'info', 'since': 'since', 'status': 'status'}
     _toPy = {'data': 'data', 'info': 'info', 'since': 'since', 'status': 'status'}
     def __init__(self, data=None, info=None, since=None, status=None, **unknown_fields):
@@ -3402,10 +7472,27 @@ class EntityStatus(Type):
         self.info = info
         self.since = since
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.data = data.get('data')
+        self.info = data.get('info')
+        self.since = data.get('since')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'data': self.data, 'info': self.info, 'since': self.since, 'status': self.status}
 
 
 
 class EntityStatusArgs(Type):
+    __slots__ = ('data', 'info', 'status', 'tag', 'unknown_fields')
     _toSchema = {'data': 'data', 'info': 'info', 'status': 'status', 'tag': 'tag'}
     _toPy = {'data': 'data', 'info': 'info', 'status': 'status', 'tag': 'tag'}
     def __init__(self, data=None, info=None, status=None, tag=None, **unknown_fields):
@@ -3419,10 +7506,27 @@ class EntityStatusArgs(Type):
         self.info = info
         self.status = status
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.data = data.get('data')
+        self.info = data.get('info')
+        self.status = data.get('status')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'data': self.data, 'info': self.info, 'status': self.status, 'tag': self.tag}
 
 
 
 class EntityString(Type):
+    __slots__ = ('tag', 'unknown_fields', 'value')
     _toSchema = {'tag': 'tag', 'value': 'value'}
     _toPy = {'tag': 'tag', 'value': 'value'}
     def __init__(self, tag=None, value=None, **unknown_fields):
@@ -3432,10 +7536,25 @@ class EntityString(Type):
         '''
         self.tag = tag
         self.value = value
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.tag = data.get('tag')
+        self.value = data.get('value')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'tag': self.tag, 'value': self.value}
 
 
 
 class EntityVersion(Type):
+    __slots__ = ('_raw_tools', '_tools', 'tag', 'unknown_fields')
     _toSchema = {'tag': 'tag', 'tools': 'tools'}
     _toPy = {'tag': 'tag', 'tools': 'tools'}
     def __init__(self, tag=None, tools=None, **unknown_fields):
@@ -3444,11 +7563,28 @@ class EntityVersion(Type):
         tools : Version
         '''
         self.tag = tag
-        self.tools = Version.from_json(tools) if tools else None
+        self._raw_tools = tools
+        self.unknown_fields = unknown_fields
+
+    tools = LazyField('tools', lambda data: Version.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.tag = data.get('tag')
+        self._raw_tools = data.get('tools')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'tag': self.tag, 'tools': self._raw_tools}
 
 
 
 class EntityWorkloadVersion(Type):
+    __slots__ = ('tag', 'unknown_fields', 'workload_version')
     _toSchema = {'tag': 'tag', 'workload_version': 'workload-version'}
     _toPy = {'tag': 'tag', 'workload-version': 'workload_version'}
     def __init__(self, tag=None, workload_version=None, **unknown_fields):
@@ -3458,21 +7594,52 @@ class EntityWorkloadVersion(Type):
         '''
         self.tag = tag
         self.workload_version = workload_version
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.tag = data.get('tag')
+        self.workload_version = data.get('workload-version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'tag': self.tag, 'workload-version': self.workload_version}
 
 
 
 class EntityWorkloadVersions(Type):
+    __slots__ = ('_entities', '_raw_entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~EntityWorkloadVersion]
         '''
-        self.entities = [EntityWorkloadVersion.from_json(o) for o in entities or []]
+        self._raw_entities = entities
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [EntityWorkloadVersion.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities}
 
 
 
 class EnvListArgs(Type):
+    __slots__ = ('patterns', 'unknown_fields')
     _toSchema = {'patterns': 'patterns'}
     _toPy = {'patterns': 'patterns'}
     def __init__(self, patterns=None, **unknown_fields):
@@ -3480,21 +7647,51 @@ class EnvListArgs(Type):
         patterns : typing.Sequence[str]
         '''
         self.patterns = patterns
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.patterns = data.get('patterns')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'patterns': self.patterns}
 
 
 
 class EnvListResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~Payload]
         '''
-        self.results = [Payload.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [Payload.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Error(Type):
+    __slots__ = ('_info', '_raw_info', 'code', 'message', 'unknown_fields')
     _toSchema = {'code': 'code', 'info': 'info', 'message': 'message'}
     _toPy = {'code': 'code', 'info': 'info', 'message': 'message'}
     def __init__(self, code=None, info=None, message=None, **unknown_fields):
@@ -3504,12 +7701,30 @@ class Error(Type):
         message : str
         '''
         self.code = code
-        self.info = ErrorInfo.from_json(info) if info else None
+        self._raw_info = info
         self.message = message
+        self.unknown_fields = unknown_fields
+
+    info = LazyField('info', lambda data: ErrorInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.code = data.get('code')
+        self._raw_info = data.get('info')
+        self.message = data.get('message')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'code': self.code, 'info': self._raw_info, 'message': self.message}
 
 
 
 class ErrorInfo(Type):
+    __slots__ = ('_macaroon', '_raw_macaroon', 'macaroon_path', 'unknown_fields')
     _toSchema = {'macaroon': 'macaroon', 'macaroon_path': 'macaroon-path'}
     _toPy = {'macaroon': 'macaroon', 'macaroon-path': 'macaroon_path'}
     def __init__(self, macaroon=None, macaroon_path=None, **unknown_fields):
@@ -3517,34 +7732,83 @@ class ErrorInfo(Type):
         macaroon : Macaroon
         macaroon_path : str
         '''
-        self.macaroon = Macaroon.from_json(macaroon) if macaroon else None
+        self._raw_macaroon = macaroon
         self.macaroon_path = macaroon_path
+        self.unknown_fields = unknown_fields
+
+    macaroon = LazyField('macaroon', lambda data: Macaroon.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_macaroon = data.get('macaroon')
+        self.macaroon_path = data.get('macaroon-path')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'macaroon': self._raw_macaroon, 'macaroon-path': self.macaroon_path}
 
 
 
 class ErrorResult(Type):
+    __slots__ = ('_error', '_raw_error', 'unknown_fields')
     _toSchema = {'error': 'error'}
     _toPy = {'error': 'error'}
     def __init__(self, error=None, **unknown_fields):
         '''
         error : Error
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error}
 
 
 
 class ErrorResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ErrorResult]
         '''
-        self.results = [ErrorResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ErrorResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ExternalControllerInfo(Type):
+    __slots__ = ('addrs', 'ca_cert', 'controller_alias', 'controller_tag', 'unknown_fields')
     _toSchema = {'addrs': 'addrs', 'ca_cert': 'ca-cert', 'controller_alias': 'controller-alias', 'controller_tag': 'controller-tag'}
     _toPy = {'addrs': 'addrs', 'ca-cert': 'ca_cert', 'controller-alias': 'controller_alias', 'controller-tag': 'controller_tag'}
     def __init__(self, addrs=None, ca_cert=None, controller_alias=None, controller_tag=None, **unknown_fields):
@@ -3558,10 +7822,27 @@ class ExternalControllerInfo(Type):
         self.ca_cert = ca_cert
         self.controller_alias = controller_alias
         self.controller_tag = controller_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.addrs = data.get('addrs')
+        self.ca_cert = data.get('ca-cert')
+        self.controller_alias = data.get('controller-alias')
+        self.controller_tag = data.get('controller-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'addrs': self.addrs, 'ca-cert': self.ca_cert, 'controller-alias': self.controller_alias, 'controller-tag': self.controller_tag}
 
 
 
 class ExternalControllerInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -3569,23 +7850,57 @@ class ExternalControllerInfoResult(Type):
         error : Error
         result : ExternalControllerInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ExternalControllerInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ExternalControllerInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ExternalControllerInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ExternalControllerInfoResult]
         '''
-        self.results = [ExternalControllerInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ExternalControllerInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class FanConfigEntry(Type):
+    __slots__ = ('overlay', 'underlay', 'unknown_fields')
     _toSchema = {'overlay': 'overlay', 'underlay': 'underlay'}
     _toPy = {'overlay': 'overlay', 'underlay': 'underlay'}
     def __init__(self, overlay=None, underlay=None, **unknown_fields):
@@ -3595,21 +7910,52 @@ class FanConfigEntry(Type):
         '''
         self.overlay = overlay
         self.underlay = underlay
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.overlay = data.get('overlay')
+        self.underlay = data.get('underlay')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'overlay': self.overlay, 'underlay': self.underlay}
 
 
 
 class FanConfigResult(Type):
+    __slots__ = ('_fans', '_raw_fans', 'unknown_fields')
     _toSchema = {'fans': 'fans'}
     _toPy = {'fans': 'fans'}
     def __init__(self, fans=None, **unknown_fields):
         '''
         fans : typing.Sequence[~FanConfigEntry]
         '''
-        self.fans = [FanConfigEntry.from_json(o) for o in fans or []]
+        self._raw_fans = fans
+        self.unknown_fields = unknown_fields
+
+    fans = LazyField('fans', lambda data: [FanConfigEntry.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_fans = data.get('fans')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'fans': self._raw_fans}
 
 
 
 class Filesystem(Type):
+    __slots__ = ('_info', '_raw_info', 'filesystem_tag', 'unknown_fields', 'volume_tag')
     _toSchema = {'filesystem_tag': 'filesystem-tag', 'info': 'info', 'volume_tag': 'volume-tag'}
     _toPy = {'filesystem-tag': 'filesystem_tag', 'info': 'info', 'volume-tag': 'volume_tag'}
     def __init__(self, filesystem_tag=None, info=None, volume_tag=None, **unknown_fields):
@@ -3619,12 +7965,30 @@ class Filesystem(Type):
         volume_tag : str
         '''
         self.filesystem_tag = filesystem_tag
-        self.info = FilesystemInfo.from_json(info) if info else None
+        self._raw_info = info
         self.volume_tag = volume_tag
+        self.unknown_fields = unknown_fields
+
+    info = LazyField('info', lambda data: FilesystemInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.filesystem_tag = data.get('filesystem-tag')
+        self._raw_info = data.get('info')
+        self.volume_tag = data.get('volume-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filesystem-tag': self.filesystem_tag, 'info': self._raw_info, 'volume-tag': self.volume_tag}
 
 
 
 class FilesystemAttachment(Type):
+    __slots__ = ('_info', '_raw_info', 'filesystem_tag', 'machine_tag', 'unknown_fields')
     _toSchema = {'filesystem_tag': 'filesystem-tag', 'info': 'info', 'machine_tag': 'machine-tag'}
     _toPy = {'filesystem-tag': 'filesystem_tag', 'info': 'info', 'machine-tag': 'machine_tag'}
     def __init__(self, filesystem_tag=None, info=None, machine_tag=None, **unknown_fields):
@@ -3634,12 +7998,30 @@ class FilesystemAttachment(Type):
         machine_tag : str
         '''
         self.filesystem_tag = filesystem_tag
-        self.info = FilesystemAttachmentInfo.from_json(info) if info else None
+        self._raw_info = info
         self.machine_tag = machine_tag
+        self.unknown_fields = unknown_fields
+
+    info = LazyField('info', lambda data: FilesystemAttachmentInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.filesystem_tag = data.get('filesystem-tag')
+        self._raw_info = data.get('info')
+        self.machine_tag = data.get('machine-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filesystem-tag': self.filesystem_tag, 'info': self._raw_info, 'machine-tag': self.machine_tag}
 
 
 
 class FilesystemAttachmentDetails(Type):
+    __slots__ = ('_filesystemattachmentinfo', '_raw_filesystemattachmentinfo', 'life', 'unknown_fields')
     _toSchema = {'filesystemattachmentinfo': 'FilesystemAttachmentInfo', 'life': 'life'}
     _toPy = {'FilesystemAttachmentInfo': 'filesystemattachmentinfo', 'life': 'life'}
     def __init__(self, filesystemattachmentinfo=None, life=None, **unknown_fields):
@@ -3647,12 +8029,29 @@ class FilesystemAttachmentDetails(Type):
         filesystemattachmentinfo : FilesystemAttachmentInfo
         life : str
         '''
-        self.filesystemattachmentinfo = FilesystemAttachmentInfo.from_json(filesystemattachmentinfo) if filesystemattachmentinfo else None
+        self._raw_filesystemattachmentinfo = filesystemattachmentinfo
         self.life = life
+        self.unknown_fields = unknown_fields
+
+    filesystemattachmentinfo = LazyField('filesystemattachmentinfo', lambda data: FilesystemAttachmentInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_filesystemattachmentinfo = data.get('FilesystemAttachmentInfo')
+        self.life = data.get('life')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'FilesystemAttachmentInfo': self._raw_filesystemattachmentinfo, 'life': self.life}
 
 
 
 class FilesystemAttachmentInfo(Type):
+    __slots__ = ('mount_point', 'read_only', 'unknown_fields')
     _toSchema = {'mount_point': 'mount-point', 'read_only': 'read-only'}
     _toPy = {'mount-point': 'mount_point', 'read-only': 'read_only'}
     def __init__(self, mount_point=None, read_only=None, **unknown_fields):
@@ -3662,10 +8061,25 @@ class FilesystemAttachmentInfo(Type):
         '''
         self.mount_point = mount_point
         self.read_only = read_only
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.mount_point = data.get('mount-point')
+        self.read_only = data.get('read-only')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'mount-point': self.mount_point, 'read-only': self.read_only}
 
 
 
 class FilesystemAttachmentParams(Type):
+    __slots__ = ('filesystem_id', 'filesystem_tag', 'instance_id', 'machine_tag', 'mount_point', 'provider', 'read_only', 'unknown_fields')
     _toSchema = {'filesystem_id': 'filesystem-id', 'filesystem_tag': 'filesystem-tag', 'instance_id': 'instance-id', 'machine_tag': 'machine-tag', 'mount_point': 'mount-point', 'provider': 'provider', 'read_only': 'read-only'}
     _toPy = {'filesystem-id': 'filesystem_id', 'filesystem-tag': 'filesystem_tag', 'instance-id': 'instance_id', 'machine-tag': 'machine_tag', 'mount-point': 'mount_point', 'provider': 'provider', 'read-only': 'read_only'}
     def __init__(self, filesystem_id=None, filesystem_tag=None, instance_id=None, machine_tag=None, mount_point=None, provider=None, read_only=None, **unknown_fields):
@@ -3685,10 +8099,30 @@ class FilesystemAttachmentParams(Type):
         self.mount_point = mount_point
         self.provider = provider
         self.read_only = read_only
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.filesystem_id = data.get('filesystem-id')
+        self.filesystem_tag = data.get('filesystem-tag')
+        self.instance_id = data.get('instance-id')
+        self.machine_tag = data.get('machine-tag')
+        self.mount_point = data.get('mount-point')
+        self.provider = data.get('provider')
+        self.read_only = data.get('read-only')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filesystem-id': self.filesystem_id, 'filesystem-tag': self.filesystem_tag, 'instance-id': self.instance_id, 'machine-tag': self.machine_tag, 'mount-point': self.mount_point, 'provider': self.provider, 'read-only': self.read_only}
 
 
 
 class FilesystemAttachmentParamsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -3696,23 +8130,57 @@ class FilesystemAttachmentParamsResult(Type):
         error : Error
         result : FilesystemAttachmentParams
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = FilesystemAttachmentParams.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: FilesystemAttachmentParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class FilesystemAttachmentParamsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemAttachmentParamsResult]
         '''
-        self.results = [FilesystemAttachmentParamsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [FilesystemAttachmentParamsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class FilesystemAttachmentResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -3720,34 +8188,84 @@ class FilesystemAttachmentResult(Type):
         error : Error
         result : FilesystemAttachment
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = FilesystemAttachment.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: FilesystemAttachment.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class FilesystemAttachmentResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemAttachmentResult]
         '''
-        self.results = [FilesystemAttachmentResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [FilesystemAttachmentResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class FilesystemAttachments(Type):
+    __slots__ = ('_filesystem_attachments', '_raw_filesystem_attachments', 'unknown_fields')
     _toSchema = {'filesystem_attachments': 'filesystem-attachments'}
     _toPy = {'filesystem-attachments': 'filesystem_attachments'}
     def __init__(self, filesystem_attachments=None, **unknown_fields):
         '''
         filesystem_attachments : typing.Sequence[~FilesystemAttachment]
         '''
-        self.filesystem_attachments = [FilesystemAttachment.from_json(o) for o in filesystem_attachments or []]
+        self._raw_filesystem_attachments = filesystem_attachments
+        self.unknown_fields = unknown_fields
+
+    filesystem_attachments = LazyField('filesystem_attachments', lambda data: [FilesystemAttachment.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_filesystem_attachments = data.get('filesystem-attachments')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filesystem-attachments': self._raw_filesystem_attachments}
 
 
 
 class FilesystemDetails(Type):
+    __slots__ = ('_info', '_raw_info', '_raw_status', '_raw_storage', '_status', '_storage', 'filesystem_tag', 'machine_attachments', 'unknown_fields', 'volume_tag')
     _toSchema = {'filesystem_tag': 'filesystem-tag', 'info': 'info', 'machine_attachments': 'machine-attachments', 'status': 'status', 'storage': 'storage', 'volume_tag': 'volume-tag'}
     _toPy = {'filesystem-tag': 'filesystem_tag', 'info': 'info', 'machine-attachments': 'machine_attachments', 'status': 'status', 'storage': 'storage', 'volume-tag': 'volume_tag'}
     def __init__(self, filesystem_tag=None, info=None, machine_attachments=None, status=None, storage=None, volume_tag=None, **unknown_fields):
@@ -3760,15 +8278,38 @@ class FilesystemDetails(Type):
         volume_tag : str
         '''
         self.filesystem_tag = filesystem_tag
-        self.info = FilesystemInfo.from_json(info) if info else None
+        self._raw_info = info
         self.machine_attachments = machine_attachments
-        self.status = EntityStatus.from_json(status) if status else None
-        self.storage = StorageDetails.from_json(storage) if storage else None
+        self._raw_status = status
+        self._raw_storage = storage
         self.volume_tag = volume_tag
+        self.unknown_fields = unknown_fields
+
+    info = LazyField('info', lambda data: FilesystemInfo.from_json(data) if data else None)
+    status = LazyField('status', lambda data: EntityStatus.from_json(data) if data else None)
+    storage = LazyField('storage', lambda data: StorageDetails.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.filesystem_tag = data.get('filesystem-tag')
+        self._raw_info = data.get('info')
+        self.machine_attachments = data.get('machine-attachments')
+        self._raw_status = data.get('status')
+        self._raw_storage = data.get('storage')
+        self.volume_tag = data.get('volume-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filesystem-tag': self.filesystem_tag, 'info': self._raw_info, 'machine-attachments': self.machine_attachments, 'status': self._raw_status, 'storage': self._raw_storage, 'volume-tag': self.volume_tag}
 
 
 
 class FilesystemDetailsListResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -3776,23 +8317,57 @@ class FilesystemDetailsListResult(Type):
         error : Error
         result : typing.Sequence[~FilesystemDetails]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = [FilesystemDetails.from_json(o) for o in result or []]
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: [FilesystemDetails.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class FilesystemDetailsListResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemDetailsListResult]
         '''
-        self.results = [FilesystemDetailsListResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [FilesystemDetailsListResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class FilesystemFilter(Type):
+    __slots__ = ('machines', 'unknown_fields')
     _toSchema = {'machines': 'machines'}
     _toPy = {'machines': 'machines'}
     def __init__(self, machines=None, **unknown_fields):
@@ -3800,21 +8375,51 @@ class FilesystemFilter(Type):
         machines : typing.Sequence[str]
         '''
         self.machines = machines
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.machines = data.get('machines')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'machines': self.machines}
 
 
 
 class FilesystemFilters(Type):
+    __slots__ = ('_filters', '_raw_filters', 'unknown_fields')
     _toSchema = {'filters': 'filters'}
     _toPy = {'filters': 'filters'}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~FilesystemFilter]
         '''
-        self.filters = [FilesystemFilter.from_json(o) for o in filters or []]
+        self._raw_filters = filters
+        self.unknown_fields = unknown_fields
+
+    filters = LazyField('filters', lambda data: [FilesystemFilter.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_filters = data.get('filters')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filters': self._raw_filters}
 
 
 
 class FilesystemInfo(Type):
+    __slots__ = ('filesystem_id', 'size', 'unknown_fields')
     _toSchema = {'filesystem_id': 'filesystem-id', 'size': 'size'}
     _toPy = {'filesystem-id': 'filesystem_id', 'size': 'size'}
     def __init__(self, filesystem_id=None, size=None, **unknown_fields):
@@ -3824,10 +8429,25 @@ class FilesystemInfo(Type):
         '''
         self.filesystem_id = filesystem_id
         self.size = size
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.filesystem_id = data.get('filesystem-id')
+        self.size = data.get('size')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filesystem-id': self.filesystem_id, 'size': self.size}
 
 
 
 class FilesystemParams(Type):
+    __slots__ = ('_attachment', '_raw_attachment', 'attributes', 'filesystem_tag', 'provider', 'size', 'tags', 'unknown_fields', 'volume_tag')
     _toSchema = {'attachment': 'attachment', 'attributes': 'attributes', 'filesystem_tag': 'filesystem-tag', 'provider': 'provider', 'size': 'size', 'tags': 'tags', 'volume_tag': 'volume-tag'}
     _toPy = {'attachment': 'attachment', 'attributes': 'attributes', 'filesystem-tag': 'filesystem_tag', 'provider': 'provider', 'size': 'size', 'tags': 'tags', 'volume-tag': 'volume_tag'}
     def __init__(self, attachment=None, attributes=None, filesystem_tag=None, provider=None, size=None, tags=None, volume_tag=None, **unknown_fields):
@@ -3840,17 +8460,39 @@ class FilesystemParams(Type):
         tags : typing.Mapping[str, str]
         volume_tag : str
         '''
-        self.attachment = FilesystemAttachmentParams.from_json(attachment) if attachment else None
+        self._raw_attachment = attachment
         self.attributes = attributes
         self.filesystem_tag = filesystem_tag
         self.provider = provider
         self.size = size
         self.tags = tags
         self.volume_tag = volume_tag
+        self.unknown_fields = unknown_fields
+
+    attachment = LazyField('attachment', lambda data: FilesystemAttachmentParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_attachment = data.get('attachment')
+        self.attributes = data.get('attributes')
+        self.filesystem_tag = data.get('filesystem-tag')
+        self.provider = data.get('provider')
+        self.size = data.get('size')
+        self.tags = data.get('tags')
+        self.volume_tag = data.get('volume-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attachment': self._raw_attachment, 'attributes': self.attributes, 'filesystem-tag': self.filesystem_tag, 'provider': self.provider, 'size': self.size, 'tags': self.tags, 'volume-tag': self.volume_tag}
 
 
 
 class FilesystemParamsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -3858,23 +8500,57 @@ class FilesystemParamsResult(Type):
         error : Error
         result : FilesystemParams
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = FilesystemParams.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: FilesystemParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class FilesystemParamsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemParamsResult]
         '''
-        self.results = [FilesystemParamsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [FilesystemParamsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class FilesystemResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -3882,34 +8558,84 @@ class FilesystemResult(Type):
         error : Error
         result : Filesystem
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = Filesystem.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: Filesystem.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class FilesystemResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemResult]
         '''
-        self.results = [FilesystemResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [FilesystemResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Filesystems(Type):
+    __slots__ = ('_filesystems', '_raw_filesystems', 'unknown_fields')
     _toSchema = {'filesystems': 'filesystems'}
     _toPy = {'filesystems': 'filesystems'}
     def __init__(self, filesystems=None, **unknown_fields):
         '''
         filesystems : typing.Sequence[~Filesystem]
         '''
-        self.filesystems = [Filesystem.from_json(o) for o in filesystems or []]
+        self._raw_filesystems = filesystems
+        self.unknown_fields = unknown_fields
+
+    filesystems = LazyField('filesystems', lambda data: [Filesystem.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_filesystems = data.get('filesystems')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filesystems': self._raw_filesystems}
 
 
 
 class FindActionsByNames(Type):
+    __slots__ = ('names', 'unknown_fields')
     _toSchema = {'names': 'names'}
     _toPy = {'names': 'names'}
     def __init__(self, names=None, **unknown_fields):
@@ -3917,10 +8643,24 @@ class FindActionsByNames(Type):
         names : typing.Sequence[str]
         '''
         self.names = names
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.names = data.get('names')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'names': self.names}
 
 
 
 class FindTags(Type):
+    __slots__ = ('prefixes', 'unknown_fields')
     _toSchema = {'prefixes': 'prefixes'}
     _toPy = {'prefixes': 'prefixes'}
     def __init__(self, prefixes=None, **unknown_fields):
@@ -3928,21 +8668,51 @@ class FindTags(Type):
         prefixes : typing.Sequence[str]
         '''
         self.prefixes = prefixes
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.prefixes = data.get('prefixes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'prefixes': self.prefixes}
 
 
 
 class FindTagsResults(Type):
+    __slots__ = ('_matches', '_raw_matches', 'unknown_fields')
     _toSchema = {'matches': 'matches'}
     _toPy = {'matches': 'matches'}
     def __init__(self, matches=None, **unknown_fields):
         '''
         matches : typing.Sequence[~Entity]
         '''
-        self.matches = [Entity.from_json(o) for o in matches or []]
+        self._raw_matches = matches
+        self.unknown_fields = unknown_fields
+
+    matches = LazyField('matches', lambda data: [Entity.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_matches = data.get('matches')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'matches': self._raw_matches}
 
 
 
 class FindToolsParams(Type):
+    __slots__ = ('_number', '_raw_number', 'arch', 'major', 'minor', 'series', 'unknown_fields')
     _toSchema = {'arch': 'arch', 'major': 'major', 'minor': 'minor', 'number': 'number', 'series': 'series'}
     _toPy = {'arch': 'arch', 'major': 'major', 'minor': 'minor', 'number': 'number', 'series': 'series'}
     def __init__(self, arch=None, major=None, minor=None, number=None, series=None, **unknown_fields):
@@ -3956,12 +8726,32 @@ class FindToolsParams(Type):
         self.arch = arch
         self.major = major
         self.minor = minor
-        self.number = Number.from_json(number) if number else None
+        self._raw_number = number
         self.series = series
+        self.unknown_fields = unknown_fields
+
+    number = LazyField('number', lambda data: Number.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arch = data.get('arch')
+        self.major = data.get('major')
+        self.minor = data.get('minor')
+        self._raw_number = data.get('number')
+        self.series = data.get('series')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'arch': self.arch, 'major': self.major, 'minor': self.minor, 'number': self._raw_number, 'series': self.series}
 
 
 
 class FindToolsResult(Type):
+    __slots__ = ('_error', '_list_', '_raw_error', '_raw_list_', 'unknown_fields')
     _toSchema = {'error': 'error', 'list_': 'list'}
     _toPy = {'error': 'error', 'list': 'list_'}
     def __init__(self, error=None, list_=None, **unknown_fields):
@@ -3969,12 +8759,30 @@ class FindToolsResult(Type):
         error : Error
         list_ : typing.Sequence[~Tools]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.list_ = [Tools.from_json(o) for o in list_ or []]
+        self._raw_error = error
+        self._raw_list_ = list_
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    list_ = LazyField('list_', lambda data: [Tools.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_list_ = data.get('list')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'list': self._raw_list_}
 
 
 
 class FirewallRule(Type):
+    __slots__ = ('known_service', 'unknown_fields', 'whitelist_cidrs')
     _toSchema = {'known_service': 'known-service', 'whitelist_cidrs': 'whitelist-cidrs'}
     _toPy = {'known-service': 'known_service', 'whitelist-cidrs': 'whitelist_cidrs'}
     def __init__(self, known_service=None, whitelist_cidrs=None, **unknown_fields):
@@ -3984,21 +8792,52 @@ class FirewallRule(Type):
         '''
         self.known_service = known_service
         self.whitelist_cidrs = whitelist_cidrs
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.known_service = data.get('known-service')
+        self.whitelist_cidrs = data.get('whitelist-cidrs')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'known-service': self.known_service, 'whitelist-cidrs': self.whitelist_cidrs}
 
 
 
 class FirewallRuleArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~FirewallRule]
         '''
-        self.args = [FirewallRule.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [FirewallRule.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class FullStatus(Type):
+    __slots__ = ('_model', '_raw_model', '_raw_relations', '_relations', 'applications', 'controller_timestamp', 'machines', 'offers', 'remote_applications', 'unknown_fields')
     _toSchema = {'applications': 'applications', 'controller_timestamp': 'controller-timestamp', 'machines': 'machines', 'model': 'model', 'offers': 'offers', 'relations': 'relations', 'remote_applications': 'remote-applications'}
     _toPy = {'applications': 'applications', 'controller-timestamp': 'controller_timestamp', 'machines': 'machines', 'model': 'model', 'offers': 'offers', 'relations': 'relations', 'remote-applications': 'remote_applications'}
     def __init__(self, applications=None, controller_timestamp=None, machines=None, model=None, offers=None, relations=None, remote_applications=None, **unknown_fields):
@@ -4014,14 +8853,37 @@ class FullStatus(Type):
         self.applications = applications
         self.controller_timestamp = controller_timestamp
         self.machines = machines
-        self.model = ModelStatusInfo.from_json(model) if model else None
+        self._raw_model = model
         self.offers = offers
-        self.relations = [RelationStatus.from_json(o) for o in relations or []]
+        self._raw_relations = relations
         self.remote_applications = remote_applications
+        self.unknown_fields = unknown_fields
+
+    model = LazyField('model', lambda data: ModelStatusInfo.from_json(data) if data else None)
+    relations = LazyField('relations', lambda data: [RelationStatus.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.applications = data.get('applications')
+        self.controller_timestamp = data.get('controller-timestamp')
+        self.machines = data.get('machines')
+        self._raw_model = data.get('model')
+        self.offers = data.get('offers')
+        self._raw_relations = data.get('relations')
+        self.remote_applications = data.get('remote-applications')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'applications': self.applications, 'controller-timestamp': self.controller_timestamp, 'machines': self.machines, 'model': self._raw_model, 'offers': self.offers, 'relations': self._raw_relations, 'remote-applications': self.remote_applications}
 
 
 
 class GetApplicationConstraints(Type):
+    __slots__ = ('application', 'unknown_fields')
     _toSchema = {'application': 'application'}
     _toPy = {'application': 'application'}
     def __init__(self, application=None, **unknown_fields):
@@ -4029,32 +8891,78 @@ class GetApplicationConstraints(Type):
         application : str
         '''
         self.application = application
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application}
 
 
 
 class GetConstraintsResults(Type):
+    __slots__ = ('_constraints', '_raw_constraints', 'unknown_fields')
     _toSchema = {'constraints': 'constraints'}
     _toPy = {'constraints': 'constraints'}
     def __init__(self, constraints=None, **unknown_fields):
         '''
         constraints : Value
         '''
-        self.constraints = Value.from_json(constraints) if constraints else None
+        self._raw_constraints = constraints
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_constraints = data.get('constraints')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'constraints': self._raw_constraints}
 
 
 
 class GetLeadershipSettingsBulkResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~GetLeadershipSettingsResult]
         '''
-        self.results = [GetLeadershipSettingsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [GetLeadershipSettingsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class GetLeadershipSettingsResult(Type):
+    __slots__ = ('_error', '_raw_error', 'settings', 'unknown_fields')
     _toSchema = {'error': 'error', 'settings': 'settings'}
     _toPy = {'error': 'error', 'settings': 'settings'}
     def __init__(self, error=None, settings=None, **unknown_fields):
@@ -4062,12 +8970,29 @@ class GetLeadershipSettingsResult(Type):
         error : Error
         settings : typing.Mapping[str, str]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.settings = settings
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.settings = data.get('settings')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'settings': self.settings}
 
 
 
 class GetTokenArg(Type):
+    __slots__ = ('tag', 'unknown_fields')
     _toSchema = {'tag': 'tag'}
     _toPy = {'tag': 'tag'}
     def __init__(self, tag=None, **unknown_fields):
@@ -4075,21 +9000,51 @@ class GetTokenArg(Type):
         tag : str
         '''
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'tag': self.tag}
 
 
 
 class GetTokenArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~GetTokenArg]
         '''
-        self.args = [GetTokenArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [GetTokenArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('Args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Args': self._raw_args}
 
 
 
 class GoalState(Type):
+    __slots__ = ('relations', 'units', 'unknown_fields')
     _toSchema = {'relations': 'relations', 'units': 'units'}
     _toPy = {'relations': 'relations', 'units': 'units'}
     def __init__(self, relations=None, units=None, **unknown_fields):
@@ -4099,10 +9054,25 @@ class GoalState(Type):
         '''
         self.relations = relations
         self.units = units
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.relations = data.get('relations')
+        self.units = data.get('units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'relations': self.relations, 'units': self.units}
 
 
 
 class GoalStateResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -4110,23 +9080,57 @@ class GoalStateResult(Type):
         error : Error
         result : GoalState
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = GoalState.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: GoalState.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class GoalStateResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~GoalStateResult]
         '''
-        self.results = [GoalStateResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [GoalStateResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class GoalStateStatus(Type):
+    __slots__ = ('since', 'status', 'unknown_fields')
     _toSchema = {'since': 'since', 'status': 'status'}
     _toPy = {'since': 'since', 'status': 'status'}
     def __init__(self, since=None, status=None, **unknown_fields):
@@ -4136,10 +9140,25 @@ class GoalStateStatus(Type):
         '''
         self.since = since
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.since = data.get('since')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'since': self.since, 'status': self.status}
 
 
 
 class HAMember(Type):
+    __slots__ = ('_public_address', '_raw_public_address', 'series', 'tag', 'unknown_fields')
     _toSchema = {'public_address': 'public-address', 'series': 'series', 'tag': 'tag'}
     _toPy = {'public-address': 'public_address', 'series': 'series', 'tag': 'tag'}
     def __init__(self, public_address=None, series=None, tag=None, **unknown_fields):
@@ -4148,13 +9167,31 @@ class HAMember(Type):
         series : str
         tag : str
         '''
-        self.public_address = Address.from_json(public_address) if public_address else None
+        self._raw_public_address = public_address
         self.series = series
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    public_address = LazyField('public_address', lambda data: Address.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_public_address = data.get('public-address')
+        self.series = data.get('series')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'public-address': self._raw_public_address, 'series': self.series, 'tag': self.tag}
 
 
 
 class HardwareCharacteristics(Type):
+    __slots__ = ('arch', 'availability_zone', 'cpu_cores', 'cpu_power', 'mem', 'root_disk', 'tags', 'unknown_fields')
     _toSchema = {'arch': 'arch', 'availability_zone': 'availability-zone', 'cpu_cores': 'cpu-cores', 'cpu_power': 'cpu-power', 'mem': 'mem', 'root_disk': 'root-disk', 'tags': 'tags'}
     _toPy = {'arch': 'arch', 'availability-zone': 'availability_zone', 'cpu-cores': 'cpu_cores', 'cpu-power': 'cpu_power', 'mem': 'mem', 'root-disk': 'root_disk', 'tags': 'tags'}
     def __init__(self, arch=None, availability_zone=None, cpu_cores=None, cpu_power=None, mem=None, root_disk=None, tags=None, **unknown_fields):
@@ -4174,10 +9211,30 @@ class HardwareCharacteristics(Type):
         self.mem = mem
         self.root_disk = root_disk
         self.tags = tags
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arch = data.get('arch')
+        self.availability_zone = data.get('availability-zone')
+        self.cpu_cores = data.get('cpu-cores')
+        self.cpu_power = data.get('cpu-power')
+        self.mem = data.get('mem')
+        self.root_disk = data.get('root-disk')
+        self.tags = data.get('tags')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'arch': self.arch, 'availability-zone': self.availability_zone, 'cpu-cores': self.cpu_cores, 'cpu-power': self.cpu_power, 'mem': self.mem, 'root-disk': self.root_disk, 'tags': self.tags}
 
 
 
 class History(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_statuses', '_statuses', 'unknown_fields')
     _toSchema = {'error': 'error', 'statuses': 'statuses'}
     _toPy = {'error': 'error', 'statuses': 'statuses'}
     def __init__(self, error=None, statuses=None, **unknown_fields):
@@ -4185,12 +9242,30 @@ class History(Type):
         error : Error
         statuses : typing.Sequence[~DetailedStatus]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.statuses = [DetailedStatus.from_json(o) for o in statuses or []]
+        self._raw_error = error
+        self._raw_statuses = statuses
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    statuses = LazyField('statuses', lambda data: [DetailedStatus.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_statuses = data.get('statuses')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'statuses': self._raw_statuses}
 
 
 
 class HostNetworkChange(Type):
+    __slots__ = ('_error', '_new_bridges', '_raw_error', '_raw_new_bridges', 'reconfigure_delay', 'unknown_fields')
     _toSchema = {'error': 'error', 'new_bridges': 'new-bridges', 'reconfigure_delay': 'reconfigure-delay'}
     _toPy = {'error': 'error', 'new-bridges': 'new_bridges', 'reconfigure-delay': 'reconfigure_delay'}
     def __init__(self, error=None, new_bridges=None, reconfigure_delay=None, **unknown_fields):
@@ -4199,37 +9274,89 @@ class HostNetworkChange(Type):
         new_bridges : typing.Sequence[~DeviceBridgeInfo]
         reconfigure_delay : int
         '''
-        self.error = Error.from_json(error) if error else None
-        self.new_bridges = [DeviceBridgeInfo.from_json(o) for o in new_bridges or []]
+        self._raw_error = error
+        self._raw_new_bridges = new_bridges
         self.reconfigure_delay = reconfigure_delay
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    new_bridges = LazyField('new_bridges', lambda data: [DeviceBridgeInfo.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_new_bridges = data.get('new-bridges')
+        self.reconfigure_delay = data.get('reconfigure-delay')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'new-bridges': self._raw_new_bridges, 'reconfigure-delay': self.reconfigure_delay}
 
 
 
 class HostNetworkChangeResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~HostNetworkChange]
         '''
-        self.results = [HostNetworkChange.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
 
+    results = LazyField('results', lambda data: [HostNetworkChange.from_json(o) for o in data or []])
 
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
 
-class HostPort(Type):
-    _toSchema = {'address': 'Address', 'port': 'port'}
+    def serialize(self):
+        return {'results': self._raw_results}
+
+
+
+class HostPort(Type):
+    __slots__ = ('_address', '_raw_address', 'port', 'unknown_fields')
+    _toSchema = {'address': 'Address', 'port': 'port'}
     _toPy = {'Address': 'address', 'port': 'port'}
     def __init__(self, address=None, port=None, **unknown_fields):
         '''
         address : Address
         port : int
         '''
-        self.address = Address.from_json(address) if address else None
+        self._raw_address = address
         self.port = port
+        self.unknown_fields = unknown_fields
+
+    address = LazyField('address', lambda data: Address.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_address = data.get('Address')
+        self.port = data.get('port')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Address': self._raw_address, 'port': self.port}
 
 
 
 class HostedModelConfig(Type):
+    __slots__ = ('_cloud_spec', '_error', '_raw_cloud_spec', '_raw_error', 'config', 'name', 'owner', 'unknown_fields')
     _toSchema = {'cloud_spec': 'cloud-spec', 'config': 'config', 'error': 'error', 'name': 'name', 'owner': 'owner'}
     _toPy = {'cloud-spec': 'cloud_spec', 'config': 'config', 'error': 'error', 'name': 'name', 'owner': 'owner'}
     def __init__(self, cloud_spec=None, config=None, error=None, name=None, owner=None, **unknown_fields):
@@ -4240,37 +9367,90 @@ class HostedModelConfig(Type):
         name : str
         owner : str
         '''
-        self.cloud_spec = CloudSpec.from_json(cloud_spec) if cloud_spec else None
+        self._raw_cloud_spec = cloud_spec
         self.config = config
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.name = name
         self.owner = owner
+        self.unknown_fields = unknown_fields
+
+    cloud_spec = LazyField('cloud_spec', lambda data: CloudSpec.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_cloud_spec = data.get('cloud-spec')
+        self.config = data.get('config')
+        self._raw_error = data.get('error')
+        self.name = data.get('name')
+        self.owner = data.get('owner')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud-spec': self._raw_cloud_spec, 'config': self.config, 'error': self._raw_error, 'name': self.name, 'owner': self.owner}
 
 
 
 class HostedModelConfigsResults(Type):
+    __slots__ = ('_models', '_raw_models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~HostedModelConfig]
         '''
-        self.models = [HostedModelConfig.from_json(o) for o in models or []]
+        self._raw_models = models
+        self.unknown_fields = unknown_fields
+
+    models = LazyField('models', lambda data: [HostedModelConfig.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_models = data.get('models')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'models': self._raw_models}
 
 
 
 class ImageFilterParams(Type):
+    __slots__ = ('_images', '_raw_images', 'unknown_fields')
     _toSchema = {'images': 'images'}
     _toPy = {'images': 'images'}
     def __init__(self, images=None, **unknown_fields):
         '''
         images : typing.Sequence[~ImageSpec]
         '''
-        self.images = [ImageSpec.from_json(o) for o in images or []]
+        self._raw_images = images
+        self.unknown_fields = unknown_fields
+
+    images = LazyField('images', lambda data: [ImageSpec.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_images = data.get('images')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'images': self._raw_images}
 
 
 
 class ImageMetadata(Type):
+    __slots__ = ('arch', 'created', 'kind', 'series', 'unknown_fields', 'url')
     _toSchema = {'arch': 'arch', 'created': 'created', 'kind': 'kind', 'series': 'series', 'url': 'url'}
     _toPy = {'arch': 'arch', 'created': 'created', 'kind': 'kind', 'series': 'series', 'url': 'url'}
     def __init__(self, arch=None, created=None, kind=None, series=None, url=None, **unknown_fields):
@@ -4286,10 +9466,28 @@ class ImageMetadata(Type):
         self.kind = kind
         self.series = series
         self.url = url
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arch = data.get('arch')
+        self.created = data.get('created')
+        self.kind = data.get('kind')
+        self.series = data.get('series')
+        self.url = data.get('url')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'arch': self.arch, 'created': self.created, 'kind': self.kind, 'series': self.series, 'url': self.url}
 
 
 
 class ImageMetadataFilter(Type):
+    __slots__ = ('arches', 'region', 'root_storage_type', 'series', 'stream', 'unknown_fields', 'virt_type')
     _toSchema = {'arches': 'arches', 'region': 'region', 'root_storage_type': 'root-storage-type', 'series': 'series', 'stream': 'stream', 'virt_type': 'virt-type'}
     _toPy = {'arches': 'arches', 'region': 'region', 'root-storage-type': 'root_storage_type', 'series': 'series', 'stream': 'stream', 'virt-type': 'virt_type'}
     def __init__(self, arches=None, region=None, root_storage_type=None, series=None, stream=None, virt_type=None, **unknown_fields):
@@ -4307,10 +9505,29 @@ class ImageMetadataFilter(Type):
         self.series = series
         self.stream = stream
         self.virt_type = virt_type
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arches = data.get('arches')
+        self.region = data.get('region')
+        self.root_storage_type = data.get('root-storage-type')
+        self.series = data.get('series')
+        self.stream = data.get('stream')
+        self.virt_type = data.get('virt-type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'arches': self.arches, 'region': self.region, 'root-storage-type': self.root_storage_type, 'series': self.series, 'stream': self.stream, 'virt-type': self.virt_type}
 
 
 
 class ImageSpec(Type):
+    __slots__ = ('arch', 'kind', 'series', 'unknown_fields')
     _toSchema = {'arch': 'arch', 'kind': 'kind', 'series': 'series'}
     _toPy = {'arch': 'arch', 'kind': 'kind', 'series': 'series'}
     def __init__(self, arch=None, kind=None, series=None, **unknown_fields):
@@ -4322,10 +9539,26 @@ class ImageSpec(Type):
         self.arch = arch
         self.kind = kind
         self.series = series
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arch = data.get('arch')
+        self.kind = data.get('kind')
+        self.series = data.get('series')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'arch': self.arch, 'kind': self.kind, 'series': self.series}
 
 
 
 class ImportStorageDetails(Type):
+    __slots__ = ('storage_tag', 'unknown_fields')
     _toSchema = {'storage_tag': 'storage-tag'}
     _toPy = {'storage-tag': 'storage_tag'}
     def __init__(self, storage_tag=None, **unknown_fields):
@@ -4333,10 +9566,24 @@ class ImportStorageDetails(Type):
         storage_tag : str
         '''
         self.storage_tag = storage_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.storage_tag = data.get('storage-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'storage-tag': self.storage_tag}
 
 
 
 class ImportStorageParams(Type):
+    __slots__ = ('kind', 'pool', 'provider_id', 'storage_name', 'unknown_fields')
     _toSchema = {'kind': 'kind', 'pool': 'pool', 'provider_id': 'provider-id', 'storage_name': 'storage-name'}
     _toPy = {'kind': 'kind', 'pool': 'pool', 'provider-id': 'provider_id', 'storage-name': 'storage_name'}
     def __init__(self, kind=None, pool=None, provider_id=None, storage_name=None, **unknown_fields):
@@ -4350,10 +9597,27 @@ class ImportStorageParams(Type):
         self.pool = pool
         self.provider_id = provider_id
         self.storage_name = storage_name
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.kind = data.get('kind')
+        self.pool = data.get('pool')
+        self.provider_id = data.get('provider-id')
+        self.storage_name = data.get('storage-name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'kind': self.kind, 'pool': self.pool, 'provider-id': self.provider_id, 'storage-name': self.storage_name}
 
 
 
 class ImportStorageResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -4361,23 +9625,57 @@ class ImportStorageResult(Type):
         error : Error
         result : ImportStorageDetails
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ImportStorageDetails.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ImportStorageDetails.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ImportStorageResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ImportStorageResult]
         '''
-        self.results = [ImportStorageResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ImportStorageResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class IngressNetworksChangeEvent(Type):
+    __slots__ = ('_macaroons', '_raw_macaroons', 'application_token', 'ingress_required', 'networks', 'relation_token', 'unknown_fields')
     _toSchema = {'application_token': 'application-token', 'ingress_required': 'ingress-required', 'macaroons': 'macaroons', 'networks': 'networks', 'relation_token': 'relation-token'}
     _toPy = {'application-token': 'application_token', 'ingress-required': 'ingress_required', 'macaroons': 'macaroons', 'networks': 'networks', 'relation-token': 'relation_token'}
     def __init__(self, application_token=None, ingress_required=None, macaroons=None, networks=None, relation_token=None, **unknown_fields):
@@ -4390,35 +9688,87 @@ class IngressNetworksChangeEvent(Type):
         '''
         self.application_token = application_token
         self.ingress_required = ingress_required
-        self.macaroons = [Macaroon.from_json(o) for o in macaroons or []]
+        self._raw_macaroons = macaroons
         self.networks = networks
         self.relation_token = relation_token
+        self.unknown_fields = unknown_fields
+
+    macaroons = LazyField('macaroons', lambda data: [Macaroon.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_token = data.get('application-token')
+        self.ingress_required = data.get('ingress-required')
+        self._raw_macaroons = data.get('macaroons')
+        self.networks = data.get('networks')
+        self.relation_token = data.get('relation-token')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-token': self.application_token, 'ingress-required': self.ingress_required, 'macaroons': self._raw_macaroons, 'networks': self.networks, 'relation-token': self.relation_token}
 
 
 
 class IngressNetworksChanges(Type):
+    __slots__ = ('_changes', '_raw_changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~IngressNetworksChangeEvent]
         '''
-        self.changes = [IngressNetworksChangeEvent.from_json(o) for o in changes or []]
+        self._raw_changes = changes
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [IngressNetworksChangeEvent.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes}
 
 
 
 class InitiateMigrationArgs(Type):
+    __slots__ = ('_raw_specs', '_specs', 'unknown_fields')
     _toSchema = {'specs': 'specs'}
     _toPy = {'specs': 'specs'}
     def __init__(self, specs=None, **unknown_fields):
         '''
         specs : typing.Sequence[~MigrationSpec]
         '''
-        self.specs = [MigrationSpec.from_json(o) for o in specs or []]
+        self._raw_specs = specs
+        self.unknown_fields = unknown_fields
+
+    specs = LazyField('specs', lambda data: [MigrationSpec.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_specs = data.get('specs')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'specs': self._raw_specs}
 
 
 
 class InitiateMigrationResult(Type):
+    __slots__ = ('_error', '_raw_error', 'migration_id', 'model_tag', 'unknown_fields')
     _toSchema = {'error': 'error', 'migration_id': 'migration-id', 'model_tag': 'model-tag'}
     _toPy = {'error': 'error', 'migration-id': 'migration_id', 'model-tag': 'model_tag'}
     def __init__(self, error=None, migration_id=None, model_tag=None, **unknown_fields):
@@ -4427,24 +9777,58 @@ class InitiateMigrationResult(Type):
         migration_id : str
         model_tag : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.migration_id = migration_id
         self.model_tag = model_tag
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.migration_id = data.get('migration-id')
+        self.model_tag = data.get('model-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'migration-id': self.migration_id, 'model-tag': self.model_tag}
 
 
 
 class InitiateMigrationResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~InitiateMigrationResult]
         '''
-        self.results = [InitiateMigrationResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [InitiateMigrationResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class InstanceInfo(Type):
+    __slots__ = ('_characteristics', '_network_config', '_raw_characteristics', '_raw_network_config', '_raw_volumes', '_volumes', 'instance_id', 'nonce', 'tag', 'unknown_fields', 'volume_attachments')
     _toSchema = {'characteristics': 'characteristics', 'instance_id': 'instance-id', 'network_config': 'network-config', 'nonce': 'nonce', 'tag': 'tag', 'volume_attachments': 'volume-attachments', 'volumes': 'volumes'}
     _toPy = {'characteristics': 'characteristics', 'instance-id': 'instance_id', 'network-config': 'network_config', 'nonce': 'nonce', 'tag': 'tag', 'volume-attachments': 'volume_attachments', 'volumes': 'volumes'}
     def __init__(self, characteristics=None, instance_id=None, network_config=None, nonce=None, tag=None, volume_attachments=None, volumes=None, **unknown_fields):
@@ -4457,17 +9841,41 @@ class InstanceInfo(Type):
         volume_attachments : typing.Mapping[str, ~VolumeAttachmentInfo]
         volumes : typing.Sequence[~Volume]
         '''
-        self.characteristics = HardwareCharacteristics.from_json(characteristics) if characteristics else None
+        self._raw_characteristics = characteristics
         self.instance_id = instance_id
-        self.network_config = [NetworkConfig.from_json(o) for o in network_config or []]
+        self._raw_network_config = network_config
         self.nonce = nonce
         self.tag = tag
         self.volume_attachments = volume_attachments
-        self.volumes = [Volume.from_json(o) for o in volumes or []]
+        self._raw_volumes = volumes
+        self.unknown_fields = unknown_fields
+
+    characteristics = LazyField('characteristics', lambda data: HardwareCharacteristics.from_json(data) if data else None)
+    network_config = LazyField('network_config', lambda data: [NetworkConfig.from_json(o) for o in data or []])
+    volumes = LazyField('volumes', lambda data: [Volume.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_characteristics = data.get('characteristics')
+        self.instance_id = data.get('instance-id')
+        self._raw_network_config = data.get('network-config')
+        self.nonce = data.get('nonce')
+        self.tag = data.get('tag')
+        self.volume_attachments = data.get('volume-attachments')
+        self._raw_volumes = data.get('volumes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'characteristics': self._raw_characteristics, 'instance-id': self.instance_id, 'network-config': self._raw_network_config, 'nonce': self.nonce, 'tag': self.tag, 'volume-attachments': self.volume_attachments, 'volumes': self._raw_volumes}
 
 
 
 class InstanceType(Type):
+    __slots__ = ('arches', 'cost', 'cpu_cores', 'deprecated', 'memory', 'name', 'root_disk', 'unknown_fields', 'virt_type')
     _toSchema = {'arches': 'arches', 'cost': 'cost', 'cpu_cores': 'cpu-cores', 'deprecated': 'deprecated', 'memory': 'memory', 'name': 'name', 'root_disk': 'root-disk', 'virt_type': 'virt-type'}
     _toPy = {'arches': 'arches', 'cost': 'cost', 'cpu-cores': 'cpu_cores', 'deprecated': 'deprecated', 'memory': 'memory', 'name': 'name', 'root-disk': 'root_disk', 'virt-type': 'virt_type'}
     def __init__(self, arches=None, cost=None, cpu_cores=None, deprecated=None, memory=None, name=None, root_disk=None, virt_type=None, **unknown_fields):
@@ -4489,10 +9897,31 @@ class InstanceType(Type):
         self.name = name
         self.root_disk = root_disk
         self.virt_type = virt_type
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arches = data.get('arches')
+        self.cost = data.get('cost')
+        self.cpu_cores = data.get('cpu-cores')
+        self.deprecated = data.get('deprecated')
+        self.memory = data.get('memory')
+        self.name = data.get('name')
+        self.root_disk = data.get('root-disk')
+        self.virt_type = data.get('virt-type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'arches': self.arches, 'cost': self.cost, 'cpu-cores': self.cpu_cores, 'deprecated': self.deprecated, 'memory': self.memory, 'name': self.name, 'root-disk': self.root_disk, 'virt-type': self.virt_type}
 
 
 
 class InstanceTypesResult(Type):
+    __slots__ = ('_error', '_instance_types', '_raw_error', '_raw_instance_types', 'cost_currency', 'cost_divisor', 'cost_unit', 'unknown_fields')
     _toSchema = {'cost_currency': 'cost-currency', 'cost_divisor': 'cost-divisor', 'cost_unit': 'cost-unit', 'error': 'error', 'instance_types': 'instance-types'}
     _toPy = {'cost-currency': 'cost_currency', 'cost-divisor': 'cost_divisor', 'cost-unit': 'cost_unit', 'error': 'error', 'instance-types': 'instance_types'}
     def __init__(self, cost_currency=None, cost_divisor=None, cost_unit=None, error=None, instance_types=None, **unknown_fields):
@@ -4506,34 +9935,87 @@ class InstanceTypesResult(Type):
         self.cost_currency = cost_currency
         self.cost_divisor = cost_divisor
         self.cost_unit = cost_unit
-        self.error = Error.from_json(error) if error else None
-        self.instance_types = [InstanceType.from_json(o) for o in instance_types or []]
+        self._raw_error = error
+        self._raw_instance_types = instance_types
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    instance_types = LazyField('instance_types', lambda data: [InstanceType.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cost_currency = data.get('cost-currency')
+        self.cost_divisor = data.get('cost-divisor')
+        self.cost_unit = data.get('cost-unit')
+        self._raw_error = data.get('error')
+        self._raw_instance_types = data.get('instance-types')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cost-currency': self.cost_currency, 'cost-divisor': self.cost_divisor, 'cost-unit': self.cost_unit, 'error': self._raw_error, 'instance-types': self._raw_instance_types}
 
 
 
 class InstanceTypesResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~InstanceTypesResult]
         '''
-        self.results = [InstanceTypesResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [InstanceTypesResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class InstancesInfo(Type):
+    __slots__ = ('_machines', '_raw_machines', 'unknown_fields')
     _toSchema = {'machines': 'machines'}
     _toPy = {'machines': 'machines'}
     def __init__(self, machines=None, **unknown_fields):
         '''
         machines : typing.Sequence[~InstanceInfo]
         '''
-        self.machines = [InstanceInfo.from_json(o) for o in machines or []]
+        self._raw_machines = machines
+        self.unknown_fields = unknown_fields
+
+    machines = LazyField('machines', lambda data: [InstanceInfo.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_machines = data.get('machines')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'machines': self._raw_machines}
 
 
 
 class IntResult(Type):
+    __slots__ = ('_error', '_raw_error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -4541,23 +10023,56 @@ class IntResult(Type):
         error : Error
         result : int
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self.result}
 
 
 
 class IntResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~IntResult]
         '''
-        self.results = [IntResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [IntResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class InterfaceAddress(Type):
+    __slots__ = ('cidr', 'unknown_fields', 'value')
     _toSchema = {'cidr': 'cidr', 'value': 'value'}
     _toPy = {'cidr': 'cidr', 'value': 'value'}
     def __init__(self, cidr=None, value=None, **unknown_fields):
@@ -4567,10 +10082,25 @@ class InterfaceAddress(Type):
         '''
         self.cidr = cidr
         self.value = value
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cidr = data.get('cidr')
+        self.value = data.get('value')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cidr': self.cidr, 'value': self.value}
 
 
 
 class InvalidateCredentialArg(Type):
+    __slots__ = ('reason', 'unknown_fields')
     _toSchema = {'reason': 'reason'}
     _toPy = {'reason': 'reason'}
     def __init__(self, reason=None, **unknown_fields):
@@ -4578,10 +10108,24 @@ class InvalidateCredentialArg(Type):
         reason : str
         '''
         self.reason = reason
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.reason = data.get('reason')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'reason': self.reason}
 
 
 
 class IsMasterResult(Type):
+    __slots__ = ('master', 'unknown_fields')
     _toSchema = {'master': 'master'}
     _toPy = {'master': 'master'}
     def __init__(self, master=None, **unknown_fields):
@@ -4589,10 +10133,24 @@ class IsMasterResult(Type):
         master : bool
         '''
         self.master = master
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.master = data.get('master')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'master': self.master}
 
 
 
 class IsMeteredResult(Type):
+    __slots__ = ('metered', 'unknown_fields')
     _toSchema = {'metered': 'metered'}
     _toPy = {'metered': 'metered'}
     def __init__(self, metered=None, **unknown_fields):
@@ -4600,10 +10158,24 @@ class IsMeteredResult(Type):
         metered : bool
         '''
         self.metered = metered
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.metered = data.get('metered')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'metered': self.metered}
 
 
 
 class JobsResult(Type):
+    __slots__ = ('_error', '_raw_error', 'jobs', 'unknown_fields')
     _toSchema = {'error': 'error', 'jobs': 'jobs'}
     _toPy = {'error': 'error', 'jobs': 'jobs'}
     def __init__(self, error=None, jobs=None, **unknown_fields):
@@ -4611,23 +10183,56 @@ class JobsResult(Type):
         error : Error
         jobs : typing.Sequence[str]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.jobs = jobs
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.jobs = data.get('jobs')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'jobs': self.jobs}
 
 
 
 class JobsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~JobsResult]
         '''
-        self.results = [JobsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [JobsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class KnownServiceArgs(Type):
+    __slots__ = ('known_services', 'unknown_fields')
     _toSchema = {'known_services': 'known-services'}
     _toPy = {'known-services': 'known_services'}
     def __init__(self, known_services=None, **unknown_fields):
@@ -4635,10 +10240,24 @@ class KnownServiceArgs(Type):
         known_services : typing.Sequence[str]
         '''
         self.known_services = known_services
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.known_services = data.get('known-services')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'known-services': self.known_services}
 
 
 
 class KubernetesDeviceParams(Type):
+    __slots__ = ('attributes', 'count', 'type_', 'unknown_fields')
     _toSchema = {'attributes': 'Attributes', 'count': 'Count', 'type_': 'Type'}
     _toPy = {'Attributes': 'attributes', 'Count': 'count', 'Type': 'type_'}
     def __init__(self, attributes=None, count=None, type_=None, **unknown_fields):
@@ -4650,10 +10269,26 @@ class KubernetesDeviceParams(Type):
         self.attributes = attributes
         self.count = count
         self.type_ = type_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.attributes = data.get('Attributes')
+        self.count = data.get('Count')
+        self.type_ = data.get('Type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Attributes': self.attributes, 'Count': self.count, 'Type': self.type_}
 
 
 
 class KubernetesFilesystemAttachmentParams(Type):
+    __slots__ = ('mount_point', 'provider', 'read_only', 'unknown_fields')
     _toSchema = {'mount_point': 'mount-point', 'provider': 'provider', 'read_only': 'read-only'}
     _toPy = {'mount-point': 'mount_point', 'provider': 'provider', 'read-only': 'read_only'}
     def __init__(self, mount_point=None, provider=None, read_only=None, **unknown_fields):
@@ -4665,10 +10300,26 @@ class KubernetesFilesystemAttachmentParams(Type):
         self.mount_point = mount_point
         self.provider = provider
         self.read_only = read_only
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.mount_point = data.get('mount-point')
+        self.provider = data.get('provider')
+        self.read_only = data.get('read-only')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'mount-point': self.mount_point, 'provider': self.provider, 'read-only': self.read_only}
 
 
 
 class KubernetesFilesystemInfo(Type):
+    __slots__ = ('_raw_volume', '_volume', 'data', 'filesystem_id', 'info', 'mount_point', 'pool', 'read_only', 'size', 'status', 'storagename', 'unknown_fields')
     _toSchema = {'data': 'data', 'filesystem_id': 'filesystem-id', 'info': 'info', 'mount_point': 'mount-point', 'pool': 'pool', 'read_only': 'read-only', 'size': 'size', 'status': 'status', 'storagename': 'storagename', 'volume': 'volume'}
     _toPy = {'data': 'data', 'filesystem-id': 'filesystem_id', 'info': 'info', 'mount-point': 'mount_point', 'pool': 'pool', 'read-only': 'read_only', 'size': 'size', 'status': 'status', 'storagename': 'storagename', 'volume': 'volume'}
     def __init__(self, data=None, filesystem_id=None, info=None, mount_point=None, pool=None, read_only=None, size=None, status=None, storagename=None, volume=None, **unknown_fields):
@@ -4693,11 +10344,36 @@ class KubernetesFilesystemInfo(Type):
         self.size = size
         self.status = status
         self.storagename = storagename
-        self.volume = KubernetesVolumeInfo.from_json(volume) if volume else None
+        self._raw_volume = volume
+        self.unknown_fields = unknown_fields
+
+    volume = LazyField('volume', lambda data: KubernetesVolumeInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.data = data.get('data')
+        self.filesystem_id = data.get('filesystem-id')
+        self.info = data.get('info')
+        self.mount_point = data.get('mount-point')
+        self.pool = data.get('pool')
+        self.read_only = data.get('read-only')
+        self.size = data.get('size')
+        self.status = data.get('status')
+        self.storagename = data.get('storagename')
+        self._raw_volume = data.get('volume')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'data': self.data, 'filesystem-id': self.filesystem_id, 'info': self.info, 'mount-point': self.mount_point, 'pool': self.pool, 'read-only': self.read_only, 'size': self.size, 'status': self.status, 'storagename': self.storagename, 'volume': self._raw_volume}
 
 
 
 class KubernetesFilesystemParams(Type):
+    __slots__ = ('_attachment', '_raw_attachment', 'attributes', 'provider', 'size', 'storagename', 'tags', 'unknown_fields')
     _toSchema = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'storagename': 'storagename', 'tags': 'tags'}
     _toPy = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'storagename': 'storagename', 'tags': 'tags'}
     def __init__(self, attachment=None, attributes=None, provider=None, size=None, storagename=None, tags=None, **unknown_fields):
@@ -4709,16 +10385,37 @@ class KubernetesFilesystemParams(Type):
         storagename : str
         tags : typing.Mapping[str, str]
         '''
-        self.attachment = KubernetesFilesystemAttachmentParams.from_json(attachment) if attachment else None
+        self._raw_attachment = attachment
         self.attributes = attributes
         self.provider = provider
         self.size = size
         self.storagename = storagename
         self.tags = tags
+        self.unknown_fields = unknown_fields
+
+    attachment = LazyField('attachment', lambda data: KubernetesFilesystemAttachmentParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_attachment = data.get('attachment')
+        self.attributes = data.get('attributes')
+        self.provider = data.get('provider')
+        self.size = data.get('size')
+        self.storagename = data.get('storagename')
+        self.tags = data.get('tags')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attachment': self._raw_attachment, 'attributes': self.attributes, 'provider': self.provider, 'size': self.size, 'storagename': self.storagename, 'tags': self.tags}
 
 
 
 class KubernetesProvisioningInfo(Type):
+    __slots__ = ('_constraints', '_devices', '_filesystems', '_raw_constraints', '_raw_devices', '_raw_filesystems', '_raw_volumes', '_volumes', 'placement', 'pod_spec', 'tags', 'unknown_fields')
     _toSchema = {'constraints': 'constraints', 'devices': 'devices', 'filesystems': 'filesystems', 'placement': 'placement', 'pod_spec': 'pod-spec', 'tags': 'tags', 'volumes': 'volumes'}
     _toPy = {'constraints': 'constraints', 'devices': 'devices', 'filesystems': 'filesystems', 'placement': 'placement', 'pod-spec': 'pod_spec', 'tags': 'tags', 'volumes': 'volumes'}
     def __init__(self, constraints=None, devices=None, filesystems=None, placement=None, pod_spec=None, tags=None, volumes=None, **unknown_fields):
@@ -4731,17 +10428,42 @@ class KubernetesProvisioningInfo(Type):
         tags : typing.Mapping[str, str]
         volumes : typing.Sequence[~KubernetesVolumeParams]
         '''
-        self.constraints = Value.from_json(constraints) if constraints else None
-        self.devices = [KubernetesDeviceParams.from_json(o) for o in devices or []]
-        self.filesystems = [KubernetesFilesystemParams.from_json(o) for o in filesystems or []]
+        self._raw_constraints = constraints
+        self._raw_devices = devices
+        self._raw_filesystems = filesystems
         self.placement = placement
         self.pod_spec = pod_spec
         self.tags = tags
-        self.volumes = [KubernetesVolumeParams.from_json(o) for o in volumes or []]
+        self._raw_volumes = volumes
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+    devices = LazyField('devices', lambda data: [KubernetesDeviceParams.from_json(o) for o in data or []])
+    filesystems = LazyField('filesystems', lambda data: [KubernetesFilesystemParams.from_json(o) for o in data or []])
+    volumes = LazyField('volumes', lambda data: [KubernetesVolumeParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_constraints = data.get('constraints')
+        self._raw_devices = data.get('devices')
+        self._raw_filesystems = data.get('filesystems')
+        self.placement = data.get('placement')
+        self.pod_spec = data.get('pod-spec')
+        self.tags = data.get('tags')
+        self._raw_volumes = data.get('volumes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'constraints': self._raw_constraints, 'devices': self._raw_devices, 'filesystems': self._raw_filesystems, 'placement': self.placement, 'pod-spec': self.pod_spec, 'tags': self.tags, 'volumes': self._raw_volumes}
 
 
 
 class KubernetesProvisioningInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -4749,23 +10471,57 @@ class KubernetesProvisioningInfoResult(Type):
         error : Error
         result : KubernetesProvisioningInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = KubernetesProvisioningInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: KubernetesProvisioningInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class KubernetesProvisioningInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~KubernetesProvisioningInfoResult]
         '''
-        self.results = [KubernetesProvisioningInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [KubernetesProvisioningInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class KubernetesVolumeAttachmentParams(Type):
+    __slots__ = ('provider', 'read_only', 'unknown_fields')
     _toSchema = {'provider': 'provider', 'read_only': 'read-only'}
     _toPy = {'provider': 'provider', 'read-only': 'read_only'}
     def __init__(self, provider=None, read_only=None, **unknown_fields):
@@ -4775,10 +10531,25 @@ class KubernetesVolumeAttachmentParams(Type):
         '''
         self.provider = provider
         self.read_only = read_only
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.provider = data.get('provider')
+        self.read_only = data.get('read-only')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'provider': self.provider, 'read-only': self.read_only}
 
 
 
 class KubernetesVolumeInfo(Type):
+    __slots__ = ('data', 'info', 'persistent', 'pool', 'size', 'status', 'unknown_fields', 'volume_id')
     _toSchema = {'data': 'data', 'info': 'info', 'persistent': 'persistent', 'pool': 'pool', 'size': 'size', 'status': 'status', 'volume_id': 'volume-id'}
     _toPy = {'data': 'data', 'info': 'info', 'persistent': 'persistent', 'pool': 'pool', 'size': 'size', 'status': 'status', 'volume-id': 'volume_id'}
     def __init__(self, data=None, info=None, persistent=None, pool=None, size=None, status=None, volume_id=None, **unknown_fields):
@@ -4798,10 +10569,30 @@ class KubernetesVolumeInfo(Type):
         self.size = size
         self.status = status
         self.volume_id = volume_id
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.data = data.get('data')
+        self.info = data.get('info')
+        self.persistent = data.get('persistent')
+        self.pool = data.get('pool')
+        self.size = data.get('size')
+        self.status = data.get('status')
+        self.volume_id = data.get('volume-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'data': self.data, 'info': self.info, 'persistent': self.persistent, 'pool': self.pool, 'size': self.size, 'status': self.status, 'volume-id': self.volume_id}
 
 
 
 class KubernetesVolumeParams(Type):
+    __slots__ = ('_attachment', '_raw_attachment', 'attributes', 'provider', 'size', 'storagename', 'tags', 'unknown_fields')
     _toSchema = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'storagename': 'storagename', 'tags': 'tags'}
     _toPy = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'storagename': 'storagename', 'tags': 'tags'}
     def __init__(self, attachment=None, attributes=None, provider=None, size=None, storagename=None, tags=None, **unknown_fields):
@@ -4813,16 +10604,37 @@ class KubernetesVolumeParams(Type):
         storagename : str
         tags : typing.Mapping[str, str]
         '''
-        self.attachment = KubernetesVolumeAttachmentParams.from_json(attachment) if attachment else None
+        self._raw_attachment = attachment
         self.attributes = attributes
         self.provider = provider
         self.size = size
         self.storagename = storagename
         self.tags = tags
+        self.unknown_fields = unknown_fields
+
+    attachment = LazyField('attachment', lambda data: KubernetesVolumeAttachmentParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_attachment = data.get('attachment')
+        self.attributes = data.get('attributes')
+        self.provider = data.get('provider')
+        self.size = data.get('size')
+        self.storagename = data.get('storagename')
+        self.tags = data.get('tags')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attachment': self._raw_attachment, 'attributes': self.attributes, 'provider': self.provider, 'size': self.size, 'storagename': self.storagename, 'tags': self.tags}
 
 
 
 class LXDProfile(Type):
+    __slots__ = ('config', 'description', 'devices', 'unknown_fields')
     _toSchema = {'config': 'config', 'description': 'description', 'devices': 'devices'}
     _toPy = {'config': 'config', 'description': 'description', 'devices': 'devices'}
     def __init__(self, config=None, description=None, devices=None, **unknown_fields):
@@ -4834,10 +10646,26 @@ class LXDProfile(Type):
         self.config = config
         self.description = description
         self.devices = devices
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self.description = data.get('description')
+        self.devices = data.get('devices')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config, 'description': self.description, 'devices': self.devices}
 
 
 
 class LXDProfileUpgradeMessages(Type):
+    __slots__ = ('_application', '_raw_application', 'unknown_fields', 'watcher_id')
     _toSchema = {'application': 'application', 'watcher_id': 'watcher-id'}
     _toPy = {'application': 'application', 'watcher-id': 'watcher_id'}
     def __init__(self, application=None, watcher_id=None, **unknown_fields):
@@ -4845,12 +10673,29 @@ class LXDProfileUpgradeMessages(Type):
         application : Entity
         watcher_id : str
         '''
-        self.application = Entity.from_json(application) if application else None
+        self._raw_application = application
         self.watcher_id = watcher_id
+        self.unknown_fields = unknown_fields
+
+    application = LazyField('application', lambda data: Entity.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_application = data.get('application')
+        self.watcher_id = data.get('watcher-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self._raw_application, 'watcher-id': self.watcher_id}
 
 
 
 class LXDProfileUpgradeMessagesResult(Type):
+    __slots__ = ('_error', '_raw_error', 'message', 'unit_name', 'unknown_fields')
     _toSchema = {'error': 'error', 'message': 'message', 'unit_name': 'unit-name'}
     _toPy = {'error': 'error', 'message': 'message', 'unit-name': 'unit_name'}
     def __init__(self, error=None, message=None, unit_name=None, **unknown_fields):
@@ -4859,24 +10704,58 @@ class LXDProfileUpgradeMessagesResult(Type):
         message : str
         unit_name : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.message = message
         self.unit_name = unit_name
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.message = data.get('message')
+        self.unit_name = data.get('unit-name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'message': self.message, 'unit-name': self.unit_name}
 
 
 
 class LXDProfileUpgradeMessagesResults(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~LXDProfileUpgradeMessagesResult]
         '''
-        self.args = [LXDProfileUpgradeMessagesResult.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [LXDProfileUpgradeMessagesResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class LifeResult(Type):
+    __slots__ = ('_error', '_raw_error', 'life', 'unknown_fields')
     _toSchema = {'error': 'error', 'life': 'life'}
     _toPy = {'error': 'error', 'life': 'life'}
     def __init__(self, error=None, life=None, **unknown_fields):
@@ -4884,34 +10763,83 @@ class LifeResult(Type):
         error : Error
         life : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.life = life
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.life = data.get('life')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'life': self.life}
 
 
 
 class LifeResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~LifeResult]
         '''
-        self.results = [LifeResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [LifeResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ListCloudImageMetadataResult(Type):
+    __slots__ = ('_raw_result', '_result', 'unknown_fields')
     _toSchema = {'result': 'result'}
     _toPy = {'result': 'result'}
     def __init__(self, result=None, **unknown_fields):
         '''
         result : typing.Sequence[~CloudImageMetadata]
         '''
-        self.result = [CloudImageMetadata.from_json(o) for o in result or []]
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    result = LazyField('result', lambda data: [CloudImageMetadata.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'result': self._raw_result}
 
 
 
 class ListCloudInfo(Type):
+    __slots__ = ('_clouddetails', '_raw_clouddetails', 'unknown_fields', 'user_access')
     _toSchema = {'clouddetails': 'CloudDetails', 'user_access': 'user-access'}
     _toPy = {'CloudDetails': 'clouddetails', 'user-access': 'user_access'}
     def __init__(self, clouddetails=None, user_access=None, **unknown_fields):
@@ -4919,12 +10847,29 @@ class ListCloudInfo(Type):
         clouddetails : CloudDetails
         user_access : str
         '''
-        self.clouddetails = CloudDetails.from_json(clouddetails) if clouddetails else None
+        self._raw_clouddetails = clouddetails
         self.user_access = user_access
+        self.unknown_fields = unknown_fields
+
+    clouddetails = LazyField('clouddetails', lambda data: CloudDetails.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_clouddetails = data.get('CloudDetails')
+        self.user_access = data.get('user-access')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'CloudDetails': self._raw_clouddetails, 'user-access': self.user_access}
 
 
 
 class ListCloudInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -4932,23 +10877,57 @@ class ListCloudInfoResult(Type):
         error : Error
         result : ListCloudInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ListCloudInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ListCloudInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ListCloudInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ListCloudInfoResult]
         '''
-        self.results = [ListCloudInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ListCloudInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ListCloudsRequest(Type):
+    __slots__ = ('all_', 'unknown_fields', 'user_tag')
     _toSchema = {'all_': 'all', 'user_tag': 'user-tag'}
     _toPy = {'all': 'all_', 'user-tag': 'user_tag'}
     def __init__(self, all_=None, user_tag=None, **unknown_fields):
@@ -4958,43 +10937,106 @@ class ListCloudsRequest(Type):
         '''
         self.all_ = all_
         self.user_tag = user_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.all_ = data.get('all')
+        self.user_tag = data.get('user-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'all': self.all_, 'user-tag': self.user_tag}
 
 
 
 class ListFirewallRulesResults(Type):
+    __slots__ = ('_raw_rules', '_rules', 'unknown_fields')
     _toSchema = {'rules': 'Rules'}
     _toPy = {'Rules': 'rules'}
     def __init__(self, rules=None, **unknown_fields):
         '''
         rules : typing.Sequence[~FirewallRule]
         '''
-        self.rules = [FirewallRule.from_json(o) for o in rules or []]
+        self._raw_rules = rules
+        self.unknown_fields = unknown_fields
+
+    rules = LazyField('rules', lambda data: [FirewallRule.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_rules = data.get('Rules')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Rules': self._raw_rules}
 
 
 
 class ListImageResult(Type):
+    __slots__ = ('_raw_result', '_result', 'unknown_fields')
     _toSchema = {'result': 'result'}
     _toPy = {'result': 'result'}
     def __init__(self, result=None, **unknown_fields):
         '''
         result : typing.Sequence[~ImageMetadata]
         '''
-        self.result = [ImageMetadata.from_json(o) for o in result or []]
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    result = LazyField('result', lambda data: [ImageMetadata.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'result': self._raw_result}
 
 
 
 class ListResourcesArgs(Type):
+    __slots__ = ('_entities', '_raw_entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~Entity]
         '''
-        self.entities = [Entity.from_json(o) for o in entities or []]
+        self._raw_entities = entities
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [Entity.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities}
 
 
 
 class ListSSHKeys(Type):
+    __slots__ = ('_entities', '_raw_entities', 'mode', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'mode': 'mode'}
     _toPy = {'entities': 'entities', 'mode': 'mode'}
     def __init__(self, entities=None, mode=None, **unknown_fields):
@@ -5002,34 +11044,83 @@ class ListSSHKeys(Type):
         entities : Entities
         mode : bool
         '''
-        self.entities = Entities.from_json(entities) if entities else None
+        self._raw_entities = entities
         self.mode = mode
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: Entities.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.mode = data.get('mode')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities, 'mode': self.mode}
 
 
 
 class ListSpacesResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~Space]
         '''
-        self.results = [Space.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [Space.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ListSubnetsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~Subnet]
         '''
-        self.results = [Subnet.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [Subnet.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ListUnitResourcesArgs(Type):
+    __slots__ = ('resource_names', 'unknown_fields')
     _toSchema = {'resource_names': 'resource-names'}
     _toPy = {'resource-names': 'resource_names'}
     def __init__(self, resource_names=None, **unknown_fields):
@@ -5037,21 +11128,51 @@ class ListUnitResourcesArgs(Type):
         resource_names : typing.Sequence[str]
         '''
         self.resource_names = resource_names
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.resource_names = data.get('resource-names')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'resource-names': self.resource_names}
 
 
 
 class LogForwardingGetLastSentParams(Type):
+    __slots__ = ('_ids', '_raw_ids', 'unknown_fields')
     _toSchema = {'ids': 'ids'}
     _toPy = {'ids': 'ids'}
     def __init__(self, ids=None, **unknown_fields):
         '''
         ids : typing.Sequence[~LogForwardingID]
         '''
-        self.ids = [LogForwardingID.from_json(o) for o in ids or []]
+        self._raw_ids = ids
+        self.unknown_fields = unknown_fields
+
+    ids = LazyField('ids', lambda data: [LogForwardingID.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_ids = data.get('ids')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ids': self._raw_ids}
 
 
 
 class LogForwardingGetLastSentResult(Type):
+    __slots__ = ('_err', '_raw_err', 'record_id', 'record_timestamp', 'unknown_fields')
     _toSchema = {'err': 'err', 'record_id': 'record-id', 'record_timestamp': 'record-timestamp'}
     _toPy = {'err': 'err', 'record-id': 'record_id', 'record-timestamp': 'record_timestamp'}
     def __init__(self, err=None, record_id=None, record_timestamp=None, **unknown_fields):
@@ -5060,24 +11181,58 @@ class LogForwardingGetLastSentResult(Type):
         record_id : int
         record_timestamp : int
         '''
-        self.err = Error.from_json(err) if err else None
+        self._raw_err = err
         self.record_id = record_id
         self.record_timestamp = record_timestamp
+        self.unknown_fields = unknown_fields
+
+    err = LazyField('err', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_err = data.get('err')
+        self.record_id = data.get('record-id')
+        self.record_timestamp = data.get('record-timestamp')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'err': self._raw_err, 'record-id': self.record_id, 'record-timestamp': self.record_timestamp}
 
 
 
 class LogForwardingGetLastSentResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~LogForwardingGetLastSentResult]
         '''
-        self.results = [LogForwardingGetLastSentResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [LogForwardingGetLastSentResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class LogForwardingID(Type):
+    __slots__ = ('model', 'sink', 'unknown_fields')
     _toSchema = {'model': 'model', 'sink': 'sink'}
     _toPy = {'model': 'model', 'sink': 'sink'}
     def __init__(self, model=None, sink=None, **unknown_fields):
@@ -5087,10 +11242,25 @@ class LogForwardingID(Type):
         '''
         self.model = model
         self.sink = sink
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.model = data.get('model')
+        self.sink = data.get('sink')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'model': self.model, 'sink': self.sink}
 
 
 
 class LogForwardingSetLastSentParam(Type):
+    __slots__ = ('_logforwardingid', '_raw_logforwardingid', 'record_id', 'record_timestamp', 'unknown_fields')
     _toSchema = {'logforwardingid': 'LogForwardingID', 'record_id': 'record-id', 'record_timestamp': 'record-timestamp'}
     _toPy = {'LogForwardingID': 'logforwardingid', 'record-id': 'record_id', 'record-timestamp': 'record_timestamp'}
     def __init__(self, logforwardingid=None, record_id=None, record_timestamp=None, **unknown_fields):
@@ -5099,24 +11269,58 @@ class LogForwardingSetLastSentParam(Type):
         record_id : int
         record_timestamp : int
         '''
-        self.logforwardingid = LogForwardingID.from_json(logforwardingid) if logforwardingid else None
+        self._raw_logforwardingid = logforwardingid
         self.record_id = record_id
         self.record_timestamp = record_timestamp
+        self.unknown_fields = unknown_fields
+
+    logforwardingid = LazyField('logforwardingid', lambda data: LogForwardingID.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_logforwardingid = data.get('LogForwardingID')
+        self.record_id = data.get('record-id')
+        self.record_timestamp = data.get('record-timestamp')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'LogForwardingID': self._raw_logforwardingid, 'record-id': self.record_id, 'record-timestamp': self.record_timestamp}
 
 
 
 class LogForwardingSetLastSentParams(Type):
+    __slots__ = ('_params', '_raw_params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~LogForwardingSetLastSentParam]
         '''
-        self.params = [LogForwardingSetLastSentParam.from_json(o) for o in params or []]
+        self._raw_params = params
+        self.unknown_fields = unknown_fields
+
+    params = LazyField('params', lambda data: [LogForwardingSetLastSentParam.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'params': self._raw_params}
 
 
 
 class LookUpArg(Type):
+    __slots__ = ('id_', 'name', 'unknown_fields')
     _toSchema = {'id_': 'id', 'name': 'name'}
     _toPy = {'id': 'id_', 'name': 'name'}
     def __init__(self, id_=None, name=None, **unknown_fields):
@@ -5126,21 +11330,52 @@ class LookUpArg(Type):
         '''
         self.id_ = id_
         self.name = name
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.id_ = data.get('id')
+        self.name = data.get('name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'id': self.id_, 'name': self.name}
 
 
 
 class LookUpArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~LookUpArg]
         '''
-        self.args = [LookUpArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [LookUpArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class LookUpPayloadArg(Type):
+    __slots__ = ('id_', 'name', 'unknown_fields')
     _toSchema = {'id_': 'id', 'name': 'name'}
     _toPy = {'id': 'id_', 'name': 'name'}
     def __init__(self, id_=None, name=None, **unknown_fields):
@@ -5150,32 +11385,75 @@ class LookUpPayloadArg(Type):
         '''
         self.id_ = id_
         self.name = name
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.id_ = data.get('id')
+        self.name = data.get('name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'id': self.id_, 'name': self.name}
 
 
 
 class LookUpPayloadArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~LookUpPayloadArg]
         '''
-        self.args = [LookUpPayloadArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [LookUpPayloadArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class Macaroon(Type):
+    __slots__ = ('unknown_fields',)
     _toSchema = {}
     _toPy = {}
     def __init__(self, **unknown_fields):
         '''
 
         '''
-        pass
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {}
 
 
 
 class MacaroonResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -5183,23 +11461,57 @@ class MacaroonResult(Type):
         error : Error
         result : Macaroon
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = Macaroon.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: Macaroon.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class MacaroonResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MacaroonResult]
         '''
-        self.results = [MacaroonResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [MacaroonResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class MachineAddresses(Type):
+    __slots__ = ('_addresses', '_raw_addresses', 'tag', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'tag': 'tag'}
     _toPy = {'addresses': 'addresses', 'tag': 'tag'}
     def __init__(self, addresses=None, tag=None, **unknown_fields):
@@ -5207,12 +11519,29 @@ class MachineAddresses(Type):
         addresses : typing.Sequence[~Address]
         tag : str
         '''
-        self.addresses = [Address.from_json(o) for o in addresses or []]
+        self._raw_addresses = addresses
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    addresses = LazyField('addresses', lambda data: [Address.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_addresses = data.get('addresses')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'addresses': self._raw_addresses, 'tag': self.tag}
 
 
 
 class MachineAddressesResult(Type):
+    __slots__ = ('_addresses', '_error', '_raw_addresses', '_raw_error', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'error': 'error'}
     _toPy = {'addresses': 'addresses', 'error': 'error'}
     def __init__(self, addresses=None, error=None, **unknown_fields):
@@ -5220,23 +11549,57 @@ class MachineAddressesResult(Type):
         addresses : typing.Sequence[~Address]
         error : Error
         '''
-        self.addresses = [Address.from_json(o) for o in addresses or []]
-        self.error = Error.from_json(error) if error else None
+        self._raw_addresses = addresses
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    addresses = LazyField('addresses', lambda data: [Address.from_json(o) for o in data or []])
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_addresses = data.get('addresses')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'addresses': self._raw_addresses, 'error': self._raw_error}
 
 
 
 class MachineAddressesResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MachineAddressesResult]
         '''
-        self.results = [MachineAddressesResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [MachineAddressesResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class MachineBlockDevices(Type):
+    __slots__ = ('_block_devices', '_raw_block_devices', 'machine', 'unknown_fields')
     _toSchema = {'block_devices': 'block-devices', 'machine': 'machine'}
     _toPy = {'block-devices': 'block_devices', 'machine': 'machine'}
     def __init__(self, block_devices=None, machine=None, **unknown_fields):
@@ -5244,12 +11607,29 @@ class MachineBlockDevices(Type):
         block_devices : typing.Sequence[~BlockDevice]
         machine : str
         '''
-        self.block_devices = [BlockDevice.from_json(o) for o in block_devices or []]
+        self._raw_block_devices = block_devices
         self.machine = machine
+        self.unknown_fields = unknown_fields
+
+    block_devices = LazyField('block_devices', lambda data: [BlockDevice.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_block_devices = data.get('block-devices')
+        self.machine = data.get('machine')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'block-devices': self._raw_block_devices, 'machine': self.machine}
 
 
 
 class MachineContainers(Type):
+    __slots__ = ('container_types', 'machine_tag', 'unknown_fields')
     _toSchema = {'container_types': 'container-types', 'machine_tag': 'machine-tag'}
     _toPy = {'container-types': 'container_types', 'machine-tag': 'machine_tag'}
     def __init__(self, container_types=None, machine_tag=None, **unknown_fields):
@@ -5259,21 +11639,52 @@ class MachineContainers(Type):
         '''
         self.container_types = container_types
         self.machine_tag = machine_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.container_types = data.get('container-types')
+        self.machine_tag = data.get('machine-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'container-types': self.container_types, 'machine-tag': self.machine_tag}
 
 
 
 class MachineContainersParams(Type):
+    __slots__ = ('_params', '_raw_params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~MachineContainers]
         '''
-        self.params = [MachineContainers.from_json(o) for o in params or []]
+        self._raw_params = params
+        self.unknown_fields = unknown_fields
+
+    params = LazyField('params', lambda data: [MachineContainers.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'params': self._raw_params}
 
 
 
 class MachineHardware(Type):
+    __slots__ = ('arch', 'availability_zone', 'cores', 'cpu_power', 'mem', 'root_disk', 'tags', 'unknown_fields')
     _toSchema = {'arch': 'arch', 'availability_zone': 'availability-zone', 'cores': 'cores', 'cpu_power': 'cpu-power', 'mem': 'mem', 'root_disk': 'root-disk', 'tags': 'tags'}
     _toPy = {'arch': 'arch', 'availability-zone': 'availability_zone', 'cores': 'cores', 'cpu-power': 'cpu_power', 'mem': 'mem', 'root-disk': 'root_disk', 'tags': 'tags'}
     def __init__(self, arch=None, availability_zone=None, cores=None, cpu_power=None, mem=None, root_disk=None, tags=None, **unknown_fields):
@@ -5293,10 +11704,30 @@ class MachineHardware(Type):
         self.mem = mem
         self.root_disk = root_disk
         self.tags = tags
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arch = data.get('arch')
+        self.availability_zone = data.get('availability-zone')
+        self.cores = data.get('cores')
+        self.cpu_power = data.get('cpu-power')
+        self.mem = data.get('mem')
+        self.root_disk = data.get('root-disk')
+        self.tags = data.get('tags')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'arch': self.arch, 'availability-zone': self.availability_zone, 'cores': self.cores, 'cpu-power': self.cpu_power, 'mem': self.mem, 'root-disk': self.root_disk, 'tags': self.tags}
 
 
 
 class MachineNetworkConfigResult(Type):
+    __slots__ = ('_error', '_info', '_raw_error', '_raw_info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
     def __init__(self, error=None, info=None, **unknown_fields):
@@ -5304,23 +11735,57 @@ class MachineNetworkConfigResult(Type):
         error : Error
         info : typing.Sequence[~NetworkConfig]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.info = [NetworkConfig.from_json(o) for o in info or []]
+        self._raw_error = error
+        self._raw_info = info
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    info = LazyField('info', lambda data: [NetworkConfig.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_info = data.get('info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'info': self._raw_info}
 
 
 
 class MachineNetworkConfigResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MachineNetworkConfigResult]
         '''
-        self.results = [MachineNetworkConfigResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [MachineNetworkConfigResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class MachinePortRange(Type):
+    __slots__ = ('_port_range', '_raw_port_range', 'relation_tag', 'unit_tag', 'unknown_fields')
     _toSchema = {'port_range': 'port-range', 'relation_tag': 'relation-tag', 'unit_tag': 'unit-tag'}
     _toPy = {'port-range': 'port_range', 'relation-tag': 'relation_tag', 'unit-tag': 'unit_tag'}
     def __init__(self, port_range=None, relation_tag=None, unit_tag=None, **unknown_fields):
@@ -5329,13 +11794,31 @@ class MachinePortRange(Type):
         relation_tag : str
         unit_tag : str
         '''
-        self.port_range = PortRange.from_json(port_range) if port_range else None
+        self._raw_port_range = port_range
         self.relation_tag = relation_tag
         self.unit_tag = unit_tag
+        self.unknown_fields = unknown_fields
+
+    port_range = LazyField('port_range', lambda data: PortRange.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_port_range = data.get('port-range')
+        self.relation_tag = data.get('relation-tag')
+        self.unit_tag = data.get('unit-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'port-range': self._raw_port_range, 'relation-tag': self.relation_tag, 'unit-tag': self.unit_tag}
 
 
 
 class MachinePorts(Type):
+    __slots__ = ('machine_tag', 'subnet_tag', 'unknown_fields')
     _toSchema = {'machine_tag': 'machine-tag', 'subnet_tag': 'subnet-tag'}
     _toPy = {'machine-tag': 'machine_tag', 'subnet-tag': 'subnet_tag'}
     def __init__(self, machine_tag=None, subnet_tag=None, **unknown_fields):
@@ -5345,21 +11828,52 @@ class MachinePorts(Type):
         '''
         self.machine_tag = machine_tag
         self.subnet_tag = subnet_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.machine_tag = data.get('machine-tag')
+        self.subnet_tag = data.get('subnet-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'machine-tag': self.machine_tag, 'subnet-tag': self.subnet_tag}
 
 
 
 class MachinePortsParams(Type):
+    __slots__ = ('_params', '_raw_params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~MachinePorts]
         '''
-        self.params = [MachinePorts.from_json(o) for o in params or []]
+        self._raw_params = params
+        self.unknown_fields = unknown_fields
+
+    params = LazyField('params', lambda data: [MachinePorts.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'params': self._raw_params}
 
 
 
 class MachinePortsResult(Type):
+    __slots__ = ('_error', '_ports', '_raw_error', '_raw_ports', 'unknown_fields')
     _toSchema = {'error': 'error', 'ports': 'ports'}
     _toPy = {'error': 'error', 'ports': 'ports'}
     def __init__(self, error=None, ports=None, **unknown_fields):
@@ -5367,23 +11881,57 @@ class MachinePortsResult(Type):
         error : Error
         ports : typing.Sequence[~MachinePortRange]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.ports = [MachinePortRange.from_json(o) for o in ports or []]
+        self._raw_error = error
+        self._raw_ports = ports
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    ports = LazyField('ports', lambda data: [MachinePortRange.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_ports = data.get('ports')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'ports': self._raw_ports}
 
 
 
 class MachinePortsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MachinePortsResult]
         '''
-        self.results = [MachinePortsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [MachinePortsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class MachineStatus(Type):
+    __slots__ = ('_agent_status', '_instance_status', '_raw_agent_status', '_raw_instance_status', 'containers', 'dns_name', 'hardware', 'has_vote', 'id_', 'instance_id', 'ip_addresses', 'jobs', 'series', 'unknown_fields', 'wants_vote')
     _toSchema = {'agent_status': 'agent-status', 'containers': 'containers', 'dns_name': 'dns-name', 'hardware': 'hardware', 'has_vote': 'has-vote', 'id_': 'id', 'instance_id': 'instance-id', 'instance_status': 'instance-status', 'ip_addresses': 'ip-addresses', 'jobs': 'jobs', 'series': 'series', 'wants_vote': 'wants-vote'}
     _toPy = {'agent-status': 'agent_status', 'containers': 'containers', 'dns-name': 'dns_name', 'hardware': 'hardware', 'has-vote': 'has_vote', 'id': 'id_', 'instance-id': 'instance_id', 'instance-status': 'instance_status', 'ip-addresses': 'ip_addresses', 'jobs': 'jobs', 'series': 'series', 'wants-vote': 'wants_vote'}
     def __init__(self, agent_status=None, containers=None, dns_name=None, hardware=None, has_vote=None, id_=None, instance_id=None, instance_status=None, ip_addresses=None, jobs=None, series=None, wants_vote=None, **unknown_fields):
@@ -5401,22 +11949,50 @@ class MachineStatus(Type):
         series : str
         wants_vote : bool
         '''
-        self.agent_status = DetailedStatus.from_json(agent_status) if agent_status else None
+        self._raw_agent_status = agent_status
         self.containers = containers
         self.dns_name = dns_name
         self.hardware = hardware
         self.has_vote = has_vote
         self.id_ = id_
         self.instance_id = instance_id
-        self.instance_status = DetailedStatus.from_json(instance_status) if instance_status else None
+        self._raw_instance_status = instance_status
         self.ip_addresses = ip_addresses
         self.jobs = jobs
         self.series = series
         self.wants_vote = wants_vote
+        self.unknown_fields = unknown_fields
+
+    agent_status = LazyField('agent_status', lambda data: DetailedStatus.from_json(data) if data else None)
+    instance_status = LazyField('instance_status', lambda data: DetailedStatus.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_agent_status = data.get('agent-status')
+        self.containers = data.get('containers')
+        self.dns_name = data.get('dns-name')
+        self.hardware = data.get('hardware')
+        self.has_vote = data.get('has-vote')
+        self.id_ = data.get('id')
+        self.instance_id = data.get('instance-id')
+        self._raw_instance_status = data.get('instance-status')
+        self.ip_addresses = data.get('ip-addresses')
+        self.jobs = data.get('jobs')
+        self.series = data.get('series')
+        self.wants_vote = data.get('wants-vote')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'agent-status': self._raw_agent_status, 'containers': self.containers, 'dns-name': self.dns_name, 'hardware': self.hardware, 'has-vote': self.has_vote, 'id': self.id_, 'instance-id': self.instance_id, 'instance-status': self._raw_instance_status, 'ip-addresses': self.ip_addresses, 'jobs': self.jobs, 'series': self.series, 'wants-vote': self.wants_vote}
 
 
 
 class MachineStorageId(Type):
+    __slots__ = ('attachment_tag', 'machine_tag', 'unknown_fields')
     _toSchema = {'attachment_tag': 'attachment-tag', 'machine_tag': 'machine-tag'}
     _toPy = {'attachment-tag': 'attachment_tag', 'machine-tag': 'machine_tag'}
     def __init__(self, attachment_tag=None, machine_tag=None, **unknown_fields):
@@ -5426,21 +12002,52 @@ class MachineStorageId(Type):
         '''
         self.attachment_tag = attachment_tag
         self.machine_tag = machine_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.attachment_tag = data.get('attachment-tag')
+        self.machine_tag = data.get('machine-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attachment-tag': self.attachment_tag, 'machine-tag': self.machine_tag}
 
 
 
 class MachineStorageIds(Type):
+    __slots__ = ('_ids', '_raw_ids', 'unknown_fields')
     _toSchema = {'ids': 'ids'}
     _toPy = {'ids': 'ids'}
     def __init__(self, ids=None, **unknown_fields):
         '''
         ids : typing.Sequence[~MachineStorageId]
         '''
-        self.ids = [MachineStorageId.from_json(o) for o in ids or []]
+        self._raw_ids = ids
+        self.unknown_fields = unknown_fields
+
+    ids = LazyField('ids', lambda data: [MachineStorageId.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_ids = data.get('ids')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ids': self._raw_ids}
 
 
 
 class MachineStorageIdsWatchResult(Type):
+    __slots__ = ('_changes', '_error', '_raw_changes', '_raw_error', 'unknown_fields', 'watcher_id')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
@@ -5449,24 +12056,59 @@ class MachineStorageIdsWatchResult(Type):
         error : Error
         watcher_id : str
         '''
-        self.changes = [MachineStorageId.from_json(o) for o in changes or []]
-        self.error = Error.from_json(error) if error else None
+        self._raw_changes = changes
+        self._raw_error = error
         self.watcher_id = watcher_id
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [MachineStorageId.from_json(o) for o in data or []])
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self._raw_error = data.get('error')
+        self.watcher_id = data.get('watcher-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes, 'error': self._raw_error, 'watcher-id': self.watcher_id}
 
 
 
 class MachineStorageIdsWatchResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MachineStorageIdsWatchResult]
         '''
-        self.results = [MachineStorageIdsWatchResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [MachineStorageIdsWatchResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class MapResult(Type):
+    __slots__ = ('_error', '_raw_error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -5474,23 +12116,56 @@ class MapResult(Type):
         error : Error
         result : typing.Mapping[str, typing.Any]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self.result}
 
 
 
 class MapResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MapResult]
         '''
-        self.results = [MapResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [MapResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class MasterMigrationStatus(Type):
+    __slots__ = ('_raw_spec', '_spec', 'migration_id', 'phase', 'phase_changed_time', 'unknown_fields')
     _toSchema = {'migration_id': 'migration-id', 'phase': 'phase', 'phase_changed_time': 'phase-changed-time', 'spec': 'spec'}
     _toPy = {'migration-id': 'migration_id', 'phase': 'phase', 'phase-changed-time': 'phase_changed_time', 'spec': 'spec'}
     def __init__(self, migration_id=None, phase=None, phase_changed_time=None, spec=None, **unknown_fields):
@@ -5503,11 +12178,30 @@ class MasterMigrationStatus(Type):
         self.migration_id = migration_id
         self.phase = phase
         self.phase_changed_time = phase_changed_time
-        self.spec = MigrationSpec.from_json(spec) if spec else None
+        self._raw_spec = spec
+        self.unknown_fields = unknown_fields
+
+    spec = LazyField('spec', lambda data: MigrationSpec.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.migration_id = data.get('migration-id')
+        self.phase = data.get('phase')
+        self.phase_changed_time = data.get('phase-changed-time')
+        self._raw_spec = data.get('spec')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'migration-id': self.migration_id, 'phase': self.phase, 'phase-changed-time': self.phase_changed_time, 'spec': self._raw_spec}
 
 
 
 class Member(Type):
+    __slots__ = ('address', 'arbiter', 'buildindexes', 'hidden', 'id_', 'priority', 'slavedelay', 'tags', 'unknown_fields', 'votes')
     _toSchema = {'address': 'Address', 'arbiter': 'Arbiter', 'buildindexes': 'BuildIndexes', 'hidden': 'Hidden', 'id_': 'Id', 'priority': 'Priority', 'slavedelay': 'SlaveDelay', 'tags': 'Tags', 'votes': 'Votes'}
     _toPy = {'Address': 'address', 'Arbiter': 'arbiter', 'BuildIndexes': 'buildindexes', 'Hidden': 'hidden', 'Id': 'id_', 'Priority': 'priority', 'SlaveDelay': 'slavedelay', 'Tags': 'tags', 'Votes': 'votes'}
     def __init__(self, address=None, arbiter=None, buildindexes=None, hidden=None, id_=None, priority=None, slavedelay=None, tags=None, votes=None, **unknown_fields):
@@ -5531,21 +12225,59 @@ class Member(Type):
         self.slavedelay = slavedelay
         self.tags = tags
         self.votes = votes
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.address = data.get('Address')
+        self.arbiter = data.get('Arbiter')
+        self.buildindexes = data.get('BuildIndexes')
+        self.hidden = data.get('Hidden')
+        self.id_ = data.get('Id')
+        self.priority = data.get('Priority')
+        self.slavedelay = data.get('SlaveDelay')
+        self.tags = data.get('Tags')
+        self.votes = data.get('Votes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Address': self.address, 'Arbiter': self.arbiter, 'BuildIndexes': self.buildindexes, 'Hidden': self.hidden, 'Id': self.id_, 'Priority': self.priority, 'SlaveDelay': self.slavedelay, 'Tags': self.tags, 'Votes': self.votes}
 
 
 
 class MergeLeadershipSettingsBulkParams(Type):
+    __slots__ = ('_params', '_raw_params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~MergeLeadershipSettingsParam]
         '''
-        self.params = [MergeLeadershipSettingsParam.from_json(o) for o in params or []]
+        self._raw_params = params
+        self.unknown_fields = unknown_fields
+
+    params = LazyField('params', lambda data: [MergeLeadershipSettingsParam.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'params': self._raw_params}
 
 
 
 class MergeLeadershipSettingsParam(Type):
+    __slots__ = ('application_tag', 'settings', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'settings': 'settings'}
     _toPy = {'application-tag': 'application_tag', 'settings': 'settings'}
     def __init__(self, application_tag=None, settings=None, **unknown_fields):
@@ -5555,10 +12287,25 @@ class MergeLeadershipSettingsParam(Type):
         '''
         self.application_tag = application_tag
         self.settings = settings
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_tag = data.get('application-tag')
+        self.settings = data.get('settings')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-tag': self.application_tag, 'settings': self.settings}
 
 
 
 class MetadataImageIds(Type):
+    __slots__ = ('image_ids', 'unknown_fields')
     _toSchema = {'image_ids': 'image-ids'}
     _toPy = {'image-ids': 'image_ids'}
     def __init__(self, image_ids=None, **unknown_fields):
@@ -5566,21 +12313,51 @@ class MetadataImageIds(Type):
         image_ids : typing.Sequence[str]
         '''
         self.image_ids = image_ids
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.image_ids = data.get('image-ids')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'image-ids': self.image_ids}
 
 
 
 class MetadataSaveParams(Type):
+    __slots__ = ('_metadata', '_raw_metadata', 'unknown_fields')
     _toSchema = {'metadata': 'metadata'}
     _toPy = {'metadata': 'metadata'}
     def __init__(self, metadata=None, **unknown_fields):
         '''
         metadata : typing.Sequence[~CloudImageMetadataList]
         '''
-        self.metadata = [CloudImageMetadataList.from_json(o) for o in metadata or []]
+        self._raw_metadata = metadata
+        self.unknown_fields = unknown_fields
+
+    metadata = LazyField('metadata', lambda data: [CloudImageMetadataList.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_metadata = data.get('metadata')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'metadata': self._raw_metadata}
 
 
 
 class MeterStatus(Type):
+    __slots__ = ('color', 'message', 'unknown_fields')
     _toSchema = {'color': 'color', 'message': 'message'}
     _toPy = {'color': 'color', 'message': 'message'}
     def __init__(self, color=None, message=None, **unknown_fields):
@@ -5590,10 +12367,25 @@ class MeterStatus(Type):
         '''
         self.color = color
         self.message = message
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.color = data.get('color')
+        self.message = data.get('message')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'color': self.color, 'message': self.message}
 
 
 
 class MeterStatusParam(Type):
+    __slots__ = ('code', 'info', 'tag', 'unknown_fields')
     _toSchema = {'code': 'code', 'info': 'info', 'tag': 'tag'}
     _toPy = {'code': 'code', 'info': 'info', 'tag': 'tag'}
     def __init__(self, code=None, info=None, tag=None, **unknown_fields):
@@ -5605,21 +12397,53 @@ class MeterStatusParam(Type):
         self.code = code
         self.info = info
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.code = data.get('code')
+        self.info = data.get('info')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'code': self.code, 'info': self.info, 'tag': self.tag}
 
 
 
 class MeterStatusParams(Type):
+    __slots__ = ('_raw_statues', '_statues', 'unknown_fields')
     _toSchema = {'statues': 'statues'}
     _toPy = {'statues': 'statues'}
     def __init__(self, statues=None, **unknown_fields):
         '''
         statues : typing.Sequence[~MeterStatusParam]
         '''
-        self.statues = [MeterStatusParam.from_json(o) for o in statues or []]
+        self._raw_statues = statues
+        self.unknown_fields = unknown_fields
+
+    statues = LazyField('statues', lambda data: [MeterStatusParam.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_statues = data.get('statues')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'statues': self._raw_statues}
 
 
 
 class MeterStatusResult(Type):
+    __slots__ = ('_error', '_raw_error', 'code', 'info', 'unknown_fields')
     _toSchema = {'code': 'code', 'error': 'error', 'info': 'info'}
     _toPy = {'code': 'code', 'error': 'error', 'info': 'info'}
     def __init__(self, code=None, error=None, info=None, **unknown_fields):
@@ -5629,23 +12453,57 @@ class MeterStatusResult(Type):
         info : str
         '''
         self.code = code
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.info = info
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.code = data.get('code')
+        self._raw_error = data.get('error')
+        self.info = data.get('info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'code': self.code, 'error': self._raw_error, 'info': self.info}
 
 
 
 class MeterStatusResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MeterStatusResult]
         '''
-        self.results = [MeterStatusResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [MeterStatusResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Metric(Type):
+    __slots__ = ('key', 'time', 'unknown_fields', 'value')
     _toSchema = {'key': 'key', 'time': 'time', 'value': 'value'}
     _toPy = {'key': 'key', 'time': 'time', 'value': 'value'}
     def __init__(self, key=None, time=None, value=None, **unknown_fields):
@@ -5657,10 +12515,26 @@ class Metric(Type):
         self.key = key
         self.time = time
         self.value = value
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.key = data.get('key')
+        self.time = data.get('time')
+        self.value = data.get('value')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'key': self.key, 'time': self.time, 'value': self.value}
 
 
 
 class MetricBatch(Type):
+    __slots__ = ('_metrics', '_raw_metrics', 'charm_url', 'created', 'unknown_fields', 'uuid')
     _toSchema = {'charm_url': 'charm-url', 'created': 'created', 'metrics': 'metrics', 'uuid': 'uuid'}
     _toPy = {'charm-url': 'charm_url', 'created': 'created', 'metrics': 'metrics', 'uuid': 'uuid'}
     def __init__(self, charm_url=None, created=None, metrics=None, uuid=None, **unknown_fields):
@@ -5672,12 +12546,31 @@ class MetricBatch(Type):
         '''
         self.charm_url = charm_url
         self.created = created
-        self.metrics = [Metric.from_json(o) for o in metrics or []]
+        self._raw_metrics = metrics
         self.uuid = uuid
+        self.unknown_fields = unknown_fields
+
+    metrics = LazyField('metrics', lambda data: [Metric.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.charm_url = data.get('charm-url')
+        self.created = data.get('created')
+        self._raw_metrics = data.get('metrics')
+        self.uuid = data.get('uuid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'charm-url': self.charm_url, 'created': self.created, 'metrics': self._raw_metrics, 'uuid': self.uuid}
 
 
 
 class MetricBatchParam(Type):
+    __slots__ = ('_batch', '_raw_batch', 'tag', 'unknown_fields')
     _toSchema = {'batch': 'batch', 'tag': 'tag'}
     _toPy = {'batch': 'batch', 'tag': 'tag'}
     def __init__(self, batch=None, tag=None, **unknown_fields):
@@ -5685,23 +12578,56 @@ class MetricBatchParam(Type):
         batch : MetricBatch
         tag : str
         '''
-        self.batch = MetricBatch.from_json(batch) if batch else None
+        self._raw_batch = batch
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    batch = LazyField('batch', lambda data: MetricBatch.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_batch = data.get('batch')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'batch': self._raw_batch, 'tag': self.tag}
 
 
 
 class MetricBatchParams(Type):
+    __slots__ = ('_batches', '_raw_batches', 'unknown_fields')
     _toSchema = {'batches': 'batches'}
     _toPy = {'batches': 'batches'}
     def __init__(self, batches=None, **unknown_fields):
         '''
         batches : typing.Sequence[~MetricBatchParam]
         '''
-        self.batches = [MetricBatchParam.from_json(o) for o in batches or []]
+        self._raw_batches = batches
+        self.unknown_fields = unknown_fields
+
+    batches = LazyField('batches', lambda data: [MetricBatchParam.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_batches = data.get('batches')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'batches': self._raw_batches}
 
 
 
 class MetricResult(Type):
+    __slots__ = ('key', 'time', 'unit', 'unknown_fields', 'value')
     _toSchema = {'key': 'key', 'time': 'time', 'unit': 'unit', 'value': 'value'}
     _toPy = {'key': 'key', 'time': 'time', 'unit': 'unit', 'value': 'value'}
     def __init__(self, key=None, time=None, unit=None, value=None, **unknown_fields):
@@ -5715,21 +12641,54 @@ class MetricResult(Type):
         self.time = time
         self.unit = unit
         self.value = value
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.key = data.get('key')
+        self.time = data.get('time')
+        self.unit = data.get('unit')
+        self.value = data.get('value')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'key': self.key, 'time': self.time, 'unit': self.unit, 'value': self.value}
 
 
 
 class MetricResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~EntityMetrics]
         '''
-        self.results = [EntityMetrics.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [EntityMetrics.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class MigrationModelInfo(Type):
+    __slots__ = ('_agent_version', '_raw_agent_version', 'name', 'owner_tag', 'unknown_fields', 'uuid')
     _toSchema = {'agent_version': 'agent-version', 'name': 'name', 'owner_tag': 'owner-tag', 'uuid': 'uuid'}
     _toPy = {'agent-version': 'agent_version', 'name': 'name', 'owner-tag': 'owner_tag', 'uuid': 'uuid'}
     def __init__(self, agent_version=None, name=None, owner_tag=None, uuid=None, **unknown_fields):
@@ -5739,14 +12698,33 @@ class MigrationModelInfo(Type):
         owner_tag : str
         uuid : str
         '''
-        self.agent_version = Number.from_json(agent_version) if agent_version else None
+        self._raw_agent_version = agent_version
         self.name = name
         self.owner_tag = owner_tag
         self.uuid = uuid
+        self.unknown_fields = unknown_fields
+
+    agent_version = LazyField('agent_version', lambda data: Number.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_agent_version = data.get('agent-version')
+        self.name = data.get('name')
+        self.owner_tag = data.get('owner-tag')
+        self.uuid = data.get('uuid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'agent-version': self._raw_agent_version, 'name': self.name, 'owner-tag': self.owner_tag, 'uuid': self.uuid}
 
 
 
 class MigrationSpec(Type):
+    __slots__ = ('_raw_target_info', '_target_info', 'external_control', 'model_tag', 'skip_initial_prechecks', 'unknown_fields')
     _toSchema = {'external_control': 'external-control', 'model_tag': 'model-tag', 'skip_initial_prechecks': 'skip-initial-prechecks', 'target_info': 'target-info'}
     _toPy = {'external-control': 'external_control', 'model-tag': 'model_tag', 'skip-initial-prechecks': 'skip_initial_prechecks', 'target-info': 'target_info'}
     def __init__(self, external_control=None, model_tag=None, skip_initial_prechecks=None, target_info=None, **unknown_fields):
@@ -5759,11 +12737,30 @@ class MigrationSpec(Type):
         self.external_control = external_control
         self.model_tag = model_tag
         self.skip_initial_prechecks = skip_initial_prechecks
-        self.target_info = MigrationTargetInfo.from_json(target_info) if target_info else None
+        self._raw_target_info = target_info
+        self.unknown_fields = unknown_fields
+
+    target_info = LazyField('target_info', lambda data: MigrationTargetInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.external_control = data.get('external-control')
+        self.model_tag = data.get('model-tag')
+        self.skip_initial_prechecks = data.get('skip-initial-prechecks')
+        self._raw_target_info = data.get('target-info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'external-control': self.external_control, 'model-tag': self.model_tag, 'skip-initial-prechecks': self.skip_initial_prechecks, 'target-info': self._raw_target_info}
 
 
 
 class MigrationStatus(Type):
+    __slots__ = ('attempt', 'external_control', 'migration_id', 'phase', 'source_api_addrs', 'source_ca_cert', 'target_api_addrs', 'target_ca_cert', 'unknown_fields')
     _toSchema = {'attempt': 'attempt', 'external_control': 'external-control', 'migration_id': 'migration-id', 'phase': 'phase', 'source_api_addrs': 'source-api-addrs', 'source_ca_cert': 'source-ca-cert', 'target_api_addrs': 'target-api-addrs', 'target_ca_cert': 'target-ca-cert'}
     _toPy = {'attempt': 'attempt', 'external-control': 'external_control', 'migration-id': 'migration_id', 'phase': 'phase', 'source-api-addrs': 'source_api_addrs', 'source-ca-cert': 'source_ca_cert', 'target-api-addrs': 'target_api_addrs', 'target-ca-cert': 'target_ca_cert'}
     def __init__(self, attempt=None, external_control=None, migration_id=None, phase=None, source_api_addrs=None, source_ca_cert=None, target_api_addrs=None, target_ca_cert=None, **unknown_fields):
@@ -5785,10 +12782,31 @@ class MigrationStatus(Type):
         self.source_ca_cert = source_ca_cert
         self.target_api_addrs = target_api_addrs
         self.target_ca_cert = target_ca_cert
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.attempt = data.get('attempt')
+        self.external_control = data.get('external-control')
+        self.migration_id = data.get('migration-id')
+        self.phase = data.get('phase')
+        self.source_api_addrs = data.get('source-api-addrs')
+        self.source_ca_cert = data.get('source-ca-cert')
+        self.target_api_addrs = data.get('target-api-addrs')
+        self.target_ca_cert = data.get('target-ca-cert')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attempt': self.attempt, 'external-control': self.external_control, 'migration-id': self.migration_id, 'phase': self.phase, 'source-api-addrs': self.source_api_addrs, 'source-ca-cert': self.source_ca_cert, 'target-api-addrs': self.target_api_addrs, 'target-ca-cert': self.target_ca_cert}
 
 
 
 class MigrationTargetInfo(Type):
+    __slots__ = ('addrs', 'auth_tag', 'ca_cert', 'controller_tag', 'macaroons', 'password', 'unknown_fields')
     _toSchema = {'addrs': 'addrs', 'auth_tag': 'auth-tag', 'ca_cert': 'ca-cert', 'controller_tag': 'controller-tag', 'macaroons': 'macaroons', 'password': 'password'}
     _toPy = {'addrs': 'addrs', 'auth-tag': 'auth_tag', 'ca-cert': 'ca_cert', 'controller-tag': 'controller_tag', 'macaroons': 'macaroons', 'password': 'password'}
     def __init__(self, addrs=None, auth_tag=None, ca_cert=None, controller_tag=None, macaroons=None, password=None, **unknown_fields):
@@ -5806,10 +12824,29 @@ class MigrationTargetInfo(Type):
         self.controller_tag = controller_tag
         self.macaroons = macaroons
         self.password = password
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.addrs = data.get('addrs')
+        self.auth_tag = data.get('auth-tag')
+        self.ca_cert = data.get('ca-cert')
+        self.controller_tag = data.get('controller-tag')
+        self.macaroons = data.get('macaroons')
+        self.password = data.get('password')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'addrs': self.addrs, 'auth-tag': self.auth_tag, 'ca-cert': self.ca_cert, 'controller-tag': self.controller_tag, 'macaroons': self.macaroons, 'password': self.password}
 
 
 
 class MinionReport(Type):
+    __slots__ = ('migration_id', 'phase', 'success', 'unknown_fields')
     _toSchema = {'migration_id': 'migration-id', 'phase': 'phase', 'success': 'success'}
     _toPy = {'migration-id': 'migration_id', 'phase': 'phase', 'success': 'success'}
     def __init__(self, migration_id=None, phase=None, success=None, **unknown_fields):
@@ -5821,10 +12858,26 @@ class MinionReport(Type):
         self.migration_id = migration_id
         self.phase = phase
         self.success = success
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.migration_id = data.get('migration-id')
+        self.phase = data.get('phase')
+        self.success = data.get('success')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'migration-id': self.migration_id, 'phase': self.phase, 'success': self.success}
 
 
 
 class MinionReports(Type):
+    __slots__ = ('failed', 'migration_id', 'phase', 'success_count', 'unknown_count', 'unknown_fields', 'unknown_sample')
     _toSchema = {'failed': 'failed', 'migration_id': 'migration-id', 'phase': 'phase', 'success_count': 'success-count', 'unknown_count': 'unknown-count', 'unknown_sample': 'unknown-sample'}
     _toPy = {'failed': 'failed', 'migration-id': 'migration_id', 'phase': 'phase', 'success-count': 'success_count', 'unknown-count': 'unknown_count', 'unknown-sample': 'unknown_sample'}
     def __init__(self, failed=None, migration_id=None, phase=None, success_count=None, unknown_count=None, unknown_sample=None, **unknown_fields):
@@ -5842,10 +12895,29 @@ class MinionReports(Type):
         self.success_count = success_count
         self.unknown_count = unknown_count
         self.unknown_sample = unknown_sample
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.failed = data.get('failed')
+        self.migration_id = data.get('migration-id')
+        self.phase = data.get('phase')
+        self.success_count = data.get('success-count')
+        self.unknown_count = data.get('unknown-count')
+        self.unknown_sample = data.get('unknown-sample')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'failed': self.failed, 'migration-id': self.migration_id, 'phase': self.phase, 'success-count': self.success_count, 'unknown-count': self.unknown_count, 'unknown-sample': self.unknown_sample}
 
 
 
 class Model(Type):
+    __slots__ = ('name', 'owner_tag', 'unknown_fields', 'uuid')
     _toSchema = {'name': 'name', 'owner_tag': 'owner-tag', 'uuid': 'uuid'}
     _toPy = {'name': 'name', 'owner-tag': 'owner_tag', 'uuid': 'uuid'}
     def __init__(self, name=None, owner_tag=None, uuid=None, **unknown_fields):
@@ -5857,10 +12929,26 @@ class Model(Type):
         self.name = name
         self.owner_tag = owner_tag
         self.uuid = uuid
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.name = data.get('name')
+        self.owner_tag = data.get('owner-tag')
+        self.uuid = data.get('uuid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'name': self.name, 'owner-tag': self.owner_tag, 'uuid': self.uuid}
 
 
 
 class ModelAccess(Type):
+    __slots__ = ('access', 'model', 'unknown_fields')
     _toSchema = {'access': 'access', 'model': 'model'}
     _toPy = {'access': 'access', 'model': 'model'}
     def __init__(self, access=None, model=None, **unknown_fields):
@@ -5870,10 +12958,25 @@ class ModelAccess(Type):
         '''
         self.access = access
         self.model = model
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.model = data.get('model')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'model': self.model}
 
 
 
 class ModelArgs(Type):
+    __slots__ = ('model_tag', 'unknown_fields')
     _toSchema = {'model_tag': 'model-tag'}
     _toPy = {'model-tag': 'model_tag'}
     def __init__(self, model_tag=None, **unknown_fields):
@@ -5881,10 +12984,24 @@ class ModelArgs(Type):
         model_tag : str
         '''
         self.model_tag = model_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.model_tag = data.get('model-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'model-tag': self.model_tag}
 
 
 
 class ModelBlockInfo(Type):
+    __slots__ = ('blocks', 'model_uuid', 'name', 'owner_tag', 'unknown_fields')
     _toSchema = {'blocks': 'blocks', 'model_uuid': 'model-uuid', 'name': 'name', 'owner_tag': 'owner-tag'}
     _toPy = {'blocks': 'blocks', 'model-uuid': 'model_uuid', 'name': 'name', 'owner-tag': 'owner_tag'}
     def __init__(self, blocks=None, model_uuid=None, name=None, owner_tag=None, **unknown_fields):
@@ -5898,21 +13015,54 @@ class ModelBlockInfo(Type):
         self.model_uuid = model_uuid
         self.name = name
         self.owner_tag = owner_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.blocks = data.get('blocks')
+        self.model_uuid = data.get('model-uuid')
+        self.name = data.get('name')
+        self.owner_tag = data.get('owner-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'blocks': self.blocks, 'model-uuid': self.model_uuid, 'name': self.name, 'owner-tag': self.owner_tag}
 
 
 
 class ModelBlockInfoList(Type):
+    __slots__ = ('_models', '_raw_models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~ModelBlockInfo]
         '''
-        self.models = [ModelBlockInfo.from_json(o) for o in models or []]
+        self._raw_models = models
+        self.unknown_fields = unknown_fields
+
+    models = LazyField('models', lambda data: [ModelBlockInfo.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_models = data.get('models')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'models': self._raw_models}
 
 
 
 class ModelConfigResult(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
     def __init__(self, config=None, **unknown_fields):
@@ -5920,10 +13070,24 @@ class ModelConfigResult(Type):
         config : typing.Mapping[str, typing.Any]
         '''
         self.config = config
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config}
 
 
 
 class ModelConfigResults(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
     def __init__(self, config=None, **unknown_fields):
@@ -5931,10 +13095,24 @@ class ModelConfigResults(Type):
         config : typing.Mapping[str, ~ConfigValue]
         '''
         self.config = config
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config}
 
 
 
 class ModelCreateArgs(Type):
+    __slots__ = ('cloud_tag', 'config', 'credential', 'name', 'owner_tag', 'region', 'unknown_fields')
     _toSchema = {'cloud_tag': 'cloud-tag', 'config': 'config', 'credential': 'credential', 'name': 'name', 'owner_tag': 'owner-tag', 'region': 'region'}
     _toPy = {'cloud-tag': 'cloud_tag', 'config': 'config', 'credential': 'credential', 'name': 'name', 'owner-tag': 'owner_tag', 'region': 'region'}
     def __init__(self, cloud_tag=None, config=None, credential=None, name=None, owner_tag=None, region=None, **unknown_fields):
@@ -5952,10 +13130,29 @@ class ModelCreateArgs(Type):
         self.name = name
         self.owner_tag = owner_tag
         self.region = region
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cloud_tag = data.get('cloud-tag')
+        self.config = data.get('config')
+        self.credential = data.get('credential')
+        self.name = data.get('name')
+        self.owner_tag = data.get('owner-tag')
+        self.region = data.get('region')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud-tag': self.cloud_tag, 'config': self.config, 'credential': self.credential, 'name': self.name, 'owner-tag': self.owner_tag, 'region': self.region}
 
 
 
 class ModelCredential(Type):
+    __slots__ = ('credential_tag', 'exists', 'model_tag', 'unknown_fields', 'valid')
     _toSchema = {'credential_tag': 'credential-tag', 'exists': 'exists', 'model_tag': 'model-tag', 'valid': 'valid'}
     _toPy = {'credential-tag': 'credential_tag', 'exists': 'exists', 'model-tag': 'model_tag', 'valid': 'valid'}
     def __init__(self, credential_tag=None, exists=None, model_tag=None, valid=None, **unknown_fields):
@@ -5969,10 +13166,27 @@ class ModelCredential(Type):
         self.exists = exists
         self.model_tag = model_tag
         self.valid = valid
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.credential_tag = data.get('credential-tag')
+        self.exists = data.get('exists')
+        self.model_tag = data.get('model-tag')
+        self.valid = data.get('valid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credential-tag': self.credential_tag, 'exists': self.exists, 'model-tag': self.model_tag, 'valid': self.valid}
 
 
 
 class ModelDefaultValues(Type):
+    __slots__ = ('cloud_region', 'cloud_tag', 'config', 'unknown_fields')
     _toSchema = {'cloud_region': 'cloud-region', 'cloud_tag': 'cloud-tag', 'config': 'config'}
     _toPy = {'cloud-region': 'cloud_region', 'cloud-tag': 'cloud_tag', 'config': 'config'}
     def __init__(self, cloud_region=None, cloud_tag=None, config=None, **unknown_fields):
@@ -5984,10 +13198,26 @@ class ModelDefaultValues(Type):
         self.cloud_region = cloud_region
         self.cloud_tag = cloud_tag
         self.config = config
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cloud_region = data.get('cloud-region')
+        self.cloud_tag = data.get('cloud-tag')
+        self.config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud-region': self.cloud_region, 'cloud-tag': self.cloud_tag, 'config': self.config}
 
 
 
 class ModelDefaults(Type):
+    __slots__ = ('_raw_regions', '_regions', 'controller', 'default', 'unknown_fields')
     _toSchema = {'controller': 'controller', 'default': 'default', 'regions': 'regions'}
     _toPy = {'controller': 'controller', 'default': 'default', 'regions': 'regions'}
     def __init__(self, controller=None, default=None, regions=None, **unknown_fields):
@@ -5998,11 +13228,29 @@ class ModelDefaults(Type):
         '''
         self.controller = controller
         self.default = default
-        self.regions = [RegionDefaults.from_json(o) for o in regions or []]
+        self._raw_regions = regions
+        self.unknown_fields = unknown_fields
+
+    regions = LazyField('regions', lambda data: [RegionDefaults.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.controller = data.get('controller')
+        self.default = data.get('default')
+        self._raw_regions = data.get('regions')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'controller': self.controller, 'default': self.default, 'regions': self._raw_regions}
 
 
 
 class ModelDefaultsResult(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
     def __init__(self, config=None, **unknown_fields):
@@ -6010,10 +13258,24 @@ class ModelDefaultsResult(Type):
         config : typing.Mapping[str, ~ModelDefaults]
         '''
         self.config = config
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config}
 
 
 
 class ModelEntityCount(Type):
+    __slots__ = ('count', 'entity', 'unknown_fields')
     _toSchema = {'count': 'count', 'entity': 'entity'}
     _toPy = {'count': 'count', 'entity': 'entity'}
     def __init__(self, count=None, entity=None, **unknown_fields):
@@ -6023,10 +13285,25 @@ class ModelEntityCount(Type):
         '''
         self.count = count
         self.entity = entity
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.count = data.get('count')
+        self.entity = data.get('entity')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'count': self.count, 'entity': self.entity}
 
 
 
 class ModelFilesystemInfo(Type):
+    __slots__ = ('detachable', 'id_', 'message', 'provider_id', 'status', 'unknown_fields')
     _toSchema = {'detachable': 'detachable', 'id_': 'id', 'message': 'message', 'provider_id': 'provider-id', 'status': 'status'}
     _toPy = {'detachable': 'detachable', 'id': 'id_', 'message': 'message', 'provider-id': 'provider_id', 'status': 'status'}
     def __init__(self, detachable=None, id_=None, message=None, provider_id=None, status=None, **unknown_fields):
@@ -6042,10 +13319,28 @@ class ModelFilesystemInfo(Type):
         self.message = message
         self.provider_id = provider_id
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.detachable = data.get('detachable')
+        self.id_ = data.get('id')
+        self.message = data.get('message')
+        self.provider_id = data.get('provider-id')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'detachable': self.detachable, 'id': self.id_, 'message': self.message, 'provider-id': self.provider_id, 'status': self.status}
 
 
 
 class ModelInfo(Type):
+    __slots__ = ('_agent_version', '_machines', '_migration', '_raw_agent_version', '_raw_machines', '_raw_migration', '_raw_sla', '_raw_status', '_raw_users', '_sla', '_status', '_users', 'cloud_credential_tag', 'cloud_region', 'cloud_tag', 'controller_uuid', 'default_series', 'life', 'name', 'owner_tag', 'provider_type', 'type_', 'unknown_fields', 'uuid')
     _toSchema = {'agent_version': 'agent-version', 'cloud_credential_tag': 'cloud-credential-tag', 'cloud_region': 'cloud-region', 'cloud_tag': 'cloud-tag', 'controller_uuid': 'controller-uuid', 'default_series': 'default-series', 'life': 'life', 'machines': 'machines', 'migration': 'migration', 'name': 'name', 'owner_tag': 'owner-tag', 'provider_type': 'provider-type', 'sla': 'sla', 'status': 'status', 'type_': 'type', 'users': 'users', 'uuid': 'uuid'}
     _toPy = {'agent-version': 'agent_version', 'cloud-credential-tag': 'cloud_credential_tag', 'cloud-region': 'cloud_region', 'cloud-tag': 'cloud_tag', 'controller-uuid': 'controller_uuid', 'default-series': 'default_series', 'life': 'life', 'machines': 'machines', 'migration': 'migration', 'name': 'name', 'owner-tag': 'owner_tag', 'provider-type': 'provider_type', 'sla': 'sla', 'status': 'status', 'type': 'type_', 'users': 'users', 'uuid': 'uuid'}
     def __init__(self, agent_version=None, cloud_credential_tag=None, cloud_region=None, cloud_tag=None, controller_uuid=None, default_series=None, life=None, machines=None, migration=None, name=None, owner_tag=None, provider_type=None, sla=None, status=None, type_=None, users=None, uuid=None, **unknown_fields):
@@ -6068,27 +13363,64 @@ class ModelInfo(Type):
         users : typing.Sequence[~ModelUserInfo]
         uuid : str
         '''
-        self.agent_version = Number.from_json(agent_version) if agent_version else None
+        self._raw_agent_version = agent_version
         self.cloud_credential_tag = cloud_credential_tag
         self.cloud_region = cloud_region
         self.cloud_tag = cloud_tag
         self.controller_uuid = controller_uuid
         self.default_series = default_series
         self.life = life
-        self.machines = [ModelMachineInfo.from_json(o) for o in machines or []]
-        self.migration = ModelMigrationStatus.from_json(migration) if migration else None
+        self._raw_machines = machines
+        self._raw_migration = migration
         self.name = name
         self.owner_tag = owner_tag
         self.provider_type = provider_type
-        self.sla = ModelSLAInfo.from_json(sla) if sla else None
-        self.status = EntityStatus.from_json(status) if status else None
+        self._raw_sla = sla
+        self._raw_status = status
         self.type_ = type_
-        self.users = [ModelUserInfo.from_json(o) for o in users or []]
+        self._raw_users = users
         self.uuid = uuid
+        self.unknown_fields = unknown_fields
+
+    agent_version = LazyField('agent_version', lambda data: Number.from_json(data) if data else None)
+    machines = LazyField('machines', lambda data: [ModelMachineInfo.from_json(o) for o in data or []])
+    migration = LazyField('migration', lambda data: ModelMigrationStatus.from_json(data) if data else None)
+    sla = LazyField('sla', lambda data: ModelSLAInfo.from_json(data) if data else None)
+    status = LazyField('status', lambda data: EntityStatus.from_json(data) if data else None)
+    users = LazyField('users', lambda data: [ModelUserInfo.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_agent_version = data.get('agent-version')
+        self.cloud_credential_tag = data.get('cloud-credential-tag')
+        self.cloud_region = data.get('cloud-region')
+        self.cloud_tag = data.get('cloud-tag')
+        self.controller_uuid = data.get('controller-uuid')
+        self.default_series = data.get('default-series')
+        self.life = data.get('life')
+        self._raw_machines = data.get('machines')
+        self._raw_migration = data.get('migration')
+        self.name = data.get('name')
+        self.owner_tag = data.get('owner-tag')
+        self.provider_type = data.get('provider-type')
+        self._raw_sla = data.get('sla')
+        self._raw_status = data.get('status')
+        self.type_ = data.get('type')
+        self._raw_users = data.get('users')
+        self.uuid = data.get('uuid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'agent-version': self._raw_agent_version, 'cloud-credential-tag': self.cloud_credential_tag, 'cloud-region': self.cloud_region, 'cloud-tag': self.cloud_tag, 'controller-uuid': self.controller_uuid, 'default-series': self.default_series, 'life': self.life, 'machines': self._raw_machines, 'migration': self._raw_migration, 'name': self.name, 'owner-tag': self.owner_tag, 'provider-type': self.provider_type, 'sla': self._raw_sla, 'status': self._raw_status, 'type': self.type_, 'users': self._raw_users, 'uuid': self.uuid}
 
 
 
 class ModelInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -6096,45 +13428,111 @@ class ModelInfoResult(Type):
         error : Error
         result : ModelInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ModelInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ModelInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ModelInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ModelInfoResult]
         '''
-        self.results = [ModelInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ModelInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ModelInstanceTypesConstraint(Type):
+    __slots__ = ('_raw_value', '_value', 'unknown_fields')
     _toSchema = {'value': 'value'}
     _toPy = {'value': 'value'}
     def __init__(self, value=None, **unknown_fields):
         '''
         value : Value
         '''
-        self.value = Value.from_json(value) if value else None
+        self._raw_value = value
+        self.unknown_fields = unknown_fields
+
+    value = LazyField('value', lambda data: Value.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_value = data.get('value')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'value': self._raw_value}
 
 
 
 class ModelInstanceTypesConstraints(Type):
+    __slots__ = ('_constraints', '_raw_constraints', 'unknown_fields')
     _toSchema = {'constraints': 'constraints'}
     _toPy = {'constraints': 'constraints'}
     def __init__(self, constraints=None, **unknown_fields):
         '''
         constraints : typing.Sequence[~ModelInstanceTypesConstraint]
         '''
-        self.constraints = [ModelInstanceTypesConstraint.from_json(o) for o in constraints or []]
+        self._raw_constraints = constraints
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: [ModelInstanceTypesConstraint.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_constraints = data.get('constraints')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'constraints': self._raw_constraints}
 
 
 
 class ModelMachineInfo(Type):
+    __slots__ = ('_hardware', '_raw_hardware', 'has_vote', 'id_', 'instance_id', 'status', 'unknown_fields', 'wants_vote')
     _toSchema = {'hardware': 'hardware', 'has_vote': 'has-vote', 'id_': 'id', 'instance_id': 'instance-id', 'status': 'status', 'wants_vote': 'wants-vote'}
     _toPy = {'hardware': 'hardware', 'has-vote': 'has_vote', 'id': 'id_', 'instance-id': 'instance_id', 'status': 'status', 'wants-vote': 'wants_vote'}
     def __init__(self, hardware=None, has_vote=None, id_=None, instance_id=None, status=None, wants_vote=None, **unknown_fields):
@@ -6146,16 +13544,37 @@ class ModelMachineInfo(Type):
         status : str
         wants_vote : bool
         '''
-        self.hardware = MachineHardware.from_json(hardware) if hardware else None
+        self._raw_hardware = hardware
         self.has_vote = has_vote
         self.id_ = id_
         self.instance_id = instance_id
         self.status = status
         self.wants_vote = wants_vote
+        self.unknown_fields = unknown_fields
+
+    hardware = LazyField('hardware', lambda data: MachineHardware.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_hardware = data.get('hardware')
+        self.has_vote = data.get('has-vote')
+        self.id_ = data.get('id')
+        self.instance_id = data.get('instance-id')
+        self.status = data.get('status')
+        self.wants_vote = data.get('wants-vote')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'hardware': self._raw_hardware, 'has-vote': self.has_vote, 'id': self.id_, 'instance-id': self.instance_id, 'status': self.status, 'wants-vote': self.wants_vote}
 
 
 
 class ModelMigrationStatus(Type):
+    __slots__ = ('end', 'start', 'status', 'unknown_fields')
     _toSchema = {'end': 'end', 'start': 'start', 'status': 'status'}
     _toPy = {'end': 'end', 'start': 'start', 'status': 'status'}
     def __init__(self, end=None, start=None, status=None, **unknown_fields):
@@ -6167,10 +13586,26 @@ class ModelMigrationStatus(Type):
         self.end = end
         self.start = start
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.end = data.get('end')
+        self.start = data.get('start')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'end': self.end, 'start': self.start, 'status': self.status}
 
 
 
 class ModelResult(Type):
+    __slots__ = ('_error', '_raw_error', 'name', 'unknown_fields', 'uuid')
     _toSchema = {'error': 'error', 'name': 'name', 'uuid': 'uuid'}
     _toPy = {'error': 'error', 'name': 'name', 'uuid': 'uuid'}
     def __init__(self, error=None, name=None, uuid=None, **unknown_fields):
@@ -6179,13 +13614,31 @@ class ModelResult(Type):
         name : str
         uuid : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.name = name
         self.uuid = uuid
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.name = data.get('name')
+        self.uuid = data.get('uuid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'name': self.name, 'uuid': self.uuid}
 
 
 
 class ModelSLA(Type):
+    __slots__ = ('creds', 'level', 'unknown_fields')
     _toSchema = {'creds': 'creds', 'level': 'level'}
     _toPy = {'creds': 'creds', 'level': 'level'}
     def __init__(self, creds=None, level=None, **unknown_fields):
@@ -6195,10 +13648,25 @@ class ModelSLA(Type):
         '''
         self.creds = creds
         self.level = level
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.creds = data.get('creds')
+        self.level = data.get('level')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'creds': self.creds, 'level': self.level}
 
 
 
 class ModelSLAInfo(Type):
+    __slots__ = ('level', 'owner', 'unknown_fields')
     _toSchema = {'level': 'level', 'owner': 'owner'}
     _toPy = {'level': 'level', 'owner': 'owner'}
     def __init__(self, level=None, owner=None, **unknown_fields):
@@ -6208,10 +13676,25 @@ class ModelSLAInfo(Type):
         '''
         self.level = level
         self.owner = owner
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.level = data.get('level')
+        self.owner = data.get('owner')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'level': self.level, 'owner': self.owner}
 
 
 
 class ModelSequencesResult(Type):
+    __slots__ = ('sequences', 'unknown_fields')
     _toSchema = {'sequences': 'sequences'}
     _toPy = {'sequences': 'sequences'}
     def __init__(self, sequences=None, **unknown_fields):
@@ -6219,10 +13702,24 @@ class ModelSequencesResult(Type):
         sequences : typing.Mapping[str, int]
         '''
         self.sequences = sequences
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.sequences = data.get('sequences')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'sequences': self.sequences}
 
 
 
 class ModelSet(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
     def __init__(self, config=None, **unknown_fields):
@@ -6230,10 +13727,24 @@ class ModelSet(Type):
         config : typing.Mapping[str, typing.Any]
         '''
         self.config = config
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self.config}
 
 
 
 class ModelStatus(Type):
+    __slots__ = ('_machines', '_raw_machines', 'application_count', 'hosted_machine_count', 'life', 'model_tag', 'owner_tag', 'unknown_fields')
     _toSchema = {'application_count': 'application-count', 'hosted_machine_count': 'hosted-machine-count', 'life': 'life', 'machines': 'machines', 'model_tag': 'model-tag', 'owner_tag': 'owner-tag'}
     _toPy = {'application-count': 'application_count', 'hosted-machine-count': 'hosted_machine_count', 'life': 'life', 'machines': 'machines', 'model-tag': 'model_tag', 'owner-tag': 'owner_tag'}
     def __init__(self, application_count=None, hosted_machine_count=None, life=None, machines=None, model_tag=None, owner_tag=None, **unknown_fields):
@@ -6248,13 +13759,34 @@ class ModelStatus(Type):
         self.application_count = application_count
         self.hosted_machine_count = hosted_machine_count
         self.life = life
-        self.machines = [ModelMachineInfo.from_json(o) for o in machines or []]
+        self._raw_machines = machines
         self.model_tag = model_tag
         self.owner_tag = owner_tag
+        self.unknown_fields = unknown_fields
+
+    machines = LazyField('machines', lambda data: [ModelMachineInfo.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_count = data.get('application-count')
+        self.hosted_machine_count = data.get('hosted-machine-count')
+        self.life = data.get('life')
+        self._raw_machines = data.get('machines')
+        self.model_tag = data.get('model-tag')
+        self.owner_tag = data.get('owner-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-count': self.application_count, 'hosted-machine-count': self.hosted_machine_count, 'life': self.life, 'machines': self._raw_machines, 'model-tag': self.model_tag, 'owner-tag': self.owner_tag}
 
 
 
 class ModelStatusInfo(Type):
+    __slots__ = ('_meter_status', '_model_status', '_raw_meter_status', '_raw_model_status', 'available_version', 'cloud_tag', 'name', 'region', 'sla', 'type_', 'unknown_fields', 'version')
     _toSchema = {'available_version': 'available-version', 'cloud_tag': 'cloud-tag', 'meter_status': 'meter-status', 'model_status': 'model-status', 'name': 'name', 'region': 'region', 'sla': 'sla', 'type_': 'type', 'version': 'version'}
     _toPy = {'available-version': 'available_version', 'cloud-tag': 'cloud_tag', 'meter-status': 'meter_status', 'model-status': 'model_status', 'name': 'name', 'region': 'region', 'sla': 'sla', 'type': 'type_', 'version': 'version'}
     def __init__(self, available_version=None, cloud_tag=None, meter_status=None, model_status=None, name=None, region=None, sla=None, type_=None, version=None, **unknown_fields):
@@ -6271,28 +13803,69 @@ class ModelStatusInfo(Type):
         '''
         self.available_version = available_version
         self.cloud_tag = cloud_tag
-        self.meter_status = MeterStatus.from_json(meter_status) if meter_status else None
-        self.model_status = DetailedStatus.from_json(model_status) if model_status else None
+        self._raw_meter_status = meter_status
+        self._raw_model_status = model_status
         self.name = name
         self.region = region
         self.sla = sla
         self.type_ = type_
         self.version = version
+        self.unknown_fields = unknown_fields
+
+    meter_status = LazyField('meter_status', lambda data: MeterStatus.from_json(data) if data else None)
+    model_status = LazyField('model_status', lambda data: DetailedStatus.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.available_version = data.get('available-version')
+        self.cloud_tag = data.get('cloud-tag')
+        self._raw_meter_status = data.get('meter-status')
+        self._raw_model_status = data.get('model-status')
+        self.name = data.get('name')
+        self.region = data.get('region')
+        self.sla = data.get('sla')
+        self.type_ = data.get('type')
+        self.version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'available-version': self.available_version, 'cloud-tag': self.cloud_tag, 'meter-status': self._raw_meter_status, 'model-status': self._raw_model_status, 'name': self.name, 'region': self.region, 'sla': self.sla, 'type': self.type_, 'version': self.version}
 
 
 
 class ModelStatusResults(Type):
+    __slots__ = ('_models', '_raw_models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~ModelStatus]
         '''
-        self.models = [ModelStatus.from_json(o) for o in models or []]
+        self._raw_models = models
+        self.unknown_fields = unknown_fields
+
+    models = LazyField('models', lambda data: [ModelStatus.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_models = data.get('models')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'models': self._raw_models}
 
 
 
 class ModelSummariesRequest(Type):
+    __slots__ = ('all_', 'unknown_fields', 'user_tag')
     _toSchema = {'all_': 'all', 'user_tag': 'user-tag'}
     _toPy = {'all': 'all_', 'user-tag': 'user_tag'}
     def __init__(self, all_=None, user_tag=None, **unknown_fields):
@@ -6302,10 +13875,25 @@ class ModelSummariesRequest(Type):
         '''
         self.all_ = all_
         self.user_tag = user_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.all_ = data.get('all')
+        self.user_tag = data.get('user-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'all': self.all_, 'user-tag': self.user_tag}
 
 
 
 class ModelSummary(Type):
+    __slots__ = ('_agent_version', '_counts', '_migration', '_raw_agent_version', '_raw_counts', '_raw_migration', '_raw_sla', '_raw_status', '_sla', '_status', 'cloud_credential_tag', 'cloud_region', 'cloud_tag', 'controller_uuid', 'default_series', 'last_connection', 'life', 'name', 'owner_tag', 'provider_type', 'type_', 'unknown_fields', 'user_access', 'uuid')
     _toSchema = {'agent_version': 'agent-version', 'cloud_credential_tag': 'cloud-credential-tag', 'cloud_region': 'cloud-region', 'cloud_tag': 'cloud-tag', 'controller_uuid': 'controller-uuid', 'counts': 'counts', 'default_series': 'default-series', 'last_connection': 'last-connection', 'life': 'life', 'migration': 'migration', 'name': 'name', 'owner_tag': 'owner-tag', 'provider_type': 'provider-type', 'sla': 'sla', 'status': 'status', 'type_': 'type', 'user_access': 'user-access', 'uuid': 'uuid'}
     _toPy = {'agent-version': 'agent_version', 'cloud-credential-tag': 'cloud_credential_tag', 'cloud-region': 'cloud_region', 'cloud-tag': 'cloud_tag', 'controller-uuid': 'controller_uuid', 'counts': 'counts', 'default-series': 'default_series', 'last-connection': 'last_connection', 'life': 'life', 'migration': 'migration', 'name': 'name', 'owner-tag': 'owner_tag', 'provider-type': 'provider_type', 'sla': 'sla', 'status': 'status', 'type': 'type_', 'user-access': 'user_access', 'uuid': 'uuid'}
     def __init__(self, agent_version=None, cloud_credential_tag=None, cloud_region=None, cloud_tag=None, controller_uuid=None, counts=None, default_series=None, last_connection=None, life=None, migration=None, name=None, owner_tag=None, provider_type=None, sla=None, status=None, type_=None, user_access=None, uuid=None, **unknown_fields):
@@ -6329,28 +13917,65 @@ class ModelSummary(Type):
         user_access : str
         uuid : str
         '''
-        self.agent_version = Number.from_json(agent_version) if agent_version else None
+        self._raw_agent_version = agent_version
         self.cloud_credential_tag = cloud_credential_tag
         self.cloud_region = cloud_region
         self.cloud_tag = cloud_tag
         self.controller_uuid = controller_uuid
-        self.counts = [ModelEntityCount.from_json(o) for o in counts or []]
+        self._raw_counts = counts
         self.default_series = default_series
         self.last_connection = last_connection
         self.life = life
-        self.migration = ModelMigrationStatus.from_json(migration) if migration else None
+        self._raw_migration = migration
         self.name = name
         self.owner_tag = owner_tag
         self.provider_type = provider_type
-        self.sla = ModelSLAInfo.from_json(sla) if sla else None
-        self.status = EntityStatus.from_json(status) if status else None
+        self._raw_sla = sla
+        self._raw_status = status
         self.type_ = type_
         self.user_access = user_access
         self.uuid = uuid
+        self.unknown_fields = unknown_fields
+
+    agent_version = LazyField('agent_version', lambda data: Number.from_json(data) if data else None)
+    counts = LazyField('counts', lambda data: [ModelEntityCount.from_json(o) for o in data or []])
+    migration = LazyField('migration', lambda data: ModelMigrationStatus.from_json(data) if data else None)
+    sla = LazyField('sla', lambda data: ModelSLAInfo.from_json(data) if data else None)
+    status = LazyField('status', lambda data: EntityStatus.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_agent_version = data.get('agent-version')
+        self.cloud_credential_tag = data.get('cloud-credential-tag')
+        self.cloud_region = data.get('cloud-region')
+        self.cloud_tag = data.get('cloud-tag')
+        self.controller_uuid = data.get('controller-uuid')
+        self._raw_counts = data.get('counts')
+        self.default_series = data.get('default-series')
+        self.last_connection = data.get('last-connection')
+        self.life = data.get('life')
+        self._raw_migration = data.get('migration')
+        self.name = data.get('name')
+        self.owner_tag = data.get('owner-tag')
+        self.provider_type = data.get('provider-type')
+        self._raw_sla = data.get('sla')
+        self._raw_status = data.get('status')
+        self.type_ = data.get('type')
+        self.user_access = data.get('user-access')
+        self.uuid = data.get('uuid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'agent-version': self._raw_agent_version, 'cloud-credential-tag': self.cloud_credential_tag, 'cloud-region': self.cloud_region, 'cloud-tag': self.cloud_tag, 'controller-uuid': self.controller_uuid, 'counts': self._raw_counts, 'default-series': self.default_series, 'last-connection': self.last_connection, 'life': self.life, 'migration': self._raw_migration, 'name': self.name, 'owner-tag': self.owner_tag, 'provider-type': self.provider_type, 'sla': self._raw_sla, 'status': self._raw_status, 'type': self.type_, 'user-access': self.user_access, 'uuid': self.uuid}
 
 
 
 class ModelSummaryResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -6358,34 +13983,80 @@ class ModelSummaryResult(Type):
         error : Error
         result : ModelSummary
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ModelSummary.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ModelSummary.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ModelSummaryResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ModelSummaryResult]
         '''
-        self.results = [ModelSummaryResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ModelSummaryResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ModelTag(Type):
+    __slots__ = ('unknown_fields',)
     _toSchema = {}
     _toPy = {}
     def __init__(self, **unknown_fields):
         '''
 
         '''
-        pass
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {}
 
 
 
 class ModelUnset(Type):
+    __slots__ = ('keys', 'unknown_fields')
     _toSchema = {'keys': 'keys'}
     _toPy = {'keys': 'keys'}
     def __init__(self, keys=None, **unknown_fields):
@@ -6393,10 +14064,24 @@ class ModelUnset(Type):
         keys : typing.Sequence[str]
         '''
         self.keys = keys
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.keys = data.get('keys')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'keys': self.keys}
 
 
 
 class ModelUnsetKeys(Type):
+    __slots__ = ('cloud_region', 'cloud_tag', 'keys', 'unknown_fields')
     _toSchema = {'cloud_region': 'cloud-region', 'cloud_tag': 'cloud-tag', 'keys': 'keys'}
     _toPy = {'cloud-region': 'cloud_region', 'cloud-tag': 'cloud_tag', 'keys': 'keys'}
     def __init__(self, cloud_region=None, cloud_tag=None, keys=None, **unknown_fields):
@@ -6408,10 +14093,26 @@ class ModelUnsetKeys(Type):
         self.cloud_region = cloud_region
         self.cloud_tag = cloud_tag
         self.keys = keys
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cloud_region = data.get('cloud-region')
+        self.cloud_tag = data.get('cloud-tag')
+        self.keys = data.get('keys')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud-region': self.cloud_region, 'cloud-tag': self.cloud_tag, 'keys': self.keys}
 
 
 
 class ModelUserInfo(Type):
+    __slots__ = ('access', 'display_name', 'last_connection', 'unknown_fields', 'user')
     _toSchema = {'access': 'access', 'display_name': 'display-name', 'last_connection': 'last-connection', 'user': 'user'}
     _toPy = {'access': 'access', 'display-name': 'display_name', 'last-connection': 'last_connection', 'user': 'user'}
     def __init__(self, access=None, display_name=None, last_connection=None, user=None, **unknown_fields):
@@ -6425,10 +14126,27 @@ class ModelUserInfo(Type):
         self.display_name = display_name
         self.last_connection = last_connection
         self.user = user
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.display_name = data.get('display-name')
+        self.last_connection = data.get('last-connection')
+        self.user = data.get('user')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'display-name': self.display_name, 'last-connection': self.last_connection, 'user': self.user}
 
 
 
 class ModelUserInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -6436,23 +14154,57 @@ class ModelUserInfoResult(Type):
         error : Error
         result : ModelUserInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ModelUserInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ModelUserInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ModelUserInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ModelUserInfoResult]
         '''
-        self.results = [ModelUserInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ModelUserInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ModelVolumeInfo(Type):
+    __slots__ = ('detachable', 'id_', 'message', 'provider_id', 'status', 'unknown_fields')
     _toSchema = {'detachable': 'detachable', 'id_': 'id', 'message': 'message', 'provider_id': 'provider-id', 'status': 'status'}
     _toPy = {'detachable': 'detachable', 'id': 'id_', 'message': 'message', 'provider-id': 'provider_id', 'status': 'status'}
     def __init__(self, detachable=None, id_=None, message=None, provider_id=None, status=None, **unknown_fields):
@@ -6468,10 +14220,28 @@ class ModelVolumeInfo(Type):
         self.message = message
         self.provider_id = provider_id
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.detachable = data.get('detachable')
+        self.id_ = data.get('id')
+        self.message = data.get('message')
+        self.provider_id = data.get('provider-id')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'detachable': self.detachable, 'id': self.id_, 'message': self.message, 'provider-id': self.provider_id, 'status': self.status}
 
 
 
 class ModifyCloudAccess(Type):
+    __slots__ = ('access', 'action', 'cloud_tag', 'unknown_fields', 'user_tag')
     _toSchema = {'access': 'access', 'action': 'action', 'cloud_tag': 'cloud-tag', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'action': 'action', 'cloud-tag': 'cloud_tag', 'user-tag': 'user_tag'}
     def __init__(self, access=None, action=None, cloud_tag=None, user_tag=None, **unknown_fields):
@@ -6485,21 +14255,54 @@ class ModifyCloudAccess(Type):
         self.action = action
         self.cloud_tag = cloud_tag
         self.user_tag = user_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.action = data.get('action')
+        self.cloud_tag = data.get('cloud-tag')
+        self.user_tag = data.get('user-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'action': self.action, 'cloud-tag': self.cloud_tag, 'user-tag': self.user_tag}
 
 
 
 class ModifyCloudAccessRequest(Type):
+    __slots__ = ('_changes', '_raw_changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~ModifyCloudAccess]
         '''
-        self.changes = [ModifyCloudAccess.from_json(o) for o in changes or []]
+        self._raw_changes = changes
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [ModifyCloudAccess.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes}
 
 
 
 class ModifyControllerAccess(Type):
+    __slots__ = ('access', 'action', 'unknown_fields', 'user_tag')
     _toSchema = {'access': 'access', 'action': 'action', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'action': 'action', 'user-tag': 'user_tag'}
     def __init__(self, access=None, action=None, user_tag=None, **unknown_fields):
@@ -6511,21 +14314,53 @@ class ModifyControllerAccess(Type):
         self.access = access
         self.action = action
         self.user_tag = user_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.action = data.get('action')
+        self.user_tag = data.get('user-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'action': self.action, 'user-tag': self.user_tag}
 
 
 
 class ModifyControllerAccessRequest(Type):
+    __slots__ = ('_changes', '_raw_changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~ModifyControllerAccess]
         '''
-        self.changes = [ModifyControllerAccess.from_json(o) for o in changes or []]
+        self._raw_changes = changes
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [ModifyControllerAccess.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes}
 
 
 
 class ModifyModelAccess(Type):
+    __slots__ = ('access', 'action', 'model_tag', 'unknown_fields', 'user_tag')
     _toSchema = {'access': 'access', 'action': 'action', 'model_tag': 'model-tag', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'action': 'action', 'model-tag': 'model_tag', 'user-tag': 'user_tag'}
     def __init__(self, access=None, action=None, model_tag=None, user_tag=None, **unknown_fields):
@@ -6539,21 +14374,54 @@ class ModifyModelAccess(Type):
         self.action = action
         self.model_tag = model_tag
         self.user_tag = user_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.action = data.get('action')
+        self.model_tag = data.get('model-tag')
+        self.user_tag = data.get('user-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'action': self.action, 'model-tag': self.model_tag, 'user-tag': self.user_tag}
 
 
 
 class ModifyModelAccessRequest(Type):
+    __slots__ = ('_changes', '_raw_changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~ModifyModelAccess]
         '''
-        self.changes = [ModifyModelAccess.from_json(o) for o in changes or []]
+        self._raw_changes = changes
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [ModifyModelAccess.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes}
 
 
 
 class ModifyOfferAccess(Type):
+    __slots__ = ('access', 'action', 'offer_url', 'unknown_fields', 'user_tag')
     _toSchema = {'access': 'access', 'action': 'action', 'offer_url': 'offer-url', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'action': 'action', 'offer-url': 'offer_url', 'user-tag': 'user_tag'}
     def __init__(self, access=None, action=None, offer_url=None, user_tag=None, **unknown_fields):
@@ -6567,21 +14435,54 @@ class ModifyOfferAccess(Type):
         self.action = action
         self.offer_url = offer_url
         self.user_tag = user_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.action = data.get('action')
+        self.offer_url = data.get('offer-url')
+        self.user_tag = data.get('user-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'action': self.action, 'offer-url': self.offer_url, 'user-tag': self.user_tag}
 
 
 
 class ModifyOfferAccessRequest(Type):
+    __slots__ = ('_changes', '_raw_changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~ModifyOfferAccess]
         '''
-        self.changes = [ModifyOfferAccess.from_json(o) for o in changes or []]
+        self._raw_changes = changes
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [ModifyOfferAccess.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes}
 
 
 
 class ModifyUserSSHKeys(Type):
+    __slots__ = ('ssh_keys', 'unknown_fields', 'user')
     _toSchema = {'ssh_keys': 'ssh-keys', 'user': 'user'}
     _toPy = {'ssh-keys': 'ssh_keys', 'user': 'user'}
     def __init__(self, ssh_keys=None, user=None, **unknown_fields):
@@ -6591,10 +14492,25 @@ class ModifyUserSSHKeys(Type):
         '''
         self.ssh_keys = ssh_keys
         self.user = user
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.ssh_keys = data.get('ssh-keys')
+        self.user = data.get('user')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ssh-keys': self.ssh_keys, 'user': self.user}
 
 
 
 class MongoUpgradeResults(Type):
+    __slots__ = ('_ha_members', '_master', '_raw_ha_members', '_raw_master', '_raw_rs_members', '_rs_members', 'unknown_fields')
     _toSchema = {'ha_members': 'ha-members', 'master': 'master', 'rs_members': 'rs-members'}
     _toPy = {'ha-members': 'ha_members', 'master': 'master', 'rs-members': 'rs_members'}
     def __init__(self, ha_members=None, master=None, rs_members=None, **unknown_fields):
@@ -6603,13 +14519,33 @@ class MongoUpgradeResults(Type):
         master : HAMember
         rs_members : typing.Sequence[~Member]
         '''
-        self.ha_members = [HAMember.from_json(o) for o in ha_members or []]
-        self.master = HAMember.from_json(master) if master else None
-        self.rs_members = [Member.from_json(o) for o in rs_members or []]
+        self._raw_ha_members = ha_members
+        self._raw_master = master
+        self._raw_rs_members = rs_members
+        self.unknown_fields = unknown_fields
+
+    ha_members = LazyField('ha_members', lambda data: [HAMember.from_json(o) for o in data or []])
+    master = LazyField('master', lambda data: HAMember.from_json(data) if data else None)
+    rs_members = LazyField('rs_members', lambda data: [Member.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_ha_members = data.get('ha-members')
+        self._raw_master = data.get('master')
+        self._raw_rs_members = data.get('rs-members')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ha-members': self._raw_ha_members, 'master': self._raw_master, 'rs-members': self._raw_rs_members}
 
 
 
 class MongoVersion(Type):
+    __slots__ = ('engine', 'major', 'minor', 'patch', 'unknown_fields')
     _toSchema = {'engine': 'engine', 'major': 'major', 'minor': 'minor', 'patch': 'patch'}
     _toPy = {'engine': 'engine', 'major': 'major', 'minor': 'minor', 'patch': 'patch'}
     def __init__(self, engine=None, major=None, minor=None, patch=None, **unknown_fields):
@@ -6623,10 +14559,27 @@ class MongoVersion(Type):
         self.major = major
         self.minor = minor
         self.patch = patch
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.engine = data.get('engine')
+        self.major = data.get('major')
+        self.minor = data.get('minor')
+        self.patch = data.get('patch')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'engine': self.engine, 'major': self.major, 'minor': self.minor, 'patch': self.patch}
 
 
 
 class NetworkConfig(Type):
+    __slots__ = ('address', 'cidr', 'config_type', 'device_index', 'disabled', 'dns_search_domains', 'dns_servers', 'gateway_address', 'interface_name', 'interface_type', 'mac_address', 'mtu', 'no_auto_start', 'parent_interface_name', 'provider_address_id', 'provider_id', 'provider_space_id', 'provider_subnet_id', 'provider_vlan_id', 'unknown_fields', 'vlan_tag')
     _toSchema = {'address': 'address', 'cidr': 'cidr', 'config_type': 'config-type', 'device_index': 'device-index', 'disabled': 'disabled', 'dns_search_domains': 'dns-search-domains', 'dns_servers': 'dns-servers', 'gateway_address': 'gateway-address', 'interface_name': 'interface-name', 'interface_type': 'interface-type', 'mac_address': 'mac-address', 'mtu': 'mtu', 'no_auto_start': 'no-auto-start', 'parent_interface_name': 'parent-interface-name', 'provider_address_id': 'provider-address-id', 'provider_id': 'provider-id', 'provider_space_id': 'provider-space-id', 'provider_subnet_id': 'provider-subnet-id', 'provider_vlan_id': 'provider-vlan-id', 'vlan_tag': 'vlan-tag'}
     _toPy = {'address': 'address', 'cidr': 'cidr', 'config-type': 'config_type', 'device-index': 'device_index', 'disabled': 'disabled', 'dns-search-domains': 'dns_search_domains', 'dns-servers': 'dns_servers', 'gateway-address': 'gateway_address', 'interface-name': 'interface_name', 'interface-type': 'interface_type', 'mac-address': 'mac_address', 'mtu': 'mtu', 'no-auto-start': 'no_auto_start', 'parent-interface-name': 'parent_interface_name', 'provider-address-id': 'provider_address_id', 'provider-id': 'provider_id', 'provider-space-id': 'provider_space_id', 'provider-subnet-id': 'provider_subnet_id', 'provider-vlan-id': 'provider_vlan_id', 'vlan-tag': 'vlan_tag'}
     def __init__(self, address=None, cidr=None, config_type=None, device_index=None, disabled=None, dns_search_domains=None, dns_servers=None, gateway_address=None, interface_name=None, interface_type=None, mac_address=None, mtu=None, no_auto_start=None, parent_interface_name=None, provider_address_id=None, provider_id=None, provider_space_id=None, provider_subnet_id=None, provider_vlan_id=None, vlan_tag=None, **unknown_fields):
@@ -6672,10 +14625,43 @@ class NetworkConfig(Type):
         self.provider_subnet_id = provider_subnet_id
         self.provider_vlan_id = provider_vlan_id
         self.vlan_tag = vlan_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.address = data.get('address')
+        self.cidr = data.get('cidr')
+        self.config_type = data.get('config-type')
+        self.device_index = data.get('device-index')
+        self.disabled = data.get('disabled')
+        self.dns_search_domains = data.get('dns-search-domains')
+        self.dns_servers = data.get('dns-servers')
+        self.gateway_address = data.get('gateway-address')
+        self.interface_name = data.get('interface-name')
+        self.interface_type = data.get('interface-type')
+        self.mac_address = data.get('mac-address')
+        self.mtu = data.get('mtu')
+        self.no_auto_start = data.get('no-auto-start')
+        self.parent_interface_name = data.get('parent-interface-name')
+        self.provider_address_id = data.get('provider-address-id')
+        self.provider_id = data.get('provider-id')
+        self.provider_space_id = data.get('provider-space-id')
+        self.provider_subnet_id = data.get('provider-subnet-id')
+        self.provider_vlan_id = data.get('provider-vlan-id')
+        self.vlan_tag = data.get('vlan-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'address': self.address, 'cidr': self.cidr, 'config-type': self.config_type, 'device-index': self.device_index, 'disabled': self.disabled, 'dns-search-domains': self.dns_search_domains, 'dns-servers': self.dns_servers, 'gateway-address': self.gateway_address, 'interface-name': self.interface_name, 'interface-type': self.interface_type, 'mac-address': self.mac_address, 'mtu': self.mtu, 'no-auto-start': self.no_auto_start, 'parent-interface-name': self.parent_interface_name, 'provider-address-id': self.provider_address_id, 'provider-id': self.provider_id, 'provider-space-id': self.provider_space_id, 'provider-subnet-id': self.provider_subnet_id, 'provider-vlan-id': self.provider_vlan_id, 'vlan-tag': self.vlan_tag}
 
 
 
 class NetworkInfo(Type):
+    __slots__ = ('_addresses', '_raw_addresses', 'interface_name', 'mac_address', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'interface_name': 'interface-name', 'mac_address': 'mac-address'}
     _toPy = {'addresses': 'addresses', 'interface-name': 'interface_name', 'mac-address': 'mac_address'}
     def __init__(self, addresses=None, interface_name=None, mac_address=None, **unknown_fields):
@@ -6684,13 +14670,31 @@ class NetworkInfo(Type):
         interface_name : str
         mac_address : str
         '''
-        self.addresses = [InterfaceAddress.from_json(o) for o in addresses or []]
+        self._raw_addresses = addresses
         self.interface_name = interface_name
         self.mac_address = mac_address
+        self.unknown_fields = unknown_fields
+
+    addresses = LazyField('addresses', lambda data: [InterfaceAddress.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_addresses = data.get('addresses')
+        self.interface_name = data.get('interface-name')
+        self.mac_address = data.get('mac-address')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'addresses': self._raw_addresses, 'interface-name': self.interface_name, 'mac-address': self.mac_address}
 
 
 
 class NetworkInfoParams(Type):
+    __slots__ = ('bindings', 'unit', 'unknown_fields')
     _toSchema = {'bindings': 'bindings', 'unit': 'unit'}
     _toPy = {'bindings': 'bindings', 'unit': 'unit'}
     def __init__(self, bindings=None, unit=None, **unknown_fields):
@@ -6700,10 +14704,25 @@ class NetworkInfoParams(Type):
         '''
         self.bindings = bindings
         self.unit = unit
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.bindings = data.get('bindings')
+        self.unit = data.get('unit')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'bindings': self.bindings, 'unit': self.unit}
 
 
 
 class NetworkInfoResult(Type):
+    __slots__ = ('_error', '_network_info', '_raw_error', '_raw_network_info', 'unknown_fields')
     _toSchema = {'error': 'error', 'network_info': 'network-info'}
     _toPy = {'error': 'error', 'network-info': 'network_info'}
     def __init__(self, error=None, network_info=None, **unknown_fields):
@@ -6711,12 +14730,30 @@ class NetworkInfoResult(Type):
         error : Error
         network_info : typing.Sequence[~NetworkInfo]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.network_info = [NetworkInfo.from_json(o) for o in network_info or []]
+        self._raw_error = error
+        self._raw_network_info = network_info
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    network_info = LazyField('network_info', lambda data: [NetworkInfo.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_network_info = data.get('network-info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'network-info': self._raw_network_info}
 
 
 
 class NetworkInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
@@ -6724,10 +14761,24 @@ class NetworkInfoResults(Type):
         results : typing.Mapping[str, ~NetworkInfoResult]
         '''
         self.results = results
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self.results}
 
 
 
 class NetworkInterface(Type):
+    __slots__ = ('dns_nameservers', 'gateway', 'ip_addresses', 'is_up', 'mac_address', 'space', 'unknown_fields')
     _toSchema = {'dns_nameservers': 'dns-nameservers', 'gateway': 'gateway', 'ip_addresses': 'ip-addresses', 'is_up': 'is-up', 'mac_address': 'mac-address', 'space': 'space'}
     _toPy = {'dns-nameservers': 'dns_nameservers', 'gateway': 'gateway', 'ip-addresses': 'ip_addresses', 'is-up': 'is_up', 'mac-address': 'mac_address', 'space': 'space'}
     def __init__(self, dns_nameservers=None, gateway=None, ip_addresses=None, is_up=None, mac_address=None, space=None, **unknown_fields):
@@ -6745,10 +14796,29 @@ class NetworkInterface(Type):
         self.is_up = is_up
         self.mac_address = mac_address
         self.space = space
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.dns_nameservers = data.get('dns-nameservers')
+        self.gateway = data.get('gateway')
+        self.ip_addresses = data.get('ip-addresses')
+        self.is_up = data.get('is-up')
+        self.mac_address = data.get('mac-address')
+        self.space = data.get('space')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'dns-nameservers': self.dns_nameservers, 'gateway': self.gateway, 'ip-addresses': self.ip_addresses, 'is-up': self.is_up, 'mac-address': self.mac_address, 'space': self.space}
 
 
 
 class NetworkRoute(Type):
+    __slots__ = ('destination_cidr', 'gateway_ip', 'metric', 'unknown_fields')
     _toSchema = {'destination_cidr': 'destination-cidr', 'gateway_ip': 'gateway-ip', 'metric': 'metric'}
     _toPy = {'destination-cidr': 'destination_cidr', 'gateway-ip': 'gateway_ip', 'metric': 'metric'}
     def __init__(self, destination_cidr=None, gateway_ip=None, metric=None, **unknown_fields):
@@ -6760,10 +14830,26 @@ class NetworkRoute(Type):
         self.destination_cidr = destination_cidr
         self.gateway_ip = gateway_ip
         self.metric = metric
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.destination_cidr = data.get('destination-cidr')
+        self.gateway_ip = data.get('gateway-ip')
+        self.metric = data.get('metric')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destination-cidr': self.destination_cidr, 'gateway-ip': self.gateway_ip, 'metric': self.metric}
 
 
 
 class NotifyWatchResult(Type):
+    __slots__ = ('_error', '_raw_error', 'notifywatcherid', 'unknown_fields')
     _toSchema = {'error': 'error', 'notifywatcherid': 'NotifyWatcherId'}
     _toPy = {'NotifyWatcherId': 'notifywatcherid', 'error': 'error'}
     def __init__(self, notifywatcherid=None, error=None, **unknown_fields):
@@ -6772,22 +14858,55 @@ class NotifyWatchResult(Type):
         error : Error
         '''
         self.notifywatcherid = notifywatcherid
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.notifywatcherid = data.get('NotifyWatcherId')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'NotifyWatcherId': self.notifywatcherid, 'error': self._raw_error}
 
 
 
 class NotifyWatchResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~NotifyWatchResult]
         '''
-        self.results = [NotifyWatchResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [NotifyWatchResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Number(Type):
+    __slots__ = ('build', 'major', 'minor', 'patch', 'tag', 'unknown_fields')
     _toSchema = {'build': 'Build', 'major': 'Major', 'minor': 'Minor', 'patch': 'Patch', 'tag': 'Tag'}
     _toPy = {'Build': 'build', 'Major': 'major', 'Minor': 'minor', 'Patch': 'patch', 'Tag': 'tag'}
     def __init__(self, build=None, major=None, minor=None, patch=None, tag=None, **unknown_fields):
@@ -6803,10 +14922,28 @@ class Number(Type):
         self.minor = minor
         self.patch = patch
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.build = data.get('Build')
+        self.major = data.get('Major')
+        self.minor = data.get('Minor')
+        self.patch = data.get('Patch')
+        self.tag = data.get('Tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Build': self.build, 'Major': self.major, 'Minor': self.minor, 'Patch': self.patch, 'Tag': self.tag}
 
 
 
 class OfferArg(Type):
+    __slots__ = ('_macaroons', '_raw_macaroons', 'offer_uuid', 'unknown_fields')
     _toSchema = {'macaroons': 'macaroons', 'offer_uuid': 'offer-uuid'}
     _toPy = {'macaroons': 'macaroons', 'offer-uuid': 'offer_uuid'}
     def __init__(self, macaroons=None, offer_uuid=None, **unknown_fields):
@@ -6814,23 +14951,56 @@ class OfferArg(Type):
         macaroons : typing.Sequence[~Macaroon]
         offer_uuid : str
         '''
-        self.macaroons = [Macaroon.from_json(o) for o in macaroons or []]
+        self._raw_macaroons = macaroons
         self.offer_uuid = offer_uuid
+        self.unknown_fields = unknown_fields
+
+    macaroons = LazyField('macaroons', lambda data: [Macaroon.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_macaroons = data.get('macaroons')
+        self.offer_uuid = data.get('offer-uuid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'macaroons': self._raw_macaroons, 'offer-uuid': self.offer_uuid}
 
 
 
 class OfferArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~OfferArg]
         '''
-        self.args = [OfferArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [OfferArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class OfferConnection(Type):
+    __slots__ = ('_raw_status', '_status', 'endpoint', 'ingress_subnets', 'relation_id', 'source_model_tag', 'unknown_fields', 'username')
     _toSchema = {'endpoint': 'endpoint', 'ingress_subnets': 'ingress-subnets', 'relation_id': 'relation-id', 'source_model_tag': 'source-model-tag', 'status': 'status', 'username': 'username'}
     _toPy = {'endpoint': 'endpoint', 'ingress-subnets': 'ingress_subnets', 'relation-id': 'relation_id', 'source-model-tag': 'source_model_tag', 'status': 'status', 'username': 'username'}
     def __init__(self, endpoint=None, ingress_subnets=None, relation_id=None, source_model_tag=None, status=None, username=None, **unknown_fields):
@@ -6846,12 +15016,33 @@ class OfferConnection(Type):
         self.ingress_subnets = ingress_subnets
         self.relation_id = relation_id
         self.source_model_tag = source_model_tag
-        self.status = EntityStatus.from_json(status) if status else None
+        self._raw_status = status
         self.username = username
+        self.unknown_fields = unknown_fields
+
+    status = LazyField('status', lambda data: EntityStatus.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.endpoint = data.get('endpoint')
+        self.ingress_subnets = data.get('ingress-subnets')
+        self.relation_id = data.get('relation-id')
+        self.source_model_tag = data.get('source-model-tag')
+        self._raw_status = data.get('status')
+        self.username = data.get('username')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'endpoint': self.endpoint, 'ingress-subnets': self.ingress_subnets, 'relation-id': self.relation_id, 'source-model-tag': self.source_model_tag, 'status': self._raw_status, 'username': self.username}
 
 
 
 class OfferFilter(Type):
+    __slots__ = ('_endpoints', '_raw_endpoints', 'allowed_users', 'application_description', 'application_name', 'application_user', 'connected_users', 'model_name', 'offer_name', 'owner_name', 'unknown_fields')
     _toSchema = {'allowed_users': 'allowed-users', 'application_description': 'application-description', 'application_name': 'application-name', 'application_user': 'application-user', 'connected_users': 'connected-users', 'endpoints': 'endpoints', 'model_name': 'model-name', 'offer_name': 'offer-name', 'owner_name': 'owner-name'}
     _toPy = {'allowed-users': 'allowed_users', 'application-description': 'application_description', 'application-name': 'application_name', 'application-user': 'application_user', 'connected-users': 'connected_users', 'endpoints': 'endpoints', 'model-name': 'model_name', 'offer-name': 'offer_name', 'owner-name': 'owner_name'}
     def __init__(self, allowed_users=None, application_description=None, application_name=None, application_user=None, connected_users=None, endpoints=None, model_name=None, offer_name=None, owner_name=None, **unknown_fields):
@@ -6871,25 +15062,65 @@ class OfferFilter(Type):
         self.application_name = application_name
         self.application_user = application_user
         self.connected_users = connected_users
-        self.endpoints = [EndpointFilterAttributes.from_json(o) for o in endpoints or []]
+        self._raw_endpoints = endpoints
         self.model_name = model_name
         self.offer_name = offer_name
         self.owner_name = owner_name
+        self.unknown_fields = unknown_fields
+
+    endpoints = LazyField('endpoints', lambda data: [EndpointFilterAttributes.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.allowed_users = data.get('allowed-users')
+        self.application_description = data.get('application-description')
+        self.application_name = data.get('application-name')
+        self.application_user = data.get('application-user')
+        self.connected_users = data.get('connected-users')
+        self._raw_endpoints = data.get('endpoints')
+        self.model_name = data.get('model-name')
+        self.offer_name = data.get('offer-name')
+        self.owner_name = data.get('owner-name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'allowed-users': self.allowed_users, 'application-description': self.application_description, 'application-name': self.application_name, 'application-user': self.application_user, 'connected-users': self.connected_users, 'endpoints': self._raw_endpoints, 'model-name': self.model_name, 'offer-name': self.offer_name, 'owner-name': self.owner_name}
 
 
 
 class OfferFilters(Type):
+    __slots__ = ('_filters', '_raw_filters', 'unknown_fields')
     _toSchema = {'filters': 'Filters'}
     _toPy = {'Filters': 'filters'}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~OfferFilter]
         '''
-        self.filters = [OfferFilter.from_json(o) for o in filters or []]
+        self._raw_filters = filters
+        self.unknown_fields = unknown_fields
+
+    filters = LazyField('filters', lambda data: [OfferFilter.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_filters = data.get('Filters')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Filters': self._raw_filters}
 
 
 
 class OfferStatusChange(Type):
+    __slots__ = ('_raw_status', '_status', 'offer_name', 'unknown_fields')
     _toSchema = {'offer_name': 'offer-name', 'status': 'status'}
     _toPy = {'offer-name': 'offer_name', 'status': 'status'}
     def __init__(self, offer_name=None, status=None, **unknown_fields):
@@ -6898,11 +15129,28 @@ class OfferStatusChange(Type):
         status : EntityStatus
         '''
         self.offer_name = offer_name
-        self.status = EntityStatus.from_json(status) if status else None
+        self._raw_status = status
+        self.unknown_fields = unknown_fields
+
+    status = LazyField('status', lambda data: EntityStatus.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.offer_name = data.get('offer-name')
+        self._raw_status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'offer-name': self.offer_name, 'status': self._raw_status}
 
 
 
 class OfferStatusWatchResult(Type):
+    __slots__ = ('_changes', '_error', '_raw_changes', '_raw_error', 'unknown_fields', 'watcher_id')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
@@ -6911,24 +15159,59 @@ class OfferStatusWatchResult(Type):
         error : Error
         watcher_id : str
         '''
-        self.changes = [OfferStatusChange.from_json(o) for o in changes or []]
-        self.error = Error.from_json(error) if error else None
+        self._raw_changes = changes
+        self._raw_error = error
         self.watcher_id = watcher_id
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [OfferStatusChange.from_json(o) for o in data or []])
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self._raw_error = data.get('error')
+        self.watcher_id = data.get('watcher-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes, 'error': self._raw_error, 'watcher-id': self.watcher_id}
 
 
 
 class OfferStatusWatchResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~OfferStatusWatchResult]
         '''
-        self.results = [OfferStatusWatchResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [OfferStatusWatchResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class OfferURLs(Type):
+    __slots__ = ('offer_urls', 'unknown_fields')
     _toSchema = {'offer_urls': 'offer-urls'}
     _toPy = {'offer-urls': 'offer_urls'}
     def __init__(self, offer_urls=None, **unknown_fields):
@@ -6936,10 +15219,24 @@ class OfferURLs(Type):
         offer_urls : typing.Sequence[str]
         '''
         self.offer_urls = offer_urls
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.offer_urls = data.get('offer-urls')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'offer-urls': self.offer_urls}
 
 
 
 class OfferUserDetails(Type):
+    __slots__ = ('access', 'display_name', 'unknown_fields', 'user')
     _toSchema = {'access': 'access', 'display_name': 'display-name', 'user': 'user'}
     _toPy = {'access': 'access', 'display-name': 'display_name', 'user': 'user'}
     def __init__(self, access=None, display_name=None, user=None, **unknown_fields):
@@ -6951,10 +15248,26 @@ class OfferUserDetails(Type):
         self.access = access
         self.display_name = display_name
         self.user = user
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.display_name = data.get('display-name')
+        self.user = data.get('user')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'display-name': self.display_name, 'user': self.user}
 
 
 
 class OperatorProvisioningInfo(Type):
+    __slots__ = ('_charm_storage', '_raw_charm_storage', '_raw_version', '_version', 'api_addresses', 'image_path', 'tags', 'unknown_fields')
     _toSchema = {'api_addresses': 'api-addresses', 'charm_storage': 'charm-storage', 'image_path': 'image-path', 'tags': 'tags', 'version': 'version'}
     _toPy = {'api-addresses': 'api_addresses', 'charm-storage': 'charm_storage', 'image-path': 'image_path', 'tags': 'tags', 'version': 'version'}
     def __init__(self, api_addresses=None, charm_storage=None, image_path=None, tags=None, version=None, **unknown_fields):
@@ -6966,14 +15279,35 @@ class OperatorProvisioningInfo(Type):
         version : Number
         '''
         self.api_addresses = api_addresses
-        self.charm_storage = KubernetesFilesystemParams.from_json(charm_storage) if charm_storage else None
+        self._raw_charm_storage = charm_storage
         self.image_path = image_path
         self.tags = tags
-        self.version = Number.from_json(version) if version else None
+        self._raw_version = version
+        self.unknown_fields = unknown_fields
+
+    charm_storage = LazyField('charm_storage', lambda data: KubernetesFilesystemParams.from_json(data) if data else None)
+    version = LazyField('version', lambda data: Number.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.api_addresses = data.get('api-addresses')
+        self._raw_charm_storage = data.get('charm-storage')
+        self.image_path = data.get('image-path')
+        self.tags = data.get('tags')
+        self._raw_version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'api-addresses': self.api_addresses, 'charm-storage': self._raw_charm_storage, 'image-path': self.image_path, 'tags': self.tags, 'version': self._raw_version}
 
 
 
 class Payload(Type):
+    __slots__ = ('class_', 'id_', 'labels', 'machine', 'status', 'type_', 'unit', 'unknown_fields')
     _toSchema = {'class_': 'class', 'id_': 'id', 'labels': 'labels', 'machine': 'machine', 'status': 'status', 'type_': 'type', 'unit': 'unit'}
     _toPy = {'class': 'class_', 'id': 'id_', 'labels': 'labels', 'machine': 'machine', 'status': 'status', 'type': 'type_', 'unit': 'unit'}
     def __init__(self, class_=None, id_=None, labels=None, machine=None, status=None, type_=None, unit=None, **unknown_fields):
@@ -6993,10 +15327,30 @@ class Payload(Type):
         self.status = status
         self.type_ = type_
         self.unit = unit
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.class_ = data.get('class')
+        self.id_ = data.get('id')
+        self.labels = data.get('labels')
+        self.machine = data.get('machine')
+        self.status = data.get('status')
+        self.type_ = data.get('type')
+        self.unit = data.get('unit')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'class': self.class_, 'id': self.id_, 'labels': self.labels, 'machine': self.machine, 'status': self.status, 'type': self.type_, 'unit': self.unit}
 
 
 
 class PayloadListArgs(Type):
+    __slots__ = ('patterns', 'unknown_fields')
     _toSchema = {'patterns': 'patterns'}
     _toPy = {'patterns': 'patterns'}
     def __init__(self, patterns=None, **unknown_fields):
@@ -7004,21 +15358,51 @@ class PayloadListArgs(Type):
         patterns : typing.Sequence[str]
         '''
         self.patterns = patterns
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.patterns = data.get('patterns')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'patterns': self.patterns}
 
 
 
 class PayloadListResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~Payload]
         '''
-        self.results = [Payload.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [Payload.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class PayloadResult(Type):
+    __slots__ = ('_entity', '_error', '_payload', '_raw_entity', '_raw_error', '_raw_payload', 'not_found', 'unknown_fields')
     _toSchema = {'entity': 'Entity', 'error': 'error', 'not_found': 'not-found', 'payload': 'payload'}
     _toPy = {'Entity': 'entity', 'error': 'error', 'not-found': 'not_found', 'payload': 'payload'}
     def __init__(self, entity=None, error=None, not_found=None, payload=None, **unknown_fields):
@@ -7028,25 +15412,62 @@ class PayloadResult(Type):
         not_found : bool
         payload : Payload
         '''
-        self.entity = Entity.from_json(entity) if entity else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_entity = entity
+        self._raw_error = error
         self.not_found = not_found
-        self.payload = Payload.from_json(payload) if payload else None
+        self._raw_payload = payload
+        self.unknown_fields = unknown_fields
+
+    entity = LazyField('entity', lambda data: Entity.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    payload = LazyField('payload', lambda data: Payload.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entity = data.get('Entity')
+        self._raw_error = data.get('error')
+        self.not_found = data.get('not-found')
+        self._raw_payload = data.get('payload')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Entity': self._raw_entity, 'error': self._raw_error, 'not-found': self.not_found, 'payload': self._raw_payload}
 
 
 
 class PayloadResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~PayloadResult]
         '''
-        self.results = [PayloadResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [PayloadResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class PhaseResult(Type):
+    __slots__ = ('_error', '_raw_error', 'phase', 'unknown_fields')
     _toSchema = {'error': 'error', 'phase': 'phase'}
     _toPy = {'error': 'error', 'phase': 'phase'}
     def __init__(self, error=None, phase=None, **unknown_fields):
@@ -7054,23 +15475,56 @@ class PhaseResult(Type):
         error : Error
         phase : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.phase = phase
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.phase = data.get('phase')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'phase': self.phase}
 
 
 
 class PhaseResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~PhaseResult]
         '''
-        self.results = [PhaseResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [PhaseResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class PinApplicationResult(Type):
+    __slots__ = ('_error', '_raw_error', 'application_name', 'unknown_fields')
     _toSchema = {'application_name': 'application-name', 'error': 'error'}
     _toPy = {'application-name': 'application_name', 'error': 'error'}
     def __init__(self, application_name=None, error=None, **unknown_fields):
@@ -7079,22 +15533,55 @@ class PinApplicationResult(Type):
         error : Error
         '''
         self.application_name = application_name
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_name = data.get('application-name')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-name': self.application_name, 'error': self._raw_error}
 
 
 
 class PinApplicationsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~PinApplicationResult]
         '''
-        self.results = [PinApplicationResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [PinApplicationResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class PinnedLeadershipResult(Type):
+    __slots__ = ('result', 'unknown_fields')
     _toSchema = {'result': 'result'}
     _toPy = {'result': 'result'}
     def __init__(self, result=None, **unknown_fields):
@@ -7102,10 +15589,24 @@ class PinnedLeadershipResult(Type):
         result : typing.Sequence[str]
         '''
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'result': self.result}
 
 
 
 class Placement(Type):
+    __slots__ = ('directive', 'scope', 'unknown_fields')
     _toSchema = {'directive': 'directive', 'scope': 'scope'}
     _toPy = {'directive': 'directive', 'scope': 'scope'}
     def __init__(self, directive=None, scope=None, **unknown_fields):
@@ -7115,10 +15616,25 @@ class Placement(Type):
         '''
         self.directive = directive
         self.scope = scope
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.directive = data.get('directive')
+        self.scope = data.get('scope')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'directive': self.directive, 'scope': self.scope}
 
 
 
 class PortRange(Type):
+    __slots__ = ('from_port', 'protocol', 'to_port', 'unknown_fields')
     _toSchema = {'from_port': 'from-port', 'protocol': 'protocol', 'to_port': 'to-port'}
     _toPy = {'from-port': 'from_port', 'protocol': 'protocol', 'to-port': 'to_port'}
     def __init__(self, from_port=None, protocol=None, to_port=None, **unknown_fields):
@@ -7130,10 +15646,26 @@ class PortRange(Type):
         self.from_port = from_port
         self.protocol = protocol
         self.to_port = to_port
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.from_port = data.get('from-port')
+        self.protocol = data.get('protocol')
+        self.to_port = data.get('to-port')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'from-port': self.from_port, 'protocol': self.protocol, 'to-port': self.to_port}
 
 
 
 class PrivateAddress(Type):
+    __slots__ = ('target', 'unknown_fields')
     _toSchema = {'target': 'target'}
     _toPy = {'target': 'target'}
     def __init__(self, target=None, **unknown_fields):
@@ -7141,10 +15673,24 @@ class PrivateAddress(Type):
         target : str
         '''
         self.target = target
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.target = data.get('target')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'target': self.target}
 
 
 
 class PrivateAddressResults(Type):
+    __slots__ = ('private_address', 'unknown_fields')
     _toSchema = {'private_address': 'private-address'}
     _toPy = {'private-address': 'private_address'}
     def __init__(self, private_address=None, **unknown_fields):
@@ -7152,10 +15698,24 @@ class PrivateAddressResults(Type):
         private_address : str
         '''
         self.private_address = private_address
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.private_address = data.get('private-address')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'private-address': self.private_address}
 
 
 
 class ProfileChangeResult(Type):
+    __slots__ = ('_error', '_profile', '_raw_error', '_raw_profile', 'new_profile_name', 'old_profile_name', 'subordinate', 'unknown_fields')
     _toSchema = {'error': 'error', 'new_profile_name': 'new-profile-name', 'old_profile_name': 'old-profile-name', 'profile': 'profile', 'subordinate': 'subordinate'}
     _toPy = {'error': 'error', 'new-profile-name': 'new_profile_name', 'old-profile-name': 'old_profile_name', 'profile': 'profile', 'subordinate': 'subordinate'}
     def __init__(self, error=None, new_profile_name=None, old_profile_name=None, profile=None, subordinate=None, **unknown_fields):
@@ -7166,26 +15726,63 @@ class ProfileChangeResult(Type):
         profile : CharmLXDProfile
         subordinate : bool
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.new_profile_name = new_profile_name
         self.old_profile_name = old_profile_name
-        self.profile = CharmLXDProfile.from_json(profile) if profile else None
+        self._raw_profile = profile
         self.subordinate = subordinate
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    profile = LazyField('profile', lambda data: CharmLXDProfile.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.new_profile_name = data.get('new-profile-name')
+        self.old_profile_name = data.get('old-profile-name')
+        self._raw_profile = data.get('profile')
+        self.subordinate = data.get('subordinate')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'new-profile-name': self.new_profile_name, 'old-profile-name': self.old_profile_name, 'profile': self._raw_profile, 'subordinate': self.subordinate}
 
 
 
 class ProfileChangeResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ProfileChangeResult]
         '''
-        self.results = [ProfileChangeResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
 
+    results = LazyField('results', lambda data: [ProfileChangeResult.from_json(o) for o in data or []])
 
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
 
-class ProviderInterfaceInfo(Type):
+    def serialize(self):
+        return {'results': self._raw_results}
+
+
+
+class ProviderInterfaceInfo(Type):
+    __slots__ = ('interface_name', 'mac_address', 'provider_id', 'unknown_fields')
     _toSchema = {'interface_name': 'interface-name', 'mac_address': 'mac-address', 'provider_id': 'provider-id'}
     _toPy = {'interface-name': 'interface_name', 'mac-address': 'mac_address', 'provider-id': 'provider_id'}
     def __init__(self, interface_name=None, mac_address=None, provider_id=None, **unknown_fields):
@@ -7197,10 +15794,26 @@ class ProviderInterfaceInfo(Type):
         self.interface_name = interface_name
         self.mac_address = mac_address
         self.provider_id = provider_id
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.interface_name = data.get('interface-name')
+        self.mac_address = data.get('mac-address')
+        self.provider_id = data.get('provider-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'interface-name': self.interface_name, 'mac-address': self.mac_address, 'provider-id': self.provider_id}
 
 
 
 class ProviderInterfaceInfoResult(Type):
+    __slots__ = ('_error', '_interfaces', '_raw_error', '_raw_interfaces', 'machine_tag', 'unknown_fields')
     _toSchema = {'error': 'error', 'interfaces': 'interfaces', 'machine_tag': 'machine-tag'}
     _toPy = {'error': 'error', 'interfaces': 'interfaces', 'machine-tag': 'machine_tag'}
     def __init__(self, error=None, interfaces=None, machine_tag=None, **unknown_fields):
@@ -7209,24 +15822,59 @@ class ProviderInterfaceInfoResult(Type):
         interfaces : typing.Sequence[~ProviderInterfaceInfo]
         machine_tag : str
         '''
-        self.error = Error.from_json(error) if error else None
-        self.interfaces = [ProviderInterfaceInfo.from_json(o) for o in interfaces or []]
+        self._raw_error = error
+        self._raw_interfaces = interfaces
         self.machine_tag = machine_tag
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    interfaces = LazyField('interfaces', lambda data: [ProviderInterfaceInfo.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_interfaces = data.get('interfaces')
+        self.machine_tag = data.get('machine-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'interfaces': self._raw_interfaces, 'machine-tag': self.machine_tag}
 
 
 
 class ProviderInterfaceInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ProviderInterfaceInfoResult]
         '''
-        self.results = [ProviderInterfaceInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ProviderInterfaceInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ProviderSpace(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_subnets', '_subnets', 'name', 'provider_id', 'unknown_fields')
     _toSchema = {'error': 'error', 'name': 'name', 'provider_id': 'provider-id', 'subnets': 'subnets'}
     _toPy = {'error': 'error', 'name': 'name', 'provider-id': 'provider_id', 'subnets': 'subnets'}
     def __init__(self, error=None, name=None, provider_id=None, subnets=None, **unknown_fields):
@@ -7236,14 +15884,34 @@ class ProviderSpace(Type):
         provider_id : str
         subnets : typing.Sequence[~Subnet]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.name = name
         self.provider_id = provider_id
-        self.subnets = [Subnet.from_json(o) for o in subnets or []]
+        self._raw_subnets = subnets
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    subnets = LazyField('subnets', lambda data: [Subnet.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.name = data.get('name')
+        self.provider_id = data.get('provider-id')
+        self._raw_subnets = data.get('subnets')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'name': self.name, 'provider-id': self.provider_id, 'subnets': self._raw_subnets}
 
 
 
 class ProvisioningInfo(Type):
+    __slots__ = ('_constraints', '_image_metadata', '_raw_constraints', '_raw_image_metadata', '_raw_volumes', '_volumes', 'controller_config', 'endpoint_bindings', 'jobs', 'placement', 'series', 'subnets_to_zones', 'tags', 'unknown_fields')
     _toSchema = {'constraints': 'constraints', 'controller_config': 'controller-config', 'endpoint_bindings': 'endpoint-bindings', 'image_metadata': 'image-metadata', 'jobs': 'jobs', 'placement': 'placement', 'series': 'series', 'subnets_to_zones': 'subnets-to-zones', 'tags': 'tags', 'volumes': 'volumes'}
     _toPy = {'constraints': 'constraints', 'controller-config': 'controller_config', 'endpoint-bindings': 'endpoint_bindings', 'image-metadata': 'image_metadata', 'jobs': 'jobs', 'placement': 'placement', 'series': 'series', 'subnets-to-zones': 'subnets_to_zones', 'tags': 'tags', 'volumes': 'volumes'}
     def __init__(self, constraints=None, controller_config=None, endpoint_bindings=None, image_metadata=None, jobs=None, placement=None, series=None, subnets_to_zones=None, tags=None, volumes=None, **unknown_fields):
@@ -7259,20 +15927,47 @@ class ProvisioningInfo(Type):
         tags : typing.Mapping[str, str]
         volumes : typing.Sequence[~VolumeParams]
         '''
-        self.constraints = Value.from_json(constraints) if constraints else None
+        self._raw_constraints = constraints
         self.controller_config = controller_config
         self.endpoint_bindings = endpoint_bindings
-        self.image_metadata = [CloudImageMetadata.from_json(o) for o in image_metadata or []]
+        self._raw_image_metadata = image_metadata
         self.jobs = jobs
         self.placement = placement
         self.series = series
         self.subnets_to_zones = subnets_to_zones
         self.tags = tags
-        self.volumes = [VolumeParams.from_json(o) for o in volumes or []]
+        self._raw_volumes = volumes
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+    image_metadata = LazyField('image_metadata', lambda data: [CloudImageMetadata.from_json(o) for o in data or []])
+    volumes = LazyField('volumes', lambda data: [VolumeParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_constraints = data.get('constraints')
+        self.controller_config = data.get('controller-config')
+        self.endpoint_bindings = data.get('endpoint-bindings')
+        self._raw_image_metadata = data.get('image-metadata')
+        self.jobs = data.get('jobs')
+        self.placement = data.get('placement')
+        self.series = data.get('series')
+        self.subnets_to_zones = data.get('subnets-to-zones')
+        self.tags = data.get('tags')
+        self._raw_volumes = data.get('volumes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'constraints': self._raw_constraints, 'controller-config': self.controller_config, 'endpoint-bindings': self.endpoint_bindings, 'image-metadata': self._raw_image_metadata, 'jobs': self.jobs, 'placement': self.placement, 'series': self.series, 'subnets-to-zones': self.subnets_to_zones, 'tags': self.tags, 'volumes': self._raw_volumes}
 
 
 
 class ProvisioningInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -7280,23 +15975,57 @@ class ProvisioningInfoResult(Type):
         error : Error
         result : ProvisioningInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = ProvisioningInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: ProvisioningInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class ProvisioningInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ProvisioningInfoResult]
         '''
-        self.results = [ProvisioningInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ProvisioningInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ProvisioningScriptParams(Type):
+    __slots__ = ('data_dir', 'disable_package_commands', 'machine_id', 'nonce', 'unknown_fields')
     _toSchema = {'data_dir': 'data-dir', 'disable_package_commands': 'disable-package-commands', 'machine_id': 'machine-id', 'nonce': 'nonce'}
     _toPy = {'data-dir': 'data_dir', 'disable-package-commands': 'disable_package_commands', 'machine-id': 'machine_id', 'nonce': 'nonce'}
     def __init__(self, data_dir=None, disable_package_commands=None, machine_id=None, nonce=None, **unknown_fields):
@@ -7310,10 +16039,27 @@ class ProvisioningScriptParams(Type):
         self.disable_package_commands = disable_package_commands
         self.machine_id = machine_id
         self.nonce = nonce
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.data_dir = data.get('data-dir')
+        self.disable_package_commands = data.get('disable-package-commands')
+        self.machine_id = data.get('machine-id')
+        self.nonce = data.get('nonce')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'data-dir': self.data_dir, 'disable-package-commands': self.disable_package_commands, 'machine-id': self.machine_id, 'nonce': self.nonce}
 
 
 
 class ProvisioningScriptResult(Type):
+    __slots__ = ('script', 'unknown_fields')
     _toSchema = {'script': 'script'}
     _toPy = {'script': 'script'}
     def __init__(self, script=None, **unknown_fields):
@@ -7321,10 +16067,24 @@ class ProvisioningScriptResult(Type):
         script : str
         '''
         self.script = script
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.script = data.get('script')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'script': self.script}
 
 
 
 class ProxyConfig(Type):
+    __slots__ = ('ftp', 'http', 'https', 'no_proxy', 'unknown_fields')
     _toSchema = {'ftp': 'ftp', 'http': 'http', 'https': 'https', 'no_proxy': 'no-proxy'}
     _toPy = {'ftp': 'ftp', 'http': 'http', 'https': 'https', 'no-proxy': 'no_proxy'}
     def __init__(self, ftp=None, http=None, https=None, no_proxy=None, **unknown_fields):
@@ -7338,10 +16098,27 @@ class ProxyConfig(Type):
         self.http = http
         self.https = https
         self.no_proxy = no_proxy
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.ftp = data.get('ftp')
+        self.http = data.get('http')
+        self.https = data.get('https')
+        self.no_proxy = data.get('no-proxy')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ftp': self.ftp, 'http': self.http, 'https': self.https, 'no-proxy': self.no_proxy}
 
 
 
 class ProxyConfigResult(Type):
+    __slots__ = ('_apt_proxy_settings', '_error', '_proxy_settings', '_raw_apt_proxy_settings', '_raw_error', '_raw_proxy_settings', 'unknown_fields')
     _toSchema = {'apt_proxy_settings': 'apt-proxy-settings', 'error': 'error', 'proxy_settings': 'proxy-settings'}
     _toPy = {'apt-proxy-settings': 'apt_proxy_settings', 'error': 'error', 'proxy-settings': 'proxy_settings'}
     def __init__(self, apt_proxy_settings=None, error=None, proxy_settings=None, **unknown_fields):
@@ -7350,24 +16127,60 @@ class ProxyConfigResult(Type):
         error : Error
         proxy_settings : ProxyConfig
         '''
-        self.apt_proxy_settings = ProxyConfig.from_json(apt_proxy_settings) if apt_proxy_settings else None
-        self.error = Error.from_json(error) if error else None
-        self.proxy_settings = ProxyConfig.from_json(proxy_settings) if proxy_settings else None
+        self._raw_apt_proxy_settings = apt_proxy_settings
+        self._raw_error = error
+        self._raw_proxy_settings = proxy_settings
+        self.unknown_fields = unknown_fields
+
+    apt_proxy_settings = LazyField('apt_proxy_settings', lambda data: ProxyConfig.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    proxy_settings = LazyField('proxy_settings', lambda data: ProxyConfig.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_apt_proxy_settings = data.get('apt-proxy-settings')
+        self._raw_error = data.get('error')
+        self._raw_proxy_settings = data.get('proxy-settings')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'apt-proxy-settings': self._raw_apt_proxy_settings, 'error': self._raw_error, 'proxy-settings': self._raw_proxy_settings}
 
 
 
 class ProxyConfigResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ProxyConfigResult]
         '''
-        self.results = [ProxyConfigResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ProxyConfigResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class PublicAddress(Type):
+    __slots__ = ('target', 'unknown_fields')
     _toSchema = {'target': 'target'}
     _toPy = {'target': 'target'}
     def __init__(self, target=None, **unknown_fields):
@@ -7375,10 +16188,24 @@ class PublicAddress(Type):
         target : str
         '''
         self.target = target
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.target = data.get('target')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'target': self.target}
 
 
 
 class PublicAddressResults(Type):
+    __slots__ = ('public_address', 'unknown_fields')
     _toSchema = {'public_address': 'public-address'}
     _toPy = {'public-address': 'public_address'}
     def __init__(self, public_address=None, **unknown_fields):
@@ -7386,21 +16213,51 @@ class PublicAddressResults(Type):
         public_address : str
         '''
         self.public_address = public_address
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.public_address = data.get('public-address')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'public-address': self.public_address}
 
 
 
 class QueryApplicationOffersResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationOfferAdminDetails]
         '''
-        self.results = [ApplicationOfferAdminDetails.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ApplicationOfferAdminDetails.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RebootActionResult(Type):
+    __slots__ = ('_error', '_raw_error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -7408,23 +16265,56 @@ class RebootActionResult(Type):
         error : Error
         result : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self.result}
 
 
 
 class RebootActionResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RebootActionResult]
         '''
-        self.results = [RebootActionResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RebootActionResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RegionDefaults(Type):
+    __slots__ = ('region_name', 'unknown_fields', 'value')
     _toSchema = {'region_name': 'region-name', 'value': 'value'}
     _toPy = {'region-name': 'region_name', 'value': 'value'}
     def __init__(self, region_name=None, value=None, **unknown_fields):
@@ -7434,10 +16324,25 @@ class RegionDefaults(Type):
         '''
         self.region_name = region_name
         self.value = value
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.region_name = data.get('region-name')
+        self.value = data.get('value')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'region-name': self.region_name, 'value': self.value}
 
 
 
 class RegisterRemoteRelationArg(Type):
+    __slots__ = ('_macaroons', '_raw_macaroons', '_raw_remote_endpoint', '_raw_remote_space', '_remote_endpoint', '_remote_space', 'application_token', 'local_endpoint_name', 'offer_uuid', 'relation_token', 'source_model_tag', 'unknown_fields')
     _toSchema = {'application_token': 'application-token', 'local_endpoint_name': 'local-endpoint-name', 'macaroons': 'macaroons', 'offer_uuid': 'offer-uuid', 'relation_token': 'relation-token', 'remote_endpoint': 'remote-endpoint', 'remote_space': 'remote-space', 'source_model_tag': 'source-model-tag'}
     _toPy = {'application-token': 'application_token', 'local-endpoint-name': 'local_endpoint_name', 'macaroons': 'macaroons', 'offer-uuid': 'offer_uuid', 'relation-token': 'relation_token', 'remote-endpoint': 'remote_endpoint', 'remote-space': 'remote_space', 'source-model-tag': 'source_model_tag'}
     def __init__(self, application_token=None, local_endpoint_name=None, macaroons=None, offer_uuid=None, relation_token=None, remote_endpoint=None, remote_space=None, source_model_tag=None, **unknown_fields):
@@ -7453,27 +16358,68 @@ class RegisterRemoteRelationArg(Type):
         '''
         self.application_token = application_token
         self.local_endpoint_name = local_endpoint_name
-        self.macaroons = [Macaroon.from_json(o) for o in macaroons or []]
+        self._raw_macaroons = macaroons
         self.offer_uuid = offer_uuid
         self.relation_token = relation_token
-        self.remote_endpoint = RemoteEndpoint.from_json(remote_endpoint) if remote_endpoint else None
-        self.remote_space = RemoteSpace.from_json(remote_space) if remote_space else None
+        self._raw_remote_endpoint = remote_endpoint
+        self._raw_remote_space = remote_space
         self.source_model_tag = source_model_tag
+        self.unknown_fields = unknown_fields
+
+    macaroons = LazyField('macaroons', lambda data: [Macaroon.from_json(o) for o in data or []])
+    remote_endpoint = LazyField('remote_endpoint', lambda data: RemoteEndpoint.from_json(data) if data else None)
+    remote_space = LazyField('remote_space', lambda data: RemoteSpace.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_token = data.get('application-token')
+        self.local_endpoint_name = data.get('local-endpoint-name')
+        self._raw_macaroons = data.get('macaroons')
+        self.offer_uuid = data.get('offer-uuid')
+        self.relation_token = data.get('relation-token')
+        self._raw_remote_endpoint = data.get('remote-endpoint')
+        self._raw_remote_space = data.get('remote-space')
+        self.source_model_tag = data.get('source-model-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-token': self.application_token, 'local-endpoint-name': self.local_endpoint_name, 'macaroons': self._raw_macaroons, 'offer-uuid': self.offer_uuid, 'relation-token': self.relation_token, 'remote-endpoint': self._raw_remote_endpoint, 'remote-space': self._raw_remote_space, 'source-model-tag': self.source_model_tag}
 
 
 
 class RegisterRemoteRelationArgs(Type):
+    __slots__ = ('_raw_relations', '_relations', 'unknown_fields')
     _toSchema = {'relations': 'relations'}
     _toPy = {'relations': 'relations'}
     def __init__(self, relations=None, **unknown_fields):
         '''
         relations : typing.Sequence[~RegisterRemoteRelationArg]
         '''
-        self.relations = [RegisterRemoteRelationArg.from_json(o) for o in relations or []]
+        self._raw_relations = relations
+        self.unknown_fields = unknown_fields
+
+    relations = LazyField('relations', lambda data: [RegisterRemoteRelationArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_relations = data.get('relations')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'relations': self._raw_relations}
 
 
 
 class RegisterRemoteRelationResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -7481,23 +16427,57 @@ class RegisterRemoteRelationResult(Type):
         error : Error
         result : RemoteRelationDetails
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = RemoteRelationDetails.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: RemoteRelationDetails.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class RegisterRemoteRelationResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RegisterRemoteRelationResult]
         '''
-        self.results = [RegisterRemoteRelationResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RegisterRemoteRelationResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RelationChange(Type):
+    __slots__ = ('changedunits', 'departedunits', 'id_', 'life', 'unknown_fields')
     _toSchema = {'changedunits': 'changedunits', 'departedunits': 'departedunits', 'id_': 'id', 'life': 'life'}
     _toPy = {'changedunits': 'changedunits', 'departedunits': 'departedunits', 'id': 'id_', 'life': 'life'}
     def __init__(self, changedunits=None, departedunits=None, id_=None, life=None, **unknown_fields):
@@ -7511,10 +16491,27 @@ class RelationChange(Type):
         self.departedunits = departedunits
         self.id_ = id_
         self.life = life
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.changedunits = data.get('changedunits')
+        self.departedunits = data.get('departedunits')
+        self.id_ = data.get('id')
+        self.life = data.get('life')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changedunits': self.changedunits, 'departedunits': self.departedunits, 'id': self.id_, 'life': self.life}
 
 
 
 class RelationIds(Type):
+    __slots__ = ('relation_ids', 'unknown_fields')
     _toSchema = {'relation_ids': 'relation-ids'}
     _toPy = {'relation-ids': 'relation_ids'}
     def __init__(self, relation_ids=None, **unknown_fields):
@@ -7522,10 +16519,24 @@ class RelationIds(Type):
         relation_ids : typing.Sequence[int]
         '''
         self.relation_ids = relation_ids
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.relation_ids = data.get('relation-ids')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'relation-ids': self.relation_ids}
 
 
 
 class RelationLifeSuspendedStatusChange(Type):
+    __slots__ = ('key', 'life', 'suspended', 'suspended_reason', 'unknown_fields')
     _toSchema = {'key': 'key', 'life': 'life', 'suspended': 'suspended', 'suspended_reason': 'suspended-reason'}
     _toPy = {'key': 'key', 'life': 'life', 'suspended': 'suspended', 'suspended-reason': 'suspended_reason'}
     def __init__(self, key=None, life=None, suspended=None, suspended_reason=None, **unknown_fields):
@@ -7539,10 +16550,27 @@ class RelationLifeSuspendedStatusChange(Type):
         self.life = life
         self.suspended = suspended
         self.suspended_reason = suspended_reason
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.key = data.get('key')
+        self.life = data.get('life')
+        self.suspended = data.get('suspended')
+        self.suspended_reason = data.get('suspended-reason')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'key': self.key, 'life': self.life, 'suspended': self.suspended, 'suspended-reason': self.suspended_reason}
 
 
 
 class RelationLifeSuspendedStatusWatchResult(Type):
+    __slots__ = ('_changes', '_error', '_raw_changes', '_raw_error', 'unknown_fields', 'watcher_id')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
@@ -7551,13 +16579,32 @@ class RelationLifeSuspendedStatusWatchResult(Type):
         error : Error
         watcher_id : str
         '''
-        self.changes = [RelationLifeSuspendedStatusChange.from_json(o) for o in changes or []]
-        self.error = Error.from_json(error) if error else None
+        self._raw_changes = changes
+        self._raw_error = error
         self.watcher_id = watcher_id
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [RelationLifeSuspendedStatusChange.from_json(o) for o in data or []])
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self._raw_error = data.get('error')
+        self.watcher_id = data.get('watcher-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes, 'error': self._raw_error, 'watcher-id': self.watcher_id}
 
 
 
 class RelationResult(Type):
+    __slots__ = ('_endpoint', '_error', '_raw_endpoint', '_raw_error', 'id_', 'key', 'life', 'unknown_fields')
     _toSchema = {'endpoint': 'endpoint', 'error': 'error', 'id_': 'id', 'key': 'key', 'life': 'life'}
     _toPy = {'endpoint': 'endpoint', 'error': 'error', 'id': 'id_', 'key': 'key', 'life': 'life'}
     def __init__(self, endpoint=None, error=None, id_=None, key=None, life=None, **unknown_fields):
@@ -7568,26 +16615,63 @@ class RelationResult(Type):
         key : str
         life : str
         '''
-        self.endpoint = Endpoint.from_json(endpoint) if endpoint else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_endpoint = endpoint
+        self._raw_error = error
         self.id_ = id_
         self.key = key
         self.life = life
+        self.unknown_fields = unknown_fields
+
+    endpoint = LazyField('endpoint', lambda data: Endpoint.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_endpoint = data.get('endpoint')
+        self._raw_error = data.get('error')
+        self.id_ = data.get('id')
+        self.key = data.get('key')
+        self.life = data.get('life')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'endpoint': self._raw_endpoint, 'error': self._raw_error, 'id': self.id_, 'key': self.key, 'life': self.life}
 
 
 
 class RelationResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RelationResult]
         '''
-        self.results = [RelationResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RelationResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RelationStatus(Type):
+    __slots__ = ('_endpoints', '_raw_endpoints', 'id_', 'interface', 'key', 'scope', 'unknown_fields')
     _toSchema = {'endpoints': 'endpoints', 'id_': 'id', 'interface': 'interface', 'key': 'key', 'scope': 'scope'}
     _toPy = {'endpoints': 'endpoints', 'id': 'id_', 'interface': 'interface', 'key': 'key', 'scope': 'scope'}
     def __init__(self, endpoints=None, id_=None, interface=None, key=None, scope=None, **unknown_fields):
@@ -7598,15 +16682,35 @@ class RelationStatus(Type):
         key : str
         scope : str
         '''
-        self.endpoints = [EndpointStatus.from_json(o) for o in endpoints or []]
+        self._raw_endpoints = endpoints
         self.id_ = id_
         self.interface = interface
         self.key = key
         self.scope = scope
+        self.unknown_fields = unknown_fields
+
+    endpoints = LazyField('endpoints', lambda data: [EndpointStatus.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_endpoints = data.get('endpoints')
+        self.id_ = data.get('id')
+        self.interface = data.get('interface')
+        self.key = data.get('key')
+        self.scope = data.get('scope')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'endpoints': self._raw_endpoints, 'id': self.id_, 'interface': self.interface, 'key': self.key, 'scope': self.scope}
 
 
 
 class RelationStatusArg(Type):
+    __slots__ = ('message', 'relation_id', 'status', 'unit_tag', 'unknown_fields')
     _toSchema = {'message': 'message', 'relation_id': 'relation-id', 'status': 'status', 'unit_tag': 'unit-tag'}
     _toPy = {'message': 'message', 'relation-id': 'relation_id', 'status': 'status', 'unit-tag': 'unit_tag'}
     def __init__(self, message=None, relation_id=None, status=None, unit_tag=None, **unknown_fields):
@@ -7620,32 +16724,81 @@ class RelationStatusArg(Type):
         self.relation_id = relation_id
         self.status = status
         self.unit_tag = unit_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.message = data.get('message')
+        self.relation_id = data.get('relation-id')
+        self.status = data.get('status')
+        self.unit_tag = data.get('unit-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'message': self.message, 'relation-id': self.relation_id, 'status': self.status, 'unit-tag': self.unit_tag}
 
 
 
 class RelationStatusArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RelationStatusArg]
         '''
-        self.args = [RelationStatusArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [RelationStatusArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class RelationStatusWatchResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RelationLifeSuspendedStatusWatchResult]
         '''
-        self.results = [RelationLifeSuspendedStatusWatchResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RelationLifeSuspendedStatusWatchResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RelationSuspendedArg(Type):
+    __slots__ = ('message', 'relation_id', 'suspended', 'unknown_fields')
     _toSchema = {'message': 'message', 'relation_id': 'relation-id', 'suspended': 'suspended'}
     _toPy = {'message': 'message', 'relation-id': 'relation_id', 'suspended': 'suspended'}
     def __init__(self, message=None, relation_id=None, suspended=None, **unknown_fields):
@@ -7657,21 +16810,53 @@ class RelationSuspendedArg(Type):
         self.message = message
         self.relation_id = relation_id
         self.suspended = suspended
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.message = data.get('message')
+        self.relation_id = data.get('relation-id')
+        self.suspended = data.get('suspended')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'message': self.message, 'relation-id': self.relation_id, 'suspended': self.suspended}
 
 
 
 class RelationSuspendedArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RelationSuspendedArg]
         '''
-        self.args = [RelationSuspendedArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [RelationSuspendedArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class RelationUnit(Type):
+    __slots__ = ('relation', 'unit', 'unknown_fields')
     _toSchema = {'relation': 'relation', 'unit': 'unit'}
     _toPy = {'relation': 'relation', 'unit': 'unit'}
     def __init__(self, relation=None, unit=None, **unknown_fields):
@@ -7681,10 +16866,25 @@ class RelationUnit(Type):
         '''
         self.relation = relation
         self.unit = unit
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.relation = data.get('relation')
+        self.unit = data.get('unit')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'relation': self.relation, 'unit': self.unit}
 
 
 
 class RelationUnitChange(Type):
+    __slots__ = ('settings', 'unknown_fields')
     _toSchema = {'settings': 'settings'}
     _toPy = {'settings': 'settings'}
     def __init__(self, settings=None, **unknown_fields):
@@ -7692,10 +16892,24 @@ class RelationUnitChange(Type):
         settings : typing.Mapping[str, typing.Any]
         '''
         self.settings = settings
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.settings = data.get('settings')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'settings': self.settings}
 
 
 
 class RelationUnitPair(Type):
+    __slots__ = ('local_unit', 'relation', 'remote_unit', 'unknown_fields')
     _toSchema = {'local_unit': 'local-unit', 'relation': 'relation', 'remote_unit': 'remote-unit'}
     _toPy = {'local-unit': 'local_unit', 'relation': 'relation', 'remote-unit': 'remote_unit'}
     def __init__(self, local_unit=None, relation=None, remote_unit=None, **unknown_fields):
@@ -7707,21 +16921,53 @@ class RelationUnitPair(Type):
         self.local_unit = local_unit
         self.relation = relation
         self.remote_unit = remote_unit
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.local_unit = data.get('local-unit')
+        self.relation = data.get('relation')
+        self.remote_unit = data.get('remote-unit')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'local-unit': self.local_unit, 'relation': self.relation, 'remote-unit': self.remote_unit}
 
 
 
 class RelationUnitPairs(Type):
+    __slots__ = ('_raw_relation_unit_pairs', '_relation_unit_pairs', 'unknown_fields')
     _toSchema = {'relation_unit_pairs': 'relation-unit-pairs'}
     _toPy = {'relation-unit-pairs': 'relation_unit_pairs'}
     def __init__(self, relation_unit_pairs=None, **unknown_fields):
         '''
         relation_unit_pairs : typing.Sequence[~RelationUnitPair]
         '''
-        self.relation_unit_pairs = [RelationUnitPair.from_json(o) for o in relation_unit_pairs or []]
+        self._raw_relation_unit_pairs = relation_unit_pairs
+        self.unknown_fields = unknown_fields
+
+    relation_unit_pairs = LazyField('relation_unit_pairs', lambda data: [RelationUnitPair.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_relation_unit_pairs = data.get('relation-unit-pairs')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'relation-unit-pairs': self._raw_relation_unit_pairs}
 
 
 
 class RelationUnitSettings(Type):
+    __slots__ = ('relation', 'settings', 'unit', 'unknown_fields')
     _toSchema = {'relation': 'relation', 'settings': 'settings', 'unit': 'unit'}
     _toPy = {'relation': 'relation', 'settings': 'settings', 'unit': 'unit'}
     def __init__(self, relation=None, settings=None, unit=None, **unknown_fields):
@@ -7733,10 +16979,26 @@ class RelationUnitSettings(Type):
         self.relation = relation
         self.settings = settings
         self.unit = unit
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.relation = data.get('relation')
+        self.settings = data.get('settings')
+        self.unit = data.get('unit')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'relation': self.relation, 'settings': self.settings, 'unit': self.unit}
 
 
 
 class RelationUnitStatus(Type):
+    __slots__ = ('in_scope', 'relation_tag', 'suspended', 'unknown_fields')
     _toSchema = {'in_scope': 'in-scope', 'relation_tag': 'relation-tag', 'suspended': 'suspended'}
     _toPy = {'in-scope': 'in_scope', 'relation-tag': 'relation_tag', 'suspended': 'suspended'}
     def __init__(self, in_scope=None, relation_tag=None, suspended=None, **unknown_fields):
@@ -7748,10 +17010,26 @@ class RelationUnitStatus(Type):
         self.in_scope = in_scope
         self.relation_tag = relation_tag
         self.suspended = suspended
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.in_scope = data.get('in-scope')
+        self.relation_tag = data.get('relation-tag')
+        self.suspended = data.get('suspended')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'in-scope': self.in_scope, 'relation-tag': self.relation_tag, 'suspended': self.suspended}
 
 
 
 class RelationUnitStatusResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_results', '_results', 'unknown_fields')
     _toSchema = {'error': 'error', 'results': 'results'}
     _toPy = {'error': 'error', 'results': 'results'}
     def __init__(self, error=None, results=None, **unknown_fields):
@@ -7759,34 +17037,84 @@ class RelationUnitStatusResult(Type):
         error : Error
         results : typing.Sequence[~RelationUnitStatus]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.results = [RelationUnitStatus.from_json(o) for o in results or []]
+        self._raw_error = error
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    results = LazyField('results', lambda data: [RelationUnitStatus.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'results': self._raw_results}
 
 
 
 class RelationUnitStatusResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RelationUnitStatusResult]
         '''
-        self.results = [RelationUnitStatusResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RelationUnitStatusResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RelationUnits(Type):
+    __slots__ = ('_raw_relation_units', '_relation_units', 'unknown_fields')
     _toSchema = {'relation_units': 'relation-units'}
     _toPy = {'relation-units': 'relation_units'}
     def __init__(self, relation_units=None, **unknown_fields):
         '''
         relation_units : typing.Sequence[~RelationUnit]
         '''
-        self.relation_units = [RelationUnit.from_json(o) for o in relation_units or []]
+        self._raw_relation_units = relation_units
+        self.unknown_fields = unknown_fields
+
+    relation_units = LazyField('relation_units', lambda data: [RelationUnit.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_relation_units = data.get('relation-units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'relation-units': self._raw_relation_units}
 
 
 
 class RelationUnitsChange(Type):
+    __slots__ = ('changed', 'departed', 'unknown_fields')
     _toSchema = {'changed': 'changed', 'departed': 'departed'}
     _toPy = {'changed': 'changed', 'departed': 'departed'}
     def __init__(self, changed=None, departed=None, **unknown_fields):
@@ -7796,21 +17124,52 @@ class RelationUnitsChange(Type):
         '''
         self.changed = changed
         self.departed = departed
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.changed = data.get('changed')
+        self.departed = data.get('departed')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changed': self.changed, 'departed': self.departed}
 
 
 
 class RelationUnitsSettings(Type):
+    __slots__ = ('_raw_relation_units', '_relation_units', 'unknown_fields')
     _toSchema = {'relation_units': 'relation-units'}
     _toPy = {'relation-units': 'relation_units'}
     def __init__(self, relation_units=None, **unknown_fields):
         '''
         relation_units : typing.Sequence[~RelationUnitSettings]
         '''
-        self.relation_units = [RelationUnitSettings.from_json(o) for o in relation_units or []]
+        self._raw_relation_units = relation_units
+        self.unknown_fields = unknown_fields
+
+    relation_units = LazyField('relation_units', lambda data: [RelationUnitSettings.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_relation_units = data.get('relation-units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'relation-units': self._raw_relation_units}
 
 
 
 class RelationUnitsWatchResult(Type):
+    __slots__ = ('_changes', '_error', '_raw_changes', '_raw_error', 'unknown_fields', 'watcher_id')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
@@ -7819,24 +17178,59 @@ class RelationUnitsWatchResult(Type):
         error : Error
         watcher_id : str
         '''
-        self.changes = RelationUnitsChange.from_json(changes) if changes else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_changes = changes
+        self._raw_error = error
         self.watcher_id = watcher_id
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: RelationUnitsChange.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self._raw_error = data.get('error')
+        self.watcher_id = data.get('watcher-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes, 'error': self._raw_error, 'watcher-id': self.watcher_id}
 
 
 
 class RelationUnitsWatchResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RelationUnitsWatchResult]
         '''
-        self.results = [RelationUnitsWatchResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RelationUnitsWatchResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RemoteApplication(Type):
+    __slots__ = ('_macaroon', '_raw_macaroon', 'is_consumer_proxy', 'life', 'model_uuid', 'name', 'offer_uuid', 'status', 'unknown_fields')
     _toSchema = {'is_consumer_proxy': 'is-consumer-proxy', 'life': 'life', 'macaroon': 'macaroon', 'model_uuid': 'model-uuid', 'name': 'name', 'offer_uuid': 'offer-uuid', 'status': 'status'}
     _toPy = {'is-consumer-proxy': 'is_consumer_proxy', 'life': 'life', 'macaroon': 'macaroon', 'model-uuid': 'model_uuid', 'name': 'name', 'offer-uuid': 'offer_uuid', 'status': 'status'}
     def __init__(self, is_consumer_proxy=None, life=None, macaroon=None, model_uuid=None, name=None, offer_uuid=None, status=None, **unknown_fields):
@@ -7851,15 +17245,37 @@ class RemoteApplication(Type):
         '''
         self.is_consumer_proxy = is_consumer_proxy
         self.life = life
-        self.macaroon = Macaroon.from_json(macaroon) if macaroon else None
+        self._raw_macaroon = macaroon
         self.model_uuid = model_uuid
         self.name = name
         self.offer_uuid = offer_uuid
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    macaroon = LazyField('macaroon', lambda data: Macaroon.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.is_consumer_proxy = data.get('is-consumer-proxy')
+        self.life = data.get('life')
+        self._raw_macaroon = data.get('macaroon')
+        self.model_uuid = data.get('model-uuid')
+        self.name = data.get('name')
+        self.offer_uuid = data.get('offer-uuid')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'is-consumer-proxy': self.is_consumer_proxy, 'life': self.life, 'macaroon': self._raw_macaroon, 'model-uuid': self.model_uuid, 'name': self.name, 'offer-uuid': self.offer_uuid, 'status': self.status}
 
 
 
 class RemoteApplicationChange(Type):
+    __slots__ = ('_raw_relations', '_relations', 'application_tag', 'life', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'life': 'life', 'relations': 'relations'}
     _toPy = {'application-tag': 'application_tag', 'life': 'life', 'relations': 'relations'}
     def __init__(self, application_tag=None, life=None, relations=None, **unknown_fields):
@@ -7870,11 +17286,29 @@ class RemoteApplicationChange(Type):
         '''
         self.application_tag = application_tag
         self.life = life
-        self.relations = RemoteRelationsChange.from_json(relations) if relations else None
+        self._raw_relations = relations
+        self.unknown_fields = unknown_fields
+
+    relations = LazyField('relations', lambda data: RemoteRelationsChange.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_tag = data.get('application-tag')
+        self.life = data.get('life')
+        self._raw_relations = data.get('relations')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-tag': self.application_tag, 'life': self.life, 'relations': self._raw_relations}
 
 
 
 class RemoteApplicationInfo(Type):
+    __slots__ = ('_endpoints', '_raw_endpoints', 'application_url', 'description', 'icon_url_path', 'model_tag', 'name', 'source_model_label', 'unknown_fields')
     _toSchema = {'application_url': 'application-url', 'description': 'description', 'endpoints': 'endpoints', 'icon_url_path': 'icon-url-path', 'model_tag': 'model-tag', 'name': 'name', 'source_model_label': 'source-model-label'}
     _toPy = {'application-url': 'application_url', 'description': 'description', 'endpoints': 'endpoints', 'icon-url-path': 'icon_url_path', 'model-tag': 'model_tag', 'name': 'name', 'source-model-label': 'source_model_label'}
     def __init__(self, application_url=None, description=None, endpoints=None, icon_url_path=None, model_tag=None, name=None, source_model_label=None, **unknown_fields):
@@ -7889,15 +17323,37 @@ class RemoteApplicationInfo(Type):
         '''
         self.application_url = application_url
         self.description = description
-        self.endpoints = [RemoteEndpoint.from_json(o) for o in endpoints or []]
+        self._raw_endpoints = endpoints
         self.icon_url_path = icon_url_path
         self.model_tag = model_tag
         self.name = name
         self.source_model_label = source_model_label
+        self.unknown_fields = unknown_fields
+
+    endpoints = LazyField('endpoints', lambda data: [RemoteEndpoint.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_url = data.get('application-url')
+        self.description = data.get('description')
+        self._raw_endpoints = data.get('endpoints')
+        self.icon_url_path = data.get('icon-url-path')
+        self.model_tag = data.get('model-tag')
+        self.name = data.get('name')
+        self.source_model_label = data.get('source-model-label')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-url': self.application_url, 'description': self.description, 'endpoints': self._raw_endpoints, 'icon-url-path': self.icon_url_path, 'model-tag': self.model_tag, 'name': self.name, 'source-model-label': self.source_model_label}
 
 
 
 class RemoteApplicationInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -7905,23 +17361,57 @@ class RemoteApplicationInfoResult(Type):
         error : Error
         result : RemoteApplicationInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = RemoteApplicationInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: RemoteApplicationInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class RemoteApplicationInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoteApplicationInfoResult]
         '''
-        self.results = [RemoteApplicationInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RemoteApplicationInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RemoteApplicationResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -7929,23 +17419,57 @@ class RemoteApplicationResult(Type):
         error : Error
         result : RemoteApplication
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = RemoteApplication.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: RemoteApplication.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class RemoteApplicationResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoteApplicationResult]
         '''
-        self.results = [RemoteApplicationResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RemoteApplicationResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RemoteApplicationStatus(Type):
+    __slots__ = ('_endpoints', '_raw_endpoints', '_raw_status', '_status', 'application_name', 'application_url', 'err', 'life', 'relations', 'unknown_fields')
     _toSchema = {'application_name': 'application-name', 'application_url': 'application-url', 'endpoints': 'endpoints', 'err': 'err', 'life': 'life', 'relations': 'relations', 'status': 'status'}
     _toPy = {'application-name': 'application_name', 'application-url': 'application_url', 'endpoints': 'endpoints', 'err': 'err', 'life': 'life', 'relations': 'relations', 'status': 'status'}
     def __init__(self, application_name=None, application_url=None, endpoints=None, err=None, life=None, relations=None, status=None, **unknown_fields):
@@ -7960,15 +17484,38 @@ class RemoteApplicationStatus(Type):
         '''
         self.application_name = application_name
         self.application_url = application_url
-        self.endpoints = [RemoteEndpoint.from_json(o) for o in endpoints or []]
+        self._raw_endpoints = endpoints
         self.err = err
         self.life = life
         self.relations = relations
-        self.status = DetailedStatus.from_json(status) if status else None
+        self._raw_status = status
+        self.unknown_fields = unknown_fields
+
+    endpoints = LazyField('endpoints', lambda data: [RemoteEndpoint.from_json(o) for o in data or []])
+    status = LazyField('status', lambda data: DetailedStatus.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_name = data.get('application-name')
+        self.application_url = data.get('application-url')
+        self._raw_endpoints = data.get('endpoints')
+        self.err = data.get('err')
+        self.life = data.get('life')
+        self.relations = data.get('relations')
+        self._raw_status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-name': self.application_name, 'application-url': self.application_url, 'endpoints': self._raw_endpoints, 'err': self.err, 'life': self.life, 'relations': self.relations, 'status': self._raw_status}
 
 
 
 class RemoteApplicationWatchResult(Type):
+    __slots__ = ('_change', '_error', '_raw_change', '_raw_error', 'id_', 'unknown_fields')
     _toSchema = {'change': 'change', 'error': 'error', 'id_': 'id'}
     _toPy = {'change': 'change', 'error': 'error', 'id': 'id_'}
     def __init__(self, change=None, error=None, id_=None, **unknown_fields):
@@ -7977,13 +17524,32 @@ class RemoteApplicationWatchResult(Type):
         error : Error
         id_ : str
         '''
-        self.change = RemoteApplicationChange.from_json(change) if change else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_change = change
+        self._raw_error = error
         self.id_ = id_
+        self.unknown_fields = unknown_fields
+
+    change = LazyField('change', lambda data: RemoteApplicationChange.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_change = data.get('change')
+        self._raw_error = data.get('error')
+        self.id_ = data.get('id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'change': self._raw_change, 'error': self._raw_error, 'id': self.id_}
 
 
 
 class RemoteEndpoint(Type):
+    __slots__ = ('interface', 'limit', 'name', 'role', 'scope', 'unknown_fields')
     _toSchema = {'interface': 'interface', 'limit': 'limit', 'name': 'name', 'role': 'role', 'scope': 'scope'}
     _toPy = {'interface': 'interface', 'limit': 'limit', 'name': 'name', 'role': 'role', 'scope': 'scope'}
     def __init__(self, interface=None, limit=None, name=None, role=None, scope=None, **unknown_fields):
@@ -7999,10 +17565,28 @@ class RemoteEndpoint(Type):
         self.name = name
         self.role = role
         self.scope = scope
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.interface = data.get('interface')
+        self.limit = data.get('limit')
+        self.name = data.get('name')
+        self.role = data.get('role')
+        self.scope = data.get('scope')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'interface': self.interface, 'limit': self.limit, 'name': self.name, 'role': self.role, 'scope': self.scope}
 
 
 
 class RemoteEntityArg(Type):
+    __slots__ = ('_macaroons', '_raw_macaroons', 'relation_token', 'unknown_fields')
     _toSchema = {'macaroons': 'macaroons', 'relation_token': 'relation-token'}
     _toPy = {'macaroons': 'macaroons', 'relation-token': 'relation_token'}
     def __init__(self, macaroons=None, relation_token=None, **unknown_fields):
@@ -8010,23 +17594,56 @@ class RemoteEntityArg(Type):
         macaroons : typing.Sequence[~Macaroon]
         relation_token : str
         '''
-        self.macaroons = [Macaroon.from_json(o) for o in macaroons or []]
+        self._raw_macaroons = macaroons
         self.relation_token = relation_token
+        self.unknown_fields = unknown_fields
+
+    macaroons = LazyField('macaroons', lambda data: [Macaroon.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_macaroons = data.get('macaroons')
+        self.relation_token = data.get('relation-token')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'macaroons': self._raw_macaroons, 'relation-token': self.relation_token}
 
 
 
 class RemoteEntityArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RemoteEntityArg]
         '''
-        self.args = [RemoteEntityArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [RemoteEntityArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class RemoteEntityId(Type):
+    __slots__ = ('model_uuid', 'token', 'unknown_fields')
     _toSchema = {'model_uuid': 'model-uuid', 'token': 'token'}
     _toPy = {'model-uuid': 'model_uuid', 'token': 'token'}
     def __init__(self, model_uuid=None, token=None, **unknown_fields):
@@ -8036,10 +17653,25 @@ class RemoteEntityId(Type):
         '''
         self.model_uuid = model_uuid
         self.token = token
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.model_uuid = data.get('model-uuid')
+        self.token = data.get('token')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'model-uuid': self.model_uuid, 'token': self.token}
 
 
 
 class RemoteEntityTokenArg(Type):
+    __slots__ = ('tag', 'token', 'unknown_fields')
     _toSchema = {'tag': 'tag', 'token': 'token'}
     _toPy = {'tag': 'tag', 'token': 'token'}
     def __init__(self, tag=None, token=None, **unknown_fields):
@@ -8049,21 +17681,52 @@ class RemoteEntityTokenArg(Type):
         '''
         self.tag = tag
         self.token = token
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.tag = data.get('tag')
+        self.token = data.get('token')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'tag': self.tag, 'token': self.token}
 
 
 
 class RemoteEntityTokenArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RemoteEntityTokenArg]
         '''
-        self.args = [RemoteEntityTokenArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [RemoteEntityTokenArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('Args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Args': self._raw_args}
 
 
 
 class RemoteRelation(Type):
+    __slots__ = ('_endpoint', '_raw_endpoint', 'application_name', 'id_', 'key', 'life', 'remote_application_name', 'remote_endpoint_name', 'source_model_uuid', 'suspended', 'unknown_fields')
     _toSchema = {'application_name': 'application-name', 'endpoint': 'endpoint', 'id_': 'id', 'key': 'key', 'life': 'life', 'remote_application_name': 'remote-application-name', 'remote_endpoint_name': 'remote-endpoint-name', 'source_model_uuid': 'source-model-uuid', 'suspended': 'suspended'}
     _toPy = {'application-name': 'application_name', 'endpoint': 'endpoint', 'id': 'id_', 'key': 'key', 'life': 'life', 'remote-application-name': 'remote_application_name', 'remote-endpoint-name': 'remote_endpoint_name', 'source-model-uuid': 'source_model_uuid', 'suspended': 'suspended'}
     def __init__(self, application_name=None, endpoint=None, id_=None, key=None, life=None, remote_application_name=None, remote_endpoint_name=None, source_model_uuid=None, suspended=None, **unknown_fields):
@@ -8079,7 +17742,7 @@ class RemoteRelation(Type):
         suspended : bool
         '''
         self.application_name = application_name
-        self.endpoint = RemoteEndpoint.from_json(endpoint) if endpoint else None
+        self._raw_endpoint = endpoint
         self.id_ = id_
         self.key = key
         self.life = life
@@ -8087,10 +17750,34 @@ class RemoteRelation(Type):
         self.remote_endpoint_name = remote_endpoint_name
         self.source_model_uuid = source_model_uuid
         self.suspended = suspended
+        self.unknown_fields = unknown_fields
+
+    endpoint = LazyField('endpoint', lambda data: RemoteEndpoint.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_name = data.get('application-name')
+        self._raw_endpoint = data.get('endpoint')
+        self.id_ = data.get('id')
+        self.key = data.get('key')
+        self.life = data.get('life')
+        self.remote_application_name = data.get('remote-application-name')
+        self.remote_endpoint_name = data.get('remote-endpoint-name')
+        self.source_model_uuid = data.get('source-model-uuid')
+        self.suspended = data.get('suspended')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-name': self.application_name, 'endpoint': self._raw_endpoint, 'id': self.id_, 'key': self.key, 'life': self.life, 'remote-application-name': self.remote_application_name, 'remote-endpoint-name': self.remote_endpoint_name, 'source-model-uuid': self.source_model_uuid, 'suspended': self.suspended}
 
 
 
 class RemoteRelationChange(Type):
+    __slots__ = ('changed_units', 'departed_units', 'id_', 'life', 'unknown_fields')
     _toSchema = {'changed_units': 'changed-units', 'departed_units': 'departed-units', 'id_': 'id', 'life': 'life'}
     _toPy = {'changed-units': 'changed_units', 'departed-units': 'departed_units', 'id': 'id_', 'life': 'life'}
     def __init__(self, changed_units=None, departed_units=None, id_=None, life=None, **unknown_fields):
@@ -8104,10 +17791,27 @@ class RemoteRelationChange(Type):
         self.departed_units = departed_units
         self.id_ = id_
         self.life = life
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.changed_units = data.get('changed-units')
+        self.departed_units = data.get('departed-units')
+        self.id_ = data.get('id')
+        self.life = data.get('life')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changed-units': self.changed_units, 'departed-units': self.departed_units, 'id': self.id_, 'life': self.life}
 
 
 
 class RemoteRelationChangeEvent(Type):
+    __slots__ = ('_changed_units', '_macaroons', '_raw_changed_units', '_raw_macaroons', 'application_token', 'departed_units', 'force_cleanup', 'life', 'relation_token', 'suspended', 'suspended_reason', 'unknown_fields')
     _toSchema = {'application_token': 'application-token', 'changed_units': 'changed-units', 'departed_units': 'departed-units', 'force_cleanup': 'force-cleanup', 'life': 'life', 'macaroons': 'macaroons', 'relation_token': 'relation-token', 'suspended': 'suspended', 'suspended_reason': 'suspended-reason'}
     _toPy = {'application-token': 'application_token', 'changed-units': 'changed_units', 'departed-units': 'departed_units', 'force-cleanup': 'force_cleanup', 'life': 'life', 'macaroons': 'macaroons', 'relation-token': 'relation_token', 'suspended': 'suspended', 'suspended-reason': 'suspended_reason'}
     def __init__(self, application_token=None, changed_units=None, departed_units=None, force_cleanup=None, life=None, macaroons=None, relation_token=None, suspended=None, suspended_reason=None, **unknown_fields):
@@ -8123,18 +17827,43 @@ class RemoteRelationChangeEvent(Type):
         suspended_reason : str
         '''
         self.application_token = application_token
-        self.changed_units = [RemoteRelationUnitChange.from_json(o) for o in changed_units or []]
+        self._raw_changed_units = changed_units
         self.departed_units = departed_units
         self.force_cleanup = force_cleanup
         self.life = life
-        self.macaroons = [Macaroon.from_json(o) for o in macaroons or []]
+        self._raw_macaroons = macaroons
         self.relation_token = relation_token
         self.suspended = suspended
         self.suspended_reason = suspended_reason
+        self.unknown_fields = unknown_fields
+
+    changed_units = LazyField('changed_units', lambda data: [RemoteRelationUnitChange.from_json(o) for o in data or []])
+    macaroons = LazyField('macaroons', lambda data: [Macaroon.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_token = data.get('application-token')
+        self._raw_changed_units = data.get('changed-units')
+        self.departed_units = data.get('departed-units')
+        self.force_cleanup = data.get('force-cleanup')
+        self.life = data.get('life')
+        self._raw_macaroons = data.get('macaroons')
+        self.relation_token = data.get('relation-token')
+        self.suspended = data.get('suspended')
+        self.suspended_reason = data.get('suspended-reason')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-token': self.application_token, 'changed-units': self._raw_changed_units, 'departed-units': self.departed_units, 'force-cleanup': self.force_cleanup, 'life': self.life, 'macaroons': self._raw_macaroons, 'relation-token': self.relation_token, 'suspended': self.suspended, 'suspended-reason': self.suspended_reason}
 
 
 
 class RemoteRelationDetails(Type):
+    __slots__ = ('_macaroon', '_raw_macaroon', 'relation_token', 'unknown_fields')
     _toSchema = {'macaroon': 'macaroon', 'relation_token': 'relation-token'}
     _toPy = {'macaroon': 'macaroon', 'relation-token': 'relation_token'}
     def __init__(self, macaroon=None, relation_token=None, **unknown_fields):
@@ -8142,12 +17871,29 @@ class RemoteRelationDetails(Type):
         macaroon : Macaroon
         relation_token : str
         '''
-        self.macaroon = Macaroon.from_json(macaroon) if macaroon else None
+        self._raw_macaroon = macaroon
         self.relation_token = relation_token
+        self.unknown_fields = unknown_fields
+
+    macaroon = LazyField('macaroon', lambda data: Macaroon.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_macaroon = data.get('macaroon')
+        self.relation_token = data.get('relation-token')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'macaroon': self._raw_macaroon, 'relation-token': self.relation_token}
 
 
 
 class RemoteRelationResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -8155,23 +17901,57 @@ class RemoteRelationResult(Type):
         error : Error
         result : RemoteRelation
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = RemoteRelation.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: RemoteRelation.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class RemoteRelationResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoteRelationResult]
         '''
-        self.results = [RemoteRelationResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RemoteRelationResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RemoteRelationUnit(Type):
+    __slots__ = ('_macaroons', '_raw_macaroons', 'relation_token', 'unit', 'unknown_fields')
     _toSchema = {'macaroons': 'macaroons', 'relation_token': 'relation-token', 'unit': 'unit'}
     _toPy = {'macaroons': 'macaroons', 'relation-token': 'relation_token', 'unit': 'unit'}
     def __init__(self, macaroons=None, relation_token=None, unit=None, **unknown_fields):
@@ -8180,13 +17960,31 @@ class RemoteRelationUnit(Type):
         relation_token : str
         unit : str
         '''
-        self.macaroons = [Macaroon.from_json(o) for o in macaroons or []]
+        self._raw_macaroons = macaroons
         self.relation_token = relation_token
         self.unit = unit
+        self.unknown_fields = unknown_fields
+
+    macaroons = LazyField('macaroons', lambda data: [Macaroon.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_macaroons = data.get('macaroons')
+        self.relation_token = data.get('relation-token')
+        self.unit = data.get('unit')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'macaroons': self._raw_macaroons, 'relation-token': self.relation_token, 'unit': self.unit}
 
 
 
 class RemoteRelationUnitChange(Type):
+    __slots__ = ('_raw_unit_id', '_unit_id', 'settings', 'unknown_fields')
     _toSchema = {'settings': 'settings', 'unit_id': 'unit-id'}
     _toPy = {'settings': 'settings', 'unit-id': 'unit_id'}
     def __init__(self, settings=None, unit_id=None, **unknown_fields):
@@ -8195,22 +17993,55 @@ class RemoteRelationUnitChange(Type):
         unit_id : RemoteEntityId
         '''
         self.settings = settings
-        self.unit_id = RemoteEntityId.from_json(unit_id) if unit_id else None
+        self._raw_unit_id = unit_id
+        self.unknown_fields = unknown_fields
+
+    unit_id = LazyField('unit_id', lambda data: RemoteEntityId.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.settings = data.get('settings')
+        self._raw_unit_id = data.get('unit-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'settings': self.settings, 'unit-id': self._raw_unit_id}
 
 
 
 class RemoteRelationUnits(Type):
+    __slots__ = ('_raw_relation_units', '_relation_units', 'unknown_fields')
     _toSchema = {'relation_units': 'relation-units'}
     _toPy = {'relation-units': 'relation_units'}
     def __init__(self, relation_units=None, **unknown_fields):
         '''
         relation_units : typing.Sequence[~RemoteRelationUnit]
         '''
-        self.relation_units = [RemoteRelationUnit.from_json(o) for o in relation_units or []]
+        self._raw_relation_units = relation_units
+        self.unknown_fields = unknown_fields
+
+    relation_units = LazyField('relation_units', lambda data: [RemoteRelationUnit.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_relation_units = data.get('relation-units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'relation-units': self._raw_relation_units}
 
 
 
 class RemoteRelationsChange(Type):
+    __slots__ = ('_changed', '_raw_changed', 'initial', 'removed', 'unknown_fields')
     _toSchema = {'changed': 'changed', 'initial': 'initial', 'removed': 'removed'}
     _toPy = {'changed': 'changed', 'initial': 'initial', 'removed': 'removed'}
     def __init__(self, changed=None, initial=None, removed=None, **unknown_fields):
@@ -8219,24 +18050,58 @@ class RemoteRelationsChange(Type):
         initial : bool
         removed : typing.Sequence[int]
         '''
-        self.changed = [RemoteRelationChange.from_json(o) for o in changed or []]
+        self._raw_changed = changed
         self.initial = initial
         self.removed = removed
+        self.unknown_fields = unknown_fields
+
+    changed = LazyField('changed', lambda data: [RemoteRelationChange.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changed = data.get('changed')
+        self.initial = data.get('initial')
+        self.removed = data.get('removed')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changed': self._raw_changed, 'initial': self.initial, 'removed': self.removed}
 
 
 
 class RemoteRelationsChanges(Type):
+    __slots__ = ('_changes', '_raw_changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~RemoteRelationChangeEvent]
         '''
-        self.changes = [RemoteRelationChangeEvent.from_json(o) for o in changes or []]
+        self._raw_changes = changes
+        self.unknown_fields = unknown_fields
+
+    changes = LazyField('changes', lambda data: [RemoteRelationChangeEvent.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_changes = data.get('changes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'changes': self._raw_changes}
 
 
 
 class RemoteRelationsWatchResult(Type):
+    __slots__ = ('_change', '_error', '_raw_change', '_raw_error', 'remoterelationswatcherid', 'unknown_fields')
     _toSchema = {'change': 'change', 'error': 'error', 'remoterelationswatcherid': 'RemoteRelationsWatcherId'}
     _toPy = {'RemoteRelationsWatcherId': 'remoterelationswatcherid', 'change': 'change', 'error': 'error'}
     def __init__(self, remoterelationswatcherid=None, change=None, error=None, **unknown_fields):
@@ -8246,12 +18111,31 @@ class RemoteRelationsWatchResult(Type):
         error : Error
         '''
         self.remoterelationswatcherid = remoterelationswatcherid
-        self.change = RemoteRelationsChange.from_json(change) if change else None
-        self.error = Error.from_json(error) if error else None
+        self._raw_change = change
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    change = LazyField('change', lambda data: RemoteRelationsChange.from_json(data) if data else None)
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.remoterelationswatcherid = data.get('RemoteRelationsWatcherId')
+        self._raw_change = data.get('change')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'RemoteRelationsWatcherId': self.remoterelationswatcherid, 'change': self._raw_change, 'error': self._raw_error}
 
 
 
 class RemoteSpace(Type):
+    __slots__ = ('_raw_subnets', '_subnets', 'cloud_type', 'name', 'provider_attributes', 'provider_id', 'unknown_fields')
     _toSchema = {'cloud_type': 'cloud-type', 'name': 'name', 'provider_attributes': 'provider-attributes', 'provider_id': 'provider-id', 'subnets': 'subnets'}
     _toPy = {'cloud-type': 'cloud_type', 'name': 'name', 'provider-attributes': 'provider_attributes', 'provider-id': 'provider_id', 'subnets': 'subnets'}
     def __init__(self, cloud_type=None, name=None, provider_attributes=None, provider_id=None, subnets=None, **unknown_fields):
@@ -8266,11 +18150,31 @@ class RemoteSpace(Type):
         self.name = name
         self.provider_attributes = provider_attributes
         self.provider_id = provider_id
-        self.subnets = [Subnet.from_json(o) for o in subnets or []]
+        self._raw_subnets = subnets
+        self.unknown_fields = unknown_fields
+
+    subnets = LazyField('subnets', lambda data: [Subnet.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cloud_type = data.get('cloud-type')
+        self.name = data.get('name')
+        self.provider_attributes = data.get('provider-attributes')
+        self.provider_id = data.get('provider-id')
+        self._raw_subnets = data.get('subnets')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud-type': self.cloud_type, 'name': self.name, 'provider-attributes': self.provider_attributes, 'provider-id': self.provider_id, 'subnets': self._raw_subnets}
 
 
 
 class RemoveBlocksArgs(Type):
+    __slots__ = ('all_', 'unknown_fields')
     _toSchema = {'all_': 'all'}
     _toPy = {'all': 'all_'}
     def __init__(self, all_=None, **unknown_fields):
@@ -8278,10 +18182,24 @@ class RemoveBlocksArgs(Type):
         all_ : bool
         '''
         self.all_ = all_
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.all_ = data.get('all')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'all': self.all_}
 
 
 
 class RemoveFilesystemParams(Type):
+    __slots__ = ('destroy', 'filesystem_id', 'provider', 'unknown_fields')
     _toSchema = {'destroy': 'destroy', 'filesystem_id': 'filesystem-id', 'provider': 'provider'}
     _toPy = {'destroy': 'destroy', 'filesystem-id': 'filesystem_id', 'provider': 'provider'}
     def __init__(self, destroy=None, filesystem_id=None, provider=None, **unknown_fields):
@@ -8293,10 +18211,26 @@ class RemoveFilesystemParams(Type):
         self.destroy = destroy
         self.filesystem_id = filesystem_id
         self.provider = provider
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.destroy = data.get('destroy')
+        self.filesystem_id = data.get('filesystem-id')
+        self.provider = data.get('provider')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destroy': self.destroy, 'filesystem-id': self.filesystem_id, 'provider': self.provider}
 
 
 
 class RemoveFilesystemParamsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -8304,34 +18238,84 @@ class RemoveFilesystemParamsResult(Type):
         error : Error
         result : RemoveFilesystemParams
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = RemoveFilesystemParams.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: RemoveFilesystemParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class RemoveFilesystemParamsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoveFilesystemParamsResult]
         '''
-        self.results = [RemoveFilesystemParamsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RemoveFilesystemParamsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RemoveStorage(Type):
+    __slots__ = ('_raw_storage', '_storage', 'unknown_fields')
     _toSchema = {'storage': 'storage'}
     _toPy = {'storage': 'storage'}
     def __init__(self, storage=None, **unknown_fields):
         '''
         storage : typing.Sequence[~RemoveStorageInstance]
         '''
-        self.storage = [RemoveStorageInstance.from_json(o) for o in storage or []]
+        self._raw_storage = storage
+        self.unknown_fields = unknown_fields
+
+    storage = LazyField('storage', lambda data: [RemoveStorageInstance.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_storage = data.get('storage')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'storage': self._raw_storage}
 
 
 
 class RemoveStorageInstance(Type):
+    __slots__ = ('destroy_attachments', 'destroy_storage', 'tag', 'unknown_fields')
     _toSchema = {'destroy_attachments': 'destroy-attachments', 'destroy_storage': 'destroy-storage', 'tag': 'tag'}
     _toPy = {'destroy-attachments': 'destroy_attachments', 'destroy-storage': 'destroy_storage', 'tag': 'tag'}
     def __init__(self, destroy_attachments=None, destroy_storage=None, tag=None, **unknown_fields):
@@ -8343,10 +18327,26 @@ class RemoveStorageInstance(Type):
         self.destroy_attachments = destroy_attachments
         self.destroy_storage = destroy_storage
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.destroy_attachments = data.get('destroy-attachments')
+        self.destroy_storage = data.get('destroy-storage')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destroy-attachments': self.destroy_attachments, 'destroy-storage': self.destroy_storage, 'tag': self.tag}
 
 
 
 class RemoveVolumeParams(Type):
+    __slots__ = ('destroy', 'provider', 'unknown_fields', 'volume_id')
     _toSchema = {'destroy': 'destroy', 'provider': 'provider', 'volume_id': 'volume-id'}
     _toPy = {'destroy': 'destroy', 'provider': 'provider', 'volume-id': 'volume_id'}
     def __init__(self, destroy=None, provider=None, volume_id=None, **unknown_fields):
@@ -8358,10 +18358,26 @@ class RemoveVolumeParams(Type):
         self.destroy = destroy
         self.provider = provider
         self.volume_id = volume_id
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.destroy = data.get('destroy')
+        self.provider = data.get('provider')
+        self.volume_id = data.get('volume-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'destroy': self.destroy, 'provider': self.provider, 'volume-id': self.volume_id}
 
 
 
 class RemoveVolumeParamsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -8369,23 +18385,57 @@ class RemoveVolumeParamsResult(Type):
         error : Error
         result : RemoveVolumeParams
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = RemoveVolumeParams.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: RemoveVolumeParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class RemoveVolumeParamsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoveVolumeParamsResult]
         '''
-        self.results = [RemoveVolumeParamsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RemoveVolumeParamsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ResolveCharmResult(Type):
+    __slots__ = ('error', 'unknown_fields', 'url')
     _toSchema = {'error': 'error', 'url': 'url'}
     _toPy = {'error': 'error', 'url': 'url'}
     def __init__(self, error=None, url=None, **unknown_fields):
@@ -8395,21 +18445,52 @@ class ResolveCharmResult(Type):
         '''
         self.error = error
         self.url = url
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.error = data.get('error')
+        self.url = data.get('url')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self.error, 'url': self.url}
 
 
 
 class ResolveCharmResults(Type):
+    __slots__ = ('_raw_urls', '_urls', 'unknown_fields')
     _toSchema = {'urls': 'urls'}
     _toPy = {'urls': 'urls'}
     def __init__(self, urls=None, **unknown_fields):
         '''
         urls : typing.Sequence[~ResolveCharmResult]
         '''
-        self.urls = [ResolveCharmResult.from_json(o) for o in urls or []]
+        self._raw_urls = urls
+        self.unknown_fields = unknown_fields
+
+    urls = LazyField('urls', lambda data: [ResolveCharmResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_urls = data.get('urls')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'urls': self._raw_urls}
 
 
 
 class ResolveCharms(Type):
+    __slots__ = ('references', 'unknown_fields')
     _toSchema = {'references': 'references'}
     _toPy = {'references': 'references'}
     def __init__(self, references=None, **unknown_fields):
@@ -8417,10 +18498,24 @@ class ResolveCharms(Type):
         references : typing.Sequence[str]
         '''
         self.references = references
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.references = data.get('references')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'references': self.references}
 
 
 
 class Resolved(Type):
+    __slots__ = ('retry', 'unit_name', 'unknown_fields')
     _toSchema = {'retry': 'retry', 'unit_name': 'unit-name'}
     _toPy = {'retry': 'retry', 'unit-name': 'unit_name'}
     def __init__(self, retry=None, unit_name=None, **unknown_fields):
@@ -8430,10 +18525,25 @@ class Resolved(Type):
         '''
         self.retry = retry
         self.unit_name = unit_name
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.retry = data.get('retry')
+        self.unit_name = data.get('unit-name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'retry': self.retry, 'unit-name': self.unit_name}
 
 
 
 class ResolvedModeResult(Type):
+    __slots__ = ('_error', '_raw_error', 'mode', 'unknown_fields')
     _toSchema = {'error': 'error', 'mode': 'mode'}
     _toPy = {'error': 'error', 'mode': 'mode'}
     def __init__(self, error=None, mode=None, **unknown_fields):
@@ -8441,23 +18551,56 @@ class ResolvedModeResult(Type):
         error : Error
         mode : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.mode = mode
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.mode = data.get('mode')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'mode': self.mode}
 
 
 
 class ResolvedModeResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ResolvedModeResult]
         '''
-        self.results = [ResolvedModeResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ResolvedModeResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Resource(Type):
+    __slots__ = ('_charmresource', '_raw_charmresource', 'application', 'id_', 'pending_id', 'timestamp', 'unknown_fields', 'username')
     _toSchema = {'application': 'application', 'charmresource': 'CharmResource', 'id_': 'id', 'pending_id': 'pending-id', 'timestamp': 'timestamp', 'username': 'username'}
     _toPy = {'CharmResource': 'charmresource', 'application': 'application', 'id': 'id_', 'pending-id': 'pending_id', 'timestamp': 'timestamp', 'username': 'username'}
     def __init__(self, charmresource=None, application=None, id_=None, pending_id=None, timestamp=None, username=None, **unknown_fields):
@@ -8469,16 +18612,37 @@ class Resource(Type):
         timestamp : str
         username : str
         '''
-        self.charmresource = CharmResource.from_json(charmresource) if charmresource else None
+        self._raw_charmresource = charmresource
         self.application = application
         self.id_ = id_
         self.pending_id = pending_id
         self.timestamp = timestamp
         self.username = username
+        self.unknown_fields = unknown_fields
+
+    charmresource = LazyField('charmresource', lambda data: CharmResource.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_charmresource = data.get('CharmResource')
+        self.application = data.get('application')
+        self.id_ = data.get('id')
+        self.pending_id = data.get('pending-id')
+        self.timestamp = data.get('timestamp')
+        self.username = data.get('username')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'CharmResource': self._raw_charmresource, 'application': self.application, 'id': self.id_, 'pending-id': self.pending_id, 'timestamp': self.timestamp, 'username': self.username}
 
 
 
 class ResourceResult(Type):
+    __slots__ = ('_errorresult', '_raw_errorresult', '_raw_resource', '_resource', 'unknown_fields')
     _toSchema = {'errorresult': 'ErrorResult', 'resource': 'resource'}
     _toPy = {'ErrorResult': 'errorresult', 'resource': 'resource'}
     def __init__(self, errorresult=None, resource=None, **unknown_fields):
@@ -8486,12 +18650,30 @@ class ResourceResult(Type):
         errorresult : ErrorResult
         resource : Resource
         '''
-        self.errorresult = ErrorResult.from_json(errorresult) if errorresult else None
-        self.resource = Resource.from_json(resource) if resource else None
+        self._raw_errorresult = errorresult
+        self._raw_resource = resource
+        self.unknown_fields = unknown_fields
+
+    errorresult = LazyField('errorresult', lambda data: ErrorResult.from_json(data) if data else None)
+    resource = LazyField('resource', lambda data: Resource.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_errorresult = data.get('ErrorResult')
+        self._raw_resource = data.get('resource')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ErrorResult': self._raw_errorresult, 'resource': self._raw_resource}
 
 
 
 class ResourcesResult(Type):
+    __slots__ = ('_charm_store_resources', '_errorresult', '_raw_charm_store_resources', '_raw_errorresult', '_raw_resources', '_raw_unit_resources', '_resources', '_unit_resources', 'unknown_fields')
     _toSchema = {'charm_store_resources': 'charm-store-resources', 'errorresult': 'ErrorResult', 'resources': 'resources', 'unit_resources': 'unit-resources'}
     _toPy = {'ErrorResult': 'errorresult', 'charm-store-resources': 'charm_store_resources', 'resources': 'resources', 'unit-resources': 'unit_resources'}
     def __init__(self, errorresult=None, charm_store_resources=None, resources=None, unit_resources=None, **unknown_fields):
@@ -8501,25 +18683,63 @@ class ResourcesResult(Type):
         resources : typing.Sequence[~Resource]
         unit_resources : typing.Sequence[~UnitResources]
         '''
-        self.errorresult = ErrorResult.from_json(errorresult) if errorresult else None
-        self.charm_store_resources = [CharmResource.from_json(o) for o in charm_store_resources or []]
-        self.resources = [Resource.from_json(o) for o in resources or []]
-        self.unit_resources = [UnitResources.from_json(o) for o in unit_resources or []]
+        self._raw_errorresult = errorresult
+        self._raw_charm_store_resources = charm_store_resources
+        self._raw_resources = resources
+        self._raw_unit_resources = unit_resources
+        self.unknown_fields = unknown_fields
+
+    errorresult = LazyField('errorresult', lambda data: ErrorResult.from_json(data) if data else None)
+    charm_store_resources = LazyField('charm_store_resources', lambda data: [CharmResource.from_json(o) for o in data or []])
+    resources = LazyField('resources', lambda data: [Resource.from_json(o) for o in data or []])
+    unit_resources = LazyField('unit_resources', lambda data: [UnitResources.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_errorresult = data.get('ErrorResult')
+        self._raw_charm_store_resources = data.get('charm-store-resources')
+        self._raw_resources = data.get('resources')
+        self._raw_unit_resources = data.get('unit-resources')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ErrorResult': self._raw_errorresult, 'charm-store-resources': self._raw_charm_store_resources, 'resources': self._raw_resources, 'unit-resources': self._raw_unit_resources}
 
 
 
 class ResourcesResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ResourcesResult]
         '''
-        self.results = [ResourcesResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ResourcesResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RestoreArgs(Type):
+    __slots__ = ('backup_id', 'unknown_fields')
     _toSchema = {'backup_id': 'backup-id'}
     _toPy = {'backup-id': 'backup_id'}
     def __init__(self, backup_id=None, **unknown_fields):
@@ -8527,21 +18747,51 @@ class RestoreArgs(Type):
         backup_id : str
         '''
         self.backup_id = backup_id
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.backup_id = data.get('backup-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'backup-id': self.backup_id}
 
 
 
 class ResumeReplicationParams(Type):
+    __slots__ = ('_members', '_raw_members', 'unknown_fields')
     _toSchema = {'members': 'members'}
     _toPy = {'members': 'members'}
     def __init__(self, members=None, **unknown_fields):
         '''
         members : typing.Sequence[~Member]
         '''
-        self.members = [Member.from_json(o) for o in members or []]
+        self._raw_members = members
+        self.unknown_fields = unknown_fields
+
+    members = LazyField('members', lambda data: [Member.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_members = data.get('members')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'members': self._raw_members}
 
 
 
 class RetryStrategy(Type):
+    __slots__ = ('jitter_retry_time', 'max_retry_time', 'min_retry_time', 'retry_time_factor', 'should_retry', 'unknown_fields')
     _toSchema = {'jitter_retry_time': 'jitter-retry-time', 'max_retry_time': 'max-retry-time', 'min_retry_time': 'min-retry-time', 'retry_time_factor': 'retry-time-factor', 'should_retry': 'should-retry'}
     _toPy = {'jitter-retry-time': 'jitter_retry_time', 'max-retry-time': 'max_retry_time', 'min-retry-time': 'min_retry_time', 'retry-time-factor': 'retry_time_factor', 'should-retry': 'should_retry'}
     def __init__(self, jitter_retry_time=None, max_retry_time=None, min_retry_time=None, retry_time_factor=None, should_retry=None, **unknown_fields):
@@ -8557,10 +18807,28 @@ class RetryStrategy(Type):
         self.min_retry_time = min_retry_time
         self.retry_time_factor = retry_time_factor
         self.should_retry = should_retry
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.jitter_retry_time = data.get('jitter-retry-time')
+        self.max_retry_time = data.get('max-retry-time')
+        self.min_retry_time = data.get('min-retry-time')
+        self.retry_time_factor = data.get('retry-time-factor')
+        self.should_retry = data.get('should-retry')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'jitter-retry-time': self.jitter_retry_time, 'max-retry-time': self.max_retry_time, 'min-retry-time': self.min_retry_time, 'retry-time-factor': self.retry_time_factor, 'should-retry': self.should_retry}
 
 
 
 class RetryStrategyResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -8568,23 +18836,57 @@ class RetryStrategyResult(Type):
         error : Error
         result : RetryStrategy
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = RetryStrategy.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: RetryStrategy.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class RetryStrategyResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RetryStrategyResult]
         '''
-        self.results = [RetryStrategyResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [RetryStrategyResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class RevokeCredentialArg(Type):
+    __slots__ = ('force', 'tag', 'unknown_fields')
     _toSchema = {'force': 'force', 'tag': 'tag'}
     _toPy = {'force': 'force', 'tag': 'tag'}
     def __init__(self, force=None, tag=None, **unknown_fields):
@@ -8594,21 +18896,52 @@ class RevokeCredentialArg(Type):
         '''
         self.force = force
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.force = data.get('force')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'force': self.force, 'tag': self.tag}
 
 
 
 class RevokeCredentialArgs(Type):
+    __slots__ = ('_credentials', '_raw_credentials', 'unknown_fields')
     _toSchema = {'credentials': 'credentials'}
     _toPy = {'credentials': 'credentials'}
     def __init__(self, credentials=None, **unknown_fields):
         '''
         credentials : typing.Sequence[~RevokeCredentialArg]
         '''
-        self.credentials = [RevokeCredentialArg.from_json(o) for o in credentials or []]
+        self._raw_credentials = credentials
+        self.unknown_fields = unknown_fields
+
+    credentials = LazyField('credentials', lambda data: [RevokeCredentialArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_credentials = data.get('credentials')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credentials': self._raw_credentials}
 
 
 
 class RunParams(Type):
+    __slots__ = ('applications', 'commands', 'machines', 'timeout', 'units', 'unknown_fields')
     _toSchema = {'applications': 'applications', 'commands': 'commands', 'machines': 'machines', 'timeout': 'timeout', 'units': 'units'}
     _toPy = {'applications': 'applications', 'commands': 'commands', 'machines': 'machines', 'timeout': 'timeout', 'units': 'units'}
     def __init__(self, applications=None, commands=None, machines=None, timeout=None, units=None, **unknown_fields):
@@ -8624,10 +18957,28 @@ class RunParams(Type):
         self.machines = machines
         self.timeout = timeout
         self.units = units
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.applications = data.get('applications')
+        self.commands = data.get('commands')
+        self.machines = data.get('machines')
+        self.timeout = data.get('timeout')
+        self.units = data.get('units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'applications': self.applications, 'commands': self.commands, 'machines': self.machines, 'timeout': self.timeout, 'units': self.units}
 
 
 
 class SSHAddressResult(Type):
+    __slots__ = ('_error', '_raw_error', 'address', 'unknown_fields')
     _toSchema = {'address': 'address', 'error': 'error'}
     _toPy = {'address': 'address', 'error': 'error'}
     def __init__(self, address=None, error=None, **unknown_fields):
@@ -8636,22 +18987,55 @@ class SSHAddressResult(Type):
         error : Error
         '''
         self.address = address
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.address = data.get('address')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'address': self.address, 'error': self._raw_error}
 
 
 
 class SSHAddressResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SSHAddressResult]
         '''
-        self.results = [SSHAddressResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [SSHAddressResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class SSHAddressesResult(Type):
+    __slots__ = ('_error', '_raw_error', 'addresses', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'error': 'error'}
     _toPy = {'addresses': 'addresses', 'error': 'error'}
     def __init__(self, addresses=None, error=None, **unknown_fields):
@@ -8660,33 +19044,82 @@ class SSHAddressesResult(Type):
         error : Error
         '''
         self.addresses = addresses
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.addresses = data.get('addresses')
+        self._raw_error = data.get('error')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'addresses': self.addresses, 'error': self._raw_error}
 
 
 
 class SSHAddressesResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SSHAddressesResult]
         '''
-        self.results = [SSHAddressesResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [SSHAddressesResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class SSHHostKeySet(Type):
+    __slots__ = ('_entity_keys', '_raw_entity_keys', 'unknown_fields')
     _toSchema = {'entity_keys': 'entity-keys'}
     _toPy = {'entity-keys': 'entity_keys'}
     def __init__(self, entity_keys=None, **unknown_fields):
         '''
         entity_keys : typing.Sequence[~SSHHostKeys]
         '''
-        self.entity_keys = [SSHHostKeys.from_json(o) for o in entity_keys or []]
+        self._raw_entity_keys = entity_keys
+        self.unknown_fields = unknown_fields
+
+    entity_keys = LazyField('entity_keys', lambda data: [SSHHostKeys.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entity_keys = data.get('entity-keys')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entity-keys': self._raw_entity_keys}
 
 
 
 class SSHHostKeys(Type):
+    __slots__ = ('public_keys', 'tag', 'unknown_fields')
     _toSchema = {'public_keys': 'public-keys', 'tag': 'tag'}
     _toPy = {'public-keys': 'public_keys', 'tag': 'tag'}
     def __init__(self, public_keys=None, tag=None, **unknown_fields):
@@ -8696,10 +19129,25 @@ class SSHHostKeys(Type):
         '''
         self.public_keys = public_keys
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.public_keys = data.get('public-keys')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'public-keys': self.public_keys, 'tag': self.tag}
 
 
 
 class SSHProxyResult(Type):
+    __slots__ = ('unknown_fields', 'use_proxy')
     _toSchema = {'use_proxy': 'use-proxy'}
     _toPy = {'use-proxy': 'use_proxy'}
     def __init__(self, use_proxy=None, **unknown_fields):
@@ -8707,10 +19155,24 @@ class SSHProxyResult(Type):
         use_proxy : bool
         '''
         self.use_proxy = use_proxy
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.use_proxy = data.get('use-proxy')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'use-proxy': self.use_proxy}
 
 
 
 class SSHPublicKeysResult(Type):
+    __slots__ = ('_error', '_raw_error', 'public_keys', 'unknown_fields')
     _toSchema = {'error': 'error', 'public_keys': 'public-keys'}
     _toPy = {'error': 'error', 'public-keys': 'public_keys'}
     def __init__(self, error=None, public_keys=None, **unknown_fields):
@@ -8718,23 +19180,56 @@ class SSHPublicKeysResult(Type):
         error : Error
         public_keys : typing.Sequence[str]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.public_keys = public_keys
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.public_keys = data.get('public-keys')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'public-keys': self.public_keys}
 
 
 
 class SSHPublicKeysResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SSHPublicKeysResult]
         '''
-        self.results = [SSHPublicKeysResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [SSHPublicKeysResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ScaleApplicationInfo(Type):
+    __slots__ = ('num_units', 'unknown_fields')
     _toSchema = {'num_units': 'num-units'}
     _toPy = {'num-units': 'num_units'}
     def __init__(self, num_units=None, **unknown_fields):
@@ -8742,10 +19237,24 @@ class ScaleApplicationInfo(Type):
         num_units : int
         '''
         self.num_units = num_units
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.num_units = data.get('num-units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'num-units': self.num_units}
 
 
 
 class ScaleApplicationParams(Type):
+    __slots__ = ('application_tag', 'scale', 'scale_change', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'scale': 'scale', 'scale_change': 'scale-change'}
     _toPy = {'application-tag': 'application_tag', 'scale': 'scale', 'scale-change': 'scale_change'}
     def __init__(self, application_tag=None, scale=None, scale_change=None, **unknown_fields):
@@ -8757,10 +19266,26 @@ class ScaleApplicationParams(Type):
         self.application_tag = application_tag
         self.scale = scale
         self.scale_change = scale_change
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_tag = data.get('application-tag')
+        self.scale = data.get('scale')
+        self.scale_change = data.get('scale-change')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-tag': self.application_tag, 'scale': self.scale, 'scale-change': self.scale_change}
 
 
 
 class ScaleApplicationResult(Type):
+    __slots__ = ('_error', '_info', '_raw_error', '_raw_info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
     def __init__(self, error=None, info=None, **unknown_fields):
@@ -8768,34 +19293,84 @@ class ScaleApplicationResult(Type):
         error : Error
         info : ScaleApplicationInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.info = ScaleApplicationInfo.from_json(info) if info else None
+        self._raw_error = error
+        self._raw_info = info
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    info = LazyField('info', lambda data: ScaleApplicationInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_info = data.get('info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'info': self._raw_info}
 
 
 
 class ScaleApplicationResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ScaleApplicationResult]
         '''
-        self.results = [ScaleApplicationResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ScaleApplicationResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class ScaleApplicationsParams(Type):
+    __slots__ = ('_applications', '_raw_applications', 'unknown_fields')
     _toSchema = {'applications': 'applications'}
     _toPy = {'applications': 'applications'}
     def __init__(self, applications=None, **unknown_fields):
         '''
         applications : typing.Sequence[~ScaleApplicationParams]
         '''
-        self.applications = [ScaleApplicationParams.from_json(o) for o in applications or []]
+        self._raw_applications = applications
+        self.unknown_fields = unknown_fields
+
+    applications = LazyField('applications', lambda data: [ScaleApplicationParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_applications = data.get('applications')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'applications': self._raw_applications}
 
 
 
 class SerializedModel(Type):
+    __slots__ = ('_raw_tools', '_tools', 'bytes_', 'charms', 'unknown_fields')
     _toSchema = {'bytes_': 'bytes', 'charms': 'charms', 'tools': 'tools'}
     _toPy = {'bytes': 'bytes_', 'charms': 'charms', 'tools': 'tools'}
     def __init__(self, bytes_=None, charms=None, tools=None, **unknown_fields):
@@ -8806,11 +19381,29 @@ class SerializedModel(Type):
         '''
         self.bytes_ = bytes_
         self.charms = charms
-        self.tools = [SerializedModelTools.from_json(o) for o in tools or []]
+        self._raw_tools = tools
+        self.unknown_fields = unknown_fields
+
+    tools = LazyField('tools', lambda data: [SerializedModelTools.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.bytes_ = data.get('bytes')
+        self.charms = data.get('charms')
+        self._raw_tools = data.get('tools')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'bytes': self.bytes_, 'charms': self.charms, 'tools': self._raw_tools}
 
 
 
 class SerializedModelResource(Type):
+    __slots__ = ('_application_revision', '_charmstore_revision', '_raw_application_revision', '_raw_charmstore_revision', 'application', 'name', 'unit_revisions', 'unknown_fields')
     _toSchema = {'application': 'application', 'application_revision': 'application-revision', 'charmstore_revision': 'charmstore-revision', 'name': 'name', 'unit_revisions': 'unit-revisions'}
     _toPy = {'application': 'application', 'application-revision': 'application_revision', 'charmstore-revision': 'charmstore_revision', 'name': 'name', 'unit-revisions': 'unit_revisions'}
     def __init__(self, application=None, application_revision=None, charmstore_revision=None, name=None, unit_revisions=None, **unknown_fields):
@@ -8822,14 +19415,35 @@ class SerializedModelResource(Type):
         unit_revisions : typing.Mapping[str, ~SerializedModelResourceRevision]
         '''
         self.application = application
-        self.application_revision = SerializedModelResourceRevision.from_json(application_revision) if application_revision else None
-        self.charmstore_revision = SerializedModelResourceRevision.from_json(charmstore_revision) if charmstore_revision else None
+        self._raw_application_revision = application_revision
+        self._raw_charmstore_revision = charmstore_revision
         self.name = name
         self.unit_revisions = unit_revisions
+        self.unknown_fields = unknown_fields
+
+    application_revision = LazyField('application_revision', lambda data: SerializedModelResourceRevision.from_json(data) if data else None)
+    charmstore_revision = LazyField('charmstore_revision', lambda data: SerializedModelResourceRevision.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self._raw_application_revision = data.get('application-revision')
+        self._raw_charmstore_revision = data.get('charmstore-revision')
+        self.name = data.get('name')
+        self.unit_revisions = data.get('unit-revisions')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'application-revision': self._raw_application_revision, 'charmstore-revision': self._raw_charmstore_revision, 'name': self.name, 'unit-revisions': self.unit_revisions}
 
 
 
 class SerializedModelResourceRevision(Type):
+    __slots__ = ('description', 'fingerprint', 'origin', 'path', 'revision', 'size', 'timestamp', 'type_', 'unknown_fields', 'username')
     _toSchema = {'description': 'description', 'fingerprint': 'fingerprint', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'timestamp': 'timestamp', 'type_': 'type', 'username': 'username'}
     _toPy = {'description': 'description', 'fingerprint': 'fingerprint', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'timestamp': 'timestamp', 'type': 'type_', 'username': 'username'}
     def __init__(self, description=None, fingerprint=None, origin=None, path=None, revision=None, size=None, timestamp=None, type_=None, username=None, **unknown_fields):
@@ -8853,10 +19467,32 @@ class SerializedModelResourceRevision(Type):
         self.timestamp = timestamp
         self.type_ = type_
         self.username = username
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.description = data.get('description')
+        self.fingerprint = data.get('fingerprint')
+        self.origin = data.get('origin')
+        self.path = data.get('path')
+        self.revision = data.get('revision')
+        self.size = data.get('size')
+        self.timestamp = data.get('timestamp')
+        self.type_ = data.get('type')
+        self.username = data.get('username')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'description': self.description, 'fingerprint': self.fingerprint, 'origin': self.origin, 'path': self.path, 'revision': self.revision, 'size': self.size, 'timestamp': self.timestamp, 'type': self.type_, 'username': self.username}
 
 
 
 class SerializedModelTools(Type):
+    __slots__ = ('unknown_fields', 'uri', 'version')
     _toSchema = {'uri': 'uri', 'version': 'version'}
     _toPy = {'uri': 'uri', 'version': 'version'}
     def __init__(self, uri=None, version=None, **unknown_fields):
@@ -8866,10 +19502,25 @@ class SerializedModelTools(Type):
         '''
         self.uri = uri
         self.version = version
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.uri = data.get('uri')
+        self.version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'uri': self.uri, 'version': self.version}
 
 
 
 class SetConstraints(Type):
+    __slots__ = ('_constraints', '_raw_constraints', 'application', 'unknown_fields')
     _toSchema = {'application': 'application', 'constraints': 'constraints'}
     _toPy = {'application': 'application', 'constraints': 'constraints'}
     def __init__(self, application=None, constraints=None, **unknown_fields):
@@ -8878,44 +19529,109 @@ class SetConstraints(Type):
         constraints : Value
         '''
         self.application = application
-        self.constraints = Value.from_json(constraints) if constraints else None
+        self._raw_constraints = constraints
+        self.unknown_fields = unknown_fields
+
+    constraints = LazyField('constraints', lambda data: Value.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application = data.get('application')
+        self._raw_constraints = data.get('constraints')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application': self.application, 'constraints': self._raw_constraints}
 
 
 
 class SetExternalControllerInfoParams(Type):
+    __slots__ = ('_info', '_raw_info', 'unknown_fields')
     _toSchema = {'info': 'info'}
     _toPy = {'info': 'info'}
     def __init__(self, info=None, **unknown_fields):
         '''
         info : ExternalControllerInfo
         '''
-        self.info = ExternalControllerInfo.from_json(info) if info else None
+        self._raw_info = info
+        self.unknown_fields = unknown_fields
+
+    info = LazyField('info', lambda data: ExternalControllerInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_info = data.get('info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'info': self._raw_info}
 
 
 
 class SetExternalControllersInfoParams(Type):
+    __slots__ = ('_controllers', '_raw_controllers', 'unknown_fields')
     _toSchema = {'controllers': 'controllers'}
     _toPy = {'controllers': 'controllers'}
     def __init__(self, controllers=None, **unknown_fields):
         '''
         controllers : typing.Sequence[~SetExternalControllerInfoParams]
         '''
-        self.controllers = [SetExternalControllerInfoParams.from_json(o) for o in controllers or []]
+        self._raw_controllers = controllers
+        self.unknown_fields = unknown_fields
+
+    controllers = LazyField('controllers', lambda data: [SetExternalControllerInfoParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_controllers = data.get('controllers')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'controllers': self._raw_controllers}
 
 
 
 class SetMachineBlockDevices(Type):
+    __slots__ = ('_machine_block_devices', '_raw_machine_block_devices', 'unknown_fields')
     _toSchema = {'machine_block_devices': 'machine-block-devices'}
     _toPy = {'machine-block-devices': 'machine_block_devices'}
     def __init__(self, machine_block_devices=None, **unknown_fields):
         '''
         machine_block_devices : typing.Sequence[~MachineBlockDevices]
         '''
-        self.machine_block_devices = [MachineBlockDevices.from_json(o) for o in machine_block_devices or []]
+        self._raw_machine_block_devices = machine_block_devices
+        self.unknown_fields = unknown_fields
+
+    machine_block_devices = LazyField('machine_block_devices', lambda data: [MachineBlockDevices.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_machine_block_devices = data.get('machine-block-devices')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'machine-block-devices': self._raw_machine_block_devices}
 
 
 
 class SetMachineNetworkConfig(Type):
+    __slots__ = ('_config', '_raw_config', 'tag', 'unknown_fields')
     _toSchema = {'config': 'config', 'tag': 'tag'}
     _toPy = {'config': 'config', 'tag': 'tag'}
     def __init__(self, config=None, tag=None, **unknown_fields):
@@ -8923,23 +19639,56 @@ class SetMachineNetworkConfig(Type):
         config : typing.Sequence[~NetworkConfig]
         tag : str
         '''
-        self.config = [NetworkConfig.from_json(o) for o in config or []]
+        self._raw_config = config
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    config = LazyField('config', lambda data: [NetworkConfig.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_config = data.get('config')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self._raw_config, 'tag': self.tag}
 
 
 
 class SetMachinesAddresses(Type):
+    __slots__ = ('_machine_addresses', '_raw_machine_addresses', 'unknown_fields')
     _toSchema = {'machine_addresses': 'machine-addresses'}
     _toPy = {'machine-addresses': 'machine_addresses'}
     def __init__(self, machine_addresses=None, **unknown_fields):
         '''
         machine_addresses : typing.Sequence[~MachineAddresses]
         '''
-        self.machine_addresses = [MachineAddresses.from_json(o) for o in machine_addresses or []]
+        self._raw_machine_addresses = machine_addresses
+        self.unknown_fields = unknown_fields
+
+    machine_addresses = LazyField('machine_addresses', lambda data: [MachineAddresses.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_machine_addresses = data.get('machine-addresses')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'machine-addresses': self._raw_machine_addresses}
 
 
 
 class SetMigrationPhaseArgs(Type):
+    __slots__ = ('phase', 'unknown_fields')
     _toSchema = {'phase': 'phase'}
     _toPy = {'phase': 'phase'}
     def __init__(self, phase=None, **unknown_fields):
@@ -8947,10 +19696,24 @@ class SetMigrationPhaseArgs(Type):
         phase : str
         '''
         self.phase = phase
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.phase = data.get('phase')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'phase': self.phase}
 
 
 
 class SetMigrationStatusMessageArgs(Type):
+    __slots__ = ('message', 'unknown_fields')
     _toSchema = {'message': 'message'}
     _toPy = {'message': 'message'}
     def __init__(self, message=None, **unknown_fields):
@@ -8958,32 +19721,78 @@ class SetMigrationStatusMessageArgs(Type):
         message : str
         '''
         self.message = message
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.message = data.get('message')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'message': self.message}
 
 
 
 class SetModelAgentVersion(Type):
+    __slots__ = ('_raw_version', '_version', 'unknown_fields')
     _toSchema = {'version': 'version'}
     _toPy = {'version': 'version'}
     def __init__(self, version=None, **unknown_fields):
         '''
         version : Number
         '''
-        self.version = Number.from_json(version) if version else None
+        self._raw_version = version
+        self.unknown_fields = unknown_fields
+
+    version = LazyField('version', lambda data: Number.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'version': self._raw_version}
 
 
 
 class SetModelDefaults(Type):
+    __slots__ = ('_config', '_raw_config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
     def __init__(self, config=None, **unknown_fields):
         '''
         config : typing.Sequence[~ModelDefaultValues]
         '''
-        self.config = [ModelDefaultValues.from_json(o) for o in config or []]
+        self._raw_config = config
+        self.unknown_fields = unknown_fields
+
+    config = LazyField('config', lambda data: [ModelDefaultValues.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_config = data.get('config')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'config': self._raw_config}
 
 
 
 class SetModelEnvironVersion(Type):
+    __slots__ = ('model_tag', 'unknown_fields', 'version')
     _toSchema = {'model_tag': 'model-tag', 'version': 'version'}
     _toPy = {'model-tag': 'model_tag', 'version': 'version'}
     def __init__(self, model_tag=None, version=None, **unknown_fields):
@@ -8993,21 +19802,52 @@ class SetModelEnvironVersion(Type):
         '''
         self.model_tag = model_tag
         self.version = version
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.model_tag = data.get('model-tag')
+        self.version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'model-tag': self.model_tag, 'version': self.version}
 
 
 
 class SetModelEnvironVersions(Type):
+    __slots__ = ('_models', '_raw_models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~SetModelEnvironVersion]
         '''
-        self.models = [SetModelEnvironVersion.from_json(o) for o in models or []]
+        self._raw_models = models
+        self.unknown_fields = unknown_fields
+
+    models = LazyField('models', lambda data: [SetModelEnvironVersion.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_models = data.get('models')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'models': self._raw_models}
 
 
 
 class SetPayloadStatusArg(Type):
+    __slots__ = ('_entity', '_raw_entity', 'status', 'unknown_fields')
     _toSchema = {'entity': 'Entity', 'status': 'status'}
     _toPy = {'Entity': 'entity', 'status': 'status'}
     def __init__(self, entity=None, status=None, **unknown_fields):
@@ -9015,34 +19855,83 @@ class SetPayloadStatusArg(Type):
         entity : Entity
         status : str
         '''
-        self.entity = Entity.from_json(entity) if entity else None
+        self._raw_entity = entity
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    entity = LazyField('entity', lambda data: Entity.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entity = data.get('Entity')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Entity': self._raw_entity, 'status': self.status}
 
 
 
 class SetPayloadStatusArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~SetPayloadStatusArg]
         '''
-        self.args = [SetPayloadStatusArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [SetPayloadStatusArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class SetPodSpecParams(Type):
+    __slots__ = ('_raw_specs', '_specs', 'unknown_fields')
     _toSchema = {'specs': 'specs'}
     _toPy = {'specs': 'specs'}
     def __init__(self, specs=None, **unknown_fields):
         '''
         specs : typing.Sequence[~EntityString]
         '''
-        self.specs = [EntityString.from_json(o) for o in specs or []]
+        self._raw_specs = specs
+        self.unknown_fields = unknown_fields
+
+    specs = LazyField('specs', lambda data: [EntityString.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_specs = data.get('specs')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'specs': self._raw_specs}
 
 
 
 class SetProfileArg(Type):
+    __slots__ = ('_entity', '_raw_entity', 'profiles', 'unknown_fields')
     _toSchema = {'entity': 'entity', 'profiles': 'profiles'}
     _toPy = {'entity': 'entity', 'profiles': 'profiles'}
     def __init__(self, entity=None, profiles=None, **unknown_fields):
@@ -9050,23 +19939,56 @@ class SetProfileArg(Type):
         entity : Entity
         profiles : typing.Sequence[str]
         '''
-        self.entity = Entity.from_json(entity) if entity else None
+        self._raw_entity = entity
         self.profiles = profiles
+        self.unknown_fields = unknown_fields
+
+    entity = LazyField('entity', lambda data: Entity.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entity = data.get('entity')
+        self.profiles = data.get('profiles')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entity': self._raw_entity, 'profiles': self.profiles}
 
 
 
 class SetProfileArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~SetProfileArg]
         '''
-        self.args = [SetProfileArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [SetProfileArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class SetProfileUpgradeCompleteArg(Type):
+    __slots__ = ('_entity', '_raw_entity', 'message', 'unknown_fields')
     _toSchema = {'entity': 'entity', 'message': 'message'}
     _toPy = {'entity': 'entity', 'message': 'message'}
     def __init__(self, entity=None, message=None, **unknown_fields):
@@ -9074,34 +19996,83 @@ class SetProfileUpgradeCompleteArg(Type):
         entity : Entity
         message : str
         '''
-        self.entity = Entity.from_json(entity) if entity else None
+        self._raw_entity = entity
         self.message = message
+        self.unknown_fields = unknown_fields
+
+    entity = LazyField('entity', lambda data: Entity.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entity = data.get('entity')
+        self.message = data.get('message')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entity': self._raw_entity, 'message': self.message}
 
 
 
 class SetProfileUpgradeCompleteArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~SetProfileUpgradeCompleteArg]
         '''
-        self.args = [SetProfileUpgradeCompleteArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [SetProfileUpgradeCompleteArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class SetStatus(Type):
+    __slots__ = ('_entities', '_raw_entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~EntityStatusArgs]
         '''
-        self.entities = [EntityStatusArgs.from_json(o) for o in entities or []]
+        self._raw_entities = entities
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [EntityStatusArgs.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities}
 
 
 
 class SetStatusArg(Type):
+    __slots__ = ('_entity', '_raw_entity', 'status', 'unknown_fields')
     _toSchema = {'entity': 'Entity', 'status': 'status'}
     _toPy = {'Entity': 'entity', 'status': 'status'}
     def __init__(self, entity=None, status=None, **unknown_fields):
@@ -9109,23 +20080,56 @@ class SetStatusArg(Type):
         entity : Entity
         status : str
         '''
-        self.entity = Entity.from_json(entity) if entity else None
+        self._raw_entity = entity
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    entity = LazyField('entity', lambda data: Entity.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entity = data.get('Entity')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Entity': self._raw_entity, 'status': self.status}
 
 
 
 class SetStatusArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~SetStatusArg]
         '''
-        self.args = [SetStatusArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [SetStatusArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class Settings(Type):
+    __slots__ = ('ftp', 'http', 'https', 'noproxy', 'unknown_fields')
     _toSchema = {'ftp': 'Ftp', 'http': 'Http', 'https': 'Https', 'noproxy': 'NoProxy'}
     _toPy = {'Ftp': 'ftp', 'Http': 'http', 'Https': 'https', 'NoProxy': 'noproxy'}
     def __init__(self, ftp=None, http=None, https=None, noproxy=None, **unknown_fields):
@@ -9139,10 +20143,27 @@ class Settings(Type):
         self.http = http
         self.https = https
         self.noproxy = noproxy
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.ftp = data.get('Ftp')
+        self.http = data.get('Http')
+        self.https = data.get('Https')
+        self.noproxy = data.get('NoProxy')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Ftp': self.ftp, 'Http': self.http, 'Https': self.https, 'NoProxy': self.noproxy}
 
 
 
 class SettingsResult(Type):
+    __slots__ = ('_error', '_raw_error', 'settings', 'unknown_fields')
     _toSchema = {'error': 'error', 'settings': 'settings'}
     _toPy = {'error': 'error', 'settings': 'settings'}
     def __init__(self, error=None, settings=None, **unknown_fields):
@@ -9150,23 +20171,56 @@ class SettingsResult(Type):
         error : Error
         settings : typing.Mapping[str, str]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.settings = settings
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.settings = data.get('settings')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'settings': self.settings}
 
 
 
 class SettingsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SettingsResult]
         '''
-        self.results = [SettingsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [SettingsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class SingularClaim(Type):
+    __slots__ = ('controller_tag', 'duration', 'model_tag', 'unknown_fields')
     _toSchema = {'controller_tag': 'controller-tag', 'duration': 'duration', 'model_tag': 'model-tag'}
     _toPy = {'controller-tag': 'controller_tag', 'duration': 'duration', 'model-tag': 'model_tag'}
     def __init__(self, controller_tag=None, duration=None, model_tag=None, **unknown_fields):
@@ -9178,21 +20232,53 @@ class SingularClaim(Type):
         self.controller_tag = controller_tag
         self.duration = duration
         self.model_tag = model_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.controller_tag = data.get('controller-tag')
+        self.duration = data.get('duration')
+        self.model_tag = data.get('model-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'controller-tag': self.controller_tag, 'duration': self.duration, 'model-tag': self.model_tag}
 
 
 
 class SingularClaims(Type):
+    __slots__ = ('_claims', '_raw_claims', 'unknown_fields')
     _toSchema = {'claims': 'claims'}
     _toPy = {'claims': 'claims'}
     def __init__(self, claims=None, **unknown_fields):
         '''
         claims : typing.Sequence[~SingularClaim]
         '''
-        self.claims = [SingularClaim.from_json(o) for o in claims or []]
+        self._raw_claims = claims
+        self.unknown_fields = unknown_fields
+
+    claims = LazyField('claims', lambda data: [SingularClaim.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_claims = data.get('claims')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'claims': self._raw_claims}
 
 
 
 class Space(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_subnets', '_subnets', 'name', 'unknown_fields')
     _toSchema = {'error': 'error', 'name': 'name', 'subnets': 'subnets'}
     _toPy = {'error': 'error', 'name': 'name', 'subnets': 'subnets'}
     def __init__(self, error=None, name=None, subnets=None, **unknown_fields):
@@ -9201,13 +20287,32 @@ class Space(Type):
         name : str
         subnets : typing.Sequence[~Subnet]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.name = name
-        self.subnets = [Subnet.from_json(o) for o in subnets or []]
+        self._raw_subnets = subnets
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    subnets = LazyField('subnets', lambda data: [Subnet.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.name = data.get('name')
+        self._raw_subnets = data.get('subnets')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'name': self.name, 'subnets': self._raw_subnets}
 
 
 
 class SpaceResult(Type):
+    __slots__ = ('_error', '_raw_error', 'tag', 'unknown_fields')
     _toSchema = {'error': 'error', 'tag': 'tag'}
     _toPy = {'error': 'error', 'tag': 'tag'}
     def __init__(self, error=None, tag=None, **unknown_fields):
@@ -9215,23 +20320,56 @@ class SpaceResult(Type):
         error : Error
         tag : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'tag': self.tag}
 
 
 
 class SpaceResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SpaceResult]
         '''
-        self.results = [SpaceResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [SpaceResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StateServingInfo(Type):
+    __slots__ = ('api_port', 'ca_private_key', 'cert', 'private_key', 'shared_secret', 'state_port', 'system_identity', 'unknown_fields')
     _toSchema = {'api_port': 'api-port', 'ca_private_key': 'ca-private-key', 'cert': 'cert', 'private_key': 'private-key', 'shared_secret': 'shared-secret', 'state_port': 'state-port', 'system_identity': 'system-identity'}
     _toPy = {'api-port': 'api_port', 'ca-private-key': 'ca_private_key', 'cert': 'cert', 'private-key': 'private_key', 'shared-secret': 'shared_secret', 'state-port': 'state_port', 'system-identity': 'system_identity'}
     def __init__(self, api_port=None, ca_private_key=None, cert=None, private_key=None, shared_secret=None, state_port=None, system_identity=None, **unknown_fields):
@@ -9251,10 +20389,30 @@ class StateServingInfo(Type):
         self.shared_secret = shared_secret
         self.state_port = state_port
         self.system_identity = system_identity
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.api_port = data.get('api-port')
+        self.ca_private_key = data.get('ca-private-key')
+        self.cert = data.get('cert')
+        self.private_key = data.get('private-key')
+        self.shared_secret = data.get('shared-secret')
+        self.state_port = data.get('state-port')
+        self.system_identity = data.get('system-identity')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'api-port': self.api_port, 'ca-private-key': self.ca_private_key, 'cert': self.cert, 'private-key': self.private_key, 'shared-secret': self.shared_secret, 'state-port': self.state_port, 'system-identity': self.system_identity}
 
 
 
 class StatusHistoryFilter(Type):
+    __slots__ = ('date', 'delta', 'size', 'unknown_fields')
     _toSchema = {'date': 'date', 'delta': 'delta', 'size': 'size'}
     _toPy = {'date': 'date', 'delta': 'delta', 'size': 'size'}
     def __init__(self, date=None, delta=None, size=None, **unknown_fields):
@@ -9266,10 +20424,26 @@ class StatusHistoryFilter(Type):
         self.date = date
         self.delta = delta
         self.size = size
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.date = data.get('date')
+        self.delta = data.get('delta')
+        self.size = data.get('size')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'date': self.date, 'delta': self.delta, 'size': self.size}
 
 
 
 class StatusHistoryPruneArgs(Type):
+    __slots__ = ('max_history_mb', 'max_history_time', 'unknown_fields')
     _toSchema = {'max_history_mb': 'max-history-mb', 'max_history_time': 'max-history-time'}
     _toPy = {'max-history-mb': 'max_history_mb', 'max-history-time': 'max_history_time'}
     def __init__(self, max_history_mb=None, max_history_time=None, **unknown_fields):
@@ -9279,10 +20453,25 @@ class StatusHistoryPruneArgs(Type):
         '''
         self.max_history_mb = max_history_mb
         self.max_history_time = max_history_time
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.max_history_mb = data.get('max-history-mb')
+        self.max_history_time = data.get('max-history-time')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'max-history-mb': self.max_history_mb, 'max-history-time': self.max_history_time}
 
 
 
 class StatusHistoryRequest(Type):
+    __slots__ = ('_filter_', '_raw_filter_', 'historykind', 'size', 'tag', 'unknown_fields')
     _toSchema = {'filter_': 'filter', 'historykind': 'historyKind', 'size': 'size', 'tag': 'tag'}
     _toPy = {'filter': 'filter_', 'historyKind': 'historykind', 'size': 'size', 'tag': 'tag'}
     def __init__(self, filter_=None, historykind=None, size=None, tag=None, **unknown_fields):
@@ -9292,25 +20481,60 @@ class StatusHistoryRequest(Type):
         size : int
         tag : str
         '''
-        self.filter_ = StatusHistoryFilter.from_json(filter_) if filter_ else None
+        self._raw_filter_ = filter_
         self.historykind = historykind
         self.size = size
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    filter_ = LazyField('filter_', lambda data: StatusHistoryFilter.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_filter_ = data.get('filter')
+        self.historykind = data.get('historyKind')
+        self.size = data.get('size')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filter': self._raw_filter_, 'historyKind': self.historykind, 'size': self.size, 'tag': self.tag}
 
 
 
 class StatusHistoryRequests(Type):
+    __slots__ = ('_raw_requests', '_requests', 'unknown_fields')
     _toSchema = {'requests': 'requests'}
     _toPy = {'requests': 'requests'}
     def __init__(self, requests=None, **unknown_fields):
         '''
         requests : typing.Sequence[~StatusHistoryRequest]
         '''
-        self.requests = [StatusHistoryRequest.from_json(o) for o in requests or []]
+        self._raw_requests = requests
+        self.unknown_fields = unknown_fields
+
+    requests = LazyField('requests', lambda data: [StatusHistoryRequest.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_requests = data.get('requests')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'requests': self._raw_requests}
 
 
 
 class StatusHistoryResult(Type):
+    __slots__ = ('_error', '_history', '_raw_error', '_raw_history', 'unknown_fields')
     _toSchema = {'error': 'error', 'history': 'history'}
     _toPy = {'error': 'error', 'history': 'history'}
     def __init__(self, error=None, history=None, **unknown_fields):
@@ -9318,23 +20542,57 @@ class StatusHistoryResult(Type):
         error : Error
         history : History
         '''
-        self.error = Error.from_json(error) if error else None
-        self.history = History.from_json(history) if history else None
+        self._raw_error = error
+        self._raw_history = history
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    history = LazyField('history', lambda data: History.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_history = data.get('history')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'history': self._raw_history}
 
 
 
 class StatusHistoryResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StatusHistoryResult]
         '''
-        self.results = [StatusHistoryResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StatusHistoryResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StatusParams(Type):
+    __slots__ = ('patterns', 'unknown_fields')
     _toSchema = {'patterns': 'patterns'}
     _toPy = {'patterns': 'patterns'}
     def __init__(self, patterns=None, **unknown_fields):
@@ -9342,10 +20600,24 @@ class StatusParams(Type):
         patterns : typing.Sequence[str]
         '''
         self.patterns = patterns
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.patterns = data.get('patterns')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'patterns': self.patterns}
 
 
 
 class StatusResult(Type):
+    __slots__ = ('_error', '_raw_error', 'data', 'id_', 'info', 'life', 'since', 'status', 'unknown_fields')
     _toSchema = {'data': 'data', 'error': 'error', 'id_': 'id', 'info': 'info', 'life': 'life', 'since': 'since', 'status': 'status'}
     _toPy = {'data': 'data', 'error': 'error', 'id': 'id_', 'info': 'info', 'life': 'life', 'since': 'since', 'status': 'status'}
     def __init__(self, data=None, error=None, id_=None, info=None, life=None, since=None, status=None, **unknown_fields):
@@ -9359,27 +20631,65 @@ class StatusResult(Type):
         status : str
         '''
         self.data = data
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.id_ = id_
         self.info = info
         self.life = life
         self.since = since
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.data = data.get('data')
+        self._raw_error = data.get('error')
+        self.id_ = data.get('id')
+        self.info = data.get('info')
+        self.life = data.get('life')
+        self.since = data.get('since')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'data': self.data, 'error': self._raw_error, 'id': self.id_, 'info': self.info, 'life': self.life, 'since': self.since, 'status': self.status}
 
 
 
 class StatusResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StatusResult]
         '''
-        self.results = [StatusResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StatusResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StorageAddParams(Type):
+    __slots__ = ('_raw_storage', '_storage', 'name', 'unit', 'unknown_fields')
     _toSchema = {'name': 'name', 'storage': 'storage', 'unit': 'unit'}
     _toPy = {'name': 'name', 'storage': 'storage', 'unit': 'unit'}
     def __init__(self, name=None, storage=None, unit=None, **unknown_fields):
@@ -9389,12 +20699,30 @@ class StorageAddParams(Type):
         unit : str
         '''
         self.name = name
-        self.storage = StorageConstraints.from_json(storage) if storage else None
+        self._raw_storage = storage
         self.unit = unit
+        self.unknown_fields = unknown_fields
+
+    storage = LazyField('storage', lambda data: StorageConstraints.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.name = data.get('name')
+        self._raw_storage = data.get('storage')
+        self.unit = data.get('unit')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'name': self.name, 'storage': self._raw_storage, 'unit': self.unit}
 
 
 
 class StorageAttachment(Type):
+    __slots__ = ('kind', 'life', 'location', 'owner_tag', 'storage_tag', 'unit_tag', 'unknown_fields')
     _toSchema = {'kind': 'kind', 'life': 'life', 'location': 'location', 'owner_tag': 'owner-tag', 'storage_tag': 'storage-tag', 'unit_tag': 'unit-tag'}
     _toPy = {'kind': 'kind', 'life': 'life', 'location': 'location', 'owner-tag': 'owner_tag', 'storage-tag': 'storage_tag', 'unit-tag': 'unit_tag'}
     def __init__(self, kind=None, life=None, location=None, owner_tag=None, storage_tag=None, unit_tag=None, **unknown_fields):
@@ -9412,10 +20740,29 @@ class StorageAttachment(Type):
         self.owner_tag = owner_tag
         self.storage_tag = storage_tag
         self.unit_tag = unit_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.kind = data.get('kind')
+        self.life = data.get('life')
+        self.location = data.get('location')
+        self.owner_tag = data.get('owner-tag')
+        self.storage_tag = data.get('storage-tag')
+        self.unit_tag = data.get('unit-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'kind': self.kind, 'life': self.life, 'location': self.location, 'owner-tag': self.owner_tag, 'storage-tag': self.storage_tag, 'unit-tag': self.unit_tag}
 
 
 
 class StorageAttachmentDetails(Type):
+    __slots__ = ('location', 'machine_tag', 'storage_tag', 'unit_tag', 'unknown_fields')
     _toSchema = {'location': 'location', 'machine_tag': 'machine-tag', 'storage_tag': 'storage-tag', 'unit_tag': 'unit-tag'}
     _toPy = {'location': 'location', 'machine-tag': 'machine_tag', 'storage-tag': 'storage_tag', 'unit-tag': 'unit_tag'}
     def __init__(self, location=None, machine_tag=None, storage_tag=None, unit_tag=None, **unknown_fields):
@@ -9429,10 +20776,27 @@ class StorageAttachmentDetails(Type):
         self.machine_tag = machine_tag
         self.storage_tag = storage_tag
         self.unit_tag = unit_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.location = data.get('location')
+        self.machine_tag = data.get('machine-tag')
+        self.storage_tag = data.get('storage-tag')
+        self.unit_tag = data.get('unit-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'location': self.location, 'machine-tag': self.machine_tag, 'storage-tag': self.storage_tag, 'unit-tag': self.unit_tag}
 
 
 
 class StorageAttachmentId(Type):
+    __slots__ = ('storage_tag', 'unit_tag', 'unknown_fields')
     _toSchema = {'storage_tag': 'storage-tag', 'unit_tag': 'unit-tag'}
     _toPy = {'storage-tag': 'storage_tag', 'unit-tag': 'unit_tag'}
     def __init__(self, storage_tag=None, unit_tag=None, **unknown_fields):
@@ -9442,21 +20806,52 @@ class StorageAttachmentId(Type):
         '''
         self.storage_tag = storage_tag
         self.unit_tag = unit_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.storage_tag = data.get('storage-tag')
+        self.unit_tag = data.get('unit-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'storage-tag': self.storage_tag, 'unit-tag': self.unit_tag}
 
 
 
 class StorageAttachmentIds(Type):
+    __slots__ = ('_ids', '_raw_ids', 'unknown_fields')
     _toSchema = {'ids': 'ids'}
     _toPy = {'ids': 'ids'}
     def __init__(self, ids=None, **unknown_fields):
         '''
         ids : typing.Sequence[~StorageAttachmentId]
         '''
-        self.ids = [StorageAttachmentId.from_json(o) for o in ids or []]
+        self._raw_ids = ids
+        self.unknown_fields = unknown_fields
+
+    ids = LazyField('ids', lambda data: [StorageAttachmentId.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_ids = data.get('ids')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ids': self._raw_ids}
 
 
 
 class StorageAttachmentIdsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -9464,23 +20859,57 @@ class StorageAttachmentIdsResult(Type):
         error : Error
         result : StorageAttachmentIds
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = StorageAttachmentIds.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: StorageAttachmentIds.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class StorageAttachmentIdsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StorageAttachmentIdsResult]
         '''
-        self.results = [StorageAttachmentIdsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StorageAttachmentIdsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StorageAttachmentResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -9488,23 +20917,57 @@ class StorageAttachmentResult(Type):
         error : Error
         result : StorageAttachment
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = StorageAttachment.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: StorageAttachment.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class StorageAttachmentResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StorageAttachmentResult]
         '''
-        self.results = [StorageAttachmentResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StorageAttachmentResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StorageConstraints(Type):
+    __slots__ = ('count', 'pool', 'size', 'unknown_fields')
     _toSchema = {'count': 'count', 'pool': 'pool', 'size': 'size'}
     _toPy = {'count': 'count', 'pool': 'pool', 'size': 'size'}
     def __init__(self, count=None, pool=None, size=None, **unknown_fields):
@@ -9516,10 +20979,26 @@ class StorageConstraints(Type):
         self.count = count
         self.pool = pool
         self.size = size
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.count = data.get('count')
+        self.pool = data.get('pool')
+        self.size = data.get('size')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'count': self.count, 'pool': self.pool, 'size': self.size}
 
 
 
 class StorageDetails(Type):
+    __slots__ = ('_raw_status', '_status', 'attachments', 'kind', 'owner_tag', 'persistent', 'storage_tag', 'unknown_fields')
     _toSchema = {'attachments': 'attachments', 'kind': 'kind', 'owner_tag': 'owner-tag', 'persistent': 'persistent', 'status': 'status', 'storage_tag': 'storage-tag'}
     _toPy = {'attachments': 'attachments', 'kind': 'kind', 'owner-tag': 'owner_tag', 'persistent': 'persistent', 'status': 'status', 'storage-tag': 'storage_tag'}
     def __init__(self, attachments=None, kind=None, owner_tag=None, persistent=None, status=None, storage_tag=None, **unknown_fields):
@@ -9535,12 +21014,33 @@ class StorageDetails(Type):
         self.kind = kind
         self.owner_tag = owner_tag
         self.persistent = persistent
-        self.status = EntityStatus.from_json(status) if status else None
+        self._raw_status = status
         self.storage_tag = storage_tag
+        self.unknown_fields = unknown_fields
+
+    status = LazyField('status', lambda data: EntityStatus.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.attachments = data.get('attachments')
+        self.kind = data.get('kind')
+        self.owner_tag = data.get('owner-tag')
+        self.persistent = data.get('persistent')
+        self._raw_status = data.get('status')
+        self.storage_tag = data.get('storage-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attachments': self.attachments, 'kind': self.kind, 'owner-tag': self.owner_tag, 'persistent': self.persistent, 'status': self._raw_status, 'storage-tag': self.storage_tag}
 
 
 
 class StorageDetailsListResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -9548,23 +21048,57 @@ class StorageDetailsListResult(Type):
         error : Error
         result : typing.Sequence[~StorageDetails]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = [StorageDetails.from_json(o) for o in result or []]
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: [StorageDetails.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class StorageDetailsListResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StorageDetailsListResult]
         '''
-        self.results = [StorageDetailsListResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StorageDetailsListResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StorageDetailsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -9572,45 +21106,107 @@ class StorageDetailsResult(Type):
         error : Error
         result : StorageDetails
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = StorageDetails.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: StorageDetails.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class StorageDetailsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StorageDetailsResult]
         '''
-        self.results = [StorageDetailsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StorageDetailsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StorageFilter(Type):
+    __slots__ = ('unknown_fields',)
     _toSchema = {}
     _toPy = {}
     def __init__(self, **unknown_fields):
         '''
 
         '''
-        pass
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {}
 
 
 
 class StorageFilters(Type):
+    __slots__ = ('_filters', '_raw_filters', 'unknown_fields')
     _toSchema = {'filters': 'filters'}
     _toPy = {'filters': 'filters'}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~StorageFilter]
         '''
-        self.filters = [StorageFilter.from_json(o) for o in filters or []]
+        self._raw_filters = filters
+        self.unknown_fields = unknown_fields
+
+    filters = LazyField('filters', lambda data: [StorageFilter.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_filters = data.get('filters')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filters': self._raw_filters}
 
 
 
 class StoragePool(Type):
+    __slots__ = ('attrs', 'name', 'provider', 'unknown_fields')
     _toSchema = {'attrs': 'attrs', 'name': 'name', 'provider': 'provider'}
     _toPy = {'attrs': 'attrs', 'name': 'name', 'provider': 'provider'}
     def __init__(self, attrs=None, name=None, provider=None, **unknown_fields):
@@ -9622,10 +21218,26 @@ class StoragePool(Type):
         self.attrs = attrs
         self.name = name
         self.provider = provider
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.attrs = data.get('attrs')
+        self.name = data.get('name')
+        self.provider = data.get('provider')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attrs': self.attrs, 'name': self.name, 'provider': self.provider}
 
 
 
 class StoragePoolFilter(Type):
+    __slots__ = ('names', 'providers', 'unknown_fields')
     _toSchema = {'names': 'names', 'providers': 'providers'}
     _toPy = {'names': 'names', 'providers': 'providers'}
     def __init__(self, names=None, providers=None, **unknown_fields):
@@ -9635,21 +21247,52 @@ class StoragePoolFilter(Type):
         '''
         self.names = names
         self.providers = providers
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.names = data.get('names')
+        self.providers = data.get('providers')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'names': self.names, 'providers': self.providers}
 
 
 
 class StoragePoolFilters(Type):
+    __slots__ = ('_filters', '_raw_filters', 'unknown_fields')
     _toSchema = {'filters': 'filters'}
     _toPy = {'filters': 'filters'}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~StoragePoolFilter]
         '''
-        self.filters = [StoragePoolFilter.from_json(o) for o in filters or []]
+        self._raw_filters = filters
+        self.unknown_fields = unknown_fields
+
+    filters = LazyField('filters', lambda data: [StoragePoolFilter.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_filters = data.get('filters')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filters': self._raw_filters}
 
 
 
 class StoragePoolsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_storage_pools', '_storage_pools', 'unknown_fields')
     _toSchema = {'error': 'error', 'storage_pools': 'storage-pools'}
     _toPy = {'error': 'error', 'storage-pools': 'storage_pools'}
     def __init__(self, error=None, storage_pools=None, **unknown_fields):
@@ -9657,34 +21300,84 @@ class StoragePoolsResult(Type):
         error : Error
         storage_pools : typing.Sequence[~StoragePool]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.storage_pools = [StoragePool.from_json(o) for o in storage_pools or []]
+        self._raw_error = error
+        self._raw_storage_pools = storage_pools
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    storage_pools = LazyField('storage_pools', lambda data: [StoragePool.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_storage_pools = data.get('storage-pools')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'storage-pools': self._raw_storage_pools}
 
 
 
 class StoragePoolsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StoragePoolsResult]
         '''
-        self.results = [StoragePoolsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StoragePoolsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StoragesAddParams(Type):
+    __slots__ = ('_raw_storages', '_storages', 'unknown_fields')
     _toSchema = {'storages': 'storages'}
     _toPy = {'storages': 'storages'}
     def __init__(self, storages=None, **unknown_fields):
         '''
         storages : typing.Sequence[~StorageAddParams]
         '''
-        self.storages = [StorageAddParams.from_json(o) for o in storages or []]
+        self._raw_storages = storages
+        self.unknown_fields = unknown_fields
+
+    storages = LazyField('storages', lambda data: [StorageAddParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_storages = data.get('storages')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'storages': self._raw_storages}
 
 
 
 class StringBoolResult(Type):
+    __slots__ = ('_error', '_raw_error', 'ok', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'ok': 'ok', 'result': 'result'}
     _toPy = {'error': 'error', 'ok': 'ok', 'result': 'result'}
     def __init__(self, error=None, ok=None, result=None, **unknown_fields):
@@ -9693,24 +21386,58 @@ class StringBoolResult(Type):
         ok : bool
         result : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.ok = ok
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.ok = data.get('ok')
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'ok': self.ok, 'result': self.result}
 
 
 
 class StringBoolResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StringBoolResult]
         '''
-        self.results = [StringBoolResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StringBoolResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StringResult(Type):
+    __slots__ = ('_error', '_raw_error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -9718,23 +21445,56 @@ class StringResult(Type):
         error : Error
         result : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self.result}
 
 
 
 class StringResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StringResult]
         '''
-        self.results = [StringResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StringResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StringsResult(Type):
+    __slots__ = ('_error', '_raw_error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -9742,23 +21502,56 @@ class StringsResult(Type):
         error : Error
         result : typing.Sequence[str]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self.result}
 
 
 
 class StringsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StringsResult]
         '''
-        self.results = [StringsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StringsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class StringsWatchResult(Type):
+    __slots__ = ('_error', '_raw_error', 'changes', 'unknown_fields', 'watcher_id')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
@@ -9768,23 +21561,57 @@ class StringsWatchResult(Type):
         watcher_id : str
         '''
         self.changes = changes
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.watcher_id = watcher_id
+        self.unknown_fields = unknown_fields
 
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
 
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.changes = data.get('changes')
+        self._raw_error = data.get('error')
+        self.watcher_id = data.get('watcher-id')
+        self.unknown_fields = {}
+        return self
 
-class StringsWatchResults(Type):
+    def serialize(self):
+        return {'changes': self.changes, 'error': self._raw_error, 'watcher-id': self.watcher_id}
+
+
+
+class StringsWatchResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StringsWatchResult]
         '''
-        self.results = [StringsWatchResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [StringsWatchResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Subnet(Type):
+    __slots__ = ('cidr', 'life', 'provider_id', 'space_tag', 'status', 'unknown_fields', 'vlan_tag', 'zones')
     _toSchema = {'cidr': 'cidr', 'life': 'life', 'provider_id': 'provider-id', 'space_tag': 'space-tag', 'status': 'status', 'vlan_tag': 'vlan-tag', 'zones': 'zones'}
     _toPy = {'cidr': 'cidr', 'life': 'life', 'provider-id': 'provider_id', 'space-tag': 'space_tag', 'status': 'status', 'vlan-tag': 'vlan_tag', 'zones': 'zones'}
     def __init__(self, cidr=None, life=None, provider_id=None, space_tag=None, status=None, vlan_tag=None, zones=None, **unknown_fields):
@@ -9804,10 +21631,30 @@ class Subnet(Type):
         self.status = status
         self.vlan_tag = vlan_tag
         self.zones = zones
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cidr = data.get('cidr')
+        self.life = data.get('life')
+        self.provider_id = data.get('provider-id')
+        self.space_tag = data.get('space-tag')
+        self.status = data.get('status')
+        self.vlan_tag = data.get('vlan-tag')
+        self.zones = data.get('zones')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cidr': self.cidr, 'life': self.life, 'provider-id': self.provider_id, 'space-tag': self.space_tag, 'status': self.status, 'vlan-tag': self.vlan_tag, 'zones': self.zones}
 
 
 
 class SubnetsFilters(Type):
+    __slots__ = ('space_tag', 'unknown_fields', 'zone')
     _toSchema = {'space_tag': 'space-tag', 'zone': 'zone'}
     _toPy = {'space-tag': 'space_tag', 'zone': 'zone'}
     def __init__(self, space_tag=None, zone=None, **unknown_fields):
@@ -9817,10 +21664,25 @@ class SubnetsFilters(Type):
         '''
         self.space_tag = space_tag
         self.zone = zone
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.space_tag = data.get('space-tag')
+        self.zone = data.get('zone')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'space-tag': self.space_tag, 'zone': self.zone}
 
 
 
 class TaggedCredential(Type):
+    __slots__ = ('_credential', '_raw_credential', 'tag', 'unknown_fields')
     _toSchema = {'credential': 'credential', 'tag': 'tag'}
     _toPy = {'credential': 'credential', 'tag': 'tag'}
     def __init__(self, credential=None, tag=None, **unknown_fields):
@@ -9828,23 +21690,56 @@ class TaggedCredential(Type):
         credential : CloudCredential
         tag : str
         '''
-        self.credential = CloudCredential.from_json(credential) if credential else None
+        self._raw_credential = credential
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    credential = LazyField('credential', lambda data: CloudCredential.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_credential = data.get('credential')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credential': self._raw_credential, 'tag': self.tag}
 
 
 
 class TaggedCredentials(Type):
+    __slots__ = ('_credentials', '_raw_credentials', 'unknown_fields')
     _toSchema = {'credentials': 'credentials'}
     _toPy = {'credentials': 'credentials'}
     def __init__(self, credentials=None, **unknown_fields):
         '''
         credentials : typing.Sequence[~TaggedCredential]
         '''
-        self.credentials = [TaggedCredential.from_json(o) for o in credentials or []]
+        self._raw_credentials = credentials
+        self.unknown_fields = unknown_fields
+
+    credentials = LazyField('credentials', lambda data: [TaggedCredential.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_credentials = data.get('credentials')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credentials': self._raw_credentials}
 
 
 
 class TokenResult(Type):
+    __slots__ = ('_error', '_raw_error', 'token', 'unknown_fields')
     _toSchema = {'error': 'error', 'token': 'token'}
     _toPy = {'error': 'error', 'token': 'token'}
     def __init__(self, error=None, token=None, **unknown_fields):
@@ -9852,23 +21747,56 @@ class TokenResult(Type):
         error : Error
         token : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.token = token
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.token = data.get('token')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'token': self.token}
 
 
 
 class TokenResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~TokenResult]
         '''
-        self.results = [TokenResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [TokenResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Tools(Type):
+    __slots__ = ('_raw_version', '_version', 'sha256', 'size', 'unknown_fields', 'url')
     _toSchema = {'sha256': 'sha256', 'size': 'size', 'url': 'url', 'version': 'version'}
     _toPy = {'sha256': 'sha256', 'size': 'size', 'url': 'url', 'version': 'version'}
     def __init__(self, sha256=None, size=None, url=None, version=None, **unknown_fields):
@@ -9881,11 +21809,30 @@ class Tools(Type):
         self.sha256 = sha256
         self.size = size
         self.url = url
-        self.version = Binary.from_json(version) if version else None
+        self._raw_version = version
+        self.unknown_fields = unknown_fields
+
+    version = LazyField('version', lambda data: Binary.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.sha256 = data.get('sha256')
+        self.size = data.get('size')
+        self.url = data.get('url')
+        self._raw_version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'sha256': self.sha256, 'size': self.size, 'url': self.url, 'version': self._raw_version}
 
 
 
 class ToolsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_tools', '_tools', 'disable_ssl_hostname_verification', 'unknown_fields')
     _toSchema = {'disable_ssl_hostname_verification': 'disable-ssl-hostname-verification', 'error': 'error', 'tools': 'tools'}
     _toPy = {'disable-ssl-hostname-verification': 'disable_ssl_hostname_verification', 'error': 'error', 'tools': 'tools'}
     def __init__(self, disable_ssl_hostname_verification=None, error=None, tools=None, **unknown_fields):
@@ -9895,45 +21842,112 @@ class ToolsResult(Type):
         tools : typing.Sequence[~Tools]
         '''
         self.disable_ssl_hostname_verification = disable_ssl_hostname_verification
-        self.error = Error.from_json(error) if error else None
-        self.tools = [Tools.from_json(o) for o in tools or []]
+        self._raw_error = error
+        self._raw_tools = tools
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    tools = LazyField('tools', lambda data: [Tools.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.disable_ssl_hostname_verification = data.get('disable-ssl-hostname-verification')
+        self._raw_error = data.get('error')
+        self._raw_tools = data.get('tools')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'disable-ssl-hostname-verification': self.disable_ssl_hostname_verification, 'error': self._raw_error, 'tools': self._raw_tools}
 
 
 
 class ToolsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ToolsResult]
         '''
-        self.results = [ToolsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ToolsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class TrackArgs(Type):
+    __slots__ = ('_payloads', '_raw_payloads', 'unknown_fields')
     _toSchema = {'payloads': 'payloads'}
     _toPy = {'payloads': 'payloads'}
     def __init__(self, payloads=None, **unknown_fields):
         '''
         payloads : typing.Sequence[~Payload]
         '''
-        self.payloads = [Payload.from_json(o) for o in payloads or []]
+        self._raw_payloads = payloads
+        self.unknown_fields = unknown_fields
+
+    payloads = LazyField('payloads', lambda data: [Payload.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_payloads = data.get('payloads')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'payloads': self._raw_payloads}
 
 
 
 class TrackPayloadArgs(Type):
+    __slots__ = ('_payloads', '_raw_payloads', 'unknown_fields')
     _toSchema = {'payloads': 'payloads'}
     _toPy = {'payloads': 'payloads'}
     def __init__(self, payloads=None, **unknown_fields):
         '''
         payloads : typing.Sequence[~Payload]
         '''
-        self.payloads = [Payload.from_json(o) for o in payloads or []]
+        self._raw_payloads = payloads
+        self.unknown_fields = unknown_fields
+
+    payloads = LazyField('payloads', lambda data: [Payload.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_payloads = data.get('payloads')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'payloads': self._raw_payloads}
 
 
 
 class UndertakerModelInfo(Type):
+    __slots__ = ('global_name', 'is_system', 'life', 'name', 'unknown_fields', 'uuid')
     _toSchema = {'global_name': 'global-name', 'is_system': 'is-system', 'life': 'life', 'name': 'name', 'uuid': 'uuid'}
     _toPy = {'global-name': 'global_name', 'is-system': 'is_system', 'life': 'life', 'name': 'name', 'uuid': 'uuid'}
     def __init__(self, global_name=None, is_system=None, life=None, name=None, uuid=None, **unknown_fields):
@@ -9949,10 +21963,28 @@ class UndertakerModelInfo(Type):
         self.life = life
         self.name = name
         self.uuid = uuid
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.global_name = data.get('global-name')
+        self.is_system = data.get('is-system')
+        self.life = data.get('life')
+        self.name = data.get('name')
+        self.uuid = data.get('uuid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'global-name': self.global_name, 'is-system': self.is_system, 'life': self.life, 'name': self.name, 'uuid': self.uuid}
 
 
 
 class UndertakerModelInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -9960,12 +21992,30 @@ class UndertakerModelInfoResult(Type):
         error : Error
         result : UndertakerModelInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = UndertakerModelInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: UndertakerModelInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class UnitNetworkConfig(Type):
+    __slots__ = ('binding_name', 'unit_tag', 'unknown_fields')
     _toSchema = {'binding_name': 'binding-name', 'unit_tag': 'unit-tag'}
     _toPy = {'binding-name': 'binding_name', 'unit-tag': 'unit_tag'}
     def __init__(self, binding_name=None, unit_tag=None, **unknown_fields):
@@ -9975,10 +22025,25 @@ class UnitNetworkConfig(Type):
         '''
         self.binding_name = binding_name
         self.unit_tag = unit_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.binding_name = data.get('binding-name')
+        self.unit_tag = data.get('unit-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'binding-name': self.binding_name, 'unit-tag': self.unit_tag}
 
 
 
 class UnitNetworkConfigResult(Type):
+    __slots__ = ('_error', '_info', '_raw_error', '_raw_info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
     def __init__(self, error=None, info=None, **unknown_fields):
@@ -9986,23 +22051,57 @@ class UnitNetworkConfigResult(Type):
         error : Error
         info : typing.Sequence[~NetworkConfig]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.info = [NetworkConfig.from_json(o) for o in info or []]
+        self._raw_error = error
+        self._raw_info = info
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    info = LazyField('info', lambda data: [NetworkConfig.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_info = data.get('info')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'info': self._raw_info}
 
 
 
 class UnitNetworkConfigResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UnitNetworkConfigResult]
         '''
-        self.results = [UnitNetworkConfigResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [UnitNetworkConfigResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class UnitRefreshResult(Type):
+    __slots__ = ('_error', '_raw_error', 'life', 'resolved', 'unknown_fields')
     _toSchema = {'error': 'Error', 'life': 'Life', 'resolved': 'Resolved'}
     _toPy = {'Error': 'error', 'Life': 'life', 'Resolved': 'resolved'}
     def __init__(self, error=None, life=None, resolved=None, **unknown_fields):
@@ -10011,24 +22110,58 @@ class UnitRefreshResult(Type):
         life : str
         resolved : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.life = life
         self.resolved = resolved
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('Error')
+        self.life = data.get('Life')
+        self.resolved = data.get('Resolved')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Error': self._raw_error, 'Life': self.life, 'Resolved': self.resolved}
 
 
 
 class UnitRefreshResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'Results'}
     _toPy = {'Results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UnitRefreshResult]
         '''
-        self.results = [UnitRefreshResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [UnitRefreshResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('Results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Results': self._raw_results}
 
 
 
 class UnitResourceResult(Type):
+    __slots__ = ('_errorresult', '_raw_errorresult', '_raw_resource', '_resource', 'unknown_fields')
     _toSchema = {'errorresult': 'ErrorResult', 'resource': 'resource'}
     _toPy = {'ErrorResult': 'errorresult', 'resource': 'resource'}
     def __init__(self, errorresult=None, resource=None, **unknown_fields):
@@ -10036,12 +22169,30 @@ class UnitResourceResult(Type):
         errorresult : ErrorResult
         resource : Resource
         '''
-        self.errorresult = ErrorResult.from_json(errorresult) if errorresult else None
-        self.resource = Resource.from_json(resource) if resource else None
+        self._raw_errorresult = errorresult
+        self._raw_resource = resource
+        self.unknown_fields = unknown_fields
+
+    errorresult = LazyField('errorresult', lambda data: ErrorResult.from_json(data) if data else None)
+    resource = LazyField('resource', lambda data: Resource.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_errorresult = data.get('ErrorResult')
+        self._raw_resource = data.get('resource')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ErrorResult': self._raw_errorresult, 'resource': self._raw_resource}
 
 
 
 class UnitResources(Type):
+    __slots__ = ('_entity', '_raw_entity', '_raw_resources', '_resources', 'download_progress', 'unknown_fields')
     _toSchema = {'download_progress': 'download-progress', 'entity': 'Entity', 'resources': 'resources'}
     _toPy = {'Entity': 'entity', 'download-progress': 'download_progress', 'resources': 'resources'}
     def __init__(self, entity=None, download_progress=None, resources=None, **unknown_fields):
@@ -10050,13 +22201,32 @@ class UnitResources(Type):
         download_progress : typing.Mapping[str, int]
         resources : typing.Sequence[~Resource]
         '''
-        self.entity = Entity.from_json(entity) if entity else None
+        self._raw_entity = entity
         self.download_progress = download_progress
-        self.resources = [Resource.from_json(o) for o in resources or []]
+        self._raw_resources = resources
+        self.unknown_fields = unknown_fields
+
+    entity = LazyField('entity', lambda data: Entity.from_json(data) if data else None)
+    resources = LazyField('resources', lambda data: [Resource.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entity = data.get('Entity')
+        self.download_progress = data.get('download-progress')
+        self._raw_resources = data.get('resources')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Entity': self._raw_entity, 'download-progress': self.download_progress, 'resources': self._raw_resources}
 
 
 
 class UnitResourcesResult(Type):
+    __slots__ = ('_errorresult', '_raw_errorresult', '_raw_resources', '_resources', 'unknown_fields')
     _toSchema = {'errorresult': 'ErrorResult', 'resources': 'resources'}
     _toPy = {'ErrorResult': 'errorresult', 'resources': 'resources'}
     def __init__(self, errorresult=None, resources=None, **unknown_fields):
@@ -10064,12 +22234,30 @@ class UnitResourcesResult(Type):
         errorresult : ErrorResult
         resources : typing.Sequence[~UnitResourceResult]
         '''
-        self.errorresult = ErrorResult.from_json(errorresult) if errorresult else None
-        self.resources = [UnitResourceResult.from_json(o) for o in resources or []]
+        self._raw_errorresult = errorresult
+        self._raw_resources = resources
+        self.unknown_fields = unknown_fields
+
+    errorresult = LazyField('errorresult', lambda data: ErrorResult.from_json(data) if data else None)
+    resources = LazyField('resources', lambda data: [UnitResourceResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_errorresult = data.get('ErrorResult')
+        self._raw_resources = data.get('resources')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'ErrorResult': self._raw_errorresult, 'resources': self._raw_resources}
 
 
 
 class UnitSettings(Type):
+    __slots__ = ('unknown_fields', 'version')
     _toSchema = {'version': 'version'}
     _toPy = {'version': 'version'}
     def __init__(self, version=None, **unknown_fields):
@@ -10077,10 +22265,24 @@ class UnitSettings(Type):
         version : int
         '''
         self.version = version
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'version': self.version}
 
 
 
 class UnitStatus(Type):
+    __slots__ = ('_agent_status', '_raw_agent_status', '_raw_workload_status', '_workload_status', 'charm', 'leader', 'machine', 'opened_ports', 'public_address', 'subordinates', 'unknown_fields', 'workload_version')
     _toSchema = {'agent_status': 'agent-status', 'charm': 'charm', 'leader': 'leader', 'machine': 'machine', 'opened_ports': 'opened-ports', 'public_address': 'public-address', 'subordinates': 'subordinates', 'workload_status': 'workload-status', 'workload_version': 'workload-version'}
     _toPy = {'agent-status': 'agent_status', 'charm': 'charm', 'leader': 'leader', 'machine': 'machine', 'opened-ports': 'opened_ports', 'public-address': 'public_address', 'subordinates': 'subordinates', 'workload-status': 'workload_status', 'workload-version': 'workload_version'}
     def __init__(self, agent_status=None, charm=None, leader=None, machine=None, opened_ports=None, public_address=None, subordinates=None, workload_status=None, workload_version=None, **unknown_fields):
@@ -10095,30 +22297,71 @@ class UnitStatus(Type):
         workload_status : DetailedStatus
         workload_version : str
         '''
-        self.agent_status = DetailedStatus.from_json(agent_status) if agent_status else None
+        self._raw_agent_status = agent_status
         self.charm = charm
         self.leader = leader
         self.machine = machine
         self.opened_ports = opened_ports
         self.public_address = public_address
         self.subordinates = subordinates
-        self.workload_status = DetailedStatus.from_json(workload_status) if workload_status else None
+        self._raw_workload_status = workload_status
         self.workload_version = workload_version
+        self.unknown_fields = unknown_fields
+
+    agent_status = LazyField('agent_status', lambda data: DetailedStatus.from_json(data) if data else None)
+    workload_status = LazyField('workload_status', lambda data: DetailedStatus.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_agent_status = data.get('agent-status')
+        self.charm = data.get('charm')
+        self.leader = data.get('leader')
+        self.machine = data.get('machine')
+        self.opened_ports = data.get('opened-ports')
+        self.public_address = data.get('public-address')
+        self.subordinates = data.get('subordinates')
+        self._raw_workload_status = data.get('workload-status')
+        self.workload_version = data.get('workload-version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'agent-status': self._raw_agent_status, 'charm': self.charm, 'leader': self.leader, 'machine': self.machine, 'opened-ports': self.opened_ports, 'public-address': self.public_address, 'subordinates': self.subordinates, 'workload-status': self._raw_workload_status, 'workload-version': self.workload_version}
 
 
 
 class UnitsNetworkConfig(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UnitNetworkConfig]
         '''
-        self.args = [UnitNetworkConfig.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [UnitNetworkConfig.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class UnitsResolved(Type):
+    __slots__ = ('_raw_tags', '_tags', 'all_', 'retry', 'unknown_fields')
     _toSchema = {'all_': 'all', 'retry': 'retry', 'tags': 'tags'}
     _toPy = {'all': 'all_', 'retry': 'retry', 'tags': 'tags'}
     def __init__(self, all_=None, retry=None, tags=None, **unknown_fields):
@@ -10129,22 +22372,56 @@ class UnitsResolved(Type):
         '''
         self.all_ = all_
         self.retry = retry
-        self.tags = Entities.from_json(tags) if tags else None
+        self._raw_tags = tags
+        self.unknown_fields = unknown_fields
+
+    tags = LazyField('tags', lambda data: Entities.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.all_ = data.get('all')
+        self.retry = data.get('retry')
+        self._raw_tags = data.get('tags')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'all': self.all_, 'retry': self.retry, 'tags': self._raw_tags}
 
 
 
 class UnsetModelDefaults(Type):
+    __slots__ = ('_keys', '_raw_keys', 'unknown_fields')
     _toSchema = {'keys': 'keys'}
     _toPy = {'keys': 'keys'}
     def __init__(self, keys=None, **unknown_fields):
         '''
         keys : typing.Sequence[~ModelUnsetKeys]
         '''
-        self.keys = [ModelUnsetKeys.from_json(o) for o in keys or []]
+        self._raw_keys = keys
+        self.unknown_fields = unknown_fields
+
+    keys = LazyField('keys', lambda data: [ModelUnsetKeys.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_keys = data.get('keys')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'keys': self._raw_keys}
 
 
 
 class UpdateApplicationServiceArg(Type):
+    __slots__ = ('_addresses', '_raw_addresses', 'application_tag', 'provider_id', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'application_tag': 'application-tag', 'provider_id': 'provider-id'}
     _toPy = {'addresses': 'addresses', 'application-tag': 'application_tag', 'provider-id': 'provider_id'}
     def __init__(self, addresses=None, application_tag=None, provider_id=None, **unknown_fields):
@@ -10153,35 +22430,85 @@ class UpdateApplicationServiceArg(Type):
         application_tag : str
         provider_id : str
         '''
-        self.addresses = [Address.from_json(o) for o in addresses or []]
+        self._raw_addresses = addresses
         self.application_tag = application_tag
         self.provider_id = provider_id
+        self.unknown_fields = unknown_fields
+
+    addresses = LazyField('addresses', lambda data: [Address.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_addresses = data.get('addresses')
+        self.application_tag = data.get('application-tag')
+        self.provider_id = data.get('provider-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'addresses': self._raw_addresses, 'application-tag': self.application_tag, 'provider-id': self.provider_id}
 
 
 
 class UpdateApplicationServiceArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UpdateApplicationServiceArg]
         '''
-        self.args = [UpdateApplicationServiceArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [UpdateApplicationServiceArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class UpdateApplicationUnitArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UpdateApplicationUnits]
         '''
-        self.args = [UpdateApplicationUnits.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [UpdateApplicationUnits.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class UpdateApplicationUnits(Type):
+    __slots__ = ('_raw_units', '_units', 'application_tag', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'units': 'units'}
     _toPy = {'application-tag': 'application_tag', 'units': 'units'}
     def __init__(self, application_tag=None, units=None, **unknown_fields):
@@ -10190,11 +22517,28 @@ class UpdateApplicationUnits(Type):
         units : typing.Sequence[~ApplicationUnitParams]
         '''
         self.application_tag = application_tag
-        self.units = [ApplicationUnitParams.from_json(o) for o in units or []]
+        self._raw_units = units
+        self.unknown_fields = unknown_fields
+
+    units = LazyField('units', lambda data: [ApplicationUnitParams.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.application_tag = data.get('application-tag')
+        self._raw_units = data.get('units')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'application-tag': self.application_tag, 'units': self._raw_units}
 
 
 
 class UpdateBehavior(Type):
+    __slots__ = ('enable_os_refresh_update', 'enable_os_upgrade', 'unknown_fields')
     _toSchema = {'enable_os_refresh_update': 'enable-os-refresh-update', 'enable_os_upgrade': 'enable-os-upgrade'}
     _toPy = {'enable-os-refresh-update': 'enable_os_refresh_update', 'enable-os-upgrade': 'enable_os_upgrade'}
     def __init__(self, enable_os_refresh_update=None, enable_os_upgrade=None, **unknown_fields):
@@ -10204,10 +22548,25 @@ class UpdateBehavior(Type):
         '''
         self.enable_os_refresh_update = enable_os_refresh_update
         self.enable_os_upgrade = enable_os_upgrade
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.enable_os_refresh_update = data.get('enable-os-refresh-update')
+        self.enable_os_upgrade = data.get('enable-os-upgrade')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'enable-os-refresh-update': self.enable_os_refresh_update, 'enable-os-upgrade': self.enable_os_upgrade}
 
 
 
 class UpdateCloudCredential(Type):
+    __slots__ = ('_credential', '_raw_credential', 'tag', 'unknown_fields')
     _toSchema = {'credential': 'credential', 'tag': 'tag'}
     _toPy = {'credential': 'credential', 'tag': 'tag'}
     def __init__(self, credential=None, tag=None, **unknown_fields):
@@ -10215,23 +22574,56 @@ class UpdateCloudCredential(Type):
         credential : CloudCredential
         tag : str
         '''
-        self.credential = CloudCredential.from_json(credential) if credential else None
+        self._raw_credential = credential
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    credential = LazyField('credential', lambda data: CloudCredential.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_credential = data.get('credential')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credential': self._raw_credential, 'tag': self.tag}
 
 
 
 class UpdateCloudCredentials(Type):
+    __slots__ = ('_credentials', '_raw_credentials', 'unknown_fields')
     _toSchema = {'credentials': 'credentials'}
     _toPy = {'credentials': 'credentials'}
     def __init__(self, credentials=None, **unknown_fields):
         '''
         credentials : typing.Sequence[~UpdateCloudCredential]
         '''
-        self.credentials = [UpdateCloudCredential.from_json(o) for o in credentials or []]
+        self._raw_credentials = credentials
+        self.unknown_fields = unknown_fields
+
+    credentials = LazyField('credentials', lambda data: [UpdateCloudCredential.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_credentials = data.get('credentials')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credentials': self._raw_credentials}
 
 
 
 class UpdateCredentialArgs(Type):
+    __slots__ = ('_credentials', '_raw_credentials', 'force', 'unknown_fields')
     _toSchema = {'credentials': 'credentials', 'force': 'force'}
     _toPy = {'credentials': 'credentials', 'force': 'force'}
     def __init__(self, credentials=None, force=None, **unknown_fields):
@@ -10239,12 +22631,29 @@ class UpdateCredentialArgs(Type):
         credentials : typing.Sequence[~TaggedCredential]
         force : bool
         '''
-        self.credentials = [TaggedCredential.from_json(o) for o in credentials or []]
+        self._raw_credentials = credentials
         self.force = force
+        self.unknown_fields = unknown_fields
+
+    credentials = LazyField('credentials', lambda data: [TaggedCredential.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_credentials = data.get('credentials')
+        self.force = data.get('force')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'credentials': self._raw_credentials, 'force': self.force}
 
 
 
 class UpdateCredentialModelResult(Type):
+    __slots__ = ('_errors', '_raw_errors', 'name', 'unknown_fields', 'uuid')
     _toSchema = {'errors': 'errors', 'name': 'name', 'uuid': 'uuid'}
     _toPy = {'errors': 'errors', 'name': 'name', 'uuid': 'uuid'}
     def __init__(self, errors=None, name=None, uuid=None, **unknown_fields):
@@ -10253,13 +22662,31 @@ class UpdateCredentialModelResult(Type):
         name : str
         uuid : str
         '''
-        self.errors = [ErrorResult.from_json(o) for o in errors or []]
+        self._raw_errors = errors
         self.name = name
         self.uuid = uuid
+        self.unknown_fields = unknown_fields
+
+    errors = LazyField('errors', lambda data: [ErrorResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_errors = data.get('errors')
+        self.name = data.get('name')
+        self.uuid = data.get('uuid')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'errors': self._raw_errors, 'name': self.name, 'uuid': self.uuid}
 
 
 
 class UpdateCredentialResult(Type):
+    __slots__ = ('_error', '_models', '_raw_error', '_raw_models', 'tag', 'unknown_fields')
     _toSchema = {'error': 'error', 'models': 'models', 'tag': 'tag'}
     _toPy = {'error': 'error', 'models': 'models', 'tag': 'tag'}
     def __init__(self, error=None, models=None, tag=None, **unknown_fields):
@@ -10268,24 +22695,59 @@ class UpdateCredentialResult(Type):
         models : typing.Sequence[~UpdateCredentialModelResult]
         tag : str
         '''
-        self.error = Error.from_json(error) if error else None
-        self.models = [UpdateCredentialModelResult.from_json(o) for o in models or []]
+        self._raw_error = error
+        self._raw_models = models
         self.tag = tag
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    models = LazyField('models', lambda data: [UpdateCredentialModelResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_models = data.get('models')
+        self.tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'models': self._raw_models, 'tag': self.tag}
 
 
 
 class UpdateCredentialResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UpdateCredentialResult]
         '''
-        self.results = [UpdateCredentialResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [UpdateCredentialResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class UpdateSeriesArg(Type):
+    __slots__ = ('_raw_tag', '_tag', 'force', 'series', 'unknown_fields')
     _toSchema = {'force': 'force', 'series': 'series', 'tag': 'tag'}
     _toPy = {'force': 'force', 'series': 'series', 'tag': 'tag'}
     def __init__(self, force=None, series=None, tag=None, **unknown_fields):
@@ -10296,33 +22758,83 @@ class UpdateSeriesArg(Type):
         '''
         self.force = force
         self.series = series
-        self.tag = Entity.from_json(tag) if tag else None
+        self._raw_tag = tag
+        self.unknown_fields = unknown_fields
+
+    tag = LazyField('tag', lambda data: Entity.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.force = data.get('force')
+        self.series = data.get('series')
+        self._raw_tag = data.get('tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'force': self.force, 'series': self.series, 'tag': self._raw_tag}
 
 
 
 class UpdateSeriesArgs(Type):
+    __slots__ = ('_args', '_raw_args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UpdateSeriesArg]
         '''
-        self.args = [UpdateSeriesArg.from_json(o) for o in args or []]
+        self._raw_args = args
+        self.unknown_fields = unknown_fields
+
+    args = LazyField('args', lambda data: [UpdateSeriesArg.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_args = data.get('args')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'args': self._raw_args}
 
 
 
 class UpgradeMongoParams(Type):
+    __slots__ = ('_raw_target', '_target', 'unknown_fields')
     _toSchema = {'target': 'target'}
     _toPy = {'target': 'target'}
     def __init__(self, target=None, **unknown_fields):
         '''
         target : MongoVersion
         '''
-        self.target = MongoVersion.from_json(target) if target else None
+        self._raw_target = target
+        self.unknown_fields = unknown_fields
+
+    target = LazyField('target', lambda data: MongoVersion.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_target = data.get('target')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'target': self._raw_target}
 
 
 
 class UpgradeSeriesNotificationParam(Type):
+    __slots__ = ('_entity', '_raw_entity', 'unknown_fields', 'watcher_id')
     _toSchema = {'entity': 'entity', 'watcher_id': 'watcher-id'}
     _toPy = {'entity': 'entity', 'watcher-id': 'watcher_id'}
     def __init__(self, entity=None, watcher_id=None, **unknown_fields):
@@ -10330,23 +22842,56 @@ class UpgradeSeriesNotificationParam(Type):
         entity : Entity
         watcher_id : str
         '''
-        self.entity = Entity.from_json(entity) if entity else None
+        self._raw_entity = entity
         self.watcher_id = watcher_id
+        self.unknown_fields = unknown_fields
+
+    entity = LazyField('entity', lambda data: Entity.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entity = data.get('entity')
+        self.watcher_id = data.get('watcher-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entity': self._raw_entity, 'watcher-id': self.watcher_id}
 
 
 
 class UpgradeSeriesNotificationParams(Type):
+    __slots__ = ('_params', '_raw_params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~UpgradeSeriesNotificationParam]
         '''
-        self.params = [UpgradeSeriesNotificationParam.from_json(o) for o in params or []]
+        self._raw_params = params
+        self.unknown_fields = unknown_fields
+
+    params = LazyField('params', lambda data: [UpgradeSeriesNotificationParam.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'params': self._raw_params}
 
 
 
 class UpgradeSeriesStartUnitCompletionParam(Type):
+    __slots__ = ('_entities', '_raw_entities', 'message', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'message': 'message'}
     _toPy = {'entities': 'entities', 'message': 'message'}
     def __init__(self, entities=None, message=None, **unknown_fields):
@@ -10354,12 +22899,29 @@ class UpgradeSeriesStartUnitCompletionParam(Type):
         entities : typing.Sequence[~Entity]
         message : str
         '''
-        self.entities = [Entity.from_json(o) for o in entities or []]
+        self._raw_entities = entities
         self.message = message
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [Entity.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.message = data.get('message')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities, 'message': self.message}
 
 
 
 class UpgradeSeriesStatusParam(Type):
+    __slots__ = ('_entity', '_raw_entity', 'message', 'status', 'unknown_fields')
     _toSchema = {'entity': 'entity', 'message': 'message', 'status': 'status'}
     _toPy = {'entity': 'entity', 'message': 'message', 'status': 'status'}
     def __init__(self, entity=None, message=None, status=None, **unknown_fields):
@@ -10368,24 +22930,58 @@ class UpgradeSeriesStatusParam(Type):
         message : str
         status : str
         '''
-        self.entity = Entity.from_json(entity) if entity else None
+        self._raw_entity = entity
         self.message = message
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    entity = LazyField('entity', lambda data: Entity.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entity = data.get('entity')
+        self.message = data.get('message')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entity': self._raw_entity, 'message': self.message, 'status': self.status}
 
 
 
 class UpgradeSeriesStatusParams(Type):
+    __slots__ = ('_params', '_raw_params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~UpgradeSeriesStatusParam]
         '''
-        self.params = [UpgradeSeriesStatusParam.from_json(o) for o in params or []]
+        self._raw_params = params
+        self.unknown_fields = unknown_fields
+
+    params = LazyField('params', lambda data: [UpgradeSeriesStatusParam.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'params': self._raw_params}
 
 
 
 class UpgradeSeriesStatusResult(Type):
+    __slots__ = ('_error', '_raw_error', 'status', 'unknown_fields')
     _toSchema = {'error': 'error', 'status': 'status'}
     _toPy = {'error': 'error', 'status': 'status'}
     def __init__(self, error=None, status=None, **unknown_fields):
@@ -10393,23 +22989,56 @@ class UpgradeSeriesStatusResult(Type):
         error : Error
         status : str
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.status = status
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.status = data.get('status')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'status': self.status}
 
 
 
 class UpgradeSeriesStatusResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UpgradeSeriesStatusResult]
         '''
-        self.results = [UpgradeSeriesStatusResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [UpgradeSeriesStatusResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class UpgradeSeriesUnitsResult(Type):
+    __slots__ = ('_error', '_raw_error', 'unit_names', 'unknown_fields')
     _toSchema = {'error': 'error', 'unit_names': 'unit-names'}
     _toPy = {'error': 'error', 'unit-names': 'unit_names'}
     def __init__(self, error=None, unit_names=None, **unknown_fields):
@@ -10417,23 +23046,56 @@ class UpgradeSeriesUnitsResult(Type):
         error : Error
         unit_names : typing.Sequence[str]
         '''
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.unit_names = unit_names
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self.unit_names = data.get('unit-names')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'unit-names': self.unit_names}
 
 
 
 class UpgradeSeriesUnitsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'Results'}
     _toPy = {'Results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UpgradeSeriesUnitsResult]
         '''
-        self.results = [UpgradeSeriesUnitsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [UpgradeSeriesUnitsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('Results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'Results': self._raw_results}
 
 
 
 class UserAccess(Type):
+    __slots__ = ('access', 'unknown_fields', 'user_tag')
     _toSchema = {'access': 'access', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'user-tag': 'user_tag'}
     def __init__(self, access=None, user_tag=None, **unknown_fields):
@@ -10443,10 +23105,25 @@ class UserAccess(Type):
         '''
         self.access = access
         self.user_tag = user_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.user_tag = data.get('user-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'user-tag': self.user_tag}
 
 
 
 class UserAccessResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -10454,23 +23131,57 @@ class UserAccessResult(Type):
         error : Error
         result : UserAccess
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = UserAccess.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: UserAccess.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class UserAccessResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UserAccessResult]
         '''
-        self.results = [UserAccessResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [UserAccessResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class UserCloud(Type):
+    __slots__ = ('cloud_tag', 'unknown_fields', 'user_tag')
     _toSchema = {'cloud_tag': 'cloud-tag', 'user_tag': 'user-tag'}
     _toPy = {'cloud-tag': 'cloud_tag', 'user-tag': 'user_tag'}
     def __init__(self, cloud_tag=None, user_tag=None, **unknown_fields):
@@ -10480,21 +23191,52 @@ class UserCloud(Type):
         '''
         self.cloud_tag = cloud_tag
         self.user_tag = user_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.cloud_tag = data.get('cloud-tag')
+        self.user_tag = data.get('user-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'cloud-tag': self.cloud_tag, 'user-tag': self.user_tag}
 
 
 
 class UserClouds(Type):
+    __slots__ = ('_raw_user_clouds', '_user_clouds', 'unknown_fields')
     _toSchema = {'user_clouds': 'user-clouds'}
     _toPy = {'user-clouds': 'user_clouds'}
     def __init__(self, user_clouds=None, **unknown_fields):
         '''
         user_clouds : typing.Sequence[~UserCloud]
         '''
-        self.user_clouds = [UserCloud.from_json(o) for o in user_clouds or []]
+        self._raw_user_clouds = user_clouds
+        self.unknown_fields = unknown_fields
+
+    user_clouds = LazyField('user_clouds', lambda data: [UserCloud.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_user_clouds = data.get('user-clouds')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'user-clouds': self._raw_user_clouds}
 
 
 
 class UserInfo(Type):
+    __slots__ = ('access', 'created_by', 'date_created', 'disabled', 'display_name', 'last_connection', 'unknown_fields', 'username')
     _toSchema = {'access': 'access', 'created_by': 'created-by', 'date_created': 'date-created', 'disabled': 'disabled', 'display_name': 'display-name', 'last_connection': 'last-connection', 'username': 'username'}
     _toPy = {'access': 'access', 'created-by': 'created_by', 'date-created': 'date_created', 'disabled': 'disabled', 'display-name': 'display_name', 'last-connection': 'last_connection', 'username': 'username'}
     def __init__(self, access=None, created_by=None, date_created=None, disabled=None, display_name=None, last_connection=None, username=None, **unknown_fields):
@@ -10514,10 +23256,30 @@ class UserInfo(Type):
         self.display_name = display_name
         self.last_connection = last_connection
         self.username = username
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.access = data.get('access')
+        self.created_by = data.get('created-by')
+        self.date_created = data.get('date-created')
+        self.disabled = data.get('disabled')
+        self.display_name = data.get('display-name')
+        self.last_connection = data.get('last-connection')
+        self.username = data.get('username')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'access': self.access, 'created-by': self.created_by, 'date-created': self.date_created, 'disabled': self.disabled, 'display-name': self.display_name, 'last-connection': self.last_connection, 'username': self.username}
 
 
 
 class UserInfoRequest(Type):
+    __slots__ = ('_entities', '_raw_entities', 'include_disabled', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'include_disabled': 'include-disabled'}
     _toPy = {'entities': 'entities', 'include-disabled': 'include_disabled'}
     def __init__(self, entities=None, include_disabled=None, **unknown_fields):
@@ -10525,12 +23287,29 @@ class UserInfoRequest(Type):
         entities : typing.Sequence[~Entity]
         include_disabled : bool
         '''
-        self.entities = [Entity.from_json(o) for o in entities or []]
+        self._raw_entities = entities
         self.include_disabled = include_disabled
+        self.unknown_fields = unknown_fields
+
+    entities = LazyField('entities', lambda data: [Entity.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_entities = data.get('entities')
+        self.include_disabled = data.get('include-disabled')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'entities': self._raw_entities, 'include-disabled': self.include_disabled}
 
 
 
 class UserInfoResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -10538,23 +23317,57 @@ class UserInfoResult(Type):
         error : Error
         result : UserInfo
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = UserInfo.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: UserInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class UserInfoResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UserInfoResult]
         '''
-        self.results = [UserInfoResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [UserInfoResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class UserModel(Type):
+    __slots__ = ('_model', '_raw_model', 'last_connection', 'unknown_fields')
     _toSchema = {'last_connection': 'last-connection', 'model': 'model'}
     _toPy = {'last-connection': 'last_connection', 'model': 'model'}
     def __init__(self, last_connection=None, model=None, **unknown_fields):
@@ -10563,22 +23376,55 @@ class UserModel(Type):
         model : Model
         '''
         self.last_connection = last_connection
-        self.model = Model.from_json(model) if model else None
+        self._raw_model = model
+        self.unknown_fields = unknown_fields
+
+    model = LazyField('model', lambda data: Model.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.last_connection = data.get('last-connection')
+        self._raw_model = data.get('model')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'last-connection': self.last_connection, 'model': self._raw_model}
 
 
 
 class UserModelList(Type):
+    __slots__ = ('_raw_user_models', '_user_models', 'unknown_fields')
     _toSchema = {'user_models': 'user-models'}
     _toPy = {'user-models': 'user_models'}
     def __init__(self, user_models=None, **unknown_fields):
         '''
         user_models : typing.Sequence[~UserModel]
         '''
-        self.user_models = [UserModel.from_json(o) for o in user_models or []]
+        self._raw_user_models = user_models
+        self.unknown_fields = unknown_fields
+
+    user_models = LazyField('user_models', lambda data: [UserModel.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_user_models = data.get('user-models')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'user-models': self._raw_user_models}
 
 
 
 class Value(Type):
+    __slots__ = ('arch', 'container', 'cores', 'cpu_power', 'instance_type', 'mem', 'root_disk', 'spaces', 'tags', 'unknown_fields', 'virt_type')
     _toSchema = {'arch': 'arch', 'container': 'container', 'cores': 'cores', 'cpu_power': 'cpu-power', 'instance_type': 'instance-type', 'mem': 'mem', 'root_disk': 'root-disk', 'spaces': 'spaces', 'tags': 'tags', 'virt_type': 'virt-type'}
     _toPy = {'arch': 'arch', 'container': 'container', 'cores': 'cores', 'cpu-power': 'cpu_power', 'instance-type': 'instance_type', 'mem': 'mem', 'root-disk': 'root_disk', 'spaces': 'spaces', 'tags': 'tags', 'virt-type': 'virt_type'}
     def __init__(self, arch=None, container=None, cores=None, cpu_power=None, instance_type=None, mem=None, root_disk=None, spaces=None, tags=None, virt_type=None, **unknown_fields):
@@ -10604,21 +23450,60 @@ class Value(Type):
         self.spaces = spaces
         self.tags = tags
         self.virt_type = virt_type
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.arch = data.get('arch')
+        self.container = data.get('container')
+        self.cores = data.get('cores')
+        self.cpu_power = data.get('cpu-power')
+        self.instance_type = data.get('instance-type')
+        self.mem = data.get('mem')
+        self.root_disk = data.get('root-disk')
+        self.spaces = data.get('spaces')
+        self.tags = data.get('tags')
+        self.virt_type = data.get('virt-type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'arch': self.arch, 'container': self.container, 'cores': self.cores, 'cpu-power': self.cpu_power, 'instance-type': self.instance_type, 'mem': self.mem, 'root-disk': self.root_disk, 'spaces': self.spaces, 'tags': self.tags, 'virt-type': self.virt_type}
 
 
 
 class Version(Type):
+    __slots__ = ('_raw_version', '_version', 'unknown_fields')
     _toSchema = {'version': 'version'}
     _toPy = {'version': 'version'}
     def __init__(self, version=None, **unknown_fields):
         '''
         version : Binary
         '''
-        self.version = Binary.from_json(version) if version else None
+        self._raw_version = version
+        self.unknown_fields = unknown_fields
+
+    version = LazyField('version', lambda data: Binary.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'version': self._raw_version}
 
 
 
 class VersionResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_version', '_version', 'unknown_fields')
     _toSchema = {'error': 'error', 'version': 'version'}
     _toPy = {'error': 'error', 'version': 'version'}
     def __init__(self, error=None, version=None, **unknown_fields):
@@ -10626,23 +23511,57 @@ class VersionResult(Type):
         error : Error
         version : Number
         '''
-        self.error = Error.from_json(error) if error else None
-        self.version = Number.from_json(version) if version else None
+        self._raw_error = error
+        self._raw_version = version
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    version = LazyField('version', lambda data: Number.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_version = data.get('version')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'version': self._raw_version}
 
 
 
 class VersionResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VersionResult]
         '''
-        self.results = [VersionResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [VersionResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Volume(Type):
+    __slots__ = ('_info', '_raw_info', 'unknown_fields', 'volume_tag')
     _toSchema = {'info': 'info', 'volume_tag': 'volume-tag'}
     _toPy = {'info': 'info', 'volume-tag': 'volume_tag'}
     def __init__(self, info=None, volume_tag=None, **unknown_fields):
@@ -10650,12 +23569,29 @@ class Volume(Type):
         info : VolumeInfo
         volume_tag : str
         '''
-        self.info = VolumeInfo.from_json(info) if info else None
+        self._raw_info = info
         self.volume_tag = volume_tag
+        self.unknown_fields = unknown_fields
+
+    info = LazyField('info', lambda data: VolumeInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_info = data.get('info')
+        self.volume_tag = data.get('volume-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'info': self._raw_info, 'volume-tag': self.volume_tag}
 
 
 
 class VolumeAttachment(Type):
+    __slots__ = ('_info', '_raw_info', 'machine_tag', 'unknown_fields', 'volume_tag')
     _toSchema = {'info': 'info', 'machine_tag': 'machine-tag', 'volume_tag': 'volume-tag'}
     _toPy = {'info': 'info', 'machine-tag': 'machine_tag', 'volume-tag': 'volume_tag'}
     def __init__(self, info=None, machine_tag=None, volume_tag=None, **unknown_fields):
@@ -10664,13 +23600,31 @@ class VolumeAttachment(Type):
         machine_tag : str
         volume_tag : str
         '''
-        self.info = VolumeAttachmentInfo.from_json(info) if info else None
+        self._raw_info = info
         self.machine_tag = machine_tag
         self.volume_tag = volume_tag
+        self.unknown_fields = unknown_fields
+
+    info = LazyField('info', lambda data: VolumeAttachmentInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_info = data.get('info')
+        self.machine_tag = data.get('machine-tag')
+        self.volume_tag = data.get('volume-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'info': self._raw_info, 'machine-tag': self.machine_tag, 'volume-tag': self.volume_tag}
 
 
 
 class VolumeAttachmentDetails(Type):
+    __slots__ = ('_raw_volumeattachmentinfo', '_volumeattachmentinfo', 'life', 'unknown_fields')
     _toSchema = {'life': 'life', 'volumeattachmentinfo': 'VolumeAttachmentInfo'}
     _toPy = {'VolumeAttachmentInfo': 'volumeattachmentinfo', 'life': 'life'}
     def __init__(self, volumeattachmentinfo=None, life=None, **unknown_fields):
@@ -10678,12 +23632,29 @@ class VolumeAttachmentDetails(Type):
         volumeattachmentinfo : VolumeAttachmentInfo
         life : str
         '''
-        self.volumeattachmentinfo = VolumeAttachmentInfo.from_json(volumeattachmentinfo) if volumeattachmentinfo else None
+        self._raw_volumeattachmentinfo = volumeattachmentinfo
         self.life = life
+        self.unknown_fields = unknown_fields
+
+    volumeattachmentinfo = LazyField('volumeattachmentinfo', lambda data: VolumeAttachmentInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_volumeattachmentinfo = data.get('VolumeAttachmentInfo')
+        self.life = data.get('life')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'VolumeAttachmentInfo': self._raw_volumeattachmentinfo, 'life': self.life}
 
 
 
 class VolumeAttachmentInfo(Type):
+    __slots__ = ('bus_address', 'device_link', 'device_name', 'read_only', 'unknown_fields')
     _toSchema = {'bus_address': 'bus-address', 'device_link': 'device-link', 'device_name': 'device-name', 'read_only': 'read-only'}
     _toPy = {'bus-address': 'bus_address', 'device-link': 'device_link', 'device-name': 'device_name', 'read-only': 'read_only'}
     def __init__(self, bus_address=None, device_link=None, device_name=None, read_only=None, **unknown_fields):
@@ -10697,10 +23668,27 @@ class VolumeAttachmentInfo(Type):
         self.device_link = device_link
         self.device_name = device_name
         self.read_only = read_only
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.bus_address = data.get('bus-address')
+        self.device_link = data.get('device-link')
+        self.device_name = data.get('device-name')
+        self.read_only = data.get('read-only')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'bus-address': self.bus_address, 'device-link': self.device_link, 'device-name': self.device_name, 'read-only': self.read_only}
 
 
 
 class VolumeAttachmentParams(Type):
+    __slots__ = ('instance_id', 'machine_tag', 'provider', 'read_only', 'unknown_fields', 'volume_id', 'volume_tag')
     _toSchema = {'instance_id': 'instance-id', 'machine_tag': 'machine-tag', 'provider': 'provider', 'read_only': 'read-only', 'volume_id': 'volume-id', 'volume_tag': 'volume-tag'}
     _toPy = {'instance-id': 'instance_id', 'machine-tag': 'machine_tag', 'provider': 'provider', 'read-only': 'read_only', 'volume-id': 'volume_id', 'volume-tag': 'volume_tag'}
     def __init__(self, instance_id=None, machine_tag=None, provider=None, read_only=None, volume_id=None, volume_tag=None, **unknown_fields):
@@ -10718,10 +23706,29 @@ class VolumeAttachmentParams(Type):
         self.read_only = read_only
         self.volume_id = volume_id
         self.volume_tag = volume_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.instance_id = data.get('instance-id')
+        self.machine_tag = data.get('machine-tag')
+        self.provider = data.get('provider')
+        self.read_only = data.get('read-only')
+        self.volume_id = data.get('volume-id')
+        self.volume_tag = data.get('volume-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'instance-id': self.instance_id, 'machine-tag': self.machine_tag, 'provider': self.provider, 'read-only': self.read_only, 'volume-id': self.volume_id, 'volume-tag': self.volume_tag}
 
 
 
 class VolumeAttachmentParamsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -10729,23 +23736,57 @@ class VolumeAttachmentParamsResult(Type):
         error : Error
         result : VolumeAttachmentParams
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = VolumeAttachmentParams.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: VolumeAttachmentParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class VolumeAttachmentParamsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeAttachmentParamsResult]
         '''
-        self.results = [VolumeAttachmentParamsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [VolumeAttachmentParamsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class VolumeAttachmentPlan(Type):
+    __slots__ = ('_block_device', '_plan_info', '_raw_block_device', '_raw_plan_info', 'life', 'machine_tag', 'unknown_fields', 'volume_tag')
     _toSchema = {'block_device': 'block-device', 'life': 'life', 'machine_tag': 'machine-tag', 'plan_info': 'plan-info', 'volume_tag': 'volume-tag'}
     _toPy = {'block-device': 'block_device', 'life': 'life', 'machine-tag': 'machine_tag', 'plan-info': 'plan_info', 'volume-tag': 'volume_tag'}
     def __init__(self, block_device=None, life=None, machine_tag=None, plan_info=None, volume_tag=None, **unknown_fields):
@@ -10756,15 +23797,36 @@ class VolumeAttachmentPlan(Type):
         plan_info : VolumeAttachmentPlanInfo
         volume_tag : str
         '''
-        self.block_device = BlockDevice.from_json(block_device) if block_device else None
+        self._raw_block_device = block_device
         self.life = life
         self.machine_tag = machine_tag
-        self.plan_info = VolumeAttachmentPlanInfo.from_json(plan_info) if plan_info else None
+        self._raw_plan_info = plan_info
         self.volume_tag = volume_tag
+        self.unknown_fields = unknown_fields
+
+    block_device = LazyField('block_device', lambda data: BlockDevice.from_json(data) if data else None)
+    plan_info = LazyField('plan_info', lambda data: VolumeAttachmentPlanInfo.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_block_device = data.get('block-device')
+        self.life = data.get('life')
+        self.machine_tag = data.get('machine-tag')
+        self._raw_plan_info = data.get('plan-info')
+        self.volume_tag = data.get('volume-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'block-device': self._raw_block_device, 'life': self.life, 'machine-tag': self.machine_tag, 'plan-info': self._raw_plan_info, 'volume-tag': self.volume_tag}
 
 
 
 class VolumeAttachmentPlanInfo(Type):
+    __slots__ = ('device_attributes', 'device_type', 'unknown_fields')
     _toSchema = {'device_attributes': 'device-attributes', 'device_type': 'device-type'}
     _toPy = {'device-attributes': 'device_attributes', 'device-type': 'device_type'}
     def __init__(self, device_attributes=None, device_type=None, **unknown_fields):
@@ -10774,10 +23836,25 @@ class VolumeAttachmentPlanInfo(Type):
         '''
         self.device_attributes = device_attributes
         self.device_type = device_type
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.device_attributes = data.get('device-attributes')
+        self.device_type = data.get('device-type')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'device-attributes': self.device_attributes, 'device-type': self.device_type}
 
 
 
 class VolumeAttachmentPlanResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -10785,34 +23862,84 @@ class VolumeAttachmentPlanResult(Type):
         error : Error
         result : VolumeAttachmentPlan
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = VolumeAttachmentPlan.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: VolumeAttachmentPlan.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class VolumeAttachmentPlanResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeAttachmentPlanResult]
         '''
-        self.results = [VolumeAttachmentPlanResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [VolumeAttachmentPlanResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class VolumeAttachmentPlans(Type):
+    __slots__ = ('_raw_volume_plans', '_volume_plans', 'unknown_fields')
     _toSchema = {'volume_plans': 'volume-plans'}
     _toPy = {'volume-plans': 'volume_plans'}
     def __init__(self, volume_plans=None, **unknown_fields):
         '''
         volume_plans : typing.Sequence[~VolumeAttachmentPlan]
         '''
-        self.volume_plans = [VolumeAttachmentPlan.from_json(o) for o in volume_plans or []]
+        self._raw_volume_plans = volume_plans
+        self.unknown_fields = unknown_fields
+
+    volume_plans = LazyField('volume_plans', lambda data: [VolumeAttachmentPlan.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_volume_plans = data.get('volume-plans')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'volume-plans': self._raw_volume_plans}
 
 
 
 class VolumeAttachmentResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -10820,34 +23947,84 @@ class VolumeAttachmentResult(Type):
         error : Error
         result : VolumeAttachment
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = VolumeAttachment.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: VolumeAttachment.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class VolumeAttachmentResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeAttachmentResult]
         '''
-        self.results = [VolumeAttachmentResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [VolumeAttachmentResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class VolumeAttachments(Type):
+    __slots__ = ('_raw_volume_attachments', '_volume_attachments', 'unknown_fields')
     _toSchema = {'volume_attachments': 'volume-attachments'}
     _toPy = {'volume-attachments': 'volume_attachments'}
     def __init__(self, volume_attachments=None, **unknown_fields):
         '''
         volume_attachments : typing.Sequence[~VolumeAttachment]
         '''
-        self.volume_attachments = [VolumeAttachment.from_json(o) for o in volume_attachments or []]
+        self._raw_volume_attachments = volume_attachments
+        self.unknown_fields = unknown_fields
+
+    volume_attachments = LazyField('volume_attachments', lambda data: [VolumeAttachment.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_volume_attachments = data.get('volume-attachments')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'volume-attachments': self._raw_volume_attachments}
 
 
 
 class VolumeDetails(Type):
+    __slots__ = ('_info', '_raw_info', '_raw_status', '_raw_storage', '_status', '_storage', 'machine_attachments', 'unknown_fields', 'volume_tag')
     _toSchema = {'info': 'info', 'machine_attachments': 'machine-attachments', 'status': 'status', 'storage': 'storage', 'volume_tag': 'volume-tag'}
     _toPy = {'info': 'info', 'machine-attachments': 'machine_attachments', 'status': 'status', 'storage': 'storage', 'volume-tag': 'volume_tag'}
     def __init__(self, info=None, machine_attachments=None, status=None, storage=None, volume_tag=None, **unknown_fields):
@@ -10858,15 +24035,37 @@ class VolumeDetails(Type):
         storage : StorageDetails
         volume_tag : str
         '''
-        self.info = VolumeInfo.from_json(info) if info else None
+        self._raw_info = info
         self.machine_attachments = machine_attachments
-        self.status = EntityStatus.from_json(status) if status else None
-        self.storage = StorageDetails.from_json(storage) if storage else None
+        self._raw_status = status
+        self._raw_storage = storage
         self.volume_tag = volume_tag
+        self.unknown_fields = unknown_fields
+
+    info = LazyField('info', lambda data: VolumeInfo.from_json(data) if data else None)
+    status = LazyField('status', lambda data: EntityStatus.from_json(data) if data else None)
+    storage = LazyField('storage', lambda data: StorageDetails.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_info = data.get('info')
+        self.machine_attachments = data.get('machine-attachments')
+        self._raw_status = data.get('status')
+        self._raw_storage = data.get('storage')
+        self.volume_tag = data.get('volume-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'info': self._raw_info, 'machine-attachments': self.machine_attachments, 'status': self._raw_status, 'storage': self._raw_storage, 'volume-tag': self.volume_tag}
 
 
 
 class VolumeDetailsListResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -10874,23 +24073,57 @@ class VolumeDetailsListResult(Type):
         error : Error
         result : typing.Sequence[~VolumeDetails]
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = [VolumeDetails.from_json(o) for o in result or []]
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: [VolumeDetails.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class VolumeDetailsListResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeDetailsListResult]
         '''
-        self.results = [VolumeDetailsListResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [VolumeDetailsListResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class VolumeFilter(Type):
+    __slots__ = ('machines', 'unknown_fields')
     _toSchema = {'machines': 'machines'}
     _toPy = {'machines': 'machines'}
     def __init__(self, machines=None, **unknown_fields):
@@ -10898,21 +24131,51 @@ class VolumeFilter(Type):
         machines : typing.Sequence[str]
         '''
         self.machines = machines
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.machines = data.get('machines')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'machines': self.machines}
 
 
 
 class VolumeFilters(Type):
+    __slots__ = ('_filters', '_raw_filters', 'unknown_fields')
     _toSchema = {'filters': 'filters'}
     _toPy = {'filters': 'filters'}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~VolumeFilter]
         '''
-        self.filters = [VolumeFilter.from_json(o) for o in filters or []]
+        self._raw_filters = filters
+        self.unknown_fields = unknown_fields
+
+    filters = LazyField('filters', lambda data: [VolumeFilter.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_filters = data.get('filters')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'filters': self._raw_filters}
 
 
 
 class VolumeInfo(Type):
+    __slots__ = ('hardware_id', 'persistent', 'size', 'unknown_fields', 'volume_id')
     _toSchema = {'hardware_id': 'hardware-id', 'persistent': 'persistent', 'size': 'size', 'volume_id': 'volume-id'}
     _toPy = {'hardware-id': 'hardware_id', 'persistent': 'persistent', 'size': 'size', 'volume-id': 'volume_id'}
     def __init__(self, hardware_id=None, persistent=None, size=None, volume_id=None, **unknown_fields):
@@ -10926,10 +24189,27 @@ class VolumeInfo(Type):
         self.persistent = persistent
         self.size = size
         self.volume_id = volume_id
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.hardware_id = data.get('hardware-id')
+        self.persistent = data.get('persistent')
+        self.size = data.get('size')
+        self.volume_id = data.get('volume-id')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'hardware-id': self.hardware_id, 'persistent': self.persistent, 'size': self.size, 'volume-id': self.volume_id}
 
 
 
 class VolumeParams(Type):
+    __slots__ = ('_attachment', '_raw_attachment', 'attributes', 'provider', 'size', 'tags', 'unknown_fields', 'volume_tag')
     _toSchema = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'tags': 'tags', 'volume_tag': 'volume-tag'}
     _toPy = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'tags': 'tags', 'volume-tag': 'volume_tag'}
     def __init__(self, attachment=None, attributes=None, provider=None, size=None, tags=None, volume_tag=None, **unknown_fields):
@@ -10941,16 +24221,37 @@ class VolumeParams(Type):
         tags : typing.Mapping[str, str]
         volume_tag : str
         '''
-        self.attachment = VolumeAttachmentParams.from_json(attachment) if attachment else None
+        self._raw_attachment = attachment
         self.attributes = attributes
         self.provider = provider
         self.size = size
         self.tags = tags
         self.volume_tag = volume_tag
+        self.unknown_fields = unknown_fields
+
+    attachment = LazyField('attachment', lambda data: VolumeAttachmentParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_attachment = data.get('attachment')
+        self.attributes = data.get('attributes')
+        self.provider = data.get('provider')
+        self.size = data.get('size')
+        self.tags = data.get('tags')
+        self.volume_tag = data.get('volume-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'attachment': self._raw_attachment, 'attributes': self.attributes, 'provider': self.provider, 'size': self.size, 'tags': self.tags, 'volume-tag': self.volume_tag}
 
 
 
 class VolumeParamsResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -10958,23 +24259,57 @@ class VolumeParamsResult(Type):
         error : Error
         result : VolumeParams
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = VolumeParams.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: VolumeParams.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class VolumeParamsResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeParamsResult]
         '''
-        self.results = [VolumeParamsResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [VolumeParamsResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class VolumeResult(Type):
+    __slots__ = ('_error', '_raw_error', '_raw_result', '_result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
     def __init__(self, error=None, result=None, **unknown_fields):
@@ -10982,34 +24317,84 @@ class VolumeResult(Type):
         error : Error
         result : Volume
         '''
-        self.error = Error.from_json(error) if error else None
-        self.result = Volume.from_json(result) if result else None
+        self._raw_error = error
+        self._raw_result = result
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+    result = LazyField('result', lambda data: Volume.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_error = data.get('error')
+        self._raw_result = data.get('result')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'error': self._raw_error, 'result': self._raw_result}
 
 
 
 class VolumeResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeResult]
         '''
-        self.results = [VolumeResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [VolumeResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
 
 class Volumes(Type):
+    __slots__ = ('_raw_volumes', '_volumes', 'unknown_fields')
     _toSchema = {'volumes': 'volumes'}
     _toPy = {'volumes': 'volumes'}
     def __init__(self, volumes=None, **unknown_fields):
         '''
         volumes : typing.Sequence[~Volume]
         '''
-        self.volumes = [Volume.from_json(o) for o in volumes or []]
+        self._raw_volumes = volumes
+        self.unknown_fields = unknown_fields
+
+    volumes = LazyField('volumes', lambda data: [Volume.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_volumes = data.get('volumes')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'volumes': self._raw_volumes}
 
 
 
 class WatchContainer(Type):
+    __slots__ = ('container_type', 'machine_tag', 'unknown_fields')
     _toSchema = {'container_type': 'container-type', 'machine_tag': 'machine-tag'}
     _toPy = {'container-type': 'container_type', 'machine-tag': 'machine_tag'}
     def __init__(self, container_type=None, machine_tag=None, **unknown_fields):
@@ -11019,21 +24404,52 @@ class WatchContainer(Type):
         '''
         self.container_type = container_type
         self.machine_tag = machine_tag
+        self.unknown_fields = unknown_fields
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.container_type = data.get('container-type')
+        self.machine_tag = data.get('machine-tag')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'container-type': self.container_type, 'machine-tag': self.machine_tag}
 
 
 
 class WatchContainers(Type):
+    __slots__ = ('_params', '_raw_params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~WatchContainer]
         '''
-        self.params = [WatchContainer.from_json(o) for o in params or []]
+        self._raw_params = params
+        self.unknown_fields = unknown_fields
+
+    params = LazyField('params', lambda data: [WatchContainer.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_params = data.get('params')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'params': self._raw_params}
 
 
 
 class ZoneResult(Type):
+    __slots__ = ('_error', '_raw_error', 'available', 'name', 'unknown_fields')
     _toSchema = {'available': 'available', 'error': 'error', 'name': 'name'}
     _toPy = {'available': 'available', 'error': 'error', 'name': 'name'}
     def __init__(self, available=None, error=None, name=None, **unknown_fields):
@@ -11043,18 +24459,51 @@ class ZoneResult(Type):
         name : str
         '''
         self.available = available
-        self.error = Error.from_json(error) if error else None
+        self._raw_error = error
         self.name = name
+        self.unknown_fields = unknown_fields
+
+    error = LazyField('error', lambda data: Error.from_json(data) if data else None)
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self.available = data.get('available')
+        self._raw_error = data.get('error')
+        self.name = data.get('name')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'available': self.available, 'error': self._raw_error, 'name': self.name}
 
 
 
 class ZoneResults(Type):
+    __slots__ = ('_raw_results', '_results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ZoneResult]
         '''
-        self.results = [ZoneResult.from_json(o) for o in results or []]
+        self._raw_results = results
+        self.unknown_fields = unknown_fields
+
+    results = LazyField('results', lambda data: [ZoneResult.from_json(o) for o in data or []])
+
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)
+        self._raw_results = data.get('results')
+        self.unknown_fields = {}
+        return self
+
+    def serialize(self):
+        return {'results': self._raw_results}
 
 
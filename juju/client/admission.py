@@ -0,0 +1,162 @@
+'''Admission control for the RPCs sent on a Connection.
+
+An Admission bounds the number of calls in flight and the rate at which
+they are sent, and decides who goes first when calls have to wait. It
+can be shared by several connections (see ``Connection.connect_params``)
+to put them all under the same budget.
+
+Each call falls into one of three priority classes:
+
+CONTROL
+    Pings and logins. These are never held back, so that a burst of
+    other calls can't make the controller time the connection out.
+WATCHER
+    Watcher calls, such as AllWatcher.Next. They are long polls, so they
+    don't count against the in-flight limit, but they need a token from
+    the rate limiter, and get it before any bulk call.
+BULK
+    Everything else.
+'''
+import asyncio
+import heapq
+import itertools
+import math
+from concurrent.futures import CancelledError
+
+CONTROL, WATCHER, BULK = 0, 1, 2
+PRIORITY_NAMES = {CONTROL: 'control', WATCHER: 'watcher', BULK: 'bulk'}
+
+
+def classify(msg):
+    '''Return the priority class of the given RPC message.'''
+    if msg['type'] in ('Admin', 'Pinger'):
+        return CONTROL
+    if msg['type'].endswith('Watcher') or msg['request'].startswith('Watch'):
+        return WATCHER
+    return BULK
+
+
+class Admission:
+    '''Limits on the calls made on one or more connections.
+
+    Calls that can't go at once are queued, highest priority first and
+    then in order of arrival. The time they spend queued is recorded in
+    ``stats``, by priority class name.
+    '''
+    def __init__(self, max_in_flight=None, rate=None, burst=None,
+                 classify=classify, loop=None):
+        '''
+        :param int max_in_flight: The number of bulk calls that may be
+            waiting for their reply at once, or None for no limit.
+        :param float rate: The number of calls per second to allow on
+            average, or None for no limit.
+        :param int burst: The number of calls that may be sent at once
+            after a quiet spell, when rate is given. Defaults to one
+            second's worth, rounded up.
+        :param classify: A function returning the priority class of an
+            RPC message.
+        :param loop: The event loop. Defaults to the current one.
+        '''
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError('max_in_flight must be at least 1')
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be positive')
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        if burst is None and rate is not None:
+            burst = max(1, math.ceil(rate))
+        self.burst = burst
+        self.classify = classify
+        self.loop = loop or asyncio.get_event_loop()
+        self.in_flight = 0
+        self.stats = {name: {'admitted': 0, 'queued': 0, 'delay': 0.0,
+                             'max_delay': 0.0}
+                      for name in PRIORITY_NAMES.values()}
+        self._tokens = burst
+        self._refilled = self.loop.time()
+        self._waiters = []
+        self._order = itertools.count()
+        self._wakeup = None
+
+    @property
+    def queued(self):
+        '''The number of calls waiting to be admitted.'''
+        return sum(1 for w in self._waiters if not w[2].done())
+
+    async def acquire(self, msg):
+        '''Wait until the given RPC message may be sent, and return its
+        priority class, to be passed to :meth:`release` once the reply
+        is in.
+        '''
+        priority = self.classify(msg)
+        if priority == CONTROL or (not self._waiters and
+                                   self._admit(priority)):
+            self._record(priority, 0.0, queued=False)
+            return priority
+        start = self.loop.time()
+        future = self.loop.create_future()
+        heapq.heappush(self._waiters,
+                       (priority, next(self._order), future))
+        self._wake()
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                # admitted just as the caller was cancelled
+                self.release(priority)
+            raise
+        self._record(priority, self.loop.time() - start, queued=True)
+        return priority
+
+    def release(self, priority):
+        '''Record that a call admitted by :meth:`acquire` is over.'''
+        if priority == BULK and self.max_in_flight is not None:
+            self.in_flight -= 1
+            self._wake()
+
+    def _record(self, priority, delay, queued):
+        stats = self.stats[PRIORITY_NAMES[priority]]
+        stats['admitted'] += 1
+        if queued:
+            stats['queued'] += 1
+            stats['delay'] += delay
+            stats['max_delay'] = max(stats['max_delay'], delay)
+
+    def _admit(self, priority):
+        '''Take what a call of the given priority needs to go, if it is
+        available, and report whether it was.
+        '''
+        counted = priority == BULK and self.max_in_flight is not None
+        if counted and self.in_flight >= self.max_in_flight:
+            return False
+        if self.rate is not None:
+            now = self.loop.time()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._refilled) * self.rate)
+            self._refilled = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        if counted:
+            self.in_flight += 1
+        return True
+
+    def _wake(self):
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._admit(priority):
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        if (self._waiters and self.rate is not None and
+                self._tokens < 1 and self._wakeup is None):
+            delay = (1 - self._tokens) / self.rate
+            self._wakeup = self.loop.call_later(delay, self._rewake)
+
+    def _rewake(self):
+        self._wakeup = None
+        self._wake()
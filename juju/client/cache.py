@@ -0,0 +1,210 @@
+'''Caching of the replies to read-only facade calls.
+
+Calls that are marked as cacheable in CACHED_REQUESTS keep their reply
+for a while, so that asking for the same thing again doesn't need a
+round trip to the controller. A cached reply is dropped when:
+
+* its TTL runs out;
+* a request that changes what it describes is made on the same
+  connection (for example Application.Set drops Application.Get);
+* an AllWatcher delta for the entity it describes arrives (see
+  :meth:`ResponseCache.invalidate_entity`); or
+* it is dropped explicitly with :meth:`ResponseCache.invalidate`.
+'''
+import json
+from collections import OrderedDict, namedtuple
+
+from juju import tag
+
+
+def request_key(msg, encoder=None, partial=False):
+    '''Return a hashable key which is the same for identical requests,
+    whatever their request ids.
+    '''
+    return (partial, json.dumps(
+        {k: v for k, v in msg.items() if k != 'request-id'},
+        sort_keys=True, cls=encoder))
+
+
+class Cacheable(namedtuple('Cacheable', 'ttl entity scope writes')):
+    '''How the reply to a request is cached.
+
+    :param float ttl: Seconds to keep the reply for.
+    :param str entity: The AllWatcher entity type whose deltas drop the
+        reply, or None.
+    :param scope: A function returning the ids of the entities a
+        request's params refer to, or None if it covers all the
+        entities of its type.
+    :param writes: The (facade, request) pairs that drop the reply.
+    '''
+    def __new__(cls, ttl, entity=None, scope=None, writes=()):
+        return super().__new__(cls, ttl, entity, scope, frozenset(writes))
+
+
+def _application_param(params):
+    return {params['application']}
+
+
+def _application_tags(params):
+    return {tag.untag('application-', entity['tag'])
+            for entity in params['entities']}
+
+
+CACHED_REQUESTS = {
+    ('ModelConfig', 'ModelGet'): Cacheable(
+        60, 'model',
+        writes=[('ModelConfig', 'ModelSet'),
+                ('ModelConfig', 'ModelUnset')]),
+    ('Client', 'GetModelConstraints'): Cacheable(
+        60, 'model', writes=[('Client', 'SetModelConstraints')]),
+    ('Application', 'Get'): Cacheable(
+        60, 'application', _application_param,
+        writes=[('Application', 'Set'),
+                ('Application', 'SetConfigs'),
+                ('Application', 'Unset'),
+                ('Application', 'UnsetApplicationsConfig'),
+                ('Application', 'Update'),
+                ('Application', 'SetConstraints'),
+                ('Application', 'SetCharm')]),
+    ('Action', 'ApplicationsCharmsActions'): Cacheable(
+        300, 'application', _application_tags,
+        writes=[('Application', 'SetCharm')]),
+    ('Cloud', 'Clouds'): Cacheable(300),
+}
+"""The requests whose replies are cached, keyed by (facade, request)."""
+
+
+_Entry = namedtuple('_Entry', 'request expires reply entity ids')
+
+
+class ResponseCache:
+    '''Cache of the replies to the requests made on a Connection.
+
+    Replies are kept JSON encoded, so that each hit returns a new copy
+    that the caller is free to change, and so that the memory they use
+    is easy to account for.
+    '''
+    def __init__(self, loop, requests=None, max_entries=1024):
+        '''
+        :param loop: The event loop, whose clock is used for TTLs.
+        :param dict requests: The requests to cache, in the same form as
+            CACHED_REQUESTS, which is used if this is None.
+        :param int max_entries: The number of replies to keep at most;
+            expired replies are dropped first, then the least recently
+            used.
+        '''
+        self.loop = loop
+        if requests is None:
+            requests = CACHED_REQUESTS
+        self.requests = requests
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'misses': 0, 'invalidated': 0}
+        self._entries = OrderedDict()
+        self._writes = {}
+        self._entities = set()
+        for request, cacheable in requests.items():
+            self._entities.add(cacheable.entity)
+            for write in cacheable.writes:
+                self._writes.setdefault(write, set()).add(request)
+        # Bumped by every invalidation, so that a reply to a request
+        # which was in flight at the time isn't stored.
+        self._generation = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self):
+        '''The fraction of cacheable calls that were answered from the
+        cache.
+        '''
+        calls = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / calls if calls else 0.0
+
+    @property
+    def size(self):
+        '''The number of characters of JSON held by the cache.'''
+        return sum(len(entry.reply) for entry in self._entries.values())
+
+    async def call(self, msg, encoder, partial, rpc):
+        '''Answer a request from the cache if possible, and make it with
+        ``await rpc(msg, encoder, partial)`` otherwise.
+        '''
+        request = (msg['type'], msg['request'])
+        if request in self._writes:
+            self._invalidate_requests(self._writes[request])
+            try:
+                return await rpc(msg, encoder, partial)
+            finally:
+                # Drop anything read while the write was in flight, too.
+                self._invalidate_requests(self._writes[request])
+
+        cacheable = self.requests.get(request)
+        if cacheable is None:
+            return await rpc(msg, encoder, partial)
+
+        key = request_key(msg, encoder, partial)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires > self.loop.time():
+                self.stats['hits'] += 1
+                self._entries.move_to_end(key)
+                return json.loads(entry.reply)
+            del self._entries[key]
+        self.stats['misses'] += 1
+
+        generation = self._generation
+        result = await rpc(msg, encoder, partial)
+        if generation == self._generation:
+            ids = None
+            if cacheable.scope is not None:
+                ids = cacheable.scope(msg['params'])
+            self._entries[key] = _Entry(
+                request, self.loop.time() + cacheable.ttl,
+                json.dumps(result), cacheable.entity, ids)
+            self._evict()
+        return result
+
+    def invalidate(self, facade=None, request=None):
+        '''Drop the cached replies to the given request, to all the
+        requests of the given facade, or to everything.
+        '''
+        self._drop(lambda entry: (
+            (facade is None or entry.request[0] == facade) and
+            (request is None or entry.request[1] == request)))
+
+    def invalidate_entity(self, entity, entity_id=None):
+        '''Drop the cached replies that describe the given entity, or
+        all the entities of the given type.
+
+        :param str entity: An AllWatcher entity type, e.g. 'application'.
+        :param str entity_id: The id of the entity, as returned by
+            the get_id method of its delta.
+        '''
+        if entity not in self._entities:
+            return
+        self._drop(lambda entry: (
+            entry.entity == entity and
+            (entity_id is None or entry.ids is None or
+             entity_id in entry.ids)))
+
+    def _invalidate_requests(self, requests):
+        self._drop(lambda entry: entry.request in requests)
+
+    def _drop(self, predicate):
+        self._generation += 1
+        for key, entry in list(self._entries.items()):
+            if predicate(entry):
+                del self._entries[key]
+                self.stats['invalidated'] += 1
+
+    def _evict(self):
+        if len(self._entries) <= self.max_entries:
+            return
+        now = self.loop.time()
+        for key, entry in list(self._entries.items()):
+            if entry.expires <= now:
+                del self._entries[key]
+        # then the least recently used
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
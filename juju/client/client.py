@@ -16,9 +16,10 @@ for o in overrides.__all__:
             "Cannot override a versioned Facade class -- you must patch "
             "it instead.")
 
-for o in overrides.__patches__:
-    # Patch a versioned Facade.
-    for client_version in _client.CLIENTS.values():
+
+def _patch(client_version):
+    # Patch the versioned Facades of a _client<version> module.
+    for o in overrides.__patches__:
         try:
             c_type = getattr(client_version, o)
         except AttributeError:
@@ -30,4 +31,9 @@ for o in overrides.__patches__:
             if not a.startswith('_'):
                 setattr(c_type, a, getattr(o_type, a))
 
+
+# The versioned modules are only imported when first used, so patch them
+# as they are.
+_client.CLIENTS.on_load(_patch)
+
 from ._client import *  # noqa, isort:skip
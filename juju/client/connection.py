@@ -2,7 +2,7 @@ import asyncio
 import base64
 import json
 import logging
-import ssl
+import re
 import urllib.request
 import weakref
 from concurrent.futures import CancelledError
@@ -12,11 +12,27 @@ import macaroonbakery.httpbakery as httpbakery
 import macaroonbakery.bakery as bakery
 import websockets
 from juju import errors, tag, utils
-from juju.client import client
+from juju.client import client, tls
+from juju.client.cache import ResponseCache, request_key
+from juju.client.httpclient import HTTPClient
 from juju.utils import IdQueue
 
 log = logging.getLogger('juju.client.connection')
 
+# Replies from the API start with their request id, which lets the
+# receiver route a frame to a raw RPC without decoding the whole of it.
+_REQUEST_ID = re.compile(r'\s*\{\s*"request-id"\s*:\s*(\d+)\s*[,}]')
+
+
+def _frame_too_big(e):
+    """Report whether a ConnectionClosed error was caused by a frame bigger
+    than the connection's max_size.
+    """
+    # websockets fails the connection without waiting for the close code
+    # 1009 to be echoed, so the code is usually 1006.
+    return (e.code == 1009 or
+            isinstance(e.__cause__, websockets.exceptions.PayloadTooBig))
+
 
 class Monitor:
     """
@@ -93,6 +109,39 @@ class Connection:
     MAX_FRAME_SIZE = 2**22
     "Maximum size for a single frame.  Defaults to 4MB."
 
+    MAX_FRAME_SIZE_LIMIT = 2**28
+    """When the controller sends a frame bigger than max_frame_size, the
+    connection doubles max_frame_size, up to this, and reconnects.
+    """
+
+    RAW_DECODE_SIZE = 2**16
+    """Replies to raw RPCs up to this size are decoded anyway, unless the
+    RPC gives a size of its own.
+    """
+
+    READ_ONLY_REQUESTS = frozenset([
+        ('Application', 'Get'),
+        ('Application', 'GetConfig'),
+        ('Application', 'GetConstraints'),
+        ('Client', 'FullStatus'),
+        ('Client', 'GetModelConstraints'),
+        ('Client', 'ModelInfo'),
+        ('Controller', 'AllModels'),
+        ('Controller', 'ControllerConfig'),
+        ('ModelConfig', 'ModelGet'),
+        ('ModelManager', 'ListModels'),
+        ('ModelManager', 'ModelInfo'),
+        ('Resources', 'ListResources'),
+    ])
+    """Requests without side effects, which may share a reply when
+    coalescing is enabled.
+    """
+
+    def __init__(self):
+        # The connected facades returned by TypeFactory.from_connection,
+        # by (name, version); cleared whenever the facades are rebuilt.
+        self._facade_cache = {}
+
     @classmethod
     async def connect(
             cls,
@@ -104,13 +153,28 @@ class Connection:
             bakery_client=None,
             loop=None,
             max_frame_size=None,
+            coalesce=False,
+            cache=False,
+            pinger=True,
+            admission=None,
+            rpc_timeout=None,
+            metrics=None,
+            decode_threshold=None,
+            decode_executor=None,
+            endpoint_stats=None,
+            read_replicas=0,
+            hedge_delay=None,
     ):
         """Connect to the websocket.
 
         If uuid is None, the connection will be to the controller. Otherwise it
         will be to the model.
 
-        :param str endpoint: The hostname:port of the controller to connect to.
+        :param endpoint: The hostname:port of the controller to connect to,
+            or a list of them for an HA controller. They are tried
+            concurrently, each starting shortly after the previous one,
+            and the first to accept the connection is used. Reconnects
+            try them all again.
         :param str uuid: The model UUID to connect to (None for a
             controller-only connection).
         :param str username: The username for controller-local users (or None
@@ -125,10 +189,62 @@ class Connection:
         :param asyncio.BaseEventLoop loop: The event loop to use for async
             operations.
         :param int max_frame_size: The maximum websocket frame size to allow.
+            It is raised, up to MAX_FRAME_SIZE_LIMIT, when a bigger frame
+            arrives, and calls to READ_ONLY_REQUESTS which got such a
+            reply are sent again once the connection has reopened.
+        :param bool coalesce: If True, identical calls to any of the
+            READ_ONLY_REQUESTS made while one is already in flight share
+            its reply instead of being sent again. Counts of sent and
+            coalesced requests are kept in coalesce_stats.
+        :param bool cache: If True, replies to the requests in
+            `juju.client.cache.CACHED_REQUESTS` are cached in a
+            `juju.client.cache.ResponseCache`, available as the cache
+            attribute.
+        :param bool pinger: If False, don't ping the controller to keep
+            the connection alive, leaving that to the caller (see
+            `juju.client.pool.ConnectionPool`).
+        :param juju.client.admission.Admission admission: Limits on the
+            number and rate of calls in flight, which may be shared with
+            other connections. Calls are not limited if this is None.
+        :param float rpc_timeout: The default number of seconds to wait
+            for the reply to an RPC, or None to wait for as long as it
+            takes. Calls on watcher facades, which are long polls, don't
+            have a default timeout. See `rpc`.
+        :param juju.client.metrics.MetricsSink metrics: Where to report
+            the counts, latencies and sizes of calls, see
+            `juju.client.metrics`. Nothing is measured if this is None.
+        :param int decode_threshold: Reply frames longer than this many
+            characters are decoded in decode_executor rather than on the
+            event loop, so that decoding a large FullStatus or AllWatcher
+            reply doesn't hold up everything else. All frames are decoded
+            on the event loop if this is None.
+        :param concurrent.futures.Executor decode_executor: The executor
+            to decode large frames in, or None for the loop's default
+            executor. json.loads holds the GIL, so a thread shortens the
+            stalls rather than removing them; a ProcessPoolExecutor
+            decodes elsewhere, but unpickling the result costs about as
+            much again.
+        :param juju.client.endpoints.EndpointStats endpoint_stats: If
+            given, the endpoints are tried fastest first, those which
+            failed recently last, and the time taken to connect to each is
+            recorded in it.
+        :param int read_replicas: The number of extra connections to make
+            to other endpoints of an HA controller. Calls to
+            READ_ONLY_REQUESTS are balanced between this connection and
+            those, while other calls, including the AllWatcher, stay on
+            this one. The replicas are connected in the background, and
+            calls use this connection alone until they are.
+        :param float hedge_delay: If a read-only call balanced between
+            replicas hasn't been answered after this many seconds, it is
+            sent to a second member too, and the first reply is used.
+            Counts of hedged calls and of those the second member won are
+            kept in hedge_stats.
         """
         self = cls()
-        if endpoint is None:
+        if not endpoint:
             raise ValueError('no endpoint provided')
+        if isinstance(endpoint, str):
+            endpoint = [endpoint]
         self.uuid = uuid
         if bakery_client is None:
             bakery_client = httpbakery.Client()
@@ -161,11 +277,38 @@ class Connection:
 
         self.facades = {}
         self.messages = IdQueue(loop=self.loop)
+        self._raw_requests = {}
         self.monitor = Monitor(connection=self)
         if max_frame_size is None:
             max_frame_size = self.MAX_FRAME_SIZE
         self.max_frame_size = max_frame_size
-        await self._connect_with_redirect([(endpoint, cacert)])
+        self.coalesce = coalesce
+        self.coalesce_stats = {'sent': 0, 'coalesced': 0}
+        self._in_flight = {}
+        self.cache = ResponseCache(self.loop) if cache else None
+        self.pinger = pinger
+        self.admission = admission
+        self.rpc_timeout = rpc_timeout
+        self.timeout_stats = {'timed_out': 0, 'late_replies': 0}
+        self._pending = set()
+        self.metrics = metrics
+        self._reply_sizes = {}
+        self.decode_threshold = decode_threshold
+        self.decode_executor = decode_executor
+        self._reconnect_task = None
+        self.endpoint_stats = endpoint_stats
+        self._endpoints = [(e, cacert) for e in endpoint]
+        self.read_replicas = read_replicas
+        self.hedge_delay = hedge_delay
+        self.hedge_stats = {'hedged': 0, 'won': 0}
+        self.replicas = []
+        self._read_load = {}
+        self._replicas_task = None
+        self._http_client = None
+        await self._connect_with_redirect(self._endpoints)
+        if read_replicas:
+            self._replicas_task = self.loop.create_task(
+                self._connect_replicas())
         return self
 
     @property
@@ -179,8 +322,7 @@ class Connection:
         return self.monitor.status == Monitor.CONNECTED
 
     def _get_ssl(self, cert=None):
-        return ssl.create_default_context(
-            purpose=ssl.Purpose.CLIENT_AUTH, cadata=cert)
+        return tls.context_for(cert)
 
     async def _open(self, endpoint, cacert):
         if self.uuid:
@@ -196,6 +338,12 @@ class Connection:
         ), url, endpoint, cacert)
 
     async def close(self):
+        await self._close_replicas()
+        if self._http_client is not None:
+            await self._http_client.close()
+        await self._close_websocket()
+
+    async def _close_websocket(self):
         if not self.ws:
             return
         self.monitor.close_called.set()
@@ -219,17 +367,32 @@ class Connection:
                 if self.monitor.close_called.is_set():
                     break
                 if result is not None:
-                    result = json.loads(result)
-                    await self.messages.put(result['request-id'], result)
+                    frame = result
+                    request_id = self._raw_request_id(result)
+                    if request_id is None:
+                        result = await self._decode(result)
+                        request_id = result['request-id']
+                    if (request_id not in self._pending and
+                            request_id <= self.__request_id__):
+                        # the caller timed out or was cancelled
+                        self.timeout_stats['late_replies'] += 1
+                        log.debug('connection {} <- dropped late reply to '
+                                  '{}'.format(id(self), request_id))
+                        continue
+                    if self.metrics is not None:
+                        self._reply_sizes[request_id] = len(frame)
+                    await self.messages.put(request_id, result)
         except CancelledError:
             pass
         except websockets.ConnectionClosed as e:
+            if _frame_too_big(e):
+                self._grow_frame_size()
             log.warning('Receiver: Connection closed, reconnecting')
-            await self.messages.put_all(e)
             # the reconnect has to be done as a task because the receiver will
             # be cancelled by the reconnect and we don't want the reconnect
             # to be aborted half-way through
-            self.loop.create_task(self.reconnect())
+            self._reconnect_task = self.loop.create_task(self.reconnect())
+            await self.messages.put_all(e)
             return
         except Exception as e:
             log.exception("Error in receiver")
@@ -237,6 +400,52 @@ class Connection:
             await self.messages.put_all(e)
             raise
 
+    def _grow_frame_size(self):
+        if self.max_frame_size >= self.MAX_FRAME_SIZE_LIMIT:
+            log.error('connection {}: received a frame bigger than the '
+                      'limit of {} bytes'.format(id(self),
+                                                 self.max_frame_size))
+            return
+        self.max_frame_size = min(self.max_frame_size * 2,
+                                  self.MAX_FRAME_SIZE_LIMIT)
+        log.warning('connection {}: received a frame too big, raising '
+                    'max_frame_size to {}'.format(id(self),
+                                                  self.max_frame_size))
+
+    async def _decode(self, frame):
+        """Decode a reply frame, in decode_executor if it is longer than
+        decode_threshold.
+
+        The receiver waits for each frame to be decoded before reading the
+        next one, so replies are still delivered in the order they arrive.
+
+        """
+        if self.decode_threshold is None or \
+                len(frame) <= self.decode_threshold:
+            return json.loads(frame)
+        return await self.loop.run_in_executor(
+            self.decode_executor, json.loads, frame)
+
+    def _raw_request_id(self, frame):
+        """Return the request id of the given reply frame if it is for a
+        raw RPC which should receive it undecoded, or None otherwise.
+
+        Error replies are small, so frames of up to the size given by the
+        RPC (RAW_DECODE_SIZE by default) are always decoded, to let rpc()
+        raise their errors.
+
+        """
+        if not self._raw_requests:
+            return None
+        match = _REQUEST_ID.match(frame)
+        if match is None:
+            return None
+        request_id = int(match.group(1))
+        size = self._raw_requests.get(request_id)
+        if size is None or len(frame) <= size:
+            return None
+        return request_id
+
     async def _pinger(self):
         '''
         A Controller can time us out if we are silent for too long. This
@@ -267,45 +476,249 @@ class Connection:
             log.debug('ping failed because of closed connection')
             pass
 
-    async def rpc(self, msg, encoder=None):
+    async def rpc(self, msg, encoder=None, partial=False, raw=False,
+                  timeout=None):
         '''Make an RPC to the API. The message is encoded as JSON
         using the given encoder if any.
         :param msg: Parameters for the call (will be encoded as JSON).
         :param encoder: Encoder to be used when encoding the message.
-        :return: The result of the call.
+        :param partial: If True, errors reported for individual entries
+            of a bulk call's result list are left in the result for the
+            caller to inspect, instead of being raised as a JujuError,
+            and the result list is not scanned for them.
+        :param raw: If True, return the reply as the undecoded JSON text
+            of its websocket frame, without checking it for errors. Replies
+            of up to RAW_DECODE_SIZE characters, or up to raw if it is a
+            number, are still decoded like any other, checked and returned
+            as dicts.
+        :param timeout: The number of seconds to wait for the reply,
+            including any time spent queued for admission, instead of
+            rpc_timeout. A reply that arrives after that is dropped.
+            Calls on watcher facades, such as AllWatcher.Next, wait for
+            as long as it takes unless this is given.
+        :return: The result of the call. Coalesced calls share the same
+            result, which must not be modified.
         :raises JujuAPIError: When there's an error returned.
+        :raises JujuTimeoutError: When the reply doesn't arrive in time.
         :raises JujuError:
         '''
-        self.__request_id__ += 1
-        msg['request-id'] = self.__request_id__
         if'params' not in msg:
             msg['params'] = {}
         if "version" not in msg:
             msg['version'] = self.facades[msg['type']]
-        outgoing = json.dumps(msg, indent=2, cls=encoder)
-        log.debug('connection {} -> {}'.format(id(self), outgoing))
-        for attempt in range(3):
-            if self.monitor.status == Monitor.DISCONNECTED:
-                # closed cleanly; shouldn't try to reconnect
-                raise websockets.exceptions.ConnectionClosed(
-                    0, 'websocket closed')
+        if timeout is None and not msg.get('type', '').endswith('Watcher'):
+            # watchers' Next calls only return when something changes
+            timeout = self.rpc_timeout
+        if timeout is None:
+            return await self._dispatch(msg, encoder, partial, raw)
+        try:
+            return await asyncio.wait_for(
+                self._dispatch(msg, encoder, partial, raw), timeout,
+                loop=self.loop)
+        except asyncio.TimeoutError:
+            self.timeout_stats['timed_out'] += 1
+            if self.metrics is not None:
+                self.metrics.inc('juju_rpc_timeouts_total', {
+                    'facade': msg['type'], 'request': msg['request']})
+            raise errors.JujuTimeoutError(
+                '{}.{} timed out after {}s'.format(
+                    msg['type'], msg['request'], timeout)) from None
+
+    async def _dispatch(self, msg, encoder, partial, raw):
+        if raw:
+            return await self._rpc(msg, encoder, partial, raw)
+        if self.cache is not None:
+            return await self.cache.call(msg, encoder, partial,
+                                         self._decoded_rpc)
+        return await self._decoded_rpc(msg, encoder, partial)
+
+    async def _decoded_rpc(self, msg, encoder, partial):
+        if (msg.get('type'), msg.get('request')) in self.READ_ONLY_REQUESTS:
+            if self.coalesce:
+                return await self._coalesced_rpc(msg, encoder, partial)
+            return await self._read_rpc(msg, encoder, partial)
+        return await self._rpc(msg, encoder, partial, False)
+
+    async def _coalesced_rpc(self, msg, encoder, partial):
+        key = request_key(msg, encoder, partial)
+        shared = self._in_flight.get(key)
+        if shared is None:
+            # The request runs in its own task so that cancelling the
+            # caller that started it doesn't fail the others. It keeps a
+            # count of the callers waiting for it.
+            task = self.loop.create_task(
+                self._read_rpc(msg, encoder, partial))
+            shared = self._in_flight[key] = [task, 0]
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self.coalesce_stats['sent'] += 1
+        else:
+            self.coalesce_stats['coalesced'] += 1
+        task = shared[0]
+        shared[1] += 1
+        try:
+            return await asyncio.shield(task, loop=self.loop)
+        finally:
+            shared[1] -= 1
+            if not shared[1] and not task.done():
+                # every caller gave up, e.g. timed out
+                task.cancel()
+
+    async def _read_rpc(self, msg, encoder, partial):
+        members = [self] + [r for r in self.replicas if r.is_open]
+        if len(members) == 1:
+            return await self._rpc(msg, encoder, partial, False)
+        members.sort(key=lambda member: self._read_load.get(member, 0))
+        tasks = [self._member_rpc(members[0], msg, encoder, partial)]
+        try:
+            if self.hedge_delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay,
+                                             loop=self.loop)
+                if not done:
+                    self.hedge_stats['hedged'] += 1
+                    tasks.append(
+                        self._member_rpc(members[1], msg, encoder, partial))
+            # Use the first reply, unless it's a failure and the other
+            # member may still answer.
+            pending = tasks
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED,
+                    loop=self.loop)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            self.hedge_stats['won'] += 1
+                        return task.result()
+                if not pending:
+                    return tasks[0].result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _member_rpc(self, member, msg, encoder, partial):
+        """Return a task sending msg through member, counted in its load
+        from now on.
+        """
+        # Each member sets its own request-id in the message.
+        msg = dict(msg)
+        if member is self:
+            task = self.loop.create_task(
+                self._rpc(msg, encoder, partial, False))
+        else:
+            task = self.loop.create_task(member.rpc(msg, encoder, partial))
+        self._read_load[member] = self._read_load.get(member, 0) + 1
+
+        def done(_):
+            self._read_load[member] -= 1
+        task.add_done_callback(done)
+        return task
+
+    async def _connect_replicas(self):
+        endpoints = [e for e, _ in self._reconnect_endpoints()[1:]]
+        if self.endpoint_stats is not None:
+            endpoints = self.endpoint_stats.rank(endpoints)
+
+        async def connect(endpoint):
+            params = self.connect_params()
+            # Replicas are only sent read-only calls, already coalesced,
+            # cached and timed by this connection.
+            params.update(endpoint=endpoint, read_replicas=0, coalesce=False,
+                          cache=False, rpc_timeout=None)
             try:
-                await self.ws.send(outgoing)
-                break
-            except websockets.ConnectionClosed:
-                if attempt == 2:
+                replica = await Connection.connect(**params)
+            except (ConnectionError, errors.JujuError) as e:
+                log.warning('connection {}: cannot connect a replica to '
+                            '{}: {}'.format(id(self), endpoint, e))
+                return
+            self.replicas.append(replica)
+            log.debug('connection {}: replica connected to {}'.format(
+                id(self), endpoint))
+
+        await asyncio.gather(*[connect(endpoint) for endpoint in
+                               endpoints[:self.read_replicas]],
+                             loop=self.loop)
+
+    async def _close_replicas(self):
+        if self._replicas_task is not None:
+            self._replicas_task.cancel()
+            await asyncio.wait([self._replicas_task], loop=self.loop)
+            self._replicas_task = None
+        replicas, self.replicas = self.replicas, []
+        await asyncio.gather(*[r.close() for r in replicas], loop=self.loop)
+
+    async def _rpc(self, msg, encoder, partial, raw):
+        if self.admission is None:
+            return await self._resend_if_too_big(msg, encoder, partial, raw)
+        priority = await self.admission.acquire(msg)
+        try:
+            return await self._resend_if_too_big(msg, encoder, partial, raw)
+        finally:
+            self.admission.release(priority)
+
+    async def _resend_if_too_big(self, msg, encoder, partial, raw):
+        while True:
+            max_frame_size = self.max_frame_size
+            try:
+                return await self._call(msg, encoder, partial, raw)
+            except websockets.ConnectionClosed as e:
+                if (not _frame_too_big(e) or
+                        self.max_frame_size == max_frame_size or
+                        (msg.get('type'), msg.get('request')) not in
+                        self.READ_ONLY_REQUESTS):
                     raise
-                log.warning('RPC: Connection closed, reconnecting')
-                # the reconnect has to be done in a separate task because,
-                # if it is triggered by the pinger, then this RPC call will
-                # be cancelled when the pinger is cancelled by the reconnect,
-                # and we don't want the reconnect to be aborted halfway through
-                await asyncio.wait([self.reconnect()], loop=self.loop)
+                # the receiver has raised max_frame_size and is reconnecting,
+                # unless another reconnect (e.g. the pinger's) got there
+                # first, in which case its task returned straight away
+                await asyncio.shield(self._reconnect_task, loop=self.loop)
+                async with self.monitor.reconnecting:
+                    pass
                 if self.monitor.status != Monitor.CONNECTED:
-                    # reconnect failed; abort and shutdown
-                    log.error('RPC: Automatic reconnect failed')
                     raise
-        result = await self._recv(msg['request-id'])
+
+    async def _call(self, msg, encoder, partial, raw):
+        if self.metrics is None:
+            return await self._exchange(msg, encoder, partial, raw)
+        labels = {'facade': msg['type'], 'request': msg['request']}
+        self.metrics.inc('juju_rpc_calls_total', labels)
+        start = self.loop.time()
+        try:
+            result = await self._exchange(msg, encoder, partial, raw,
+                                          labels)
+        except Exception as e:
+            self.metrics.inc('juju_rpc_errors_total',
+                             dict(labels, error=type(e).__name__))
+            raise
+        finally:
+            self.metrics.observe('juju_rpc_latency_seconds',
+                                 self.loop.time() - start, labels)
+        return result
+
+    async def _exchange(self, msg, encoder, partial, raw, labels=None):
+        self.__request_id__ += 1
+        msg['request-id'] = self.__request_id__
+        outgoing = json.dumps(msg, indent=2, cls=encoder)
+        log.debug('connection {} -> {}'.format(id(self), outgoing))
+        self._pending.add(msg['request-id'])
+        if raw:
+            self._raw_requests[msg['request-id']] = (
+                self.RAW_DECODE_SIZE if raw is True else raw)
+        try:
+            await self._send(outgoing, labels)
+            result = await self._recv(msg['request-id'])
+        finally:
+            self._pending.discard(msg['request-id'])
+            self._raw_requests.pop(msg['request-id'], None)
+            size = self._reply_sizes.pop(msg['request-id'], None)
+        if labels is not None:
+            self.metrics.observe('juju_rpc_request_bytes', len(outgoing),
+                                 labels)
+            if size is not None:
+                self.metrics.observe('juju_rpc_response_bytes', size,
+                                     labels)
+        if isinstance(result, str):
+            log.debug('connection {} <- raw reply to {} ({} chars)'.format(
+                id(self), msg['request-id'], len(result)))
+            return result
         log.debug('connection {} <- {}'.format(id(self), result))
 
         if not result:
@@ -320,11 +733,11 @@ class Connection:
             return result
 
         if 'results' in result['response']:
-            # Check for errors in a result list.
-            # TODO This loses the results that might have succeeded.
-            # Perhaps JujuError should return all the results including
-            # errors, or perhaps a keyword parameter to the rpc method
-            # could be added to trigger this behaviour.
+            if partial:
+                return result
+            # Check for errors in a result list. This loses the results
+            # that might have succeeded; callers that want them should
+            # pass partial=True (see Type.partial).
             err_results = []
             for res in result['response']['results']:
                 if res.get('error', {}).get('message'):
@@ -337,6 +750,31 @@ class Connection:
 
         return result
 
+    async def _send(self, outgoing, labels=None):
+        for attempt in range(3):
+            if self.monitor.status == Monitor.DISCONNECTED:
+                # closed cleanly; shouldn't try to reconnect
+                raise websockets.exceptions.ConnectionClosed(
+                    0, 'websocket closed')
+            try:
+                await self.ws.send(outgoing)
+                return
+            except websockets.ConnectionClosed:
+                if attempt == 2:
+                    raise
+                log.warning('RPC: Connection closed, reconnecting')
+                if labels is not None:
+                    self.metrics.inc('juju_rpc_send_retries_total', labels)
+                # the reconnect has to be done in a separate task because,
+                # if it is triggered by the pinger, then this RPC call will
+                # be cancelled when the pinger is cancelled by the reconnect,
+                # and we don't want the reconnect to be aborted halfway through
+                await asyncio.wait([self.reconnect()], loop=self.loop)
+                if self.monitor.status != Monitor.CONNECTED:
+                    # reconnect failed; abort and shutdown
+                    log.error('RPC: Automatic reconnect failed')
+                    raise
+
     def _http_headers(self):
         """Return dictionary of http headers necessary for making an http
         connection to the endpoint of this Connection.
@@ -356,6 +794,18 @@ class Connection:
             'Authorization': 'Basic {}'.format(token.decode())
         }
 
+    def http_client(self):
+        """Return the HTTPClient for requests to the HTTP endpoints of this
+        Connection's controller or model, which keeps its connections
+        alive for reuse until this Connection is closed.
+
+        :return juju.client.httpclient.HTTPClient:
+
+        """
+        if self._http_client is None:
+            self._http_client = HTTPClient(self)
+        return self._http_client
+
     def https_connection(self):
         """Return an https connection to this Connection's endpoint.
 
@@ -398,7 +848,7 @@ class Connection:
         the other holds a dict of the keyword args.
         """
         return {
-            'endpoint': self.endpoint,
+            'endpoint': self._endpoint_param(),
             'uuid': self.uuid,
             'username': self.username,
             'password': self.password,
@@ -406,19 +856,39 @@ class Connection:
             'bakery_client': self.bakery_client,
             'loop': self.loop,
             'max_frame_size': self.max_frame_size,
+            'coalesce': self.coalesce,
+            'cache': self.cache is not None,
+            'admission': self.admission,
+            'rpc_timeout': self.rpc_timeout,
+            'metrics': self.metrics,
+            'decode_threshold': self.decode_threshold,
+            'decode_executor': self.decode_executor,
+            'endpoint_stats': self.endpoint_stats,
+            'read_replicas': self.read_replicas,
+            'hedge_delay': self.hedge_delay,
         }
 
     async def controller(self):
         """Return a Connection to the controller at self.endpoint
         """
         return await Connection.connect(
-            self.endpoint,
+            self._endpoint_param(),
             username=self.username,
             password=self.password,
             cacert=self.cacert,
             bakery_client=self.bakery_client,
             loop=self.loop,
             max_frame_size=self.max_frame_size,
+            coalesce=self.coalesce,
+            cache=self.cache is not None,
+            admission=self.admission,
+            rpc_timeout=self.rpc_timeout,
+            metrics=self.metrics,
+            decode_threshold=self.decode_threshold,
+            decode_executor=self.decode_executor,
+            endpoint_stats=self.endpoint_stats,
+            read_replicas=self.read_replicas,
+            hedge_delay=self.hedge_delay,
         )
 
     async def reconnect(self):
@@ -428,17 +898,52 @@ class Connection:
         if monitor.reconnecting.locked() or monitor.close_called.is_set():
             return
         async with monitor.reconnecting:
-            await self.close()
-            await self._connect_with_login([(self.endpoint, self.cacert)])
+            if self.metrics is not None:
+                self.metrics.inc('juju_reconnects_total')
+            await self._close_websocket()
+            login_result = await self._connect_with_login(
+                self._reconnect_endpoints())
+            # the controller may have been upgraded in the meantime
+            self._build_facades(login_result.get('facades', {}))
+
+    def _reconnect_endpoints(self):
+        """Return the endpoints to reconnect to, the current one first."""
+        return [(self.endpoint, self.cacert)] + [
+            (endpoint, cacert) for endpoint, cacert in self._endpoints
+            if endpoint != self.endpoint]
+
+    def _endpoint_param(self):
+        """Return the endpoint argument for Connection.connect that makes
+        a new connection to the same controller.
+        """
+        endpoints = self._reconnect_endpoints()
+        if len(endpoints) == 1:
+            return self.endpoint
+        return [endpoint for endpoint, _ in endpoints]
 
     async def _connect(self, endpoints):
         if len(endpoints) == 0:
             raise errors.JujuConnectionError('no endpoints to connect to')
 
+        stats = self.endpoint_stats
+        if stats is not None:
+            cacerts = dict(endpoints)
+            endpoints = [(endpoint, cacerts[endpoint])
+                         for endpoint in stats.rank(list(cacerts))]
+
         async def _try_endpoint(endpoint, cacert, delay):
             if delay:
                 await asyncio.sleep(delay)
-            return await self._open(endpoint, cacert)
+            if stats is None:
+                return await self._open(endpoint, cacert)
+            start = self.loop.time()
+            try:
+                result = await self._open(endpoint, cacert)
+            except ConnectionError:
+                stats.record_failure(endpoint)
+                raise
+            stats.record_success(endpoint, self.loop.time() - start)
+            return result
 
         # Try all endpoints in parallel, with slight increasing delay (+100ms
         # for each subsequent endpoint); the delay allows us to prefer the
@@ -453,6 +958,8 @@ class Connection:
             except ConnectionError:
                 continue  # ignore; try another endpoint
         else:
+            if stats is not None:
+                await stats.flush(self.loop)
             raise errors.JujuConnectionError(
                 'Unable to connect to any endpoint: {}'.format(', '.join([
                     endpoint for endpoint, cacert in endpoints])))
@@ -465,6 +972,8 @@ class Connection:
         self._receiver_task.start()
         log.debug("Driver connected to juju %s", self.addr)
         self.monitor.close_called.clear()
+        if stats is not None:
+            await stats.flush(self.loop)
 
     async def _connect_with_login(self, endpoints):
         """Connect to the websocket.
@@ -510,12 +1019,15 @@ class Connection:
         try:
             login_result = await self._connect_with_login(endpoints)
         except errors.JujuRedirectException as e:
+            self._endpoints = e.endpoints
             login_result = await self._connect_with_login(e.endpoints)
         self._build_facades(login_result.get('facades', {}))
-        self._pinger_task.start()
+        if self.pinger:
+            self._pinger_task.start()
 
     def _build_facades(self, facades):
         self.facades.clear()
+        self._facade_cache.clear()
         for facade in facades:
             self.facades[facade['name']] = facade['versions'][-1]
 
@@ -27,10 +27,30 @@ class Connector:
         max_frame_size=None,
         bakery_client=None,
         jujudata=None,
+        coalesce=False,
+        cache=False,
+        admission=None,
+        rpc_timeout=None,
+        metrics=None,
+        decode_threshold=None,
+        decode_executor=None,
+        endpoint_stats=None,
+        read_replicas=0,
+        hedge_delay=None,
     ):
         '''Initialize a connector that will use the given parameters
         by default when making a new connection'''
         self.max_frame_size = max_frame_size
+        self.coalesce = coalesce
+        self.cache = cache
+        self.admission = admission
+        self.rpc_timeout = rpc_timeout
+        self.metrics = metrics
+        self.decode_threshold = decode_threshold
+        self.decode_executor = decode_executor
+        self.endpoint_stats = endpoint_stats
+        self.read_replicas = read_replicas
+        self.hedge_delay = hedge_delay
         self.loop = loop or asyncio.get_event_loop()
         self.bakery_client = bakery_client
         self._connection = None
@@ -56,6 +76,16 @@ class Connector:
         """
         kwargs.setdefault('loop', self.loop)
         kwargs.setdefault('max_frame_size', self.max_frame_size)
+        kwargs.setdefault('coalesce', self.coalesce)
+        kwargs.setdefault('cache', self.cache)
+        kwargs.setdefault('admission', self.admission)
+        kwargs.setdefault('rpc_timeout', self.rpc_timeout)
+        kwargs.setdefault('metrics', self.metrics)
+        kwargs.setdefault('decode_threshold', self.decode_threshold)
+        kwargs.setdefault('decode_executor', self.decode_executor)
+        kwargs.setdefault('endpoint_stats', self.endpoint_stats)
+        kwargs.setdefault('read_replicas', self.read_replicas)
+        kwargs.setdefault('hedge_delay', self.hedge_delay)
         kwargs.setdefault('bakery_client', self.bakery_client)
         if 'macaroons' in kwargs:
             if not kwargs['bakery_client']:
@@ -85,13 +115,13 @@ class Connector:
             raise JujuConnectionError('No current controller')
 
         controller = self.jujudata.controllers()[controller_name]
-        # TODO change Connection so we can pass all the endpoints
-        # instead of just the first.
-        endpoint = controller['api-endpoints'][0]
+        endpoints = controller['api-endpoints']
         accounts = self.jujudata.accounts().get(controller_name, {})
 
+        if self.endpoint_stats is None:
+            self.endpoint_stats = self.jujudata.endpoint_stats()
         await self.connect(
-            endpoint=endpoint,
+            endpoint=endpoints,
             uuid=None,
             username=accounts.get('user'),
             password=accounts.get('password'),
@@ -116,9 +146,7 @@ class Connector:
         if controller is None:
             raise JujuConnectionError('Controller {} not found'.format(
                 controller_name))
-        # TODO change Connection so we can pass all the endpoints
-        # instead of just the first one.
-        endpoint = controller['api-endpoints'][0]
+        endpoints = controller['api-endpoints']
         account = self.jujudata.accounts().get(controller_name, {})
         models = self.jujudata.models().get(controller_name, {}).get('models',
                                                                      {})
@@ -131,8 +159,10 @@ class Connector:
         # haven't necessarily synced with the local juju data,
         # and also remove the need for base.CleanModel to
         # subclass JujuData.
+        if self.endpoint_stats is None:
+            self.endpoint_stats = self.jujudata.endpoint_stats()
         await self.connect(
-            endpoint=endpoint,
+            endpoint=endpoints,
             uuid=models[model_name]['uuid'],
             username=account.get('user'),
             password=account.get('password'),
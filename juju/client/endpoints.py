@@ -0,0 +1,138 @@
+'''Connect latency and failure history of controller API endpoints.
+
+An HA controller has several API endpoints, and the first one listed is
+not necessarily the closest. EndpointStats keeps, for each endpoint
+that a Connection has tried, a moving average of the time taken to open
+a websocket to it and a count of the consecutive failures to do so. A
+Connection given one (see ``Connection.connect``) tries the endpoints
+it knows to be fastest first, and leaves those which failed recently
+until last.
+
+The Connector keeps its EndpointStats in the endpoint-stats.json file of
+the Juju data directory, so that they are shared between processes. Each
+process reads the file once, and a Connection writes all of its stats
+back, in an executor, after each connect; processes that connect at the
+same time overwrite each other's measurements, which only makes the next
+ranking a little less informed.
+'''
+import json
+import logging
+import os
+import tempfile
+import time
+
+log = logging.getLogger(__name__)
+
+
+class EndpointStats:
+    ALPHA = 0.3
+    "The weight of the latest latency in the moving average."
+
+    BACKOFF = 30
+    """Seconds for which an endpoint that failed once is ranked after the
+    healthy ones. This doubles with each consecutive failure, up to
+    MAX_BACKOFF.
+    """
+
+    MAX_BACKOFF = 3600
+
+    def __init__(self, path=None, clock=time.time):
+        '''
+        :param str path: The JSON file to load the stats from and save them
+            to, or None to keep them in memory only.
+        :param clock: The function giving the current time, in seconds
+            since the epoch.
+        '''
+        self.path = path
+        self.clock = clock
+        self.endpoints = {}
+        self._dirty = False
+        if path is not None:
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                self.endpoints = json.load(f)
+        except FileNotFoundError:
+            self.endpoints = {}
+        except (OSError, ValueError) as e:
+            log.warning('ignoring endpoint stats in {}: {}'.format(
+                self.path, e))
+            self.endpoints = {}
+
+    def save(self):
+        if self.path is None:
+            return
+        self._dirty = False
+        self._write(self._dumps())
+
+    async def flush(self, loop):
+        '''Save the stats if they changed since they were last saved,
+        without blocking loop on the file I/O.
+        '''
+        if self.path is None or not self._dirty:
+            return
+        self._dirty = False
+        await loop.run_in_executor(None, self._write, self._dumps())
+
+    def _dumps(self):
+        return json.dumps(self.endpoints, indent=1, sort_keys=True)
+
+    def _write(self, data):
+        # Write to a temporary file first so that other processes never
+        # read a partly written one.
+        directory = os.path.dirname(self.path)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix='.endpoint-stats')
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log.warning('cannot save endpoint stats to {}: {}'.format(
+                self.path, e))
+
+    def record_success(self, endpoint, latency):
+        '''Record that a websocket to endpoint was opened in latency
+        seconds.
+        '''
+        stats = self.endpoints.setdefault(endpoint, {})
+        average = stats.get('latency')
+        if average is not None:
+            latency = self.ALPHA * latency + (1 - self.ALPHA) * average
+        stats.update(latency=latency, failures=0, last_failure=None)
+        self._dirty = True
+
+    def record_failure(self, endpoint):
+        '''Record that a websocket to endpoint could not be opened.'''
+        stats = self.endpoints.setdefault(endpoint, {})
+        stats['failures'] = stats.get('failures', 0) + 1
+        stats['last_failure'] = self.clock()
+        self._dirty = True
+
+    def is_healthy(self, endpoint):
+        '''Report whether endpoint hasn't failed recently.'''
+        stats = self.endpoints.get(endpoint, {})
+        failures = stats.get('failures', 0)
+        if not failures:
+            return True
+        backoff = min(self.BACKOFF * 2 ** (failures - 1), self.MAX_BACKOFF)
+        return self.clock() - stats['last_failure'] >= backoff
+
+    def rank(self, endpoints):
+        '''Return endpoints in the order in which to try them: healthy
+        endpoints with a known latency, fastest first, then the others
+        in the order given, then those which failed recently, least
+        recently failed first.
+        '''
+        def key(item):
+            index, endpoint = item
+            stats = self.endpoints.get(endpoint, {})
+            if not self.is_healthy(endpoint):
+                return 2, stats['last_failure'], index
+            latency = stats.get('latency')
+            if latency is None:
+                return 1, 0, index
+            return 0, latency, index
+        return [endpoint for _, endpoint in
+                sorted(enumerate(endpoints), key=key)]
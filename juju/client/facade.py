@@ -1,6 +1,9 @@
 import argparse
 import builtins
+import collections.abc
+import copy
 import functools
+import importlib
 import json
 import keyword
 import pprint
@@ -15,6 +18,8 @@ from typing import Any, Mapping, Sequence, TypeVar, Union
 from . import codegen
 
 _marker = object()
+# The packaged schemas of every facade version, one per line.
+SCHEMA_INDEX = Path(__file__).parent / '_facade_schemas.jsonl'
 
 JUJU_VERSION = re.compile(r'[0-9]+\.[0-9-]+[\.\-][0-9a-z]+(\.[0-9]+)?')
 # Workaround for https://bugs.launchpad.net/juju/+bug/1683906
@@ -43,15 +48,23 @@ HEADER = """\
 
 # Classes and helper functions that we'll write to _client.py
 LOOKUP_FACADE = '''
+_facade_classes = {}
+
+
 def lookup_facade(name, version):
     """
     Given a facade name and version, attempt to pull that facade out
     of the correct client<version>.py file.
 
     """
+    try:
+        return _facade_classes[name, version]
+    except KeyError:
+        pass
     for _version in range(int(version), 0, -1):
         try:
             facade = getattr(CLIENTS[str(_version)], name)
+            _facade_classes[name, version] = facade
             return facade
         except (KeyError, AttributeError):
             continue
@@ -71,6 +84,12 @@ class TypeFactory:
         connected instance of an API Interface matching the name of
         this class.
 
+        The instance is cached on the connection until its facades are
+        rebuilt, so repeated calls are cheap. Use partial() or raw() to
+        get a copy with different options rather than changing it.
+        Watcher facades, which keep the id of their watcher, aren't
+        cached: each call returns a new one.
+
         @param connection: initialized Connection object.
 
         """
@@ -83,9 +102,19 @@ class TypeFactory:
             raise Exception('No facade {} in facades {}'.format(facade_name,
                                                                 connection.facades))
 
+        stateful = facade_name.endswith('Watcher')
+        cache = connection._facade_cache
+        if not stateful:
+            try:
+                return cache[facade_name, version]
+            except KeyError:
+                pass
+
         c = lookup_facade(cls.__name__, version)
         c = c()
         c.connect(connection)
+        if not stateful:
+            cache[facade_name, version] = c
 
         return c
 
@@ -93,9 +122,9 @@ class TypeFactory:
 '''
 
 CLIENT_TABLE = '''
-CLIENTS = {{
+CLIENTS = ClientModules({{
     {clients}
-}}
+}})
 
 
 '''
@@ -140,6 +169,7 @@ _types = TypeRegistry()
 _registry = KindRegistry()
 CLASSES = {}
 factories = codegen.Capture()
+facade_schemas = {}
 
 
 def booler(v):
@@ -178,14 +208,23 @@ def name_to_py(name):
     return result
 
 
+def is_generic(kind, origin):
+    """Return whether kind is the generic type origin or a subscripted
+    version of it, e.g. ``is_generic(Sequence[str], Sequence)``.
+
+    """
+    # Subscripted generics are no longer classes since Python 3.7.
+    kind = getattr(kind, '__origin__', None) or kind
+    origin = getattr(origin, '__origin__', None) or origin
+    return isinstance(kind, type) and issubclass(kind, origin)
+
+
 def strcast(kind, keep_builtins=False):
     if (kind in basic_types or
             type(kind) in basic_types) and keep_builtins is False:
         return kind.__name__
     if str(kind).startswith('~'):
         return str(kind)[1:]
-    if issubclass(kind, typing.GenericMeta):
-        return str(kind)[1:]
     return kind
 
 
@@ -205,8 +244,8 @@ class Args(list):
     def do_explode(self, kind):
         if kind in basic_types or type(kind) is typing.TypeVar:
             return False
-        if not issubclass(kind, (typing.Sequence,
-                                 typing.Mapping)):
+        if not (is_generic(kind, typing.Sequence) or
+                is_generic(kind, typing.Mapping)):
             self.clear()
             self.extend(Args(kind))
             return True
@@ -272,8 +311,61 @@ def buildTypes(schema, capture):
         # Write Factory class for _client.py
         make_factory(name)
         # Write actual class
+        slots = []
+        init = []
+        from_json = []
+        serialize = []
+        lazy_fields = []
+        for arg in args:
+            arg_name = name_to_py(arg[0])
+            arg_type = arg[1]
+            arg_type_name = strcast(arg_type)
+            # Fields holding other Types keep their JSON data and are
+            # only decoded on first access; see LazyField.
+            decode = None
+            if arg_type in basic_types:
+                pass
+            elif type(arg_type) is typing.TypeVar:
+                decode = "{}.from_json(data) if data else None".format(
+                    arg_type_name)
+            elif is_generic(arg_type, typing.Sequence):
+                value_type = (
+                    arg_type_name.__parameters__[0]
+                    if len(arg_type_name.__parameters__)
+                    else None
+                )
+                if type(value_type) is typing.TypeVar:
+                    decode = "[{}.from_json(o) for o in data or []]".format(
+                        strcast(value_type))
+            elif is_generic(arg_type, typing.Mapping):
+                value_type = (
+                    arg_type_name.__parameters__[1]
+                    if len(arg_type_name.__parameters__) > 1
+                    else None
+                )
+                if type(value_type) is typing.TypeVar:
+                    decode = ("{{k: {}.from_json(v) "
+                              "for k, v in (data or dict()).items()}}".format(
+                                  strcast(value_type)))
+            attr = arg_name
+            if decode is not None:
+                attr = LazyField.PREFIX + arg_name
+                slots.append("_" + arg_name)
+                lazy_fields.append(
+                    "{}{} = LazyField('{}', lambda data: {})".format(
+                        INDENT, arg_name, arg_name, decode))
+            slots.append(attr)
+            init.append("{}self.{} = {}".format(INDENT * 2, attr, arg_name))
+            from_json.append("{}self.{} = data.get('{}')".format(
+                INDENT * 2, attr, arg[0]))
+            serialize.append("'{}': self.{}".format(arg[0], attr))
+        slots.append("unknown_fields")
+        if len(set(slots)) != len(slots):
+            raise ValueError("Clashing slots for {}: {}".format(name, slots))
+
         source = ["""
 class {}(Type):
+    __slots__ = {}
     _toSchema = {}
     _toPy = {}
     def __init__(self{}{}, **unknown_fields):
@@ -281,70 +373,35 @@ class {}(Type):
 {}
         '''""".format(
             name,
+            tuple(sorted(slots)),
             # pprint these to get stable ordering across regens
             pprint.pformat(args.PyToSchemaMapping(), width=999),
             pprint.pformat(args.SchemaToPyMapping(), width=999),
             ", " if args else "",
             args.as_kwargs(),
             textwrap.indent(args.get_doc(), INDENT * 2))]
+        source.extend(init)
+        source.append("{}self.unknown_fields = unknown_fields".format(
+            INDENT * 2))
+        if lazy_fields:
+            source.append("")
+            source.extend(lazy_fields)
+        # Specialised versions of Type.from_json and Type.serialize, which
+        # avoid looping over _toPy and _toSchema for every object. Data
+        # with keys other than the schema ones, such as unknown fields or
+        # the Python names of fields, take the generic path.
+        source.append("""
+    @classmethod
+    def from_json(cls, data):
+        if type(data) is not dict or not data.keys() <= cls._toPy.keys():
+            return super().from_json(data)
+        self = cls.__new__(cls)""")
+        source.extend(from_json)
+        source.append("""        self.unknown_fields = {{}}
+        return self
 
-        if not args:
-            source.append("{}pass".format(INDENT * 2))
-        else:
-            for arg in args:
-                arg_name = name_to_py(arg[0])
-                arg_type = arg[1]
-                arg_type_name = strcast(arg_type)
-                if arg_type in basic_types:
-                    source.append("{}self.{} = {}".format(INDENT * 2,
-                                                          arg_name,
-                                                          arg_name))
-                elif type(arg_type) is typing.TypeVar:
-                    source.append("{}self.{} = {}.from_json({}) "
-                                  "if {} else None".format(INDENT * 2,
-                                                           arg_name,
-                                                           arg_type_name,
-                                                           arg_name,
-                                                           arg_name))
-                elif issubclass(arg_type, typing.Sequence):
-                    value_type = (
-                        arg_type_name.__parameters__[0]
-                        if len(arg_type_name.__parameters__)
-                        else None
-                    )
-                    if type(value_type) is typing.TypeVar:
-                        source.append(
-                            "{}self.{} = [{}.from_json(o) "
-                            "for o in {} or []]".format(INDENT * 2,
-                                                        arg_name,
-                                                        strcast(value_type),
-                                                        arg_name))
-                    else:
-                        source.append("{}self.{} = {}".format(INDENT * 2,
-                                                              arg_name,
-                                                              arg_name))
-                elif issubclass(arg_type, typing.Mapping):
-                    value_type = (
-                        arg_type_name.__parameters__[1]
-                        if len(arg_type_name.__parameters__) > 1
-                        else None
-                    )
-                    if type(value_type) is typing.TypeVar:
-                        source.append(
-                            "{}self.{} = {{k: {}.from_json(v) "
-                            "for k, v in ({} or dict()).items()}}".format(
-                                INDENT * 2,
-                                arg_name,
-                                strcast(value_type),
-                                arg_name))
-                    else:
-                        source.append("{}self.{} = {}".format(INDENT * 2,
-                                                              arg_name,
-                                                              arg_name))
-                else:
-                    source.append("{}self.{} = {}".format(INDENT * 2,
-                                                          arg_name,
-                                                          arg_name))
+    def serialize(self):
+        return {{{}}}""".format(", ".join(serialize)))
 
         source = "\n".join(source)
         capture.clear(name)
@@ -418,8 +475,15 @@ def ReturnMapping(cls):
         async def wrapper(*args, **kwargs):
             nonlocal cls
             reply = await f(*args, **kwargs)
+            raw = args and getattr(args[0], '_raw', None)
+            if raw == 'dict':
+                return reply['response']
+            if raw == 'json':
+                # small replies are decoded by the connection regardless
+                return reply if isinstance(reply, str) else json.dumps(reply)
+            partial = args and getattr(args[0], '_partial', False)
             if cls is None:
-                return reply
+                return _partial_results(reply) if partial else reply
             if 'error' in reply:
                 cls = CLASSES['Error']
             if issubclass(cls, typing.Sequence):
@@ -436,12 +500,73 @@ def ReturnMapping(cls):
                     """
             else:
                 result = cls.from_json(reply['response'])
+                if partial:
+                    result = _partial_results(result)
 
             return result
         return wrapper
     return decorator
 
 
+def _partial_results(reply):
+    if isinstance(reply, dict):
+        results = reply.get('response', {}).get('results')
+    else:
+        results = getattr(reply, 'results', None)
+    if isinstance(results, list):
+        return PartialResults(results, reply)
+    return reply
+
+
+class PartialResults:
+    """
+    The reply to a bulk call made through a facade returned by
+    :meth:`Type.partial`.
+
+    ``response`` is the reply, decoded if the call has a return type,
+    and ``results`` its list of entries, in the same order as the
+    request. ``succeeded`` maps the index of each entry that succeeded to
+    the entry, and ``errors`` maps the index of each entry that failed to
+    its ``Error``.
+
+    """
+    def __init__(self, results, response):
+        from ._definitions import Error
+
+        self.response = response
+        self.results = results
+        self.succeeded = {}
+        self.errors = {}
+        for i, result in enumerate(results):
+            if isinstance(result, dict):
+                error = result.get('error')
+                error = Error.from_json(error) if error else None
+            else:
+                error = getattr(result, 'error', None)
+            if error is not None and error.message:
+                self.errors[i] = error
+            else:
+                self.succeeded[i] = result
+
+    def __len__(self):
+        return len(self.results)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def raise_for_errors(self):
+        """
+        Raise a JujuError with the message of every failed entry, as the
+        call would have done if it hadn't been made with
+        :meth:`Type.partial`.
+
+        """
+        if self.errors:
+            from ..errors import JujuError
+            raise JujuError([error.message
+                             for _, error in sorted(self.errors.items())])
+
+
 def makeFunc(cls, name, params, result, _async=True):
     INDENT = "    "
     args = Args(params)
@@ -452,7 +577,8 @@ def makeFunc(cls, name, params, result, _async=True):
                                                            toschema[arg],
                                                            arg))
     assignments = "\n".join(assignments)
-    res = retspec(result)
+    # Python 3.7 renamed _ForwardRef; keep the docstrings stable.
+    res = re.sub(r'(?<!_)ForwardRef\(', '_ForwardRef(', str(retspec(result)))
     source = """
 
 @ReturnMapping({rettype})
@@ -523,13 +649,76 @@ def buildFacade(schema):
 class {name}Facade(Type):
     name = '{name}'
     version = {version}
-    schema = {schema}
+    schema = FacadeSchema()
     """.format(name=schema.name,
-               version=schema.version,
-               schema=textwrap.indent(pprint.pformat(schema), "    "))
+               version=schema.version)
     return cls, source
 
 
+class FacadeSchema:
+    """
+    Descriptor for the schema of a generated facade class.
+
+    The schemas are only needed to generate the facades, so rather than
+    being kept in memory they are written to SCHEMA_INDEX, one per line,
+    and a facade's schema is only read from there when first accessed.
+
+    """
+    def __get__(self, obj, cls):
+        prefix = '{} {}\t'.format(cls.name, cls.version)
+        with SCHEMA_INDEX.open(encoding='utf-8') as f:
+            for line in f:
+                if line.startswith(prefix):
+                    schema = json.loads(line[len(prefix):])
+                    break
+            else:
+                raise AttributeError('No schema for {} version {}'.format(
+                    cls.name, cls.version))
+        # Replace this descriptor for later lookups.
+        cls.schema = schema
+        return schema
+
+
+class ClientModules(collections.abc.Mapping):
+    """
+    The generated _client<version> modules, by version.
+
+    Each module is only imported when it is first looked up, since between
+    them they define thousands of facade classes of which a program
+    typically uses a few.
+
+    """
+    def __init__(self, modules):
+        self._names = modules
+        self._modules = {}
+        self._hooks = []
+
+    def __getitem__(self, version):
+        module = self._modules.get(version)
+        if module is None:
+            module = importlib.import_module(self._names[version])
+            for hook in self._hooks:
+                hook(module)
+            self._modules[version] = module
+        return module
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def on_load(self, hook):
+        """
+        Call hook with each module when it is imported, and with those
+        which already have been.
+
+        """
+        self._hooks.append(hook)
+        for module in self._modules.values():
+            hook(module)
+
+
 class TypeEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, Type):
@@ -537,12 +726,105 @@ class TypeEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+class LazyField:
+    """
+    Descriptor for a field of a generated Type which holds other Types.
+
+    The JSON data of the field is stored on the instance under the field
+    name prefixed with PREFIX, and is only decoded, by calling decode with
+    it, when the field is first accessed. The decoded value is then kept
+    under the field name prefixed with an underscore, and also replaces
+    the JSON data, which Type.serialize passes on as it is.
+
+    """
+    PREFIX = '_raw_'
+
+    def __init__(self, name, decode):
+        self.name = name
+        self.raw_name = self.PREFIX + name
+        self.value_name = '_' + name
+        self.decode = decode
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.value_name)
+        except AttributeError:
+            pass
+        value = self.decode(getattr(obj, self.raw_name))
+        self.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.value_name, value)
+        setattr(obj, self.raw_name, value)
+
+
 class Type:
+    """
+    Base class for the generated facades and the types of their
+    parameters and results.
+
+    The generated types define __slots__, along with specialised versions
+    of from_json and serialize; subclasses which override __init__ must
+    also override from_json.
+
+    """
+    __slots__ = ()
+    _partial = False
+    _raw = None
+    _timeout = None
+
     def connect(self, connection):
         self.connection = connection
 
+    def partial(self):
+        """
+        Return a copy of this facade whose bulk calls don't raise when
+        some of the entries in their result list failed.
+
+        Such calls instead return a :class:`PartialResults`, giving both
+        the entries that succeeded and the errors of those that failed,
+        and the connection skips its scan of the results for errors.
+
+        """
+        facade = copy.copy(self)
+        facade._partial = True
+        return facade
+
+    def raw(self, decode=True):
+        """
+        Return a copy of this facade whose calls return their response
+        without building Type objects from it, for callers which only
+        need the plain data, e.g. to pass it on as JSON.
+
+        If decode is True, calls return the response as a plain dict.
+        Otherwise, they return the JSON text of the whole reply, with its
+        'request-id' and 'response' keys, as received from the websocket
+        and without decoding it at all.
+
+        """
+        facade = copy.copy(self)
+        facade._raw = 'dict' if decode else 'json'
+        return facade
+
+    def with_timeout(self, timeout):
+        """
+        Return a copy of this facade whose calls raise JujuTimeoutError
+        if their reply doesn't arrive within timeout seconds, instead of
+        waiting for as long as the connection's rpc_timeout says.
+
+        """
+        facade = copy.copy(self)
+        facade._timeout = timeout
+        return facade
+
     async def rpc(self, msg):
-        result = await self.connection.rpc(msg, encoder=TypeEncoder)
+        result = await self.connection.rpc(msg, encoder=TypeEncoder,
+                                           partial=self._partial,
+                                           raw=self._raw == 'json',
+                                           timeout=self._timeout)
         return result
 
     @classmethod
@@ -569,6 +851,20 @@ class Type:
             d[tgt] = getattr(self, attr)
         return d
 
+    def _asdict(self):
+        """
+        Return a dict mapping the Python name of each field to its value,
+        along with any fields the controller sent that the type doesn't
+        know about, under their own names.
+
+        The generated types have __slots__, so this replaces vars() for
+        them.
+
+        """
+        d = dict(getattr(self, 'unknown_fields', None) or {})
+        d.update((attr, getattr(self, attr)) for attr in self._toSchema)
+        return d
+
     def to_json(self):
         return json.dumps(self.serialize(), cls=TypeEncoder, sort_keys=True)
 
@@ -680,6 +976,8 @@ class Schema(dict):
 
 def _getns():
     ns = {'Type': Type,
+          'LazyField': LazyField,
+          'FacadeSchema': FacadeSchema,
           'typing': typing,
           'ReturnMapping': ReturnMapping
           }
@@ -704,7 +1002,8 @@ def write_facades(captures, options):
         filename = "{}/_client{}.py".format(options.output_dir, version)
         with open(filename, "w") as f:
             f.write(HEADER)
-            f.write("from juju.client.facade import Type, ReturnMapping\n")
+            f.write("from juju.client.facade import FacadeSchema, Type, "
+                    "ReturnMapping\n")
             f.write("from juju.client._definitions import *\n\n")
             for key in sorted(
                     [k for k in captures[version].keys() if "Facade" in k]):
@@ -724,7 +1023,7 @@ def write_definitions(captures, options, version):
     """
     with open("{}/_definitions.py".format(options.output_dir), "w") as f:
         f.write(HEADER)
-        f.write("from juju.client.facade import Type, ReturnMapping\n\n")
+        f.write("from juju.client.facade import LazyField, ReturnMapping, Type\n\n")
         for key in sorted(
                 [k for k in captures[version].keys() if "Facade" not in k]):
             print(captures[version][key], file=f)
@@ -738,17 +1037,30 @@ def write_client(captures, options):
     """
     with open("{}/_client.py".format(options.output_dir), "w") as f:
         f.write(HEADER)
-        f.write("from juju.client._definitions import *\n\n")
-        clients = ", ".join("_client{}".format(v) for v in captures)
-        f.write("from juju.client import " + clients + "\n\n")
+        f.write("from juju.client._definitions import *\n")
+        f.write("from juju.client.facade import ClientModules\n\n")
         f.write(CLIENT_TABLE.format(clients=",\n    ".join(
-            ['"{}": _client{}'.format(v, v) for v in captures])))
+            ['"{}": "juju.client._client{}"'.format(v, v)
+             for v in captures])))
         f.write(LOOKUP_FACADE)
         f.write(TYPE_FACTORY)
         for key in sorted([k for k in factories.keys() if "Facade" in k]):
             print(factories[key], file=f)
 
 
+def write_schemas(options):
+    """
+    Write the schema of every Facade to the index read by FacadeSchema.
+
+    """
+    with open("{}/{}".format(options.output_dir, SCHEMA_INDEX.name),
+              "w", encoding="utf-8") as f:
+        for name, version in sorted(facade_schemas):
+            schema = facade_schemas[name, version]
+            f.write("{} {}\t{}\n".format(name, version, json.dumps(
+                schema, sort_keys=True, separators=(",", ":"))))
+
+
 def generate_facades(options):
     captures = defaultdict(codegen.Capture)
     schemas = {}
@@ -781,6 +1093,7 @@ def generate_facades(options):
             cls_name = "{}Facade".format(schema.name)
 
             captures[schema.version].clear(cls_name)
+            facade_schemas[schema.name, schema.version] = schema
             # Make the factory class for _client.py
             make_factory(cls_name)
             # Make the actual class
@@ -812,6 +1125,7 @@ def main():
     last_version = write_facades(captures, options)
     write_definitions(captures, options, last_version)
     write_client(captures, options)
+    write_schemas(options)
 
 
 if __name__ == '__main__':
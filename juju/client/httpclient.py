@@ -0,0 +1,307 @@
+'''An asyncio HTTPS client for the HTTP endpoints of a controller.
+
+Charms are uploaded to the same host:port as the websocket API, over
+plain HTTPS. Connection.http_client returns an HTTPClient bound to the
+connection, which keeps the TLS connections it opens alive for the next
+request, streams request bodies from files without loading them into
+memory, reports upload progress and limits the number of requests in
+flight at once.
+'''
+import asyncio
+import json
+import logging
+import os
+
+from juju import errors
+
+log = logging.getLogger(__name__)
+
+
+class HTTPResponse:
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    def text(self):
+        return self.body.decode('utf-8', 'replace')
+
+    def json(self):
+        return json.loads(self.text())
+
+
+class _Stream:
+    def __init__(self, endpoint, reader, writer, loop):
+        self.endpoint = endpoint
+        self.reader = reader
+        self.writer = writer
+        self.last_used = loop.time()
+        self.requests = 0
+
+    @property
+    def is_open(self):
+        return not (self.reader.at_eof() or
+                    self.writer.transport.is_closing())
+
+    def close(self):
+        self.writer.close()
+
+
+class HTTPClient:
+    """Makes HTTPS requests to the endpoint of a Connection, with the
+    connection's credentials.
+
+    """
+    def __init__(self, connection, max_connections=4, idle_timeout=30,
+                 chunk_size=2**16):
+        """
+        :param Connection connection: The connection whose endpoint, CA
+            certificate and credentials are used. Requests follow it to
+            a new endpoint after a reconnect.
+        :param int max_connections: The number of requests in flight,
+            and of TLS connections open, at once.
+        :param float idle_timeout: Seconds after which a kept-alive TLS
+            connection is not reused.
+        :param int chunk_size: The size of the chunks request bodies are
+            sent in.
+        """
+        self.connection = connection
+        self.loop = connection.loop
+        self.idle_timeout = idle_timeout
+        self.chunk_size = chunk_size
+        self.stats = {'connections': 0, 'requests': 0, 'reused': 0}
+        self._slots = asyncio.Semaphore(max_connections, loop=self.loop)
+        self._idle = []
+
+    async def request(self, method, path, body=None, headers=None,
+                      size=None, progress=None):
+        """Make a request and return its HTTPResponse, whatever its status.
+
+        :param str method: The HTTP method, e.g. 'POST'.
+        :param str path: The path of the request, relative to the model
+            when the connection is to a model, e.g. '/charms?series=bionic'.
+        :param body: The request body: bytes, a binary file object read
+            from its current position in the loop's default executor, or
+            an iterable or asynchronous iterable of bytes chunks. A request
+            whose kept-alive connection turns out to be closed is sent
+            again on a new one only if its body is bytes, a seekable file
+            or has a rewind() coroutine method, such as
+            juju.utils.AsyncPipe.
+        :param dict headers: Extra request headers.
+        :param int size: The size of the body, if it can't be told from
+            it. The body is sent chunked if its size isn't known.
+        :param progress: A function called with the number of bytes of
+            the body sent so far and its size (or None) after each chunk.
+        :raises JujuConnectionError: If the endpoint can't be reached.
+        """
+        if self.connection.uuid:
+            path = '/model/{}{}'.format(self.connection.uuid, path)
+        if size is None:
+            size = _size(body)
+        async with self._slots:
+            stream = self._reuse()
+            position = _tell(body)
+            if stream is not None:
+                try:
+                    return await self._exchange(stream, method, path, body,
+                                                headers, size, progress)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # The server closed the idle connection. Try again on
+                    # a new one if the body can be sent again.
+                    if not await _rewind(body, position):
+                        raise
+                    log.debug('retrying %s %s on a new connection',
+                              method, path)
+            stream = await self._open()
+            return await self._exchange(stream, method, path, body, headers,
+                                        size, progress)
+
+    async def close(self):
+        """Close the kept-alive connections."""
+        idle, self._idle = self._idle, []
+        for stream in idle:
+            stream.close()
+
+    def _reuse(self):
+        now = self.loop.time()
+        endpoint = self.connection.endpoint
+        while self._idle:
+            stream = self._idle.pop()
+            if (stream.endpoint == endpoint and stream.is_open and
+                    now - stream.last_used < self.idle_timeout):
+                self.stats['reused'] += 1
+                return stream
+            stream.close()
+        return None
+
+    async def _open(self):
+        endpoint = self.connection.endpoint
+        host, port = endpoint.split(':', 1)
+        port = port.split('/', 1)[0]
+        try:
+            reader, writer = await asyncio.open_connection(
+                host, int(port), loop=self.loop,
+                ssl=self.connection._get_ssl(self.connection.cacert),
+                server_hostname=host)
+        except OSError as e:
+            raise errors.JujuConnectionError(
+                'cannot connect to {}: {}'.format(endpoint, e)) from e
+        self.stats['connections'] += 1
+        return _Stream(endpoint, reader, writer, self.loop)
+
+    async def _exchange(self, stream, method, path, body, headers, size,
+                        progress):
+        try:
+            response = await self._send_and_receive(
+                stream, method, path, body, headers, size, progress)
+        except BaseException:
+            stream.close()
+            raise
+        stream.last_used = self.loop.time()
+        if response.headers.get('connection', '').lower() == 'close' or \
+                not stream.is_open:
+            stream.close()
+        else:
+            self._idle.append(stream)
+        return response
+
+    async def _send_and_receive(self, stream, method, path, body, headers,
+                                size, progress):
+        self.stats['requests'] += 1
+        stream.requests += 1
+        request_headers = {'Host': stream.endpoint}
+        request_headers.update(self.connection._http_headers())
+        request_headers.update(headers or {})
+        if body is not None:
+            if size is None:
+                request_headers['Transfer-Encoding'] = 'chunked'
+            else:
+                request_headers['Content-Length'] = size
+        head = ['{} {} HTTP/1.1'.format(method, path)] + [
+            '{}: {}'.format(k, v) for k, v in request_headers.items()]
+        stream.writer.write(('\r\n'.join(head) + '\r\n\r\n').encode())
+        if body is not None:
+            await self._send_body(stream.writer, body, size, progress)
+        else:
+            await stream.writer.drain()
+
+        return await self._read_response(stream.reader, method)
+
+    async def _send_body(self, writer, body, size, progress):
+        chunked = size is None
+        sent = 0
+
+        async def send(chunk):
+            nonlocal sent
+            if chunked:
+                writer.write('{:x}\r\n'.format(len(chunk)).encode())
+                writer.write(chunk)
+                writer.write(b'\r\n')
+            else:
+                writer.write(chunk)
+            await writer.drain()
+            sent += len(chunk)
+            if progress is not None:
+                progress(sent, size)
+
+        if hasattr(body, '__aiter__'):
+            async for chunk in body:
+                if chunk:
+                    await send(chunk)
+        elif hasattr(body, 'read'):
+            # files are read in the loop's default executor, so that a
+            # slow disk doesn't hold up the loop
+            while True:
+                chunk = await self.loop.run_in_executor(
+                    None, body.read, self.chunk_size)
+                if not chunk:
+                    break
+                await send(chunk)
+        else:
+            for chunk in _chunks(body, self.chunk_size):
+                if chunk:
+                    await send(chunk)
+        if chunked:
+            writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    async def _read_response(self, reader, method):
+        line = await reader.readline()
+        if not line:
+            raise ConnectionResetError('connection closed by the server')
+        _, status, reason = (line.decode('latin-1').rstrip('\r\n') +
+                             ' ').split(' ', 2)
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        status = int(status)
+        if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            body = b''
+        elif headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = await _read_chunked(reader)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+        return HTTPResponse(status, reason.strip(), headers, body)
+
+
+def _size(body):
+    if body is None:
+        return None
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    try:
+        position = body.tell()
+        size = body.seek(0, os.SEEK_END) - position
+        body.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _tell(body):
+    try:
+        return body.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+async def _rewind(body, position):
+    """Prepare body to be sent again, and report whether it can be."""
+    if body is None or isinstance(body, (bytes, bytearray)):
+        return True
+    if hasattr(body, 'rewind'):
+        await body.rewind()
+        return True
+    if position is None:
+        return False
+    body.seek(position)
+    return True
+
+
+def _chunks(body, chunk_size):
+    if isinstance(body, (bytes, bytearray)):
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+    else:
+        yield from body
+
+
+async def _read_chunked(reader):
+    body = []
+    while True:
+        line = await reader.readline()
+        size = int(line.split(b';', 1)[0].strip() or b'0', 16)
+        if not size:
+            # skip any trailers
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            return b''.join(body)
+        body.append(await reader.readexactly(size))
+        await reader.readexactly(2)
@@ -0,0 +1,69 @@
+'''Incremental decoding of JSON arrays in large documents.
+
+iter_array decodes the items of an array nested in a JSON document one at
+a time, so that the items of a huge reply, such as the deltas of the
+first AllWatcher.Next of a big model, can be processed and discarded
+without building the whole document first. Only the values of the keys
+that lead to the array are decoded on the way to it.
+'''
+import json
+import re
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+def _skip(text, pos):
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _expect(text, pos, char):
+    pos = _skip(text, pos)
+    if not text.startswith(char, pos):
+        raise ValueError('expected {!r} at position {}'.format(char, pos))
+    return pos + 1
+
+
+def _member(text, pos, key):
+    '''Return the position of the value of key in the object at pos.'''
+    pos = _skip(text, _expect(text, pos, '{'))
+    if text.startswith('}', pos):
+        raise KeyError(key)
+    while True:
+        name, pos = _decoder.raw_decode(text, _skip(text, pos))
+        pos = _skip(text, _expect(text, pos, ':'))
+        if name == key:
+            return pos
+        _, pos = _decoder.raw_decode(text, pos)
+        pos = _skip(text, pos)
+        if text.startswith('}', pos):
+            raise KeyError(key)
+        pos = _expect(text, pos, ',')
+
+
+def iter_array(text, path=()):
+    '''Yield the decoded items of a JSON array.
+
+    :param str text: A JSON document.
+    :param path: The keys of the nested objects leading to the array from
+        the top of the document, e.g. ('response', 'deltas').
+    :raises KeyError: If one of the keys is missing.
+    :raises ValueError: If the document isn't valid JSON or the value
+        found isn't an array. A null value is taken as an empty array.
+    '''
+    pos = 0
+    for key in path:
+        pos = _member(text, pos, key)
+    pos = _skip(text, pos)
+    if text.startswith('null', pos):
+        return
+    pos = _skip(text, _expect(text, pos, '['))
+    if text.startswith(']', pos):
+        return
+    while True:
+        item, pos = _decoder.raw_decode(text, _skip(text, pos))
+        yield item
+        pos = _skip(text, pos)
+        if text.startswith(']', pos):
+            return
+        pos = _expect(text, pos, ',')
@@ -6,6 +6,8 @@ import pathlib
 import juju.client.client as jujuclient
 import yaml
 from juju import tag
+from juju.charmcache import CharmCache
+from juju.client.endpoints import EndpointStats
 from juju.client.gocookies import GoCookieJar
 from juju.errors import JujuError
 
@@ -79,6 +81,19 @@ class JujuData:
         '''
         raise NotImplementedError()
 
+    def endpoint_stats(self):
+        '''Return the EndpointStats used to choose which of a
+        controller's API endpoints to connect to. By default they are
+        only kept in memory.
+        '''
+        return EndpointStats()
+
+    def charm_cache(self):
+        '''Return the CharmCache used to avoid archiving and uploading
+        local charms again. By default it is only kept in memory.
+        '''
+        return CharmCache()
+
     def parse_model(self, model):
         """Split the given model_name into controller and model parts.
         If the controller part is empty, the current controller will be used.
@@ -120,9 +135,15 @@ class JujuData:
 class FileJujuData(JujuData):
     '''Provide access to the Juju client configuration files.
     Any configuration file is read once and then cached.'''
-    def __init__(self):
+    def __init__(self, cache_charms=True):
+        '''
+        :param bool cache_charms: If False, the archives and uploads of
+            local charms are only remembered in memory, rather than in the
+            charm-cache directory; see charm_cache.
+        '''
         self.path = os.environ.get('JUJU_DATA') or '~/.local/share/juju'
         self.path = os.path.abspath(os.path.expanduser(self.path))
+        self.cache_charms = cache_charms
         # _loaded keeps track of the loaded YAML from
         # the Juju data files so we don't need to load the same
         # file many times.
@@ -217,3 +238,15 @@ class FileJujuData(JujuData):
         jar = GoCookieJar(str(f))
         jar.load()
         return jar
+
+    def endpoint_stats(self):
+        '''Return the EndpointStats kept in endpoint-stats.json.'''
+        return EndpointStats(os.path.join(self.path, 'endpoint-stats.json'))
+
+    def charm_cache(self):
+        '''Return the CharmCache kept in the charm-cache directory, or one
+        kept in memory if cache_charms is False.
+        '''
+        if not self.cache_charms:
+            return CharmCache()
+        return CharmCache(os.path.join(self.path, 'charm-cache'))
@@ -0,0 +1,160 @@
+'''Measurements of the work done by connections and models.
+
+A Connection given a metrics sink (see ``Connection.connect``) reports
+to it:
+
+juju_rpc_calls_total
+    Calls sent, by facade and request.
+juju_rpc_errors_total
+    Calls that failed, by facade, request and error type.
+juju_rpc_latency_seconds
+    Histogram of the time from sending a call to getting its reply.
+juju_rpc_request_bytes, juju_rpc_response_bytes
+    Histograms of the size of the calls' JSON frames.
+juju_rpc_timeouts_total
+    Calls that missed their deadline.
+juju_rpc_send_retries_total
+    Calls that had to be sent again after a reconnect.
+juju_reconnects_total
+    Reconnections.
+
+and the watcher of a Model connected with one reports:
+
+juju_watcher_batch_deltas
+    Histogram of the number of deltas in each AllWatcher batch.
+juju_observer_dispatch_seconds
+    Histogram of the time each observer callback takes to handle a
+    delta, from start to finish, by entity type.
+
+MetricsRegistry keeps them in memory, and to_prometheus formats them in
+the Prometheus text exposition format. Other sinks can forward them
+elsewhere by implementing the two methods of MetricsSink.
+'''
+import bisect
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = tuple(4 ** i for i in range(4, 14))
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class MetricsSink:
+    '''The interface that metrics are reported to. It ignores them.'''
+    def inc(self, name, labels=None, value=1):
+        '''Add value to the counter with the given name and labels.'''
+
+    def observe(self, name, value, labels=None):
+        '''Record a value in the histogram with the given name and
+        labels.
+        '''
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items())) if labels else ()
+
+
+class MetricsRegistry(MetricsSink):
+    '''A sink that keeps the counters and histograms reported to it.'''
+    def __init__(self, buckets=None):
+        '''
+        :param dict buckets: The upper bounds of the buckets of the named
+            histograms. Histograms whose names aren't given here use
+            LATENCY_BUCKETS if their name ends with _seconds,
+            SIZE_BUCKETS if it ends with _bytes and COUNT_BUCKETS
+            otherwise.
+        '''
+        self.buckets = dict(buckets or {})
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name, labels=None, value=1):
+        key = _key(name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, labels=None):
+        key = _key(name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(
+                self._buckets(name))
+        histogram.observe(value)
+
+    def counter(self, name, **labels):
+        '''Return the value of a counter, or 0 if it was never
+        incremented.
+        '''
+        return self.counters.get(_key(name, labels), 0)
+
+    def histogram(self, name, **labels):
+        '''Return a Histogram, with its counts, sum and count, or None if
+        nothing was recorded in it.
+        '''
+        return self.histograms.get(_key(name, labels))
+
+    def _buckets(self, name):
+        if name in self.buckets:
+            return tuple(self.buckets[name])
+        if name.endswith('_seconds'):
+            return LATENCY_BUCKETS
+        if name.endswith('_bytes'):
+            return SIZE_BUCKETS
+        return COUNT_BUCKETS
+
+
+def _labels(labels, extra=()):
+    labels = tuple(labels) + tuple(extra)
+    if not labels:
+        return ''
+    return '{' + ','.join(
+        '{}="{}"'.format(k, str(v).replace('\\', '\\\\')
+                         .replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in labels) + '}'
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def to_prometheus(registry):
+    '''Return the metrics of a MetricsRegistry in the Prometheus text
+    exposition format.
+    '''
+    lines = []
+    seen = set()
+    for (name, labels), value in sorted(registry.counters.items()):
+        if name not in seen:
+            seen.add(name)
+            lines.append('# TYPE {} counter'.format(name))
+        lines.append('{}{} {}'.format(name, _labels(labels), _number(value)))
+    for (name, labels), histogram in sorted(registry.histograms.items(),
+                                            key=lambda item: item[0]):
+        if name not in seen:
+            seen.add(name)
+            lines.append('# TYPE {} histogram'.format(name))
+        cumulative = 0
+        bounds = histogram.buckets + (float('inf'),)
+        for bound, count in zip(bounds, histogram.counts):
+            cumulative += count
+            lines.append('{}_bucket{} {}'.format(
+                name, _labels(labels, [('le', _number(bound))]),
+                cumulative))
+        lines.append('{}_sum{} {}'.format(name, _labels(labels),
+                                          _number(histogram.sum)))
+        lines.append('{}_count{} {}'.format(name, _labels(labels),
+                                            histogram.count))
+    return '\n'.join(lines) + '\n' if lines else ''
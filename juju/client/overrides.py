@@ -3,6 +3,7 @@ from collections import namedtuple
 
 from . import _client, _definitions
 from .facade import ReturnMapping, Type, TypeEncoder
+from .jsonstream import iter_array
 
 __all__ = [
     'Delta',
@@ -94,7 +95,7 @@ class AllWatcherFacade(Type):
     Patch rpc method of allwatcher to add in 'id' stuff.
 
     """
-    async def rpc(self, msg):
+    async def rpc(self, msg, raw=None):
         if not hasattr(self, 'Id'):
             client = _client.ClientFacade.from_connection(self.connection)
 
@@ -102,9 +103,34 @@ class AllWatcherFacade(Type):
             self.Id = result.watcher_id
 
         msg['Id'] = self.Id
-        result = await self.connection.rpc(msg, encoder=TypeEncoder)
+        if raw is None:
+            raw = self._raw == 'json'
+        result = await self.connection.rpc(msg, encoder=TypeEncoder,
+                                           partial=self._partial,
+                                           raw=raw,
+                                           timeout=self._timeout)
         return result
 
+    async def next_deltas(self, stream_size=None):
+        """Call Next and return an iterable of its deltas, as plain lists.
+
+        Replies of up to stream_size characters are decoded by the
+        connection like any other, in its decode_executor if they are
+        longer than its decode_threshold. Longer ones are returned
+        undecoded, and their deltas decoded one at a time as they are
+        iterated over (see juju.client.jsonstream), so that the whole of a
+        huge first batch is never held in memory at once.
+
+        :param int stream_size: The size of the replies decoded as they
+            are iterated over; None to decode every reply as a whole.
+        """
+        msg = dict(type='AllWatcher', request='Next', version=self.version,
+                   params={})
+        reply = await self.rpc(msg, raw=stream_size or False)
+        if isinstance(reply, str):
+            return iter_array(reply, ('response', 'deltas'))
+        return reply['response'].get('deltas') or []
+
 
 class ActionFacade(Type):
 
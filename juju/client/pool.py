@@ -0,0 +1,248 @@
+import asyncio
+import logging
+from concurrent.futures import CancelledError
+
+import websockets
+from juju.client import client
+from juju.client.connection import Connection
+
+log = logging.getLogger(__name__)
+
+
+class _Member:
+    def __init__(self, connection, loop):
+        self.connection = connection
+        self.in_flight = 0
+        self.last_used = self.last_active = loop.time()
+
+
+class _Lane:
+    def __init__(self, min_size, max_size):
+        self.members = []
+        self.min_size = min_size
+        self.max_size = max_size
+        self.growing = None
+
+
+class ConnectionPool:
+    """A pool of logged-in connections to the same controller or model,
+    made with :meth:`Connection.connect_params`.
+
+    The pool can stand in for a Connection when getting a facade, e.g.
+    ``client.ClientFacade.from_connection(pool)``; each RPC goes to the
+    open connection with the fewest calls in flight. A connection is
+    added when they all have ``max_in_flight`` calls or more, up to
+    ``max_size`` of them, and connections beyond ``min_size`` that have
+    been idle for ``idle_timeout`` seconds are closed again.
+
+    Calls in HEAVY_REQUESTS, which may take long or carry large replies,
+    go to a separate lane of up to ``heavy_size`` connections, so that
+    they don't hold up the small calls behind them.
+
+    Instead of each connection running its own pinger, the pool pings
+    the connections it made that have been idle for ``ping_interval``
+    seconds.
+
+    """
+    HEAVY_REQUESTS = frozenset([
+        ('Bundle', 'GetChanges'),
+        ('Client', 'FullStatus'),
+        ('Client', 'ResolveCharms'),
+        ('Charms', 'List'),
+        ('ModelManager', 'DumpModels'),
+        ('ModelManager', 'DumpModelsDB'),
+    ])
+    "Requests sent on the heavy lane by default."
+
+    def __init__(self, connection, min_size=1, max_size=4, heavy_size=1,
+                 max_in_flight=4, idle_timeout=60, ping_interval=10,
+                 heavy_requests=None):
+        """Create a pool, which takes ownership of the given connection.
+
+        :param Connection connection: A connected Connection, which is
+            the first connection of the pool and is never closed before
+            the pool is.
+        :param int min_size: The number of connections not to shrink
+            below.
+        :param int max_size: The number of connections not to grow
+            beyond, not counting the heavy lane.
+        :param int heavy_size: The number of connections in the heavy
+            lane, or 0 to send heavy requests like any other.
+        :param int max_in_flight: The number of calls in flight on every
+            connection above which another one is made.
+        :param float idle_timeout: Seconds after which connections above
+            min_size are closed if unused.
+        :param float ping_interval: Seconds a connection can be idle for
+            before it is pinged.
+        :param heavy_requests: The (facade, request) pairs to send on the
+            heavy lane, instead of HEAVY_REQUESTS.
+        """
+        self.loop = connection.loop
+        self.max_in_flight = max_in_flight
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        if heavy_requests is None:
+            heavy_requests = self.HEAVY_REQUESTS
+        self.heavy_requests = frozenset(heavy_requests)
+        self._primary = connection
+        # the facades returned by from_connection for the pool, which
+        # route their calls through it
+        self._facade_cache = {}
+        min_size = max(min_size, 1)
+        self._lane = _Lane(min_size, max(max_size, min_size))
+        self._lane.members.append(_Member(connection, self.loop))
+        self._heavy_lane = _Lane(0, heavy_size)
+        self._closed = asyncio.Event(loop=self.loop)
+        self._pinger = self.loop.create_task(self._ping_and_shrink())
+
+    @classmethod
+    async def connect(cls, connection, **kwargs):
+        """Create a pool for the given connection, and open its first
+        min_size connections.
+
+        kwargs are passed through to the constructor.
+        """
+        self = cls(connection, **kwargs)
+        lane = self._lane
+        await asyncio.gather(*[
+            self._grow(lane) for _ in range(lane.min_size - 1)
+        ], loop=self.loop)
+        return self
+
+    @property
+    def facades(self):
+        return self._primary.facades
+
+    @property
+    def is_open(self):
+        return self._primary.is_open
+
+    @property
+    def connections(self):
+        """The connections of the pool, followed by those of the heavy
+        lane.
+        """
+        return [m.connection
+                for m in self._lane.members + self._heavy_lane.members]
+
+    def __len__(self):
+        return len(self._lane.members) + len(self._heavy_lane.members)
+
+    async def rpc(self, msg, encoder=None, partial=False, raw=False,
+                  timeout=None):
+        """Make an RPC on one of the pool's connections; see
+        :meth:`Connection.rpc`.
+        """
+        if self._closed.is_set():
+            raise websockets.exceptions.ConnectionClosed(0, 'pool closed')
+        lane = self._lane
+        if (self._heavy_lane.max_size and
+                (msg.get('type'), msg.get('request')) in self.heavy_requests):
+            lane = self._heavy_lane
+        member = await self._route(lane)
+        member.in_flight += 1
+        try:
+            return await member.connection.rpc(msg, encoder=encoder,
+                                               partial=partial, raw=raw,
+                                               timeout=timeout)
+        finally:
+            member.in_flight -= 1
+            member.last_used = member.last_active = self.loop.time()
+
+    async def close(self):
+        """Close all the connections of the pool."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        await self._pinger
+        members = self._lane.members + self._heavy_lane.members
+        self._lane.members, self._heavy_lane.members = [], []
+        await asyncio.gather(*[m.connection.close() for m in members],
+                             loop=self.loop)
+
+    async def _route(self, lane):
+        while True:
+            # Connections that aren't open may be reconnecting, so they
+            # stay in the lane, to be closed with the pool or when idle.
+            member = self._least_busy(lane)
+            if member is not None and member.in_flight < self.max_in_flight:
+                return member
+            if len(lane.members) >= lane.max_size:
+                # Wait in line on the least busy connection.
+                member = member or self._least_busy(self._lane)
+                if member is None:
+                    raise websockets.exceptions.ConnectionClosed(
+                        0, 'no open connection in pool')
+                return member
+            # Open one connection at a time, and let the calls that
+            # arrive meanwhile share it.
+            if lane.growing is None:
+                lane.growing = self.loop.create_task(self._grow(lane))
+            growing = lane.growing
+            await asyncio.wait([growing], loop=self.loop)
+            if growing.cancelled():
+                error = CancelledError()
+            else:
+                error = growing.exception()
+            if error is not None:
+                if member is None:
+                    raise error
+                log.warning('pool %s could not grow: %r', id(self), error)
+                return member
+
+    def _least_busy(self, lane):
+        open_members = [m for m in lane.members if m.connection.is_open]
+        if not open_members:
+            return None
+        return min(open_members, key=lambda m: m.in_flight)
+
+    async def _grow(self, lane):
+        try:
+            params = self._primary.connect_params()
+            params['pinger'] = False
+            params['read_replicas'] = 0
+            connection = await Connection.connect(**params)
+        finally:
+            lane.growing = None
+        if self._closed.is_set():
+            await connection.close()
+            raise websockets.exceptions.ConnectionClosed(0, 'pool closed')
+        member = _Member(connection, self.loop)
+        lane.members.append(member)
+        log.debug('pool %s grew to %d connections', id(self), len(self))
+        return member
+
+    async def _ping_and_shrink(self):
+        while not self._closed.is_set():
+            try:
+                await asyncio.wait_for(self._closed.wait(),
+                                       self.ping_interval, loop=self.loop)
+                return
+            except asyncio.TimeoutError:
+                pass
+            except CancelledError:
+                return
+            now = self.loop.time()
+            for lane in (self._lane, self._heavy_lane):
+                for member in list(lane.members):
+                    if member.connection is self._primary or member.in_flight:
+                        continue
+                    if (now - member.last_used >= self.idle_timeout and
+                            len(lane.members) > lane.min_size):
+                        lane.members.remove(member)
+                        await member.connection.close()
+                    elif now - member.last_active >= self.ping_interval:
+                        await self._ping(member)
+
+    async def _ping(self, member):
+        facade = client.PingerFacade.from_connection(member.connection)
+        member.in_flight += 1
+        try:
+            await facade.Ping()
+        except websockets.exceptions.ConnectionClosed:
+            log.debug('ping failed because of closed connection')
+        finally:
+            member.in_flight -= 1
+            # A ping keeps the connection alive, but doesn't count as use
+            # that would stop it being closed when idle.
+            member.last_active = self.loop.time()
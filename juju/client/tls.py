@@ -0,0 +1,122 @@
+'''Shared SSL contexts for controller connections.
+
+Building an SSL context parses its CA certificate, and a new context
+can't resume the TLS sessions of another, so every connection to a
+controller used to pay for both a parse and a full handshake.
+context_for returns one context per CA certificate instead, which
+remembers the last TLS session of each server it connected to and
+offers it in the next handshake with that server, whether for a
+websocket or an HTTPS connection. A controller that still has the
+session skips the certificate exchange and key agreement.
+
+Sessions are offered through the session argument of
+SSLContext.wrap_bio and wrap_socket, which asyncio and http.client
+call, and recorded by SSLObject and SSLSocket subclasses set as the
+context's sslobject_class and sslsocket_class. Those appeared in
+Python 3.7; on older versions the contexts are still shared but every
+handshake is a full one.
+'''
+import ssl
+import sys
+
+_contexts = {}
+
+_CAN_RESUME = sys.version_info >= (3, 7)
+
+
+def context_for(cert=None):
+    '''Return the shared SSL context for connections to a controller with
+    the given CA certificate.
+
+    The context has a tls_stats dict counting its handshakes and how many
+    of them resumed a session.
+
+    :param str cert: The PEM encoded CA certificate of the controller.
+    '''
+    context = _contexts.get(cert)
+    if context is None:
+        if _CAN_RESUME:
+            # as ssl.create_default_context(Purpose.CLIENT_AUTH) does
+            context = _ResumingContext(ssl.PROTOCOL_TLS)
+            if cert:
+                context.load_verify_locations(cadata=cert)
+        else:
+            context = ssl.create_default_context(
+                purpose=ssl.Purpose.CLIENT_AUTH, cadata=cert)
+        context.tls_stats = {'handshakes': 0, 'resumed': 0}
+        _contexts[cert] = context
+    return context
+
+
+class _Resuming:
+    '''Records the session of each completed handshake in the context.
+
+    With TLS 1.3 the ticket needed to resume a session arrives after the
+    handshake, so the session is recorded again after the first read.
+    '''
+    _ticket_pending = False
+
+    def do_handshake(self, *args, **kwargs):
+        super().do_handshake(*args, **kwargs)
+        stats = self.context.tls_stats
+        stats['handshakes'] += 1
+        if self.session_reused:
+            stats['resumed'] += 1
+        self._record_session()
+        self._ticket_pending = self.version() == 'TLSv1.3'
+
+    def read(self, *args, **kwargs):
+        data = super().read(*args, **kwargs)
+        if self._ticket_pending:
+            self._ticket_pending = False
+            self._record_session()
+        return data
+
+    def _record_session(self):
+        if self.server_side or self.server_hostname is None:
+            return
+        session = self.session
+        if session is not None:
+            self.context.tls_sessions[self.server_hostname] = session
+
+
+class _ResumingSSLObject(_Resuming, ssl.SSLObject):
+    pass
+
+
+class _ResumingSSLSocket(_Resuming, ssl.SSLSocket):
+    pass
+
+
+class _ResumingContext(ssl.SSLContext):
+    '''An SSL context which offers the last session of each server in
+    the next handshake with it.
+    '''
+    sslobject_class = _ResumingSSLObject
+    sslsocket_class = _ResumingSSLSocket
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.tls_sessions = {}
+
+    def wrap_socket(self, sock, server_side=False,
+                    do_handshake_on_connect=True, suppress_ragged_eofs=True,
+                    server_hostname=None, session=None):
+        return super().wrap_socket(
+            sock, server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname,
+            session=self._session(server_side, server_hostname, session))
+
+    def wrap_bio(self, incoming, outgoing, server_side=False,
+                 server_hostname=None, session=None):
+        return super().wrap_bio(
+            incoming, outgoing, server_side=server_side,
+            server_hostname=server_hostname,
+            session=self._session(server_side, server_hostname, session))
+
+    def _session(self, server_side, server_hostname, session):
+        if session is None and not server_side:
+            session = self.tls_sessions.get(server_hostname)
+        return session
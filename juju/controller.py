@@ -17,6 +17,15 @@ class Controller:
         max_frame_size=None,
         bakery_client=None,
         jujudata=None,
+        coalesce=False,
+        cache=False,
+        admission=None,
+        rpc_timeout=None,
+        metrics=None,
+        decode_threshold=None,
+        decode_executor=None,
+        read_replicas=0,
+        hedge_delay=None,
     ):
         """Instantiate a new Controller.
 
@@ -32,12 +41,45 @@ class Controller:
             for macaroon authorization.
         :param jujudata JujuData: The source for current controller
         information.
+        :param bool coalesce: Share the replies to identical read-only
+            requests that are in flight at the same time. See
+            `juju.client.connection.Connection.connect`
+        :param bool cache: Cache the replies to requests that rarely
+            change, such as the model and application config. See
+            `juju.client.cache`
+        :param juju.client.admission.Admission admission: Limits on the
+            number and rate of calls made to the controller.
+        :param float rpc_timeout: The default number of seconds to wait
+            for the reply to each call to the controller, or None to wait
+            for as long as it takes. It doesn't apply to watchers.
+        :param juju.client.metrics.MetricsSink metrics: Where to report
+            measurements of the calls made, see `juju.client.metrics`.
+        :param int decode_threshold: Decode replies longer than this many
+            characters in decode_executor instead of on the event loop.
+        :param concurrent.futures.Executor decode_executor: The executor
+            to decode large replies in, or None for the loop's default
+            executor. See `juju.client.connection.Connection.connect`
+        :param int read_replicas: The number of extra connections to make
+            to other members of an HA controller, to share read-only calls
+            with.
+        :param float hedge_delay: Seconds after which a read-only call
+            that hasn't been answered is sent to another member too. See
+            `juju.client.connection.Connection.connect`
         """
         self._connector = connector.Connector(
             loop=loop,
             max_frame_size=max_frame_size,
             bakery_client=bakery_client,
             jujudata=jujudata,
+            coalesce=coalesce,
+            cache=cache,
+            admission=admission,
+            rpc_timeout=rpc_timeout,
+            metrics=metrics,
+            decode_threshold=decode_threshold,
+            decode_executor=decode_executor,
+            read_replicas=read_replicas,
+            hedge_delay=hedge_delay,
         )
 
     async def __aenter__(self):
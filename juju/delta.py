@@ -62,6 +62,16 @@ class UnitDelta(EntityDelta):
         return Unit
 
 
+class ModelDelta(EntityDelta):
+    def get_id(self):
+        return self.data['model-uuid']
+
+    @classmethod
+    def get_entity_class(self):
+        from .model import ModelInfo
+        return ModelInfo
+
+
 class RelationDelta(EntityDelta):
     @classmethod
     def get_entity_class(self):
@@ -74,6 +84,7 @@ _delta_types = {
     'application': ApplicationDelta,
     'annotation': AnnotationDelta,
     'machine': MachineDelta,
+    'model': ModelDelta,
     'unit': UnitDelta,
     'relation': RelationDelta,
 }
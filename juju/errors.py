@@ -1,3 +1,6 @@
+import asyncio
+
+
 class JujuError(Exception):
     def __init__(self, *args, **kwargs):
         self.message = ''
@@ -23,6 +26,10 @@ class JujuAPIError(JujuError):
         super().__init__(self.message)
 
 
+class JujuTimeoutError(asyncio.TimeoutError, JujuError):
+    pass
+
+
 class JujuConnectionError(ConnectionError, JujuError):
     pass
 
@@ -2,12 +2,13 @@ import asyncio
 import base64
 import collections
 import hashlib
+import heapq
 import json
 import logging
 import os
 import re
 import stat
-import tempfile
+import warnings
 import weakref
 import zipfile
 from concurrent.futures import CancelledError
@@ -19,7 +20,7 @@ import theblues.errors
 import websockets
 import yaml
 
-from . import tag, utils
+from . import charmcache, parallelzip, tag, utils
 from .client import client, connector
 from .client.client import ConfigValue
 from .client.client import Value
@@ -167,6 +168,16 @@ class ModelState:
         """
         return self.entity_history(entity_type, entity_id)[history_index]
 
+    def forget_entity(self, entity_type, entity_id):
+        """Drop the delta history of an entity which is of no further
+        interest, such as a finished action whose result has been read.
+
+        Objects already returned for the entity can no longer read its
+        data, and a later delta for it starts a new history.
+
+        """
+        self.state.get(entity_type, {}).pop(entity_id, None)
+
     def apply_delta(self, delta):
         """Apply delta to our state and return a copy of the
         affected object as it was before and after the update, e.g.:
@@ -390,16 +401,49 @@ class ModelEntity:
         return self.model.state.get_entity(self.entity_type, self.entity_id)
 
 
+class ModelInfo(ModelEntity):
+    """The model itself, as described by its AllWatcher deltas: its name,
+    life, status, config and constraints.
+    """
+    @property
+    def entity_type(self):
+        return 'model'
+
+    @property
+    def tag(self):
+        return tag.model(self.entity_id)
+
+
 class Model:
     """
     The main API for interacting with a Juju model.
     """
+    ACTION_CHUNK_SIZE = 100
+    "Maximum number of actions sent in a single Enqueue call."
+
+    WATCH_STREAM_SIZE = 2**22
+    """AllWatcher replies longer than this are decoded one delta at a time
+    as they are applied, rather than as a whole.
+    """
+
+    WATCH_YIELD_EVERY = 100
+    "The watcher lets other tasks run after applying this many deltas."
+
     def __init__(
         self,
         loop=None,
         max_frame_size=None,
         bakery_client=None,
         jujudata=None,
+        coalesce=False,
+        cache=False,
+        admission=None,
+        rpc_timeout=None,
+        metrics=None,
+        decode_threshold=None,
+        decode_executor=None,
+        read_replicas=0,
+        hedge_delay=None,
     ):
         """Instantiate a new Model.
 
@@ -414,16 +458,50 @@ class Model:
         :param bakery_client httpbakery.Client: The bakery client to use
             for macaroon authorization.
         :param jujudata JujuData: The source for current controller information
+        :param bool coalesce: Share the replies to identical read-only
+            requests that are in flight at the same time. See
+            `juju.client.connection.Connection.connect`
+        :param bool cache: Cache the replies to requests that rarely
+            change, such as the model and application config. See
+            `juju.client.cache`
+        :param juju.client.admission.Admission admission: Limits on the
+            number and rate of calls made to the controller.
+        :param float rpc_timeout: The default number of seconds to wait
+            for the reply to each call to the controller, or None to wait
+            for as long as it takes. It doesn't apply to watchers.
+        :param juju.client.metrics.MetricsSink metrics: Where to report
+            measurements of the calls made, see `juju.client.metrics`.
+        :param int decode_threshold: Decode replies longer than this many
+            characters in decode_executor instead of on the event loop.
+        :param concurrent.futures.Executor decode_executor: The executor
+            to decode large replies in, or None for the loop's default
+            executor. See `juju.client.connection.Connection.connect`
+        :param int read_replicas: The number of extra connections to make
+            to other members of an HA controller, to share read-only calls
+            with.
+        :param float hedge_delay: Seconds after which a read-only call
+            that hasn't been answered is sent to another member too. See
+            `juju.client.connection.Connection.connect`
         """
         self._connector = connector.Connector(
             loop=loop,
             max_frame_size=max_frame_size,
             bakery_client=bakery_client,
             jujudata=jujudata,
+            coalesce=coalesce,
+            cache=cache,
+            admission=admission,
+            rpc_timeout=rpc_timeout,
+            metrics=metrics,
+            decode_threshold=decode_threshold,
+            decode_executor=decode_executor,
+            read_replicas=read_replicas,
+            hedge_delay=hedge_delay,
         )
         self._observers = weakref.WeakValueDictionary()
         self.state = ModelState(self)
         self._info = None
+        self._charm_cache = None
         self._watch_stopping = asyncio.Event(loop=self._connector.loop)
         self._watch_stopped = asyncio.Event(loop=self._connector.loop)
         self._watch_received = asyncio.Event(loop=self._connector.loop)
@@ -592,7 +670,7 @@ class Model:
             await self._connector.disconnect()
             self._info = None
 
-    async def add_local_charm_dir(self, charm_dir, series):
+    async def add_local_charm_dir(self, charm_dir, series, progress=None):
         """Upload a local charm to the model.
 
         This will automatically generate an archive from
@@ -600,18 +678,109 @@ class Model:
 
         :param charm_dir: Path to the charm directory
         :param series: Charm series
-
-        """
-        fh = tempfile.NamedTemporaryFile()
-        CharmArchiveGenerator(charm_dir).make_archive(fh.name)
-        with fh:
-            func = partial(
-                self.add_local_charm, fh, series, os.stat(fh.name).st_size)
-            charm_url = await self._connector.loop.run_in_executor(None, func)
+        :param progress: A function called with the number of bytes of
+            the archive uploaded so far and its size, or None if the
+            archive is being built as it is sent.
+
+        The charm isn't uploaded again if the model still has the charm
+        uploaded with the same content and series, as remembered by the
+        JujuData's :class:`juju.charmcache.CharmCache`. Otherwise the
+        archive kept in the cache for the content is uploaded, or the
+        archive is built in an executor, compressing its files in
+        parallel when there are several CPUs, and streamed straight into
+        the upload as well as into the cache.
+
+        The cache is read and written in the loop's default executor.
+
+        """
+        loop = self._connector.loop
+        if self._charm_cache is None:
+            cache = await loop.run_in_executor(
+                None, self._connector.jujudata.charm_cache)
+            if self._charm_cache is None:
+                self._charm_cache = cache
+        cache = self._charm_cache
+        generator = CharmArchiveGenerator(charm_dir)
+        content_hash = await loop.run_in_executor(
+            None, generator.content_hash, cache)
+        await loop.run_in_executor(None, cache.save)
+        model_uuid = self.connection().uuid
+
+        charm_url = cache.uploaded(model_uuid, series, content_hash)
+        if charm_url is not None:
+            if await self._has_charm(charm_url):
+                log.debug('Local charm %s already uploaded as %s',
+                          charm_dir, charm_url)
+                return charm_url
+            await loop.run_in_executor(
+                None, cache.forget_upload, model_uuid, series, content_hash)
+
+        cached = await loop.run_in_executor(None, cache.archive, content_hash)
+        if cached is not None:
+            with open(cached, 'rb') as archive:
+                charm_url = await self._upload_charm(archive, series,
+                                                     progress=progress)
+        else:
+            make_archive = partial(generator.make_archive,
+                                   executor=parallelzip.default_executor())
+            archive = utils.AsyncPipe(partial(
+                cache.archive_to, content_hash, make_archive), loop=loop)
+            try:
+                charm_url = await self._upload_charm(archive, series,
+                                                     progress=progress)
+            finally:
+                await archive.aclose()
+        await loop.run_in_executor(None, cache.record_upload, model_uuid,
+                                   series, content_hash, charm_url)
 
         log.debug('Uploaded local charm: %s -> %s', charm_dir, charm_url)
         return charm_url
 
+    async def _has_charm(self, charm_url):
+        """Report whether the model has the charm with charm_url."""
+        charms_facade = client.CharmsFacade.from_connection(self.connection())
+        try:
+            await charms_facade.CharmInfo(charm_url)
+        except JujuAPIError:
+            return False
+        return True
+
+    async def upload_local_charm(self, charm_file, series, size=None,
+                                 progress=None):
+        """Upload a local charm archive to the model.
+
+        Returns the 'local:...' url that should be used to deploy the charm.
+
+        :param charm_file: Path to the charm zip archive, or a binary file
+            object to read it from
+        :param series: Charm series
+        :param size: Size of the archive, in bytes, if it can't be told
+            from charm_file
+        :param progress: A function called with the number of bytes sent
+            so far and the size of the archive (or None) as it is uploaded
+        :return str: 'local:...' url for deploying the charm
+        :raises: :class:`JujuError` if the upload fails
+
+        The archive is read in an executor and streamed with the
+        connection's HTTPClient, which reuses its TLS connections between
+        uploads.
+
+        """
+        if isinstance(charm_file, (str, Path)):
+            with open(charm_file, 'rb') as f:
+                return await self._upload_charm(f, series, size, progress)
+        return await self._upload_charm(charm_file, series, size, progress)
+
+    async def _upload_charm(self, charm_file, series, size=None,
+                            progress=None):
+        response = await self.connection().http_client().request(
+            'POST', '/charms?series={}'.format(series), body=charm_file,
+            headers={'Content-Type': 'application/zip'}, size=size,
+            progress=progress)
+        if response.status != 200:
+            raise JujuError(response.text())
+        return response.json()['charm-url']
+
     def add_local_charm(self, charm_file, series, size=None):
         """Upload a local charm archive to the model.
 
@@ -626,12 +795,15 @@ class Model:
         Uses an https endpoint at the same host:port as the wss.
         Supports large file uploads.
 
-        .. warning::
-
-           This method will block. Consider using :meth:`add_local_charm_dir`
+        .. deprecated:: 0.11.3
+           This method blocks the event loop for the whole upload. Use
+           :meth:`upload_local_charm` or :meth:`add_local_charm_dir`
            instead.
 
         """
+        warnings.warn('Model.add_local_charm blocks the event loop; use '
+                      'upload_local_charm instead', DeprecationWarning,
+                      stacklevel=2)
         conn, headers, path_prefix = self.connection().https_connection()
         path = "%s/charms?series=%s" % (path_prefix, series)
         headers['Content-Type'] = 'application/zip'
@@ -738,7 +910,7 @@ class Model:
         facade = client.ClientFacade.from_connection(self.connection())
 
         self._info = await facade.ModelInfo()
-        log.debug('Got ModelInfo: %s', vars(self.info))
+        log.debug('Got ModelInfo: %s', self.info._asdict())
 
         return self.info
 
@@ -802,8 +974,8 @@ class Model:
                     self.connection())
                 while not self._watch_stopping.is_set():
                     try:
-                        results = await utils.run_with_interrupt(
-                            allwatcher.Next(),
+                        deltas = await utils.run_with_interrupt(
+                            allwatcher.next_deltas(self.WATCH_STREAM_SIZE),
                             self._watch_stopping,
                             loop=self._connector.loop)
                     except JujuAPIError as e:
@@ -822,32 +994,60 @@ class Model:
                         del allwatcher.Id
                         continue
                     except websockets.ConnectionClosed:
-                        monitor = self.connection().monitor
+                        if self._watch_stopping.is_set():
+                            break
+                        connection = self.connection()
+                        monitor = connection.monitor
+                        # the receiver may already be reconnecting, e.g.
+                        # with a bigger max_frame_size after our last
+                        # batch didn't fit in a frame
+                        reconnect_task = connection._reconnect_task
+                        if reconnect_task is not None:
+                            await asyncio.wait([reconnect_task],
+                                               loop=self._connector.loop)
+                        async with monitor.reconnecting:
+                            pass
                         if monitor.status == monitor.ERROR:
                             # closed unexpectedly, try to reopen
                             log.warning(
                                 'Watcher: connection closed, reopening')
-                            await self.connection().reconnect()
+                            await connection.reconnect()
                             if monitor.status != monitor.CONNECTED:
                                 # reconnect failed; abort and shutdown
                                 log.error('Watcher: automatic reconnect '
                                           'failed; stopping watcher')
                                 break
-                            del allwatcher.Id
-                            continue
-                        else:
-                            # closed on request, go ahead and shutdown
+                        elif monitor.status != monitor.CONNECTED:
+                            # closed on request; wait for the model to
+                            # stop the watcher
+                            await self._watch_stopping.wait()
                             break
+                        del allwatcher.Id
+                        continue
                     if self._watch_stopping.is_set():
                         try:
                             await allwatcher.Stop()
                         except websockets.ConnectionClosed:
                             pass  # can't stop on a closed conn
                         break
-                    for delta in results.deltas:
-                        delta = get_entity_delta(delta)
+                    cache = self.connection().cache
+                    metrics = self.connection().metrics
+                    count = 0
+                    for delta in deltas:
+                        count += 1
+                        if not count % self.WATCH_YIELD_EVERY:
+                            # a big batch would otherwise hold up the loop
+                            # until all of it is applied
+                            await asyncio.sleep(0, loop=self._connector.loop)
+                        delta = get_entity_delta(client.Delta(delta))
                         old_obj, new_obj = self.state.apply_delta(delta)
-                        await self._notify_observers(delta, old_obj, new_obj)
+                        if cache is not None:
+                            cache.invalidate_entity(delta.entity,
+                                                    delta.get_id())
+                        await self._notify_observers(delta, old_obj, new_obj,
+                                                     metrics)
+                    if metrics is not None:
+                        metrics.observe('juju_watcher_batch_deltas', count)
                     self._watch_received.set()
             except CancelledError:
                 pass
@@ -863,7 +1063,8 @@ class Model:
         self._watch_stopped.clear()
         self._connector.loop.create_task(_all_watcher())
 
-    async def _notify_observers(self, delta, old_obj, new_obj):
+    async def _notify_observers(self, delta, old_obj, new_obj,
+                                metrics=None):
         """Call observing callbacks, notifying them of a change in model state
 
         :param delta: The raw change from the watcher
@@ -872,6 +1073,8 @@ class Model:
             May be None.
         :param new_obj: The object in the model that is created or updated
             by applying this delta.
+        :param metrics: The MetricsSink to report the time each callback
+            takes to, if any.
 
         """
         if new_obj and not old_obj:
@@ -883,8 +1086,20 @@ class Model:
 
         for o in self._observers:
             if o.cares_about(delta):
-                asyncio.ensure_future(o(delta, old_obj, new_obj, self),
-                                      loop=self._connector.loop)
+                call = o(delta, old_obj, new_obj, self)
+                if metrics is not None:
+                    call = self._timed_observer(call, delta.entity, metrics)
+                asyncio.ensure_future(call, loop=self._connector.loop)
+
+    async def _timed_observer(self, call, entity, metrics):
+        """Await an observer's callback, and report how long it took."""
+        loop = self._connector.loop
+        start = loop.time()
+        try:
+            await call
+        finally:
+            metrics.observe('juju_observer_dispatch_seconds',
+                            loop.time() - start, {'entity': entity})
 
     async def _wait(self, entity_type, entity_id, action, predicate=None):
         """
@@ -939,6 +1154,47 @@ class Model:
 
         return await self._wait('action', action_id, None, predicate)
 
+    async def enqueue_action(self, action_name, units, params=None,
+                             chunk_size=None):
+        """Enqueue the same action on many units at once.
+
+        The actions are sent in as few Enqueue calls as possible, at most
+        ``chunk_size`` per call. A unit on which the action can't be
+        enqueued is recorded in the returned batch's ``errors`` rather
+        than aborting the whole batch.
+
+        :param str action_name: Name of action to run
+        :param units: Units to run the action on, as
+            :class:`juju.unit.Unit` instances or unit names
+        :param dict params: Action parameters
+        :param int chunk_size: Maximum number of actions per Enqueue call.
+            Defaults to :attr:`ACTION_CHUNK_SIZE`.
+        :returns: A :class:`juju.action.ActionBatch` instance.
+
+        """
+        from .action import ActionBatch
+
+        chunk_size = chunk_size or self.ACTION_CHUNK_SIZE
+        unit_names = [u if isinstance(u, str) else u.name for u in units]
+
+        log.debug('Starting action `%s` on %d units',
+                  action_name, len(unit_names))
+
+        action_facade = client.ActionFacade.from_connection(
+            self.connection()).partial()
+        batch = ActionBatch(self)
+        for i in range(0, len(unit_names), chunk_size):
+            chunk = unit_names[i:i + chunk_size]
+            results = await action_facade.Enqueue([
+                client.Action(
+                    name=action_name,
+                    parameters=params or {},
+                    receiver=tag.unit(unit_name),
+                ) for unit_name in chunk])
+            for unit_name, result in zip(chunk, results):
+                batch._add_result(unit_name, result)
+        return batch
+
     async def add_machine(
             self, spec=None, constraints=None, disks=None, series=None):
         """Start a new, empty machine and optionally a container, or add a
@@ -1638,14 +1894,60 @@ class Model:
         """
         raise NotImplementedError()
 
-    def run(self, command, timeout=None):
-        """Run command on all machines in this model.
+    async def run(self, command, timeout=None, applications=None,
+                  units=None, machines=None, max_output_size=None):
+        """Run command across this model.
 
-        :param str command: The command to run
-        :param int timeout: Time to wait before command is considered failed
+        If no applications, units or machines are given, the command is run
+        on all machines in the model. Otherwise it is run on every unit of
+        the given applications, the given units and the given machines.
+        In either case a single Run call is made to the controller.
 
-        """
-        raise NotImplementedError()
+        :param str command: The command to run
+        :param float timeout: Time, in seconds, to wait before the command
+            is considered failed
+        :param list applications: Names of applications to run on
+        :param list units: Units to run on, as :class:`juju.unit.Unit`
+            instances or unit names
+        :param list machines: Ids of machines to run on
+        :param int max_output_size: Maximum number of bytes of stdout and
+            of stderr in the result for each receiver; see
+            :class:`juju.action.RunBatch`
+        :returns: A :class:`juju.action.RunBatch` instance, which yields a
+            :class:`juju.action.RunResult` for each receiver as its command
+            finishes.
+
+        """
+        from .action import RunBatch, receiver_name
+
+        if timeout:
+            # Convert seconds to nanoseconds
+            timeout = int(timeout * 1000000000)
+
+        unit_names = [u if isinstance(u, str) else u.name
+                      for u in units or []]
+        action_facade = client.ActionFacade.from_connection(
+            self.connection()).partial()
+        if applications or unit_names or machines:
+            log.debug('Running `%s`', command)
+            run = action_facade.Run
+        else:
+            log.debug('Running `%s` on all machines', command)
+            run = action_facade.RunOnAllMachines
+        results = await run(applications=applications or [],
+                            commands=command,
+                            machines=machines or [],
+                            timeout=timeout,
+                            units=unit_names)
+
+        batch = RunBatch(self, max_output_size=max_output_size)
+        for i, result in enumerate(results):
+            if result.action:
+                name = receiver_name(result.action.receiver)
+            else:
+                name = '#{}'.format(i)
+            batch._add_result(name, result)
+        return batch
 
     async def set_config(self, config):
         """Set configuration keys on this model.
@@ -1848,7 +2150,7 @@ class Model:
                     raise Exception(error.message)
 
             for metric in entity_metrics.metrics:
-                metrics[metric.unit].append(vars(metric))
+                metrics[metric.unit].append(metric._asdict())
 
         return metrics
 
@@ -1960,11 +2262,79 @@ class BundleHandler:
         if self.plan.errors:
             raise JujuError(self.plan.errors)
 
-    async def execute_plan(self):
-        for step in self.plan.changes:
-            method = getattr(self, step.method)
-            result = await method(*step.args)
-            self.references[step.id_] = result
+    async def execute_plan(self, max_concurrency=8):
+        """Execute the steps of the plan, each as soon as the steps that
+        it requires or refers to with a placeholder are done, and at most
+        max_concurrency at once. The units of an application are added in
+        the order of the plan.
+
+        Once a step fails, only steps before it in the plan are started,
+        and when those running are done the error of the first step that
+        failed in the order of the plan is raised: the same error as if
+        the steps had been executed one after another.
+
+        """
+        loop = self.model.loop
+        changes = self.plan.changes
+        order = {step.id_: i for i, step in enumerate(changes)}
+        blockers = {}
+        dependents = collections.defaultdict(list)
+        last_unit = {}
+        for step in changes:
+            requires = set(step.requires or ())
+            requires.update(_placeholders(step.args))
+            if step.method == 'addUnit':
+                previous = last_unit.get(step.args[0])
+                if previous is not None:
+                    requires.add(previous)
+                last_unit[step.args[0]] = step.id_
+            requires = {r for r in requires if r in order and r != step.id_}
+            blockers[step.id_] = requires
+            for required in requires:
+                dependents[required].append(step.id_)
+
+        ready = [order[id_] for id_, requires in blockers.items()
+                 if not requires]
+        heapq.heapify(ready)
+        running = {}
+        failures = []
+        first_failure = len(changes)
+        try:
+            while ready or running:
+                while ready and len(running) < max_concurrency and \
+                        ready[0] < first_failure:
+                    step = changes[heapq.heappop(ready)]
+                    method = getattr(self, step.method)
+                    running[loop.create_task(method(*step.args))] = step
+                if not running:
+                    break
+                done, _ = await asyncio.wait(
+                    running, loop=loop, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    if task.exception() is not None:
+                        failures.append((order[step.id_], task.exception()))
+                        first_failure = min(first_failure, order[step.id_])
+                        continue
+                    self.references[step.id_] = task.result()
+                    for dependent in dependents[step.id_]:
+                        blockers[dependent].discard(step.id_)
+                        if not blockers[dependent]:
+                            heapq.heappush(ready, order[dependent])
+        finally:
+            for task in running:
+                task.cancel()
+
+        if failures:
+            failures.sort(key=lambda failure: failure[0])
+            for i, error in failures[1:]:
+                log.error('Bundle step %s failed: %s', changes[i].id_, error)
+            raise failures[0][1]
+        unfinished = [step.id_ for step in changes
+                      if step.id_ not in self.references]
+        if unfinished:
+            raise JujuError('Bundle steps {} wait on each other'.format(
+                ', '.join(unfinished)))
 
     @property
     def applications(self):
@@ -2217,6 +2587,21 @@ class BundleHandler:
         return await entity.set_annotations(annotations)
 
 
+def _placeholders(value):
+    """Yield the ids of the bundle steps that placeholders in value, such
+    as "$deploy-1" or "$deploy-1:db", refer to.
+    """
+    if isinstance(value, str):
+        if value.startswith('$'):
+            yield value[1:].split(':', 1)[0]
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _placeholders(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _placeholders(item)
+
+
 class CharmStore:
     """
     Async wrapper around theblues.charmstore.CharmStore
@@ -2259,10 +2644,14 @@ class CharmArchiveGenerator:
     def __init__(self, path):
         self.path = os.path.abspath(os.path.expanduser(path))
 
-    def make_archive(self, path):
+    def make_archive(self, path, executor=None):
         """Create archive of directory and write to ``path``.
 
-        :param path: Path to archive
+        :param path: Path to archive, or a writable file object
+        :param executor: A concurrent.futures executor to compress the
+            files on in parallel, with a
+            :class:`juju.parallelzip.ParallelZipFile`, rather than one
+            after another in the calling thread.
 
         Ignored::
 
@@ -2273,24 +2662,69 @@ class CharmArchiveGenerator:
                           (.bzr, etc)
 
         """
-        zf = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        if executor is None:
+            zf = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        else:
+            zf = parallelzip.ParallelZipFile(path, executor)
+        for real_path, archive_name in self._entries():
+            if os.path.isdir(real_path) and not os.path.islink(real_path):
+                zf.write(real_path, archive_name)
+                continue
+            self._check_type(real_path)
+            if os.path.islink(real_path):
+                self._check_link(real_path)
+                self._write_symlink(
+                    zf, os.readlink(real_path), archive_name)
+            else:
+                zf.write(real_path, archive_name)
+        zf.close()
+        return path
+
+    def content_hash(self, cache=None):
+        """Return the SHA-256 hex digest of the names, modes and contents
+        of the files that :meth:`make_archive` would archive.
+
+        :param cache: A :class:`juju.charmcache.CharmCache` that avoids
+            reading files unchanged since their last digest.
+
+        """
+        digest = hashlib.sha256()
+        for real_path, archive_name in self._entries():
+            s = os.lstat(real_path)
+            if stat.S_ISLNK(s.st_mode):
+                content = os.readlink(real_path)
+            elif stat.S_ISREG(s.st_mode):
+                content = (cache.file_digest(real_path, s) if cache else
+                           charmcache.file_digest(real_path))
+            else:
+                content = None
+            digest.update(json.dumps(
+                [archive_name, s.st_mode, content]).encode() + b'\n')
+        return digest.hexdigest()
+
+    def _entries(self):
+        """Yield the path and archive name of each directory, file and
+        link to archive, in a stable order.
+        """
         for dirpath, dirnames, filenames in os.walk(self.path):
+            dirnames.sort()
             relative_path = dirpath[len(self.path) + 1:]
             if relative_path and not self._ignore(relative_path):
-                zf.write(dirpath, relative_path)
-            for name in filenames:
+                yield dirpath, relative_path
+            for name in sorted(filenames):
                 archive_name = os.path.join(relative_path, name)
                 if not self._ignore(archive_name):
-                    real_path = os.path.join(dirpath, name)
-                    self._check_type(real_path)
-                    if os.path.islink(real_path):
-                        self._check_link(real_path)
-                        self._write_symlink(
-                            zf, os.readlink(real_path), archive_name)
-                    else:
-                        zf.write(real_path, archive_name)
-        zf.close()
-        return path
+                    yield os.path.join(dirpath, name), archive_name
+
+    def stream(self, loop=None, executor=None):
+        """Return a :class:`juju.utils.AsyncPipe` yielding the bytes of the
+        archive, which is built in an executor as it is read.
+
+        Only a few chunks of the archive are held in memory at once.
+
+        """
+        return utils.AsyncPipe(self.make_archive, loop=loop,
+                               executor=executor)
 
     def _check_type(self, path):
         """Check the path
@@ -0,0 +1,263 @@
+'''Zip archives whose members are compressed in parallel.
+
+zipfile.ZipFile deflates one member after another, in the calling
+thread. ParallelZipFile has the part of its interface that
+CharmArchiveGenerator uses (write, writestr and close), but reads and
+compresses the files on an executor, and writes the results in order as
+they complete. zlib releases the GIL while it compresses, so a thread
+pool uses every CPU; a process pool works too.
+
+Files larger than chunk_size are split into chunks compressed
+separately, each primed with the 32KB that precede it, as pigz does, so
+that one large file keeps several workers busy. The raw deflate streams
+of the chunks, ended by a sync flush but for the last, concatenate into
+the deflate stream of the file. Their CRC is computed by a job of its
+own, and written after the data in a data descriptor, so that at most
+a window of compressed chunks are held in memory at once.
+
+ZIP64 archives aren't supported: archives of 4GB or more, or with more
+than 65535 members, raise zipfile.LargeZipFile.
+'''
+import collections
+import os
+import stat
+import struct
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK_SIZE = 2**20
+_DICT_SIZE = 2**15
+_LIMIT = 0xFFFFFFFF
+_DATA_DESCRIPTOR = struct.Struct('<4sLLL')
+
+_default_executor = None
+
+
+def default_executor():
+    '''Return a thread pool shared by the archives built in this process,
+    with a thread for each available CPU, or None if there is only one.
+    '''
+    global _default_executor
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    if cpus < 2:
+        return None
+    if _default_executor is None:
+        _default_executor = ThreadPoolExecutor(cpus)
+    return _default_executor
+
+
+def _compress(path, offset, length, last, level):
+    '''Return the raw deflate stream of length bytes of the file at path
+    from offset, the number of bytes read and their CRC. The stream ends
+    with a sync flush unless last.
+    '''
+    with open(path, 'rb') as f:
+        start = max(0, offset - _DICT_SIZE)
+        f.seek(start)
+        zdict = f.read(offset - start)
+        data = f.read(length)
+    if zdict:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+            zlib.Z_DEFAULT_STRATEGY, zdict)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    flush = zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    return (compressor.compress(data) + compressor.flush(flush), len(data),
+            zlib.crc32(data))
+
+
+def _crc(path):
+    crc = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+class _Done:
+    def __init__(self, value):
+        self.value = value
+
+    def result(self):
+        return self.value
+
+
+class _Member:
+    def __init__(self, zinfo, jobs, crc=None):
+        self.zinfo = zinfo
+        self.jobs = jobs
+        # the CRC of a file compressed in several chunks, which follows
+        # the data
+        self.crc = crc
+        self.written = 0
+        self.compress_size = 0
+        self.file_size = 0
+
+
+class ParallelZipFile:
+    def __init__(self, file, executor, chunk_size=CHUNK_SIZE, window=None,
+                 compresslevel=zlib.Z_DEFAULT_COMPRESSION):
+        '''
+        :param file: The path of the archive, or a binary file object to
+            write it to, which needn't be seekable.
+        :param executor: The concurrent.futures executor to compress on.
+        :param int chunk_size: The size of the chunks large files are
+            compressed in.
+        :param int window: The number of chunks submitted to the executor
+            ahead of the one being written; by default, twice its workers.
+        '''
+        if hasattr(file, 'write'):
+            self.fp, self._own_fp = file, False
+        else:
+            self.fp, self._own_fp = open(file, 'wb'), True
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.window = window or 2 * getattr(executor, '_max_workers', 4)
+        self.compresslevel = compresslevel
+        self.filelist = []
+        self._queued = collections.deque()
+        self._running = collections.deque()
+        self._offset = 0
+
+    def write(self, filename, arcname):
+        '''Add the file or directory at filename as arcname, like
+        ZipFile.write with ZIP_DEFLATED.
+        '''
+        st = os.stat(filename)
+        isdir = stat.S_ISDIR(st.st_mode)
+        if isdir:
+            arcname += '/'
+        zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+        if isdir:
+            zinfo.external_attr |= 0x10
+            self._add(_Member(zinfo, [_Done((b'', 0, 0))]))
+            return
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        level = self.compresslevel
+        if st.st_size <= self.chunk_size:
+            self._add(_Member(zinfo, [
+                (_compress, filename, 0, self.chunk_size, True, level)]))
+            return
+        # flag bit 3: the CRC and sizes follow the data
+        zinfo.flag_bits |= 0x08
+        offsets = range(0, st.st_size, self.chunk_size)
+        self._add(_Member(zinfo, [
+            (_compress, filename, offset, self.chunk_size,
+             offset == offsets[-1], level) for offset in offsets],
+            crc=self.executor.submit(_crc, filename)))
+
+    def writestr(self, zinfo, data):
+        '''Add data as the member described by the ZipInfo zinfo, like
+        ZipFile.writestr.
+        '''
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if not zinfo.external_attr:
+            zinfo.external_attr = 0o600 << 16
+        crc = zlib.crc32(data)
+        if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(
+                self.compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+            chunk = compressor.compress(data) + compressor.flush()
+        else:
+            chunk = data
+        self._add(_Member(zinfo, [_Done((chunk, len(data), crc))]))
+
+    def close(self):
+        '''Write the remaining members and the central directory.'''
+        try:
+            self._submit()
+            while self._running:
+                self._write_chunk(*self._running.popleft())
+            self._write_central_directory()
+        finally:
+            if self._own_fp:
+                self.fp.close()
+
+    def _add(self, member):
+        self._queued.extend((member, job) for job in member.jobs)
+        # Write what's done until the jobs of member are all submitted,
+        # so that no more than window of them are pending at once.
+        while True:
+            self._submit()
+            if not self._queued:
+                return
+            self._write_chunk(*self._running.popleft())
+
+    def _submit(self):
+        while self._queued and len(self._running) < self.window:
+            member, job = self._queued.popleft()
+            if not isinstance(job, _Done):
+                job = self.executor.submit(*job)
+            self._running.append((member, job))
+
+    def _write(self, data):
+        self.fp.write(data)
+        self._offset += len(data)
+
+    def _write_chunk(self, member, job):
+        zinfo = member.zinfo
+        data, size, crc = job.result()
+        streamed = zinfo.flag_bits & 0x08
+        if not member.written:
+            zinfo.header_offset = self._offset
+            if not streamed:
+                # the only chunk, whose sizes and CRC go in the header
+                zinfo.compress_size = len(data)
+                zinfo.file_size = size
+                zinfo.CRC = crc
+            self._write(zinfo.FileHeader(False))
+        self._write(data)
+        member.written += 1
+        member.compress_size += len(data)
+        member.file_size += size
+        if member.written < len(member.jobs):
+            return
+        if streamed:
+            zinfo.CRC = member.crc.result()
+            zinfo.compress_size = member.compress_size
+            zinfo.file_size = member.file_size
+            self._write(_DATA_DESCRIPTOR.pack(
+                b'PK\x07\x08', zinfo.CRC, zinfo.compress_size,
+                zinfo.file_size))
+        if (self._offset > _LIMIT or zinfo.file_size > _LIMIT or
+                len(self.filelist) >= 0xFFFF):
+            raise zipfile.LargeZipFile('ZIP64 archives are not supported')
+        self.filelist.append(zinfo)
+
+    def _write_central_directory(self):
+        start = self._offset
+        for zinfo in self.filelist:
+            dt = zinfo.date_time
+            dosdate = (dt[0] - 1980) << 9 | dt[1] << 5 | dt[2]
+            dostime = dt[3] << 11 | dt[4] << 5 | (dt[5] // 2)
+            try:
+                filename = zinfo.filename.encode('ascii')
+                flag_bits = zinfo.flag_bits
+            except UnicodeEncodeError:
+                filename = zinfo.filename.encode('utf-8')
+                flag_bits = zinfo.flag_bits | 0x800
+            self._write(struct.pack(
+                zipfile.structCentralDir, zipfile.stringCentralDir,
+                zinfo.create_version, zinfo.create_system,
+                zinfo.extract_version, zinfo.reserved, flag_bits,
+                zinfo.compress_type, dostime, dosdate, zinfo.CRC,
+                zinfo.compress_size, zinfo.file_size, len(filename),
+                len(zinfo.extra), len(zinfo.comment), 0,
+                zinfo.internal_attr, zinfo.external_attr,
+                zinfo.header_offset))
+            self._write(filename + zinfo.extra + zinfo.comment)
+        if self._offset > _LIMIT:
+            raise zipfile.LargeZipFile('ZIP64 archives are not supported')
+        count = len(self.filelist)
+        self._write(struct.pack(
+            zipfile.structEndArchive, zipfile.stringEndArchive, 0, 0,
+            count, count, self._offset - start, start, 0))
+        self.fp.flush()
@@ -36,5 +36,9 @@ def application(app_name):
     return _prefix('application-', app_name)
 
 
+def unit(unit_name):
+    return _prefix('unit-', unit_name.replace('/', '-'))
+
+
 def action(action_uuid):
     return _prefix('action-', action_uuid)
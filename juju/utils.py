@@ -58,8 +58,11 @@ class IdQueue:
         self._queues = defaultdict(partial(asyncio.Queue, maxsize, loop=loop))
 
     async def get(self, id):
-        value = await self._queues[id].get()
-        del self._queues[id]
+        try:
+            value = await self._queues[id].get()
+        finally:
+            # don't keep the queue of a cancelled get, either
+            self._queues.pop(id, None)
         if isinstance(value, Exception):
             raise value
         return value
@@ -110,3 +113,99 @@ async def run_with_interrupt(task, *events, loop=None):
         return task.result()  # may raise exception
     else:
         return None
+
+
+class AsyncPipe:
+    """
+    Runs a function that writes to a file object in an executor, and
+    yields what it writes on the event loop as an asynchronous iterable of
+    bytes chunks.
+
+    At most max_chunks chunks wait to be read at once; the function
+    blocks in the meantime, so a slow reader bounds the memory used
+    rather than the size of the output. Iterating again after rewind()
+    runs the function again from the start.
+    """
+    def __init__(self, write, loop=None, chunk_size=2**16, max_chunks=4,
+                 executor=None):
+        """
+        :param write: The function to run, given the file object to write
+            to, which is neither readable nor seekable.
+        :param int chunk_size: The size of the chunks yielded, except for
+            the last one.
+        :param int max_chunks: The number of chunks that wait to be read
+            before the function blocks.
+        :param executor: The executor to run the function in, or None for
+            the loop's default one.
+        """
+        self.loop = loop or asyncio.get_event_loop()
+        self._write = write
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.executor = executor
+        self._task = None
+        self._reset()
+
+    def _reset(self):
+        self._queue = asyncio.Queue(self.max_chunks, loop=self.loop)
+        self._buffer = bytearray()
+        self._closed = False
+
+    def __aiter__(self):
+        if self._task is None:
+            self._task = self.loop.run_in_executor(self.executor, self._run)
+        return self
+
+    async def __anext__(self):
+        chunk = await self._queue.get()
+        if chunk is None:
+            await self._task  # raises what the function raised, if anything
+            raise StopAsyncIteration
+        return chunk
+
+    async def aclose(self):
+        """Stop the function, if it's still running, and wait for it."""
+        if self._task is None:
+            return
+        self._closed = True
+        # unblock the function if it's waiting for room in the queue; its
+        # next write then fails
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        try:
+            await self._task
+        except Exception:
+            pass
+        self._task = None
+
+    async def rewind(self):
+        """Prepare to yield the output of the function again."""
+        await self.aclose()
+        self._reset()
+
+    def _run(self):
+        try:
+            self._write(self)
+            if self._buffer:
+                self._put(bytes(self._buffer))
+        finally:
+            if not self._closed:
+                self._put(None)
+
+    def _put(self, chunk):
+        if self._closed:
+            raise BrokenPipeError('the pipe was closed by the reader')
+        asyncio.run_coroutine_threadsafe(
+            self._queue.put(chunk), self.loop).result()
+
+    # the file object interface, used by the function in the executor
+
+    def write(self, data):
+        self._buffer += data
+        while len(self._buffer) >= self.chunk_size:
+            self._put(bytes(self._buffer[:self.chunk_size]))
+            del self._buffer[:self.chunk_size]
+        return len(data)
+
+    def flush(self):
+        pass
@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+import pytest
+
+from juju.client import client
+from juju.client.admission import Admission
+
+from .. import fakes
+
+CALLS = 5000
+
+
+async def _burst(admission):
+    controller = fakes.FakeController(latency=0.001)
+    controller.handle('Client', 'ModelInfo')(lambda params: {
+        'name': 'bench', 'uuid': controller.model_uuid})
+
+    async with controller.connection(admission=admission) as connection:
+        facade = client.ClientFacade.from_connection(connection)
+        pinger = client.PingerFacade.from_connection(connection)
+        start = time.perf_counter()
+        calls = asyncio.gather(*[facade.ModelInfo() for _ in range(CALLS)])
+        await asyncio.sleep(0)
+        await pinger.Ping()
+        ping = time.perf_counter() - start
+        await calls
+        return ping, time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_ping_during_burst(event_loop):
+    print('\nPing during a burst of {} calls:'.format(CALLS))
+    for name, admission in [('unlimited', None),
+                            ('max_in_flight=50', Admission(max_in_flight=50))]:
+        ping, total = await _burst(admission)
+        print('  {:<18} ping {:.3f}s, burst {:.3f}s'.format(
+            name, ping, total))
+        if admission is not None:
+            stats = admission.stats['bulk']
+            print('  {:<18} {} queued, mean delay {:.3f}s, max {:.3f}s'
+                  .format('', stats['queued'],
+                          stats['delay'] / stats['queued'],
+                          stats['max_delay']))
@@ -0,0 +1,106 @@
+import itertools
+import tempfile
+import time
+
+import pytest
+
+from juju.client.jujudata import JujuData
+from juju.model import BundleHandler, Model
+
+from .. import fakes
+
+APPS = 60
+LATENCY = 0.01
+
+
+def _plan():
+    changes = []
+    for i in range(APPS):
+        changes.append({'id': 'addCharm-{}'.format(i), 'method': 'addCharm',
+                        'args': ['local:xenial/app{}-1'.format(i), 'xenial'],
+                        'requires': []})
+        changes.append({'id': 'deploy-{}'.format(i), 'method': 'deploy',
+                        'args': ['$addCharm-{}'.format(i), 'xenial',
+                                 'app{}'.format(i), {}, '', {}, {}, {}],
+                        'requires': ['addCharm-{}'.format(i)]})
+    for i in range(APPS):
+        for unit in range(2):
+            changes.append({'id': 'addUnit-{}-{}'.format(i, unit),
+                            'method': 'addUnit',
+                            'args': ['$deploy-{}'.format(i), None],
+                            'requires': ['deploy-{}'.format(i)]})
+    for i in range(1, APPS):
+        changes.append({'id': 'addRelation-{}'.format(i),
+                        'method': 'addRelation',
+                        'args': ['$deploy-0:db', '$deploy-{}:db'.format(i)],
+                        'requires': ['deploy-0', 'deploy-{}'.format(i)]})
+    return changes
+
+
+def _controller():
+    """A fake controller that answers every request after LATENCY, and
+    reports the entities that bundle steps add through the AllWatcher.
+    """
+    controller = fakes.FakeController(facades={'Annotations': 2},
+                                      latency=LATENCY)
+    units = itertools.count()
+    relations = itertools.count()
+
+    controller.handle('Bundle', 'GetChanges')(
+        lambda params: {'changes': _plan()})
+
+    @controller.handle('Application', 'Deploy')
+    def deploy(params):
+        for app in params['applications']:
+            controller.add_deltas(('application', 'change', {
+                'name': app['application'], 'charm-url': app['charm-url'],
+                'life': 'alive'}))
+        return {'results': [{} for _ in params['applications']]}
+
+    @controller.handle('Application', 'AddUnits')
+    def add_units(params):
+        names = ['{}/{}'.format(params['application'], next(units))
+                 for _ in range(params['num-units'])]
+        for name in names:
+            controller.add_deltas(('unit', 'change', {
+                'name': name, 'application': params['application'],
+                'life': 'alive'}))
+        return {'units': names}
+
+    @controller.handle('Application', 'AddRelation')
+    def add_relation(params):
+        endpoints = {}
+        for spec in params['endpoints']:
+            app, name = spec.split(':')
+            endpoints[app] = {'name': name, 'role': 'requirer',
+                              'interface': 'db', 'scope': 'global'}
+        controller.add_deltas(('relation', 'change', {
+            'id': next(relations), 'key': ' '.join(params['endpoints']),
+            'endpoints': [{'application-name': app, 'relation': endpoint}
+                          for app, endpoint in endpoints.items()]}))
+        return {'endpoints': endpoints}
+
+    return controller
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_execute_plan(event_loop):
+    print('\nDeploying a bundle of {} applications with {}ms RPC '
+          'latency:'.format(APPS, LATENCY * 1000))
+    with tempfile.NamedTemporaryFile('w', suffix='.yaml') as bundle:
+        bundle.write('applications: {}\n')
+        bundle.flush()
+        for max_concurrency in (1, 8, 32):
+            controller = _controller()
+            model = Model(jujudata=JujuData())
+            async with controller.model(model):
+                handler = BundleHandler(model)
+                await handler.fetch_plan(bundle.name)
+                start = time.perf_counter()
+                await handler.execute_plan(max_concurrency=max_concurrency)
+                elapsed = time.perf_counter() - start
+                assert len(model.units) == APPS * 2
+                assert len(model.relations) == APPS - 1
+            print('  {:>2} at once: {} steps in {:.3f}s'.format(
+                max_concurrency, len(handler.plan.changes), elapsed))
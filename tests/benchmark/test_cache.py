@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+from juju.model import Model
+
+from .. import fakes
+
+APPLICATIONS = 20
+CALLS = 2000
+CALLS_PER_DELTA = 50
+
+
+async def _get_configs(cache):
+    controller = fakes.FakeController(latency=0.001)
+
+    @controller.handle('Application', 'Get')
+    def get(params):
+        return {'application': params['application'], 'charm': 'ubuntu',
+                'config': {'option-{}'.format(i): {'value': i}
+                           for i in range(50)},
+                'constraints': {}, 'series': 'bionic'}
+
+    def app_delta(i):
+        return ('application', 'change', {'name': 'app-{}'.format(i),
+                                          'charm-url': 'cs:ubuntu-1'})
+
+    controller.add_deltas(*[app_delta(i) for i in range(APPLICATIONS)])
+    async with controller.model(Model(cache=cache)) as model:
+        apps = [model.applications['app-{}'.format(i)]
+                for i in range(APPLICATIONS)]
+        start = time.perf_counter()
+        for i in range(CALLS):
+            if i % CALLS_PER_DELTA == 0:
+                model._watch_received.clear()
+                controller.add_deltas(app_delta(i % APPLICATIONS))
+                await model._watch_received.wait()
+            await apps[i % APPLICATIONS].get_config()
+        elapsed = time.perf_counter() - start
+        return elapsed, model.connection().cache
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_get_config_cache(event_loop):
+    uncached, _ = await _get_configs(cache=False)
+    cached, cache = await _get_configs(cache=True)
+    print('\n{} get_config calls on {} applications, one delta every {}:\n'
+          '  uncached {:.3f}s\n'
+          '  cached   {:.3f}s, hit ratio {:.1%}, {} entries using {:.1f}KB'
+          .format(CALLS, APPLICATIONS, CALLS_PER_DELTA, uncached, cached,
+                  cache.hit_ratio, len(cache), cache.size / 1024))
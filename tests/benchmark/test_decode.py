@@ -0,0 +1,80 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from juju.client.connection import Connection
+
+from .. import fakes
+
+CALLS = 10
+
+
+class _BigStatusController(fakes.FakeController):
+    """Answers FullStatus with a frame of nearly MAX_FRAME_SIZE, encoded
+    once up front so that encoding it doesn't add to the loop lag being
+    measured.
+    """
+    def __init__(self):
+        super().__init__()
+        machines = {}
+        size = 0
+        while size < Connection.MAX_FRAME_SIZE - 2**18:
+            i = str(len(machines))
+            machines[i] = {'id': i, 'series': 'bionic', 'dns-name': '10.0.0.1',
+                           'instance-id': 'machine-' + i,
+                           'agent-status': {'status': 'started', 'info': ''}}
+            size += len(json.dumps({i: machines[i]}))
+        self.status = json.dumps({'machines': machines})
+        self.handle('Client', 'FullStatus')(lambda params: self.status)
+
+    def encode(self, reply):
+        if reply['response'] is self.status:
+            return '{{"request-id": {}, "response": {}}}'.format(
+                reply['request-id'], self.status)
+        return super().encode(reply)
+
+
+async def _lag(controller, **kwargs):
+    """Return the worst delay of a 1ms ticker, and the total time, while
+    fetching FullStatus CALLS times. The replies are not turned into
+    facade objects, which would happen on the loop either way.
+    """
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    async with controller.connection(**kwargs) as connection:
+        tick = asyncio.ensure_future(ticker())
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            await connection.rpc({'type': 'Client', 'request': 'FullStatus',
+                                  'version': 1, 'params': {}})
+        elapsed = time.perf_counter() - start
+        done.set()
+        await tick
+        return max(lags), elapsed
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_decode_lag(event_loop):
+    controller = _BigStatusController()
+    print('\n{} FullStatus calls of {:.1f}MB:'.format(
+        CALLS, len(controller.status) / 2**20))
+    with ProcessPoolExecutor(max_workers=1) as processes:
+        for name, kwargs in [
+                ('on the loop', {}),
+                ('thread', {'decode_threshold': 2**16}),
+                ('process', {'decode_threshold': 2**16,
+                             'decode_executor': processes})]:
+            lag, elapsed = await _lag(controller, **kwargs)
+            print('  {:<12} max loop lag {:.1f}ms, total {:.3f}s'.format(
+                name, lag * 1000, elapsed))
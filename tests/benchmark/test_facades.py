@@ -0,0 +1,25 @@
+import time
+
+import pytest
+
+from juju.client import client
+
+from .. import fakes
+
+CALLS = 100000
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_from_connection(event_loop):
+    controller = fakes.FakeController()
+    async with controller.connection() as connection:
+        facades = [client.ApplicationFacade, client.ClientFacade,
+                   client.ActionFacade]
+        start = time.perf_counter()
+        for i in range(CALLS):
+            facades[i % len(facades)].from_connection(connection)
+        elapsed = time.perf_counter() - start
+
+    print('\n{} from_connection calls: {:.3f}s ({:.2f}us each)'.format(
+        CALLS, elapsed, elapsed / CALLS * 1e6))
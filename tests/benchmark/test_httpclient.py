@@ -0,0 +1,153 @@
+import asyncio
+import io
+import os
+import tempfile
+import time
+
+import pytest
+
+from juju.charmcache import CharmCache
+from juju.client.connection import Connection
+from juju.client.httpclient import HTTPClient
+from juju.client.jujudata import JujuData
+from juju.model import CharmArchiveGenerator, Model
+
+from .. import fakes
+
+UPLOADS = 50
+ARCHIVE = os.urandom(2**20)
+
+
+def _connection(server, loop):
+    connection = Connection()
+    connection.loop = loop
+    connection.endpoint = server.endpoint
+    connection.cacert = server.cert
+    connection.uuid = 'm-1'
+    connection.usertag = 'user-admin'
+    connection.password = 'secret'
+    connection._http_client = None
+    return connection
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_uploads(event_loop):
+    async with fakes.HTTPSServer(event_loop) as server:
+        model = Model(jujudata=JujuData())
+        model._connector._connection = _connection(server, event_loop)
+        print('\n{} uploads of a {}MB archive to a local server:'.format(
+            UPLOADS, len(ARCHIVE) // 2**20))
+
+        start = time.perf_counter()
+        for _ in range(UPLOADS):
+            await event_loop.run_in_executor(
+                None, model.add_local_charm, io.BytesIO(ARCHIVE), 'xenial',
+                len(ARCHIVE))
+        elapsed = time.perf_counter() - start
+        print('  {:<22} {:.3f}s, {} connections'.format(
+            'HTTPSConnection', elapsed, server.connections))
+
+        server.connections = 0
+        client = HTTPClient(model.connection())
+        start = time.perf_counter()
+        for _ in range(UPLOADS):
+            await client.request('POST', '/charms?series=xenial',
+                                 body=io.BytesIO(ARCHIVE))
+        elapsed = time.perf_counter() - start
+        await client.close()
+        print('  {:<22} {:.3f}s, {} connections'.format(
+            'HTTPClient', elapsed, server.connections))
+
+
+async def _max_lag(coro):
+    """Return the worst delay of a 1ms ticker while coro runs, and the
+    total time.
+    """
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    tick = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await coro
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    return max(lags), elapsed
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_archive_upload(event_loop):
+    with tempfile.TemporaryDirectory() as charm_dir:
+        with open(os.path.join(charm_dir, 'metadata.yaml'), 'w') as f:
+            f.write('name: big\n')
+        os.mkdir(os.path.join(charm_dir, 'wheelhouse'))
+        for i in range(20):
+            with open(os.path.join(charm_dir, 'wheelhouse', str(i)), 'wb') as f:
+                f.write(os.urandom(2**20))
+
+        async with fakes.HTTPSServer(event_loop) as server:
+            model = Model(jujudata=JujuData())
+            model._connector._connection = _connection(server, event_loop)
+
+            async def temporary_file():
+                with tempfile.NamedTemporaryFile() as fh:
+                    CharmArchiveGenerator(charm_dir).make_archive(fh.name)
+                    await model._upload_charm(fh, 'xenial')
+
+            print('\nUploading a 20MB charm:')
+            for name, upload in [
+                    ('temporary file', temporary_file()),
+                    ('stream', model.add_local_charm_dir(charm_dir, 'xenial'))]:
+                lag, elapsed = await _max_lag(upload)
+                print('  {:<15} max loop lag {:.1f}ms, total {:.3f}s'.format(
+                    name, lag * 1000, elapsed))
+            await model.connection().http_client().close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_redeploy(event_loop):
+    with tempfile.TemporaryDirectory() as tmp:
+        charm_dir = os.path.join(tmp, 'charm')
+        os.makedirs(os.path.join(charm_dir, 'wheelhouse'))
+        with open(os.path.join(charm_dir, 'metadata.yaml'), 'w') as f:
+            f.write('name: big\n')
+        for i in range(20):
+            with open(os.path.join(charm_dir, 'wheelhouse', str(i)), 'wb') as f:
+                f.write(os.urandom(2**20))
+
+        class _JujuData(JujuData):
+            cache = CharmCache(os.path.join(tmp, 'cache'))
+
+            def charm_cache(self):
+                return self.cache
+
+        async with fakes.HTTPSServer(event_loop) as server:
+            model = Model(jujudata=_JujuData())
+            model._connector._connection = _connection(server, event_loop)
+
+            async def has_charm(url):
+                return True
+            model._has_charm = has_charm
+
+            print('\nDeploying a 20MB charm:')
+            for name, uuid in [('first time', 'm-1'),
+                               ('to another model', 'm-2'),
+                               ('to the same model', 'm-2')]:
+                model.connection().uuid = uuid
+                requests = len(server.requests)
+                start = time.perf_counter()
+                await model.add_local_charm_dir(charm_dir, 'xenial')
+                print('  {:<18} {:.3f}s, {} upload'.format(
+                    name, time.perf_counter() - start,
+                    len(server.requests) - requests))
+            await model.connection().http_client().close()
@@ -0,0 +1,55 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+MEASURE = '''
+import json, re, resource, sys, time
+start = time.perf_counter()
+import juju.model
+if sys.argv[1:] == ['all']:
+    from juju.client import client
+    for version in client.CLIENTS:
+        client.CLIENTS[version]
+elapsed = time.perf_counter() - start
+try:
+    with open('/proc/self/statm') as f:
+        rss = int(f.read().split()[1]) * resource.getpagesize()
+except OSError:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+print(json.dumps({
+    'elapsed': elapsed,
+    'rss': rss,
+    'client_modules': sorted(m for m in sys.modules
+                             if re.match(r'juju\\.client\\._client\\d+$', m)),
+}))
+'''
+
+
+def _measure(*args):
+    output = subprocess.check_output([sys.executable, '-c', MEASURE] +
+                                     list(args))
+    return json.loads(output.decode('utf-8'))
+
+
+def _best(*args):
+    # The first run warms the bytecode cache.
+    runs = [_measure(*args) for _ in range(6)][1:]
+    return min(runs, key=lambda r: r['elapsed'])
+
+
+@pytest.mark.benchmark
+def test_import_time():
+    best = _best()
+    print('\nimport juju.model: {:.3f}s, RSS {:.1f}MB, '
+          'loaded {}'.format(best['elapsed'], best['rss'] / 2**20,
+                             ', '.join(best['client_modules']) or
+                             'no versioned client modules'))
+
+
+@pytest.mark.benchmark
+def test_import_all_facades():
+    best = _best('all')
+    print('\nimport juju.model and every facade version: {:.3f}s, '
+          'RSS {:.1f}MB'.format(best['elapsed'], best['rss'] / 2**20))
@@ -0,0 +1,50 @@
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from juju.client import client
+from juju.client.jsonstream import iter_array
+
+UNITS = 20000
+
+
+def _frame():
+    deltas = [['unit', 'change', {
+        'name': 'app/{}'.format(i), 'application': 'app', 'series': 'bionic',
+        'charm-url': 'cs:app-1', 'machine-id': str(i),
+        'ports': [], 'port-ranges': [], 'subordinate': False,
+        'workload-status': {'current': 'active', 'message': 'ready'},
+        'agent-status': {'current': 'idle', 'message': ''}}]
+        for i in range(UNITS)]
+    return json.dumps({'request-id': 1, 'response': {'deltas': deltas}})
+
+
+def _whole(frame):
+    results = client.AllWatcherNextResults.from_json(
+        json.loads(frame)['response'])
+    for delta in results.deltas:
+        pass
+
+
+def _streamed(frame):
+    for delta in iter_array(frame, ('response', 'deltas')):
+        delta = client.Delta(delta)
+
+
+@pytest.mark.benchmark
+def test_delta_stream():
+    frame = _frame()
+    print('\nDecoding {} deltas ({:.1f}MB):'.format(
+        UNITS, len(frame) / 2**20))
+    for name, decode in [('whole', _whole), ('streamed', _streamed)]:
+        start = time.perf_counter()
+        decode(frame)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        decode(frame)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('  {:<9} peak {:.1f}MB, {:.3f}s'.format(
+            name, peak / 2**20, elapsed))
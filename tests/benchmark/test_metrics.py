@@ -0,0 +1,32 @@
+import time
+
+import pytest
+
+from juju.client import client
+from juju.client.metrics import MetricsRegistry, MetricsSink
+
+from .. import fakes
+
+CALLS = 5000
+
+
+async def _calls(metrics):
+    controller = fakes.FakeController()
+    async with controller.connection(metrics=metrics) as connection:
+        facade = client.ClientFacade.from_connection(connection)
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            await facade.ModelInfo()
+        return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_metrics_overhead(event_loop):
+    print('\n{} sequential calls:'.format(CALLS))
+    for name, metrics in [('no metrics', None),
+                          ('MetricsSink', MetricsSink()),
+                          ('MetricsRegistry', MetricsRegistry())]:
+        elapsed = min([await _calls(metrics) for _ in range(3)])
+        print('  {:<16} {:.3f}s ({:.1f}us per call)'.format(
+            name, elapsed, elapsed / CALLS * 1e6))
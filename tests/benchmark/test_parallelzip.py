@@ -0,0 +1,58 @@
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from juju.model import CharmArchiveGenerator
+
+WORDS = [w * n for w in ('charm', 'juju', 'relation', 'hook', 'unit')
+         for n in range(1, 4)]
+
+
+def _charm_tree(path):
+    """A charm with 2000 small source files and four 8MB libraries, half
+    compressible text and half random bytes.
+    """
+    rng = random.Random(0)
+    for i in range(2000):
+        directory = os.path.join(path, 'lib', 'pkg{}'.format(i // 100))
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, 'mod{}.py'.format(i)), 'w') as f:
+            f.write(' '.join(rng.choice(WORDS) for _ in range(600)))
+    os.makedirs(os.path.join(path, 'wheelhouse'))
+    for i in range(4):
+        with open(os.path.join(path, 'wheelhouse', 'lib{}.so'.format(i)),
+                  'wb') as f:
+            for _ in range(64):
+                f.write(' '.join(rng.choice(WORDS)
+                                 for _ in range(9000)).encode()[:2**16])
+                f.write(os.urandom(2**16))
+    with open(os.path.join(path, 'metadata.yaml'), 'w') as f:
+        f.write('name: big\n')
+
+
+@pytest.mark.benchmark
+def test_make_archive():
+    cpus = os.cpu_count()
+    with tempfile.TemporaryDirectory() as tmp:
+        charm_dir = os.path.join(tmp, 'charm')
+        _charm_tree(charm_dir)
+        generator = CharmArchiveGenerator(charm_dir)
+        archive = os.path.join(tmp, 'charm.zip')
+        size = sum(os.path.getsize(os.path.join(d, name))
+                   for d, _, names in os.walk(charm_dir) for name in names)
+        print('\nArchiving a {:.0f}MB charm of 2005 files on {} CPU(s):'.format(
+            size / 2**20, cpus))
+        with ThreadPoolExecutor(cpus) as threads, \
+                ProcessPoolExecutor(cpus) as processes:
+            for name, executor in [('serial', None),
+                                   ('threads', threads),
+                                   ('processes', processes)]:
+                start = time.perf_counter()
+                generator.make_archive(archive, executor=executor)
+                print('  {:<10} {:.3f}s, {:.1f}MB'.format(
+                    name, time.perf_counter() - start,
+                    os.path.getsize(archive) / 2**20))
@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from juju.model import Model
+
+from .. import fakes
+
+UNITS = 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_run_fan_out(event_loop):
+    controller = fakes.FakeController(latency=0.001)
+
+    @controller.handle('Action', 'Run')
+    def run(params):
+        results = []
+        for i in range(UNITS):
+            results.append({'action': {
+                'tag': 'action-{}'.format(i),
+                'receiver': 'unit-app-{}'.format(i),
+            }})
+            controller.add_deltas(('action', 'change', {
+                'id': str(i), 'status': 'completed', 'message': '',
+                'results': {'Code': '0', 'Stdout': 'x' * 4096,
+                            'Stderr': ''},
+            }))
+        return {'results': results}
+
+    # the whole batch of deltas is a frame of over 4MB, which the fake
+    # couldn't send again on a new watcher after a reconnect
+    async with controller.model(Model(), max_frame_size=2**24) as model:
+        start = time.perf_counter()
+        batch = await model.run('hostname', applications=['app'],
+                                max_output_size=1024)
+        count = 0
+        async for result in batch:
+            assert result.code == 0
+            assert len(result.stdout) == 1024
+            count += 1
+        elapsed = time.perf_counter() - start
+
+    assert count == UNITS
+    assert not model.state.state.get('action')
+    print('\nrun on {} units: {:.3f}s ({:.0f} results/s)'.format(
+        UNITS, elapsed, UNITS / elapsed))
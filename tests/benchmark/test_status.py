@@ -0,0 +1,133 @@
+import json
+import time
+
+import pytest
+
+from juju.client import client
+
+from .. import fakes
+
+APPLICATIONS = 200
+UNITS_PER_APPLICATION = 80
+
+
+def _status(i):
+    return {'status': 'active', 'info': 'ready {}'.format(i),
+            'since': '2019-01-16T12:00:00Z', 'kind': '', 'version': '',
+            'life': '', 'data': {}, 'err': None}
+
+
+def full_status():
+    """Return a FullStatus response for a model with 16,000 units, each on
+    its own machine, which encodes to about 20MB of JSON.
+
+    """
+    applications = {}
+    machines = {}
+    for a in range(APPLICATIONS):
+        name = 'app-{}'.format(a)
+        units = {}
+        for u in range(UNITS_PER_APPLICATION):
+            machine = str(a * UNITS_PER_APPLICATION + u)
+            units['{}/{}'.format(name, u)] = {
+                'agent-status': _status(u),
+                'workload-status': _status(u),
+                'workload-version': '1.0',
+                'charm': '',
+                'leader': u == 0,
+                'machine': machine,
+                'opened-ports': ['80/tcp', '443/tcp'],
+                'public-address': '10.0.{}.{}'.format(a, u),
+                'subordinates': {},
+            }
+            machines[machine] = {
+                'agent-status': _status(u),
+                'instance-status': _status(u),
+                'dns-name': '10.0.{}.{}'.format(a, u),
+                'ip-addresses': ['10.0.{}.{}'.format(a, u)],
+                'instance-id': 'i-{:08x}'.format(int(machine)),
+                'series': 'bionic',
+                'id': machine,
+                'containers': {},
+                'hardware': 'arch=amd64 cores=2 mem=4096M',
+                'jobs': ['JobHostUnits'],
+                'has-vote': False,
+                'wants-vote': False,
+                'constraints': '',
+                'network-interfaces': {
+                    'eth0': {
+                        'ip-addresses': ['10.0.{}.{}'.format(a, u)],
+                        'mac-address': '00:16:3e:00:{:02x}:{:02x}'.format(
+                            a % 256, u),
+                        'gateway': '10.0.{}.1'.format(a),
+                        'dns-nameservers': ['10.0.0.2'],
+                        'space': 'default',
+                        'is-up': True,
+                    },
+                },
+            }
+        applications[name] = {
+            'charm': 'cs:{}-1'.format(name),
+            'series': 'bionic',
+            'exposed': False,
+            'life': '',
+            'relations': {'peer': [name]},
+            'can-upgrade-to': '',
+            'subordinate-to': [],
+            'units': units,
+            'meter-statuses': {},
+            'status': _status(a),
+            'workload-version': '1.0',
+            'endpoint-bindings': {'': 'default'},
+            'err': None,
+        }
+    return {
+        'model': {'name': 'bench', 'type': 'iaas', 'cloud-tag': 'cloud-aws',
+                  'region': 'us-east-1', 'version': '2.5.0',
+                  'available-version': '', 'model-status': _status(0),
+                  'meter-status': {'color': '', 'message': ''},
+                  'sla': 'unsupported'},
+        'machines': machines,
+        'applications': applications,
+        'remote-applications': {},
+        'offers': {},
+        'relations': [
+            {'id': i, 'key': 'app-{0}:peer'.format(i),
+             'interface': 'peer', 'scope': 'global',
+             'endpoints': [{'application': 'app-{}'.format(i),
+                            'name': 'peer', 'role': 'peer',
+                            'subordinate': False}],
+             'status': _status(i)}
+            for i in range(APPLICATIONS)
+        ],
+        'controller-timestamp': '2019-01-16T12:00:00Z',
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_full_status_decode(event_loop):
+    status = full_status()
+    controller = fakes.FakeController()
+    frame = controller.encode({'request-id': 0, 'response': status})
+    controller.handle('Client', 'FullStatus')(lambda params: status)
+    # Encode the 20MB reply once, rather than on every call.
+    controller.encode = lambda reply: frame.replace(
+        '"request-id": 0', '"request-id": {}'.format(reply['request-id']),
+        1)
+
+    async with controller.connection(max_frame_size=2**26) as connection:
+        facade = client.ClientFacade.from_connection(connection)
+        timings = []
+        for mode, call in [('Type objects', facade.FullStatus),
+                           ('raw dict', facade.raw().FullStatus),
+                           ('raw json', facade.raw(decode=False).FullStatus)]:
+            start = time.perf_counter()
+            for _ in range(3):
+                result = await call(None)
+            timings.append((mode, (time.perf_counter() - start) / 3))
+
+    assert json.loads(result)['response'] == status
+    print('\nFullStatus of {:.1f}MB:'.format(len(frame) / 2**20))
+    for mode, elapsed in timings:
+        print('  {:<14} {:.3f}s'.format(mode, elapsed))
@@ -0,0 +1,47 @@
+import asyncio
+import ssl
+import time
+
+import pytest
+
+from juju.client import tls
+
+from .. import fakes
+
+CONNECTIONS = 200
+
+
+async def _connect(server, get_context):
+    host, port = server.endpoint.split(':')
+    start = time.perf_counter()
+    for _ in range(CONNECTIONS):
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=get_context(server.cert),
+            server_hostname='localhost')
+        writer.write(b'x')
+        await reader.read(1)
+        writer.close()
+    return time.perf_counter() - start
+
+
+def _new_context(cert):
+    return ssl.create_default_context(purpose=ssl.Purpose.CLIENT_AUTH,
+                                      cadata=cert)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_handshakes(event_loop):
+    server = await fakes.TLSServer().start()
+    try:
+        print('\n{} TLS connections to a local server:'.format(CONNECTIONS))
+        for name, get_context in [('new context', _new_context),
+                                  ('shared context', tls.context_for)]:
+            elapsed = await _connect(server, get_context)
+            print('  {:<15} {:.3f}s ({:.2f}ms each)'.format(
+                name, elapsed, elapsed / CONNECTIONS * 1000))
+        stats = tls.context_for(server.cert).tls_stats
+        print('  {} of {} handshakes resumed a session'.format(
+            stats['resumed'], stats['handshakes']))
+    finally:
+        await server.close()
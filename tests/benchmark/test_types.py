@@ -0,0 +1,56 @@
+import gc
+import time
+import tracemalloc
+
+import pytest
+
+from juju.client import client
+
+from .test_status import full_status
+
+
+def _decode(status):
+    """Decode every application, unit and machine of a FullStatus
+    response, and read a nested field of each.
+
+    """
+    decoded = []
+    for data in status['applications'].values():
+        app = client.ApplicationStatus.from_json(data)
+        decoded.append(app)
+        app.status.status
+        for unit_data in data['units'].values():
+            unit = client.UnitStatus.from_json(unit_data)
+            decoded.append(unit)
+            unit.workload_status.status
+    for data in status['machines'].values():
+        machine = client.MachineStatus.from_json(data)
+        decoded.append(machine)
+        machine.agent_status.status
+    return decoded
+
+
+@pytest.mark.benchmark
+def test_decode_status_types():
+    status = full_status()
+
+    gc.collect()
+    start = time.perf_counter()
+    decoded = _decode(status)
+    elapsed = time.perf_counter() - start
+
+    del decoded
+    gc.collect()
+    tracemalloc.start()
+    decoded = _decode(status)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for obj in decoded:
+        obj.serialize()
+    serialize_elapsed = time.perf_counter() - start
+
+    print('\nDecoded {} status objects in {:.3f}s, using {:.1f}MB; '
+          'serialized them in {:.3f}s'.format(
+              len(decoded), elapsed, size / 2**20, serialize_elapsed))
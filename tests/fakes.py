@@ -0,0 +1,388 @@
+"""
+An in-process stand-in for the websocket API of a Juju controller.
+
+FakeController answers RPCs with registered handlers, feeds queued
+deltas to the AllWatcher and can add artificial latency to every reply,
+which makes it suitable both for unit tests and for benchmarks that need
+many units without a real controller.
+
+"""
+import asyncio
+import json
+import os
+import ssl
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import mock
+
+from . import base
+
+DEFAULT_FACADES = {
+    'Action': 3,
+    'AllWatcher': 1,
+    'Application': 8,
+    'Bundle': 1,
+    'Charms': 2,
+    'Client': 1,
+    'ModelConfig': 2,
+    'Pinger': 1,
+    'Resources': 1,
+}
+
+
+class FakeWebsocket:
+    def __init__(self, controller, max_size=None, endpoint=None):
+        self.controller = controller
+        self.max_size = max_size
+        self.endpoint = endpoint
+        self.open = True
+        self.sent = []
+        self._outgoing = asyncio.Queue()
+        self._replies = set()
+
+    async def send(self, message):
+        if not self.open:
+            raise _closed()
+        msg = json.loads(message)
+        self.sent.append(msg)
+        reply = asyncio.ensure_future(self._reply(msg))
+        self._replies.add(reply)
+        reply.add_done_callback(self._replies.discard)
+
+    async def _reply(self, msg):
+        try:
+            response = await self.controller.dispatch(msg)
+        except Exception as e:
+            reply = {'request-id': msg['request-id'], 'error': str(e),
+                     'error-code': '', 'response': {}}
+        else:
+            reply = {'request-id': msg['request-id'], 'response': response}
+        latency = self.controller.reply_latency.get(
+            self.endpoint, self.controller.latency)
+        if latency:
+            await asyncio.sleep(latency)
+        await self._outgoing.put(self.controller.encode(reply))
+
+    async def recv(self):
+        frame = await self._outgoing.get()
+        if frame is None:
+            raise _closed()
+        if self.max_size is not None and len(frame) > self.max_size:
+            # like websockets, fail the connection without a close code
+            from websockets.exceptions import ConnectionClosed, PayloadTooBig
+            self.open = False
+            raise ConnectionClosed(1006, '') from PayloadTooBig()
+        return frame
+
+    async def close(self):
+        self.open = False
+        for reply in list(self._replies):
+            reply.cancel()
+        await self._outgoing.put(None)
+
+
+def _closed():
+    from websockets.exceptions import ConnectionClosed
+    return ConnectionClosed(1000, 'closed')
+
+
+class FakeController:
+    """
+    A fake controller which can be connected to with
+    :meth:`juju.model.Model.connect` inside :meth:`patched`.
+
+    Handlers are registered per facade and request name and are called
+    with the decoded ``params`` of each request; they may be plain
+    functions or coroutines and must return the ``response`` dict.
+
+    Connecting to an endpoint (host:port) in ``unreachable`` is refused,
+    and connecting to one in ``endpoint_latency`` takes that many seconds.
+    Replies sent through connections to an endpoint in ``reply_latency``
+    are delayed by that many seconds instead of ``latency``.
+
+    """
+    model_uuid = 'd1c08ad5-2d1b-4b25-8e4b-1c3c5b9c0fe5'
+
+    def __init__(self, facades=None, latency=0):
+        self.facades = dict(DEFAULT_FACADES, **(facades or {}))
+        self.latency = latency
+        self.endpoint_latency = {}
+        self.reply_latency = {}
+        self.unreachable = set()
+        self.handlers = {}
+        self.calls = []
+        self.websockets = []
+        self._deltas = asyncio.Queue()
+        self.handle('Pinger', 'Ping')(lambda params: {})
+        self.handle('Client', 'WatchAll')(
+            lambda params: {'watcher-id': '1'})
+        self.handle('AllWatcher', 'Next')(self._next_deltas)
+        self.handle('AllWatcher', 'Stop')(lambda params: {})
+        self.handle('Client', 'ModelInfo')(lambda params: {
+            'name': 'fake', 'uuid': self.model_uuid})
+
+    def handle(self, facade, request):
+        def register(handler):
+            self.handlers[(facade, request)] = handler
+            return handler
+        return register
+
+    def encode(self, reply):
+        return json.dumps(reply)
+
+    async def dispatch(self, msg):
+        key = (msg['type'], msg['request'])
+        self.calls.append(key)
+        handler = self.handlers.get(key)
+        if handler is None:
+            raise NotImplementedError('{}.{}'.format(*key))
+        response = handler(msg.get('params', {}))
+        if asyncio.iscoroutine(response):
+            response = await response
+        return response
+
+    def add_deltas(self, *deltas):
+        """Queue deltas, each an (entity, type, data) tuple, to be returned
+        together by the next AllWatcher.Next call.
+
+        """
+        self._deltas.put_nowait([list(d) for d in deltas])
+
+    async def _next_deltas(self, params):
+        deltas = await self._deltas.get()
+        while not self._deltas.empty():
+            deltas.extend(self._deltas.get_nowait())
+        return {'deltas': deltas}
+
+    def login_response(self):
+        return {'response': {
+            'facades': [{'name': name, 'versions': [version]}
+                        for name, version in self.facades.items()],
+        }}
+
+    async def _connect(self, url, *args, max_size=None, **kwargs):
+        endpoint = url.split('/')[2]
+        if endpoint in self.unreachable:
+            raise ConnectionRefusedError(endpoint)
+        if self.endpoint_latency.get(endpoint):
+            await asyncio.sleep(self.endpoint_latency[endpoint])
+        ws = FakeWebsocket(self, max_size, endpoint)
+        self.websockets.append(ws)
+        return ws
+
+    @contextmanager
+    def patched(self):
+        """Patch the websocket layer so that connections reach this fake.
+
+        """
+        with \
+                mock.patch('websockets.connect', self._connect), \
+                mock.patch(
+                    'juju.client.connection.Connection.login',
+                    base.AsyncMock(return_value=self.login_response()),
+                ):
+            yield self
+
+    async def connect_model(self, model, **kwargs):
+        """Connect the given :class:`juju.model.Model` to this fake.
+
+        kwargs are passed on to Model.connect.
+
+        """
+        # Seed the initial AllWatcher response so that connect() returns.
+        self.add_deltas()
+        await model.connect(endpoint='0.1.2.3:17070', uuid=self.model_uuid,
+                            username='admin', password='secret', **kwargs)
+        return model
+
+    def connection(self, endpoint='0.1.2.3:17070', **kwargs):
+        """Return an async context manager which connects a
+        :class:`juju.client.connection.Connection` to this fake, inside
+        :meth:`patched`, and closes it on exit::
+
+            async with controller.connection(rpc_timeout=1) as connection:
+                ...
+
+        kwargs are passed on to Connection.connect.
+
+        """
+        from juju.client.connection import Connection
+        return _Connected(self, lambda: Connection.connect(endpoint, **kwargs),
+                          lambda connection: connection.close())
+
+    def model(self, model, **kwargs):
+        """Return an async context manager which connects the given
+        :class:`juju.model.Model` to this fake with :meth:`connect_model`,
+        inside :meth:`patched`, and disconnects it on exit.
+
+        """
+        return _Connected(self, lambda: self.connect_model(model, **kwargs),
+                          lambda model: model.disconnect())
+
+
+class _Connected:
+    def __init__(self, controller, connect, close):
+        self._patched = controller.patched()
+        self._connect = connect
+        self._close = close
+        self._connected = None
+
+    async def __aenter__(self):
+        self._patched.__enter__()
+        try:
+            self._connected = await self._connect()
+        except BaseException:
+            self._patched.__exit__(*sys.exc_info())
+            raise
+        return self._connected
+
+    async def __aexit__(self, *exc):
+        try:
+            await self._close(self._connected)
+        finally:
+            self._patched.__exit__(None, None, None)
+
+
+def self_signed_cert(hostname='localhost'):
+    """Return a PEM encoded self-signed certificate for hostname, and its
+    key.
+
+    """
+    import datetime
+    from cryptography import x509
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    # Like the certificates of Juju controllers.
+    key = rsa.generate_private_key(65537, 2048, default_backend())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, hostname)])
+    now = datetime.datetime.utcnow()
+    cert = x509.CertificateBuilder().subject_name(name).issuer_name(
+        name).public_key(key.public_key()).serial_number(
+        x509.random_serial_number()).not_valid_before(
+        now - datetime.timedelta(days=1)).not_valid_after(
+        now + datetime.timedelta(days=1)).add_extension(
+        x509.SubjectAlternativeName([x509.DNSName(hostname)]),
+        critical=False).sign(key, hashes.SHA256(), default_backend())
+    return (cert.public_bytes(serialization.Encoding.PEM).decode(),
+            key.private_bytes(serialization.Encoding.PEM,
+                              serialization.PrivateFormat.PKCS8,
+                              serialization.NoEncryption()).decode())
+
+
+class TLSServer:
+    """
+    A local TLS server standing in for a controller's API port, which
+    answers every byte it receives with one byte, for measuring TLS
+    handshakes.
+
+    """
+    def __init__(self, loop=None):
+        self.loop = loop or asyncio.get_event_loop()
+        self.cert, key = self_signed_cert()
+        self.context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        with tempfile.TemporaryDirectory() as tmp:
+            certfile = os.path.join(tmp, 'cert.pem')
+            keyfile = os.path.join(tmp, 'key.pem')
+            with open(certfile, 'w') as f:
+                f.write(self.cert)
+            with open(keyfile, 'w') as f:
+                f.write(key)
+            self.context.load_cert_chain(certfile, keyfile)
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(
+            self._serve, '127.0.0.1', 0, ssl=self.context, loop=self.loop)
+        return self
+
+    @property
+    def endpoint(self):
+        return '127.0.0.1:{}'.format(
+            self.server.sockets[0].getsockname()[1])
+
+    async def _serve(self, reader, writer):
+        try:
+            while True:
+                data = await reader.read(1)
+                if not data:
+                    break
+                writer.write(data)
+        except (ConnectionError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class HTTPSServer(TLSServer):
+    """
+    A local HTTPS server standing in for the HTTP endpoints of a
+    controller. It keeps connections alive, records each request as a
+    (method, path, headers, body) tuple in requests and answers it with
+    reply(method, path, headers, body), which returns a status and a
+    JSON-encodable value.
+
+    """
+    def __init__(self, loop=None):
+        super().__init__(loop)
+        self.requests = []
+        self.connections = 0
+        self.reply = lambda *request: (200, {'charm-url': 'local:xenial/a-1'})
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                self.requests.append(request)
+                status, value = self.reply(*request)
+                body = json.dumps(value).encode()
+                writer.write('HTTP/1.1 {} X\r\nContent-Type: application/json'
+                             '\r\nContent-Length: {}\r\n\r\n'.format(
+                                 status, len(body)).encode() + body)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        method, path, _ = line.decode().split(' ', 2)
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode()
+            if line == '\r\n':
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        if headers.get('transfer-encoding') == 'chunked':
+            chunks = []
+            while True:
+                size = int(await reader.readline(), 16)
+                chunks.append(await reader.readexactly(size + 2))
+                if not size:
+                    break
+            body = b''.join(chunk[:-2] for chunk in chunks)
+        else:
+            body = await reader.readexactly(
+                int(headers.get('content-length', 0)))
+        return method, path, headers, body
@@ -0,0 +1,143 @@
+import asyncio
+
+import asynctest
+import mock
+
+from juju.model import Model
+
+from .. import base, fakes
+
+
+def _make_delta(entity, type_, data=None):
+    from juju.client.client import Delta
+    from juju.delta import get_entity_delta
+
+    delta = Delta([entity, type_, data])
+    return get_entity_delta(delta)
+
+
+def _enqueue_response(msg, **kwargs):
+    results = []
+    for action in msg['params']['actions']:
+        receiver = action.receiver
+        if receiver == 'unit-app-1':
+            results.append({'error': {'message': 'unit not found'}})
+        else:
+            results.append({'action': {
+                'tag': 'action-{}'.format(receiver[len('unit-'):]),
+                'receiver': receiver,
+                'name': action.name,
+            }})
+    return {'request-id': 1, 'response': {'results': results}}
+
+
+class TestEnqueueAction(asynctest.TestCase):
+    def _make_model(self):
+        model = Model()
+        model._connector = mock.MagicMock()
+        model._connector.loop = self.loop
+        connection = model._connector.connection.return_value
+        connection.facades = {'Action': 3}
+        connection._facade_cache = {}
+        connection.rpc = base.AsyncMock(side_effect=_enqueue_response)
+        return model, connection
+
+    async def _finish(self, model, action_id, status='completed'):
+        delta = _make_delta('action', 'change', {
+            'id': action_id, 'status': status})
+        old, new = model.state.apply_delta(delta)
+        await model._notify_observers(delta, old, new)
+
+    async def test_chunks_and_partial_failure(self):
+        model, connection = self._make_model()
+        batch = await model.enqueue_action(
+            'backup', ['app/0', 'app/1', 'app/2'], {'dir': '/srv'},
+            chunk_size=2)
+
+        self.assertEqual(connection.rpc.call_count, 2)
+        msg = connection.rpc.call_args_list[0][0][0]
+        self.assertEqual(msg['request'], 'Enqueue')
+        self.assertEqual(len(msg['params']['actions']), 2)
+        self.assertTrue(connection.rpc.call_args_list[0][1]['partial'])
+        self.assertEqual(batch.action_ids, {'app/0': 'app-0',
+                                            'app/2': 'app-2'})
+        self.assertEqual(batch.errors, {'app/1': 'unit not found'})
+
+        await self._finish(model, 'app-2', 'failed')
+        await self._finish(model, 'app-0')
+        finished = []
+        async for action in batch:
+            finished.append((action.entity_id, action.status))
+        self.assertEqual(finished, [('app-2', 'failed'),
+                                    ('app-0', 'completed')])
+
+    async def test_already_finished(self):
+        model, connection = self._make_model()
+        # the action completed before Enqueue returned its id
+        delta = _make_delta('action', 'add', {
+            'id': 'app-0', 'status': 'completed'})
+        model.state.apply_delta(delta)
+
+        batch = await model.enqueue_action('backup', ['app/0'])
+        results = await batch.wait()
+        self.assertEqual(list(results), ['app/0'])
+        self.assertEqual(results['app/0'].status, 'completed')
+
+    async def test_cancelled_and_aborted(self):
+        model, connection = self._make_model()
+        batch = await model.enqueue_action('backup', ['app/0', 'app/2'])
+        await self._finish(model, 'app-0', 'cancelled')
+        await self._finish(model, 'app-2', 'aborted')
+        results = await asyncio.wait_for(batch.wait(), 1, loop=self.loop)
+        self.assertEqual(results['app/0'].status, 'cancelled')
+        self.assertEqual(results['app/2'].status, 'aborted')
+
+
+class TestRun(asynctest.TestCase):
+    async def test_run_streams_results(self):
+        from juju.action import RunResult
+
+        controller = fakes.FakeController()
+
+        @controller.handle('Action', 'Run')
+        def run(params):
+            assert params['applications'] == ['app']
+            assert params['timeout'] == 2000000000
+            return {'results': [
+                {'action': {'tag': 'action-{}'.format(i),
+                            'receiver': 'unit-app-{}'.format(i)}}
+                for i in range(2)
+            ]}
+
+        async with controller.model(Model()) as model:
+            batch = await model.run('hostname', timeout=2,
+                                    applications=['app'],
+                                    max_output_size=4)
+            self.assertEqual(batch.action_ids, {'app/0': '0',
+                                                'app/1': '1'})
+            controller.add_deltas(('action', 'change', {
+                'id': '1', 'status': 'completed', 'message': '',
+                'results': {'Code': '0', 'Stdout': 'host-1',
+                            'Stderr': ''},
+            }))
+            result = await batch.__anext__()
+            self.assertEqual(result, RunResult(
+                receiver='app/1', status='completed', code=0,
+                stdout=b'host', stderr=b'', message='',
+                truncated=True))
+            with self.assertRaises(KeyError):
+                model.state.entity_history('action', '1')
+
+            controller.add_deltas(('action', 'change', {
+                'id': '0', 'status': 'failed', 'message': 'timed out',
+                'results': {},
+            }))
+            remaining = await batch.wait()
+            self.assertEqual(remaining['app/0'].status, 'failed')
+            self.assertIsNone(remaining['app/0'].code)
+
+    def test_receiver_name(self):
+        from juju.action import receiver_name
+
+        self.assertEqual(receiver_name('unit-my-app-10'), 'my-app/10')
+        self.assertEqual(receiver_name('machine-0-lxd-2'), '0/lxd/2')
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from juju.client import client
+from juju.client.admission import BULK, CONTROL, WATCHER, Admission, classify
+
+from .. import fakes
+
+
+def _msg(type_, request):
+    return {'type': type_, 'request': request}
+
+
+def test_classify():
+    assert classify(_msg('Pinger', 'Ping')) == CONTROL
+    assert classify(_msg('Admin', 'Login')) == CONTROL
+    assert classify(_msg('AllWatcher', 'Next')) == WATCHER
+    assert classify(_msg('Client', 'WatchAll')) == WATCHER
+    assert classify(_msg('Client', 'FullStatus')) == BULK
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight(event_loop):
+    controller = fakes.FakeController()
+    release = asyncio.Event()
+
+    @controller.handle('Client', 'FullStatus')
+    async def full_status(params):
+        await release.wait()
+        return {}
+
+    admission = Admission(max_in_flight=2)
+    async with controller.connection(admission=admission) as connection:
+        facade = client.ClientFacade.from_connection(connection)
+        calls = asyncio.gather(*[facade.FullStatus(None) for _ in range(5)])
+        await asyncio.sleep(0.01)
+        assert controller.calls.count(('Client', 'FullStatus')) == 2
+        assert admission.queued == 3
+        # pings are never held back
+        await client.PingerFacade.from_connection(connection).Ping()
+
+        release.set()
+        await calls
+        assert controller.calls.count(('Client', 'FullStatus')) == 5
+        assert admission.in_flight == 0
+        stats = admission.stats['bulk']
+        assert stats['admitted'] == 5
+        assert stats['queued'] == 3
+        assert stats['max_delay'] > 0
+        assert stats['delay'] >= stats['max_delay']
+        assert admission.stats['control']['admitted'] >= 2
+        assert connection.connect_params()['admission'] is admission
+
+
+@pytest.mark.asyncio
+async def test_rate_and_priority(event_loop):
+    admission = Admission(rate=100, burst=1, loop=event_loop)
+    admitted = []
+
+    async def call(name, type_, request):
+        priority = await admission.acquire(_msg(type_, request))
+        admitted.append(name)
+        admission.release(priority)
+
+    start = event_loop.time()
+    await asyncio.gather(
+        call('bulk-1', 'Client', 'FullStatus'),
+        call('bulk-2', 'Client', 'FullStatus'),
+        call('bulk-3', 'Client', 'FullStatus'),
+        call('watcher', 'AllWatcher', 'Next'),
+        call('ping', 'Pinger', 'Ping'),
+    )
+    # the first call takes the only token; then the watcher goes ahead of
+    # the queued bulk calls, at 100 calls a second
+    assert admitted == ['bulk-1', 'ping', 'watcher', 'bulk-2', 'bulk-3']
+    assert event_loop.time() - start >= 0.03
+    assert admission.stats['watcher']['queued'] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter(event_loop):
+    admission = Admission(max_in_flight=1, loop=event_loop)
+    first = await admission.acquire(_msg('Client', 'FullStatus'))
+    waiter = event_loop.create_task(
+        admission.acquire(_msg('Client', 'FullStatus')))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    admission.release(first)
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert admission.in_flight == 0
+    assert admission.queued == 0
@@ -0,0 +1,124 @@
+import asyncio
+
+import mock
+import pytest
+
+from juju.client import client
+from juju.errors import JujuError
+from juju.model import BundleHandler
+
+
+class _Handler(BundleHandler):
+    """Executes plans with steps that take delay seconds and record when
+    they start and end.
+    """
+    def __init__(self, loop, changes, delay=0.01, fail=()):
+        self.model = mock.Mock(loop=loop)
+        self.references = {}
+        self.plan = client.BundleChangesResults(changes=[
+            client.BundleChange(id_=id_, method=method, args=args,
+                                requires=requires)
+            for id_, method, args, requires in changes])
+        self.delay = delay
+        self.fail = fail
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+    async def _step(self, name):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.events.append(('start', name))
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        self.events.append(('end', name))
+        if name in self.fail:
+            raise JujuError('{} failed'.format(name))
+        return name
+
+    async def addCharm(self, charm, series):
+        return await self._step(charm)
+
+    async def deploy(self, charm, series, application, *args):
+        assert self.resolve(charm) in self.references.values()
+        return await self._step(application)
+
+    async def addUnit(self, application, to):
+        return await self._step(self.resolve(application) + '/unit')
+
+    async def addRelation(self, endpoint1, endpoint2):
+        return await self._step('{} {}'.format(endpoint1, endpoint2))
+
+
+def _plan(apps):
+    changes = []
+    for i in range(apps):
+        changes.append(('addCharm-{}'.format(i), 'addCharm',
+                        ['local:app{}'.format(i), 'xenial'], []))
+        changes.append(('deploy-{}'.format(i), 'deploy',
+                        ['$addCharm-{}'.format(i), 'xenial', 'app{}'.format(i),
+                         {}, '', {}, {}, {}], ['addCharm-{}'.format(i)]))
+    for i in range(apps):
+        for unit in range(2):
+            # units only refer to their application
+            changes.append(('addUnit-{}-{}'.format(i, unit), 'addUnit',
+                            ['$deploy-{}'.format(i), None], []))
+    for i in range(1, apps):
+        # the requirements of relations are given as placeholders only
+        changes.append(('addRelation-{}'.format(i), 'addRelation',
+                        ['$deploy-0:db', '$deploy-{}:db'.format(i)], []))
+    return changes
+
+
+@pytest.mark.asyncio
+async def test_execute_plan(event_loop):
+    handler = _Handler(event_loop, _plan(10))
+    await handler.execute_plan(max_concurrency=4)
+
+    assert handler.max_running == 4
+    assert len(handler.references) == len(handler.plan.changes)
+    assert handler.references['deploy-3'] == 'app3'
+    assert handler.references['addRelation-2'] == '$deploy-0:db $deploy-2:db'
+
+    events = handler.events
+    for i in range(10):
+        app = 'app{}'.format(i)
+        assert events.index(('end', 'local:' + app)) < \
+            events.index(('start', app))
+        # units of an application are added one after another
+        assert events.index(('end', app + '/unit')) < \
+            events.index(('start', app + '/unit'), events.index(
+                ('start', app + '/unit')) + 1)
+    for i in range(1, 10):
+        relation = '$deploy-0:db $deploy-{}:db'.format(i)
+        assert events.index(('end', 'app0')) < \
+            events.index(('start', relation))
+        assert events.index(('end', 'app{}'.format(i))) < \
+            events.index(('start', relation))
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_errors(event_loop):
+    # the first error in the order of the plan is raised, although
+    # local:app3 fails first
+    handler = _Handler(event_loop, _plan(4), fail={'app1', 'local:app3'})
+    with pytest.raises(JujuError) as e:
+        await handler.execute_plan(max_concurrency=8)
+    assert str(e.value) == 'app1 failed'
+    assert handler.running == 0
+    # steps before the failure in the plan still ran, but nothing that
+    # needed app1 or came after it
+    assert ('end', 'app0') in handler.events
+    assert ('start', 'app1/unit') not in handler.events
+    assert ('start', 'app2/unit') not in handler.events
+    assert not any('$deploy-1' in name for _, name in handler.events)
+
+    handler = _Handler(event_loop, [
+        ('a', 'addCharm', ['a', 'xenial'], ['b']),
+        ('b', 'addCharm', ['b', 'xenial'], ['a']),
+        ('c', 'addCharm', ['c', 'xenial'], [])])
+    with pytest.raises(JujuError, match='a, b wait on each other'):
+        await handler.execute_plan()
+    assert handler.references == {'c': 'c'}
@@ -0,0 +1,155 @@
+import asynctest
+import mock
+
+from juju.client import client
+from juju.client.cache import Cacheable, ResponseCache
+from juju.model import Model
+
+from .. import fakes
+
+
+class TestResponseCache(asynctest.TestCase):
+    async def test_model_cache(self):
+        controller = fakes.FakeController()
+        config = {'trust': False}
+
+        @controller.handle('Application', 'Get')
+        def get(params):
+            return {'application': params['application'], 'charm': 'ubuntu',
+                    'config': dict(config), 'constraints': {},
+                    'series': 'bionic'}
+
+        @controller.handle('Application', 'Set')
+        def set_config(params):
+            config.update(params['options'])
+            return {}
+
+        def calls():
+            return controller.calls.count(('Application', 'Get'))
+
+        async def delta(name):
+            model._watch_received.clear()
+            controller.add_deltas(('application', 'change', {
+                'name': name, 'charm-url': 'cs:ubuntu-1'}))
+            await model._watch_received.wait()
+
+        controller.add_deltas(
+            ('application', 'change', {'name': 'app',
+                                       'charm-url': 'cs:ubuntu-1'}),
+            ('application', 'change', {'name': 'other',
+                                       'charm-url': 'cs:ubuntu-1'}))
+        async with controller.model(Model(cache=True)) as model:
+            cache = model.connection().cache
+            app = model.applications['app']
+            self.assertEqual(await app.get_config(), {'trust': False})
+            result = await app.get_config()
+            self.assertEqual(result, {'trust': False})
+            self.assertEqual(calls(), 1)
+            # every hit is a copy
+            result['trust'] = True
+            self.assertEqual(await app.get_config(), {'trust': False})
+            self.assertEqual(calls(), 1)
+
+            # a change to another application keeps the entry
+            await delta('other')
+            await app.get_config()
+            self.assertEqual(calls(), 1)
+            await delta('app')
+            await app.get_config()
+            self.assertEqual(calls(), 2)
+
+            # so does a write made through the connection
+            await app.set_config({'trust': True})
+            self.assertEqual(await app.get_config(), {'trust': True})
+            self.assertEqual(calls(), 3)
+
+            cache.invalidate('Application')
+            await app.get_config()
+            self.assertEqual(calls(), 4)
+
+            self.assertEqual(cache.stats['hits'], 3)
+            self.assertEqual(cache.stats['misses'], 4)
+            self.assertEqual(cache.hit_ratio, 3 / 7)
+            self.assertEqual(len(cache), 1)
+            self.assertGreater(cache.size, 0)
+
+    async def test_ttl(self):
+        loop = mock.Mock(time=mock.Mock(return_value=0))
+        cache = ResponseCache(loop, {('Client', 'FullStatus'): Cacheable(10)})
+        replies = []
+
+        async def rpc(msg, encoder, partial):
+            replies.append(msg)
+            return {'response': len(replies)}
+
+        msg = {'type': 'Client', 'request': 'FullStatus', 'version': 1,
+               'params': {}}
+        self.assertEqual(await cache.call(dict(msg), None, False, rpc),
+                         {'response': 1})
+        loop.time.return_value = 9
+        self.assertEqual(await cache.call(dict(msg), None, False, rpc),
+                         {'response': 1})
+        # partial calls are cached separately
+        self.assertEqual(await cache.call(dict(msg), None, True, rpc),
+                         {'response': 2})
+        loop.time.return_value = 10
+        self.assertEqual(await cache.call(dict(msg), None, False, rpc),
+                         {'response': 3})
+        self.assertEqual(len(replies), 3)
+
+    async def test_lru(self):
+        loop = mock.Mock(time=mock.Mock(return_value=0))
+        cache = ResponseCache(loop, {('Client', 'FullStatus'): Cacheable(10)},
+                              max_entries=2)
+        replies = []
+
+        async def rpc(msg, encoder, partial):
+            replies.append(msg)
+            return {'response': len(replies)}
+
+        def status(name):
+            return {'type': 'Client', 'request': 'FullStatus', 'version': 1,
+                    'params': {'patterns': [name]}}
+
+        await cache.call(status('a'), None, False, rpc)
+        await cache.call(status('b'), None, False, rpc)
+        # a hit makes 'a' the most recently used, so 'b' is evicted
+        await cache.call(status('a'), None, False, rpc)
+        await cache.call(status('c'), None, False, rpc)
+        self.assertEqual(len(replies), 3)
+        self.assertEqual(await cache.call(status('a'), None, False, rpc),
+                         {'response': 1})
+        self.assertEqual(await cache.call(status('b'), None, False, rpc),
+                         {'response': 4})
+
+    async def test_model_delta(self):
+        controller = fakes.FakeController()
+        controller.handle('ModelConfig', 'ModelGet')(lambda params: {
+            'config': {'trust': {'value': False, 'source': 'default'}}})
+        controller.handle('Client', 'GetModelConstraints')(
+            lambda params: {'constraints': {'mem': 1024}})
+
+        def calls():
+            return (controller.calls.count(('ModelConfig', 'ModelGet')) +
+                    controller.calls.count(('Client', 'GetModelConstraints')))
+
+        async with controller.model(Model(cache=True)) as model:
+            facade = client.ClientFacade.from_connection(
+                model.connection())
+            for _ in range(2):
+                await model.get_config()
+                await facade.GetModelConstraints()
+            self.assertEqual(calls(), 2)
+
+            # the model's config or constraints may have changed
+            model._watch_received.clear()
+            controller.add_deltas(('model', 'change', {
+                'model-uuid': controller.model_uuid, 'name': 'fake',
+                'life': 'alive'}))
+            await model._watch_received.wait()
+            self.assertEqual(
+                model.state.entity_data(
+                    'model', controller.model_uuid, -1)['name'], 'fake')
+            await model.get_config()
+            await facade.GetModelConstraints()
+            self.assertEqual(calls(), 4)
@@ -0,0 +1,170 @@
+import io
+import os
+import zipfile
+
+import mock
+import pytest
+
+from juju.charmcache import CharmCache
+from juju.client.jujudata import FileJujuData, JujuData
+from juju.model import CharmArchiveGenerator, Model
+
+from .. import fakes
+
+
+def _charm(path):
+    os.makedirs(os.path.join(path, 'hooks'))
+    with open(os.path.join(path, 'metadata.yaml'), 'w') as f:
+        f.write('name: a\n')
+    with open(os.path.join(path, 'hooks', 'install'), 'w') as f:
+        f.write('#!/bin/sh\n')
+    os.symlink('install', os.path.join(path, 'hooks', 'start'))
+    return path
+
+
+def test_content_hash(tmpdir):
+    charm_dir = _charm(str(tmpdir.join('a')))
+    generator = CharmArchiveGenerator(charm_dir)
+    content_hash = generator.content_hash()
+
+    # ignored files don't count
+    with open(os.path.join(charm_dir, '.hidden'), 'w') as f:
+        f.write('x')
+    assert generator.content_hash() == content_hash
+
+    cache = CharmCache()
+    assert generator.content_hash(cache) == content_hash
+    assert sorted(cache.files) == [
+        os.path.join(charm_dir, 'hooks', 'install'),
+        os.path.join(charm_dir, 'metadata.yaml')]
+
+    # unchanged files aren't read again
+    metadata = os.path.join(charm_dir, 'metadata.yaml')
+    st = os.stat(metadata)
+    with open(metadata, 'w') as f:
+        f.write('name: b\n')
+    os.utime(metadata, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert generator.content_hash(cache) == content_hash
+    assert generator.content_hash() != content_hash
+
+    os.utime(metadata)
+    assert generator.content_hash(cache) == generator.content_hash()
+
+    os.chmod(os.path.join(charm_dir, 'hooks', 'install'), 0o755)
+    assert generator.content_hash(cache) != content_hash
+
+
+def test_archives(tmpdir):
+    charm_dir = _charm(str(tmpdir.join('a')))
+    generator = CharmArchiveGenerator(charm_dir)
+    cache = CharmCache(str(tmpdir.join('cache')))
+    assert cache.archive('h1') is None
+
+    out = io.BytesIO()
+    cache.archive_to('h1', generator.make_archive, out)
+    with open(cache.archive('h1'), 'rb') as f:
+        assert f.read() == out.getvalue()
+    assert sorted(zipfile.ZipFile(out).namelist()) == [
+        'hooks/', 'hooks/install', 'hooks/start', 'metadata.yaml']
+
+    def fail(f):
+        f.write(b'x')
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        cache.archive_to('h2', fail, io.BytesIO())
+    assert cache.archive('h2') is None
+    assert os.listdir(cache.path) == ['h1.charm']
+
+    cache.MAX_ARCHIVES = 2
+    for content_hash in ['h2', 'h3']:
+        cache.archive_to(content_hash, generator.make_archive, io.BytesIO())
+    assert sorted(os.listdir(cache.path)) == ['h2.charm', 'h3.charm']
+
+
+def test_uploads(tmpdir):
+    cache = CharmCache(str(tmpdir))
+    cache.record_upload('m-1', 'xenial', 'h1', 'local:xenial/a-1')
+    cache.record_upload('m-1', 'bionic', 'h1', 'local:bionic/a-1')
+    cache.file_digest(str(tmpdir.join('index.json')),
+                      os.stat(str(tmpdir.join('index.json'))))
+    cache.save()
+
+    cache = CharmCache(str(tmpdir))
+    assert cache.uploaded('m-1', 'xenial', 'h1') == 'local:xenial/a-1'
+    assert cache.uploaded('m-2', 'xenial', 'h1') is None
+    assert len(cache.files) == 1
+    cache.forget_upload('m-1', 'xenial', 'h1')
+    assert CharmCache(str(tmpdir)).uploaded('m-1', 'xenial', 'h1') is None
+
+    cache.MAX_UPLOADS = 2
+    cache.record_upload('m-2', 'xenial', 'h1', 'local:xenial/a-1')
+    cache.record_upload('m-3', 'xenial', 'h1', 'local:xenial/a-1')
+    assert list(cache.uploads) == ['m-2/xenial/h1', 'm-3/xenial/h1']
+
+
+def test_file_jujudata(tmpdir, monkeypatch):
+    monkeypatch.setenv('JUJU_DATA', str(tmpdir))
+    assert FileJujuData().charm_cache().path == str(tmpdir.join('charm-cache'))
+    assert FileJujuData(cache_charms=False).charm_cache().path is None
+
+
+class _JujuData(JujuData):
+    def __init__(self, path):
+        self.cache = CharmCache(path)
+
+    def charm_cache(self):
+        return self.cache
+
+
+@pytest.mark.asyncio
+async def test_add_local_charm_dir(event_loop, tmpdir):
+    charm_dir = _charm(str(tmpdir.join('a')))
+    controller = fakes.FakeController()
+    charms = set()
+
+    @controller.handle('Charms', 'CharmInfo')
+    def charm_info(params):
+        if params['url'] not in charms:
+            raise Exception('charm not found')
+        return {'url': params['url'], 'revision': 1}
+
+    async with fakes.HTTPSServer(event_loop) as server:
+        def upload(method, path, headers, body):
+            charms.add('local:xenial/a-1')
+            return 200, {'charm-url': 'local:xenial/a-1'}
+        server.reply = upload
+
+        jujudata = _JujuData(str(tmpdir.join('cache')))
+        async with controller.model(Model(jujudata=jujudata)) as model:
+            connection = model.connection()
+            connection.endpoint = server.endpoint
+            connection.cacert = server.cert
+            with mock.patch.object(event_loop, 'run_in_executor',
+                                   wraps=event_loop.run_in_executor) as run:
+                url = await model.add_local_charm_dir(charm_dir, 'xenial')
+            # the cache isn't written to on the loop
+            assert mock.call(None, jujudata.cache.record_upload, model.info.uuid,
+                             'xenial', mock.ANY, url) in run.call_args_list
+            assert url == 'local:xenial/a-1'
+            assert len(server.requests) == 1
+            assert 'transfer-encoding' in server.requests[0][2]
+
+            # the model still has it
+            assert await model.add_local_charm_dir(charm_dir, 'xenial') == url
+            assert len(server.requests) == 1
+            assert controller.calls.count(('Charms', 'CharmInfo')) == 1
+
+            # the model lost it, so it's uploaded again from the cache
+            charms.clear()
+            assert await model.add_local_charm_dir(charm_dir, 'xenial') == url
+            assert len(server.requests) == 2
+            assert server.requests[1][2]['content-length'] == str(
+                len(server.requests[0][3]))
+            assert server.requests[1][3] == server.requests[0][3]
+
+            # another model
+            connection.uuid = 'other'
+            assert await model.add_local_charm_dir(charm_dir, 'xenial') == url
+            assert len(server.requests) == 3
+            assert server.requests[2][1].startswith('/model/other/')
@@ -2,9 +2,21 @@
 Tests for generated client code
 
 """
+import copy
+import json
+import pickle
+import subprocess
+import sys
 
 import mock
 from juju.client import client
+from juju.client.connection import Connection
+from juju.client.facade import FacadeSchema
+from juju.errors import JujuAPIError, JujuError
+
+import pytest
+
+from .. import fakes
 
 
 def test_basics():
@@ -16,11 +28,181 @@ def test_basics():
 def test_from_connection():
     connection = mock.Mock()
     connection.facades = {"Action": 2}
+    connection._facade_cache = {}
     action_facade = client.ActionFacade.from_connection(connection)
     assert action_facade
 
 
+def test_from_connection_cache():
+    connection = Connection()
+    connection.facades = {}
+    connection._build_facades([{'name': 'Action', 'versions': [2]},
+                               {'name': 'AllWatcher', 'versions': [1]},
+                               {'name': 'Client', 'versions': [1]}])
+    action_facade = client.ActionFacade.from_connection(connection)
+    assert action_facade.connection is connection
+    assert client.ActionFacade.from_connection(connection) is action_facade
+    assert client.ClientFacade.from_connection(connection) is not \
+        action_facade
+    # a copy with different options doesn't replace the cached facade
+    assert action_facade.partial() is not action_facade
+    assert client.ActionFacade.from_connection(connection) is action_facade
+    # watchers keep their watcher's id, so each caller gets its own
+    assert client.AllWatcherFacade.from_connection(connection) is not \
+        client.AllWatcherFacade.from_connection(connection)
+
+    # reconnecting may negotiate different versions
+    connection._build_facades([{'name': 'Action', 'versions': [3]}])
+    reconnected = client.ActionFacade.from_connection(connection)
+    assert reconnected is not action_facade
+    assert reconnected.version == 3
+
+
+@pytest.mark.asyncio
+async def test_from_connection_cache_reconnect(event_loop):
+    controller = fakes.FakeController()
+    async with controller.connection() as connection:
+        action_facade = client.ActionFacade.from_connection(connection)
+        await connection.reconnect()
+        assert connection.facades == controller.facades
+        assert client.ActionFacade.from_connection(connection) is not \
+            action_facade
+
+
 def test_to_json():
     uml = client.UserModelList([client.UserModel()])
     assert uml.to_json() == ('{"user-models": [{"last-connection": null, '
                              '"model": null}]}')
+
+
+@pytest.mark.asyncio
+async def test_partial(event_loop):
+    controller = fakes.FakeController()
+
+    @controller.handle('Application', 'DestroyUnits')
+    def destroy_units(params):
+        return {'results': [
+            {'error': {'message': 'no unit {}'.format(name)}}
+            if name.endswith('/1') else {'info': {}}
+            for name in params['unit-names']
+        ]}
+
+    async with controller.connection() as connection:
+        app_facade = client.ApplicationFacade.from_connection(connection)
+        with pytest.raises(JujuError) as excinfo:
+            await app_facade.DestroyUnits(['app/0', 'app/1'])
+        assert excinfo.value.errors == ['no unit app/1']
+
+        results = await app_facade.partial().DestroyUnits(
+            ['app/0', 'app/1', 'app/2'])
+        assert len(results) == 3
+        assert sorted(results.succeeded) == [0, 2]
+        assert results.errors[1].message == 'no unit app/1'
+        with pytest.raises(JujuError):
+            results.raise_for_errors()
+        # the original facade is unaffected
+        assert not app_facade._partial
+
+
+@pytest.mark.asyncio
+async def test_raw(event_loop):
+    controller = fakes.FakeController()
+    machines = {str(i): {'id': str(i), 'series': 'bionic'}
+                for i in range(2000)}
+
+    @controller.handle('Client', 'FullStatus')
+    def full_status(params):
+        if params['patterns'] == ['missing']:
+            raise Exception('no such application')
+        return {'machines': machines if params['patterns'] is None else {}}
+
+    async with controller.connection() as connection:
+        client_facade = client.ClientFacade.from_connection(connection)
+        status = await client_facade.raw().FullStatus(None)
+        assert status == {'machines': machines}
+
+        text = await client_facade.raw(decode=False).FullStatus(None)
+        assert isinstance(text, str)
+        assert len(text) > connection.RAW_DECODE_SIZE
+        assert json.loads(text)['response'] == {'machines': machines}
+        assert not connection._raw_requests
+
+        text = await client_facade.raw(decode=False).FullStatus([])
+        assert json.loads(text)['response'] == {'machines': {}}
+
+        with pytest.raises(JujuAPIError):
+            await client_facade.raw(decode=False).FullStatus(['missing'])
+
+
+def test_lazy_fields():
+    data = {'status': {'status': 'active', 'info': 'ready'},
+            'relations': [{'id': 1, 'key': 'a:b c:d'}]}
+    app = client.ApplicationStatus.from_json(data)
+    assert app._raw_status is data['status']
+    assert app.serialize()['status'] is data['status']
+
+    assert isinstance(app.status, client.DetailedStatus)
+    assert app.status.info == 'ready'
+    assert app.status is app.status
+    assert app.serialize()['status'] is app.status
+
+    status = client.FullStatus.from_json(data)
+    assert status.relations[0].key == 'a:b c:d'
+
+    app = client.ApplicationStatus.from_json(data)
+    app.status = None
+    assert app.serialize()['status'] is None
+
+
+def test_slots():
+    data = {'name': 'backup', 'receiver': 'unit-app-0', 'extra': 1}
+    action = client.Action.from_json(data)
+    assert not hasattr(action, '__dict__')
+    assert action.unknown_fields == {'extra': 1}
+    assert action.serialize() == {'name': 'backup', 'parameters': None,
+                                  'receiver': 'unit-app-0', 'tag': None}
+    assert action._asdict() == {'name': 'backup', 'parameters': None,
+                                'receiver': 'unit-app-0', 'tag': None,
+                                'extra': 1}
+    assert client.Action.from_json(action) is action
+    assert client.Action.from_json(json.dumps(data)).name == 'backup'
+    assert client.Action.from_json(None).name is None
+
+    action = client.Action(name='backup', tag='action-1')
+    assert action.serialize()['tag'] == 'action-1'
+    assert not client.Action.from_json({'name': 'x'}).unknown_fields
+
+
+def test_copy_and_pickle():
+    data = {'status': {'status': 'active'}, 'charm': 'cs:ubuntu-0'}
+    for app in (client.ApplicationStatus.from_json(data),
+                client.ApplicationStatus.from_json(dict(data, extra=1))):
+        for clone in (copy.deepcopy(app), pickle.loads(pickle.dumps(app))):
+            assert clone.serialize() == app.serialize()
+            assert clone.status.status == 'active'
+            assert clone.unknown_fields == app.unknown_fields
+            assert clone.unknown_fields is not app.unknown_fields
+
+
+def test_lazy_client_modules():
+    code = '\n'.join([
+        'import sys',
+        'import juju.model',
+        'from juju.client import client, overrides',
+        'assert "juju.client._client3" not in sys.modules',
+        'facade = client.lookup_facade("ActionFacade", 3)',
+        'assert "juju.client._client3" in sys.modules',
+        'assert "juju.client._client9" not in sys.modules',
+        'assert facade.FindActionTagsByPrefix is '
+        '    overrides.ActionFacade.FindActionTagsByPrefix',
+    ])
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+def test_facade_schema():
+    facade = client.lookup_facade('ActionFacade', 3)
+    assert isinstance(vars(facade)['schema'], FacadeSchema)
+    schema = facade.schema
+    assert 'Enqueue' in schema['properties']
+    assert vars(facade)['schema'] is schema
+    assert client.lookup_facade('ActionFacade', 2).schema is not schema
@@ -1,14 +1,17 @@
 import asyncio
 import json
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import mock
+from juju.client import client
 from juju.client.connection import Connection
+from juju.errors import JujuTimeoutError
 from websockets.exceptions import ConnectionClosed
 
 import pytest
 
-from .. import base
+from .. import base, fakes
 
 
 class WebsocketMock:
@@ -63,3 +66,206 @@ async def test_out_of_order(event_loop):
     finally:
         if con:
             await con.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesce(event_loop):
+    controller = fakes.FakeController()
+    release = asyncio.Event()
+
+    @controller.handle('Client', 'FullStatus')
+    async def full_status(params):
+        await release.wait()
+        return {'model': {'name': 'fake'}, 'patterns': params['patterns']}
+
+    @controller.handle('Application', 'Set')
+    async def set_config(params):
+        await release.wait()
+        return {}
+
+    async with controller.connection(coalesce=True) as connection:
+        def call(request, **params):
+            return connection.rpc({'type': 'Client' if request == 'FullStatus'
+                                   else 'Application',
+                                   'request': request, 'params': params})
+
+        calls = asyncio.gather(
+            call('FullStatus', patterns=['a']),
+            call('FullStatus', patterns=['a']),
+            call('FullStatus', patterns=['b']),
+            call('Set', application='app', options={}),
+            call('Set', application='app', options={}),
+        )
+        # let the calls reach the fake before replying to them
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await calls
+        assert results[0] is results[1]
+        assert results[2]['response']['patterns'] == ['b']
+        assert controller.calls.count(('Client', 'FullStatus')) == 2
+        # requests with side effects are always sent
+        assert controller.calls.count(('Application', 'Set')) == 2
+        assert connection.coalesce_stats == {'sent': 2, 'coalesced': 1}
+
+        # once the reply is in, the next call is sent again
+        await call('FullStatus', patterns=['a'])
+        assert controller.calls.count(('Client', 'FullStatus')) == 3
+        assert connection.connect_params()['coalesce']
+
+
+@pytest.mark.asyncio
+async def test_timeout(event_loop):
+    controller = fakes.FakeController()
+    release = asyncio.Event()
+
+    @controller.handle('Client', 'FullStatus')
+    async def full_status(params):
+        await release.wait()
+        return {}
+
+    async with controller.connection(rpc_timeout=0.05,
+                                     coalesce=True) as connection:
+        facade = client.ClientFacade.from_connection(connection)
+        with pytest.raises(JujuTimeoutError):
+            await facade.FullStatus(None)
+        # the call is forgotten, and so is the shared coalesced request
+        assert not connection._pending
+        assert not connection.messages._queues
+        assert not connection._in_flight
+        assert connection.timeout_stats == {'timed_out': 1,
+                                            'late_replies': 0}
+
+        # the late reply is dropped
+        release.set()
+        await asyncio.sleep(0.01)
+        assert not connection.messages._queues
+        assert connection.timeout_stats['late_replies'] == 1
+
+        # a per-call timeout overrides the connection's
+        release.clear()
+        call = event_loop.create_task(
+            facade.with_timeout(1).FullStatus(None))
+        await asyncio.sleep(0.1)
+        release.set()
+        assert (await call).serialize() is not None
+        assert connection.connect_params()['rpc_timeout'] == 0.05
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.frames = []
+
+    def submit(self, fn, frame):
+        self.frames.append(frame)
+        return super().submit(fn, frame)
+
+
+@pytest.mark.asyncio
+async def test_decode_threshold(event_loop):
+    controller = fakes.FakeController()
+    machines = {str(i): {'id': str(i), 'series': 'bionic'}
+                for i in range(200)}
+    controller.handle('Client', 'FullStatus')(
+        lambda params: {'machines': machines})
+    controller.handle('Client', 'ModelInfo')(lambda params: {'name': 'm'})
+
+    executor = _CountingExecutor()
+    async with controller.connection(
+            decode_threshold=4096, decode_executor=executor) as connection:
+        facade = client.ClientFacade.from_connection(connection)
+        status, info = await asyncio.gather(facade.FullStatus(None),
+                                            facade.ModelInfo())
+        assert sorted(status.machines) == sorted(machines)
+        assert info.name == 'm'
+        # only the large reply was decoded off the loop
+        assert len(executor.frames) == 1
+        assert len(executor.frames[0]) > 4096
+        assert connection.connect_params()['decode_executor'] is executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_frame_size_grows(event_loop):
+    controller = fakes.FakeController()
+    machines = {str(i): {'id': str(i)} for i in range(500)}
+    controller.handle('Client', 'FullStatus')(
+        lambda params: {'machines': machines})
+
+    async with controller.connection(max_frame_size=4096) as connection:
+        facade = client.ClientFacade.from_connection(connection)
+        # the reply needs two doublings, each with a reconnect
+        status = await facade.FullStatus(None)
+        assert sorted(status.machines) == sorted(machines)
+        assert connection.max_frame_size == 16384
+        assert len(controller.websockets) == 3
+        assert connection.connect_params()['max_frame_size'] == 16384
+
+        # other calls aren't sent again
+        controller.handle('Client', 'AddCharm')(
+            lambda params: {'machines': machines, 'x': 'x' * 20000})
+        with pytest.raises(ConnectionClosed):
+            await connection.rpc({'type': 'Client',
+                                  'request': 'AddCharm'})
+        assert connection.max_frame_size == 32768
+        await connection._reconnect_task
+        async with connection.monitor.reconnecting:
+            pass
+
+
+def _sent(ws, request):
+    return sum(1 for msg in ws.sent if msg['request'] == request)
+
+
+@pytest.mark.asyncio
+async def test_read_replicas(event_loop):
+    controller = fakes.FakeController()
+    release = asyncio.Event()
+
+    @controller.handle('Client', 'FullStatus')
+    async def full_status(params):
+        await release.wait()
+        return {}
+
+    controller.handle('Client', 'SetModelAgentVersion')(lambda params: {})
+    endpoints = ['a:17070', 'b:17070', 'c:17070']
+    async with controller.connection(endpoints, read_replicas=2) as connection:
+        await connection._replicas_task
+        assert [r.endpoint for r in connection.replicas] == \
+            ['b:17070', 'c:17070']
+        facade = client.ClientFacade.from_connection(connection)
+
+        # read-only calls are spread over the members
+        calls = asyncio.gather(*[facade.FullStatus(None)
+                                 for _ in range(6)])
+        await asyncio.sleep(0.01)
+        assert [_sent(ws, 'FullStatus')
+                for ws in controller.websockets] == [2, 2, 2]
+        release.set()
+        await calls
+
+        # other calls stay on the primary
+        await facade.SetModelAgentVersion('2.5.0')
+        assert [_sent(ws, 'SetModelAgentVersion')
+                for ws in controller.websockets] == [1, 0, 0]
+        assert connection.connect_params()['read_replicas'] == 2
+    assert not connection.replicas
+    assert not any(ws.open for ws in controller.websockets)
+
+
+@pytest.mark.asyncio
+async def test_hedged_reads(event_loop):
+    controller = fakes.FakeController()
+    controller.reply_latency['a:17070'] = 0.5
+    async with controller.connection(['a:17070', 'b:17070'],
+                                     read_replicas=1,
+                                     hedge_delay=0.05) as connection:
+        await connection._replicas_task
+        facade = client.ClientFacade.from_connection(connection)
+        start = event_loop.time()
+        info = await facade.ModelInfo()
+        assert info.uuid == controller.model_uuid
+        assert event_loop.time() - start < 0.4
+        assert connection.hedge_stats == {'hedged': 1, 'won': 1}
+        assert [_sent(ws, 'ModelInfo')
+                for ws in controller.websockets] == [1, 1]
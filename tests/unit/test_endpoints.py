@@ -0,0 +1,99 @@
+import json
+
+import mock
+import pytest
+
+from juju.client.connection import Connection
+from juju.client.endpoints import EndpointStats
+
+from .. import fakes
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000
+
+    def __call__(self):
+        return self.now
+
+
+def test_rank():
+    clock = Clock()
+    stats = EndpointStats(clock=clock)
+    endpoints = ['a:17070', 'b:17070', 'c:17070', 'd:17070']
+    assert stats.rank(endpoints) == endpoints
+
+    stats.record_success('c:17070', 0.2)
+    stats.record_success('d:17070', 0.1)
+    stats.record_failure('a:17070')
+    assert stats.rank(endpoints) == ['d:17070', 'c:17070', 'b:17070',
+                                     'a:17070']
+
+    # the moving average follows the latest latencies
+    stats.record_success('d:17070', 0.5)
+    assert stats.endpoints['d:17070']['latency'] == pytest.approx(0.22)
+    assert stats.rank(endpoints)[:2] == ['c:17070', 'd:17070']
+
+    # failed endpoints are tried again after a backoff that doubles
+    stats.record_failure('a:17070')
+    clock.now += EndpointStats.BACKOFF
+    assert not stats.is_healthy('a:17070')
+    clock.now += EndpointStats.BACKOFF
+    assert stats.is_healthy('a:17070')
+    stats.record_success('a:17070', 0.01)
+    assert stats.rank(endpoints)[0] == 'a:17070'
+    assert stats.endpoints['a:17070']['failures'] == 0
+
+
+@pytest.mark.asyncio
+async def test_persistence(tmpdir, event_loop):
+    path = str(tmpdir.join('endpoint-stats.json'))
+    stats = EndpointStats(path)
+    stats.record_success('a:17070', 0.2)
+    stats.record_failure('b:17070')
+    # the stats are only written when flushed, off the loop
+    assert tmpdir.listdir() == []
+    with mock.patch.object(event_loop, 'run_in_executor',
+                           wraps=event_loop.run_in_executor) as run:
+        await stats.flush(event_loop)
+        await stats.flush(event_loop)
+    assert run.call_count == 1
+    assert EndpointStats(path).endpoints == stats.endpoints
+    assert json.loads(tmpdir.join('endpoint-stats.json').read())[
+        'a:17070']['latency'] == 0.2
+    assert tmpdir.listdir() == [tmpdir.join('endpoint-stats.json')]
+
+    tmpdir.join('endpoint-stats.json').write('{')
+    assert EndpointStats(path).endpoints == {}
+
+
+@pytest.mark.asyncio
+async def test_connect_ranked(event_loop, tmpdir):
+    controller = fakes.FakeController()
+    controller.unreachable.add('a:17070')
+    controller.endpoint_latency['b:17070'] = 0.3
+    path = str(tmpdir.join('endpoint-stats.json'))
+    stats = EndpointStats(path)
+    endpoints = ['a:17070', 'b:17070', 'c:17070']
+
+    async with controller.connection(endpoints,
+                                     endpoint_stats=stats) as connection:
+        assert connection.endpoint == 'c:17070'
+        assert EndpointStats(path).endpoints == stats.endpoints
+        assert stats.endpoints['a:17070']['failures'] == 1
+        assert 'b:17070' not in stats.endpoints
+        assert stats.rank(endpoints) == ['c:17070', 'b:17070',
+                                         'a:17070']
+        params = connection.connect_params()
+        assert params['endpoint'] == ['c:17070', 'a:17070', 'b:17070']
+        assert params['endpoint_stats'] is stats
+
+        # the fastest endpoint is tried first, and wins straight away
+        clone = await Connection.connect(**params)
+        assert clone.endpoint == 'c:17070'
+        assert len(controller.websockets) == 2
+        await clone.close()
+
+        await connection.reconnect()
+        assert connection.endpoint == 'c:17070'
+        assert len(controller.websockets) == 3
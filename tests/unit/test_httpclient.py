@@ -0,0 +1,165 @@
+import asyncio
+import io
+import os
+import zipfile
+
+import mock
+import pytest
+
+from juju.client.connection import Connection
+from juju.client.httpclient import HTTPClient, _Stream
+from juju.client.jujudata import JujuData
+from juju.errors import JujuError
+from juju.model import Model
+from juju.utils import AsyncPipe
+
+from .. import fakes
+
+
+def _connection(server, loop, uuid=None):
+    connection = Connection()
+    connection.loop = loop
+    connection.endpoint = server.endpoint
+    connection.cacert = server.cert
+    connection.uuid = uuid
+    connection.usertag = 'user-admin'
+    connection.password = 'secret'
+    connection._http_client = None
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_keep_alive(event_loop):
+    async with fakes.HTTPSServer(event_loop) as server:
+        client = HTTPClient(_connection(server, event_loop, uuid='m-1'))
+        try:
+            for _ in range(3):
+                response = await client.request('POST', '/charms?series=xenial',
+                                                body=b'zip')
+                assert response.status == 200
+                assert response.json() == {'charm-url': 'local:xenial/a-1'}
+            assert server.connections == 1
+            assert client.stats == {'connections': 1, 'requests': 3, 'reused': 2}
+            method, path, headers, body = server.requests[0]
+            assert (method, path, body) == ('POST', '/model/m-1/charms?series=xenial',
+                                            b'zip')
+            assert headers['authorization'].startswith('Basic ')
+            assert headers['content-length'] == '3'
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_bodies_and_progress(event_loop):
+    async with fakes.HTTPSServer(event_loop) as server:
+        client = HTTPClient(_connection(server, event_loop), chunk_size=4)
+        progress = []
+        try:
+            data = b'0123456789'
+            await client.request('POST', '/charms', body=io.BytesIO(data),
+                                 progress=lambda *p: progress.append(p))
+            await client.request('POST', '/charms', body=iter([b'012', b'345']))
+            assert progress == [(4, 10), (8, 10), (10, 10)]
+            assert server.requests[0][3] == data
+            assert 'content-length' in server.requests[0][2]
+            assert server.requests[1][2]['transfer-encoding'] == 'chunked'
+            assert server.requests[1][3] == b'012345'
+
+            server.reply = lambda *request: (400, {'error': 'bad charm'})
+            response = await client.request('POST', '/charms', body=b'x')
+            assert response.status == 400
+            assert response.json() == {'error': 'bad charm'}
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_max_connections(event_loop):
+    async with fakes.HTTPSServer(event_loop) as server:
+        client = HTTPClient(_connection(server, event_loop), max_connections=2)
+        try:
+            await asyncio.gather(*[
+                client.request('POST', '/charms', body=b'x') for _ in range(6)])
+            assert server.connections == 2
+            assert client.stats['requests'] == 6
+            assert len(client._idle) == 2
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_connection(event_loop):
+    async with fakes.HTTPSServer(event_loop) as server:
+        client = HTTPClient(_connection(server, event_loop))
+        try:
+            await client.request('GET', '/charms')
+            # the connection is closed by the server after the client has
+            # checked it, and the request is sent again on a new one
+            client._idle[0].writer.transport.abort()
+            with mock.patch.object(_Stream, 'is_open', new_callable=mock.PropertyMock,
+                                   return_value=True):
+                body = io.BytesIO(b'abc')
+                response = await client.request('POST', '/charms', body=body)
+            assert response.status == 200
+            assert server.connections == 2
+            assert server.requests[-1][3] == b'abc'
+
+            # so is an AsyncPipe, which is rewound
+            client._idle[0].writer.transport.abort()
+            with mock.patch.object(_Stream, 'is_open', new_callable=mock.PropertyMock,
+                                   return_value=True):
+                body = AsyncPipe(lambda f: f.write(b'def' * 10**5))
+                response = await client.request('POST', '/charms', body=body)
+            assert response.status == 200
+            assert server.connections == 3
+            assert server.requests[-1][3] == b'def' * 10**5
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_add_local_charm_dir(event_loop):
+    async with fakes.HTTPSServer(event_loop) as server:
+        model = Model(jujudata=JujuData())
+        model._connector._connection = _connection(server, event_loop, uuid='m-1')
+        charm_dir = os.path.join(os.path.dirname(__file__), '..', 'charm')
+        progress = []
+        try:
+            charm_url = await model.add_local_charm_dir(
+                charm_dir, 'xenial', progress=lambda *p: progress.append(p))
+            assert charm_url == 'local:xenial/a-1'
+            method, path, headers, body = server.requests[0]
+            assert path == '/model/m-1/charms?series=xenial'
+            assert headers['content-type'] == 'application/zip'
+            assert 'metadata.yaml' in zipfile.ZipFile(io.BytesIO(body)).namelist()
+            assert headers['transfer-encoding'] == 'chunked'
+            assert progress[-1] == (len(body), None)
+
+            server.reply = lambda *request: (400, {'error': 'bad charm'})
+            with pytest.raises(JujuError):
+                await model.add_local_charm_dir(charm_dir, 'bionic')
+            assert server.connections == 1
+        finally:
+            await model.connection().http_client().close()
+
+
+@pytest.mark.asyncio
+async def test_upload_local_charm(event_loop, tmpdir):
+    archive = tmpdir.join('a.charm')
+    archive.write_binary(b'zip' * 10**5)
+    async with fakes.HTTPSServer(event_loop) as server:
+        model = Model(jujudata=JujuData())
+        model._connector._connection = _connection(server, event_loop, uuid='m-1')
+        try:
+            with mock.patch.object(event_loop, 'run_in_executor',
+                                   wraps=event_loop.run_in_executor) as run:
+                url = await model.upload_local_charm(str(archive), 'xenial')
+            assert url == 'local:xenial/a-1'
+            method, path, headers, body = server.requests[0]
+            assert path == '/model/m-1/charms?series=xenial'
+            assert headers['content-length'] == str(3 * 10**5)
+            assert body == b'zip' * 10**5
+            # the file was read off the loop
+            assert run.call_count > 1
+        finally:
+            await model.connection().http_client().close()
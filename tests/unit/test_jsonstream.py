@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from juju.client.jsonstream import iter_array
+
+
+def test_iter_array():
+    deltas = [['application', 'change', {'name': 'a', 'tags': [1, {}]}],
+              ['unit', 'remove', {'name': 'a/0', 'text': 'x, ]}"'}]]
+    reply = {'request-id': 3, 'response': {'other': [1, 2], 'deltas': deltas}}
+    assert list(iter_array(json.dumps(reply), ('response', 'deltas'))) == \
+        deltas
+    assert list(iter_array(json.dumps(reply, indent=2),
+                           ('response', 'deltas'))) == deltas
+    assert list(iter_array(' [ ] ')) == []
+    assert list(iter_array('{"a": null}', ('a',))) == []
+    assert list(iter_array('[1,2 , 3]')) == [1, 2, 3]
+
+
+def test_iter_array_errors():
+    with pytest.raises(KeyError):
+        list(iter_array('{"response": {}}', ('response', 'deltas')))
+    with pytest.raises(KeyError):
+        list(iter_array('{"a": 1}', ('b',)))
+    with pytest.raises(ValueError):
+        list(iter_array('{"a": 1}', ('a',)))
+    with pytest.raises(ValueError):
+        list(iter_array('[1 2]'))
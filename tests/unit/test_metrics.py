@@ -0,0 +1,84 @@
+import asyncio
+
+import asynctest
+
+from juju.client import client
+from juju.client.metrics import MetricsRegistry, to_prometheus
+from juju.errors import JujuAPIError
+from juju.model import Model
+
+from .. import fakes
+
+
+class TestMetrics(asynctest.TestCase):
+    def test_prometheus(self):
+        registry = MetricsRegistry(buckets={'size_bytes': [10, 100]})
+        self.assertEqual(to_prometheus(registry), '')
+        registry.inc('calls_total', {'facade': 'Client'})
+        registry.inc('calls_total', {'facade': 'Client'}, 2)
+        registry.inc('calls_total', {'facade': 'say "hi"\n'})
+        registry.observe('size_bytes', 5)
+        registry.observe('size_bytes', 50)
+        registry.observe('size_bytes', 500)
+        self.assertEqual(registry.counter('calls_total', facade='Client'), 3)
+        self.assertEqual(registry.histogram('size_bytes').counts, [1, 1, 1])
+        self.assertEqual(to_prometheus(registry), '\n'.join([
+            '# TYPE calls_total counter',
+            'calls_total{facade="Client"} 3',
+            'calls_total{facade="say \\"hi\\"\\n"} 1',
+            '# TYPE size_bytes histogram',
+            'size_bytes_bucket{le="10"} 1',
+            'size_bytes_bucket{le="100"} 2',
+            'size_bytes_bucket{le="+Inf"} 3',
+            'size_bytes_sum 555',
+            'size_bytes_count 3',
+        ]) + '\n')
+
+    async def test_model_metrics(self):
+        controller = fakes.FakeController()
+        controller.handle('Application', 'Get')(lambda params: {
+            'application': params['application'], 'config': {},
+            'constraints': {}, 'charm': 'ubuntu', 'series': 'bionic'})
+        registry = MetricsRegistry()
+        controller.add_deltas(('application', 'change', {
+            'name': 'app', 'charm-url': 'cs:ubuntu-1'}))
+
+        observed = asyncio.Event()
+
+        async def observer(delta, old, new, model):
+            await asyncio.sleep(0.05)
+            observed.set()
+
+        model = Model(metrics=registry)
+        model.add_observer(observer, 'application')
+        async with controller.model(model):
+            await model.applications['app'].get_config()
+            await observed.wait()
+            # let the callback's timing be recorded
+            await asyncio.sleep(0)
+            facade = client.ApplicationFacade.from_connection(
+                model.connection())
+            with self.assertRaises(JujuAPIError):
+                await facade.Expose('app')
+
+        get = {'facade': 'Application', 'request': 'Get'}
+        self.assertEqual(registry.counter('juju_rpc_calls_total', **get), 1)
+        self.assertEqual(
+            registry.histogram('juju_rpc_latency_seconds', **get).count, 1)
+        self.assertGreater(
+            registry.histogram('juju_rpc_request_bytes', **get).sum, 0)
+        self.assertGreater(
+            registry.histogram('juju_rpc_response_bytes', **get).sum, 0)
+        self.assertEqual(registry.counter(
+            'juju_rpc_errors_total', facade='Application', request='Expose',
+            error='JujuAPIError'), 1)
+        self.assertGreaterEqual(
+            registry.histogram('juju_watcher_batch_deltas').count, 1)
+        dispatch = registry.histogram('juju_observer_dispatch_seconds',
+                                      entity='application')
+        self.assertEqual(dispatch.count, 1)
+        # the time the callback took, not just the time to schedule it
+        self.assertGreaterEqual(dispatch.sum, 0.05)
+        self.assertIn('juju_rpc_latency_seconds_bucket{'
+                      'facade="Application",request="Get",le="+Inf"} 1',
+                      to_prometheus(registry))
@@ -1,12 +1,19 @@
+import asyncio
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import mock
 
 import asynctest
+import pytest
 
-from juju.client.jujudata import FileJujuData
+from juju.client import overrides
+from juju.client.jujudata import FileJujuData, JujuData
+from juju.constraints import parse as parse_constraints
 from juju.model import Model
 
+from .. import fakes
+
 
 def _make_delta(entity, type_, data=None):
     from juju.client.client import Delta
@@ -98,6 +105,24 @@ class TestModelState(unittest.TestCase):
         self.assertIsInstance(prev, Application)
         self.assertTrue(prev)
 
+    def test_forget_entity(self):
+        from juju.model import Model
+
+        model = Model()
+        model._connector = mock.MagicMock()
+        delta = _make_delta('action', 'change', dict(id='1'))
+        model.state.apply_delta(delta)
+        model.state.forget_entity('action', '1')
+        with self.assertRaises(KeyError):
+            model.state.entity_history('action', '1')
+        # forgetting what isn't there is fine
+        model.state.forget_entity('action', '1')
+        model.state.forget_entity('unit', 'ubuntu/0')
+
+        # a later delta starts a new history
+        model.state.apply_delta(delta)
+        self.assertEqual(len(model.state.entity_history('action', '1')), 1)
+
 
 def test_get_series():
     from juju.model import Model
@@ -262,3 +287,126 @@ class TestModelConnect(asynctest.TestCase):
                                         macaroons='macaroons',
                                         loop='loop',
                                         max_frame_size='max_frame_size')
+
+
+@pytest.mark.asyncio
+async def test_add_machine_constraints():
+    controller = fakes.FakeController()
+    params = []
+
+    @controller.handle('Client', 'AddMachines')
+    def add_machines(request):
+        params.extend(request['params'])
+        controller.add_deltas(('machine', 'change', {'id': '0'}))
+        return {'machines': [{'machine': '0'}]}
+
+    async with controller.model(Model(jujudata=JujuData())) as model:
+        # parse_constraints returns the Python names of the fields
+        await model.add_machine(
+            constraints=parse_constraints(
+                'mem=4G root-disk=20G cpu-power=100 instance-type=m1'),
+            disks=[{'pool': 'ebs', 'size': 1024, 'count': 1}])
+    constraints = params[0]['constraints']
+    assert (constraints['mem'], constraints['root-disk'],
+            constraints['cpu-power'], constraints['instance-type']) == (
+        4096, 20480, 100, 'm1')
+    assert params[0]['disks'] == [{'Pool': 'ebs', 'Size': 1024, 'Count': 1}]
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.frames = []
+
+    def submit(self, fn, frame):
+        self.frames.append(frame)
+        return super().submit(fn, frame)
+
+
+def _unit_deltas(count):
+    return [('unit', 'change', {'name': 'app/{}'.format(i),
+                                'application': 'app'})
+            for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_watcher_frame_size_grows(event_loop):
+    controller = fakes.FakeController()
+    watchers = []
+
+    @controller.handle('Client', 'WatchAll')
+    def watch_all(params):
+        watchers.append(True)
+        return {'watcher-id': str(len(watchers))}
+
+    @controller.handle('AllWatcher', 'Next')
+    async def next_deltas(params):
+        if watchers[-1]:
+            # a new watcher starts with the whole model, which doesn't
+            # fit in a frame
+            watchers[-1] = False
+            return {'deltas': [list(d) for d in _unit_deltas(200)]}
+        return await controller._next_deltas(params)
+
+    model = Model(jujudata=JujuData())
+    async with controller.model(model, max_frame_size=4096):
+        assert len(model.units) == 200
+        assert len(watchers) > 1
+        assert model.connection().max_frame_size > 4096
+        # the re-created watcher carries on
+        controller.add_deltas(('unit', 'change', {'name': 'app/200',
+                                                  'application': 'app'}))
+        await model.block_until(lambda: len(model.units) == 201,
+                                timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_watcher_outlives_rpc_timeout(event_loop):
+    controller = fakes.FakeController()
+    model = Model(jujudata=JujuData(), rpc_timeout=0.05)
+    async with controller.model(model):
+        # the model stays idle for longer than rpc_timeout
+        await asyncio.sleep(0.2)
+        assert not model._watch_stopped.is_set()
+        controller.add_deltas(*_unit_deltas(1))
+        await model.block_until(lambda: len(model.units) == 1, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_watcher_decodes_in_executor(event_loop):
+    controller = fakes.FakeController()
+    executor = _CountingExecutor()
+    model = Model(jujudata=JujuData(), decode_threshold=1000,
+                  decode_executor=executor)
+    async with controller.model(model):
+        controller.add_deltas(*_unit_deltas(3000))
+        await model.block_until(lambda: len(model.units) == 3000)
+        assert any(len(frame) > 1000 for frame in executor.frames)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_watcher_streams_huge_batches(event_loop):
+    controller = fakes.FakeController()
+    model = Model(jujudata=JujuData())
+    counts = []
+
+    async def ticker():
+        # runs between the deltas of a batch being applied
+        while True:
+            counts.append(len(model.state.state.get('unit', {})))
+            await asyncio.sleep(0)
+
+    with mock.patch.object(Model, 'WATCH_STREAM_SIZE', 1000):
+        async with controller.model(model):
+            ticks = event_loop.create_task(ticker())
+            try:
+                with mock.patch('juju.client.overrides.iter_array',
+                                wraps=overrides.iter_array) as iter_array:
+                    controller.add_deltas(*_unit_deltas(3000))
+                    await model.block_until(
+                        lambda: len(model.units) == 3000)
+                assert iter_array.called
+                assert any(0 < count < 3000 for count in counts)
+            finally:
+                ticks.cancel()
@@ -0,0 +1,70 @@
+import io
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from juju.model import CharmArchiveGenerator
+from juju.parallelzip import ParallelZipFile
+
+
+def _charm(path):
+    os.makedirs(os.path.join(path, 'hooks'))
+    os.makedirs(os.path.join(path, 'build'))
+    with open(os.path.join(path, 'metadata.yaml'), 'w') as f:
+        f.write('name: a\n')
+    with open(os.path.join(path, 'hooks', 'install'), 'w') as f:
+        f.write('#!/bin/sh\n')
+    os.chmod(os.path.join(path, 'hooks', 'install'), 0o755)
+    os.symlink('install', os.path.join(path, 'hooks', 'start'))
+    with open(os.path.join(path, 'build', 'ignored'), 'w') as f:
+        f.write('x')
+    with open(os.path.join(path, 'wheel'), 'wb') as f:
+        # compressible, and in several chunks
+        f.write(os.urandom(2**10) * 300 + os.urandom(2**12))
+    with open(os.path.join(path, 'ünïcode'), 'w') as f:
+        f.write('')
+    return path
+
+
+def _members(archive):
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.testzip() is None
+        return [(info.filename, info.external_attr, info.date_time,
+                 zf.read(info)) for info in zf.infolist()]
+
+
+@pytest.mark.parametrize('executor_class', [ThreadPoolExecutor,
+                                            ProcessPoolExecutor])
+def test_make_archive(tmpdir, executor_class):
+    generator = CharmArchiveGenerator(_charm(str(tmpdir.join('a'))))
+    serial = io.BytesIO()
+    generator.make_archive(serial)
+    with executor_class(2) as executor:
+        parallel = str(tmpdir.join('a.charm'))
+        generator.make_archive(parallel, executor=executor)
+    assert _members(parallel) == _members(serial)
+    with zipfile.ZipFile(parallel) as zf:
+        assert zf.getinfo('wheel').compress_size < 2**16
+        assert zf.getinfo('hooks/start').external_attr == 2716663808
+
+
+def test_window(tmpdir):
+    path = str(tmpdir.join('big'))
+    with open(path, 'wb') as f:
+        f.write(os.urandom(2**16))
+
+    class Executor(ThreadPoolExecutor):
+        def submit(self, *args):
+            running = len(zf._running)
+            assert running <= zf.window
+            return super().submit(*args)
+
+    with Executor(2) as executor:
+        out = io.BytesIO()
+        zf = ParallelZipFile(out, executor, chunk_size=2**10, window=3)
+        zf.write(path, 'big')
+        zf.close()
+    with open(path, 'rb') as f:
+        assert zipfile.ZipFile(out).read('big') == f.read()
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+import websockets
+
+from juju.client import client
+from juju.client.pool import ConnectionPool
+from juju.utils import block_until
+
+from .. import fakes
+
+
+def _requests(ws):
+    return [msg['request'] for msg in ws.sent]
+
+
+@pytest.mark.asyncio
+async def test_pool(event_loop):
+    controller = fakes.FakeController()
+    release = asyncio.Event()
+
+    @controller.handle('Client', 'ModelInfo')
+    async def model_info(params):
+        await release.wait()
+        return {'name': 'fake'}
+
+    controller.handle('Client', 'FullStatus')(lambda params: {})
+
+    async with controller.connection() as connection:
+        pool = ConnectionPool(connection, max_size=2, max_in_flight=2,
+                              idle_timeout=0.2, ping_interval=0.02)
+        try:
+            facade = client.ClientFacade.from_connection(pool)
+            assert facade.connection is pool
+
+            # two calls fit on the first connection, the next two go to a
+            # new one and the fifth waits on the least busy of them
+            calls = [event_loop.create_task(facade.ModelInfo())
+                     for _ in range(5)]
+            await block_until(lambda: sum(
+                _requests(ws).count('ModelInfo')
+                for ws in controller.websockets) == 5,
+                timeout=1, wait_period=0.001)
+            assert len(pool) == 2
+            first, second = controller.websockets
+            assert _requests(first).count('ModelInfo') == 3
+            assert _requests(second).count('ModelInfo') == 2
+            assert not second.sent[0].get('params', {}).get('auth-tag')
+
+            # heavy calls get their own lane
+            await facade.FullStatus(None)
+            assert len(pool) == 3
+            assert _requests(controller.websockets[2]) == ['FullStatus']
+
+            release.set()
+            await asyncio.gather(*calls)
+
+            # idle connections are pinged, then closed
+            await asyncio.sleep(0.08)
+            assert 'Ping' in _requests(second)
+            assert second.open
+            await asyncio.sleep(0.25)
+            assert pool.connections == [connection]
+            assert not second.open
+            assert connection.is_open
+        finally:
+            await pool.close()
+    assert not connection.is_open
+
+
+@pytest.mark.asyncio
+async def test_pool_min_size(event_loop):
+    controller = fakes.FakeController()
+    controller.handle('Client', 'FullStatus')(lambda params: {})
+    async with controller.connection() as connection:
+        pool = await ConnectionPool.connect(connection, min_size=3,
+                                            heavy_size=0)
+        try:
+            assert len(pool) == 3
+            assert len(controller.websockets) == 3
+            # the pool's connections leave pinging to the pool
+            await pool.connections[1]._pinger_task.stopped.wait()
+            await client.ClientFacade.from_connection(pool).FullStatus(None)
+            assert len(pool) == 3
+        finally:
+            await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_skips_closed(event_loop):
+    controller = fakes.FakeController()
+    controller.handle('Client', 'FullStatus')(lambda params: {})
+    async with controller.connection() as connection:
+        pool = ConnectionPool(connection, max_size=1)
+        try:
+            facade = client.ClientFacade.from_connection(pool)
+            await facade.FullStatus(None)
+            heavy = pool.connections[1]
+            await heavy.close()
+            # the full heavy lane has no open connection, so the call goes
+            # to the pool's, and the closed one is kept for the pool to
+            # close in case it was only reconnecting
+            await facade.FullStatus(None)
+            assert pool.connections == [connection, heavy]
+            assert _requests(controller.websockets[0]).count('FullStatus') == 1
+
+            # a full lane with nothing open fails rather than using a
+            # closed connection
+            await connection.close()
+            with pytest.raises(websockets.exceptions.ConnectionClosed):
+                await facade.ModelInfo()
+        finally:
+            await pool.close()
+        assert not any(ws.open for ws in controller.websockets)
+
+
+@pytest.mark.asyncio
+async def test_pool_grow_cancelled(event_loop):
+    controller = fakes.FakeController()
+    release = asyncio.Event()
+
+    @controller.handle('Client', 'ModelInfo')
+    async def model_info(params):
+        await release.wait()
+        return {'name': 'fake'}
+
+    async with controller.connection() as connection:
+        pool = ConnectionPool(connection, max_in_flight=1)
+        try:
+            facade = client.ClientFacade.from_connection(pool)
+            first = event_loop.create_task(facade.ModelInfo())
+            await block_until(lambda: pool._lane.members[0].in_flight,
+                              timeout=1, wait_period=0.001)
+            second = event_loop.create_task(facade.ModelInfo())
+            await block_until(lambda: pool._lane.growing is not None,
+                              timeout=1, wait_period=0.001)
+            pool._lane.growing.cancel()
+            # the call waits in line on the busy connection instead
+            await block_until(lambda: pool._lane.members[0].in_flight == 2,
+                              timeout=1, wait_period=0.001)
+            assert len(pool) == 1
+            release.set()
+            await asyncio.gather(first, second)
+        finally:
+            await pool.close()
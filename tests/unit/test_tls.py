@@ -0,0 +1,45 @@
+import asyncio
+import socket
+
+import pytest
+
+from juju.client import tls
+from juju.client.connection import Connection
+
+from .. import fakes
+
+
+async def _exchange(context, host, port):
+    reader, writer = await asyncio.open_connection(
+        host, port, ssl=context, server_hostname='localhost')
+    writer.write(b'x')
+    assert await reader.read(1) == b'x'
+    writer.close()
+
+
+def _blocking_exchange(context, host, port):
+    with socket.create_connection((host, port)) as sock:
+        with context.wrap_socket(sock, server_hostname='localhost') as tls:
+            tls.sendall(b'x')
+            assert tls.recv(1) == b'x'
+
+
+@pytest.mark.asyncio
+async def test_context_for(event_loop):
+    server = await fakes.TLSServer().start()
+    try:
+        context = tls.context_for(server.cert)
+        assert tls.context_for(server.cert) is context
+        assert tls.context_for(None) is not context
+        assert Connection()._get_ssl(server.cert) is context
+
+        host, port = server.endpoint.split(':')
+        await _exchange(context, host, port)
+        await _exchange(context, host, port)
+        # sessions are shared between asyncio and blocking sockets, as
+        # used by websockets and HTTPS connections
+        await event_loop.run_in_executor(
+            None, _blocking_exchange, context, host, int(port))
+        assert context.tls_stats == {'handshakes': 3, 'resumed': 2}
+    finally:
+        await server.close()
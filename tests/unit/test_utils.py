@@ -0,0 +1,72 @@
+import asyncio
+import io
+import os
+import threading
+import zipfile
+
+import pytest
+
+from juju.model import CharmArchiveGenerator
+from juju.utils import AsyncPipe
+
+CHARM_DIR = os.path.join(os.path.dirname(__file__), '..', 'charm')
+
+
+async def _read(pipe):
+    chunks = []
+    async for chunk in pipe:
+        chunks.append(chunk)
+    return chunks
+
+
+@pytest.mark.asyncio
+async def test_async_pipe(event_loop):
+    pipe = AsyncPipe(lambda f: f.write(b'x' * 10), chunk_size=4)
+    assert await _read(pipe) == [b'xxxx', b'xxxx', b'xx']
+    await pipe.rewind()
+    assert await _read(pipe) == [b'xxxx', b'xxxx', b'xx']
+
+    def fail(f):
+        f.write(b'x')
+        raise ValueError('no charm')
+
+    with pytest.raises(ValueError):
+        await _read(AsyncPipe(fail))
+
+
+@pytest.mark.asyncio
+async def test_async_pipe_bounded(event_loop):
+    written = []
+    errors = []
+    blocked = threading.Event()
+
+    def write(f):
+        try:
+            for i in range(100):
+                if i == 3:
+                    blocked.set()
+                f.write(b'x' * 4)
+                written.append(i)
+        except BrokenPipeError as e:
+            errors.append(e)
+            raise
+
+    pipe = AsyncPipe(write, chunk_size=4, max_chunks=2)
+    chunks = pipe.__aiter__()
+    assert await chunks.__anext__() == b'xxxx'
+    await event_loop.run_in_executor(None, blocked.wait)
+    await asyncio.sleep(0.05)
+    # the writer waits for room in the queue rather than running ahead
+    assert len(written) <= 4
+    await pipe.aclose()
+    assert len(written) < 100
+    assert errors
+
+
+@pytest.mark.asyncio
+async def test_charm_archive_stream(event_loop):
+    chunks = await _read(CharmArchiveGenerator(CHARM_DIR).stream())
+    archive = zipfile.ZipFile(io.BytesIO(b''.join(chunks)))
+    assert archive.namelist() == ['metadata.yaml']
+    with open(os.path.join(CHARM_DIR, 'metadata.yaml'), 'rb') as f:
+        assert archive.read('metadata.yaml') == f.read()